@@ -29,6 +29,7 @@ PYLIBRARY_DIR = path.join(WS_DIR, "LIBS", "PYLIBRARY")
 if PYLIBRARY_DIR not in sys_path:
     sys_path.insert(0, PYLIBRARY_DIR)
 # end if
+from pylibrary.tools.elfhelper import AddressIntervals  # noqa: E402: module level import not at top of file
 from pylibrary.tools.elfhelper import ElfHelper  # noqa: E402: module level import not at top of file
 
 
@@ -133,7 +134,8 @@ class HexCompare:
                 stdout.write("First allowed address is the one for the uicr approtect register: "
                              f"0x{uicr_approtect_register_address:X}\n")
             # end if
-            addresses_allowed_to_differ = {uicr_approtect_register_address}
+            addresses_allowed_to_differ = AddressIntervals(
+                [(uicr_approtect_register_address, uicr_approtect_register_address + 1)])
 
             if VERBOSE:
                 stdout.write("Look at the allowed symbols in the bootloader elf file:\n")
@@ -278,8 +280,8 @@ class HexCompare:
 
         :param hex_file: given binary file
         :type hex_file: ``str``
-        :param ignored_addresses: List of address range to ignore - OPTIONAL
-        :type ignored_addresses: ``set`` or ``None``
+        :param ignored_addresses: Address ranges to ignore - OPTIONAL
+        :type ignored_addresses: ``AddressIntervals`` or ``None``
 
         :return: Report whether all the differences are contained in the ignored addresses set.
         :rtype: ``bool``
@@ -287,7 +289,7 @@ class HexCompare:
         if VERBOSE:
             stdout.write("Check if the hex files are identical (or with some allowed difference):\n\t")
         # end if
-        ignored_address_set = set() if ignored_addresses is None else ignored_addresses
+        ignored_addresses = AddressIntervals() if ignored_addresses is None else ignored_addresses
 
         hex_data = IntelHex(hex_file).todict()
         hex_addresses = hex_data.keys()
@@ -305,9 +307,9 @@ class HexCompare:
         # ensure that the data that differs between the two hex files is found at a
         # subset of the addresses of the symbols that are allowed to change between
         # production and ci hex files.
-        if not addresses_with_different_contents.issubset(ignored_address_set):
+        if not ignored_addresses.contains_all(addresses_with_different_contents):
             if VERBOSE:
-                difference = [f"{x:X}" for x in addresses_with_different_contents.difference(ignored_address_set)]
+                difference = [f"{x:X}" for x in sorted(addresses_with_different_contents) if x not in ignored_addresses]
                 stdout.write(f"Different addresses: {difference}\n\t")
             # end if
             stdout.write("Different hex file\n")
@@ -368,7 +370,7 @@ class HexCompare:
         :type symbol_name: ``str``
 
         :return: The address range (if possible)
-        :rtype: ``set`` or ``None``
+        :rtype: ``AddressIntervals`` or ``None``
 
         :raise ``AssertionError``: __etext, __data_start__ or __data_end__ symbols are not in the elf file
         """
@@ -391,14 +393,12 @@ class HexCompare:
         assert data_start_addr is not None, "Data start symbol should be in the elf file"
         assert data_end_addr is not None, "Data end symbol should be in the elf file"
 
-        symbol_address_range = elf_helper.get_symbols_address_range(symbols_names=[symbol_name])
-        symbol_address_range = list(symbol_address_range)
-        symbol_address_range.sort()
-        symbol_address_range = set(symbol_address_range)
+        symbol_address_range = elf_helper.get_symbols_address_intervals(symbols_names=[symbol_name])
 
         if data_start_addr <= symbol_address <= data_end_addr:
             address_delta = data_start_addr - etext_addr
-            symbol_address_range = set([x - address_delta for x in list(symbol_address_range)])
+            symbol_address_range = AddressIntervals(
+                (start - address_delta, end - address_delta) for start, end in symbol_address_range.intervals)
         # end if
 
         return symbol_address_range
@@ -414,7 +414,7 @@ class HexCompare:
         If ``one_byte_offset`` is not ``None``, only the address at the index in the range will be taken.
 
         :param allowed_set: Set of allowed addresses to add the new ones (if found)
-        :type allowed_set: ``set``
+        :type allowed_set: ``AddressIntervals``
         :param elf_helper: Elf helper object containing the information
         :type elf_helper: ``ElfHelper``
         :param symbol_name: Name of the symbol to find
@@ -425,7 +425,7 @@ class HexCompare:
         :type one_byte_offset: ``int`` or ``None``
 
         :return: The new set with added values (if needed)
-        :rtype: ``set``
+        :rtype: ``AddressIntervals``
         """
         log_to_add = entity_in_log + " s" if entity_in_log is not None else "S"
 
@@ -436,7 +436,8 @@ class HexCompare:
             if symbol_address is None:
                 symbol_address_range = None
             else:
-                symbol_address_range = {symbol_address + one_byte_offset}
+                symbol_address_range = AddressIntervals(
+                    [(symbol_address + one_byte_offset, symbol_address + one_byte_offset + 1)])
             # end if
         # end if
 
@@ -449,13 +450,15 @@ class HexCompare:
 
         allowed_set |= symbol_address_range
         if VERBOSE:
+            intervals = symbol_address_range.intervals
             if len(symbol_address_range) > 1:
                 stdout.write(
-                    f"{log_to_add}ymbol found: {symbol_name} at address range [0x{list(symbol_address_range)[0]:X}, "
-                    f"0x{list(symbol_address_range)[-1]:X}]\n")
+                    f"{log_to_add}ymbol found: {symbol_name} at address range [0x{intervals[0][0]:X}, "
+                    f"0x{intervals[-1][1] - 1:X}]\n")
+            elif len(symbol_address_range) == 1:
+                stdout.write(f"{log_to_add}ymbol found: {symbol_name} at address 0x{intervals[0][0]:X}\n")
             else:
-                stdout.write(
-                    f"{log_to_add}ymbol found: {symbol_name} at address 0x{list(symbol_address_range)[0]:X}\n")
+                stdout.write(f"{log_to_add}ymbol found: {symbol_name} without size\n")
             # end if
         # end if
 
@@ -24,6 +24,7 @@ from pyhid.hiddispatcher import HIDDispatcher
 from pyhid.hiddispatcher import HidMessageQueue
 from pyhid.hidpp.features.error import Hidpp1ErrorCodes
 from pyhid.hidpp.features.error import Hidpp2ErrorCodes
+from pyhid.hidpp.hidppmessage import HidppMessage
 from pylibrary.system.tracelogger import TraceLevel
 from pylibrary.system.tracelogger import TraceLogger
 from pylibrary.tools.bitstruct import BitStruct
@@ -295,6 +296,8 @@ class BaseCommunicationChannel:
     GENERIC_SEND_TIMEOUT = .6  # in seconds
     GENERIC_GET_TIMEOUT = 2  # in seconds
     WAIT_CONNECTION_STATE_PERIOD = 0.1  # in seconds
+    # Index of the time stamped message queues used when the raw filters check the feature index
+    FEATURE_INDEX_INDEX = 'feature_index'
 
     def __init__(self, trace_level=TraceLevel.NO_TRACE, trace_file_name=None):
         """
@@ -330,6 +333,9 @@ class BaseCommunicationChannel:
             LogitechReportType.KEYBOARD: self.__hid_dispatcher.process_interrupt_hid_keyboard,
             LogitechReportType.DIGITIZER: self.__hid_dispatcher.process_interrupt_hid_digitizer,
         }
+        # Report types decoded by a worker as soon as they are received, the messages are directly routed to the HID
+        # dispatcher queues instead of the time stamped message queues
+        self.dispatch_workers = {}
     # end def __init__
 
     def __del__(self):
@@ -902,8 +908,22 @@ class BaseCommunicationChannel:
             # end def filter_method
         # end if
 
-        message = time_stamped_msg_queue.get_first_message_filter(
-            timeout=timeout if timeout > 0 else None, filter_method=filter_method)
+        feature_indexes = self._get_feature_indexes_in_filters(filters=raw_filters) \
+            if raw_filters is not None else None
+        if feature_indexes is None:
+            message = time_stamped_msg_queue.get_first_message_filter(
+                timeout=timeout if timeout > 0 else None, filter_method=filter_method)
+        else:
+            if not time_stamped_msg_queue.has_index(index_name=self.FEATURE_INDEX_INDEX):
+                time_stamped_msg_queue.add_index(
+                    index_name=self.FEATURE_INDEX_INDEX, key_method=self._get_feature_index)
+            # end if
+            message = time_stamped_msg_queue.get_first_message_index(
+                index_name=self.FEATURE_INDEX_INDEX,
+                key_filter_method=feature_indexes.__contains__,
+                timeout=timeout if timeout > 0 else None,
+                filter_method=filter_method)
+        # end if
 
         if not skip_error:
             for is_error_in_filters, error_filters in [(is_error_1_in_filters, self.HIDPP_1_ERROR_FILTERS),
@@ -984,13 +1004,21 @@ class BaseCommunicationChannel:
             # end def filter_method
         # end if
 
+        if report_type in self.dispatch_workers:
+            # The worker fills the dispatcher queue, there is no time stamped message to process
+            return self._get_dispatcher_message(
+                dispatcher_queue=dispatcher_queue, message_class=message_class, filter_method=filter_method,
+                timeout=timeout)
+        # end if
+
         self.process_all_report_type_in_dispatcher(report_type=report_type)
 
         message = None
 
         if not dispatcher_queue.event_empty.is_set():
-            message = dispatcher_queue.get_no_wait_first_message_filter(
-                filter_method=filter_method, skip_error=True)
+            message = self._get_no_wait_dispatcher_message(
+                dispatcher_queue=dispatcher_queue, message_class=message_class, filter_method=filter_method,
+                skip_error=True)
         # end if
 
         if message is None:
@@ -1013,8 +1041,9 @@ class BaseCommunicationChannel:
                 remaining_time = end_time - time()
                 # This could add a small drift to the computation of the timeout, but it should be small enough to
                 # be accepted
-                message = dispatcher_queue.get_no_wait_first_message_filter(
-                    filter_method=filter_method, skip_error=remaining_time > 0)
+                message = self._get_no_wait_dispatcher_message(
+                    dispatcher_queue=dispatcher_queue, message_class=message_class, filter_method=filter_method,
+                    skip_error=remaining_time > 0)
             # end while
 
             if message is None:
@@ -1027,6 +1056,136 @@ class BaseCommunicationChannel:
         return message
     # end def _common_get_message_with_dispatcher
 
+    @staticmethod
+    def _get_no_wait_dispatcher_message(dispatcher_queue, message_class, filter_method, skip_error):
+        """
+        Get the first message of the expected class(es) in a dispatcher queue, with no wait period. The message class
+        index of the queue is used if it has one.
+
+        :param dispatcher_queue: Queue in the dispatcher to find the message in
+        :type dispatcher_queue: ``HidMessageQueue``
+        :param message_class: The class(es) of the message to get. If ``None``, the message class is not checked
+        :type message_class: ``type`` or ``tuple[type]`` or ``None``
+        :param filter_method: The filter method equivalent to ``message_class``
+        :type filter_method: ``callable type`` or ``None``
+        :param skip_error: Flag to enable / disable exception when the requested message is not found
+        :type skip_error: ``bool``
+
+        :return: The message found or ``None`` if not found and ``skip_error`` is ``True``
+        :rtype: ``TimestampedBitFieldContainerMixin`` or ``None``
+        """
+        if message_class is None or not dispatcher_queue.has_index(index_name=HidMessageQueue.MESSAGE_CLASS_INDEX):
+            return dispatcher_queue.get_no_wait_first_message_filter(filter_method=filter_method, skip_error=skip_error)
+        # end if
+
+        def key_filter_method(message_type):
+            """
+            Key filter method to give to the queue when getting a message.
+
+            :param message_type: The class of a message in the queue
+            :type message_type: ``type``
+
+            :return: Flag indicating if the messages of this class are expected
+            :rtype: ``bool``
+            """
+            return issubclass(message_type, message_class)
+        # end def key_filter_method
+
+        return dispatcher_queue.get_no_wait_first_message_index(
+            index_name=HidMessageQueue.MESSAGE_CLASS_INDEX, key_filter_method=key_filter_method,
+            skip_error=skip_error)
+    # end def _get_no_wait_dispatcher_message
+
+    @staticmethod
+    def _get_dispatcher_message(dispatcher_queue, message_class, filter_method, timeout):
+        """
+        Wait for the first message of the expected class(es) in a dispatcher queue. The message class index of the
+        queue is used if it has one.
+
+        :param dispatcher_queue: Queue in the dispatcher to find the message in
+        :type dispatcher_queue: ``HidMessageQueue``
+        :param message_class: The class(es) of the message to get. If ``None``, the message class is not checked
+        :type message_class: ``type`` or ``tuple[type]`` or ``None``
+        :param filter_method: The filter method equivalent to ``message_class``
+        :type filter_method: ``callable type`` or ``None``
+        :param timeout: The timeout of this action in seconds (0 disable it)
+        :type timeout: ``float`` or ``int``
+
+        :return: The message found
+        :rtype: ``TimestampedBitFieldContainerMixin``
+
+        :raise ``QueueEmpty``: If no expected message is received before the timeout
+        """
+        if message_class is None or not dispatcher_queue.has_index(index_name=HidMessageQueue.MESSAGE_CLASS_INDEX):
+            return dispatcher_queue.get_first_message_filter(timeout=timeout, filter_method=filter_method)
+        # end if
+
+        def key_filter_method(message_type):
+            """
+            Key filter method to give to the queue when getting a message.
+
+            :param message_type: The class of a message in the queue
+            :type message_type: ``type``
+
+            :return: Flag indicating if the messages of this class are expected
+            :rtype: ``bool``
+            """
+            return issubclass(message_type, message_class)
+        # end def key_filter_method
+
+        return dispatcher_queue.get_first_message_index(
+            index_name=HidMessageQueue.MESSAGE_CLASS_INDEX, key_filter_method=key_filter_method, timeout=timeout)
+    # end def _get_dispatcher_message
+
+    @staticmethod
+    def _get_feature_indexes_in_filters(filters):
+        """
+        Get the feature indexes (or HID++ 1.0 sub ids) the filters accept, if all the filters check it.
+
+        :param filters: A list of filter for the message
+        :type filters: ``list[MessageFilter]`` or ``tuple[list[MessageFilter]]``
+
+        :return: The accepted feature indexes or ``None`` if a filter does not check the feature index
+        :rtype: ``frozenset[int]`` or ``None``
+        """
+        if not isinstance(filters, tuple):
+            filters = (filters,)
+        # end if
+
+        feature_indexes = set()
+        for message_filters in filters:
+            values = {byte_filter.value for byte_filter in message_filters
+                      if byte_filter.index_in_message == HidppMessage.OFFSET.FEATURE_INDEX}
+            if len(values) == 0:
+                return None
+            elif len(values) == 1:
+                feature_indexes.update(values)
+            # end if
+            # More than one value in the same filter list: no message can match it
+        # end for
+        return frozenset(feature_indexes)
+    # end def _get_feature_indexes_in_filters
+
+    @staticmethod
+    def _get_feature_index(transport_message):
+        """
+        Get the feature index (or HID++ 1.0 sub id) of a message, it is the key of the feature index index of the
+        time stamped message queues.
+
+        :param transport_message: The message
+        :type transport_message: ``TransportMessage``
+
+        :return: The feature index or ``None`` if the message is too short
+        :rtype: ``int`` or ``None``
+        """
+        # The header is read in the raw data, the HexList is not built
+        data = transport_message.raw_data
+        if data is None or len(data) <= HidppMessage.OFFSET.FEATURE_INDEX:
+            return None
+        # end if
+        return data[HidppMessage.OFFSET.FEATURE_INDEX]
+    # end def _get_feature_index
+
     @staticmethod
     def _are_hidpp_errors_in_filters(filters):
         """
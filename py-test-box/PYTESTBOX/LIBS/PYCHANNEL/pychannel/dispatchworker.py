@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Box
+# ------------------------------------------------------------------------------
+"""
+:package: pychannel.dispatchworker
+:brief: Worker decoding the messages of an interface out of the transport thread
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from collections import deque
+from threading import Event
+from threading import Thread
+from time import perf_counter_ns
+
+from pylibrary.system.tracelogger import TraceLevel
+from pylibrary.system.tracelogger import TraceLogger
+from pylibrary.tools.tracebacklog import TracebackLogWrapper
+
+# ------------------------------------------------------------------------------
+# constants
+# ------------------------------------------------------------------------------
+TRACE_LOGGER = TraceLogger.get_instance()
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class DispatchWorker(Thread):
+    """
+    Worker decoding the messages received on an interface and routing them to the HID dispatcher queues.
+
+    It replaces the time stamped message queue given to the transport: the transport thread only appends the message
+    to a bounded ring, without lock, and the worker thread decodes the messages in their reception order. When the ring
+    is full, the oldest message is dropped.
+
+    The latency is measured from the time the message is put in the ring, the timestamp of the message being given by
+    the device or the driver on some transports.
+
+    The messages are decoded with the state of the HID dispatcher at their reception, not when they are got by the
+    test.
+    """
+    DEFAULT_RING_SIZE = 1024
+
+    def __init__(self, process_message_callback, ring_size=DEFAULT_RING_SIZE, name=None, trace_owner=None):
+        """
+        :param process_message_callback: The method decoding and routing a transport message, like
+                                         ``HIDDispatcher.process_interrupt_hidpp``
+        :type process_message_callback: ``callable type``
+        :param ring_size: The maximum number of messages waiting to be decoded - OPTIONAL
+        :type ring_size: ``int``
+        :param name: The thread name - OPTIONAL
+        :type name: ``str`` or ``None``
+        :param trace_owner: The subscription owner used to log the errors - OPTIONAL
+        :type trace_owner: ``object`` or ``None``
+        """
+        assert ring_size > 0, f"The ring size should be strictly positive, {ring_size} is not"
+        super().__init__(name=name, daemon=True)
+        self._process_message_callback = process_message_callback
+        self._ring = deque(maxlen=ring_size)
+        self._trace_owner = trace_owner
+        self._wake_up_event = Event()
+        self._stop_event = Event()
+        self.ring_size = ring_size
+
+        self.received_count = 0
+        self.dropped_count = 0
+        self.processed_count = 0
+        self.not_decoded_count = 0
+        self.error_count = 0
+        self.max_depth = 0
+        # Decoding time and latency from the put of the message in the ring to its routing, in ns
+        self.total_decode_time = 0
+        self.max_decode_time = 0
+        self.total_latency = 0
+        self.max_latency = 0
+    # end def __init__
+
+    def __str__(self):
+        processed_count = max(self.processed_count, 1)
+        return f"{self.name}: {self.received_count} received, {self.dropped_count} dropped, " \
+               f"{self.processed_count} processed ({self.not_decoded_count} not decoded, {self.error_count} errors), " \
+               f"depth {self.depth}/{self.ring_size} (max {self.max_depth}), " \
+               f"decode {self.total_decode_time // processed_count}ns (max {self.max_decode_time}ns), " \
+               f"latency {self.total_latency // processed_count}ns (max {self.max_latency}ns)"
+    # end def __str__
+
+    @property
+    def depth(self):
+        """
+        Property getter of ``depth``, the number of messages waiting to be decoded.
+
+        :return: ``depth`` value
+        :rtype: ``int``
+        """
+        return len(self._ring)
+    # end def property getter depth
+
+    def put_nowait(self, item):
+        """
+        Give a message to decode, called by the transport thread.
+
+        :param item: The message received
+        :type item: ``TransportMessage``
+        """
+        ring = self._ring
+        if len(ring) == self.ring_size:
+            # The ring drops its oldest message
+            self.dropped_count += 1
+        # end if
+        ring.append((perf_counter_ns(), item))
+        self.received_count += 1
+
+        depth = len(ring)
+        if depth > self.max_depth:
+            self.max_depth = depth
+        # end if
+
+        # Avoid the lock of the event when the worker is already awake
+        if not self._wake_up_event.is_set():
+            self._wake_up_event.set()
+        # end if
+    # end def put_nowait
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Give a message to decode, it never blocks.
+
+        :param item: The message received
+        :type item: ``TransportMessage``
+        :param block: Unused, kept for the ``Queue`` interface - OPTIONAL
+        :type block: ``bool``
+        :param timeout: Unused, kept for the ``Queue`` interface - OPTIONAL
+        :type timeout: ``float`` or ``None``
+        """
+        self.put_nowait(item)
+    # end def put
+
+    def stop(self, timeout=None):
+        """
+        Stop the worker once the messages already received are decoded.
+
+        :param timeout: The maximum time to wait for the worker, in seconds - OPTIONAL
+        :type timeout: ``float`` or ``None``
+
+        :return: Flag indicating if the worker is stopped, it is not if a decoding or a subscriber is stuck
+        :rtype: ``bool``
+        """
+        self._stop_event.set()
+        self._wake_up_event.set()
+        if self.is_alive():
+            self.join(timeout=timeout)
+        # end if
+        return not self.is_alive()
+    # end def stop
+
+    def reset_statistics(self):
+        """
+        Reset the counters, the depth is not changed.
+        """
+        self.received_count = 0
+        self.dropped_count = 0
+        self.processed_count = 0
+        self.not_decoded_count = 0
+        self.error_count = 0
+        self.max_depth = 0
+        self.total_decode_time = 0
+        self.max_decode_time = 0
+        self.total_latency = 0
+        self.max_latency = 0
+    # end def reset_statistics
+
+    def run(self):
+        # See ``Thread.run``
+        while True:
+            # Cleared before emptying the ring, a message appended after is signaled again
+            self._wake_up_event.clear()
+            self._process_ring()
+            if self._stop_event.is_set():
+                break
+            # end if
+            self._wake_up_event.wait()
+        # end while
+    # end def run
+
+    def _process_ring(self):
+        """
+        Decode the messages of the ring until it is empty.
+        """
+        ring = self._ring
+        process_message_callback = self._process_message_callback
+        while len(ring) > 0:
+            try:
+                put_time, transport_message = ring.popleft()
+            except IndexError:
+                break
+            # end try
+
+            start = perf_counter_ns()
+            # noinspection PyBroadException
+            try:
+                if process_message_callback(transport_message=transport_message) is None:
+                    self.not_decoded_count += 1
+                # end if
+            except Exception:
+                self.error_count += 1
+                if self._trace_owner is not None:
+                    TRACE_LOGGER.log_trace(
+                        subscription_owner=self._trace_owner,
+                        message=f"{self.name}, cannot decode {transport_message}:\n"
+                                f"{TracebackLogWrapper.get_exception_stack()}",
+                        trace_level=TraceLevel.ERROR)
+                # end if
+            # end try
+            end = perf_counter_ns()
+
+            self.processed_count += 1
+            decode_time = end - start
+            self.total_decode_time += decode_time
+            if decode_time > self.max_decode_time:
+                self.max_decode_time = decode_time
+            # end if
+            latency = end - put_time
+            self.total_latency += latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+            # end if
+        # end while
+    # end def _process_ring
+# end class DispatchWorker
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Box
+# ------------------------------------------------------------------------------
+"""
+:package: pychannel.test.dispatchworker_test
+:brief: ``DispatchWorker`` unit tests
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from threading import Event
+from time import perf_counter_ns
+from time import sleep
+from unittest import TestCase
+
+from pychannel.dispatchworker import DispatchWorker
+from pytransport.transportmessage import TransportMessage
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class DispatchWorkerTestCase(TestCase):
+    """
+    Test ``DispatchWorker`` class
+    """
+    def setUp(self):
+        # See ``TestCase.setUp``
+        self.processed_messages = []
+        self.processing_event = Event()
+        self.unblock_event = Event()
+        self.unblock_event.set()
+    # end def setUp
+
+    def test_order(self):
+        """
+        Check the messages are processed in their reception order
+        """
+        dispatch_worker = DispatchWorker(process_message_callback=self._process_message, name="test")
+        dispatch_worker.start()
+        messages = [TransportMessage(raw_data=bytes([index]), timestamp=perf_counter_ns()) for index in range(200)]
+        for message in messages:
+            dispatch_worker.put_nowait(message)
+        # end for
+        dispatch_worker.stop(timeout=5)
+
+        self.assertFalse(dispatch_worker.is_alive())
+        self.assertEqual(messages, self.processed_messages)
+        self.assertEqual(200, dispatch_worker.received_count)
+        self.assertEqual(200, dispatch_worker.processed_count)
+        self.assertEqual(0, dispatch_worker.dropped_count)
+        self.assertEqual(0, dispatch_worker.depth)
+        self.assertGreater(dispatch_worker.max_latency, 0)
+    # end def test_order
+
+    def test_drop_oldest(self):
+        """
+        Check the oldest messages are dropped when the ring is full
+        """
+        self.unblock_event.clear()
+        dispatch_worker = DispatchWorker(process_message_callback=self._process_message, ring_size=4)
+        dispatch_worker.start()
+        messages = [TransportMessage(raw_data=bytes([index])) for index in range(10)]
+        dispatch_worker.put_nowait(messages[0])
+        self.assertTrue(self.processing_event.wait(timeout=5), "The worker did not get the first message")
+        for message in messages[1:]:
+            dispatch_worker.put(message)
+        # end for
+
+        self.assertEqual(4, dispatch_worker.depth)
+        self.assertEqual(4, dispatch_worker.max_depth)
+        self.assertEqual(5, dispatch_worker.dropped_count)
+
+        self.unblock_event.set()
+        dispatch_worker.stop(timeout=5)
+
+        self.assertEqual([messages[0]] + messages[6:], self.processed_messages)
+        self.assertEqual(10, dispatch_worker.received_count)
+        self.assertEqual(5, dispatch_worker.processed_count)
+    # end def test_drop_oldest
+
+    def test_latency(self):
+        """
+        Check the latency is measured from the put of the message, not from its timestamp
+        """
+        self.unblock_event.clear()
+        dispatch_worker = DispatchWorker(process_message_callback=self._process_message)
+        dispatch_worker.start()
+        # Device timestamps, not on the perf_counter_ns timeline
+        dispatch_worker.put_nowait(TransportMessage(raw_data=b'\x00', timestamp=0))
+        dispatch_worker.put_nowait(TransportMessage(raw_data=b'\x01'))
+        start = perf_counter_ns()
+        self.assertTrue(self.processing_event.wait(timeout=5), "The worker did not get the first message")
+        sleep(0.05)
+        self.unblock_event.set()
+        dispatch_worker.stop(timeout=5)
+        elapsed = perf_counter_ns() - start
+
+        self.assertEqual(2, dispatch_worker.processed_count)
+        self.assertGreaterEqual(dispatch_worker.max_latency, 50000000)
+        self.assertLess(dispatch_worker.max_latency, elapsed + 50000000)
+        self.assertGreaterEqual(dispatch_worker.total_latency, 2 * 50000000)
+    # end def test_latency
+
+    def test_counters(self):
+        """
+        Check the messages not decoded and the errors are counted, without stopping the worker
+        """
+        def process_message(transport_message):
+            if transport_message.raw_data[0] == 0:
+                return None
+            elif transport_message.raw_data[0] == 1:
+                raise ValueError("Cannot decode")
+            # end if
+            return transport_message
+        # end def process_message
+
+        dispatch_worker = DispatchWorker(process_message_callback=process_message)
+        dispatch_worker.start()
+        for value in (0, 1, 2, 1, 2):
+            dispatch_worker.put_nowait(TransportMessage(raw_data=bytes([value])))
+        # end for
+        dispatch_worker.stop(timeout=5)
+
+        self.assertEqual(5, dispatch_worker.processed_count)
+        self.assertEqual(1, dispatch_worker.not_decoded_count)
+        self.assertEqual(2, dispatch_worker.error_count)
+        self.assertIn("5 received, 0 dropped, 5 processed (1 not decoded, 2 errors)", str(dispatch_worker))
+
+        dispatch_worker.reset_statistics()
+        self.assertEqual(0, dispatch_worker.processed_count)
+        self.assertEqual(0, dispatch_worker.total_decode_time)
+    # end def test_counters
+
+    def test_stop_timeout(self):
+        """
+        Check the stop of a worker stuck in a decoding returns after the timeout
+        """
+        self.unblock_event.clear()
+        dispatch_worker = DispatchWorker(process_message_callback=self._process_message)
+        dispatch_worker.start()
+        dispatch_worker.put_nowait(TransportMessage(raw_data=b'\x00'))
+        dispatch_worker.put_nowait(TransportMessage(raw_data=b'\x01'))
+        self.assertTrue(self.processing_event.wait(timeout=5), "The worker did not get the first message")
+
+        self.assertFalse(dispatch_worker.stop(timeout=0.05))
+        self.assertTrue(dispatch_worker.is_alive())
+        self.assertEqual(1, dispatch_worker.depth)
+
+        self.unblock_event.set()
+        self.assertTrue(dispatch_worker.stop(timeout=5))
+        self.assertEqual(2, dispatch_worker.processed_count)
+    # end def test_stop_timeout
+
+    def _process_message(self, transport_message):
+        """
+        Process message callback saving the messages
+
+        :param transport_message: The message to process
+        :type transport_message: ``TransportMessage``
+
+        :return: The message
+        :rtype: ``TransportMessage``
+        """
+        self.processing_event.set()
+        self.unblock_event.wait()
+        self.processed_messages.append(transport_message)
+        return transport_message
+    # end def _process_message
+# end class DispatchWorkerTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -351,6 +351,38 @@ class UsbChannelTestCase(TestCase):
                          msg="Message received is not the expected one")
     # end def test_get_message_business
 
+    def test_dispatch_worker_business(self):
+        """
+        Test the HID++ messages are given to a dispatch worker when it is enabled
+        """
+        usb_context = MockUsbContext()
+        test_object = self._get_test_object(usb_context=usb_context)
+        test_object.DISPATCH_WORKER_REPORT_TYPES = (LogitechReportType.HIDPP,)
+        test_object.open()
+
+        dispatch_worker = test_object.dispatch_workers.get(LogitechReportType.HIDPP)
+        if isinstance(test_object, UsbReceiverChannel):
+            # The multi device index queue of the receiver cannot be replaced
+            self.assertIsNone(dispatch_worker)
+            test_object.close()
+            return
+        # end if
+
+        self.assertIs(dispatch_worker, usb_context.hidpp_queue)
+        self.assertTrue(dispatch_worker.is_alive())
+
+        usb_context.hidpp_queue.put_nowait(TransportMessage(data=HexList('10ff8100000000')))
+        message = test_object.get_message(dispatcher_queue=test_object.hid_dispatcher.receiver_response_queue,
+                                          message_class=GetEnableHidppReportingResponse, timeout=1)
+        self.assertIsInstance(obj=message, cls=GetEnableHidppReportingResponse)
+        test_object.close()
+
+        self.assertFalse(dispatch_worker.is_alive())
+        self.assertEqual(first=1, second=dispatch_worker.processed_count)
+        self.assertEqual(first={}, second=test_object.dispatch_workers)
+        self._check_after_closing(test_object=test_object)
+    # end def test_dispatch_worker_business
+
     def test_open_different_link_enabler(self):
         """
         Test open method of a ``UsbChannel`` object with different link enabler
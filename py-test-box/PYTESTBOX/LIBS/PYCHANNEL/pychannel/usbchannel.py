@@ -23,6 +23,7 @@ from pychannel.channelinterfaceclasses import LinkEnablerInfo
 from pychannel.channelinterfaceclasses import LogitechProtocol
 from pychannel.channelinterfaceclasses import LogitechReportType
 from pychannel.channelinterfaceclasses import MessageFilter
+from pychannel.dispatchworker import DispatchWorker
 from pyhid.bitfieldcontainermixin import TimestampedBitFieldContainerMixin
 from pyhid.hiddispatcher import HidMessageQueue
 from pyhid.hidpp.hidpp1.hidpp1data import Hidpp1Data
@@ -82,6 +83,12 @@ class UsbChannel(BaseCommunicationChannel):
     Implementation of a USB communication channel.
     """
     HIDPP_QUEUE_TYPE = QueueWithFilter
+    # Report types decoded by a dispatch worker as soon as they are received, instead of when a message is got. The
+    # time stamped message queues of those report types stay empty, only the HID dispatcher queues can be used
+    DISPATCH_WORKER_REPORT_TYPES = ()
+    DISPATCH_WORKER_RING_SIZE = DispatchWorker.DEFAULT_RING_SIZE
+    # Maximum time to wait for a dispatch worker to decode its last messages when the channel is closed, in seconds
+    DISPATCH_WORKER_STOP_TIMEOUT = 2
 
     def __init__(self, usb_context, usb_context_device, trace_level=TraceLevel.NO_TRACE,
                  trace_file_name=None):
@@ -242,6 +249,8 @@ class UsbChannel(BaseCommunicationChannel):
                     # which exception because it does not matter.
                     self._usb_context.stop_interrupt_read_polling(usb_context_device=self._usb_context_device)
                     raise
+                finally:
+                    self._stop_dispatch_workers()
                 # end try
                 raise
             # end try
@@ -276,6 +285,8 @@ class UsbChannel(BaseCommunicationChannel):
                 # end try
             # end if
 
+            self._stop_dispatch_workers()
+
             for report_type in self.report_type_time_stamped_msg_queue:
                 receiver_queue = self.report_type_time_stamped_msg_queue[report_type]
                 if isinstance(receiver_queue, ReceiverMultiHidppQueue):
@@ -914,6 +925,16 @@ class UsbChannel(BaseCommunicationChannel):
             self.report_type_to_interface[report_type] = interface_id
             self.report_type_to_endpoint[report_type] = ep_id
             msg_queue = self.report_type_time_stamped_msg_queue[report_type]
+            if report_type in self.DISPATCH_WORKER_REPORT_TYPES and \
+                    not isinstance(msg_queue, ReceiverMultiHidppQueue):
+                msg_queue = DispatchWorker(
+                    process_message_callback=self._report_type_to_process_message_callback[report_type],
+                    ring_size=self.DISPATCH_WORKER_RING_SIZE,
+                    name=f"{trace_name} dispatch worker",
+                    trace_owner=self)
+                msg_queue.start()
+                self.dispatch_workers[report_type] = msg_queue
+            # end if
         else:
             msg_queue = None
         # end if
@@ -926,6 +947,27 @@ class UsbChannel(BaseCommunicationChannel):
             discard_report=discard_report)
         # end if
     # end def _start_interrupt_polling_on_interface
+
+    def _stop_dispatch_workers(self):
+        """
+        Stop the dispatch workers once the messages they received are decoded, and log their statistics.
+        """
+        for report_type, dispatch_worker in self.dispatch_workers.items():
+            if not dispatch_worker.stop(timeout=self.DISPATCH_WORKER_STOP_TIMEOUT):
+                # The daemon thread is left behind, the channel close is not blocked by a stuck decoding or subscriber
+                TRACE_LOGGER.log_trace(
+                    subscription_owner=self,
+                    message=f"{report_type!r} {dispatch_worker.name} still alive after "
+                            f"{self.DISPATCH_WORKER_STOP_TIMEOUT}s, {dispatch_worker.depth} messages not decoded",
+                    trace_level=TraceLevel.WARNING)
+            # end if
+            TRACE_LOGGER.log_trace(
+                subscription_owner=self,
+                message=f"{report_type!r} {dispatch_worker}",
+                trace_level=TraceLevel.DEBUG if dispatch_worker.dropped_count == 0 else TraceLevel.WARNING)
+        # end for
+        self.dispatch_workers.clear()
+    # end def _stop_dispatch_workers
 # end class UsbChannel
 
 
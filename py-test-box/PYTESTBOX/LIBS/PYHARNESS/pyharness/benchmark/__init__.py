@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+""" @package pyharness.benchmark
+
+@brief PyHarness benchmark repository
+
+@author christophe Roquebert
+
+@date   2026/10/18
+
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
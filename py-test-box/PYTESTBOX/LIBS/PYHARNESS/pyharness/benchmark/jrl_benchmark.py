@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyharness.benchmark.jrl_benchmark
+:brief: Benchmark of the Journal.jrl queries, full text scan against the indexed journal
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A journal of a long-lived bench is written: the same test ids run again and again. The parsing of every line, as done
+by the text scan, is compared to the index import, the index reload and the queries used by the test manager (last
+entry of every test id, history of a test id). The append of new entries and the compaction are also measured.
+
+Usage: python -m pyharness.benchmark.jrl_benchmark [entry count]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from os.path import join
+from shutil import rmtree
+from time import localtime
+from time import perf_counter_ns
+
+from pyharness.files.jrl import JrlFile
+from pylibrary.tools.tempfile import mkdtemp
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_ENTRY_COUNT = 1000000
+TEST_ID_COUNT = 1000
+APPEND_COUNT = 100
+
+
+def write_journal(path, count):
+    """
+    Write a journal with runs of ``TEST_ID_COUNT`` tests, up to the entry count.
+
+    :param path: The path of the journal
+    :type path: ``str``
+    :param count: Number of entries
+    :type count: ``int``
+
+    :return: The test ids
+    :rtype: ``list[str]``
+    """
+    test_ids = [f'pytestbox.device.hidpp20.feature{index // 10}.Test{index}.test_business' for index in
+                range(TEST_ID_COUNT)]
+    test_time = localtime()
+    lines = []
+    for index, test_id in enumerate(test_ids):
+        jrl_entry = JrlFile.JrlEntry(test_id, test_time, test_time,
+                                     JrlFile.JrlEntry.STATE_SUCCESS if index % 7 else JrlFile.JrlEntry.STATE_FAILURE)
+        lines.append((jrl_entry.toString() + '\n').encode('utf8'))
+    # end for
+    run_start = ''.join(JrlFile.JrlComment(comment).toString() + '\n' for comment in (
+        'run started', '-' * 77)).encode('utf8')
+
+    JrlFile._createBlankFile(path)                                                        # pylint:disable=W0212
+    with open(path, 'ab') as jrl_file:
+        for run_index in range(0, count, TEST_ID_COUNT):
+            jrl_file.write(run_start)
+            jrl_file.writelines(lines[:count - run_index])
+        # end for
+    # end with
+    return test_ids
+# end def write_journal
+
+
+def measure_text_scan(path):
+    """
+    Measure the parsing of every line of the journal.
+
+    :param path: The path of the journal
+    :type path: ``str``
+
+    :return: The time in ns
+    :rtype: ``int``
+    """
+    start = perf_counter_ns()
+    entries = {}
+    with open(path, 'r') as jrl_file:
+        lines = jrl_file.readlines()
+    # end with
+    for line in lines:
+        line = line.strip()
+        if len(line) > 0 and line[0] != '#':
+            jrl_entry = JrlFile.JrlEntry.fromString(line)
+            entries.setdefault(jrl_entry.getTestId(), []).append(jrl_entry)
+        # end if
+    # end for
+    return perf_counter_ns() - start
+# end def measure_text_scan
+
+
+def measure(function, *args):
+    """
+    Measure a function call.
+
+    :param function: The function to call
+    :type function: ``callable``
+    :param args: The arguments of the function
+    :type args: ``tuple``
+
+    :return: The time in ns and the function result
+    :rtype: ``tuple[int, object]``
+    """
+    start = perf_counter_ns()
+    result = function(*args)
+    return perf_counter_ns() - start, result
+# end def measure
+
+
+def append_entries(jrl_file, test_ids):
+    """
+    Append entries as the journal test listener does: create and save, then update and save.
+
+    :param jrl_file: The journal
+    :type jrl_file: ``JrlFile``
+    :param test_ids: The test ids
+    :type test_ids: ``list[str]``
+    """
+    for test_id in test_ids[:APPEND_COUNT]:
+        jrl_file.createEntry(test_id, localtime())
+        jrl_file.save()
+        jrl_entry = jrl_file.getLastEntry(test_id)
+        jrl_entry.setTestStopDate(localtime())
+        jrl_entry.setTestState(JrlFile.JrlEntry.STATE_SUCCESS)
+        jrl_file.save()
+    # end for
+# end def append_entries
+
+
+def main(count=DEFAULT_ENTRY_COUNT):
+    """
+    Run the benchmark and print the results.
+
+    :param count: Number of journal entries
+    :type count: ``int``
+    """
+    temp_dir_path = mkdtemp('', 'jrl_benchmark')
+    try:
+        path = join(temp_dir_path, 'Journal.jrl')
+        test_ids = write_journal(path, count)
+
+        text_scan_time = measure_text_scan(path)
+        import_time, _ = measure(JrlFile, path)
+        load_time, jrl_file = measure(JrlFile, path)
+        last_entries_time, _ = measure(lambda: [jrl_file.getLastEntry(test_id) for test_id in test_ids])
+        history_time, history = measure(jrl_file.getAllEntries, test_ids[-1])
+        append_time, _ = measure(append_entries, jrl_file, test_ids)
+        compact_time, _ = measure(jrl_file.compact)
+
+        print(f'{count} journal entries, {len(test_ids)} test ids')
+        for name, elapsed in (('text scan (every line parsed)', text_scan_time),
+                              ('index import from text', import_time),
+                              ('index load', load_time),
+                              (f'last entry of {len(test_ids)} test ids', last_entries_time),
+                              (f'history of a test id ({len(history)} entries)', history_time),
+                              (f'{APPEND_COUNT} entries appended', append_time),
+                              ('compaction', compact_time)):
+            print(f'{name:40}: {elapsed / 1000000:10.2f} ms')
+        # end for
+    finally:
+        rmtree(temp_dir_path, True)
+    # end try
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
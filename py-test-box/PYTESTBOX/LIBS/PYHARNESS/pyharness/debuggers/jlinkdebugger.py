@@ -82,6 +82,8 @@ class JlinkDebugger(NvsDebugger, ABC):
     NVS_START_ADDRESS = None
     NVS_SIZE = None
     NVS_BANK_SIZE = None
+    # NRF52 flash page size
+    NVS_PAGE_SIZE = 4 * 1024
 
     def __init__(self, input_dir='.', local_dir=None, debugger_number=0):
         """
@@ -447,6 +449,25 @@ class JlinkDebugger(NvsDebugger, ABC):
         self._j_link.erase()
     # end def erase_firmware
 
+    def write_flash_page(self, address, data):
+        """
+        Erase a flash page and write its content.
+
+        :param address: The start address of the flash page
+        :type address: ``int``
+        :param data: The content of the flash page
+        :type data: ``HexList``
+
+        :raise ``RuntimeError``: If the J-Link is not opened
+        """
+        if self._j_link is not None and self._j_link.opened():
+            # The J-Link flash loader erases the flash sectors touched by the download
+            self._j_link.flash_write(addr=address, data=list(data))
+        else:
+            raise RuntimeError("Unable to write flash page")
+        # end if
+    # end def write_flash_page
+
     def flash_firmware(self, firmware_hex_file, no_reset=False):
         """
         Flash firmware.
@@ -460,6 +481,7 @@ class JlinkDebugger(NvsDebugger, ABC):
         :return: Status
         :rtype: ``int``
         """
+        self.count_flash_write()
         flash_hex_file = IntelHex(firmware_hex_file)
         # Create a temporary file which is going to be deleted just after the flashing
         flash_hex_file_path = "tmp_flash_file.hex"
@@ -572,6 +594,7 @@ class JlinkDebugger(NvsDebugger, ABC):
         :return: Status
         :rtype: ``int``
         """
+        self.count_flash_write()
         # Create a temporary file which is going to be deleted just after the flashing
         flash_hex_file_path = "tmp_merged_files.hex"
         flash_hex_file = IntelHex(nvs_hex_file)
@@ -1007,6 +1030,8 @@ class STM32F723IEJLinkDebugger(JlinkDebugger):  # noqa
     Implementation of a debugger configured for the STM32F723IE MCU, companion MCU on Savituck.
     """
     MCU_NAME = 'STM32F723IE'
+    # The STM32 NVS is reloaded with the whole firmware
+    NVS_PAGE_SIZE = None
 
     FMM_FLASH_SIZE = 256 * 1024
     FMM_FLASH_START_ADDR = 0x08000000
@@ -1049,6 +1074,8 @@ class STM32F072CBJlinkDebugger(JlinkDebugger):
     NVS_START_ADDRESS = 0x8004000
     NVS_SIZE = 28 * 1024
     NVS_BANK_SIZE = 2 * 1024
+    # The STM32 NVS is reloaded with the whole firmware
+    NVS_PAGE_SIZE = None
 # end class STM32F072CBJlinkDebugger
 
 
@@ -1063,6 +1090,8 @@ class STM32H7B0IBJLinkDebugger(JlinkDebugger):
     SECURE_BLOCK_START_ADDRESS = 0x0801A000
     NVS_SECURE_SIZE = 0x2000
     NVS_BANK_SIZE = [0x2000, 0x2000]
+    # The STM32 NVS is reloaded with the whole firmware
+    NVS_PAGE_SIZE = None
 # end class STM32H7B0IBJLinkDebugger
 
 
@@ -1075,6 +1104,8 @@ class STM32L052JLinkDebugger(JlinkDebugger):
     NVS_START_ADDRESS = 0x08080000
     NVS_SIZE = 2 * 1024
     NVS_BANK_SIZE = 2 * 1024
+    # The STM32 NVS is reloaded with the whole firmware
+    NVS_PAGE_SIZE = None
 
     def erase_and_flash_firmware(self, firmware_hex_file, no_reset=False):
         """
@@ -25,6 +25,7 @@ from typing import TextIO
 from intelhex import IntelHex
 
 from pylibrary.system.debugger import Debugger
+from pylibrary.system.nvspagewriter import NvsPageWriter
 from pylibrary.tools.config import ConfigParser
 from pylibrary.tools.elfhelper import ElfHelper
 # noinspection PyUnresolvedReferences
@@ -52,10 +53,25 @@ class NvsDebugger(Debugger, ABC):
     NVS_START_ADDRESS = None
     NVS_SIZE = None
     NVS_BANK_SIZE = None
+    # Size of the flash pages of the NVS, ``None`` if the NVS can only be reloaded with the whole firmware. The
+    # debuggers defining it implement ``write_flash_page(address, data)``, erasing a flash page and writing its content
+    NVS_PAGE_SIZE = None
+
+    # Number of flash writes (firmware or NVS) done by the debuggers in the process. The caches of the device state,
+    # like the feature tables, compare it with the count of their last read to detect a flash write
+    flash_write_count = 0
 
     _serial_no: int = 0
     _stdout: TextIO = None
 
+    @staticmethod
+    def count_flash_write():
+        """
+        Count a flash write of a device, to be called by the flash and reload methods of the debuggers.
+        """
+        NvsDebugger.flash_write_count += 1
+    # end def count_flash_write
+
     @contextmanager
     def opened_with_mcu_name(self, mcu_name, unlock_device=False, exclude_nvs_range=True, **kwargs):
         """
@@ -302,6 +318,69 @@ class NvsDebugger(Debugger, ABC):
         return self.flash_firmware(flash_hex_file, no_reset)
     # end def reload_file
 
+    def exclude_flash_cache_range(self, start_address, stop_address):
+        """
+        Exclude a part of the flash from the internal cache of the probe, so that its reads get the flash content.
+        The probes without flash cache read the flash directly.
+
+        :param start_address: Start address of the range to exclude
+        :type start_address: ``int``
+        :param stop_address: Stop address of the range to exclude
+        :type stop_address: ``int``
+        """
+        pass
+    # end def exclude_flash_cache_range
+
+    def reload_nvs_pages(self, nvs_hex_file, no_reset=False, full_write_time=None):
+        """
+        Flash the NVS without the firmware, only the flash pages which differ from the device content are erased and
+        written with ``write_flash_page``. The device is halted during the write, then reset.
+
+        The debuggers which do not define ``NVS_PAGE_SIZE`` reload the NVS with the whole firmware.
+
+        :param nvs_hex_file: Hex file of the NVS to load
+        :type nvs_hex_file: ``str`` or ``IntelHex``
+        :param no_reset: If True, the device is only stopped and run, without reset - OPTIONAL
+        :type no_reset: ``bool``
+        :param full_write_time: The duration of the last whole NVS reload, in seconds, to report the saved time
+                                - OPTIONAL
+        :type full_write_time: ``float`` or ``None``
+
+        :return: The write report, ``None`` if the NVS is reloaded with the whole firmware
+        :rtype: ``NvsWriteReport`` or ``None``
+
+        :raise ``AssertionError``: If a page is not written
+        """
+        if self.NVS_PAGE_SIZE is None:
+            if no_reset:
+                self.reload_nvs_no_device_reset(nvs_hex_file=nvs_hex_file)
+            else:
+                self.reload_file(nvs_hex_file=nvs_hex_file)
+            # end if
+            return None
+        # end if
+
+        nvs_page_writer = NvsPageWriter(debugger=self,
+                                        start_address=self.NVS_START_ADDRESS,
+                                        size=self.NVS_SIZE,
+                                        page_size=self.NVS_PAGE_SIZE)
+        self.count_flash_write()
+        self.stop()
+        try:
+            # The device content and the written pages are compared with the flash, not with the probe cache which
+            # is updated by the write itself
+            self.exclude_flash_cache_range(self.NVS_START_ADDRESS, self.NVS_START_ADDRESS + self.NVS_SIZE)
+            report = nvs_page_writer.write(nvs_hex_file, full_write_time=full_write_time)
+        finally:
+            if no_reset:
+                self.run()
+            else:
+                self.reset()
+            # end if
+        # end try
+        return report
+    # end def reload_nvs_pages
+
     @staticmethod
     def remove_data_block(file, start_address, size):
         """
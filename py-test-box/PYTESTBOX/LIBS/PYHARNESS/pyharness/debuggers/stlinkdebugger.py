@@ -212,6 +212,7 @@ class STLinkDebugger(NvsDebugger, ABC):
         :raise ``AssertionError``: if running subprocess fails
         :raise ``RuntimeError``: if the expected returned message is not found in stdout
         """
+        self.count_flash_write()
         if no_reset:
             process = subprocess.run([ST_FLASH, CONNECT_UNDER_RESET, WRITE, firmware_hex_file],
                                      capture_output=True, universal_newlines=True)
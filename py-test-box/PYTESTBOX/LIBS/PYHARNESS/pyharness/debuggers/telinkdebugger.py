@@ -298,6 +298,7 @@ class TelinkDebugger(NvsDebugger, ABC):
         :raise ``AssertionError``: if running subprocess fails
         :raise ``RuntimeError``: if the expected returned message is not found in stdout
         """
+        NvsDebugger.count_flash_write()
         process = subprocess.run([LINUX_BDT, MODEL, FLASH, START_ADDRESS, INPUT, firmware_hex_file],
                                  capture_output=True, universal_newlines=True)
         assert process.returncode == 0, f"LinuxBDT flashing subprocess failed: {process.stdout}"
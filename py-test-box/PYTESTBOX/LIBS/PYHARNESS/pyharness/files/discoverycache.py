@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+''' @package pyharness.files.discoverycache
+
+@brief  Persistent cache of the collected test trees.
+
+@author christophe.roquebert
+
+@date   2026/10/18
+'''
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from hashlib                            import sha1
+from importlib.util                     import find_spec
+from json                               import dump
+from json                               import load
+from os                                 import makedirs
+from os                                 import replace
+from os                                 import stat
+from os                                 import walk
+from os.path                            import dirname
+from os.path                            import join
+from threading                          import RLock
+from pylibrary.tools.threadutils        import synchronized
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+
+class DiscoveryCache(object):
+    '''
+    A cache of the test trees collected from a root test id.
+
+    Collecting a test tree imports every test module below the root test id, and runs the whole tree in collect
+    mode. The collected tree is saved with:
+    - The metadata of each test: levels, features and services guards, source file and line
+    - The stamp (modification time and size) and the content hash of every source file below the root package
+
+    A tree is reused while no source file is added, removed or modified. A source file whose stamp changed, but not
+    its content (e.g. after a checkout), is accepted and its stamp is updated.
+    The trees are stored per key, that must identify the collect settings (configuration, filters...).
+    '''
+    SYNCHRONIZATION_LOCK = RLock()
+
+    FILE_NAME         = 'Discovery.cache'
+    VERSION           = 1
+    MAX_TREE_COUNT    = 8
+    SOURCE_EXTENSIONS = ('.py',)
+    IGNORED_DIRS      = ('__pycache__',)
+
+    def __init__(self, filePath):
+        '''
+        Constructor.
+
+        @param  filePath [in] (str) The path to the cache file
+        '''
+        self._filePath = filePath
+        self._trees    = None
+        self._metadata = {}
+
+        self.hitCount  = 0
+        self.missCount = 0
+    # end def __init__
+
+    @staticmethod
+    def getKey(*settings):
+        '''
+        Computes the key of a collected tree
+
+        @param  settings [in] (tuple) The root test id, followed by the settings that change the collected tree.
+                                       Their representation must not depend on the process.
+
+        @return (str) The key
+        '''
+        return sha1(repr(settings).encode('utf-8')).hexdigest()
+    # end def getKey
+
+    @staticmethod
+    def getSourceRoots(testId):
+        '''
+        Obtains the directories containing the sources of a test id.
+
+        This is the parent directory of its top-level package, that also contains the shared definitions.
+        The package is located without being imported.
+
+        @param  testId [in] (str) The test id
+
+        @return (list) The source directories, empty if the top-level package cannot be found
+        '''
+        try:
+            spec = find_spec(testId.split('.', 1)[0])
+        except (ImportError, ValueError):
+            spec = None
+        # end try
+
+        if (spec is None):
+            return []
+        # end if
+
+        if (spec.submodule_search_locations is not None):
+            return sorted(set(dirname(location) for location in spec.submodule_search_locations))
+        # end if
+
+        return (spec.origin is not None) and [dirname(spec.origin)] or []
+    # end def getSourceRoots
+
+    @classmethod
+    def _getSourceStamps(cls, sourceRoots):
+        '''
+        Obtains the stamps of the source files
+
+        @param  sourceRoots [in] (list) The source directories
+
+        @return (dict) The modification time (ns) and the size, per source file path
+        '''
+        stamps = {}
+        for sourceRoot in sourceRoots:
+            for dirPath, dirNames, fileNames in walk(sourceRoot):
+                dirNames[:] = [dirName for dirName in dirNames if dirName not in cls.IGNORED_DIRS]
+                for fileName in fileNames:
+                    if (fileName.endswith(cls.SOURCE_EXTENSIONS)):
+                        filePath = join(dirPath, fileName)
+                        fileStat = stat(filePath)
+                        stamps[filePath] = [fileStat.st_mtime_ns, fileStat.st_size]
+                    # end if
+                # end for
+            # end for
+        # end for
+
+        return stamps
+    # end def _getSourceStamps
+
+    @staticmethod
+    def _getSourceHash(filePath):
+        '''
+        Computes the content hash of a source file
+
+        @param  filePath [in] (str) The path to the source file
+
+        @return (str) The content hash
+        '''
+        with open(filePath, 'rb') as sourceFile:
+            return sha1(sourceFile.read()).hexdigest()
+        # end with
+    # end def _getSourceHash
+
+    def _loadTrees(self):
+        '''
+        Obtains the cached trees, read from the cache file on the first call.
+
+        A missing, corrupted or outdated cache file is an empty cache.
+
+        @return (dict) The cached trees, per key
+        '''
+        if (self._trees is None):
+            try:
+                with open(self._filePath, 'r', encoding='utf-8') as cacheFile:
+                    content = load(cacheFile)
+                # end with
+                trees = content['trees'] if (content.get('version') == self.VERSION) else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                trees = {}
+            # end try
+
+            self._trees = trees
+        # end if
+
+        return self._trees
+    # end def _loadTrees
+
+    def _saveTrees(self):
+        '''
+        Writes the cached trees to the cache file.
+
+        The file is replaced at once. The cache is only an optimization: a file that cannot be written is ignored.
+        '''
+        try:
+            makedirs(dirname(self._filePath), exist_ok=True)
+            temporaryPath = self._filePath + '.tmp'
+            with open(temporaryPath, 'w', encoding='utf-8') as cacheFile:
+                dump({'version': self.VERSION, 'trees': self._trees}, cacheFile)
+            # end with
+            replace(temporaryPath, self._filePath)
+        except OSError:
+            pass
+        # end try
+    # end def _saveTrees
+
+    @staticmethod
+    def _toTree(descriptor):
+        '''
+        Converts a TestDescriptor tree to a serializable tree
+
+        @param  descriptor [in] (TestDescriptor) The root TestDescriptor
+
+        @return (list) The tree, as [test id, type, children]
+        '''
+        return [descriptor.testId,
+                descriptor.getType(),
+                [DiscoveryCache._toTree(child) for child in descriptor.getChildren()]]
+    # end def _toTree
+
+    @staticmethod
+    def _fromTree(tree, descriptorClass):
+        '''
+        Converts a serialized tree to a TestDescriptor tree
+
+        @param  tree            [in] (list) The tree, as [test id, type, children]
+        @param  descriptorClass [in] (type) The TestDescriptor class
+
+        @return (TestDescriptor) The root TestDescriptor
+        '''
+        testId, descriptorType, children = tree
+        descriptor = descriptorClass(testId, descriptorType=descriptorType)
+        for child in children:
+            descriptor.addChild(DiscoveryCache._fromTree(child, descriptorClass))
+        # end for
+
+        return descriptor
+    # end def _fromTree
+
+    @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
+    def getTestTree(self, key, sourceRoots, descriptorClass):
+        '''
+        Obtains a cached test tree, if its source files did not change.
+
+        @param  key             [in] (str) The key of the tree, from getKey
+        @param  sourceRoots     [in] (list) The source directories, from getSourceRoots
+        @param  descriptorClass [in] (type) The TestDescriptor class
+
+        @return (TestDescriptor) The root TestDescriptor of a new tree, None if the tree is not cached or outdated
+        '''
+        entry = self._loadTrees().get(key)
+        if (    (entry is None)
+            or  (entry['roots'] != sourceRoots)):
+            self.missCount += 1
+            return None
+        # end if
+
+        stamps       = self._getSourceStamps(sourceRoots)
+        cachedStamps = entry['sources']
+        if (stamps.keys() != cachedStamps.keys()):
+            self.missCount += 1
+            return None
+        # end if
+
+        isUpdated = False
+        for filePath, stamp in stamps.items():
+            cachedStamp = cachedStamps[filePath]
+            if (stamp != cachedStamp[:2]):
+                if (    (stamp[1] != cachedStamp[1])
+                    or  (self._getSourceHash(filePath) != cachedStamp[2])):
+                    self.missCount += 1
+                    return None
+                # end if
+
+                # Touched but not modified
+                cachedStamp[:2] = stamp
+                isUpdated = True
+            # end if
+        # end for
+
+        if (isUpdated):
+            self._saveTrees()
+        # end if
+
+        self._metadata.update(entry['metadata'])
+        self.hitCount += 1
+
+        return self._fromTree(entry['tree'], descriptorClass)
+    # end def getTestTree
+
+    @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
+    def setTestTree(self, key, sourceRoots, descriptor, metadata):
+        '''
+        Saves a collected test tree.
+
+        @param  key         [in] (str) The key of the tree, from getKey
+        @param  sourceRoots [in] (list) The source directories, from getSourceRoots
+        @param  descriptor  [in] (TestDescriptor) The root TestDescriptor
+        @param  metadata    [in] (dict) The metadata of the collected tests, per test id
+        '''
+        stamps = self._getSourceStamps(sourceRoots)
+        for filePath, stamp in stamps.items():
+            stamp.append(self._getSourceHash(filePath))
+        # end for
+
+        trees = self._loadTrees()
+        trees.pop(key, None)
+        trees[key] = {'roots':    sourceRoots,
+                      'sources':  stamps,
+                      'tree':     self._toTree(descriptor),
+                      'metadata': metadata,
+                      }
+
+        # Keep the most recently collected trees only
+        for oldKey in list(trees)[:-self.MAX_TREE_COUNT]:
+            del trees[oldKey]
+        # end for
+
+        self._metadata.update(metadata)
+        self._saveTrees()
+    # end def setTestTree
+
+    def getTestMetadata(self, testId):
+        '''
+        Obtains the metadata of a test, from the trees obtained from this cache.
+
+        @param  testId [in] (str) The test id
+
+        @return (dict) The metadata: 'levels', 'features', 'services', 'file' and 'line'. None if unknown.
+        '''
+        return self._metadata.get(testId)
+    # end def getTestMetadata
+
+    def clear(self):
+        '''
+        Forgets the metadata of the obtained trees, and reloads the cache file on the next access.
+        '''
+        self._trees    = None
+        self._metadata = {}
+    # end def clear
+# end class DiscoveryCache
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -20,6 +20,8 @@ from os                                 import F_OK
 from os                                 import R_OK
 from os                                 import access
 from os                                 import makedirs
+from os                                 import remove
+from os                                 import replace
 from os.path                            import dirname
 from threading                          import RLock
 from time                               import localtime
@@ -35,9 +37,15 @@ class JrlFile(object):
     An image of a Journal file.
 
     This clas is able to read, write and update the contents of a .jrl file.
+
+    The .jrl file is append-only: new entries are appended, and the modified entries are rewritten in place.
+    An index file, next to the .jrl file, lists the offset and test id of each entry, so that the entries of a test id
+    are read without parsing the whole journal. The index is rebuilt from the .jrl file when it is missing or stale.
     '''
     SYNCHRONIZATION_LOCK = RLock()
 
+    INDEX_EXTENSION      = '.idx'
+
     class JrlComment(object):
         '''
         A comment entry in the JRL file
@@ -346,10 +354,17 @@ class JrlFile(object):
 
         @param  filePath [in] (str) The path to the .jrl file
         '''
-        self._entries      = []
-        self._entriesCache = {}
-
-        self._jrlPath = filePath
+        # Offsets in the .jrl file of the saved entries, per test id
+        self._offsets        = {}
+        # Saved entries already parsed, per offset in the .jrl file
+        self._parsedEntries  = {}
+        # Entries and comments not saved yet, in creation order
+        self._pendingEntries = []
+        # Entries not saved yet, per test id
+        self._pendingCache   = {}
+
+        self._jrlPath    = filePath
+        self._loadedPath = filePath
 
         if (not access(self._jrlPath, R_OK)):
             jrlDirPath = dirname(self._jrlPath)
@@ -363,6 +378,18 @@ class JrlFile(object):
         self._loadJrlEntries(self._jrlPath)
     # end def __init__
 
+    @classmethod
+    def getIndexPath(cls, filePath):
+        '''
+        Obtains the path of the index of a .jrl file
+
+        @param  filePath [in] (str) The path to the .jrl file
+
+        @return (str) The path to the index file
+        '''
+        return filePath + cls.INDEX_EXTENSION
+    # end def getIndexPath
+
     @classmethod
     def _createBlankFile(cls, filePath):
         '''
@@ -379,65 +406,251 @@ class JrlFile(object):
             lines = [(cls.JrlComment(comment).toString()+'\n').encode('utf-8') for comment in comments]
             jrlFile.writelines(lines)
         # end with
+
+        indexPath = cls.getIndexPath(filePath)
+        if (access(indexPath, F_OK)):
+            remove(indexPath)
+        # end if
     # end def _createBlankFile
 
-    @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
-    def _loadJrlEntries(self, path):
+    @staticmethod
+    def _toBytes(jrlEntry):
         '''
-        Loads the JrlEntry instances from a text file
+        Converts a JrlEntry or a JrlComment to a fixed-width line
 
-        @param  path [in] (str) The path to the journal.jrl file
+        @param  jrlEntry [in] (JrlFile.JrlEntry) The entry or comment to convert
+
+        @return (bytes) The line, without its newline
         '''
+        # The width is counted in bytes, so that a line can always be rewritten in place
+        return jrlEntry.toString().encode('utf8')[:jrlEntry.LINE_LENGTH].ljust(jrlEntry.LINE_LENGTH)
+    # end def _toBytes
 
-        entries      = []
-        entriesCache = {}
-        if (access(path, R_OK)):
-            with open(path, "r+") as jrlFile:
-                lines = jrlFile.readlines()
+    @staticmethod
+    def _parseTestId(line):
+        '''
+        Extracts the test id of a .jrl file line
+
+        @param  line [in] (bytes) The line to parse
+
+        @return (str) The test id, None if the line is blank or a comment
+        '''
+        values = line.split(None, 1)
+        if ((len(values) == 0) or values[0].startswith(b'#')):
+            return None
+        # end if
+
+        testId = values[0].decode('utf-8', 'replace')
+        if (testId.endswith('.log')):
+            testId = testId[:-4]
+        # end if
+
+        return testId
+    # end def _parseTestId
+
+    @classmethod
+    def _scanJrlEntries(cls, jrlFile, offset):
+        '''
+        Reads the test ids of the entries of a .jrl file, without parsing the entries.
+
+        @param  jrlFile [in] (file) The .jrl file, opened in binary mode
+        @param  offset  [in] (int) The offset of the first line to read
+
+        @return (list) The (offset, test id) of the entries, up to the end of the file
+        '''
+        records = []
+        jrlFile.seek(offset)
+        for line in jrlFile:
+            testId = cls._parseTestId(line)
+            if (testId is not None):
+                records.append((offset, testId))
+            # end if
+            offset += len(line)
+        # end for
+
+        return records
+    # end def _scanJrlEntries
+
+    @staticmethod
+    def _loadIndex(indexPath):
+        '''
+        Reads the records of an index file
+
+        @param  indexPath [in] (str) The path to the index file
+
+        @return (tuple) The offsets of the indexed entries per test id, and the (offset, test id) of the last indexed
+                        entry. None if the index is missing, empty or corrupted.
+        '''
+        try:
+            with open(indexPath, "r", encoding='utf-8') as indexFile:
+                lines = indexFile.read().splitlines()
             # end with
 
+            offsets = {}
             for line in lines:
-                line = line.strip()
-                if (len(line) > 0):
-                    if (line[0] == '#'):
-                        jrlEntry = self.JrlComment.fromString(line)
+                offset, _, testId = line.partition(' ')
+                offsets.setdefault(testId, []).append(int(offset))
+            # end for
+
+            if ((len(lines) == 0) or (testId == '')):
+                return None
+            # end if
+        except (OSError, ValueError):
+            return None
+        # end try
+
+        return offsets, (offsets[testId][-1], testId)
+    # end def _loadIndex
+
+    @staticmethod
+    def _saveIndex(indexPath, records, append=True):
+        '''
+        Writes records to an index file.
+
+        The index is only a cache of the .jrl file: it is rebuilt from the .jrl file if it cannot be written.
+
+        @param  indexPath [in] (str) The path to the index file
+        @param  records   [in] (list) The (offset, test id) of the entries to index
+        @option append    [in] (bool) Whether to append the records, or to replace the index content
+        '''
+        try:
+            with open(indexPath, append and "a" or "w", encoding='utf-8') as indexFile:
+                indexFile.writelines(["%d %s\n" % record for record in records])
+            # end with
+        except OSError:
+            pass
+        # end try
+    # end def _saveIndex
+
+    @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
+    def _loadJrlEntries(self, path):
+        '''
+        Loads the index of the JrlEntry instances of a text file.
+
+        The index is read from the index file, and completed with the entries appended since it was last saved.
+        A missing or stale index is rebuilt from the text file. The entries are only parsed when requested.
+
+        @param  path [in] (str) The path to the journal.jrl file
+        '''
+        offsets = {}
+        if (access(path, R_OK)):
+            indexPath = self.getIndexPath(path)
+            index     = self._loadIndex(indexPath)
+
+            with open(path, "rb") as jrlFile:
+                offset = 0
+                if (index is not None):
+                    # The index is valid if its last entry is still in the .jrl file
+                    lastOffset, lastTestId = index[1]
+                    jrlFile.seek(lastOffset)
+                    line = jrlFile.readline()
+                    if (self._parseTestId(line) == lastTestId):
+                        offsets = index[0]
+                        offset  = lastOffset + len(line)
                     else:
-                        jrlEntry = self.JrlEntry.fromString(line)
-                        entriesCache.setdefault(jrlEntry.getTestId(), []).append(jrlEntry)
+                        index = None
                     # end if
-                    entries.append(jrlEntry)
                 # end if
+
+                records = self._scanJrlEntries(jrlFile, offset)
+            # end with
+
+            if (index is None):
+                self._saveIndex(indexPath, records, append=False)
+            elif (len(records) > 0):
+                self._saveIndex(indexPath, records)
+            # end if
+
+            for offset, testId in records:
+                offsets.setdefault(testId, []).append(offset)
             # end for
         # end if
 
-        self._entries      = entries
-        self._entriesCache = entriesCache
+        self._offsets        = offsets
+        self._parsedEntries  = {}
+        self._pendingEntries = []
+        self._pendingCache   = {}
+        self._loadedPath     = path
     # end def _loadJrlEntries
 
+    def _getParsedEntries(self, offsets):
+        '''
+        Obtains the saved entries at the given offsets, parsing them if needed.
+
+        @param  offsets [in] (list) The offsets of the entries in the .jrl file
+
+        @return (list) The entries
+        '''
+        parsedEntries  = self._parsedEntries
+        missingOffsets = [offset for offset in offsets if offset not in parsedEntries]
+        if (len(missingOffsets) > 0):
+            with open(self._loadedPath, "rb") as jrlFile:
+                for offset in missingOffsets:
+                    jrlFile.seek(offset)
+                    jrlEntry = self.JrlEntry.fromString(jrlFile.readline().decode('utf-8', 'replace').strip())
+                    jrlEntry.dirty = False
+                    parsedEntries[offset] = jrlEntry
+                # end for
+            # end with
+        # end if
+
+        return [parsedEntries[offset] for offset in offsets]
+    # end def _getParsedEntries
+
     @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
     def _saveJrlEntries(self, path):
         '''
         Saves the JrlEntry instances to a text file.
 
-        This uses the dirty flags of the JrlEntries to only writes JrlEntries that have actually been modified.
+        The modified entries are rewritten in place, and the new entries and comments are appended to the file and to
+        its index.
 
         @param  path [in] (str) The path to the journal.jrl file to replace
         '''
-
-        offset = 0
+        records = []
         with open(path, "r+b") as jrlFile:
-            for jrlEntry in self._entries:
+            for offset, jrlEntry in self._parsedEntries.items():
                 if (jrlEntry.dirty):
                     jrlFile.seek(offset)
-                    jrlFile.write(jrlEntry.toString().encode('utf8'))
-                    jrlFile.write(b'\n')
-                    jrlFile.seek(0, 2)
+                    jrlFile.write(self._toBytes(jrlEntry))
                     jrlEntry.dirty = False
                 # end if
-
-                offset += jrlEntry.LINE_LENGTH + 1
             # end for
+
+            if (len(self._pendingEntries) > 0):
+                offset = jrlFile.seek(0, 2)
+                if (offset > 0):
+                    jrlFile.seek(offset - 1)
+                    if (jrlFile.read(1) != b'\n'):
+                        jrlFile.write(b'\n')
+                        offset += 1
+                    # end if
+                # end if
+
+                lines = []
+                for jrlEntry in self._pendingEntries:
+                    line = self._toBytes(jrlEntry) + b'\n'
+                    if (isinstance(jrlEntry, self.JrlEntry)):
+                        testId = jrlEntry.getTestId()
+                        self._offsets.setdefault(testId, []).append(offset)
+                        self._parsedEntries[offset] = jrlEntry
+                        records.append((offset, testId))
+                    # end if
+                    jrlEntry.dirty = False
+                    lines.append(line)
+                    offset += len(line)
+                # end for
+                jrlFile.writelines(lines)
+            # end if
         # end with
+
+        # The index is written after the .jrl file: an interrupted save is recovered at the next load
+        if (len(records) > 0):
+            self._saveIndex(self.getIndexPath(path), records)
+        # end if
+
+        self._pendingEntries = []
+        self._pendingCache   = {}
     # end def _saveJrlEntries
 
     @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
@@ -451,8 +664,8 @@ class JrlFile(object):
         @return (JrlFile.JrlEntry) The newly created entry
         '''
         jrlEntry = self.JrlEntry(testId, testStartTime)
-        self._entries.append(jrlEntry)
-        self._entriesCache.setdefault(testId, []).append(jrlEntry)
+        self._pendingEntries.append(jrlEntry)
+        self._pendingCache.setdefault(testId, []).append(jrlEntry)
 
         return jrlEntry
     # end def createEntry
@@ -472,7 +685,7 @@ class JrlFile(object):
             jrlComment.dirty = True
         # end for
 
-        self._entries.extend(jrlComments)
+        self._pendingEntries.extend(jrlComments)
     # end def addComment
 
     def addRunStartComment(self):
@@ -488,15 +701,18 @@ class JrlFile(object):
         '''
         Obtains the last valid entry for a testId, or create it if needed.
 
+        Only the last entry is parsed from the file.
+
         @param  testId [in] (str) The test Id identifying the entry
 
         @return (JrlFile.JrlEntry) The active entry
         '''
         jrlEntry = None
 
-        allEntries = self.getAllEntries(testId)
-        if (len(allEntries)):
-            jrlEntry = allEntries[-1]
+        if (testId in self._pendingCache):
+            jrlEntry = self._pendingCache[testId][-1]
+        elif (testId in self._offsets):
+            jrlEntry = self._getParsedEntries(self._offsets[testId][-1:])[0]
         # end if
 
         return jrlEntry
@@ -514,13 +730,85 @@ class JrlFile(object):
         jrlEntries = []
 
         # Is there at least one entry ?
-        if (testId in self._entriesCache):
-            jrlEntries = self._entriesCache[testId]
+        if (testId in self._offsets):
+            jrlEntries = self._getParsedEntries(self._offsets[testId])
+        # end if
+
+        if (testId in self._pendingCache):
+            jrlEntries = jrlEntries + self._pendingCache[testId]
         # end if
 
         return jrlEntries
     # end def getAllEntries
 
+    @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
+    def getTestIds(self):
+        '''
+        Obtains the test ids that have at least one entry
+
+        @return (set) The test ids
+        '''
+        return set(self._offsets).union(self._pendingCache)
+    # end def getTestIds
+
+    @synchronized(SYNCHRONIZATION_LOCK)                                                                                 # pylint:disable=E0602
+    def compact(self, keepCount=1):
+        '''
+        Rewrites the journal, keeping the comments and only the last entries of each test id.
+
+        The modifications are saved first. The entries already obtained from this instance stay valid.
+
+        @option keepCount [in] (int) The number of entries to keep per test id
+        '''
+        self._saveJrlEntries(self._jrlPath)
+        if (self._loadedPath != self._jrlPath):
+            self._loadJrlEntries(self._jrlPath)
+        # end if
+
+        keptOffsets = {}
+        for testId, offsets in self._offsets.items():
+            for offset in offsets[max(len(offsets) - keepCount, 0):]:
+                keptOffsets[offset] = testId
+            # end for
+        # end for
+
+        records       = []
+        parsedEntries = {}
+        temporaryPath = self._jrlPath + '.tmp'
+        with open(self._jrlPath, "rb") as jrlFile, open(temporaryPath, "wb") as temporaryFile:
+            offset    = 0
+            newOffset = 0
+            for line in jrlFile:
+                lineLength = len(line)
+                isComment  = line.lstrip().startswith(b'#')
+                if (isComment or (offset in keptOffsets)):
+                    if (not isComment):
+                        records.append((newOffset, keptOffsets[offset]))
+                        if (offset in self._parsedEntries):
+                            parsedEntries[newOffset] = self._parsedEntries[offset]
+                        # end if
+                    # end if
+
+                    if (not line.endswith(b'\n')):
+                        line += b'\n'
+                    # end if
+                    temporaryFile.write(line)
+                    newOffset += len(line)
+                # end if
+                offset += lineLength
+            # end for
+        # end with
+
+        replace(temporaryPath, self._jrlPath)
+        self._saveIndex(self.getIndexPath(self._jrlPath), records, append=False)
+
+        self._offsets = {}
+        for offset, testId in records:
+            self._offsets.setdefault(testId, []).append(offset)
+        # end for
+        self._parsedEntries = parsedEntries
+    # end def compact
+
     def load(self, jrlPath=None):
         '''
         Loads the entries from disk
@@ -569,8 +857,8 @@ class JrlFile(object):
                 cls._createBlankFile(key)
             # end if
 
+            # The constructor loads the entries
             result = cls(key)
-            result.load()
             cls.JRL_FILE_CACHE[key] = result
         # end if
 
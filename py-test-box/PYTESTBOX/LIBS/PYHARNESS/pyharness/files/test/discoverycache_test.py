@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+''' @package pyharness.files.test.discoverycache
+
+@brief  Tests of the DiscoveryCache class
+
+@author christophe.roquebert
+
+@date   2026/10/18
+'''
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from os import makedirs
+from os import stat
+from os import utime
+from os.path import join
+from shutil import rmtree
+from unittest import TestCase
+
+from pyharness.files.discoverycache import DiscoveryCache
+from pylibrary.tools.tempfile import mkdtemp
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class Descriptor(object):
+    '''
+    The part of the TestDescriptor interface used by the DiscoveryCache
+    '''
+    def __init__(self, testId, descriptorType=0):
+        '''
+        Constructor
+
+        @param  testId         [in] (str) The test id
+        @option descriptorType [in] (int) The descriptor type
+        '''
+        self.testId    = testId
+        self.type      = descriptorType
+        self._children = []
+    # end def __init__
+
+    def getType(self):
+        '''
+        Obtains the descriptor type
+
+        @return (int) The descriptor type
+        '''
+        return self.type
+    # end def getType
+
+    def addChild(self, child):
+        '''
+        Adds a child descriptor
+
+        @param  child [in] (Descriptor) The child
+        '''
+        self._children.append(child)
+    # end def addChild
+
+    def getChildren(self):
+        '''
+        Obtains the children descriptors
+
+        @return (list) The children
+        '''
+        return self._children
+    # end def getChildren
+
+    def toTuple(self):
+        '''
+        Converts the tree to nested tuples
+
+        @return (tuple) The tree
+        '''
+        return (self.testId, self.type, tuple(child.toTuple() for child in self._children))
+    # end def toTuple
+# end class Descriptor
+
+
+class DiscoveryCacheTestCase(TestCase):
+    '''
+    Tests of the DiscoveryCache class
+    '''
+    KEY = DiscoveryCache.getKey('mypackage', 'settings')
+    METADATA = {'mypackage.mymodule.MyTest.test_One': {'levels':   ['Business'],
+                                                        'features': [['Feature1234']],
+                                                        'services': [],
+                                                        'file':     'mymodule.py',
+                                                        'line':     12,
+                                                        },
+                }
+
+    def setUp(self):
+        '''
+        Create a temporary source tree
+        '''
+        TestCase.setUp(self)
+
+        self.__tempDirPath = mkdtemp("", "test_%s" % self.id())
+        self.sourceRoot = join(self.__tempDirPath, 'SOURCES')
+        self.cachePath = join(self.__tempDirPath, 'LOCAL', DiscoveryCache.FILE_NAME)
+        makedirs(join(self.sourceRoot, 'mypackage'))
+        for fileName in ('__init__.py', 'mymodule.py'):
+            self._writeSource(fileName, "# %s\n" % fileName)
+        # end for
+
+        root = Descriptor('Root', 30)
+        suite = Descriptor('mypackage', 20)
+        suite.addChild(Descriptor('mypackage.mymodule.MyTest.test_One', 10))
+        suite.addChild(Descriptor('mypackage.mymodule.MyTest.test_Two', 10))
+        root.addChild(suite)
+        self.tree = root
+    # end def setUp
+
+    def tearDown(self):
+        '''
+        Cleans up the temporary directory
+        '''
+        rmtree(self.__tempDirPath, True)
+
+        TestCase.tearDown(self)
+    # end def tearDown
+
+    def _writeSource(self, fileName, content):
+        '''
+        Writes a source file of the package
+
+        @param  fileName [in] (str) The file name
+        @param  content  [in] (str) The file content
+        '''
+        with open(join(self.sourceRoot, 'mypackage', fileName), 'w') as sourceFile:
+            sourceFile.write(content)
+        # end with
+    # end def _writeSource
+
+    def _getTree(self, key=KEY):
+        '''
+        Obtains the tree from a new cache instance, reading the cache file
+
+        @option key [in] (str) The key of the tree
+
+        @return (tuple) The tree, None if not cached
+        '''
+        discoveryCache = DiscoveryCache(self.cachePath)
+        descriptor = discoveryCache.getTestTree(key, [self.sourceRoot], Descriptor)
+
+        return (descriptor is not None) and descriptor.toTuple() or None
+    # end def _getTree
+
+    def _setTree(self):
+        '''
+        Saves the tree in the cache file
+        '''
+        discoveryCache = DiscoveryCache(self.cachePath)
+        discoveryCache.setTestTree(self.KEY, [self.sourceRoot], self.tree, self.METADATA)
+    # end def _setTree
+
+    def test_Hit(self):
+        '''
+        Tests a saved tree and its metadata are obtained while the sources do not change
+        '''
+        self.assertIsNone(self._getTree(), "Unexpected tree in an empty cache")
+        self._setTree()
+
+        discoveryCache = DiscoveryCache(self.cachePath)
+        descriptor = discoveryCache.getTestTree(self.KEY, [self.sourceRoot], Descriptor)
+        self.assertEqual(self.tree.toTuple(), descriptor.toTuple(), "Unexpected cached tree")
+        self.assertEqual(self.METADATA['mypackage.mymodule.MyTest.test_One'],
+                         discoveryCache.getTestMetadata('mypackage.mymodule.MyTest.test_One'),
+                         "Unexpected cached metadata")
+        self.assertIsNone(discoveryCache.getTestMetadata('mypackage.mymodule.MyTest.test_Three'),
+                          "Unexpected metadata of an unknown test")
+        self.assertEqual((1, 0), (discoveryCache.hitCount, discoveryCache.missCount), "Unexpected counters")
+
+        self.assertIsNone(self._getTree(DiscoveryCache.getKey('mypackage', 'other settings')),
+                          "Unexpected tree for other settings")
+    # end def test_Hit
+
+    def test_TouchedSource(self):
+        '''
+        Tests a source file touched, but not modified, keeps the tree valid
+        '''
+        self._setTree()
+        sourcePath = join(self.sourceRoot, 'mypackage', 'mymodule.py')
+        mtime = stat(sourcePath).st_mtime_ns + 10 ** 9
+        utime(sourcePath, ns=(mtime, mtime))
+
+        self.assertEqual(self.tree.toTuple(), self._getTree(), "The touched source invalidates the tree")
+    # end def test_TouchedSource
+
+    def test_ModifiedSource(self):
+        '''
+        Tests a modified, added or removed source file invalidates the tree
+        '''
+        self._setTree()
+        self._writeSource('mymodule.py', "# modified\n")
+        self.assertIsNone(self._getTree(), "The modified source does not invalidate the tree")
+
+        self._setTree()
+        self._writeSource('myothermodule.py', "")
+        self.assertIsNone(self._getTree(), "The added source does not invalidate the tree")
+    # end def test_ModifiedSource
+# end class DiscoveryCacheTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -14,8 +14,11 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
+from os import remove
+from os.path import exists
 from os.path import join
 from shutil import rmtree
+from time import localtime
 from time import strptime
 from unittest import TestCase
 
@@ -113,6 +116,134 @@ class JrlFileTestCase(TestCase):
             index += 1
         # end for
     # end def test_Load
+    def _createJournal(self):
+        '''
+        Creates a journal with two runs of two tests, and returns its path
+
+        @return (str) The path to the journal
+        '''
+        jrlPath = join(self.__tempDirPath, 'Journal.jrl')
+        jrlFile = JrlFile(jrlPath)
+        for testState in (JrlFile.JrlEntry.STATE_FAILURE, JrlFile.JrlEntry.STATE_SUCCESS):
+            jrlFile.addRunStartComment()
+            for testId in ("test.id", "test.id2"):
+                jrlEntry = jrlFile.createEntry(testId, localtime())
+                jrlEntry.setTestStopDate(localtime())
+                jrlEntry.setTestState(testState)
+            # end for
+            jrlFile.save()
+        # end for
+
+        return jrlPath
+    # end def _createJournal
+
+    def test_Index(self):
+        '''
+        Tests the entries are read back through the index, and the index is rebuilt when missing
+        '''
+        jrlPath = self._createJournal()
+        self.assertTrue(exists(JrlFile.getIndexPath(jrlPath)), "The index is not saved")
+
+        for rebuild in (False, True):
+            if rebuild:
+                remove(JrlFile.getIndexPath(jrlPath))
+            # end if
+
+            jrlFile = JrlFile(jrlPath)
+            self.assertEqual({"test.id", "test.id2"},
+                             jrlFile.getTestIds(),
+                             "Unexpected test ids")
+            self.assertEqual([JrlFile.JrlEntry.STATE_FAILURE, JrlFile.JrlEntry.STATE_SUCCESS],
+                             [jrlEntry.getTestState() for jrlEntry in jrlFile.getAllEntries("test.id")],
+                             "Unexpected test history")
+            self.assertEqual(JrlFile.JrlEntry.STATE_SUCCESS,
+                             jrlFile.getLastEntry("test.id2").getTestState(),
+                             "Unexpected last entry")
+            self.assertIsNone(jrlFile.getLastEntry("test.id3"),
+                              "Unexpected entry for an unknown test id")
+        # end for
+    # end def test_Index
+
+    def test_Update(self):
+        '''
+        Tests an entry modified after its creation is rewritten in place
+        '''
+        jrlPath = self._createJournal()
+
+        jrlFile = JrlFile(jrlPath)
+        jrlFile.getLastEntry("test.id").setTestState(JrlFile.JrlEntry.STATE_ERROR)
+        jrlFile.getLastEntry("test.id").setTestMessage("Message")
+        jrlFile.save()
+
+        jrlFile = JrlFile(jrlPath)
+        self.assertEqual(2, len(jrlFile.getAllEntries("test.id")), "Unexpected test history")
+        self.assertEqual(JrlFile.JrlEntry.STATE_ERROR,
+                         jrlFile.getLastEntry("test.id").getTestState(),
+                         "Unexpected test state")
+        self.assertEqual("Message",
+                         jrlFile.getLastEntry("test.id").getTestMessage(),
+                         "Unexpected test message")
+        self.assertEqual(JrlFile.JrlEntry.STATE_SUCCESS,
+                         jrlFile.getLastEntry("test.id2").getTestState(),
+                         "Unexpected test state")
+    # end def test_Update
+
+    def test_StaleIndex(self):
+        '''
+        Tests the entries appended without the index are indexed, and an index of another file is rebuilt
+        '''
+        jrlPath = self._createJournal()
+        with open(jrlPath, "a") as jrlFile:
+            jrlFile.write("test.id3 2007-01-02 01:02:03 2007-01-02 04:05:06 Ok\n")
+        # end with
+
+        jrlFile = JrlFile(jrlPath)
+        self.assertEqual(JrlFile.JrlEntry.STATE_SUCCESS,
+                         jrlFile.getLastEntry("test.id3").getTestState(),
+                         "The appended entry is not indexed")
+
+        with open(jrlPath, "w") as jrlFile:
+            jrlFile.write("test.id4 2007-01-02 01:02:03 2007-01-02 04:05:06 Failed")
+        # end with
+
+        jrlFile = JrlFile(jrlPath)
+        self.assertEqual({"test.id4"}, jrlFile.getTestIds(), "The stale index is not rebuilt")
+        self.assertEqual(JrlFile.JrlEntry.STATE_FAILURE,
+                         jrlFile.getLastEntry("test.id4").getTestState(),
+                         "Unexpected test state")
+    # end def test_StaleIndex
+
+    def test_Compact(self):
+        '''
+        Tests the compaction keeps the comments and the last entries only
+        '''
+        jrlPath = self._createJournal()
+
+        jrlFile = JrlFile(jrlPath)
+        lastEntry = jrlFile.getLastEntry("test.id")
+        jrlFile.compact()
+
+        self.assertEqual([lastEntry], jrlFile.getAllEntries("test.id"), "Unexpected compacted history")
+        lastEntry.setTestMessage("Message")
+        jrlFile.createEntry("test.id2", localtime())
+        jrlFile.save()
+
+        jrlFile = JrlFile(jrlPath)
+        self.assertEqual(["Message"],
+                         [jrlEntry.getTestMessage() for jrlEntry in jrlFile.getAllEntries("test.id")],
+                         "Unexpected compacted history")
+        self.assertEqual(2, len(jrlFile.getAllEntries("test.id2")), "Unexpected compacted history")
+        self.assertEqual(JrlFile.JrlEntry.STATE_SUCCESS,
+                         jrlFile.getAllEntries("test.id2")[0].getTestState(),
+                         "Unexpected compacted history")
+
+        with open(jrlPath) as jrlFile:
+            lines = jrlFile.readlines()
+        # end with
+        self.assertEqual(3 + 2 * 2 + 3,
+                         len(lines),
+                         "The comments are not kept")
+    # end def test_Compact
 # end class JrlFileTestCase
 
 # ------------------------------------------------------------------------------
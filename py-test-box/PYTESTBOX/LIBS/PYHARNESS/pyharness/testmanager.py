@@ -33,7 +33,10 @@ from pyharness.core                      import TestListener
 from pyharness.core                      import TestLoader
 from pyharness.core                      import TestSuite
 from pyharness.extensions                import level
+from pyharness.files.discoverycache      import DiscoveryCache
 from pyharness.files.jrl                 import JrlFile
+from pyharness.selector                  import features
+from pyharness.selector                  import services
 from os                                 import F_OK
 from os                                 import R_OK
 from os                                 import access
@@ -41,6 +44,7 @@ from os                                 import listdir
 from os.path                            import exists
 from os.path                            import isdir
 from os.path                            import join
+from inspect                            import unwrap
 from types                              import MethodType
 from types                              import FunctionType
 from weakref                            import ref
@@ -379,6 +383,9 @@ class CollectListener(TestListener):
         TestListener.__init__(self, None, None, None, None)
         self.ignoreCollection = False
 
+        # Metadata of the collected tests, per test id
+        self.testMetadata = {}
+
         self.descriptorStack = []
         self.descriptorStack.append(TestDescriptor("Root",
                                                    state=TestDescriptor.STATE_UNKNOWN,
@@ -404,8 +411,48 @@ class CollectListener(TestListener):
                                     descriptorType=testType)
         self.descriptorStack[-1].addChild(descriptor)
         self.descriptorStack.append(descriptor)
+
+        self.testMetadata[descriptor.testId] = self.getTestMetadata(test)
     # end def startTest
 
+    @staticmethod
+    def getTestMetadata(test):
+        '''
+        Extracts the metadata of a test, that can be used without importing it again
+
+        @param  test [in] (Test) The collected test
+
+        @return (dict) The metadata: 'levels', 'features', 'services', 'file' and 'line'
+        '''
+        if (isinstance(test, TestCase)):
+            obj = getattr(test.__class__, test._testMethodName, None)                                                 # pylint:disable=W0212
+        else:
+            obj = test.__class__
+        # end if
+
+        metadata = {'levels':   [],
+                    'features': [],
+                    'services': [],
+                    'file':     None,
+                    'line':     None,
+                    }
+        if (obj is not None):
+            metadata['levels']   = sorted(level.get_levels(obj))
+            metadata['features'] = sorted([name] + [str(arg) for arg in args]
+                                          for name, args in features.getFeatures(obj))
+            metadata['services'] = sorted([name] + [str(arg) for arg in args]
+                                          for name, args in services.getFeatures(obj))
+
+            code = getattr(unwrap(obj), '__code__', None)
+            if (code is not None):
+                metadata['file'] = code.co_filename
+                metadata['line'] = code.co_firstlineno
+            # end if
+        # end if
+
+        return metadata
+    # end def getTestMetadata
+
     def stopTest(self, test):
         '''
         @copydoc pyharness.core.TestListener.stopTest
@@ -835,6 +882,8 @@ class LocalTestManager(TestManager):
     ## Zope-compatible implementation definition.
     __implements__ = TestManager
     CONFIGFILE_NAME = "Settings.ini"
+    ## Whether the collected test trees are reused from the discovery cache
+    USE_DISCOVERY_CACHE = True
 
     class DescriptorTestListener(TestListener):
         '''
@@ -930,6 +979,9 @@ class LocalTestManager(TestManager):
                                  self.CONFIGFILE_NAME)
         self.__configFilePath = configFileRelPath
 
+        self.discoveryCache = DiscoveryCache(join(root,
+                                                  DEFAULT_OUTPUT_DIRECTORY,
+                                                  DiscoveryCache.FILE_NAME))
     # end def __init__
 
     def clearCache(self):
@@ -938,6 +990,7 @@ class LocalTestManager(TestManager):
         '''
         TestManager.clearCache(self)
         self.context = None
+        self.discoveryCache.clear()
     # end def clearCache
 
     def __createFilter(self, kwArgs):                                                                                   #pylint:disable=R0912
@@ -1259,24 +1312,39 @@ class LocalTestManager(TestManager):
             return result
         # end if
 
-        # First step: import the root test suite
-        testLoader = TestLoader()
-        suite = testLoader.loadTestsFromNames((testId,))
-
-        # Create a local context, to collect the tests without actually
-        # running them.
         context = self.__createContext()
-        localContext = CollectContext(context)
-        localListener = CollectListener()
 
-        # Run the test suite. This will NOT actually run the
-        # setUp/tearDown/test_XYZ on TestCases instances, but will only
-        # collect the test call hierarchy
-        testRunner = MonoThreadTestRunner([localListener, ])
-        testRunner.run(suite, localContext)
+        # The collected tree is reused while the sources and the collect settings do not change
+        discoveryKey = self.__getDiscoveryKey(testId, context)
+        sourceRoots = DiscoveryCache.getSourceRoots(testId)
+        testDescriptor = None
+        if (discoveryKey is not None):
+            testDescriptor = self.discoveryCache.getTestTree(discoveryKey, sourceRoots, TestDescriptor)
+        # end if
+
+        if (testDescriptor is None):
+            # First step: import the root test suite
+            testLoader = TestLoader()
+            suite = testLoader.loadTestsFromNames((testId,))
+
+            # Create a local context, to collect the tests without actually
+            # running them.
+            localContext = CollectContext(context)
+            localListener = CollectListener()
+
+            # Run the test suite. This will NOT actually run the
+            # setUp/tearDown/test_XYZ on TestCases instances, but will only
+            # collect the test call hierarchy
+            testRunner = MonoThreadTestRunner([localListener, ])
+            testRunner.run(suite, localContext)
+
+            testDescriptor = localListener.descriptorStack[0]
+            if (discoveryKey is not None):
+                self.discoveryCache.setTestTree(discoveryKey, sourceRoots, testDescriptor, localListener.testMetadata)
+            # end if
+        # end if
 
         # Keep a cache of the test descriptors, only for recursive calls
-        testDescriptor = localListener.descriptorStack[0]
         if (recursive):
 
             # Update the test states, using the default kwArgs
@@ -1373,6 +1441,31 @@ class LocalTestManager(TestManager):
         return testDescriptor
     # end def getTestDescriptor
 
+    def __getDiscoveryKey(self, testId, context):
+        '''
+        Computes the discovery cache key of a collected test tree.
+
+        The tree depends on the test id, on the features (obtained from the configuration), and on the filter.
+
+        @param  testId  [in] (str) The root test id
+        @param  context [in] (Context) The context the tree is collected in
+
+        @return (str) The key, None if the tree cannot be cached
+        '''
+        # A custom filter, defined in the UI, cannot be identified
+        if (    (not self.USE_DISCOVERY_CACHE)
+            or  (self._kwArgs[KeywordArguments.KEY_CUSTOM_FILTER] is not KeywordArguments.CUSTOM_FILTER_DEFAULT)):
+            return None
+        # end if
+
+        return DiscoveryCache.getKey(testId,
+                                     context.getConfig().write_string(),
+                                     self._kwArgs[KeywordArguments.KEY_INCLUDEDPATTERNS],
+                                     self._kwArgs[KeywordArguments.KEY_EXCLUDEDPATTERNS],
+                                     self._kwArgs[KeywordArguments.KEY_LEVELS],
+                                     self._kwArgs[KeywordArguments.KEY_NO_LEVELS])
+    # end def __getDiscoveryKey
+
     def resetTests(self, testIds, listeners=(), updatedKwArgs=None):
         '''
         @copydoc pyharness.testmanager.TestManager.resetTests
@@ -1781,13 +1874,19 @@ class LocalTestManager(TestManager):
             if (innerTestDescriptor is not None):
                 innerTestId = innerTestDescriptor.testId
 
-                # Attempt to import the specified test id.
-                obj = importFqn(innerTestId, False)
+                metadata = self.discoveryCache.getTestMetadata(innerTestId)
+                if (metadata is not None):
+                    # The levels have been collected with the test tree
+                    result.update(metadata['levels'])
+                else:
+                    # Attempt to import the specified test id.
+                    obj = importFqn(innerTestId, False)
 
-                if (obj is not None):
-                    # The target has been found, lookup the list of levels from
-                    # the repository
-                    result.update(level.get_levels(obj))
+                    if (obj is not None):
+                        # The target has been found, lookup the list of levels from
+                        # the repository
+                        result.update(level.get_levels(obj))
+                    # end if
                 # end if
 
                 if (recursive):
@@ -2035,6 +2134,12 @@ class LocalTestManager(TestManager):
         '''
         @copydoc pyharness.testmanager.TestManager.getTestSourceLine
         '''
+        metadata = self.discoveryCache.getTestMetadata(testId)
+        if (    (metadata is not None)
+            and (metadata['line'] is not None)):
+            return metadata['line'] - 1
+        # end if
+
         obj = importFqn(testId)
 
         # Handle decorators and proxies
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.benchmark.bitfieldcodec_benchmark
+:brief: Benchmark of the BitFieldContainerMixin codec over the HID++ 2.0 feature messages
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+Usage: python -m pyhid.benchmark.bitfieldcodec_benchmark [iterations]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import importlib
+import inspect
+import pkgutil
+import sys
+import warnings
+from random import Random
+from time import perf_counter_ns
+
+import pyhid.hidpp.features
+from pyhid.bitfieldcontainermixin import BitFieldContainerMixin
+from pyhid.field import Field
+from pylibrary.tools.hexlist import HexList
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_ITERATIONS = 200
+MESSAGE_SIZES = (7, 20, 64)
+
+
+def legacy_from_hex_list(cls, data):
+    """
+    Parse data the way ``BitFieldContainerMixin.fromHexList`` did before the codec: a new inner class per call and a
+    field by field parsing.
+
+    :param cls: The class to parse
+    :type cls: ``type``
+    :param data: The data to parse
+    :type data: ``HexList``
+
+    :return: Parsed object
+    :rtype: ``BitFieldContainerMixin``
+    """
+    offset = 0
+    limit = len(data) * 8
+
+    class InnerFieldContainerMixin(cls):  # pylint:disable=W0223
+        """
+        Inner class used to obtain the FIELDS of the Record
+        """
+
+        def __init__(self):
+            BitFieldContainerMixin.__init__(self)
+        # end def __init__
+    # end class InnerFieldContainerMixin
+
+    InnerFieldContainerMixin.__name__ = cls.__name__
+    inner_field_container_mixin = InnerFieldContainerMixin()
+
+    for field in inner_field_container_mixin.FIELDS:
+        if isinstance(field, Field):
+            offset //= 8
+            limit //= 8
+            offset, value = field.fromHexList(inner_field_container_mixin, data, offset, limit)
+            offset *= 8
+            limit *= 8
+        else:
+            offset, value = field.fromHexList(inner_field_container_mixin, data, offset, limit)
+        # end if
+
+        if value is not None:
+            inner_field_container_mixin.setValue(field.getFid(), value)
+        # end if
+    # end for
+    return inner_field_container_mixin
+# end def legacy_from_hex_list
+
+
+def legacy_to_hex_list(container):
+    """
+    Encode a container the way ``BitFieldContainerMixin.__hexlist__`` did before the codec.
+
+    :param container: The container to encode
+    :type container: ``BitFieldContainerMixin``
+
+    :return: HexList representation of the container
+    :rtype: ``HexList``
+    """
+    return container._bitListToHexList(container.to_bit_list())
+# end def legacy_to_hex_list
+
+
+def get_message_classes():
+    """
+    Collect the ``BitFieldContainerMixin`` subclasses defined in ``pyhid.hidpp.features``.
+
+    :return: The message classes, sorted by qualified name
+    :rtype: ``list[type]``
+    """
+    classes = set()
+    for module_info in pkgutil.walk_packages(pyhid.hidpp.features.__path__, pyhid.hidpp.features.__name__ + '.'):
+        if '.test' in module_info.name:
+            continue
+        # end if
+        module = importlib.import_module(module_info.name)
+        for value in vars(module).values():
+            if inspect.isclass(value) and issubclass(value, BitFieldContainerMixin) \
+                    and value.__module__ == module.__name__ and value.FIELDS:
+                classes.add(value)
+            # end if
+        # end for
+    # end for
+    return sorted(classes, key=lambda cls: f'{cls.__module__}.{cls.__qualname__}')
+# end def get_message_classes
+
+
+def get_samples(classes):
+    """
+    Build the messages to parse: random data of the usual HID++ report sizes, kept only if both implementations parse
+    and encode them.
+
+    :param classes: The message classes
+    :type classes: ``list[type]``
+
+    :return: The couples (class, data)
+    :rtype: ``list[tuple[type, HexList]]``
+    """
+    random = Random(0)
+    samples = []
+    for cls in classes:
+        for size in MESSAGE_SIZES:
+            data = HexList()
+            data.extendRaw([random.randrange(256) for _ in range(size)])
+            try:
+                legacy_to_hex_list(legacy_from_hex_list(cls, data))
+                HexList(cls.fromHexList(data))
+            except Exception:  # pylint:disable=W0703
+                continue
+            # end try
+            samples.append((cls, data))
+            break
+        # end for
+    # end for
+    return samples
+# end def get_samples
+
+
+def measure(samples, iterations, from_hex_list, to_hex_list):
+    """
+    Measure the time spent parsing and encoding all the samples.
+
+    :param samples: The couples (class, data)
+    :type samples: ``list[tuple[type, HexList]]``
+    :param iterations: Number of passes over the samples
+    :type iterations: ``int``
+    :param from_hex_list: The parser, called with (class, data)
+    :type from_hex_list: ``callable``
+    :param to_hex_list: The encoder, called with the parsed object
+    :type to_hex_list: ``callable``
+
+    :return: Decoding and encoding time, in ns
+    :rtype: ``tuple[int, int]``
+    """
+    decode_time = 0
+    encode_time = 0
+    for _ in range(iterations):
+        for cls, data in samples:
+            start = perf_counter_ns()
+            message = from_hex_list(cls, data)
+            middle = perf_counter_ns()
+            to_hex_list(message)
+            decode_time += middle - start
+            encode_time += perf_counter_ns() - middle
+        # end for
+    # end for
+    return decode_time, encode_time
+# end def measure
+
+
+def main(iterations=DEFAULT_ITERATIONS):
+    """
+    Run the benchmark and print the results.
+
+    :param iterations: Number of passes over the samples
+    :type iterations: ``int``
+    """
+    warnings.simplefilter('ignore')
+    classes = get_message_classes()
+    samples = get_samples(classes)
+    count = len(samples) * iterations
+
+    legacy = measure(samples, iterations, legacy_from_hex_list, legacy_to_hex_list)
+    codec = measure(samples, iterations, lambda cls, data: cls.fromHexList(data), HexList)
+
+    print(f'{len(classes)} message classes, {len(samples)} samples, {iterations} iterations')
+    for name, legacy_time, codec_time in (('fromHexList', legacy[0], codec[0]),
+                                          ('__hexlist__', legacy[1], codec[1])):
+        print(f'{name:12}: legacy {legacy_time / count / 1000:8.2f} us/msg, codec {codec_time / count / 1000:8.2f} '
+              f'us/msg, speedup x{legacy_time / codec_time:.2f}')
+    # end for
+    print(f'{"total":12}: legacy {sum(legacy) / 1e9:8.2f} s, codec {sum(codec) / 1e9:8.2f} s')
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.benchmark.dfufileparser_benchmark
+:brief: Benchmark of the DFU file parsing, with and without the cache of the DFU file reports
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A clear text DFU file of a given number of program data packets is written, then parsed as done at each DFU: first
+with an empty cache, then with the reports of the file in the cache. The cached reports are also compared with the
+encoding of the parsed objects, which was done for each packet sent.
+
+Usage: python -m pyhid.benchmark.dfufileparser_benchmark [program data packet count]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from os import remove
+from struct import pack
+from tempfile import mkstemp
+from time import perf_counter_ns
+
+from pyhid.tools.dfufileparser import DfuFileParser
+from pyhid.tools.dfufileparser import DfuFileReports
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_PACKET_COUNT = 16384
+DEVICE_INDEX = 0xFF
+DFU_FEATURE_INDEX = 0x03
+DFU_FEATURE_VERSION = 0
+
+
+def write_dfu_file(packet_count):
+    """
+    Write a clear text DFU file.
+
+    :param packet_count: Number of program data packets
+    :type packet_count: ``int``
+
+    :return: The path of the DFU file
+    :rtype: ``str``
+    """
+    program_data = bytes((index * 7) & 0xFF for index in range(packet_count * 16))
+    check_data = bytes(range(32))
+    dfu_file_content = bytes([0, 0]) + b'RBM00_D0' + bytes(6)
+    dfu_file_content += pack('>BII7x', 1, 0x4000, len(program_data)) + program_data
+    dfu_file_content += pack('>BII7x', 2, 0, len(check_data)) + check_data
+    dfu_file_content += pack('>B15x', 3)
+
+    file_descriptor, dfu_file_path = mkstemp(suffix='.dfu')
+    with open(file_descriptor, 'wb') as dfu_file:
+        dfu_file.write(dfu_file_content)
+    # end with
+    return dfu_file_path
+# end def write_dfu_file
+
+
+def measure(function, *args):
+    """
+    Measure the duration of a function call.
+
+    :param function: The function to call
+    :type function: ``callable``
+    :param args: The arguments of the function
+    :type args: ``tuple``
+
+    :return: The result of the function and the duration in ns
+    :rtype: ``tuple[object, int]``
+    """
+    start = perf_counter_ns()
+    result = function(*args)
+    return result, perf_counter_ns() - start
+# end def measure
+
+
+def main(count=DEFAULT_PACKET_COUNT):
+    """
+    Run the benchmark and print the results.
+
+    :param count: Number of program data packets
+    :type count: ``int``
+    """
+    dfu_file_path = write_dfu_file(count)
+    try:
+        DfuFileParser.clear_cache()
+        _, uncached_parse_time = measure(
+            DfuFileParser.parse_dfu_file, dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX, DFU_FEATURE_VERSION)
+        dfu_file_parser, cached_parse_time = measure(
+            DfuFileParser.parse_dfu_file, dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX, DFU_FEATURE_VERSION)
+        encoded_reports, encode_time = measure(DfuFileReports.from_dfu_file_parser, dfu_file_parser)
+        cached_reports, cached_reports_time = measure(
+            DfuFileParser.get_dfu_file_reports, dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX)
+        assert encoded_reports.command_1 == cached_reports.command_1, "The cached reports differ from the parsed ones"
+    finally:
+        remove(dfu_file_path)
+        DfuFileParser.clear_cache()
+    # end try
+
+    print(f'DFU file of {count} program data packets')
+    for name, duration in (('parse_dfu_file, empty cache', uncached_parse_time),
+                           ('parse_dfu_file, cached', cached_parse_time),
+                           ('encoding of the parsed objects', encode_time),
+                           ('get_dfu_file_reports, cached', cached_reports_time)):
+        print(f'{name:32}: {duration / 1e6:8.1f} ms, {duration / count / 1000:6.2f} us/packet')
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.benchmark.hiddispatcher_benchmark
+:brief: Benchmark of the HIDDispatcher message class resolution
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+Replay a stream of HID++ 2.0 responses and events, one per entry of the dispatcher message class tables, through
+``HIDDispatcher.process_interrupt_hidpp``. The legacy dispatcher resolves the message classes by scanning the tables.
+
+Usage: python -m pyhid.benchmark.hiddispatcher_benchmark [iterations]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+import warnings
+from random import Random
+from time import perf_counter_ns
+
+from pyhid.hiddispatcher import HIDDispatcher
+from pyhid.hiddispatcher import MessageClassIndex
+from pyhid.hidpp.hidppmessage import HidppMessage
+from pylibrary.tools.hexlist import HexList
+from pytransport.transportmessage import TransportMessage
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_ITERATIONS = 20
+
+
+class LegacyHIDDispatcher(HIDDispatcher):
+    """
+    Dispatcher resolving the message classes by scanning the tables, as before ``MessageClassIndex``
+    """
+
+    def get_hidpp2_message(self, transport_message):
+        # See ``HIDDispatcher.get_hidpp2_message``
+        message = None
+        message_class = None
+        data = transport_message.data
+
+        if len(data) > HidppMessage.OFFSET.SOFTWARE_ID:
+            feature_index, function_index, software_id = self.parse_hidpp2_header(data)
+
+            if feature_index in self._feature_index_to_id:
+                feature_id, feature_version = self._feature_index_to_id[feature_index]
+                if software_id == 0:
+                    message_class = self.get_message_class(
+                        self._event_table, feature_id, feature_version, function_index)
+                # end if
+
+                if message_class is None:
+                    message_class = self.get_message_class(
+                        self._feature_table, feature_id, feature_version, function_index)
+                # end if
+
+                if message_class is not None:
+                    message = message_class.fromHexList(data, timestamp=transport_message.timestamp)
+                    transport_message.message_class = message_class
+                # end if
+            # end if
+        # end if
+        return message
+    # end def get_hidpp2_message
+# end class LegacyHIDDispatcher
+
+
+def build_stream(dispatchers):
+    """
+    Register a feature index for each feature version of the tables and build one report per message class.
+
+    :param dispatchers: The dispatchers to configure
+    :type dispatchers: ``list[HIDDispatcher]``
+
+    :return: The reports data, with the feature index, feature id and version they are decoded with
+    :rtype: ``list[tuple[int, int, int, HexList]]``
+    """
+    random = Random(0)
+    reference = dispatchers[0]
+    feature_indexes = {}
+    stream = []
+    for table, software_id in ((reference._event_table, 0), (reference._feature_table, 1)):
+        for key in table:
+            for feature_id, version, function_index in MessageClassIndex.expand_key(key):
+                if feature_id in (0xFF00, 0xFF01) or len(feature_indexes) >= 0xFE:
+                    # Error messages and the features not fitting in the index space are skipped
+                    continue
+                # end if
+                feature_index = feature_indexes.setdefault(feature_id, len(feature_indexes) + 1)
+                data = HexList(0x11, 0xFF, feature_index, (function_index << 4) | software_id)
+                data.extendRaw([random.randrange(256) for _ in range(16)])
+                stream.append((feature_index, feature_id, version, data))
+            # end for
+        # end for
+    # end for
+
+    reports = []
+    for feature_index, feature_id, version, data in stream:
+        for dispatcher in dispatchers:
+            dispatcher.add_feature_entry(feature_index, feature_id, version)
+        # end for
+        # Keep the reports the dispatchers can decode with this feature mapping
+        try:
+            if all(dispatcher.get_hidpp2_message(TransportMessage(data=data)) is not None
+                   for dispatcher in dispatchers):
+                reports.append((feature_index, feature_id, version, data))
+            # end if
+        except Exception:  # pylint:disable=W0703
+            continue
+        # end try
+    # end for
+    return reports
+# end def build_stream
+
+
+def replay(dispatcher, reports, iterations):
+    """
+    Replay the reports through ``process_interrupt_hidpp``.
+
+    :param dispatcher: The dispatcher
+    :type dispatcher: ``HIDDispatcher``
+    :param reports: The reports with their feature mapping
+    :type reports: ``list[tuple]``
+    :param iterations: Number of replays of the stream
+    :type iterations: ``int``
+
+    :return: The total processing time, in ns
+    :rtype: ``int``
+    """
+    total = 0
+    for _ in range(iterations):
+        for feature_index, feature_id, version, data in reports:
+            dispatcher.add_feature_entry(feature_index, feature_id, version)
+            transport_message = TransportMessage(data=data, timestamp=0)
+            start = perf_counter_ns()
+            dispatcher.process_interrupt_hidpp(transport_message)
+            total += perf_counter_ns() - start
+        # end for
+        dispatcher.clear_all_queues()
+        dispatcher.default_message_queue.clear()
+    # end for
+    return total
+# end def replay
+
+
+def measure_lookup(dispatcher, reports, iterations):
+    """
+    Measure the message class resolution only, with the table scan and with the index.
+
+    :param dispatcher: The dispatcher
+    :type dispatcher: ``HIDDispatcher``
+    :param reports: The reports with their feature mapping
+    :type reports: ``list[tuple]``
+    :param iterations: Number of passes over the reports
+    :type iterations: ``int``
+
+    :return: Scan and index lookup times, in ns
+    :rtype: ``tuple[int, int]``
+    """
+    keys = [(feature_id, version, data[3] >> 4) for _, feature_id, version, data in reports]
+    start = perf_counter_ns()
+    for _ in range(iterations):
+        for key in keys:
+            dispatcher.get_message_class(dispatcher._event_table, *key) or \
+                dispatcher.get_message_class(dispatcher._feature_table, *key)
+        # end for
+    # end for
+    scan_time = perf_counter_ns() - start
+
+    start = perf_counter_ns()
+    for _ in range(iterations):
+        for key in keys:
+            dispatcher._event_message_classes.get_message_class(*key) or \
+                dispatcher._feature_message_classes.get_message_class(*key)
+        # end for
+    # end for
+    return scan_time, perf_counter_ns() - start
+# end def measure_lookup
+
+
+def main(iterations=DEFAULT_ITERATIONS):
+    """
+    Run the benchmark and print the results.
+
+    :param iterations: Number of replays of the stream
+    :type iterations: ``int``
+    """
+    warnings.simplefilter('ignore')
+    legacy = LegacyHIDDispatcher()
+    indexed = HIDDispatcher()
+    for dispatcher in (legacy, indexed):
+        dispatcher.load_all_features()
+    # end for
+    reports = build_stream([legacy, indexed])
+    count = len(reports) * iterations
+
+    scan_time, index_time = measure_lookup(indexed, reports, iterations)
+    legacy_time = replay(legacy, reports, iterations)
+    indexed_time = replay(indexed, reports, iterations)
+
+    print(f'{len(reports)} reports, {iterations} iterations')
+    print(f'lookup                : scan {scan_time / count / 1000:8.2f} us/msg, index {index_time / count / 1000:8.2f} '
+          f'us/msg, speedup x{scan_time / index_time:.1f}')
+    print(f'process_interrupt_hidpp: legacy {legacy_time / count / 1000:8.2f} us/msg, indexed '
+          f'{indexed_time / count / 1000:8.2f} us/msg, speedup x{legacy_time / indexed_time:.2f}')
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
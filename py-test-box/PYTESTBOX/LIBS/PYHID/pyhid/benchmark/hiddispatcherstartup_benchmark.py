@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.benchmark.hiddispatcherstartup_benchmark
+:brief: Benchmark of the HIDDispatcher import and construction
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+The lazy figures are the ones of a dispatcher registering the features on demand, the eager figures are the ones of
+a dispatcher loading all the features of the manifest, as the dispatcher did before the manifest.
+
+Usage: python -m pyhid.benchmark.hiddispatcherstartup_benchmark [iterations]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import subprocess
+import sys
+import warnings
+from time import perf_counter_ns
+
+from pyhid.hiddispatcher import HIDDispatcher
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_ITERATIONS = 50
+
+IMPORT_SCRIPT = """
+import sys
+import warnings
+from time import perf_counter_ns
+warnings.simplefilter('ignore')
+start = perf_counter_ns()
+from pyhid.hiddispatcher import HIDDispatcher
+if sys.argv[1] == 'eager':
+    HIDDispatcher().load_all_features()
+else:
+    HIDDispatcher()
+# end if
+print(perf_counter_ns() - start, len(sys.modules))
+"""
+
+
+def measure_first_use(mode):
+    """
+    Measure the import of the dispatcher and the creation of the first dispatcher in a new interpreter.
+
+    :param mode: ``lazy`` or ``eager``
+    :type mode: ``str``
+
+    :return: The time in ns and the number of imported modules
+    :rtype: ``tuple[int, int]``
+    """
+    output = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT, mode], check=True, capture_output=True,
+                            text=True).stdout.split()
+    return int(output[0]), int(output[1])
+# end def measure_first_use
+
+
+def measure_construction(iterations, eager):
+    """
+    Measure the creation of dispatchers once the feature modules are imported.
+
+    :param iterations: Number of dispatchers to create
+    :type iterations: ``int``
+    :param eager: Flag indicating if all the features are loaded
+    :type eager: ``bool``
+
+    :return: The total time, in ns
+    :rtype: ``int``
+    """
+    HIDDispatcher().load_all_features()
+    start = perf_counter_ns()
+    for _ in range(iterations):
+        dispatcher = HIDDispatcher()
+        if eager:
+            dispatcher.load_all_features()
+        # end if
+    # end for
+    return perf_counter_ns() - start
+# end def measure_construction
+
+
+def main(iterations=DEFAULT_ITERATIONS):
+    """
+    Run the benchmark and print the results.
+
+    :param iterations: Number of dispatchers to create
+    :type iterations: ``int``
+    """
+    warnings.simplefilter('ignore')
+    lazy_time, lazy_modules = measure_first_use('lazy')
+    eager_time, eager_modules = measure_first_use('eager')
+    lazy_construction = measure_construction(iterations, eager=False)
+    eager_construction = measure_construction(iterations, eager=True)
+
+    print(f'first use   : eager {eager_time / 1e6:8.1f} ms ({eager_modules} modules), lazy {lazy_time / 1e6:8.1f} ms '
+          f'({lazy_modules} modules), speedup x{eager_time / lazy_time:.2f}')
+    print(f'construction: eager {eager_construction / iterations / 1e6:8.2f} ms, lazy '
+          f'{lazy_construction / iterations / 1e6:8.2f} ms, speedup x{eager_construction / lazy_construction:.2f}')
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
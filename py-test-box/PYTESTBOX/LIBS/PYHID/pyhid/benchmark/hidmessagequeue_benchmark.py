@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.benchmark.hidmessagequeue_benchmark
+:brief: Benchmark of the filtered get of a HidMessageQueue full of events
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A response is looked for behind a growing number of events, as when a test waits for a response while the device
+sends mouse or battery notifications. The legacy queue pops all the messages and puts them back, the filter get
+searches the queue in place and the index get uses the message class index.
+
+Usage: python -m pyhid.benchmark.hidmessagequeue_benchmark [iterations]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from time import perf_counter_ns
+
+from pyhid.hiddispatcher import HidMessageQueue
+from pyhid.hidpp.features.common.keepalive import GetTimeoutRangeResponse
+from pyhid.hidpp.features.common.keepalive import KeepAliveTimeoutEventV1
+from pylibrary.tools.hexlist import HexList
+from pylibrary.tools.threadutils import QueueEmpty
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_ITERATIONS = 20
+QUEUE_SIZES = (10, 100, 1000, 5000)
+
+
+class LegacyHidMessageQueue(HidMessageQueue):
+    """
+    Queue getting with filter by popping all the messages, as before the in place search
+    """
+
+    def get_no_wait_first_message_filter(self, filter_method=None, skip_error=False):
+        # See ``QueueWithFilter.get_no_wait_first_message_filter``
+        unwanted_objects = []
+        returned_message = None
+
+        try:
+            while returned_message is None:
+                returned_message = self.get_nowait()
+                if filter_method is not None and not filter_method(returned_message):
+                    unwanted_objects.append(returned_message)
+                    returned_message = None
+                # end if
+            # end while
+        except QueueEmpty:
+            if not skip_error:
+                raise
+            # end if
+        finally:
+            if len(unwanted_objects) > 0:
+                while not self.event_empty.is_set():
+                    unwanted_objects.append(self.get_nowait())
+                # end while
+                while len(unwanted_objects) > 0:
+                    self.put(unwanted_objects.pop(0))
+                # end while
+            # end if
+        # end try
+
+        return returned_message
+    # end def get_no_wait_first_message_filter
+# end class LegacyHidMessageQueue
+
+
+def fill(queue, size):
+    """
+    Fill a queue with events followed by one response.
+
+    :param queue: The queue
+    :type queue: ``HidMessageQueue``
+    :param size: The number of events
+    :type size: ``int``
+
+    :return: The response
+    :rtype: ``GetTimeoutRangeResponse``
+    """
+    event = KeepAliveTimeoutEventV1.fromHexList(HexList('11FF0500' + '00' * 16))
+    response = GetTimeoutRangeResponse.fromHexList(HexList('11FF0511' + '00' * 16))
+    for _ in range(size):
+        queue.put(event)
+    # end for
+    queue.put(response)
+    return response
+# end def fill
+
+
+def measure(queue, size, iterations, get_method):
+    """
+    Measure the get of the response behind the events.
+
+    :param queue: The queue
+    :type queue: ``HidMessageQueue``
+    :param size: The number of events
+    :type size: ``int``
+    :param iterations: Number of gets
+    :type iterations: ``int``
+    :param get_method: The method getting the response from the queue
+    :type get_method: ``callable type``
+
+    :return: The mean time of a get, in ns
+    :rtype: ``float``
+    """
+    total = 0
+    for _ in range(iterations):
+        response = fill(queue, size)
+        start = perf_counter_ns()
+        message = get_method(queue)
+        total += perf_counter_ns() - start
+        assert message is response and queue.qsize() == size
+        queue.clear()
+    # end for
+    return total / iterations
+# end def measure
+
+
+def main(iterations=DEFAULT_ITERATIONS):
+    """
+    Run the benchmark and print the results.
+
+    :param iterations: Number of gets for each queue size
+    :type iterations: ``int``
+    """
+    def filter_method(message):
+        """
+        Filter of the response.
+
+        :param message: The message to test
+        :type message: ``HidppMessage``
+
+        :return: Flag indicating if the message is the response
+        :rtype: ``bool``
+        """
+        return isinstance(message, GetTimeoutRangeResponse)
+    # end def filter_method
+
+    def get_filter(queue):
+        """
+        Get the response with the filter.
+
+        :param queue: The queue
+        :type queue: ``HidMessageQueue``
+
+        :return: The response
+        :rtype: ``GetTimeoutRangeResponse``
+        """
+        return queue.get_no_wait_first_message_filter(filter_method=filter_method)
+    # end def get_filter
+
+    def get_index(queue):
+        """
+        Get the response with the message class index.
+
+        :param queue: The queue
+        :type queue: ``HidMessageQueue``
+
+        :return: The response
+        :rtype: ``GetTimeoutRangeResponse``
+        """
+        return queue.get_no_wait_first_message_index(
+            index_name=HidMessageQueue.MESSAGE_CLASS_INDEX,
+            key_filter_method=lambda message_class: issubclass(message_class, GetTimeoutRangeResponse))
+    # end def get_index
+
+    print(f'{iterations} iterations')
+    for size in QUEUE_SIZES:
+        legacy_time = measure(LegacyHidMessageQueue(), size, iterations, get_filter)
+        filter_time = measure(HidMessageQueue(), size, iterations, get_filter)
+        index_time = measure(HidMessageQueue(), size, iterations, get_index)
+        print(f'{size:5d} events: legacy {legacy_time / 1000:10.1f} us, filter {filter_time / 1000:8.1f} us '
+              f'(x{legacy_time / filter_time:.1f}), index {index_time / 1000:6.1f} us (x{legacy_time / index_time:.1f})')
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
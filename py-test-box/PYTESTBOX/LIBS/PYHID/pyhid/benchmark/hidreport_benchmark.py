@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.benchmark.hidreport_benchmark
+:brief: Benchmark of the HID mouse report decoding, generic deserialization against the compiled report decoder
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A stream of mouse reports (buttons, small X and Y motions, wheel) is replayed in ``HIDDispatcher``, first with the
+generic ``Device.deserialize``, then with the report decoder compiled from the descriptor. The report decoding alone
+(``analyse_hid_message``) and the whole processing up to the mouse queue (``process_interrupt_hid_mouse``) are
+measured.
+
+Usage: python -m pyhid.benchmark.hidreport_benchmark [report count]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from random import Random
+from time import perf_counter_ns
+
+from pyhid.hiddispatcher import HIDDispatcher
+from pyhid.hiddispatcher import MessageType
+from pylibrary.tools.hexlist import HexList
+from pytransport.transportmessage import TransportMessage
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_REPORT_COUNT = 100000
+# Mouse with 16 buttons, 16 bits X and Y, wheel and AC pan in report ID 2, consumer keys in report ID 3 and system
+# control in report ID 4
+MOUSE_DESCRIPTOR = '05010902A1018502' '0901A100951075011500250105091901291081029502751016018026FF7F05010930' \
+                   '09318106950175081581257F093881069501050C0A38028106C0C0' \
+                   '050C0901A1018503950275101501' '26FF0219012AFF028100C0' \
+                   '05010980A1018504950175021501250309820981098381007506' '8103C0'
+MOUSE_REPORT_ID = 2
+# Number of reports processed before emptying the mouse queue
+QUEUE_FLUSH_PERIOD = 1000
+
+
+def get_reports(count):
+    """
+    Build the mouse reports: a button pressed from time to time, motions of a few counts and some wheel steps.
+
+    :param count: Number of reports
+    :type count: ``int``
+
+    :return: The raw reports, with their report ID
+    :rtype: ``list[bytes]``
+    """
+    random = Random(0)
+    reports = []
+    for _ in range(count):
+        buttons = 1 << random.randrange(16) if random.random() < 0.1 else 0
+        x = random.randint(-127, 127)
+        y = random.randint(-127, 127)
+        wheel = random.choice((-1, 0, 0, 0, 1))
+        reports.append(bytes([MOUSE_REPORT_ID]) + buttons.to_bytes(2, 'little') + x.to_bytes(2, 'little', signed=True)
+                       + y.to_bytes(2, 'little', signed=True) + wheel.to_bytes(1, 'little', signed=True) + b'\x00')
+    # end for
+    return reports
+# end def get_reports
+
+
+def get_dispatcher(compiled):
+    """
+    Get a dispatcher which has read the mouse descriptor.
+
+    :param compiled: Flag indicating to use the compiled report decoder, else the generic deserialization is used
+    :type compiled: ``bool``
+
+    :return: The dispatcher
+    :rtype: ``HIDDispatcher``
+    """
+    dispatcher = HIDDispatcher()
+    dispatcher.process_control_read_get_descriptor(TransportMessage(data=HexList(MOUSE_DESCRIPTOR), timestamp=0))
+    for report_decoder in dispatcher.mouse_collections.input_decoders.values():
+        report_decoder.is_compiled &= compiled
+    # end for
+    return dispatcher
+# end def get_dispatcher
+
+
+def measure_analyse(dispatcher, reports):
+    """
+    Measure the report decoding.
+
+    :param dispatcher: The dispatcher
+    :type dispatcher: ``HIDDispatcher``
+    :param reports: The raw reports
+    :type reports: ``list[bytes]``
+
+    :return: The total time in ns and the decoded data
+    :rtype: ``tuple[int, list[HexList]]``
+    """
+    results = []
+    start = perf_counter_ns()
+    for report in reports:
+        results.append(dispatcher.analyse_hid_message(
+            usbmessage=TransportMessage(raw_data=report, timestamp=0), message_type=MessageType.HID_MOUSE)[0])
+    # end for
+    return perf_counter_ns() - start, results
+# end def measure_analyse
+
+
+def measure_process(dispatcher, reports):
+    """
+    Measure the whole processing of the reports, up to the mouse queue.
+
+    :param dispatcher: The dispatcher
+    :type dispatcher: ``HIDDispatcher``
+    :param reports: The raw reports
+    :type reports: ``list[bytes]``
+
+    :return: The total time in ns
+    :rtype: ``int``
+    """
+    elapsed = 0
+    for index in range(0, len(reports), QUEUE_FLUSH_PERIOD):
+        start = perf_counter_ns()
+        for report in reports[index:index + QUEUE_FLUSH_PERIOD]:
+            dispatcher.process_interrupt_hid_mouse(transport_message=TransportMessage(raw_data=report, timestamp=0))
+        # end for
+        elapsed += perf_counter_ns() - start
+        dispatcher.clear_all_queues()
+    # end for
+    return elapsed
+# end def measure_process
+
+
+def main(count=DEFAULT_REPORT_COUNT):
+    """
+    Run the benchmark and print the results.
+
+    :param count: Number of mouse reports
+    :type count: ``int``
+    """
+    reports = get_reports(count)
+    generic_dispatcher = get_dispatcher(compiled=False)
+    compiled_dispatcher = get_dispatcher(compiled=True)
+
+    generic_analyse_time, generic_results = measure_analyse(generic_dispatcher, reports)
+    compiled_analyse_time, compiled_results = measure_analyse(compiled_dispatcher, reports)
+    assert generic_results == compiled_results, "The report decoder does not give the generic deserialization data"
+
+    generic_process_time = measure_process(generic_dispatcher, reports)
+    compiled_process_time = measure_process(compiled_dispatcher, reports)
+
+    print(f'{count} mouse reports')
+    for name, generic_time, compiled_time in (
+            ('analyse_hid_message', generic_analyse_time, compiled_analyse_time),
+            ('process_interrupt_hid_mouse', generic_process_time, compiled_process_time)):
+        print(f'{name:28}: generic {generic_time / count / 1000:8.2f} us/report, compiled '
+              f'{compiled_time / count / 1000:8.2f} us/report, speedup x{generic_time / compiled_time:.1f}')
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -279,6 +279,19 @@ class BitField(object):
      - BitField acceptable:  Checks whether an attribute name is acceptable for this field
      - BitField accept: Checks if the HexList data are interpretable by self
     """
+    # Incremented each time the layout (fid, lengths, optionality) of a field used by a compiled
+    # ``pyhid.bitfieldcodec.BitFieldContainerCodec`` is modified, so that the codecs are rebuilt on next use
+    LAYOUT_GENERATION = 0
+
+    # Flag set by ``BitFieldContainerCodec`` on the fields it has compiled
+    _layout_compiled = False
+
+    # Incremented each time the fid, name or aliases of a field referenced by a
+    # ``pyhid.bitfieldindex.BitFieldContainerIndex`` is modified, so that the indexes are rebuilt on next use
+    INDEX_GENERATION = 0
+
+    # Flag set by ``BitFieldContainerIndex`` on the fields it has indexed
+    _indexed = False
 
     def __init__(self, fid=None, length=0x00, fid_length=0x00, len_length=0x00, default_value=None,
                  title='Undefined Field', name=None, checks=None, conversions=None, aliases=tuple(), optional=None,
@@ -505,6 +518,26 @@ class BitField(object):
                               self.title, self.name, self.checks, self.conversions, self.aliases)
     # end def deepcopy
 
+    def _invalidate_layout(self):
+        """
+        Invalidate the compiled codecs relying on this field, if any.
+        """
+        if self._layout_compiled:
+            BitField.LAYOUT_GENERATION += 1
+            self._layout_compiled = False
+        # end if
+    # end def _invalidate_layout
+
+    def _invalidate_index(self):
+        """
+        Invalidate the field indexes referencing this field, if any.
+        """
+        if self._indexed:
+            BitField.INDEX_GENERATION += 1
+            self._indexed = False
+        # end if
+    # end def _invalidate_index
+
     def getFid(self):
         """
         Deprecated function. See property ``fid``.
@@ -560,6 +593,8 @@ class BitField(object):
         # end if
 
         self._fid = fid
+        self._invalidate_layout()
+        self._invalidate_index()
     # end def fid
 
     @property
@@ -582,6 +617,7 @@ class BitField(object):
         :type fid_length: ``int``
         """
         self._fid_length = fid_length
+        self._invalidate_layout()
     # end def fid_length
 
     @property
@@ -604,6 +640,7 @@ class BitField(object):
         :type len_length: ``int``
         """
         self._len_length = len_length
+        self._invalidate_layout()
     # end def len_length
 
     def get_has_tag(self, container=None):
@@ -698,6 +735,7 @@ class BitField(object):
         # end if
 
         self._length = length
+        self._invalidate_layout()
     # end def set_length
 
     length = property(get_length, set_length)
@@ -822,6 +860,7 @@ class BitField(object):
         self._name = name
         self._acceptable = None
         self._confusing = None
+        self._invalidate_index()
     # end def name
 
     @property
@@ -913,6 +952,7 @@ class BitField(object):
         self._aliases = aliases
         self._acceptable = None
         self._confusing = None
+        self._invalidate_index()
     # end def aliases
 
     def add_alias(self, alias):
@@ -1168,6 +1208,7 @@ class BitField(object):
         # end if
 
         self._optional = optional
+        self._invalidate_layout()
     # end def set_optional
 
     optional = property(is_optional, set_optional)
@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.bitfieldcodec
+:brief: Per-class compiled codec for BitFieldContainerMixin
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from pyhid.bitfield import BitField
+from pyhid.bitfield import bit_field_from_hex_list
+from pyhid.bitfield import byte_field_from_hex_list
+from pyhid.field import ArrayField
+from pyhid.field import BitField8
+from pyhid.field import CheckByte
+from pyhid.field import CheckHexList
+from pyhid.field import CheckInt
+from pylibrary.tools.bitstruct import BitStruct
+from pylibrary.tools.hexlist import HexList
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+class BitFieldContainerCodec:
+    """
+    Decoder and encoder of a ``BitFieldContainerMixin`` subclass, built once the first time the class is used.
+
+    The leading fields of ``FIELDS`` that have a fixed length, no tag, no length prefix and the default parsers are
+    compiled into a list of bit offsets and masks. They are decoded in a single pass over the raw data, the
+    remaining fields (if any) being parsed by the generic ``BitField.fromHexList`` loop.
+
+    When all the fields are compiled, the whole container is also encoded in a single pass.
+    """
+    # Name of the class attribute holding the codec of a container class
+    CODEC_ATTRIBUTE = '_bit_field_codec'
+
+    # Field types and parsers whose behavior is reproduced by the codec
+    COMPILABLE_FIELD_TYPES = (BitField, BitField8)
+    COMPILABLE_PARSERS = (byte_field_from_hex_list, bit_field_from_hex_list)
+
+    class Step:
+        """
+        Compiled step of the codec: the extraction of one field
+        """
+        __slots__ = ('definition', 'fid', 'offset', 'length', 'byte_aligned', 'byte_length', 'mask', 'checked')
+
+        def __init__(self, field, definition, offset):
+            """
+            :param field: The field to extract
+            :type field: ``BitField``
+            :param definition: The field returned by ``getFieldDefinition`` for the fid of ``field``, used to check
+                               and convert the value (it differs from ``field`` when several fields share a fid)
+            :type definition: ``BitField``
+            :param offset: The offset of the field in the container, in bits
+            :type offset: ``int``
+            """
+            self.definition = definition
+            self.fid = field.fid
+            self.offset = offset
+            self.length = field._length
+            self.byte_aligned = (offset % 8 == 0) and (self.length % 8 == 0)
+            definition_length = definition.get_length()
+            self.byte_length = (definition_length // 8
+                                if isinstance(definition_length, int) and definition_length % 8 == 0 else None)
+            self.mask = (1 << self.length) - 1
+            self.checked = definition._checks is not None and not self.is_always_accepted()
+        # end def __init__
+
+        def is_always_accepted(self):
+            """
+            Check whether the checks of the field accept any value the step can extract: an ``HexList`` of the field
+            length if it is byte aligned, else an integer of the field length. ``check_value`` uses the first check
+            accepting the value type, it is always accepted if this check is an ``HexList`` length or an integer range
+            covering all the values of the step.
+
+            :return: Flag indicating if the check of the extracted values can be skipped
+            :rtype: ``bool``
+            """
+            for check in self.definition._checks:
+                if type(check) is CheckHexList:
+                    if self.byte_aligned:
+                        return isinstance(check._length, int) and check._length * 8 == self.length
+                    # end if
+                elif type(check) in (CheckInt, CheckByte):
+                    if not self.byte_aligned:
+                        return ((check._min_value is None or check._min_value <= 0)
+                                and (check._max_value is None or check._max_value >= self.mask))
+                    # end if
+                else:
+                    return False
+                # end if
+            # end for
+            return False
+        # end def is_always_accepted
+    # end class Step
+
+    def __init__(self, container_class, inner_class):
+        """
+        :param container_class: The ``BitFieldContainerMixin`` subclass to compile
+        :type container_class: ``type``
+        :param inner_class: The class of the instances created by the decoder
+        :type inner_class: ``type``
+        """
+        self.container_class = container_class
+        self.inner_class = inner_class
+        self.fields = container_class.FIELDS
+        self.generation = BitField.LAYOUT_GENERATION
+
+        # Instantiate once: check the class definition and compute the automatic fids
+        inner_class()
+
+        definitions = {}
+        for field in self.fields:
+            definitions.setdefault(field.fid, field)
+        # end for
+
+        self.steps = []
+        offset = 0
+        for field in self.fields:
+            if not self.is_compilable(field) or not self.is_compilable(definitions[field.fid]):
+                break
+            # end if
+            self.steps.append(self.Step(field, definitions[field.fid], offset))
+            field._layout_compiled = True
+            offset += field._length
+        # end for
+
+        self.prefix_count = len(self.steps)
+        self.prefix_length = offset
+        self.prefix_byte_length = (offset + 7) // 8
+        self.complete = self.prefix_count == len(self.fields)
+    # end def __init__
+
+    @classmethod
+    def is_compilable(cls, field):
+        """
+        Check whether a field can be handled by the codec.
+
+        :param field: The field to check
+        :type field: ``BitField``
+
+        :return: Flag indicating if the field has a fixed position and length
+        :rtype: ``bool``
+        """
+        length = field._length
+        return (type(field) in cls.COMPILABLE_FIELD_TYPES
+                and field._parser in cls.COMPILABLE_PARSERS
+                and field._fid_length == 0
+                and field._len_length == 0
+                and isinstance(length, int)
+                and length > 0
+                and field._optional is False
+                and not hasattr(field, 'serializer'))
+    # end def is_compilable
+
+    @classmethod
+    def get_codec(cls, container_class, inner_class_factory):
+        """
+        Get the codec of a container class, building it if needed.
+
+        :param container_class: The ``BitFieldContainerMixin`` subclass
+        :type container_class: ``type``
+        :param inner_class_factory: Callable creating the class of the decoded instances
+        :type inner_class_factory: ``callable``
+
+        :return: The codec of the container class
+        :rtype: ``BitFieldContainerCodec``
+        """
+        codec = container_class.__dict__.get(cls.CODEC_ATTRIBUTE)
+        if codec is None or not codec.is_valid():
+            inner_class = codec.inner_class if codec is not None else inner_class_factory(container_class)
+            codec = cls(container_class, inner_class)
+            setattr(container_class, cls.CODEC_ATTRIBUTE, codec)
+        # end if
+        return codec
+    # end def get_codec
+
+    def is_valid(self):
+        """
+        Check whether the codec still matches the definition of its container class.
+
+        :return: Flag indicating if the codec can be used
+        :rtype: ``bool``
+        """
+        return self.generation == BitField.LAYOUT_GENERATION and self.fields is self.container_class.FIELDS
+    # end def is_valid
+
+    def new_instance(self):
+        """
+        Create an empty instance of the decoded class.
+
+        This is equivalent to calling ``BitFieldContainerMixin.__init__`` without argument, the class level checks
+        having been done once when the codec was built.
+
+        :return: New empty instance
+        :rtype: ``BitFieldContainerMixin``
+        """
+        instance = object.__new__(self.inner_class)
+        instance_dict = instance.__dict__
+        instance_dict['_values'] = {}
+        instance_dict['_name'] = self.inner_class.__name__
+        instance_dict['_externalProperties'] = self.inner_class._ExternalProperties()
+        return instance
+    # end def new_instance
+
+    def decode_prefix(self, instance, data, offset, limit):
+        """
+        Decode the compiled fields in a single pass.
+
+        :param instance: The instance to fill
+        :type instance: ``BitFieldContainerMixin``
+        :param data: The data to parse
+        :type data: ``HexList`` or ``bytes`` or ``bytearray`` or ``memoryview``
+        :param offset: The offset in data at which to start parsing, in bits
+        :type offset: ``int``
+        :param limit: The limit of the data to parse, in bits
+        :type limit: ``int``
+
+        :return: The offset following the compiled fields or ``None`` if the generic parsing shall be used
+        :rtype: ``int`` or ``None``
+        """
+        if self.prefix_count == 0 or offset % 8 != 0:
+            return None
+        # end if
+
+        end = offset + self.prefix_length
+        if end > limit or end > len(data) * 8:
+            return None
+        # end if
+
+        start_byte = offset // 8
+        end_byte = start_byte + self.prefix_byte_length
+        try:
+            if isinstance(data, list):
+                window = bytes(list.__getitem__(data, slice(start_byte, end_byte)))
+            else:
+                window = bytes(data[start_byte:end_byte])
+            # end if
+        except (ValueError, TypeError):
+            return None
+        # end try
+
+        word = int.from_bytes(window, 'big')
+        total_length = self.prefix_byte_length * 8
+        values = instance._values
+        for step in self.steps:
+            if step.byte_aligned:
+                value = HexList()
+                byte_offset = step.offset // 8
+                list.extend(value, window[byte_offset:byte_offset + step.length // 8])
+            else:
+                value = (word >> (total_length - step.offset - step.length)) & step.mask
+            # end if
+
+            field = step.definition
+            if step.checked:
+                field.check_value(value, instance)
+            # end if
+            if field._conversions:
+                value = field.convert_value(value, instance)
+            # end if
+            if step.byte_length is not None and isinstance(value, int):
+                if 0 <= value < (1 << (step.byte_length * 8)):
+                    int_value = value
+                    value = HexList()
+                    list.extend(value, int_value.to_bytes(step.byte_length, 'big'))
+                else:
+                    value = HexList.fromLong(value, step.byte_length)
+                # end if
+            # end if
+            values[step.fid] = value
+        # end for
+
+        return end
+    # end def decode_prefix
+
+    def encode(self, container):
+        """
+        Encode a container in a single pass.
+
+        :param container: The container to encode
+        :type container: ``BitFieldContainerMixin``
+
+        :return: HexList representation of the container or ``None`` if the generic encoding shall be used
+        :rtype: ``HexList`` or ``None``
+
+        :raise ``ValueError``: If a value is out of bound
+        """
+        # Instances may redefine their own FIELDS
+        if not self.complete or container.FIELDS is not self.fields:
+            return None
+        # end if
+
+        values = container._values
+        accumulator = 0
+        bit_count = 0
+        for step in self.steps:
+            value = values.get(step.fid)
+            if value is None:
+                value = step.definition.get_default_value(container)
+                if value is None:
+                    continue
+                # end if
+            # end if
+
+            if isinstance(value, HexList):
+                try:
+                    raw = bytes(value)
+                except (ValueError, TypeError):
+                    return None
+                # end try
+                # A HexList starts on a byte boundary
+                padding = -bit_count % 8
+                accumulator = (accumulator << (padding + len(raw) * 8)) | int.from_bytes(raw, 'big')
+                bit_count += padding + len(raw) * 8
+                continue
+            elif not isinstance(value, int):
+                if (hasattr(value, 'to_bit_list') or isinstance(value, (list, BitStruct, ArrayField.ArrayWrapper))):
+                    return None
+                # end if
+                value = HexList(value).toLong()
+            # end if
+
+            length = step.length
+            if not (0 <= value < (1 << length)):
+                raise ValueError('Out of bound value: %s. Max value: %d' % (value, (1 << length)))
+            # end if
+            accumulator = (accumulator << length) | int(value)
+            bit_count += length
+        # end for
+
+        padding = -bit_count % 8
+        result = HexList()
+        list.extend(result, (accumulator << padding).to_bytes((bit_count + padding) // 8, 'big'))
+        return result
+    # end def encode
+# end class BitFieldContainerCodec
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -20,6 +20,9 @@ from pylibrary.system.tracelogger import TIMESTAMP_UNIT_DIVIDER_MAP
 from pylibrary.tools.bitstruct import BitStruct
 from pylibrary.tools.hexlist import HexList
 from pyhid.bitfield import getElement
+from pyhid.bitfieldcodec import BitFieldContainerCodec
+from pyhid.bitfieldindex import BitFieldContainerIndex
+from pyhid.bitfieldindex import BitFieldDescriptor
 from pyhid.field import ArrayField
 from pyhid.field import Field
 from pylibrary.tools.numeral import to_int
@@ -98,6 +101,10 @@ class AbstractFieldContainerMixin:
         As a consequence, fid is optional and automatically computed during
         instantiation of container
         """
+        if not BitFieldContainerIndex.get_index(self).automatic_fids:
+            return
+        # end if
+
         ind = -1
         existing_fids = [f.fid for f in self.FIELDS if f.fid is not None]
         for field in self.FIELDS:
@@ -126,12 +133,11 @@ class AbstractFieldContainerMixin:
 
         :raise ``ValueError``: If the FID is inconsistent for this object
         """
-        for field in self.FIELDS:
-            if field.getFid() == fid:
-                return field
-            # end if
-        # end for
-        raise ValueError(f'Inconsistent FID={fid} for this object!')
+        field = BitFieldContainerIndex.get_index(self).by_fid.get(fid)
+        if field is None:
+            raise ValueError(f'Inconsistent FID={fid} for this object!')
+        # end if
+        return field
     # end def getFieldDefinition
 
     def getFieldCount(self):
@@ -289,6 +295,17 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
         # end def __setattr__
     # end class _ExternalProperties
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Expose the fields defined by the subclass as descriptors.
+
+        :param kwargs: Class keyword arguments
+        :type kwargs: ``dict``
+        """
+        super().__init_subclass__(**kwargs)
+        BitFieldDescriptor.install(cls)
+    # end def __init_subclass__
+
     def __init__(self, *args, **kwargs):
         """
         :param args: Positional Parameters
@@ -312,16 +329,15 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
         key_to_ignore = []
         if len(kwargs):
             kw_args_order = {}
+            field_index = BitFieldContainerIndex.get_index(self)
             for key in kwargs:
-                for index, field in enumerate(self.FIELDS):
-                    if (key == field.name) or key in field.aliases:
-                        kw_args_order[key] = index
-                        break
-                    # end if
+                position = field_index.get_position(key)
+                if position is not None:
+                    kw_args_order[key] = position
                 else:
                     # Ignore unknown field name
                     key_to_ignore.append(key)
-                # end for
+                # end if
             # end for
 
             for key in key_to_ignore:
@@ -475,7 +491,11 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
         :return: fid value
         :rtype: ``int``
         """
-        return [f.getFid() for f in self.FIELDS if f.name == name][0]
+        field = BitFieldContainerIndex.get_index(self).by_name.get(name)
+        if field is None:
+            raise IndexError(f'No field named {name}')
+        # end if
+        return field.getFid()
     # end def getFidFromName
 
     def _debug(self):
@@ -520,11 +540,10 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
 
         :raise ``AttributeError``: If the attribute is not found
         """
-        for field in self.FIELDS:
-            if (field.name.upper() == name.upper()) or (name in field.aliases):
-                return self.getValue(field.getFid())
-            # end if
-        # end for
+        field = BitFieldContainerIndex.get_index(self).get_field(name)
+        if field is not None:
+            return self.getValue(field.getFid())
+        # end if
 
         # Handle the case where the user called get<AttributeName>
         if name.startswith('get'):
@@ -563,14 +582,11 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
                     :param value: Value to set
                     :type value: ``object``
                     """
-                    for field_ in self.FIELDS:
-                        if (field_.name.upper() == attr_name.upper()) or (attr_name in field_.aliases):
-                            self.setValue(field_.getFid(), value)
-                            break
-                        # end if
-                    else:
+                    field_ = BitFieldContainerIndex.get_index(self).get_field(attr_name)
+                    if field_ is None:
                         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr_name}'")
-                    # end for
+                    # end if
+                    self.setValue(field_.getFid(), value)
 
                 # end def setter
 
@@ -596,17 +612,15 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
 
         :raise ``AttributeError``: If the attribute is not found
         """
-        lower_name = name.lower()
-        for field in self.FIELDS:
-            if field.acceptable(name):
-                self.setValue(field.getFid(), value)
-                break
-            elif field.confusing(lower_name):
-                raise AttributeError(f'Attribute {name} is probably mistaken with {field.name}')
-            # end if
-        else:
+        # The first field whose name or aliases match regardless of the case must match exactly
+        field = BitFieldContainerIndex.get_index(self).by_lower_name.get(name.lower())
+        if field is None:
             object.__setattr__(self, name, value)
-        # end for
+        elif field.acceptable(name):
+            self.setValue(field.getFid(), value)
+        else:
+            raise AttributeError(f'Attribute {name} is probably mistaken with {field.name}')
+        # end if
     # end def __setattr__
 
     def getExternalProperties(self):
@@ -838,20 +852,53 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
        :return: HexList representation of the BitFieldContainerMixin
        :rtype: ``HexList``
         """
-        bit_list = self.to_bit_list()
+        data = BitFieldContainerCodec.get_codec(self.__class__, self._create_inner_class).encode(self)
 
-        data = self._bitListToHexList(bit_list)
+        if data is None:
+            bit_list = self.to_bit_list()
+
+            data = self._bitListToHexList(bit_list)
+        # end if
 
         return data
     # end def __hexlist__
 
+    @staticmethod
+    def _create_inner_class(cls):
+        """
+        Create the class of the instances returned by ``fromHexList``.
+
+        The inner class bypasses the constructor of ``cls`` which may require parameters. It is created once per
+        class, by its ``BitFieldContainerCodec``.
+
+        :param cls: The class to derive
+        :type cls: ``type``
+
+        :return: The inner class
+        :rtype: ``type``
+        """
+        class InnerFieldContainerMixin(cls):  # pylint:disable=W0223
+            """
+            Inner class used to obtain the FIELDS of the Record
+            """
+
+            def __init__(self):
+                BitFieldContainerMixin.__init__(self)
+            # end def __init__
+
+        # end class InnerFieldContainerMixin
+
+        InnerFieldContainerMixin.__name__ = cls.__name__
+        return InnerFieldContainerMixin
+    # end def _create_inner_class
+
     @classmethod
     def fromHexList(cls, *args, **kwargs):
         """
         Parsing from HexList instance
 
         @note   expected parameters:
-                - data (HexList) data to parser
+                - data (HexList or bytes) data to parser
                 - offset (int) Offset (in bits) of value to parse in data
                 - length (int) Length (in bits) of value to parse in data
 
@@ -899,21 +946,24 @@ class BitFieldContainerMixin(AbstractFieldContainerMixin):
 
         limit = offset + length if length is not None else len(data) * 8
 
-        class InnerFieldContainerMixin(cls):  # pylint:disable=W0223
-            """
-            Inner class used to obtain the FIELDS of the Record
-            """
+        codec = BitFieldContainerCodec.get_codec(cls, cls._create_inner_class)
+        inner_field_container_mixin = codec.new_instance()
 
-            def __init__(self):
-                BitFieldContainerMixin.__init__(self)
-            # end def __init__
-
-        # end class InnerFieldContainerMixin
+        # Compiled fields are decoded in a single pass, the others by their own parser
+        field_index = 0
+        prefix_offset = codec.decode_prefix(inner_field_container_mixin, data, offset, limit)
+        if prefix_offset is not None:
+            offset = prefix_offset
+            field_index = codec.prefix_count
+        # end if
 
-        InnerFieldContainerMixin.__name__ = cls.__name__
-        inner_field_container_mixin = InnerFieldContainerMixin()
+        if field_index < len(inner_field_container_mixin.FIELDS) and isinstance(data, (bytes, bytearray, memoryview)):
+            hex_data = HexList()
+            hex_data.extendRaw(bytes(data))
+            data = hex_data
+        # end if
 
-        for field in inner_field_container_mixin.FIELDS:
+        for field in inner_field_container_mixin.FIELDS[field_index:]:
             if isinstance(field, Field):
                 # Adjustment of offset after handling of Field instead of BitField
                 offset //= 8
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.bitfieldindex
+:brief: Name and fid lookup tables of the BitFieldContainerMixin fields
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from pyhid.bitfield import BitField
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+class BitFieldContainerIndex:
+    """
+    Lookup tables of a ``FIELDS`` tuple, replacing the linear scans of the fields by their name, aliases or fid.
+
+    Each table gives the first matching field, as the scans did:
+     - ``by_name``: the names, used by ``getFidFromName``
+     - ``by_upper_name``: the upper case names, used by ``__getattr__``
+     - ``by_alias``: the aliases, used by ``__getattr__``
+     - ``by_lower_name``: the lower case names and aliases, used by ``__setattr__`` to detect confusing names
+     - ``by_exact_name``: the names and aliases, used by the constructor keyword arguments
+     - ``by_fid``: the fids, used by ``getFieldDefinition``
+
+    The index of a class ``FIELDS`` is cached on the class, the index of a ``FIELDS`` redefined by an instance is
+    cached on the instance.
+    """
+    # Name of the attribute holding the index of a container class or instance
+    INDEX_ATTRIBUTE = '_bit_field_index'
+
+    def __init__(self, fields):
+        """
+        :param fields: The fields to index
+        :type fields: ``tuple[BitField]``
+        """
+        self.fields = fields
+        self.generation = BitField.INDEX_GENERATION
+
+        self.by_name = {}
+        self.by_upper_name = {}
+        self.by_alias = {}
+        self.by_lower_name = {}
+        self.by_exact_name = {}
+        self.by_fid = {}
+        self.positions = {}
+        self.automatic_fids = False
+        for position, field in enumerate(fields):
+            if field.name is not None:
+                self.by_name.setdefault(field.name, field)
+                self.by_upper_name.setdefault(field.name.upper(), field)
+                self.by_lower_name.setdefault(field.name.lower(), field)
+                self.by_exact_name.setdefault(field.name, field)
+            # end if
+            for alias in field.aliases:
+                self.by_alias.setdefault(alias, field)
+                self.by_lower_name.setdefault(alias.lower(), field)
+                self.by_exact_name.setdefault(alias, field)
+            # end for
+            fid = field.getFid()
+            if fid is None:
+                self.automatic_fids = True
+            else:
+                self.by_fid.setdefault(fid, field)
+            # end if
+            self.positions.setdefault(id(field), position)
+            field._indexed = True
+        # end for
+    # end def __init__
+
+    @classmethod
+    def get_index(cls, container):
+        """
+        Get the index of the fields of a container, building it if needed.
+
+        :param container: The container
+        :type container: ``BitFieldContainerMixin``
+
+        :return: The index of ``container.FIELDS``
+        :rtype: ``BitFieldContainerIndex``
+        """
+        instance_dict = container.__dict__
+        if 'FIELDS' in instance_dict:
+            owner_dict = instance_dict
+            fields = instance_dict['FIELDS']
+        else:
+            owner_dict = type(container).__dict__
+            fields = container.FIELDS
+        # end if
+
+        index = owner_dict.get(cls.INDEX_ATTRIBUTE)
+        if index is None or index.fields is not fields or index.generation != BitField.INDEX_GENERATION:
+            index = cls(fields)
+            if owner_dict is instance_dict:
+                instance_dict[cls.INDEX_ATTRIBUTE] = index
+            else:
+                setattr(type(container), cls.INDEX_ATTRIBUTE, index)
+            # end if
+        # end if
+        return index
+    # end def get_index
+
+    def get_field(self, name):
+        """
+        Get the first field whose name matches ``name`` (case insensitive) or whose aliases contain ``name``.
+
+        :param name: The attribute name
+        :type name: ``str``
+
+        :return: The field or ``None`` if no field matches
+        :rtype: ``BitField`` or ``None``
+        """
+        field = self.by_upper_name.get(name.upper())
+        alias_field = self.by_alias.get(name)
+        if alias_field is not None and (field is None or self.positions[id(alias_field)] < self.positions[id(field)]):
+            field = alias_field
+        # end if
+        return field
+    # end def get_field
+
+    def get_position(self, name):
+        """
+        Get the position of the first field whose name or aliases are exactly ``name``.
+
+        :param name: The attribute name
+        :type name: ``str``
+
+        :return: The position of the field in the fields or ``None`` if no field matches
+        :rtype: ``int`` or ``None``
+        """
+        field = self.by_exact_name.get(name)
+        return self.positions[id(field)] if field is not None else None
+    # end def get_position
+# end class BitFieldContainerIndex
+
+
+class BitFieldDescriptor:
+    """
+    Class attribute giving access to the value of a field, in place of the ``__getattr__`` fallback.
+
+    The descriptor resolves its name in the index of the instance fields, so that it stays valid for instances or
+    subclasses redefining their ``FIELDS``. It does not define ``__set__``: assignments are handled by
+    ``BitFieldContainerMixin.__setattr__``.
+    """
+
+    def __init__(self, name):
+        """
+        :param name: The field name or alias
+        :type name: ``str``
+        """
+        self.name = name
+    # end def __init__
+
+    def __get__(self, instance, owner=None):
+        """
+        Get the value of the field.
+
+        :param instance: The container
+        :type instance: ``BitFieldContainerMixin`` or ``None``
+        :param owner: The container class - OPTIONAL
+        :type owner: ``type``
+
+        :return: The field value, or the descriptor itself when accessed from the class
+        :rtype: ``object``
+
+        :raise ``AttributeError``: If the fields of the instance do not define this name
+        """
+        if instance is None:
+            return self
+        # end if
+
+        field = BitFieldContainerIndex.get_index(instance).get_field(self.name)
+        if field is None:
+            # Let __getattr__ handle it
+            raise AttributeError(self.name)
+        # end if
+        return instance.getValue(field.getFid())
+    # end def __get__
+
+    @classmethod
+    def install(cls, container_class):
+        """
+        Install a descriptor for each name and alias of the fields defined by a container class, unless the name is
+        already an attribute of the class.
+
+        :param container_class: The container class
+        :type container_class: ``type``
+        """
+        fields = container_class.__dict__.get('FIELDS')
+        if not isinstance(fields, tuple):
+            return
+        # end if
+
+        for field in fields:
+            if not isinstance(field, BitField):
+                continue
+            # end if
+            names = (field.name,) + tuple(field.aliases) if field.name is not None else tuple(field.aliases)
+            for name in names:
+                if name.isidentifier() and not hasattr(container_class, name):
+                    setattr(container_class, name, cls(name))
+                # end if
+            # end for
+        # end for
+    # end def install
+# end class BitFieldDescriptor
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
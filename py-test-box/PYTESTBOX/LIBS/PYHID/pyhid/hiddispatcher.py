@@ -27,112 +27,16 @@ from pyhid.hid.hidmouse import HidMouseNvidiaExtension
 from pyhid.hid.hidsystemcontrol import HidSystemControl
 from pyhid.hid.interfacedescriptors import DescriptorDispatcher
 from pyhid.hid.interfacedescriptors import ReportDescriptor
-from pyhid.hidpp.features.batteryunifiedlevelstatus import BatteryLevelStatusBroadcastEvent as BatteryEvent
-from pyhid.hidpp.features.batteryunifiedlevelstatus import GetBatteryCapabilityResponse as BatteryCapability
-from pyhid.hidpp.features.batteryunifiedlevelstatus import GetBatteryLevelStatusResponse as BatteryLevel
-from pyhid.hidpp.features.batteryunifiedlevelstatus import ShowBatteryStatusResponse as BatteryStatus
-from pyhid.hidpp.features.common.analogkeys import AnalogKeysModel
-from pyhid.hidpp.features.common.backlight import BacklightModel
-from pyhid.hidpp.features.common.batterylevelscalibration import BatteryLevelsCalibrationModel
-from pyhid.hidpp.features.common.bleproprepairing import BleProPrepairingModel
-from pyhid.hidpp.features.common.changehost import ChangeHostModel
-from pyhid.hidpp.features.common.configurabledeviceproperties import ConfigurableDevicePropertiesModel
-from pyhid.hidpp.features.common.configurableproperties import ConfigurablePropertiesModel
-from pyhid.hidpp.features.common.configurabledeviceregisters import ConfigurableDeviceRegistersModel
-from pyhid.hidpp.features.common.controllist import ControlListModel
-from pyhid.hidpp.features.common.devicefriendlyname import DeviceFriendlyNameModel
-from pyhid.hidpp.features.common.deviceinformation import DeviceInformationModel
-from pyhid.hidpp.features.common.devicetypeandname import DeviceTypeAndNameModel
-from pyhid.hidpp.features.common.dfu import DfuModel
-from pyhid.hidpp.features.common.dfucontrol import DfuControlModel
-from pyhid.hidpp.features.common.equaddjdebuginfo import ReadEquadDJDebugInfoResponse as ReadEquadDJDebugInfo
-from pyhid.hidpp.features.common.equaddjdebuginfo import WriteEquadDJDebugInfoResponse as WriteEquadDJDebugInfo
-from pyhid.hidpp.features.common.equadpairingenc import EquadPairingEncModel
-from pyhid.hidpp.features.common.forcepairing import ForcePairingModel
-from pyhid.hidpp.features.common.forcesensingbutton import ForceSensingButtonModel
-from pyhid.hidpp.features.common.fullkeycustomization import FullKeyCustomizationModel
-from pyhid.hidpp.features.common.gpioaccess import GpioAccessModel
-from pyhid.hidpp.features.common.hostsinfo import HostsInfoModel
-from pyhid.hidpp.features.common.i2cdirectaccess import I2CDirectAccessModel
-from pyhid.hidpp.features.common.keepalive import KeepAliveModel
-from pyhid.hidpp.features.common.ledtest import LEDTestModel
-from pyhid.hidpp.features.common.lightspeedprepairing import LightspeedPrepairingModel
-from pyhid.hidpp.features.common.managedeactivatablefeatures import ManageDeactivatableFeaturesModel
-from pyhid.hidpp.features.common.managedeactivatablefeaturesauth import ManageDeactivatableFeaturesAuthModel
-from pyhid.hidpp.features.common.manufacturingmode import ManufacturingModeModel
-from pyhid.hidpp.features.common.oobstate import OobStateModel
-from pyhid.hidpp.features.common.opticalswitches import OpticalSwitchesModel
-from pyhid.hidpp.features.common.passwordauthentication import PasswordAuthenticationModel
-from pyhid.hidpp.features.common.powermodes import PowerModesModel
-from pyhid.hidpp.features.common.propertyaccess import PropertyAccessModel
-from pyhid.hidpp.features.common.rftest import RFTestModel
-from pyhid.hidpp.features.common.rftestble import RFTestBLEModel
-from pyhid.hidpp.features.common.securedfucontrol import SecureDfuControlModel
-from pyhid.hidpp.features.common.specialkeysmsebuttons import SpecialKeysMSEButtonsModel
-from pyhid.hidpp.features.common.spidirectaccess import SPIDirectAccessModel
-from pyhid.hidpp.features.common.staticmonitormode import StaticMonitorModeModel
-from pyhid.hidpp.features.common.tdeaccesstonvm import TdeAccessToNvmModel
-from pyhid.hidpp.features.common.temperaturemeasurement import TemperatureMeasurementModel
-from pyhid.hidpp.features.common.unifiedbattery import UnifiedBatteryModel
-from pyhid.hidpp.features.common.uniqueidentifier32bytes import GetByte0To15Response as GetByte0To15
-from pyhid.hidpp.features.common.uniqueidentifier32bytes import GetByte16To31Response as GetByte16To31
-from pyhid.hidpp.features.common.uniqueidentifier32bytes import RegenIdResponse as RegenId
-from pyhid.hidpp.features.common.wirelessdevicestatus import WirelessDeviceStatusBroadcastEvent
-from pyhid.hidpp.features.configchange import GetConfigurationCookieResponse as ConfigCookie
-from pyhid.hidpp.features.configchange import SetConfigurationCompleteResponse as ConfigComplete
-from pyhid.hidpp.features.enablehidden import GetEnableHiddenFeaturesResponse as GetHidden
-from pyhid.hidpp.features.enablehidden import SetEnableHiddenFeaturesResponse as SetHidden
+from pyhid.hiddispatchermanifest import HIDPP_CORE_FEATURES
+from pyhid.hiddispatchermanifest import HIDPP_FEATURE_MANIFEST
+from pyhid.hiddispatchermanifest import VLP_CORE_FEATURES
+from pyhid.hiddispatchermanifest import VLP_FEATURE_MANIFEST
+from pyhid.hiddispatchermanifest import get_message_class_table
 from pyhid.hidpp.features.error import ErrorCodes
 from pyhid.hidpp.features.error import Hidpp1ErrorCodes
-from pyhid.hidpp.features.featureset import FeatureSetModel
-from pyhid.hidpp.features.gaming.axisresponsecurve import AxisResponseCurveModel
-from pyhid.hidpp.features.gaming.brakeforce import BrakeForceModel
-from pyhid.hidpp.features.gaming.brightnesscontrol import BrightnessControlModel
-from pyhid.hidpp.features.gaming.combinedpedals import CombinedPedalsModel
-from pyhid.hidpp.features.gaming.extendedadjustablereportrate import ExtendedAdjustableReportRateModel
-from pyhid.hidpp.features.gaming.gaminggkeys import GamingGKeysModel
-from pyhid.hidpp.features.gaming.logimodifiers import LogiModifiersModel
-from pyhid.hidpp.features.gaming.macrorecordkey import MacroRecordkeyModel
-from pyhid.hidpp.features.gaming.modestatus import ModeStatusModel
-from pyhid.hidpp.features.gaming.mousebuttonspy import MouseButtonSpyModel
-from pyhid.hidpp.features.gaming.onboardprofiles import OnboardProfilesModel
-from pyhid.hidpp.features.gaming.pedalstatus import PedalStatusModel
-from pyhid.hidpp.features.gaming.perkeylighting import PerKeyLightingModel
-from pyhid.hidpp.features.gaming.profilemanagement import ProfileManagementModel
-from pyhid.hidpp.features.gaming.reportrate import ReportRateModel
-from pyhid.hidpp.features.gaming.rgbeffects import RGBEffectsModel
-from pyhid.hidpp.features.hireswheel import HiResWheelModel
-from pyhid.hidpp.features.keyboard.disablecontrolsbycidx import DisableControlsByCIDXModel
-from pyhid.hidpp.features.keyboard.disablekeys import DisableKeysModel
-from pyhid.hidpp.features.keyboard.disablekeysbyusage import DisableKeysByUsageModel
-from pyhid.hidpp.features.keyboard.fninversionformultihostdevices import FnInversionForMultiHostDevicesModel
-from pyhid.hidpp.features.keyboard.keyboardinternationallayouts import KeyboardInternationalLayoutsModel
-from pyhid.hidpp.features.keyboard.lockkeystate import LockKeyStateModel
-from pyhid.hidpp.features.keyboard.multiplatform import MultiPlatformModel
-from pyhid.hidpp.features.keyboard.multiroller import MultiRollerModel
-from pyhid.hidpp.features.mouse.adjustabledpi import AdjustableDpiModel
-from pyhid.hidpp.features.mouse.analysismode import AnalysisModeModel
-from pyhid.hidpp.features.mouse.extendedadjustabledpi import ExtendedAdjustableDpiModel
-from pyhid.hidpp.features.mouse.mousewheelanalytics import MouseWheelAnalyticsModel
-from pyhid.hidpp.features.mouse.ratchetwheel import RatchetWheelModel
-from pyhid.hidpp.features.mouse.smartshift import GetRatchetControlModeResponse as GetRatchetControlMode
-from pyhid.hidpp.features.mouse.smartshift import SetRatchetControlModeResponse as SetRatchetControlMode
-from pyhid.hidpp.features.mouse.smartshifttunable import SmartShiftTunableModel
-from pyhid.hidpp.features.mouse.thumbwheel import ThumbwheelModel
-from pyhid.hidpp.features.peripheral.ads1231 import Ads1231Model
-from pyhid.hidpp.features.peripheral.mlx90393multisensor import MLX90393MultiSensorModel
-from pyhid.hidpp.features.peripheral.mlx903xx import MLX903xxModel
-from pyhid.hidpp.features.peripheral.pmw3816andpmw3826 import PMW3816andPMW3826Model
-from pyhid.hidpp.features.peripheral.testkeysdisplay import TestKeysDisplayModel
-from pyhid.hidpp.features.root import RootModel
-from pyhid.hidpp.features.touchpad.touchpadrawxy import TouchpadRawXYModel
-from pyhid.hidpp.features.verticalscrolling import GetRollerInfoResponse as GetRollerInfo
 from pyhid.hidpp.hidpp1.hidpp1data import Hidpp1Data
 from pyhid.hidpp.hidpp1.hidpp1model import Hidpp1Model
 from pyhid.hidpp.hidppmessage import HidppMessage
-from pyhid.vlp.features.common.contextualdisplay import ContextualDisplayModel
-from pyhid.vlp.features.important.vlpfeatureset import VLPFeatureSetModel
-from pyhid.vlp.features.important.vlproot import VLPRootModel
 from pyhid.vlp.vlpmessage import VlpMessage
 from pyhid.vlp.vlpmessage import VlpMessageRawPayload
 from pylibrary.tools.hexlist import HexList
@@ -202,8 +106,10 @@ class AbstractHIDMessageHandler(object):
 
 class HidMessageQueue(QueueWithFilter, AbstractHIDMessageHandler):
     """
-    Define queue that accepts and stores all HID messages
+    Define queue that accepts and stores all HID messages. The messages are indexed by class.
     """
+    MESSAGE_CLASS_INDEX = 'message_class'
+
     def __init__(self, accepted_messages=None, name=None, *args, **kwargs):
         """
         :param accepted_messages: Queue will only store messages of specified types, if no messages are specified,
@@ -219,6 +125,7 @@ class HidMessageQueue(QueueWithFilter, AbstractHIDMessageHandler):
         super().__init__(*args, **kwargs)
         self._accepted_messages = accepted_messages
         self.name = name
+        self.add_index(index_name=self.MESSAGE_CLASS_INDEX, key_method=type)
     # end def __init__
 
     def is_message_accepted(self, message):
@@ -249,6 +156,19 @@ class HidMessageQueue(QueueWithFilter, AbstractHIDMessageHandler):
         self._accepted_messages = accepted_messages
     # end def update_accepted_messages
 
+    def add_accepted_messages(self, accepted_messages):
+        """
+        Add message types to the list of accepted messages. A queue accepting all messages is left unchanged.
+
+        :param accepted_messages: Accepted messages types to add
+        :type accepted_messages: ``tuple``
+        """
+        if self._accepted_messages is not None:
+            self._accepted_messages = self._accepted_messages + tuple(
+                message_type for message_type in accepted_messages if message_type not in self._accepted_messages)
+        # end if
+    # end def add_accepted_messages
+
     def handle(self, message):
         # See ``AbstractHIDMessageHandler.handle``
         self.put(message, timeout=5)
@@ -307,6 +227,96 @@ class MessageType(object):
 # end class MessageType
 
 
+class MessageClassIndex(object):
+    """
+    Flat view of a message class table.
+
+    The keys of the tables are ``(feature id, versions, function index or indexes)``. They are expanded once into
+    ``(feature id, version, function index)`` keys so that the message class of a received message is found with a
+    single dictionary lookup.
+    """
+
+    def __init__(self, table):
+        """
+        :param table: Message class table to index
+        :type table: ``dict``
+
+        :raise ``KeyError``: If multiple entries of the table match the same feature characteristics
+        """
+        self.table = table
+        self._message_classes = {}
+        self.update(table)
+    # end def __init__
+
+    @staticmethod
+    def expand_key(key):
+        """
+        Expand a table key into the feature characteristics it matches.
+
+        :param key: Table key ``(feature id, versions, function index or indexes)``
+        :type key: ``tuple``
+
+        :return: The ``(feature id, version, function index)`` keys
+        :rtype: ``list[tuple[int, int, int]]``
+        """
+        feature_id, versions, function_indexes = key
+        versions = (versions,) if isinstance(versions, int) else versions
+        function_indexes = (function_indexes,) if isinstance(function_indexes, int) else function_indexes
+        return [(feature_id, version, function_index) for version in versions for function_index in function_indexes]
+    # end def expand_key
+
+    def update(self, table):
+        """
+        Add the entries of a message class table to the index.
+
+        :param table: Message class table
+        :type table: ``dict``
+
+        :raise ``KeyError``: If multiple entries match the same feature characteristics
+        """
+        matching_keys = {}
+        for key, message_class in table.items():
+            for flat_key in self.expand_key(key):
+                matching_keys.setdefault(flat_key, []).append(key)
+                self._message_classes[flat_key] = message_class
+            # end for
+        # end for
+
+        for (feature_id, feature_version, function_index), keys in matching_keys.items():
+            # An exact key takes precedence over the expanded ones
+            if len(keys) > 1 and (feature_id, feature_version, function_index) not in table:
+                raise KeyError(f"Too many matching entries in features table :\n"
+                               f"Feature ID = {feature_id}, feature version = {feature_version}, function index = "
+                               f"{function_index} is referenced {len(keys)} times")
+            # end if
+        # end for
+
+        for key, message_class in table.items():
+            if isinstance(key[1], int) and isinstance(key[2], int):
+                self._message_classes[key] = message_class
+            # end if
+        # end for
+    # end def update
+
+    def get_message_class(self, feature_id, feature_version, function_index):
+        """
+        Get message class matching feature id, feature version and function index
+
+        :param feature_id: Feature id
+        :type feature_id: ``int``
+        :param feature_version: Feature version
+        :type feature_version: ``int``
+        :param function_index: Function index
+        :type function_index: ``int``
+
+        :return: Matching message class
+        :rtype: ``HidppMessage`` or ``VlpMessage`` or ``None``
+        """
+        return self._message_classes.get((feature_id, feature_version, function_index))
+    # end def get_message_class
+# end class MessageClassIndex
+
+
 class HIDDispatcher(object):
     """
     Define dispatcher for HID messages coming from the device.
@@ -337,321 +347,36 @@ class HIDDispatcher(object):
         VLP_EVENT = "VLP Event Queue"
     # end class QueueName
 
+    # Receiver response table, built on first use as it is the same for all the dispatchers
+    _RECEIVER_RESPONSE_TABLE = None
+
+    # Message type of a HID report from the name of its application collection, by order of priority
+    HID_USAGE_NAME_MESSAGE_TYPES = (
+        ('mouse', MessageType.HID_MOUSE),
+        ('keyboard', MessageType.HID_KEYBOARD),
+        ('consumer_control', MessageType.HID_CONSUMER_CTRL),
+        ('system_control', MessageType.HID_SYS_CTRL),
+        ('call_state_management_control', MessageType.HID_CALL_STATE_MGT_CRTL),
+        ('touch_pad', MessageType.HID_DIGITIZER),
+    )
+
     def __init__(self):
+        # Message class tables, the features are added when registered (see ``load_feature``)
         self._feature_table = {
-            # --- Important --------------------------------------------------------------------------------------------
-            # 0x0000 IRoot
-            **RootModel.get_available_responses_map(),
-            # 0x0001 IFeatureSet
-            **FeatureSetModel.get_available_responses_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Common -----------------------------------------------------------------------------------------------
-            # 0x0003 Device Information
-            **DeviceInformationModel.get_available_responses_map(),
-            # 0x0005 Device Name and Type
-            **DeviceTypeAndNameModel.get_available_responses_map(),
-            # 0x0007 Device Friendly Name
-            **DeviceFriendlyNameModel.get_available_responses_map(),
-            # 0x0008 Keep Alive
-            **KeepAliveModel.get_available_responses_map(),
-            # 0x0011 Property Access
-            **PropertyAccessModel.get_available_responses_map(),
-            # 0x0020 Config Change
-            (ConfigCookie.FEATURE_ID, ConfigCookie.VERSION, ConfigCookie.FUNCTION_INDEX): ConfigCookie,
-            (ConfigComplete.FEATURE_ID, ConfigComplete.VERSION, ConfigComplete.FUNCTION_INDEX): ConfigComplete,
-            # 0x0021 32 Byte Unique (Random) Identifier
-            (GetByte0To15.FEATURE_ID, GetByte0To15.VERSION, GetByte0To15.FUNCTION_INDEX): GetByte0To15,
-            (GetByte16To31.FEATURE_ID, GetByte16To31.VERSION, GetByte16To31.FUNCTION_INDEX): GetByte16To31,
-            (RegenId.FEATURE_ID, RegenId.VERSION, RegenId.FUNCTION_INDEX): RegenId,
-            # 0x00C2 DFU Control
-            **DfuControlModel.get_available_responses_map(),
-            # 0x00C3 Secure DFU Control
-            **SecureDfuControlModel.get_available_responses_map(),
-            # 0x00D0 DFU
-            **DfuModel.get_available_responses_map(),
-            # 0x1000 Battery Unified Level Status
-            (BatteryLevel.FEATURE_ID, BatteryLevel.VERSION, BatteryLevel.FUNCTION_INDEX): BatteryLevel,
-            (BatteryCapability.FEATURE_ID, BatteryCapability.VERSION,
-             BatteryCapability.FUNCTION_INDEX): BatteryCapability,
-            (BatteryStatus.FEATURE_ID, BatteryStatus.VERSION, BatteryStatus.FUNCTION_INDEX): BatteryStatus,
-            # 0x1004 Unified Battery
-            **UnifiedBatteryModel.get_available_responses_map(),
-            # 0x1500 Force Pairing
-            **ForcePairingModel.get_available_responses_map(),
-            # 0x1602 Password Authentication
-            **PasswordAuthenticationModel.get_available_responses_map(),
-            # 0x1801 Manufacturing Mode
-            **ManufacturingModeModel.get_available_responses_map(),
-            # 0x1803 GPIO Access
-            **GpioAccessModel.get_available_responses_map(),
-            # 0x1805 OOB State
-            **OobStateModel.get_available_responses_map(),
-            # 0x1806 Configurable Device Properties
-            **ConfigurableDevicePropertiesModel.get_available_responses_map(),
-            # 0x1807 Configurable Properties
-            **ConfigurablePropertiesModel.get_available_responses_map(),
-            # 0x180B Configurable Device Registers
-            **ConfigurableDeviceRegistersModel.get_available_responses_map(),
-            # 0x1811 Equad Pairing Encryption
-            **EquadPairingEncModel.get_available_responses_map(),
-            # 0x1814 Change Host
-            **ChangeHostModel.get_available_responses_map(),
-            # 0x1815 Hosts Info
-            **HostsInfoModel.get_available_responses_map(),
-            # 0x1816 Ble Pro Pairing
-            **BleProPrepairingModel.get_available_responses_map(),
-            # 0x1817 Lightspeed Prepairing
-            **LightspeedPrepairingModel.get_available_responses_map(),
-            # 0x1830 Power Modes
-            **PowerModesModel.get_available_responses_map(),
-            # 0x1861 Battery Levels Calibration
-            **BatteryLevelsCalibrationModel.get_available_responses_map(),
-            # 0x1876 Optical Switches
-            **OpticalSwitchesModel.get_available_responses_map(),
-            # 0x1890 RF Test
-            **RFTestModel.get_available_responses_map(),
-            # 0x1891 RF Test BLE
-            **RFTestBLEModel.get_available_responses_map(),
-            # 0x18B0 Monitor Mode
-            **StaticMonitorModeModel.get_available_responses_map(),
-            # 0x18A1 LED Test
-            **LEDTestModel.get_available_responses_map(),
-            # 0x1982 Backlight
-            **BacklightModel.get_available_responses_map(),
-            # 0x19C0 Force Sensing Button
-            **ForceSensingButtonModel.get_available_responses_map(),
-            # 0x1B04 Keyboard Reprogrammable Keys and Mouse Buttons
-            **SpecialKeysMSEButtonsModel.get_available_responses_map(),
-            # 0x1B05 Full Key Customization
-            **FullKeyCustomizationModel.get_available_responses_map(),
-            # 0x1B08 Analog Keys
-            **AnalogKeysModel.get_available_responses_map(),
-            # 0x1B10 Control List
-            **ControlListModel.get_available_responses_map(),
-            # 0x1DF3 - EquadDJ Debug Info
-            (ReadEquadDJDebugInfo.FEATURE_ID, ReadEquadDJDebugInfo.VERSION, ReadEquadDJDebugInfo.FUNCTION_INDEX):
-                ReadEquadDJDebugInfo,
-            (WriteEquadDJDebugInfo.FEATURE_ID, WriteEquadDJDebugInfo.VERSION, WriteEquadDJDebugInfo.FUNCTION_INDEX):
-                WriteEquadDJDebugInfo,
-            # 0x1E00 Enable Hidden Features
-            (GetHidden.FEATURE_ID, GetHidden.VERSION, GetHidden.FUNCTION_INDEX): GetHidden,
-            (SetHidden.FEATURE_ID, SetHidden.VERSION, SetHidden.FUNCTION_INDEX): SetHidden,
-            # 0x1E01 Manage Deactivatable Features
-            **ManageDeactivatableFeaturesModel.get_available_responses_map(),
-            # 0x1E02 Manage Deactivatable Features
-            **ManageDeactivatableFeaturesAuthModel.get_available_responses_map(),
-            # 0x1E22 SPI Direct Access
-            **SPIDirectAccessModel.get_available_responses_map(),
-            # 0x1E30 I2C Direct Access
-            **I2CDirectAccessModel.get_available_responses_map(),
-            # 0x1EB0 TDE Access To Non-Volatile Memory
-            **TdeAccessToNvmModel.get_available_responses_map(),
-            # 0x1F30 Temperature Measurement
-            **TemperatureMeasurementModel.get_available_responses_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Mouse ------------------------------------------------------------------------------------------------
-            # 0x2100 Vertical Scrolling
-            (GetRollerInfo.FEATURE_ID, GetRollerInfo.VERSION, GetRollerInfo.FUNCTION_INDEX): GetRollerInfo,
-            # 0x2110 Smart Shift
-            (GetRatchetControlMode.FEATURE_ID, GetRatchetControlMode.VERSION, GetRatchetControlMode.FUNCTION_INDEX):
-                GetRatchetControlMode,
-            (SetRatchetControlMode.FEATURE_ID, SetRatchetControlMode.VERSION, SetRatchetControlMode.FUNCTION_INDEX):
-                SetRatchetControlMode,
-            # 0x2111 SmartShift 3G/EPM wheel with tunable torque
-            **SmartShiftTunableModel.get_available_responses_map(),
-            # 0x2121 HiRes Wheel
-            **HiResWheelModel.get_available_responses_map(),
-            # 0x2130 Ratchet Wheel
-            **RatchetWheelModel.get_available_responses_map(),
-            # 0x2150 Thumbwheel
-            **ThumbwheelModel.get_available_responses_map(),
-            # 0x2201 Adjustable DPI
-            **AdjustableDpiModel.get_available_responses_map(),
-            # 0x2202 Extended Adjustable DPI
-            **ExtendedAdjustableDpiModel.get_available_responses_map(),
-            # 0x2250 Analysis Mode
-            **AnalysisModeModel.get_available_responses_map(),
-            # 0x2251 Mouse Wheel Analytics
-            **MouseWheelAnalyticsModel.get_available_responses_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Keyboard ---------------------------------------------------------------------------------------------
-            # 0x40A3 Fn Inversion for Multi-Host Devices
-            **FnInversionForMultiHostDevicesModel.get_available_responses_map(),
-            # 0x4220 Lock Key State
-            **LockKeyStateModel.get_available_responses_map(),
-            # 0x4521 Disable Keys
-            **DisableKeysModel.get_available_responses_map(),
-            # 0x4522 Disable Keys By Usage
-            **DisableKeysByUsageModel.get_available_responses_map(),
-            # 0x4523 Disable Controls By CIDX
-            **DisableControlsByCIDXModel.get_available_responses_map(),
-            # 0x4531 Multi Platform
-            **MultiPlatformModel.get_available_responses_map(),
-            # 0x4540 Keyboard International Layouts
-            **KeyboardInternationalLayoutsModel.get_available_responses_map(),
-            # 0x4610 Multi Roller
-            **MultiRollerModel.get_available_responses_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Touchpad ---------------------------------------------------------------------------------------------
-            # 0x6100 Touchpad Raw XY
-            **TouchpadRawXYModel.get_available_responses_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Gaming -----------------------------------------------------------------------------------------------
-            # 0x8010 Gaming G Keys
-            **GamingGKeysModel.get_available_responses_map(),
-            # 0x8030 MacroRecord key
-            **MacroRecordkeyModel.get_available_responses_map(),
-            # 0x8040 Brightness Control
-            **BrightnessControlModel.get_available_responses_map(),
-            # 0x8051 Logi Modifiers
-            **LogiModifiersModel.get_available_responses_map(),
-            # 0x8060 Report Rate
-            **ReportRateModel.get_available_responses_map(),
-            # 0x8061 Extended Adjustable Report Rate
-            **ExtendedAdjustableReportRateModel.get_available_responses_map(),
-            # 0x8071 RGB Effects
-            **RGBEffectsModel.get_available_responses_map(),
-            # 0x8081 PerKey Lighting
-            **PerKeyLightingModel.get_available_responses_map(),
-            # 0x8090 Mode Status
-            **ModeStatusModel.get_available_responses_map(),
-            # 0x80A4 Axis Response Curve
-            **AxisResponseCurveModel.get_available_responses_map(),
-            # 0x80D0 Combined Pedals
-            **CombinedPedalsModel.get_available_responses_map(),
-            # 0x8100 Onboard Profiles
-            **OnboardProfilesModel.get_available_responses_map(),
-            # 0x8101 Profile Management
-            **ProfileManagementModel.get_available_responses_map(),
-            # 0x8110 Mouse Button Spy
-            **MouseButtonSpyModel.get_available_responses_map(),
-            # 0x8134 Brake Force
-            **BrakeForceModel.get_available_responses_map(),
-            # 0x8135 Pedal Status
-            **PedalStatusModel.get_available_responses_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Peripheral -------------------------------------------------------------------------------------------
-            # 0x9001 PMW3816 and PMW3826
-            **PMW3816andPMW3826Model.get_available_responses_map(),
-            # 0x9205 MLX903xx
-            **MLX903xxModel.get_available_responses_map(),
-            # 0x9209 MLX 90393 Multi Sensor
-            **MLX90393MultiSensorModel.get_available_responses_map(),
-            # 0x9215 Ads 1231
-            **Ads1231Model.get_available_responses_map(),
-            # 0x92E2 Test Keys Display
-            **TestKeysDisplayModel.get_available_responses_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
             # Error commands
             (Hidpp1ErrorCodes.FEATURE_ID, Hidpp1ErrorCodes.VERSION, Hidpp1ErrorCodes.FUNCTION_INDEX): Hidpp1ErrorCodes,
             (ErrorCodes.FEATURE_ID, ErrorCodes.VERSION, ErrorCodes.FUNCTION_INDEX): ErrorCodes,
         }
 
-        self._event_table = {
-            # --- Common -----------------------------------------------------------------------------------------------
-            # 0x0008 Keep Alive Feature
-            **KeepAliveModel.get_available_events_map(),
-            # 0x00C3 Secure DFU Control
-            **SecureDfuControlModel.get_available_events_map(),
-            # 0x00D0 DFU
-            **DfuModel.get_available_events_map(),
-            # 0x1000 Battery Unified Level Status
-            (BatteryEvent.FEATURE_ID, BatteryEvent.VERSION, BatteryEvent.FUNCTION_INDEX): BatteryEvent,
-            # 0x1004 Unified Battery
-            **UnifiedBatteryModel.get_available_events_map(),
-            # 0x1500 Force Pairing
-            **ForcePairingModel.get_available_events_map(),
-            # 0x18B0 Monitor Mode
-            **StaticMonitorModeModel.get_available_events_map(),
-            # 0x1982 Backlight
-            **BacklightModel.get_available_events_map(),
-            # 0x1B04 Keyboard Reprogrammable Keys and Mouse Buttons
-            **SpecialKeysMSEButtonsModel.get_available_events_map(),
-            # 0x1B05 Full Key Customization
-            **FullKeyCustomizationModel.get_available_events_map(),
-            # 0x1B08 Analog Keys
-            **AnalogKeysModel.get_available_events_map(),
-            # 0x1D4B Wireless Device Status
-            (WirelessDeviceStatusBroadcastEvent.FEATURE_ID, WirelessDeviceStatusBroadcastEvent.VERSION,
-             WirelessDeviceStatusBroadcastEvent.FUNCTION_INDEX): WirelessDeviceStatusBroadcastEvent,
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Mouse ------------------------------------------------------------------------------------------------
-            # 0x2121 HiRes Wheel
-            **HiResWheelModel.get_available_events_map(),
-            # 0x2130 Ratchet Wheel
-            **RatchetWheelModel.get_available_events_map(),
-            # 0x2150 Thumbwheel
-            **ThumbwheelModel.get_available_events_map(),
-            # 0x2202 Extended Adjustable DPI
-            **ExtendedAdjustableDpiModel.get_available_events_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Keyboard ---------------------------------------------------------------------------------------------
-            # 0x40A3 Fn Inversion for Multi-Host Devices
-            **FnInversionForMultiHostDevicesModel.get_available_events_map(),
-            # 0x4220 Lock Key State
-            **LockKeyStateModel.get_available_events_map(),
-            # 0x4523 Disable Controls By CIDX
-            **DisableControlsByCIDXModel.get_available_events_map(),
-            # 0x4531 Multi Platform
-            **MultiPlatformModel.get_available_events_map(),
-            # 0x4610 Multi Roller
-            **MultiRollerModel.get_available_events_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Touchpad ---------------------------------------------------------------------------------------------
-            # 0x6100 Touchpad Raw XY
-            **TouchpadRawXYModel.get_available_events_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Gaming -----------------------------------------------------------------------------------------------
-            # 0x8030 MacroRecord key
-            **MacroRecordkeyModel.get_available_events_map(),
-            # 0x8040 Brightness Control
-            **BrightnessControlModel.get_available_events_map(),
-            # 0x8051 Logi Modifiers
-            **LogiModifiersModel.get_available_events_map(),
-            # 0x8061 Extended Adjustable Report Rate
-            **ExtendedAdjustableReportRateModel.get_available_events_map(),
-            # 0x8071 RGB Effects
-            **RGBEffectsModel.get_available_events_map(),
-            # 0x8090 Mode Status
-            **ModeStatusModel.get_available_events_map(),
-            # 0x80A4 Axis Respone Curve
-            **AxisResponseCurveModel.get_available_events_map(),
-            # 0x80D0 Combined Pedals
-            **CombinedPedalsModel.get_available_events_map(),
-            # 0x8100 Onboard Profiles
-            **OnboardProfilesModel.get_available_events_map(),
-            # 0x8101 Profile Management
-            **ProfileManagementModel.get_available_events_map(),
-            # 0x8134 Brake Force
-            **BrakeForceModel.get_available_events_map(),
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Peripheral -------------------------------------------------------------------------------------------
-            # 0x9001 PMW3816 and PMW3826
-            **PMW3816andPMW3826Model.get_available_events_map(),
-            # 0x9205 MLX903xx
-            **MLX903xxModel.get_available_events_map(),
-            # 0x9209 MLX 90393 Multi Sensor
-            **MLX90393MultiSensorModel.get_available_events_map(),
-            # 0x9215 Ads 1231
-            **Ads1231Model.get_available_events_map(),
-            # 0x92E2 Test Keys Display
-            **TestKeysDisplayModel.get_available_events_map(),
-            # ----------------------------------------------------------------------------------------------------------
-        }
+        self._event_table = {}
+
+        # Ids of the features whose messages are in the tables
+        self._loaded_features = set()
 
-        self._receiver_response_table = Hidpp1Model.get_available_responses_map()
+        if HIDDispatcher._RECEIVER_RESPONSE_TABLE is None:
+            HIDDispatcher._RECEIVER_RESPONSE_TABLE = Hidpp1Model.get_available_responses_map()
+        # end if
+        self._receiver_response_table = dict(HIDDispatcher._RECEIVER_RESPONSE_TABLE)
 
         self._receiver_event_table = Hidpp1Model.get_available_events_map()
 
@@ -665,23 +390,13 @@ class HIDDispatcher(object):
         # VLP Section
         # --------------------------------------------------------------------------------------------------------------
         self._vlp_features_table = {
-            # 0x0102 VLP Root
-            **VLPRootModel.get_available_responses_map(),
-
-            # 0x0103 VLP Feature Set
-            **VLPFeatureSetModel.get_available_responses_map(),
-
-            # 0x19A1 Contextual Display
-            **ContextualDisplayModel.get_available_responses_map(),
-
             # Error commands
             (ErrorCodes.FEATURE_ID, ErrorCodes.VERSION, ErrorCodes.FUNCTION_INDEX): ErrorCodes,
         }
 
-        self._vlp_event_table = {
-            # 0x19A1 Contextual Display
-            **ContextualDisplayModel.get_available_events_map(),
-        }
+        self._vlp_event_table = {}
+
+        self._loaded_vlp_features = set()
 
         self._vlp_feature_index_to_id = {
             ErrorCodes.ERROR_TAG: (ErrorCodes.FEATURE_ID, ErrorCodes.VERSION[0]),
@@ -740,330 +455,36 @@ class HIDDispatcher(object):
     def init_feature_message_queues(self):
         """
         Update queues to store messages by feature.
+
+        The feature queues only accept the messages of the loaded features, the messages of a feature are added when
+        it is loaded (see ``load_feature`` and ``load_vlp_feature``).
+
+        :raise ``KeyError``: If multiple entries of a message class table match the same feature characteristics
         """
-        # HID++ Important messages
-        accepted_messages = (
-            # 0x0000 IRoot
-            RootModel.get_available_responses_classes() +
-            # 0x0001 IFeatureSet
-            FeatureSetModel.get_available_responses_classes()
-        )
-        self.important_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
-        self.queue_list.append(self.important_message_queue)
-
-        # HID++ Common messages
-        accepted_messages = (
-            # 0x0003 Device Information
-            DeviceInformationModel.get_available_responses_classes() +
-            # 0x0005 Device Name and Type
-            DeviceTypeAndNameModel.get_available_responses_classes() +
-            # 0x0007 Device Friendly Name
-            DeviceFriendlyNameModel.get_available_responses_classes() +
-            # 0x0008 Keep Alive
-            KeepAliveModel.get_available_responses_classes() +
-            # 0x0011 Property Access
-            PropertyAccessModel.get_available_responses_classes() +
-            # 0x0020 Config Change
-            (ConfigCookie, ConfigComplete,) +
-            # 0x0021 32 Byte Unique (Random) Identifier
-            (GetByte0To15, GetByte16To31, RegenId,) +
-            # 0x00C2 DFU Control
-            DfuControlModel.get_available_responses_classes() +
-            # 0x00C3 Secure DFU Control
-            SecureDfuControlModel.get_available_responses_classes() +
-            # 0x00D0 DFU
-            DfuModel.get_available_responses_classes() +
-            # 0x1000 Battery Unified Level Status
-            (BatteryLevel, BatteryCapability, BatteryStatus,) +
-            # 0x1004 Unified Battery
-            UnifiedBatteryModel.get_available_responses_classes() +
-            # 0x1500 Force Pairing
-            ForcePairingModel.get_available_responses_classes() +
-            # 0x1602 Password Authentication
-            PasswordAuthenticationModel.get_available_responses_classes() +
-            # 0x1801 Manufacturing Mode
-            ManufacturingModeModel.get_available_responses_classes() +
-            # 0x1803 GPIO Access
-            GpioAccessModel.get_available_responses_classes() +
-            # 0x1805 OOB State
-            OobStateModel.get_available_responses_classes() +
-            # 0x1806 Configurable Device Properties
-            ConfigurableDevicePropertiesModel.get_available_responses_classes() +
-            # 0x1807 Configurable Properties
-            ConfigurablePropertiesModel.get_available_responses_classes() +
-            # 0x180B Configurable Device Registers
-            ConfigurableDeviceRegistersModel.get_available_responses_classes() +
-            # 0x1811 Equad Pairing Encryption
-            EquadPairingEncModel.get_available_responses_classes() +
-            # 0x1814 Change Host
-            ChangeHostModel.get_available_responses_classes() +
-            # 0x1815 Hosts Info
-            HostsInfoModel.get_available_responses_classes() +
-            # 0x1816 Ble Pro Pairing
-            BleProPrepairingModel.get_available_responses_classes() +
-            # 0x1817 Lightspeed Prepairing
-            LightspeedPrepairingModel.get_available_responses_classes() +
-            # 0x1830 Power Modes
-            PowerModesModel.get_available_responses_classes() +
-            # 0x1861 Battery Levels Calibration
-            BatteryLevelsCalibrationModel.get_available_responses_classes() +
-            # 0x1876 Optical Switches
-            OpticalSwitchesModel.get_available_responses_classes() +
-            # 0x1890 RF Test
-            RFTestModel.get_available_responses_classes() +
-            # 0x1891 RF Test BLE
-            RFTestBLEModel.get_available_responses_classes() +
-            # 0x18B0 Monitor Mode
-            StaticMonitorModeModel.get_available_responses_classes() +
-            # 0x18A1 LED Test
-            LEDTestModel.get_available_responses_classes() +
-            # 0x1982 Backlight
-            BacklightModel.get_available_responses_classes() +
-            # 0x19C0 Force Sensing Button
-            ForceSensingButtonModel.get_available_responses_classes() +
-            # 0x1B04 Keyboard Reprogrammable Keys and Mouse Buttons
-            SpecialKeysMSEButtonsModel.get_available_responses_classes() +
-            # 0x1B05 Full Key Customization
-            FullKeyCustomizationModel.get_available_responses_classes() +
-            # 0x1B08 Analog Keys
-            AnalogKeysModel.get_available_responses_classes() +
-            # 0x1B10 Control List
-            ControlListModel.get_available_responses_classes() +
-            # 0x1DF3 - EquadDJ Debug Info
-            (ReadEquadDJDebugInfo, WriteEquadDJDebugInfo,) +
-            # 0x1E00 Enable Hidden Features
-            (GetHidden, SetHidden,) +
-            # 0x1E01 Manage Deactivatable Features
-            ManageDeactivatableFeaturesModel.get_available_responses_classes() +
-            # 0x1E02 Manage Deactivatable Features
-            ManageDeactivatableFeaturesAuthModel.get_available_responses_classes() +
-            # 0x1E22 SPI Direct Access
-            SPIDirectAccessModel.get_available_responses_classes() +
-            # 0x1E30 I2C Direct Access
-            I2CDirectAccessModel.get_available_responses_classes() +
-            # 0x1EB0 TDE Access To Non-Volatile Memory
-            TdeAccessToNvmModel.get_available_responses_classes() +
-            # 0x1F30 Temperature Measurement
-            TemperatureMeasurementModel.get_available_responses_classes()
-        )
-        self.common_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
-        self.queue_list.append(self.common_message_queue)
-
-        # HID++ Mouse messages
-        accepted_messages = (
-            # 0x2100 Vertical Scrolling
-            (GetRollerInfo,) +
-            # 0x2110 Smart Shift
-            (GetRatchetControlMode, SetRatchetControlMode,) +
-            # 0x2111 SmartShift 3G/EPM wheel with tunable torque
-            SmartShiftTunableModel.get_available_responses_classes() +
-            # 0x2121 HiRes Wheel
-            HiResWheelModel.get_available_responses_classes() +
-            # 0x2130 Ratchet Wheel
-            RatchetWheelModel.get_available_responses_classes() +
-            # 0x2150 Thumbwheel
-            ThumbwheelModel.get_available_responses_classes() +
-            # 0x2201 Adjustable DPI
-            AdjustableDpiModel.get_available_responses_classes() +
-            # 0x2202 Extended Adjustable DPI
-            ExtendedAdjustableDpiModel.get_available_responses_classes() +
-            # 0x2250 Analysis Mode
-            AnalysisModeModel.get_available_responses_classes() +
-            # 0x2251 Mouse Wheel Analytics
-            MouseWheelAnalyticsModel.get_available_responses_classes()
-        )
-        self.mouse_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
-        self.queue_list.append(self.mouse_message_queue)
-
-        # HID++ Keyboard messages
-        accepted_messages = (
-            # 0x40A3 Fn Inversion for Multi-Host Devices
-            FnInversionForMultiHostDevicesModel.get_available_responses_classes() +
-            # 0x4220 Lock Key State
-            LockKeyStateModel.get_available_responses_classes() +
-            # 0x4521 Disable Keys
-            DisableKeysModel.get_available_responses_classes() +
-            # 0x4522 Disable Keys By Usage
-            DisableKeysByUsageModel.get_available_responses_classes() +
-            # 0x4523 Disable Controls By CIDX
-            DisableControlsByCIDXModel.get_available_responses_classes() +
-            # 0x4531 Multi Platform
-            MultiPlatformModel.get_available_responses_classes() +
-            # 0x4540 Keyboard International Layouts
-            KeyboardInternationalLayoutsModel.get_available_responses_classes() +
-            # 0x4610 Multi Roller
-            MultiRollerModel.get_available_responses_classes()
-        )
-        self.keyboard_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
-        self.queue_list.append(self.keyboard_message_queue)
-
-        # HID++ Touchpad messages
-        accepted_messages = (
-            # 0x6100 Touchpad Raw XY
-            TouchpadRawXYModel.get_available_responses_classes()
-        )
-        self.touchpad_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
-        self.queue_list.append(self.touchpad_message_queue)
-
-        # HID++ Gaming messages
-        accepted_messages = (
-            # 0x8010 Gaming G Keys
-            GamingGKeysModel.get_available_responses_classes() +
-            # 0x8030 MacroRecord key
-            MacroRecordkeyModel.get_available_responses_classes() +
-            # 0x8040 Brightness Control
-            BrightnessControlModel.get_available_responses_classes() +
-            # 0x8051 Logi Modifiers
-            LogiModifiersModel.get_available_responses_classes() +
-            # 0x8060 Report Rate
-            ReportRateModel.get_available_responses_classes() +
-            # 0x8061 Extended Adjustable Report Rate
-            ExtendedAdjustableReportRateModel.get_available_responses_classes() +
-            # 0x8071 RGB Effects
-            RGBEffectsModel.get_available_responses_classes() +
-            # 0x8081 PerKey Lighting
-            PerKeyLightingModel.get_available_responses_classes() +
-            # 0x8090 Mode Status
-            ModeStatusModel.get_available_responses_classes() +
-            # 0x80A4 Axis Response Curve
-            AxisResponseCurveModel.get_available_responses_classes() +
-            # 0x80D0 Combined Pedals
-            CombinedPedalsModel.get_available_responses_classes() +
-            # 0x8100 Onboard Profiles
-            OnboardProfilesModel.get_available_responses_classes() +
-            # 0x8101 Profile Management
-            ProfileManagementModel.get_available_responses_classes() +
-            # 0x8110 Mouse Button Spy
-            MouseButtonSpyModel.get_available_responses_classes() +
-            # 0x8134 Brake Force
-            BrakeForceModel.get_available_responses_classes() +
-            # 0x8135 Pedal Status
-            PedalStatusModel.get_available_responses_classes()
-        )
-        self.gaming_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
-        self.queue_list.append(self.gaming_message_queue)
-
-        # HID++ Peripheral messages
-        accepted_messages = (
-            # 0x9001 PMW3816 and PMW3826
-            PMW3816andPMW3826Model.get_available_responses_classes() +
-            # 0x9205 MLX903xx
-            MLX903xxModel.get_available_responses_classes() +
-            # 0x9209 MLX 90393 Multi Sensor
-            MLX90393MultiSensorModel.get_available_responses_classes() +
-            # 0x9215 Ads 1231
-            Ads1231Model.get_available_responses_classes() +
-            # 0x92E2 Test Keys Display
-            TestKeysDisplayModel.get_available_responses_classes()
-        )
-        self.peripheral_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
-        self.queue_list.append(self.peripheral_message_queue)
+        # Message class lookup tables used on reception
+        self._feature_message_classes = MessageClassIndex(self._feature_table)
+        self._event_message_classes = MessageClassIndex(self._event_table)
+        self._vlp_feature_message_classes = MessageClassIndex(self._vlp_features_table)
+        self._vlp_event_message_classes = MessageClassIndex(self._vlp_event_table)
+
+        # HID++ Important, Common, Mouse, Keyboard, Touchpad, Gaming and Peripheral messages
+        for feature_queue in (self.important_message_queue, self.common_message_queue, self.mouse_message_queue,
+                              self.keyboard_message_queue, self.touchpad_message_queue, self.gaming_message_queue,
+                              self.peripheral_message_queue):
+            feature_queue.update_accepted_messages(accepted_messages=())
+            self.queue_list.append(feature_queue)
+        # end for
 
         # Interface configuration descriptor messages
         self.interface_descriptor_queue.update_accepted_messages(accepted_messages=(ReportDescriptor,))
         self.queue_list.append(self.interface_descriptor_queue)
 
         # HID++ Event messages
-        accepted_messages = (
-            # --- Common -----------------------------------------------------------------------------------------------
-            # 0x0008 Keep Alive
-            KeepAliveModel.get_available_events_classes() +
-            # 0x00C2 DFU Control
-            DfuModel.get_available_events_classes() +
-            # 0x00C3 Secure DFU Control
-            SecureDfuControlModel.get_available_events_classes() +
-            # 0x1500 Force Pairing
-            ForcePairingModel.get_available_events_classes() +
-            # 0x18B0 Monitor Mode
-            StaticMonitorModeModel.get_available_events_classes() +
-            # 0x1982 Backlight
-            BacklightModel.get_available_events_classes() +
-            # 0x1B04 Keyboard Reprogrammable Keys and Mouse Buttons
-            SpecialKeysMSEButtonsModel.get_available_events_classes() +
-            # 0x1B05 Full Key Customization
-            FullKeyCustomizationModel.get_available_events_classes() +
-            # 0x1B08 Analog Keys
-            AnalogKeysModel.get_available_events_classes() +
-            # 0x1D4B Wireless Device Status
-            (WirelessDeviceStatusBroadcastEvent,) +
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Mouse ------------------------------------------------------------------------------------------------
-            # 0x2121 HiRes Wheel
-            HiResWheelModel.get_available_events_classes() +
-            # 0x2130 Ratchet Wheel
-            RatchetWheelModel.get_available_events_classes() +
-            # 0x2150 Thumbwheel
-            ThumbwheelModel.get_available_events_classes() +
-            # 0x2202 Extended Adjustable DPI
-            ExtendedAdjustableDpiModel.get_available_events_classes() +
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Keyboard ---------------------------------------------------------------------------------------------
-            # 0x40A3 Fn Inversion for Multi-Host Devices
-            FnInversionForMultiHostDevicesModel.get_available_events_classes() +
-            # 0x4220 Lock Key State
-            LockKeyStateModel.get_available_events_classes() +
-            # 0x4523 Disable Controls By CIDX
-            DisableControlsByCIDXModel.get_available_events_classes() +
-            # 0x4531 Multi Platform
-            MultiPlatformModel.get_available_events_classes() +
-            # 0x4610 Multi Roller
-            MultiRollerModel.get_available_events_classes() +
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Touchpad ---------------------------------------------------------------------------------------------
-            # 0x6100 Touchpad Raw XY
-            TouchpadRawXYModel.get_available_events_classes() +
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Gaming -----------------------------------------------------------------------------------------------
-            # 0x8030 MacroRecord key
-            MacroRecordkeyModel.get_available_events_classes() +
-            # 0x8040 Brightness Control
-            BrightnessControlModel.get_available_events_classes() +
-            # 0x8051 Logi Modifiers
-            LogiModifiersModel.get_available_events_classes() +
-            # 0x8061 Extended Adjustable Report Rate
-            ExtendedAdjustableReportRateModel.get_available_events_classes() +
-            # 0x8071 RGB Effects
-            RGBEffectsModel.get_available_events_classes() +
-            # 0x8090 Mode Status
-            ModeStatusModel.get_available_events_classes() +
-            # 0x80D0 Combined Pedals
-            CombinedPedalsModel.get_available_events_classes() +
-            # 0x80A4 Axis Response Curve
-            AxisResponseCurveModel.get_available_events_classes() +
-            # 0x8100 Onboard Profiles
-            OnboardProfilesModel.get_available_events_classes() +
-            # 0x8101 Profile Management
-            ProfileManagementModel.get_available_events_classes() +
-            # 0x8134 Brake Force
-            BrakeForceModel.get_available_events_classes() +
-            # ----------------------------------------------------------------------------------------------------------
-
-            # --- Peripheral -------------------------------------------------------------------------------------------
-            # 0x9001 PMW3816 and PMW3826
-            PMW3816andPMW3826Model.get_available_events_classes() +
-            # 0x9205 MLX903xx
-            MLX903xxModel.get_available_events_classes() +
-            # 0x9215 Ads 1231
-            Ads1231Model.get_available_events_classes() +
-            # 0x92E2 Test Keys Display
-            TestKeysDisplayModel.get_available_events_classes()
-            # ----------------------------------------------------------------------------------------------------------
-        )
-        self.event_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
+        self.event_message_queue.update_accepted_messages(accepted_messages=())
         self.queue_list.append(self.event_message_queue)
 
         # HID++ Battery Event messages
-        accepted_messages = (
-            # 0x1000 Battery Unified Level Status
-            (BatteryEvent,) +
-            # 0x1004 Unified Battery
-            UnifiedBatteryModel.get_available_events_classes()
-        )
-        self.battery_event_message_queue.update_accepted_messages(accepted_messages=accepted_messages)
+        self.battery_event_message_queue.update_accepted_messages(accepted_messages=())
         self.queue_list.append(self.battery_event_message_queue)
 
         # HID++ Error messages
@@ -1098,35 +519,127 @@ class HIDDispatcher(object):
         # --------------------------------------------------------------------------------------------------------------
         # VLP Queues Section
         # --------------------------------------------------------------------------------------------------------------
-        accepted_messages = (
-            # 0x0102 VLP Root
-            VLPRootModel.get_available_responses_classes(),
-            # 0x0103 VLP Feature Set
-            VLPFeatureSetModel.get_available_responses_classes(),
-        )
-        self.vlp_important_message_queue.update_accepted_messages(accepted_messages)
-
-        accepted_messages = (
-            # 0x19A1 Contextual Display
-            ContextualDisplayModel.get_available_responses_classes()
-        )
-        self.vlp_common_message_queue.update_accepted_messages(accepted_messages)
-
-        accepted_messages = (
-            # 0x19A1 Contextual Display
-            ContextualDisplayModel.get_available_events_classes()
-        )
-        self.vlp_event_message_queue.update_accepted_messages(accepted_messages)
-
-        self.queue_list.append(self.vlp_important_message_queue)
-        self.queue_list.append(self.vlp_common_message_queue)
-        self.queue_list.append(self.vlp_event_message_queue)
+        for feature_queue in (self.vlp_important_message_queue, self.vlp_common_message_queue,
+                              self.vlp_event_message_queue):
+            feature_queue.update_accepted_messages(accepted_messages=())
+            self.queue_list.append(feature_queue)
+        # end for
 
         for my_queue in self.queue_list:
             self.add_handler(my_queue)
         # end for
+
+        # Messages of the features already loaded
+        for feature_id in self._loaded_features:
+            self._add_feature_queues_entry(HIDPP_FEATURE_MANIFEST[feature_id])
+        # end for
+        for feature_id in self._loaded_vlp_features:
+            self._add_feature_queues_entry(VLP_FEATURE_MANIFEST[feature_id])
+        # end for
+
+        # Features always present
+        for feature_id in HIDPP_CORE_FEATURES:
+            self.load_feature(feature_id)
+        # end for
+        for feature_id in VLP_CORE_FEATURES:
+            self.load_vlp_feature(feature_id)
+        # end for
     # end def init_feature_message_queues
 
+    @synchronized(SYNCHRONIZATION_LOCK)
+    def load_feature(self, feature_id):
+        """
+        Add the messages of a HID++ feature to the message class tables and to the queues. The feature module is
+        imported on first use, see ``HIDPP_FEATURE_MANIFEST``.
+
+        :param feature_id: Feature id
+        :type feature_id: ``int``
+
+        :return: Flag indicating if the feature is known by the dispatcher
+        :rtype: ``bool``
+        """
+        if feature_id in self._loaded_features:
+            return True
+        # end if
+
+        entry = HIDPP_FEATURE_MANIFEST.get(feature_id)
+        if entry is None:
+            return False
+        # end if
+
+        responses, events = entry.load()
+        responses_map = get_message_class_table(responses)
+        events_map = get_message_class_table(events)
+        self._feature_table.update(responses_map)
+        self._feature_message_classes.update(responses_map)
+        self._event_table.update(events_map)
+        self._event_message_classes.update(events_map)
+        self._add_feature_queues_entry(entry)
+        self._loaded_features.add(feature_id)
+        return True
+    # end def load_feature
+
+    @synchronized(SYNCHRONIZATION_LOCK)
+    def load_vlp_feature(self, feature_id):
+        """
+        Add the messages of a VLP feature to the message class tables and to the queues. The feature module is
+        imported on first use, see ``VLP_FEATURE_MANIFEST``.
+
+        :param feature_id: Feature id
+        :type feature_id: ``int``
+
+        :return: Flag indicating if the feature is known by the dispatcher
+        :rtype: ``bool``
+        """
+        if feature_id in self._loaded_vlp_features:
+            return True
+        # end if
+
+        entry = VLP_FEATURE_MANIFEST.get(feature_id)
+        if entry is None:
+            return False
+        # end if
+
+        responses, events = entry.load()
+        responses_map = get_message_class_table(responses)
+        events_map = get_message_class_table(events)
+        self._vlp_features_table.update(responses_map)
+        self._vlp_feature_message_classes.update(responses_map)
+        self._vlp_event_table.update(events_map)
+        self._vlp_event_message_classes.update(events_map)
+        self._add_feature_queues_entry(entry)
+        self._loaded_vlp_features.add(feature_id)
+        return True
+    # end def load_vlp_feature
+
+    def load_all_features(self):
+        """
+        Load all the features of the manifests, as if they were all registered.
+        """
+        for feature_id in HIDPP_FEATURE_MANIFEST:
+            self.load_feature(feature_id)
+        # end for
+        for feature_id in VLP_FEATURE_MANIFEST:
+            self.load_vlp_feature(feature_id)
+        # end for
+    # end def load_all_features
+
+    def _add_feature_queues_entry(self, entry):
+        """
+        Add the messages of a feature to the queues given by its manifest entry.
+
+        :param entry: Manifest entry of the feature
+        :type entry: ``FeatureManifestEntry``
+        """
+        responses, events = entry.load()
+        if entry.response_queue is not None:
+            getattr(self, entry.response_queue).add_accepted_messages(accepted_messages=responses)
+        # end if
+        if entry.event_queue is not None:
+            getattr(self, entry.event_queue).add_accepted_messages(accepted_messages=events)
+        # end if
+    # end def _add_feature_queues_entry
+
     def clear_feature_entries(self, table=None):
         """
         Clear all entries into the mapping
@@ -1145,7 +658,7 @@ class HIDDispatcher(object):
 
     def add_feature_entry(self, feature_index, feature_id, feature_version, table=None):
         """
-        Add an entry into the mapping
+        Add an entry into the mapping, loading the messages of the feature if needed
 
         :param feature_index: Feature Index
         :type feature_index: ``int``
@@ -1158,6 +671,7 @@ class HIDDispatcher(object):
         """
         table = self._feature_index_to_id if table is None else table
         value = (int(Numeral(feature_id)), int(Numeral(feature_version)))
+        self.load_feature(value[0])
         # Delete entry in table if value already in dict to keep uniqueness
         # If a value is already in the dict then 2 feature index can be associated to a feature id.
         # This can happen if the firmware of a device changes (e.g. after a DFU) and the features changes.
@@ -1170,7 +684,7 @@ class HIDDispatcher(object):
 
     def add_vlp_feature_entry(self, feature_index, feature_id, feature_version, table=None):
         """
-        Add an entry into the VLP feature mapping
+        Add an entry into the VLP feature mapping, loading the messages of the feature if needed
 
         :param feature_index: Feature Index
         :type feature_index: ``int``
@@ -1183,6 +697,7 @@ class HIDDispatcher(object):
         """
         table = self._vlp_feature_index_to_id if table is None else table
         value = (int(Numeral(feature_id)), int(Numeral(feature_version)))
+        self.load_vlp_feature(value[0])
         # Delete entry in table if value already in dict to keep uniqueness
         # If a value is already in the dict then 2 feature index can be associated to a feature id.
         # This can happen if the firmware of a device changes (e.g. after a DFU) and the features changes.
@@ -1335,13 +850,15 @@ class HIDDispatcher(object):
         :return: The queue where the message has been put in or None if the given message could not be treated
         :rtype: ``HidMessageQueue`` or ``None``
         """
-        if len(transport_message.data) == 0:
+        # The header is read in the raw data, the HexList is not built
+        data = transport_message.raw_data
+        report_len = len(data)
+        if report_len == 0:
             return None
         # end if
 
         # Get potential reportId from usb message
-        report_id = transport_message.data[0]
-        report_len = len(transport_message.data)
+        report_id = data[0]
 
         # Check message type
         if report_id in HidppMessage.HIDPP_REPORT_ID_LIST and report_len in HidppMessage.HIDPP_REPORT_LEN_LIST:
@@ -1375,7 +892,7 @@ class HIDDispatcher(object):
         """
         message = None
 
-        data = transport_message.data
+        data = transport_message.raw_data
         if len(data) > Hidpp1Data.Offset.SUB_ID:
             sub_id = data[Hidpp1Data.Offset.SUB_ID]
             message_class = None
@@ -1406,7 +923,7 @@ class HIDDispatcher(object):
         Get feature index, function index and software id from message data
 
         :param data: Transport message data
-        :type data: ``HexList``
+        :type data: ``HexList`` or ``bytes`` or ``bytearray`` or ``memoryview``
 
         :return: Feature index, function index and software id
         :rtype: ``tuple``
@@ -1439,23 +956,11 @@ class HIDDispatcher(object):
         :rtype: ``HidMessage`` or ``None``
         """
         message = None
-        for (table_id, table_versions, table_index) in self._event_table.keys():
-            # Try every possible version supported by the framework
-            for ver in table_versions:
-                # If one version is a perfect match, keep that one
-                if (table_id, ver, table_index) == index:
-                    message = self._event_table[(table_id, table_versions, table_index)].fromHexList(
-                        transport_message.data, timestamp=transport_message.timestamp)
-                    transport_message.message_class = self._event_table[
-                        (table_id, table_versions, table_index)]
-                    break
-                # end if
-            # end for
-            if message is not None:
-                # Entry found in the table, exit the loop
-                break
-            # end if
-        # end for
+        message_class = self._event_message_classes.get_message_class(*index)
+        if message_class is not None:
+            message = message_class.fromHexList(transport_message.raw_data, timestamp=transport_message.timestamp)
+            transport_message.message_class = message_class
+        # end if
         return message
     # end def get_hidpp2_message_from_event
 
@@ -1471,7 +976,7 @@ class HIDDispatcher(object):
         """
         message = None
         message_class = None
-        data = transport_message.data
+        data = transport_message.raw_data
 
         if len(data) > HidppMessage.OFFSET.SOFTWARE_ID:
             feature_index, function_index, software_id = self.parse_hidpp2_header(data)
@@ -1479,13 +984,13 @@ class HIDDispatcher(object):
             if feature_index in self._feature_index_to_id:
                 feature_id, feature_version = self._feature_index_to_id[feature_index]
                 if software_id == 0:
-                    message_class = self.get_message_class(
-                        self._event_table, feature_id, feature_version, function_index)
+                    message_class = self._event_message_classes.get_message_class(
+                        feature_id, feature_version, function_index)
                 # end if
 
                 if message_class is None:
-                    message_class = self.get_message_class(
-                        self._feature_table, feature_id, feature_version, function_index)
+                    message_class = self._feature_message_classes.get_message_class(
+                        feature_id, feature_version, function_index)
                 # end if
 
                 if message_class is not None:
@@ -1567,7 +1072,7 @@ class HIDDispatcher(object):
         """
         vlp_message = None
         vlp_message_class = None
-        data = transport_message.data
+        data = transport_message.raw_data
 
         if len(data) > VlpMessage.HEADER_SIZE // 8:
             vlp_message = VlpMessageRawPayload.fromHexList(data, timestamp=transport_message.timestamp)
@@ -1578,11 +1083,11 @@ class HIDDispatcher(object):
             if feature_index in self._vlp_feature_index_to_id:
                 feature_id, feature_version = self._vlp_feature_index_to_id[feature_index]
                 if feature_index == ErrorCodes.ERROR_TAG or software_id != 0:
-                    vlp_message_class = self.get_message_class(
-                        self._vlp_features_table, feature_id, feature_version, function_index)
+                    vlp_message_class = self._vlp_feature_message_classes.get_message_class(
+                        feature_id, feature_version, function_index)
                 else:
-                    vlp_message_class = self.get_message_class(
-                        self._vlp_event_table, feature_id, feature_version, function_index)
+                    vlp_message_class = self._vlp_event_message_classes.get_message_class(
+                        feature_id, feature_version, function_index)
                 # end if
             # end if
             if vlp_message_class is not None:
@@ -1608,7 +1113,7 @@ class HIDDispatcher(object):
         """
         message = None
 
-        if len(transport_message.data) == 0:
+        if len(transport_message) == 0:
             return None
         # end if
 
@@ -1654,7 +1159,7 @@ class HIDDispatcher(object):
         """
         message = None
 
-        if len(transport_message.data) == 0:
+        if len(transport_message) == 0:
             return None
         # end if
 
@@ -1695,7 +1200,7 @@ class HIDDispatcher(object):
         """
         message = None
 
-        if len(transport_message.data) == 0:
+        if len(transport_message) == 0:
             return None
         # end if
 
@@ -1724,7 +1229,7 @@ class HIDDispatcher(object):
         """
         message = None
 
-        if len(transport_message.data) == 0:
+        if len(transport_message) == 0:
             return None
         # end if
 
@@ -1846,17 +1351,38 @@ class HIDDispatcher(object):
         # end if
 
         if data_collections is not None:
-            payload = usbmessage.data
+            raw_data = usbmessage.raw_data
             if len(report_id_list) > 0:
-                report_id = payload[0]
-                payload = payload[1:]
+                report_id = raw_data[0]
+                raw_data = raw_data[1:]
             else:
                 report_id = 0
             # end if
 
-            if report_id not in data_collections.reports.keys():
+            # The decoder of the report ID is compiled once from the descriptor, the generic deserialization is only
+            # used for the data it cannot decode
+            report_decoder = data_collections.input_decoders.get(report_id)
+            if report_decoder is None:
                 return None, None  # TODO: Warn when this situation happens
-            elif hasattr(data_collections.reports[report_id].inputs, 'mouse'):
+            # end if
+
+            big_endian_payload = report_decoder.decode(raw_data)
+            if big_endian_payload is not None:
+                for usage_name, usage_message_type in self.HID_USAGE_NAME_MESSAGE_TYPES:
+                    if usage_name in report_decoder.usage_names:
+                        message_type = usage_message_type
+                        break
+                    # end if
+                # end for
+                return HexList(big_endian_payload), message_type
+            # end if
+
+            payload = usbmessage.data
+            if len(report_id_list) > 0:
+                payload = payload[1:]
+            # end if
+
+            if hasattr(data_collections.reports[report_id].inputs, 'mouse'):
                 message_type = MessageType.HID_MOUSE
             elif hasattr(data_collections.reports[report_id].inputs, 'keyboard'):
                 message_type = MessageType.HID_KEYBOARD
@@ -1914,6 +1440,7 @@ class HIDDispatcher(object):
             version = version.toLong()
         # end if
 
+        self.load_feature(feature_id)
         try:
             response_class = self._feature_table[(feature_id, version, 0)]
 
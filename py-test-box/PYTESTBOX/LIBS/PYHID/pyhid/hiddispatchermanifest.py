@@ -0,0 +1,561 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+:package: pyhid.hiddispatchermanifest
+:brief: Static manifest of the features known by the HID dispatcher
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+The manifest gives, for each feature id, the module defining its messages and the dispatcher queues receiving them.
+The feature modules are only imported when the feature is registered in a dispatcher.
+
+Usage: python -m pyhid.hiddispatchermanifest
+"""
+# ----------------------------------------------------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------------------------------------------------
+from importlib import import_module
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------------------------------------------------
+class DispatcherQueue(object):
+    """
+    Name of the ``HIDDispatcher`` attributes holding the feature message queues
+    """
+    IMPORTANT = 'important_message_queue'
+    COMMON = 'common_message_queue'
+    MOUSE = 'mouse_message_queue'
+    KEYBOARD = 'keyboard_message_queue'
+    TOUCHPAD = 'touchpad_message_queue'
+    GAMING = 'gaming_message_queue'
+    PERIPHERAL = 'peripheral_message_queue'
+    EVENT = 'event_message_queue'
+    BATTERY_EVENT = 'battery_event_message_queue'
+    VLP_IMPORTANT = 'vlp_important_message_queue'
+    VLP_COMMON = 'vlp_common_message_queue'
+    VLP_EVENT = 'vlp_event_message_queue'
+# end class DispatcherQueue
+
+
+class FeatureManifestEntry(object):
+    """
+    Description of the messages of a feature.
+
+    The messages are given either by a ``FeatureModel`` or by the names of the response and event classes of the
+    module. The events of a feature without event queue are decoded but stored in the default queue.
+    """
+
+    def __init__(self, feature_id, module, model=None, responses=(), events=(), response_queue=None,
+                 event_queue=None):
+        """
+        :param feature_id: Feature id
+        :type feature_id: ``int``
+        :param module: Name of the module defining the feature messages
+        :type module: ``str``
+        :param model: Name of the ``FeatureModel`` of the module - OPTIONAL
+        :type model: ``str`` or ``None``
+        :param responses: Names of the response classes of the module, if there is no model - OPTIONAL
+        :type responses: ``tuple[str]``
+        :param events: Names of the event classes of the module, if there is no model - OPTIONAL
+        :type events: ``tuple[str]``
+        :param response_queue: ``HIDDispatcher`` attribute of the queue receiving the responses - OPTIONAL
+        :type response_queue: ``str`` or ``None``
+        :param event_queue: ``HIDDispatcher`` attribute of the queue receiving the events - OPTIONAL
+        :type event_queue: ``str`` or ``None``
+        """
+        self.feature_id = feature_id
+        self.module = module
+        self.model = model
+        self.responses = responses
+        self.events = events
+        self.response_queue = response_queue
+        self.event_queue = event_queue
+        self._classes = None
+    # end def __init__
+
+    def load(self):
+        """
+        Import the feature module and get the message classes, the module is only imported once.
+
+        :return: The response classes and the event classes
+        :rtype: ``tuple[tuple[type], tuple[type]]``
+
+        :raise ``ImportError``: If the module cannot be imported
+        :raise ``AttributeError``: If the module does not define the model or one of the classes
+        """
+        if self._classes is None:
+            module = import_module(self.module)
+            if self.model is not None:
+                model = getattr(module, self.model)
+                responses = model.get_available_responses_classes()
+                try:
+                    events = model.get_available_events_classes()
+                except KeyError:
+                    # The data model of a feature without event does not define the events API
+                    events = ()
+                # end try
+            else:
+                responses = tuple(getattr(module, name) for name in self.responses)
+                events = tuple(getattr(module, name) for name in self.events)
+            # end if
+            self._classes = (responses, events)
+        # end if
+        return self._classes
+    # end def load
+
+    @property
+    def symbols(self):
+        """
+        Qualified names of the model or of the classes of the feature.
+
+        :return: The names
+        :rtype: ``tuple[str]``
+        """
+        if self.model is not None:
+            return f'{self.module}.{self.model}',
+        # end if
+        return tuple(f'{self.module}.{name}' for name in self.responses + self.events)
+    # end def symbols
+# end class FeatureManifestEntry
+
+
+def to_manifest(*entries):
+    """
+    Build a manifest from its entries.
+
+    :param entries: Manifest entries
+    :type entries: ``FeatureManifestEntry``
+
+    :return: The entries by feature id
+    :rtype: ``dict[int, FeatureManifestEntry]``
+
+    :raise ``ValueError``: If a feature id is given twice
+    """
+    manifest = {}
+    for entry in entries:
+        if entry.feature_id in manifest:
+            raise ValueError(f'Feature 0x{entry.feature_id:04X} is declared twice in the manifest')
+        # end if
+        manifest[entry.feature_id] = entry
+    # end for
+    return manifest
+# end def to_manifest
+
+
+HIDPP_FEATURE_MANIFEST = to_manifest(
+    # --- Important ----------------------------------------------------------------------------------------------------
+    # 0x0000 IRoot
+    FeatureManifestEntry(0x0000, 'pyhid.hidpp.features.root', model='RootModel',
+                         response_queue=DispatcherQueue.IMPORTANT),
+    # 0x0001 IFeatureSet
+    FeatureManifestEntry(0x0001, 'pyhid.hidpp.features.featureset', model='FeatureSetModel',
+                         response_queue=DispatcherQueue.IMPORTANT),
+    # ------------------------------------------------------------------------------------------------------------------
+
+    # --- Common -------------------------------------------------------------------------------------------------------
+    # 0x0003 Device Information
+    FeatureManifestEntry(0x0003, 'pyhid.hidpp.features.common.deviceinformation', model='DeviceInformationModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x0005 Device Name and Type
+    FeatureManifestEntry(0x0005, 'pyhid.hidpp.features.common.devicetypeandname', model='DeviceTypeAndNameModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x0007 Device Friendly Name
+    FeatureManifestEntry(0x0007, 'pyhid.hidpp.features.common.devicefriendlyname', model='DeviceFriendlyNameModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x0008 Keep Alive
+    FeatureManifestEntry(0x0008, 'pyhid.hidpp.features.common.keepalive', model='KeepAliveModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x0011 Property Access
+    FeatureManifestEntry(0x0011, 'pyhid.hidpp.features.common.propertyaccess', model='PropertyAccessModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x0020 Config Change
+    FeatureManifestEntry(0x0020, 'pyhid.hidpp.features.configchange',
+                         responses=('GetConfigurationCookieResponse', 'SetConfigurationCompleteResponse'),
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x0021 32 Byte Unique (Random) Identifier
+    FeatureManifestEntry(0x0021, 'pyhid.hidpp.features.common.uniqueidentifier32bytes',
+                         responses=('GetByte0To15Response', 'GetByte16To31Response', 'RegenIdResponse'),
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x00C2 DFU Control
+    FeatureManifestEntry(0x00C2, 'pyhid.hidpp.features.common.dfucontrol', model='DfuControlModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x00C3 Secure DFU Control
+    FeatureManifestEntry(0x00C3, 'pyhid.hidpp.features.common.securedfucontrol', model='SecureDfuControlModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x00D0 DFU
+    FeatureManifestEntry(0x00D0, 'pyhid.hidpp.features.common.dfu', model='DfuModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x1000 Battery Unified Level Status
+    FeatureManifestEntry(0x1000, 'pyhid.hidpp.features.batteryunifiedlevelstatus',
+                         responses=('GetBatteryLevelStatusResponse', 'GetBatteryCapabilityResponse',
+                                    'ShowBatteryStatusResponse'), events=('BatteryLevelStatusBroadcastEvent',),
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.BATTERY_EVENT),
+    # 0x1004 Unified Battery
+    FeatureManifestEntry(0x1004, 'pyhid.hidpp.features.common.unifiedbattery', model='UnifiedBatteryModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.BATTERY_EVENT),
+    # 0x1500 Force Pairing
+    FeatureManifestEntry(0x1500, 'pyhid.hidpp.features.common.forcepairing', model='ForcePairingModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x1602 Password Authentication
+    FeatureManifestEntry(0x1602, 'pyhid.hidpp.features.common.passwordauthentication',
+                         model='PasswordAuthenticationModel', response_queue=DispatcherQueue.COMMON),
+    # 0x1801 Manufacturing Mode
+    FeatureManifestEntry(0x1801, 'pyhid.hidpp.features.common.manufacturingmode', model='ManufacturingModeModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1803 GPIO Access
+    FeatureManifestEntry(0x1803, 'pyhid.hidpp.features.common.gpioaccess', model='GpioAccessModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1805 OOB State
+    FeatureManifestEntry(0x1805, 'pyhid.hidpp.features.common.oobstate', model='OobStateModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1806 Configurable Device Properties
+    FeatureManifestEntry(0x1806, 'pyhid.hidpp.features.common.configurabledeviceproperties',
+                         model='ConfigurableDevicePropertiesModel', response_queue=DispatcherQueue.COMMON),
+    # 0x1807 Configurable Properties
+    FeatureManifestEntry(0x1807, 'pyhid.hidpp.features.common.configurableproperties',
+                         model='ConfigurablePropertiesModel', response_queue=DispatcherQueue.COMMON),
+    # 0x180B Configurable Device Registers
+    FeatureManifestEntry(0x180B, 'pyhid.hidpp.features.common.configurabledeviceregisters',
+                         model='ConfigurableDeviceRegistersModel', response_queue=DispatcherQueue.COMMON),
+    # 0x1811 Equad Pairing Encryption
+    FeatureManifestEntry(0x1811, 'pyhid.hidpp.features.common.equadpairingenc', model='EquadPairingEncModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1814 Change Host
+    FeatureManifestEntry(0x1814, 'pyhid.hidpp.features.common.changehost', model='ChangeHostModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1815 Hosts Info
+    FeatureManifestEntry(0x1815, 'pyhid.hidpp.features.common.hostsinfo', model='HostsInfoModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1816 Ble Pro Pairing
+    FeatureManifestEntry(0x1816, 'pyhid.hidpp.features.common.bleproprepairing', model='BleProPrepairingModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1817 Lightspeed Prepairing
+    FeatureManifestEntry(0x1817, 'pyhid.hidpp.features.common.lightspeedprepairing', model='LightspeedPrepairingModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1830 Power Modes
+    FeatureManifestEntry(0x1830, 'pyhid.hidpp.features.common.powermodes', model='PowerModesModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1861 Battery Levels Calibration
+    FeatureManifestEntry(0x1861, 'pyhid.hidpp.features.common.batterylevelscalibration',
+                         model='BatteryLevelsCalibrationModel', response_queue=DispatcherQueue.COMMON),
+    # 0x1876 Optical Switches
+    FeatureManifestEntry(0x1876, 'pyhid.hidpp.features.common.opticalswitches', model='OpticalSwitchesModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1890 RF Test
+    FeatureManifestEntry(0x1890, 'pyhid.hidpp.features.common.rftest', model='RFTestModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1891 RF Test BLE
+    FeatureManifestEntry(0x1891, 'pyhid.hidpp.features.common.rftestble', model='RFTestBLEModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x18A1 LED Test
+    FeatureManifestEntry(0x18A1, 'pyhid.hidpp.features.common.ledtest', model='LEDTestModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x18B0 Monitor Mode
+    FeatureManifestEntry(0x18B0, 'pyhid.hidpp.features.common.staticmonitormode', model='StaticMonitorModeModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x1982 Backlight
+    FeatureManifestEntry(0x1982, 'pyhid.hidpp.features.common.backlight', model='BacklightModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x19C0 Force Sensing Button
+    FeatureManifestEntry(0x19C0, 'pyhid.hidpp.features.common.forcesensingbutton', model='ForceSensingButtonModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1B04 Keyboard Reprogrammable Keys and Mouse Buttons
+    FeatureManifestEntry(0x1B04, 'pyhid.hidpp.features.common.specialkeysmsebuttons',
+                         model='SpecialKeysMSEButtonsModel', response_queue=DispatcherQueue.COMMON,
+                         event_queue=DispatcherQueue.EVENT),
+    # 0x1B05 Full Key Customization
+    FeatureManifestEntry(0x1B05, 'pyhid.hidpp.features.common.fullkeycustomization', model='FullKeyCustomizationModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x1B08 Analog Keys
+    FeatureManifestEntry(0x1B08, 'pyhid.hidpp.features.common.analogkeys', model='AnalogKeysModel',
+                         response_queue=DispatcherQueue.COMMON, event_queue=DispatcherQueue.EVENT),
+    # 0x1B10 Control List
+    FeatureManifestEntry(0x1B10, 'pyhid.hidpp.features.common.controllist', model='ControlListModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1D4B Wireless Device Status
+    FeatureManifestEntry(0x1D4B, 'pyhid.hidpp.features.common.wirelessdevicestatus',
+                         events=('WirelessDeviceStatusBroadcastEvent',), event_queue=DispatcherQueue.EVENT),
+    # 0x1DF3 EquadDJ Debug Info
+    FeatureManifestEntry(0x1DF3, 'pyhid.hidpp.features.common.equaddjdebuginfo',
+                         responses=('ReadEquadDJDebugInfoResponse', 'WriteEquadDJDebugInfoResponse'),
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1E00 Enable Hidden Features
+    FeatureManifestEntry(0x1E00, 'pyhid.hidpp.features.enablehidden',
+                         responses=('GetEnableHiddenFeaturesResponse', 'SetEnableHiddenFeaturesResponse'),
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1E01 Manage Deactivatable Features
+    FeatureManifestEntry(0x1E01, 'pyhid.hidpp.features.common.managedeactivatablefeatures',
+                         model='ManageDeactivatableFeaturesModel', response_queue=DispatcherQueue.COMMON),
+    # 0x1E02 Manage Deactivatable Features
+    FeatureManifestEntry(0x1E02, 'pyhid.hidpp.features.common.managedeactivatablefeaturesauth',
+                         model='ManageDeactivatableFeaturesAuthModel', response_queue=DispatcherQueue.COMMON),
+    # 0x1E22 SPI Direct Access
+    FeatureManifestEntry(0x1E22, 'pyhid.hidpp.features.common.spidirectaccess', model='SPIDirectAccessModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1E30 I2C Direct Access
+    FeatureManifestEntry(0x1E30, 'pyhid.hidpp.features.common.i2cdirectaccess', model='I2CDirectAccessModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1EB0 TDE Access To Non-Volatile Memory
+    FeatureManifestEntry(0x1EB0, 'pyhid.hidpp.features.common.tdeaccesstonvm', model='TdeAccessToNvmModel',
+                         response_queue=DispatcherQueue.COMMON),
+    # 0x1F30 Temperature Measurement
+    FeatureManifestEntry(0x1F30, 'pyhid.hidpp.features.common.temperaturemeasurement',
+                         model='TemperatureMeasurementModel', response_queue=DispatcherQueue.COMMON),
+    # ------------------------------------------------------------------------------------------------------------------
+
+    # --- Mouse --------------------------------------------------------------------------------------------------------
+    # 0x2100 Vertical Scrolling
+    FeatureManifestEntry(0x2100, 'pyhid.hidpp.features.verticalscrolling', responses=('GetRollerInfoResponse',),
+                         response_queue=DispatcherQueue.MOUSE),
+    # 0x2110 Smart Shift
+    FeatureManifestEntry(0x2110, 'pyhid.hidpp.features.mouse.smartshift',
+                         responses=('GetRatchetControlModeResponse', 'SetRatchetControlModeResponse'),
+                         response_queue=DispatcherQueue.MOUSE),
+    # 0x2111 SmartShift 3G/EPM wheel with tunable torque
+    FeatureManifestEntry(0x2111, 'pyhid.hidpp.features.mouse.smartshifttunable', model='SmartShiftTunableModel',
+                         response_queue=DispatcherQueue.MOUSE),
+    # 0x2121 HiRes Wheel
+    FeatureManifestEntry(0x2121, 'pyhid.hidpp.features.hireswheel', model='HiResWheelModel',
+                         response_queue=DispatcherQueue.MOUSE, event_queue=DispatcherQueue.EVENT),
+    # 0x2130 Ratchet Wheel
+    FeatureManifestEntry(0x2130, 'pyhid.hidpp.features.mouse.ratchetwheel', model='RatchetWheelModel',
+                         response_queue=DispatcherQueue.MOUSE, event_queue=DispatcherQueue.EVENT),
+    # 0x2150 Thumbwheel
+    FeatureManifestEntry(0x2150, 'pyhid.hidpp.features.mouse.thumbwheel', model='ThumbwheelModel',
+                         response_queue=DispatcherQueue.MOUSE, event_queue=DispatcherQueue.EVENT),
+    # 0x2201 Adjustable DPI
+    FeatureManifestEntry(0x2201, 'pyhid.hidpp.features.mouse.adjustabledpi', model='AdjustableDpiModel',
+                         response_queue=DispatcherQueue.MOUSE),
+    # 0x2202 Extended Adjustable DPI
+    FeatureManifestEntry(0x2202, 'pyhid.hidpp.features.mouse.extendedadjustabledpi', model='ExtendedAdjustableDpiModel',
+                         response_queue=DispatcherQueue.MOUSE, event_queue=DispatcherQueue.EVENT),
+    # 0x2250 Analysis Mode
+    FeatureManifestEntry(0x2250, 'pyhid.hidpp.features.mouse.analysismode', model='AnalysisModeModel',
+                         response_queue=DispatcherQueue.MOUSE),
+    # 0x2251 Mouse Wheel Analytics
+    FeatureManifestEntry(0x2251, 'pyhid.hidpp.features.mouse.mousewheelanalytics', model='MouseWheelAnalyticsModel',
+                         response_queue=DispatcherQueue.MOUSE),
+    # ------------------------------------------------------------------------------------------------------------------
+
+    # --- Keyboard -----------------------------------------------------------------------------------------------------
+    # 0x40A3 Fn Inversion for Multi-Host Devices
+    FeatureManifestEntry(0x40A3, 'pyhid.hidpp.features.keyboard.fninversionformultihostdevices',
+                         model='FnInversionForMultiHostDevicesModel', response_queue=DispatcherQueue.KEYBOARD,
+                         event_queue=DispatcherQueue.EVENT),
+    # 0x4220 Lock Key State
+    FeatureManifestEntry(0x4220, 'pyhid.hidpp.features.keyboard.lockkeystate', model='LockKeyStateModel',
+                         response_queue=DispatcherQueue.KEYBOARD, event_queue=DispatcherQueue.EVENT),
+    # 0x4521 Disable Keys
+    FeatureManifestEntry(0x4521, 'pyhid.hidpp.features.keyboard.disablekeys', model='DisableKeysModel',
+                         response_queue=DispatcherQueue.KEYBOARD),
+    # 0x4522 Disable Keys By Usage
+    FeatureManifestEntry(0x4522, 'pyhid.hidpp.features.keyboard.disablekeysbyusage', model='DisableKeysByUsageModel',
+                         response_queue=DispatcherQueue.KEYBOARD),
+    # 0x4523 Disable Controls By CIDX
+    FeatureManifestEntry(0x4523, 'pyhid.hidpp.features.keyboard.disablecontrolsbycidx',
+                         model='DisableControlsByCIDXModel', response_queue=DispatcherQueue.KEYBOARD,
+                         event_queue=DispatcherQueue.EVENT),
+    # 0x4531 Multi Platform
+    FeatureManifestEntry(0x4531, 'pyhid.hidpp.features.keyboard.multiplatform', model='MultiPlatformModel',
+                         response_queue=DispatcherQueue.KEYBOARD, event_queue=DispatcherQueue.EVENT),
+    # 0x4540 Keyboard International Layouts
+    FeatureManifestEntry(0x4540, 'pyhid.hidpp.features.keyboard.keyboardinternationallayouts',
+                         model='KeyboardInternationalLayoutsModel', response_queue=DispatcherQueue.KEYBOARD),
+    # 0x4610 Multi Roller
+    FeatureManifestEntry(0x4610, 'pyhid.hidpp.features.keyboard.multiroller', model='MultiRollerModel',
+                         response_queue=DispatcherQueue.KEYBOARD, event_queue=DispatcherQueue.EVENT),
+    # ------------------------------------------------------------------------------------------------------------------
+
+    # --- Touchpad -----------------------------------------------------------------------------------------------------
+    # 0x6100 Touchpad Raw XY
+    FeatureManifestEntry(0x6100, 'pyhid.hidpp.features.touchpad.touchpadrawxy', model='TouchpadRawXYModel',
+                         response_queue=DispatcherQueue.TOUCHPAD, event_queue=DispatcherQueue.EVENT),
+    # ------------------------------------------------------------------------------------------------------------------
+
+    # --- Gaming -------------------------------------------------------------------------------------------------------
+    # 0x8010 Gaming G Keys
+    FeatureManifestEntry(0x8010, 'pyhid.hidpp.features.gaming.gaminggkeys', model='GamingGKeysModel',
+                         response_queue=DispatcherQueue.GAMING),
+    # 0x8030 MacroRecord key
+    FeatureManifestEntry(0x8030, 'pyhid.hidpp.features.gaming.macrorecordkey', model='MacroRecordkeyModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8040 Brightness Control
+    FeatureManifestEntry(0x8040, 'pyhid.hidpp.features.gaming.brightnesscontrol', model='BrightnessControlModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8051 Logi Modifiers
+    FeatureManifestEntry(0x8051, 'pyhid.hidpp.features.gaming.logimodifiers', model='LogiModifiersModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8060 Report Rate
+    FeatureManifestEntry(0x8060, 'pyhid.hidpp.features.gaming.reportrate', model='ReportRateModel',
+                         response_queue=DispatcherQueue.GAMING),
+    # 0x8061 Extended Adjustable Report Rate
+    FeatureManifestEntry(0x8061, 'pyhid.hidpp.features.gaming.extendedadjustablereportrate',
+                         model='ExtendedAdjustableReportRateModel', response_queue=DispatcherQueue.GAMING,
+                         event_queue=DispatcherQueue.EVENT),
+    # 0x8071 RGB Effects
+    FeatureManifestEntry(0x8071, 'pyhid.hidpp.features.gaming.rgbeffects', model='RGBEffectsModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8081 PerKey Lighting
+    FeatureManifestEntry(0x8081, 'pyhid.hidpp.features.gaming.perkeylighting', model='PerKeyLightingModel',
+                         response_queue=DispatcherQueue.GAMING),
+    # 0x8090 Mode Status
+    FeatureManifestEntry(0x8090, 'pyhid.hidpp.features.gaming.modestatus', model='ModeStatusModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x80A4 Axis Response Curve
+    FeatureManifestEntry(0x80A4, 'pyhid.hidpp.features.gaming.axisresponsecurve', model='AxisResponseCurveModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x80D0 Combined Pedals
+    FeatureManifestEntry(0x80D0, 'pyhid.hidpp.features.gaming.combinedpedals', model='CombinedPedalsModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8100 Onboard Profiles
+    FeatureManifestEntry(0x8100, 'pyhid.hidpp.features.gaming.onboardprofiles', model='OnboardProfilesModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8101 Profile Management
+    FeatureManifestEntry(0x8101, 'pyhid.hidpp.features.gaming.profilemanagement', model='ProfileManagementModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8110 Mouse Button Spy
+    FeatureManifestEntry(0x8110, 'pyhid.hidpp.features.gaming.mousebuttonspy',
+                         responses=('GetNbOfButtonsResponse', 'StartSpyResponse', 'StopSpyResponse',
+                                    'GetRemappingResponse', 'SetRemappingResponse'),
+                         response_queue=DispatcherQueue.GAMING),
+    # 0x8134 Brake Force
+    FeatureManifestEntry(0x8134, 'pyhid.hidpp.features.gaming.brakeforce', model='BrakeForceModel',
+                         response_queue=DispatcherQueue.GAMING, event_queue=DispatcherQueue.EVENT),
+    # 0x8135 Pedal Status
+    FeatureManifestEntry(0x8135, 'pyhid.hidpp.features.gaming.pedalstatus', model='PedalStatusModel',
+                         response_queue=DispatcherQueue.GAMING),
+    # ------------------------------------------------------------------------------------------------------------------
+
+    # --- Peripheral ---------------------------------------------------------------------------------------------------
+    # 0x9001 PMW3816 and PMW3826
+    FeatureManifestEntry(0x9001, 'pyhid.hidpp.features.peripheral.pmw3816andpmw3826', model='PMW3816andPMW3826Model',
+                         response_queue=DispatcherQueue.PERIPHERAL, event_queue=DispatcherQueue.EVENT),
+    # 0x9205 MLX903xx
+    FeatureManifestEntry(0x9205, 'pyhid.hidpp.features.peripheral.mlx903xx', model='MLX903xxModel',
+                         response_queue=DispatcherQueue.PERIPHERAL, event_queue=DispatcherQueue.EVENT),
+    # 0x9209 MLX 90393 Multi Sensor
+    FeatureManifestEntry(0x9209, 'pyhid.hidpp.features.peripheral.mlx90393multisensor',
+                         model='MLX90393MultiSensorModel', response_queue=DispatcherQueue.PERIPHERAL),
+    # 0x9215 Ads 1231
+    FeatureManifestEntry(0x9215, 'pyhid.hidpp.features.peripheral.ads1231', model='Ads1231Model',
+                         response_queue=DispatcherQueue.PERIPHERAL, event_queue=DispatcherQueue.EVENT),
+    # 0x92E2 Test Keys Display
+    FeatureManifestEntry(0x92E2, 'pyhid.hidpp.features.peripheral.testkeysdisplay', model='TestKeysDisplayModel',
+                         response_queue=DispatcherQueue.PERIPHERAL, event_queue=DispatcherQueue.EVENT),
+    # ------------------------------------------------------------------------------------------------------------------
+)
+
+VLP_FEATURE_MANIFEST = to_manifest(
+    # 0x0102 VLP Root
+    FeatureManifestEntry(0x0102, 'pyhid.vlp.features.important.vlproot', model='VLPRootModel',
+                         response_queue=DispatcherQueue.VLP_IMPORTANT),
+    # 0x0103 VLP Feature Set
+    FeatureManifestEntry(0x0103, 'pyhid.vlp.features.important.vlpfeatureset', model='VLPFeatureSetModel',
+                         response_queue=DispatcherQueue.VLP_IMPORTANT),
+    # 0x19A1 Contextual Display
+    FeatureManifestEntry(0x19A1, 'pyhid.vlp.features.common.contextualdisplay', model='ContextualDisplayModel',
+                         response_queue=DispatcherQueue.VLP_COMMON, event_queue=DispatcherQueue.VLP_EVENT),
+)
+
+# Features registered when the dispatcher is created
+HIDPP_CORE_FEATURES = (0x0000, 0x0001)
+VLP_CORE_FEATURES = (0x0102, 0x0103)
+
+
+def get_message_class_table(message_classes):
+    """
+    Build the message class table of message classes, as the ``FeatureModel`` maps.
+
+    :param message_classes: Message classes
+    :type message_classes: ``tuple[type]``
+
+    :return: The message classes by ``(feature id, version, function index)``
+    :rtype: ``dict``
+    """
+    return {(message_class.FEATURE_ID, message_class.VERSION, message_class.FUNCTION_INDEX): message_class
+            for message_class in message_classes}
+# end def get_message_class_table
+
+
+def dump_manifest(manifest):
+    """
+    Describe a manifest, one line per feature.
+
+    :param manifest: The manifest
+    :type manifest: ``dict[int, FeatureManifestEntry]``
+
+    :return: The description lines
+    :rtype: ``list[str]``
+    """
+    return [f'0x{entry.feature_id:04X} {entry.response_queue or "-":28} {entry.event_queue or "-":28} '
+            f'{", ".join(entry.symbols)}' for entry in sorted(manifest.values(), key=lambda item: item.feature_id)]
+# end def dump_manifest
+
+
+def verify_manifest(manifest):
+    """
+    Import all the features of a manifest and check their messages.
+
+    Each message class must belong to the feature of its entry and to no other entry, and each queue must be a queue
+    of the dispatcher.
+
+    :param manifest: The manifest
+    :type manifest: ``dict[int, FeatureManifestEntry]``
+
+    :return: The errors found, empty if the manifest is valid
+    :rtype: ``list[str]``
+    """
+    errors = []
+    owners = {}
+    queues = {value for name, value in vars(DispatcherQueue).items() if not name.startswith('_')}
+    for entry in manifest.values():
+        try:
+            responses, events = entry.load()
+        except (ImportError, AttributeError) as error:
+            errors.append(f'0x{entry.feature_id:04X}: {error}')
+            continue
+        # end try
+
+        if not responses and not events:
+            errors.append(f'0x{entry.feature_id:04X}: no message')
+        # end if
+        for message_class in responses + events:
+            if message_class.FEATURE_ID != entry.feature_id:
+                errors.append(f'0x{entry.feature_id:04X}: {message_class.__name__} belongs to feature '
+                              f'0x{message_class.FEATURE_ID:04X}')
+            # end if
+            owner = owners.setdefault(message_class, entry.feature_id)
+            if owner != entry.feature_id:
+                errors.append(f'0x{entry.feature_id:04X}: {message_class.__name__} already declared by feature '
+                              f'0x{owner:04X}')
+            # end if
+        # end for
+        for queue, message_classes in ((entry.response_queue, responses), (entry.event_queue, events)):
+            if queue is not None and queue not in queues:
+                errors.append(f'0x{entry.feature_id:04X}: unknown queue {queue}')
+            elif queue is not None and not message_classes:
+                errors.append(f'0x{entry.feature_id:04X}: no message for queue {queue}')
+            # end if
+        # end for
+    # end for
+    return errors
+# end def verify_manifest
+
+
+if __name__ == '__main__':
+    for name, feature_manifest in (('HID++', HIDPP_FEATURE_MANIFEST), ('VLP', VLP_FEATURE_MANIFEST)):
+        print(f'--- {name} features ---')
+        print('\n'.join(dump_manifest(feature_manifest)))
+        manifest_errors = verify_manifest(feature_manifest)
+        print('\n'.join(manifest_errors) if manifest_errors else f'{len(feature_manifest)} features verified')
+    # end for
+# end if
+
+# ----------------------------------------------------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------------------------------------------------
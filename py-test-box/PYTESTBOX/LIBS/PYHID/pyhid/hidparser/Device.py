@@ -394,6 +394,140 @@ class ReportGroup:
         return self._feature_size
 
 
+class ReportDecoder:
+    """
+    Decoder of the reports of a report ID, compiled from its collection.
+
+    It gives the same data as ``Device.deserialize``: the fields of the report, in their order, each one in big endian.
+    The bit offset, size and logical range of each field are computed once, a report is then decoded with integer
+    operations only. The 1 bit fields and the 8 bits fields aligned on a byte are extracted with a single mask.
+
+    ``decode`` returns ``None`` when the data would not be decoded the same way by ``Device.deserialize``: wrong size,
+    value outside its logical range or report of a size not aligned on a byte.
+    """
+    # Table reversing the bits of each byte, the 1 bit fields are given from the least significant bit
+    REVERSE_BITS_TABLE = bytes(int(f"{value:08b}"[::-1], 2) for value in range(256))
+
+    def __init__(self, collection: Collection, report_type: ReportType=ReportType.INPUT):
+        """
+        :param collection: The collection of the report ID for the report type
+        :type collection: ``Collection``
+        :param report_type: The report type to decode - OPTIONAL
+        :type report_type: ``ReportType``
+        """
+        fields = []
+        self.bit_size = self._add_fields(collection=collection, report_type=report_type, offset=0, fields=fields)
+        self.size = ((self.bit_size - 1) // 8) + 1
+        # Lower case names of the application collections, as given by the attributes of the collection
+        self.usage_names = frozenset(collection._attrs.keys())
+
+        self._single_bit_mask = 0
+        self._byte_mask = 0
+        # (shift in the little endian data, mask, shift in the big endian result, minimum, maximum, sign bit)
+        self._fields = []
+        for offset, size, minimum, maximum in fields:
+            result_shift = self.bit_size - offset - size
+            if minimum is None and size == 1:
+                self._single_bit_mask |= 1 << result_shift
+            elif minimum is None and size == 8 and offset % 8 == 0:
+                self._byte_mask |= 0xFF << result_shift
+            else:
+                self._fields.append((offset, (1 << size) - 1, result_shift, minimum, maximum,
+                                     (1 << (size - 1)) if minimum is not None and minimum < 0 else 0))
+
+        self.is_compiled = self.bit_size > 0 and self.bit_size % 8 == 0
+
+    @classmethod
+    def _add_fields(cls, collection: Collection, report_type: ReportType, offset: int, fields: list):
+        """
+        Add the fields of a collection, with the offsets used by ``Collection.deserialize``.
+
+        :param collection: The collection
+        :type collection: ``Collection``
+        :param report_type: The report type to decode
+        :type report_type: ``ReportType``
+        :param offset: The bit offset of the collection
+        :type offset: ``int``
+        :param fields: The fields, as (offset, size, minimum, maximum) with ``None`` as minimum when the value is not
+                       checked
+        :type fields: ``list[tuple]``
+
+        :return: The bit offset after the collection
+        :rtype: ``int``
+        """
+        for item in collection.items:
+            if isinstance(item, Report):
+                if item.report_type is not report_type:
+                    continue
+                minimum, maximum = cls._get_checked_range(item)
+                for index in range(item.count):
+                    fields.append((offset + index * item.size, item.size, minimum, maximum))
+            else:
+                cls._add_fields(collection=item, report_type=report_type, offset=offset, fields=fields)
+            offset += item.bits
+        return offset
+
+    @staticmethod
+    def _get_checked_range(report: Report):
+        """
+        Get the range to check for the values of a report, ``Report.unpack`` raises an ``ArithmeticError`` for a non
+        zero value outside the logical range, or for any non zero value if the range is a single value.
+
+        :param report: The report
+        :type report: ``Report``
+
+        :return: The minimum and maximum values, both ``None`` if all the values of the report are accepted
+        :rtype: ``tuple[int|None, int|None]``
+        """
+        if report.flags is not None and report.flags & ReportFlags.NULL_STATE:
+            return None, None
+        minimum = report.logical_range.minimum
+        maximum = report.logical_range.maximum
+        if minimum == maximum:
+            # Empty range, only the zero values are accepted
+            return 1, 0
+        if minimum < 0:
+            lowest = -(1 << (report.size - 1))
+            highest = (1 << (report.size - 1)) - 1
+        else:
+            lowest = 0
+            highest = (1 << report.size) - 1
+        if minimum <= lowest and highest <= maximum:
+            return None, None
+        return minimum, maximum
+
+    def decode(self, data):
+        """
+        Decode the data of a report, without its report ID.
+
+        :param data: The data received
+        :type data: ``bytes`` or ``bytearray`` or ``memoryview``
+
+        :return: The fields in big endian, or ``None`` if the data has to be decoded by ``Device.deserialize``
+        :rtype: ``bytes`` or ``None``
+        """
+        if len(data) != self.size or not self.is_compiled:
+            return None
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+
+        result = 0
+        if self._single_bit_mask:
+            result = int.from_bytes(data.translate(self.REVERSE_BITS_TABLE), 'big') & self._single_bit_mask
+        if self._byte_mask:
+            result |= int.from_bytes(data, 'big') & self._byte_mask
+        if self._fields:
+            value = int.from_bytes(data, 'little')
+            for shift, mask, result_shift, minimum, maximum, sign_bit in self._fields:
+                field = (value >> shift) & mask
+                if minimum is not None and field != 0:
+                    number = field - (sign_bit << 1) if field & sign_bit else field
+                    if not minimum <= number <= maximum:
+                        return None
+                result |= field << result_shift
+        return result.to_bytes(self.size, 'big')
+
+
 class Device:
     def deserialize(self, data: bytes, report_type: ReportType=None):
         """
@@ -459,6 +593,7 @@ class Device:
         # Create ReportGroups from the Report IDs found in the master Collection
         self._populate_report_types(self._collection)
         self._timestamp = timestamp
+        self._input_decoders = None
 
     @property
     def reports(self):
@@ -468,6 +603,18 @@ class Device:
         """
         return self._reports
 
+    @property
+    def input_decoders(self):
+        """
+        Returns a dictionary that maps report ids to the decoders of their input reports, compiled on first use
+        :return:
+        """
+        if self._input_decoders is None:
+            self._input_decoders = {
+                report_id: ReportDecoder(report_group.inputs, ReportType.INPUT)
+                for report_id, report_group in self._reports.items()}
+        return self._input_decoders
+
     @property
     def all(self):
         """
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+""" @package pyhid.hidparser.test.reportdecoder_test
+
+@brief  PyHid report decoder testing module
+
+@author christophe Roquebert
+
+@date   2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from os import urandom
+from unittest import TestCase
+from warnings import catch_warnings
+from warnings import simplefilter
+
+from pyhid import hidparser
+from pyhid.hidparser.Device import Collection
+from pyhid.hidparser.Device import Report
+from pyhid.hidparser.Device import ReportDecoder
+from pyhid.hidparser.enums import ReportType
+from pylibrary.tools.util import reverse_bits
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+
+
+class ReportDecoderTestCase(TestCase):                                               #pylint:disable=R0904
+    """
+    Tests of the ReportDecoder class, against Device.deserialize
+    """
+    # Mouse with 16 buttons, 16 bits X and Y, wheel and AC pan in report ID 2, consumer keys in report ID 3 and
+    # system control in report ID 4
+    GRAVITON_INTERFACE0 = bytes([
+        0x05, 0x01, 0x09, 0x02, 0xA1, 0x01, 0x85, 0x02, 0x09, 0x01, 0xA1, 0x00, 0x95, 0x10, 0x75, 0x01, 0x15, 0x00,
+        0x25, 0x01, 0x05, 0x09, 0x19, 0x01, 0x29, 0x10, 0x81, 0x02, 0x95, 0x02, 0x75, 0x10, 0x16, 0x01, 0x80, 0x26,
+        0xFF, 0x7F, 0x05, 0x01, 0x09, 0x30, 0x09, 0x31, 0x81, 0x06, 0x95, 0x01, 0x75, 0x08, 0x15, 0x81, 0x25, 0x7F,
+        0x09, 0x38, 0x81, 0x06, 0x95, 0x01, 0x05, 0x0C, 0x0A, 0x38, 0x02, 0x81, 0x06, 0xC0, 0xC0, 0x05, 0x0C, 0x09,
+        0x01, 0xA1, 0x01, 0x85, 0x03, 0x95, 0x02, 0x75, 0x10, 0x15, 0x01, 0x26, 0xFF, 0x02, 0x19, 0x01, 0x2A, 0xFF,
+        0x02, 0x81, 0x00, 0xC0, 0x05, 0x01, 0x09, 0x80, 0xA1, 0x01, 0x85, 0x04, 0x95, 0x01, 0x75, 0x02, 0x15, 0x01,
+        0x25, 0x03, 0x09, 0x82, 0x09, 0x81, 0x09, 0x83, 0x81, 0x00, 0x75, 0x06, 0x81, 0x03, 0xC0,
+    ])
+    # Keyboard with 8 modifiers, a reserved byte and 6 keys limited to 0xE7 in report ID 1
+    KEYBOARD_INTERFACE1 = bytes([
+        0x05, 0x01, 0x09, 0x06, 0xA1, 0x01, 0x85, 0x01, 0x05, 0x07, 0x19, 0xE0, 0x29, 0xE7, 0x15, 0x00, 0x25, 0x01,
+        0x75, 0x01, 0x95, 0x08, 0x81, 0x02, 0x95, 0x01, 0x75, 0x08, 0x81, 0x01, 0x95, 0x06, 0x75, 0x08, 0x15, 0x00,
+        0x26, 0xE7, 0x00, 0x05, 0x07, 0x19, 0x00, 0x29, 0xE7, 0x81, 0x00, 0xC0,
+    ])
+    RANDOM_REPORT_COUNT = 500
+
+    def test_mouse_reports(self):
+        """
+        Tests the mouse, consumer and system control reports are decoded as by Device.deserialize
+        """
+        device = hidparser.parse(bytes(self.GRAVITON_INTERFACE0.hex(), 'utf-8'))
+        self.assertEqual({2, 3, 4}, set(device.input_decoders))
+        self.assertIn('mouse', device.input_decoders[2].usage_names)
+        self.assertEqual(8, device.input_decoders[2].size)
+
+        for report_id in device.input_decoders:
+            self._check_random_reports(device=device, report_id=report_id)
+        # end for
+    # end def test_mouse_reports
+
+    def test_keyboard_reports(self):
+        """
+        Tests the keyboard reports, with keys checked against their logical range, are decoded as by
+        Device.deserialize
+        """
+        device = hidparser.parse(bytes(self.KEYBOARD_INTERFACE1.hex(), 'utf-8'))
+        self.assertIn('keyboard', device.input_decoders[1].usage_names)
+
+        self._check_random_reports(device=device, report_id=1)
+        self.assertEqual(bytes.fromhex('F000041600000000'),
+                         device.input_decoders[1].decode(bytes.fromhex('0F00041600000000')))
+        self.assertIsNone(device.input_decoders[1].decode(bytes.fromhex('0F0004E800000000')))
+    # end def test_keyboard_reports
+
+    def test_out_of_range(self):
+        """
+        Tests the values rejected by Device.deserialize are not decoded
+        """
+        device = hidparser.parse(bytes(self.GRAVITON_INTERFACE0.hex(), 'utf-8'))
+        report_decoder = device.input_decoders[2]
+
+        # X = -32768 is outside the logical range [-32767, 32767]
+        self.assertIsNone(report_decoder.decode(bytes.fromhex('0000' '0080' '0000' '0000')))
+        self.assertEqual(bytes.fromhex('8000' '8001' '0000' '0000'),
+                         report_decoder.decode(bytes.fromhex('0100' '0180' '0000' '0000')))
+        # Wrong size
+        self.assertIsNone(report_decoder.decode(bytes(7)))
+        self.assertIsNone(report_decoder.decode(bytes(9)))
+    # end def test_out_of_range
+
+    def test_not_aligned(self):
+        """
+        Tests a report which size is not a multiple of 8 bits is not compiled
+        """
+        report_decoder = ReportDecoder(
+            Collection(items=Report(ReportType.INPUT, size=2, count=5, logical_range=(0, 3))))
+
+        self.assertEqual(10, report_decoder.bit_size)
+        self.assertFalse(report_decoder.is_compiled)
+        self.assertIsNone(report_decoder.decode(bytes(2)))
+    # end def test_not_aligned
+
+    def _check_random_reports(self, device, report_id):
+        """
+        Check random reports are decoded as by Device.deserialize, or not decoded if it raises
+
+        :param device: The device
+        :type device: ``Device``
+        :param report_id: The report ID
+        :type report_id: ``int``
+        """
+        report_decoder = device.input_decoders[report_id]
+        for _ in range(self.RANDOM_REPORT_COUNT):
+            data = urandom(report_decoder.size)
+            try:
+                with catch_warnings():
+                    simplefilter('ignore')
+                    expected = device.deserialize(bytes([report_id]) + bytes(reverse_bits(byte) for byte in data))
+                # end with
+            except ArithmeticError:
+                self.assertIsNone(report_decoder.decode(data), data.hex())
+                continue
+            # end try
+            self.assertEqual(bytes.fromhex(expected.hex), report_decoder.decode(data), data.hex())
+            self.assertEqual(bytes.fromhex(expected.hex), report_decoder.decode(memoryview(data)), data.hex())
+        # end for
+    # end def _check_random_reports
+# end class ReportDecoderTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
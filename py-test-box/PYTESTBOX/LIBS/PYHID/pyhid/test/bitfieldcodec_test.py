@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.test.bitfieldcodec_test
+:brief: BitFieldContainerCodec testing module
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from unittest import TestCase
+
+from pyhid.bitfield import BitField
+from pyhid.bitfieldcodec import BitFieldContainerCodec
+from pyhid.bitfieldcontainermixin import BitFieldContainerMixin
+from pyhid.field import CheckByte
+from pyhid.field import CheckHexList
+from pyhid.field import CheckInt
+from pyhid.hidpp.features.featureset import GetCountResponse
+from pyhid.hidpp.features.root import RootGetFeature
+from pyhid.hidpp.features.root import RootGetFeatureResponse
+from pylibrary.tools.hexlist import HexList
+from pylibrary.tools.numeral import Numeral
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+class CodecTestContainer(BitFieldContainerMixin):
+    """
+    Container mixing byte and bit fields
+    """
+    class FID(object):
+        """
+        Field Identifiers
+        """
+        FIRST = 0xFF
+        SECOND = 0xFE
+        THIRD = 0xFD
+        FOURTH = 0xFC
+    # end class FID
+
+    FIELDS = (BitField(FID.FIRST, 0x08, title='First', name='first', checks=(CheckHexList(1),)),
+              BitField(FID.SECOND, 0x03, title='Second', name='second', checks=(CheckInt(0, 7),)),
+              BitField(FID.THIRD, 0x05, title='Third', name='third', default_value=0x1F),
+              BitField(FID.FOURTH, 0x10, title='Fourth', name='fourth', conversions={HexList: Numeral}),
+              )
+# end class CodecTestContainer
+
+
+class CodecTestPartialContainer(BitFieldContainerMixin):
+    """
+    Container ending with a variable length field
+    """
+    class FID(object):
+        """
+        Field Identifiers
+        """
+        FIRST = 0xFF
+        VARIABLE = 0xFE
+    # end class FID
+
+    FIELDS = (BitField(FID.FIRST, 0x08, title='First', name='first'),
+              BitField(FID.VARIABLE, None, title='Variable', name='variable'),
+              )
+# end class CodecTestPartialContainer
+
+
+class CodecTestCheckedContainer(BitFieldContainerMixin):
+    """
+    Container which fields have checks rejecting some values
+    """
+    class FID(object):
+        """
+        Field Identifiers
+        """
+        VALUE = 0xFF
+        NIBBLE = 0xFE
+        BYTE = 0xFD
+    # end class FID
+
+    FIELDS = (BitField(FID.VALUE, 0x04, title='Value', name='value', checks=(CheckInt(0, 0x0A),)),
+              BitField(FID.NIBBLE, 0x04, title='Nibble', name='nibble', checks=(CheckInt(0, 0x0F),)),
+              BitField(FID.BYTE, 0x08, title='Byte', name='byte', checks=(CheckHexList(1), CheckByte(),)),
+              )
+# end class CodecTestCheckedContainer
+
+
+class BitFieldContainerCodecTestCase(TestCase):
+    """
+    BitFieldContainerCodec testing class
+    """
+
+    @staticmethod
+    def _generic_from_hex_list(cls, data):
+        """
+        Parse data without the codec, using the field parsers only.
+
+        :param cls: The class to parse
+        :type cls: ``type``
+        :param data: The data to parse
+        :type data: ``HexList``
+
+        :return: The parsed instance
+        :rtype: ``BitFieldContainerMixin``
+        """
+        instance = BitFieldContainerCodec.get_codec(cls, cls._create_inner_class).new_instance()
+        offset = 0
+        for field in instance.FIELDS:
+            offset, value = field.from_hex_list(instance, data, offset, len(data) * 8)
+            if value is not None:
+                instance.setValue(field.fid, value)
+            # end if
+        # end for
+        return instance
+    # end def _generic_from_hex_list
+
+    def _check_values(self, expected, obtained):
+        """
+        Check that two instances hold the same values, with the same types.
+
+        :param expected: Reference instance
+        :type expected: ``BitFieldContainerMixin``
+        :param obtained: Instance to check
+        :type obtained: ``BitFieldContainerMixin``
+        """
+        self.assertEqual(expected._values.keys(), obtained._values.keys())
+        for fid, value in expected._values.items():
+            self.assertEqual(type(value), type(obtained._values[fid]), f'Wrong type for fid {fid}')
+            self.assertEqual(value, obtained._values[fid], f'Wrong value for fid {fid}')
+        # end for
+    # end def _check_values
+
+    def test_codec_is_built_once(self):
+        """
+        Check the codec is cached on its class and not inherited by subclasses
+        """
+        codec = BitFieldContainerCodec.get_codec(RootGetFeature, RootGetFeature._create_inner_class)
+
+        RootGetFeature.fromHexList(HexList('10FF000F00010000'))
+        self.assertIs(codec, BitFieldContainerCodec.get_codec(RootGetFeature, RootGetFeature._create_inner_class))
+        self.assertTrue(codec.complete)
+
+        message = RootGetFeature.fromHexList(HexList('10FF000F00010000'))
+        self.assertIs(codec.inner_class, message.__class__)
+        self.assertEqual(RootGetFeature.__name__, message.__class__.__name__)
+        self.assertIsInstance(message, RootGetFeature)
+    # end def test_codec_is_built_once
+
+    def test_decode_bit_fields(self):
+        """
+        Check the decoding of fields that are not byte aligned
+        """
+        data = HexList('A5B71234')
+        obtained = CodecTestContainer.fromHexList(data)
+
+        self._check_values(self._generic_from_hex_list(CodecTestContainer, data), obtained)
+        self.assertEqual(HexList('A5'), obtained.first)
+        self.assertEqual(0x05, obtained.second)
+        self.assertEqual(0x17, obtained.third)
+        self.assertIsInstance(obtained.fourth, Numeral)
+        self.assertEqual(data, HexList(obtained))
+    # end def test_decode_bit_fields
+
+    def test_decode_bytes(self):
+        """
+        Check bytes and HexList data give the same result
+        """
+        data = HexList('11FF00080001000000000000000000000000000000')[:20]
+        self._check_values(RootGetFeatureResponse.fromHexList(data),
+                           RootGetFeatureResponse.fromHexList(bytes(data)))
+        self._check_values(CodecTestPartialContainer.fromHexList(HexList('010203')),
+                           CodecTestPartialContainer.fromHexList(b'\x01\x02\x03'))
+    # end def test_decode_bytes
+
+    def test_decode_shared_fid(self):
+        """
+        Check the value of fields sharing the fid of a previous field uses the first field definition
+        """
+        data = HexList('1100010A0500000000000000000000000000000000')[:20]
+        obtained = GetCountResponse.fromHexList(data)
+
+        self._check_values(self._generic_from_hex_list(GetCountResponse, data), obtained)
+        self.assertEqual(obtained._bitListToHexList(obtained.to_bit_list()), HexList(obtained))
+    # end def test_decode_shared_fid
+
+    def test_checks_always_accepted(self):
+        """
+        Check the checks of a field are skipped only if they accept any value of the field length
+        """
+        codec = BitFieldContainerCodec.get_codec(CodecTestContainer, CodecTestContainer._create_inner_class)
+        self.assertEqual([False, False, False, False], [step.checked for step in codec.steps])
+
+        codec = BitFieldContainerCodec.get_codec(CodecTestCheckedContainer,
+                                                 CodecTestCheckedContainer._create_inner_class)
+        self.assertEqual([True, False, False], [step.checked for step in codec.steps])
+        self.assertEqual(0x0A, CodecTestCheckedContainer.fromHexList(HexList('A501')).value)
+        with self.assertRaises(ValueError):
+            CodecTestCheckedContainer.fromHexList(HexList('B501'))
+        # end with
+    # end def test_checks_always_accepted
+
+    def test_decode_short_data(self):
+        """
+        Check the generic parsing is used when the data is too short for the compiled fields
+        """
+        with self.assertRaises(ValueError):
+            CodecTestContainer.fromHexList(HexList('A5'))
+        # end with
+    # end def test_decode_short_data
+
+    def test_partial_codec(self):
+        """
+        Check a container with a variable length field is only partially compiled
+        """
+        codec = BitFieldContainerCodec.get_codec(CodecTestPartialContainer,
+                                                 CodecTestPartialContainer._create_inner_class)
+        self.assertEqual(1, codec.prefix_count)
+        self.assertFalse(codec.complete)
+
+        obtained = CodecTestPartialContainer.fromHexList(HexList('01020304'))
+        self.assertEqual(HexList('01'), obtained.first)
+        self.assertEqual(HexList(), obtained.variable)
+        self.assertEqual(HexList('01'), HexList(obtained))
+    # end def test_partial_codec
+
+    def test_layout_change(self):
+        """
+        Check the codec is rebuilt when the length of a compiled field changes
+        """
+        class Container(BitFieldContainerMixin):
+            """
+            Container whose field length is modified
+            """
+            FIELDS = (BitField(0xFF, 0x08, title='First', name='first'),
+                      BitField(0xFE, 0x08, title='Second', name='second'),)
+        # end class Container
+
+        codec = BitFieldContainerCodec.get_codec(Container, Container._create_inner_class)
+        self.assertEqual(HexList('02'), Container.fromHexList(HexList('010203')).second)
+
+        Container.FIELDS[0].length = 0x10
+        self.assertFalse(codec.is_valid())
+        self.assertEqual(HexList('03'), Container.fromHexList(HexList('010203')).second)
+        self.assertIsNot(codec, BitFieldContainerCodec.get_codec(Container, Container._create_inner_class))
+    # end def test_layout_change
+
+    def test_encode(self):
+        """
+        Check the encoding of an instance created by its constructor
+        """
+        message = RootGetFeature(deviceIndex=0xFF, featureId=0x0001)
+        self.assertEqual(HexList('10FF000F0001'), HexList(message)[:6])
+        self.assertEqual(message._bitListToHexList(message.to_bit_list()), HexList(message))
+    # end def test_encode
+
+    def test_encode_instance_fields(self):
+        """
+        Check instances redefining their FIELDS are encoded by the generic encoder
+        """
+        instance = CodecTestContainer()
+        instance.FIELDS = CodecTestContainer.FIELDS[:1]
+        instance.first = HexList('12')
+        self.assertEqual(HexList('12'), HexList(instance))
+    # end def test_encode_instance_fields
+
+    def test_encode_out_of_bound(self):
+        """
+        Check an out of bound value raises the same error as the generic encoder
+        """
+        instance = CodecTestContainer(first=HexList('01'), fourth=0x0203)
+        instance._values[CodecTestContainer.FID.SECOND] = 0x08
+        with self.assertRaises(ValueError):
+            HexList(instance)
+        # end with
+    # end def test_encode_out_of_bound
+# end class BitFieldContainerCodecTestCase
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.test.bitfieldindex_test
+:brief: BitFieldContainerIndex testing module
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from unittest import TestCase
+
+from pyhid.bitfield import BitField
+from pyhid.bitfieldcontainermixin import BitFieldContainerMixin
+from pyhid.bitfieldindex import BitFieldContainerIndex
+from pyhid.bitfieldindex import BitFieldDescriptor
+from pylibrary.tools.hexlist import HexList
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+class IndexTestContainer(BitFieldContainerMixin):
+    """
+    Container with aliases and automatic fids
+    """
+    FIELDS = (BitField(length=0x08, title='DeviceIndex', name='deviceIndex', aliases=('device_index',)),
+              BitField(length=0x08, title='FeatureIndex', name='featureIndex', aliases=('feature_index',)),
+              BitField(length=0x10, title='Value', name='value', aliases=('level',)),
+              BitField(length=0x08, title='Level', name='LEVEL'),
+              )
+# end class IndexTestContainer
+
+
+class BitFieldContainerIndexTestCase(TestCase):
+    """
+    BitFieldContainerIndex testing class
+    """
+
+    def test_descriptors(self):
+        """
+        Check descriptors are installed for the names and aliases only
+        """
+        self.assertIsInstance(IndexTestContainer.__dict__['deviceIndex'], BitFieldDescriptor)
+        self.assertIsInstance(IndexTestContainer.__dict__['device_index'], BitFieldDescriptor)
+        # 'name' is a property of BitFieldContainerMixin, it is not overridden
+        self.assertNotIn('name', IndexTestContainer.__dict__)
+
+        instance = IndexTestContainer(deviceIndex=0x01, feature_index=0x02)
+        self.assertEqual(HexList('01'), instance.deviceIndex)
+        self.assertEqual(HexList('01'), instance.device_index)
+        self.assertEqual(HexList('02'), instance.featureIndex)
+    # end def test_descriptors
+
+    def test_get_case_insensitive(self):
+        """
+        Check field names are matched regardless of the case, aliases exactly
+        """
+        instance = IndexTestContainer(deviceIndex=0x01, value=0x0203)
+        # LEVEL is rejected by __setattr__ as it may be confused with the 'level' alias
+        instance.setValue(IndexTestContainer.FIELDS[3].fid, 0x04)
+        self.assertEqual(HexList('01'), instance.DEVICEINDEX)
+        self.assertEqual(HexList('0203'), instance.VALUE)
+        # The alias of the 3rd field comes before the name of the 4th one
+        self.assertEqual(HexList('0203'), instance.level)
+        self.assertEqual(HexList('04'), instance.Level)
+        with self.assertRaises(AttributeError):
+            _ = instance.DEVICE_INDEX
+        # end with
+    # end def test_get_case_insensitive
+
+    def test_getter_setter(self):
+        """
+        Check the get<Name> and set<Name> accessors
+        """
+        instance = IndexTestContainer()
+        instance.setDeviceIndex(0x05)
+        self.assertEqual(HexList('05'), instance.getDeviceIndex())
+        with self.assertRaises(AttributeError):
+            instance.setUnknown(0x05)
+        # end with
+    # end def test_getter_setter
+
+    def test_set_confusing_name(self):
+        """
+        Check a name differing from a field name by its case only is rejected
+        """
+        instance = IndexTestContainer()
+        with self.assertRaisesRegex(AttributeError, 'probably mistaken with deviceIndex'):
+            instance.DeviceIndex = 0x01
+        # end with
+        with self.assertRaisesRegex(AttributeError, 'probably mistaken with value'):
+            instance.Level = 0x01
+        # end with
+
+        instance.other = 0x01
+        self.assertEqual(0x01, instance.__dict__['other'])
+    # end def test_set_confusing_name
+
+    def test_instance_fields(self):
+        """
+        Check an instance redefining its FIELDS uses its own index
+        """
+        instance = IndexTestContainer()
+        instance.FIELDS = IndexTestContainer.FIELDS[:1] + (BitField(fid=0x10, length=0x08, title='Extra',
+                                                                    name='extra'),)
+        instance.extra = 0x01
+        self.assertEqual(HexList('01'), instance.extra)
+        with self.assertRaises(AttributeError):
+            _ = instance.featureIndex
+        # end with
+        self.assertIs(instance.FIELDS, BitFieldContainerIndex.get_index(instance).fields)
+        self.assertIs(IndexTestContainer.FIELDS, BitFieldContainerIndex.get_index(IndexTestContainer()).fields)
+    # end def test_instance_fields
+
+    def test_field_renamed(self):
+        """
+        Check the index is rebuilt when a field is renamed
+        """
+        class Container(BitFieldContainerMixin):
+            """
+            Container whose field is renamed
+            """
+            FIELDS = (BitField(fid=0xFF, length=0x08, title='First', name='first'),)
+        # end class Container
+
+        instance = Container(first=0x01)
+        index = BitFieldContainerIndex.get_index(instance)
+        Container.FIELDS[0].name = 'renamed'
+        self.assertIsNot(index, BitFieldContainerIndex.get_index(instance))
+        self.assertEqual(HexList('01'), instance.renamed)
+        self.assertEqual(0xFF, instance.getFidFromName('renamed'))
+    # end def test_field_renamed
+
+    def test_field_definition(self):
+        """
+        Check the field definition of a fid is the first field with this fid
+        """
+        instance = IndexTestContainer()
+        for field in IndexTestContainer.FIELDS:
+            self.assertIs(field, instance.getFieldDefinition(field.fid))
+        # end for
+        with self.assertRaises(ValueError):
+            instance.getFieldDefinition(0x1234)
+        # end with
+    # end def test_field_definition
+# end class BitFieldContainerIndexTestCase
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pyhid.test.hiddispatcher_test
+:brief: HIDDispatcher message class resolution and feature registration testing module
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from os.path import dirname
+from os.path import join
+from unittest import TestCase
+
+from pyhid.hid.hidmouse import HidMouse
+from pyhid.hiddispatcher import HIDDispatcher
+from pyhid.hiddispatcher import HidMessageQueue
+from pyhid.hiddispatcher import MessageClassIndex
+from pyhid.hiddispatchermanifest import HIDPP_FEATURE_MANIFEST
+from pyhid.hiddispatchermanifest import VLP_FEATURE_MANIFEST
+from pyhid.hiddispatchermanifest import dump_manifest
+from pyhid.hiddispatchermanifest import verify_manifest
+from pyhid.hidpp.features.batteryunifiedlevelstatus import BatteryLevelStatusBroadcastEvent
+from pyhid.hidpp.features.batteryunifiedlevelstatus import GetBatteryLevelStatusResponse
+from pyhid.hidpp.features.common.keepalive import GetTimeoutRangeResponse
+from pyhid.hidpp.features.common.keepalive import KeepAlive
+from pyhid.hidpp.features.common.keepalive import KeepAliveTimeoutEventV1
+from pyhid.hidpp.features.error import ErrorCodes
+from pyhid.hidpp.features.error import Hidpp1ErrorCodes
+from pyhid.hidpp.features.root import RootGetFeatureResponse
+from pyhid.vlp.features.common.contextualdisplay import ContextualDisplay
+from pylibrary.tools.hexlist import HexList
+from pytransport.transportmessage import TransportMessage
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+EAGER_TABLES_FILE_PATH = join(dirname(__file__), 'hiddispatcher_eager_tables.txt')
+
+
+def get_table_lines(dispatcher):
+    """
+    Describe the message class tables of a dispatcher and the queue accepting each message class, one sorted line per
+    table entry and per message class.
+
+    :param dispatcher: The dispatcher
+    :type dispatcher: ``HIDDispatcher``
+
+    :return: The description lines
+    :rtype: ``list[str]``
+    """
+    queue_names = {id(queue): name for name, queue in vars(dispatcher).items() if isinstance(queue, HidMessageQueue)}
+    lines = []
+    message_classes = set()
+    for table_name, table in (('response', dispatcher._feature_table), ('event', dispatcher._event_table),
+                              ('vlp_response', dispatcher._vlp_features_table),
+                              ('vlp_event', dispatcher._vlp_event_table)):
+        for (feature_id, versions, function_indexes), message_class in table.items():
+            lines.append(f'{table_name} 0x{feature_id:04X} {versions} {function_indexes} '
+                         f'{message_class.__module__}.{message_class.__qualname__}')
+            message_classes.add(message_class)
+        # end for
+    # end for
+    for message_class in message_classes:
+        accepting_queues = sorted(queue_names[id(queue)] for queue in dispatcher.queue_list
+                                  if queue.is_message_type_accepted(message_class))
+        lines.append(f'queue {message_class.__module__}.{message_class.__qualname__} '
+                     f'{",".join(accepting_queues) or "-"}')
+    # end for
+    return sorted(lines)
+# end def get_table_lines
+
+
+class MessageClassIndexTestCase(TestCase):
+    """
+    MessageClassIndex testing class
+    """
+
+    def test_expansion(self):
+        """
+        Check versions and function indexes tuples are expanded
+        """
+        index = MessageClassIndex({(0x1234, (0, 1), 2): int, (0x1234, (1,), (3, 4)): str})
+        self.assertIs(int, index.get_message_class(0x1234, 0, 2))
+        self.assertIs(int, index.get_message_class(0x1234, 1, 2))
+        self.assertIs(str, index.get_message_class(0x1234, 1, 3))
+        self.assertIs(str, index.get_message_class(0x1234, 1, 4))
+        self.assertIsNone(index.get_message_class(0x1234, 0, 3))
+        self.assertIsNone(index.get_message_class(0x1235, 0, 2))
+    # end def test_expansion
+
+    def test_ambiguity(self):
+        """
+        Check two entries matching the same feature characteristics are reported when the index is built
+        """
+        with self.assertRaisesRegex(KeyError, 'is referenced 2 times'):
+            MessageClassIndex({(0x1234, (0, 1), 2): int, (0x1234, (1, 2), 2): str})
+        # end with
+    # end def test_ambiguity
+
+    def test_exact_key(self):
+        """
+        Check an exact key takes precedence over the expanded ones, as in ``HIDDispatcher.get_message_class``
+        """
+        table = {(0x1234, (0, 1), 2): int, (0x1234, 1, 2): str}
+        index = MessageClassIndex(table)
+        self.assertIs(HIDDispatcher.get_message_class(table, 0x1234, 1, 2), index.get_message_class(0x1234, 1, 2))
+        self.assertIs(int, index.get_message_class(0x1234, 0, 2))
+    # end def test_exact_key
+# end class MessageClassIndexTestCase
+
+
+class HIDDispatcherTestCase(TestCase):
+    """
+    HIDDispatcher message class resolution testing class
+    """
+    FEATURE_INDEX = 0x05
+
+    @classmethod
+    def setUpClass(cls):
+        # See ``TestCase.setUpClass``
+        cls.dispatcher = HIDDispatcher()
+        cls.dispatcher.add_feature_entry(cls.FEATURE_INDEX, KeepAlive.FEATURE_ID, 1)
+    # end def setUpClass
+
+    def tearDown(self):
+        # See ``TestCase.tearDown``
+        self.dispatcher.clear_all_queues()
+        self.dispatcher.default_message_queue.clear()
+        super().tearDown()
+    # end def tearDown
+
+    def test_index_matches_tables(self):
+        """
+        Check the index gives the same message class as the table scan for every entry of the tables
+        """
+        for table, index in ((self.dispatcher._feature_table, self.dispatcher._feature_message_classes),
+                             (self.dispatcher._event_table, self.dispatcher._event_message_classes),
+                             (self.dispatcher._vlp_features_table, self.dispatcher._vlp_feature_message_classes),
+                             (self.dispatcher._vlp_event_table, self.dispatcher._vlp_event_message_classes)):
+            for key in table:
+                for flat_key in MessageClassIndex.expand_key(key):
+                    self.assertIs(HIDDispatcher.get_message_class(table, *flat_key),
+                                  index.get_message_class(*flat_key), flat_key)
+                # end for
+            # end for
+        # end for
+    # end def test_index_matches_tables
+
+    def test_process_event(self):
+        """
+        Check an event is decoded with the event table
+        """
+        transport_message = TransportMessage(data=HexList(f'11FF{self.FEATURE_INDEX:02X}00' + '00' * 16), timestamp=0)
+        self.dispatcher.process_interrupt_hidpp(transport_message)
+        self.assertIs(KeepAliveTimeoutEventV1, transport_message.message_class)
+
+        transport_message = TransportMessage(data=HexList(f'11FF{self.FEATURE_INDEX:02X}00' + '00' * 16), timestamp=0)
+        message = self.dispatcher.get_hidpp2_message_from_event(transport_message, (KeepAlive.FEATURE_ID, 1, 0))
+        self.assertIsInstance(message, KeepAliveTimeoutEventV1)
+    # end def test_process_event
+
+    def test_process_response(self):
+        """
+        Check a response is decoded with the feature table
+        """
+        transport_message = TransportMessage(data=HexList(f'11FF{self.FEATURE_INDEX:02X}01' + '00' * 16), timestamp=0)
+        self.dispatcher.process_interrupt_hidpp(transport_message)
+        self.assertIs(GetTimeoutRangeResponse, transport_message.message_class)
+    # end def test_process_response
+
+    def test_process_raw_data(self):
+        """
+        Check a message received as raw data is decoded as the same message in HexList, without building the HexList
+        """
+        data = HexList(f'11FF{self.FEATURE_INDEX:02X}01' + '00' * 16)
+        for raw_data in (bytes(data), memoryview(bytearray(data))):
+            transport_message = TransportMessage(raw_data=raw_data, timestamp=0)
+            queue = self.dispatcher.process_interrupt_hidpp(transport_message)
+            self.assertIs(GetTimeoutRangeResponse, transport_message.message_class)
+            self.assertIsNone(transport_message._data)
+            self.assertEqual(GetTimeoutRangeResponse.fromHexList(data), queue.get_nowait())
+        # end for
+    # end def test_process_raw_data
+# end class HIDDispatcherTestCase
+
+
+class HIDDispatcherHidReportTestCase(TestCase):
+    """
+    HIDDispatcher HID report decoding testing class
+    """
+    # Mouse with 16 buttons, 16 bits X and Y, wheel and AC pan, without report ID
+    MOUSE_DESCRIPTOR = '05010902A1010901A1009510750115002501050919012910810295027510160180' \
+                       '26FF7F0501093009318106950175081581257F093881069501050C0A38028106C0C0'
+
+    def test_process_mouse_report(self):
+        """
+        Check a mouse report is decoded by the report decoder as by the generic deserialization
+        """
+        dispatcher = HIDDispatcher()
+        dispatcher.process_control_read_get_descriptor(
+            TransportMessage(data=HexList(self.MOUSE_DESCRIPTOR), timestamp=0))
+        self.assertTrue(dispatcher.mouse_collections.input_decoders[0].is_compiled)
+
+        raw_data = bytes.fromhex('0100' '0500' 'FDFF' '01' '00')
+        transport_message = TransportMessage(raw_data=raw_data, timestamp=0)
+        message = dispatcher.process_interrupt_hid_mouse(transport_message).get_nowait()
+        self.assertIs(HidMouse, transport_message.message_class)
+        self.assertIsNone(transport_message._data)
+        self.assertEqual(1, message.button1)
+        self.assertEqual(0, message.button2)
+        self.assertEqual(HexList('0005'), message.x)
+        self.assertEqual(HexList('FFFD'), message.y)
+        self.assertEqual(HexList('01'), message.wheel)
+
+        # Generic deserialization
+        dispatcher.mouse_collections.input_decoders[0].is_compiled = False
+        generic_message = dispatcher.process_interrupt_hid_mouse(
+            TransportMessage(data=HexList(raw_data), timestamp=0)).get_nowait()
+        self.assertEqual(HexList(generic_message), HexList(message))
+    # end def test_process_mouse_report
+# end class HIDDispatcherHidReportTestCase
+
+
+class HIDDispatcherManifestTestCase(TestCase):
+    """
+    HIDDispatcher feature manifest and lazy feature registration testing class
+    """
+
+    def test_manifest(self):
+        """
+        Check the manifests modules define the expected messages
+        """
+        for manifest in (HIDPP_FEATURE_MANIFEST, VLP_FEATURE_MANIFEST):
+            self.assertListEqual([], verify_manifest(manifest))
+            self.assertEqual(len(manifest), len(dump_manifest(manifest)))
+        # end for
+    # end def test_manifest
+
+    def test_core_features(self):
+        """
+        Check the root feature and the errors are known by a new dispatcher
+        """
+        dispatcher = HIDDispatcher()
+        self.assertTrue(dispatcher.important_message_queue.is_message_type_accepted(RootGetFeatureResponse))
+        self.assertTrue(dispatcher.error_message_queue.is_message_type_accepted(ErrorCodes))
+        self.assertIs(Hidpp1ErrorCodes, dispatcher._feature_message_classes.get_message_class(
+            Hidpp1ErrorCodes.FEATURE_ID, Hidpp1ErrorCodes.VERSION[0], Hidpp1ErrorCodes.FUNCTION_INDEX))
+    # end def test_core_features
+
+    def test_lazy_registration(self):
+        """
+        Check the messages of a feature are added to the tables and queues when the feature is registered
+        """
+        dispatcher = HIDDispatcher()
+        feature_id = GetBatteryLevelStatusResponse.FEATURE_ID
+        version = GetBatteryLevelStatusResponse.VERSION[0]
+        self.assertFalse(dispatcher.common_message_queue.is_message_type_accepted(GetBatteryLevelStatusResponse))
+        self.assertIsNone(dispatcher._feature_message_classes.get_message_class(feature_id, version, 0))
+
+        dispatcher.add_feature_entry(0x04, feature_id, version)
+        self.assertTrue(dispatcher.common_message_queue.is_message_type_accepted(GetBatteryLevelStatusResponse))
+        self.assertTrue(dispatcher.battery_event_message_queue.is_message_type_accepted(
+            BatteryLevelStatusBroadcastEvent))
+        self.assertIs(GetBatteryLevelStatusResponse,
+                      dispatcher._feature_message_classes.get_message_class(feature_id, version, 0))
+        self.assertIs(BatteryLevelStatusBroadcastEvent,
+                      dispatcher._event_message_classes.get_message_class(feature_id, version, 0))
+
+        transport_message = TransportMessage(data=HexList('11FF0401' + '00' * 16), timestamp=0)
+        self.assertIs(dispatcher.common_message_queue, dispatcher.process_interrupt_hidpp(transport_message))
+
+        # The other dispatchers are not affected
+        self.assertFalse(HIDDispatcher().common_message_queue.is_message_type_accepted(GetBatteryLevelStatusResponse))
+    # end def test_lazy_registration
+
+    def test_vlp_lazy_registration(self):
+        """
+        Check the messages of a VLP feature are added to the tables and queues when the feature is registered
+        """
+        dispatcher = HIDDispatcher()
+        response_classes = VLP_FEATURE_MANIFEST[ContextualDisplay.FEATURE_ID].load()[0]
+        self.assertFalse(dispatcher.vlp_common_message_queue.is_message_type_accepted(response_classes[0]))
+
+        dispatcher.add_vlp_feature_entry(0x02, ContextualDisplay.FEATURE_ID, 0)
+        self.assertTrue(dispatcher.vlp_common_message_queue.is_message_type_accepted(response_classes[0]))
+    # end def test_vlp_lazy_registration
+
+    def test_unknown_feature(self):
+        """
+        Check an unknown feature is mapped without message
+        """
+        dispatcher = HIDDispatcher()
+        self.assertFalse(dispatcher.load_feature(0xFFFE))
+        dispatcher.add_feature_entry(0x04, 0xFFFE, 0)
+        self.assertEqual((0xFFFE, 0), dispatcher.get_feature_entry_by_index(0x04))
+        self.assertIsNone(dispatcher.get_first_request_class_from_feature_id_and_version(0xFFFE, 0))
+    # end def test_unknown_feature
+
+    def test_eager_tables(self):
+        """
+        Check a dispatcher loading all the features has the tables and the queue filters of the dispatcher building
+        them in its constructor, saved in ``EAGER_TABLES_FILE_PATH``.
+
+        The VLP Root and VLP Feature Set responses were accepted by no queue in that dispatcher, their tuples being
+        nested in the accepted messages of ``vlp_important_message_queue``: the saved lines give that queue.
+        """
+        dispatcher = HIDDispatcher()
+        dispatcher.load_all_features()
+        with open(EAGER_TABLES_FILE_PATH) as eager_tables_file:
+            expected_lines = eager_tables_file.read().splitlines()
+        # end with
+        self.assertListEqual(expected_lines, get_table_lines(dispatcher))
+    # end def test_eager_tables
+# end class HIDDispatcherManifestTestCase
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -12,7 +12,10 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
+from collections import OrderedDict
+from hashlib import sha256
 from io import BufferedReader
+from os.path import abspath
 from typing import BinaryIO
 from warnings import warn
 
@@ -36,10 +39,64 @@ from pylibrary.tools.numeral import Numeral
 # ------------------------------------------------------------------------------
 # implementation
 # ------------------------------------------------------------------------------
+class DfuFileReports(object):
+    """
+    Define the reports of a DFU file, pre-encoded as ``bytes`` for a device index and a DFU feature index.
+
+    The function index of each report is the one used by the DFU file parser: 4 for the DfuStart command, then the
+    sequence number modulo 4.
+    """
+
+    def __init__(self, dfu_start, command_1, command_2, command_3):
+        """
+        :param dfu_start: DfuStart command report
+        :type dfu_start: ``bytes``
+        :param command_1: Tuples of Command 1 report and its associated program data reports
+        :type command_1: ``list[tuple[bytes, list[bytes]]]``
+        :param command_2: Tuples of Command 2 report and its associated check data reports
+        :type command_2: ``list[tuple[bytes, list[bytes]]]``
+        :param command_3: Command 3 report, ``None`` if not in the DFU file
+        :type command_3: ``bytes`` or ``None``
+        """
+        self.dfu_start = dfu_start
+        self.command_1 = command_1
+        self.command_2 = command_2
+        self.command_3 = command_3
+    # end def __init__
+
+    @classmethod
+    def from_dfu_file_parser(cls, dfu_file_parser):
+        """
+        Encode the commands of a DFU file parser object, for instance after their modification.
+
+        :param dfu_file_parser: The DFU file parser object
+        :type dfu_file_parser: ``DefaultDfuFileParser``
+
+        :return: The reports of the DFU file parser object
+        :rtype: ``DfuFileReports``
+        """
+        return cls(
+            dfu_start=bytes(HexList(dfu_file_parser.dfu_start_command)),
+            command_1=[(bytes(HexList(cmd_1)), [bytes(HexList(program_data)) for program_data in program_data_list])
+                       for (cmd_1, program_data_list) in dfu_file_parser.command_1],
+            command_2=[(bytes(HexList(cmd_2)), [bytes(HexList(check_data)) for check_data in check_data_list])
+                       for (cmd_2, check_data_list) in dfu_file_parser.command_2],
+            command_3=bytes(HexList(dfu_file_parser.command_3)) if dfu_file_parser.command_3 is not None else None)
+    # end def from_dfu_file_parser
+# end class DfuFileReports
+
+
 class DfuFileParser(object):
     """
     Defines the DFU file parser class.
+
+    The reports of the parsed DFU files are cached by path, content hash, device index and DFU feature index, so the
+    same DFU file is read and split once per test session. The cache keeps the ``DFU_FILE_REPORTS_CACHE_SIZE`` most
+    recently used DFU files.
     """
+    DFU_FILE_REPORTS_CACHE_SIZE = 8
+    _dfu_file_reports_cache = OrderedDict()
+
     @classmethod
     def parse_dfu_file(cls, dfu_file_path, device_index, dfu_feature_index, dfu_feature_version):
         """
@@ -57,75 +114,18 @@ class DfuFileParser(object):
         :return: object created from file
         :rtype: ``DfuFileParser``
         """
+        dfu_file_reports = cls.get_dfu_file_reports(dfu_file_path, device_index, dfu_feature_index)
 
-        header_bytes = [Dfu.DEFAULT.REPORT_ID_LONG, device_index, dfu_feature_index, 0x0F]
-
-        with open(dfu_file_path, "rb") as dfu_file:
-            # Get StartDfu command
-            block_bytes = cls._get_block_bytes_from_file(dfu_file, DfuStatusResponse.FUNCTION_INDEX[4], header_bytes)
-
-            if dfu_feature_version == 0:
-                dfu_start_command = DfuStartV0.fromHexList(HexList(block_bytes))
-            elif dfu_feature_version == 1:
-                dfu_start_command = DfuStartV1.fromHexList(HexList(block_bytes))
-            elif dfu_feature_version == 2 or dfu_feature_version == 3:
-                dfu_start_command = DfuStartV2.fromHexList(HexList(block_bytes))
-            else:
-                assert False, "dfu_feature_version parameter (%d) not in accepted version %s" % (dfu_feature_version,
-                                                                                                 str(Dfu.VERSIONS_LIST))
-            # end if
-
-            sequence_number = 1
-            command_1 = []
-            command_2 = []
-            command_3 = None
-            while True:
-                # Get the next command
-                block_bytes = cls._get_block_bytes_from_file(dfu_file, sequence_number % 4, header_bytes)
-
-                # Check is file ended
-                if block_bytes is None:
-                    break
-                # end if
-
-                if block_bytes[len(header_bytes)] == Dfu.CommandId.SUPPLY_PROGRAM_DATA:
-                    # Get Command 1
-                    command_1_cmd = DfuCmdDataXCmd1or2.fromHexList(HexList(block_bytes))
-                    sequence_number += 1
-
-                    # Get program data blocks
-                    number_of_program_data_packets = sequence_number + \
-                        cls.get_number_of_program_data_packets(dfu_start_command, command_1_cmd)
-                    program_data_list = []
-                    while sequence_number < number_of_program_data_packets:
-                        block_bytes = cls._get_block_bytes_from_file(dfu_file, sequence_number % 4, header_bytes)
-                        program_data_list.append(DfuCmdDataXData.fromHexList(HexList(block_bytes)))
-                        sequence_number += 1
-                    # end while
-
-                    command_1.append((command_1_cmd, program_data_list))
-                elif block_bytes[len(header_bytes)] == Dfu.CommandId.SUPPLY_CHECK_DATA:
-                    # Get Command 2
-                    command_2_cmd = DfuCmdDataXCmd1or2.fromHexList(HexList(block_bytes))
-                    sequence_number += 1
-
-                    # Get check data blocks
-                    sequence_number_before_data = sequence_number
-                    check_data_list = []
-                    while sequence_number < (sequence_number_before_data + ceil(command_2_cmd.size.toLong() / 16)):
-                        block_bytes = cls._get_block_bytes_from_file(dfu_file, sequence_number % 4, header_bytes)
-                        check_data_list.append(DfuCmdDataXData.fromHexList(HexList(block_bytes)))
-                        sequence_number += 1
-                    # end while
-
-                    command_2.append((command_2_cmd, check_data_list))
-                elif block_bytes[len(header_bytes)] == Dfu.CommandId.CHECK_AND_VALIDATE_FIRMWARE:
-                    # Get Command 3
-                    command_3 = DfuCmdDataXCmd3.fromHexList(HexList(block_bytes))
-                    sequence_number += 1
-                # end if
-            # end while
-        # end with
+        # The commands are built for each call, as the callers are free to modify them
+        dfu_start_command = cls.get_dfu_start_command(dfu_file_reports.dfu_start, dfu_feature_version)
+        command_1 = [(DfuCmdDataXCmd1or2.fromHexList(HexList(cmd_1)),
+                      [DfuCmdDataXData.fromHexList(HexList(program_data)) for program_data in program_data_list])
+                     for (cmd_1, program_data_list) in dfu_file_reports.command_1]
+        command_2 = [(DfuCmdDataXCmd1or2.fromHexList(HexList(cmd_2)),
+                      [DfuCmdDataXData.fromHexList(HexList(check_data)) for check_data in check_data_list])
+                     for (cmd_2, check_data_list) in dfu_file_reports.command_2]
+        command_3 = DfuCmdDataXCmd3.fromHexList(HexList(dfu_file_reports.command_3)) \
+            if dfu_file_reports.command_3 is not None else None
 
         parser_cls = (LexendDfuFileParser if dfu_start_command.magic_str.ascii_converter() in ["U166_D0A", "U166_IMAGE"]
                       else DefaultDfuFileParser)
@@ -134,28 +134,145 @@ class DfuFileParser(object):
         return parser_object
     # end def parse_dfu_file
 
+    @classmethod
+    def get_dfu_file_reports(cls, dfu_file_path, device_index, dfu_feature_index):
+        """
+        Get the reports of a DFU file, from the cache if this DFU file content was already parsed.
+
+        :param dfu_file_path: Path to the DFU file to parse
+        :type dfu_file_path: ``str``
+        :param device_index: Device Index
+        :type device_index: ``int``
+        :param dfu_feature_index: DFU feature (0x00D0) index
+        :type dfu_feature_index: ``int``
+
+        :return: The reports of the DFU file, shared by all the callers: they shall not be modified
+        :rtype: ``DfuFileReports``
+        """
+        with open(dfu_file_path, "rb") as dfu_file:
+            file_bytes = dfu_file.read()
+        # end with
+
+        key = (abspath(dfu_file_path), sha256(file_bytes).digest(), device_index, dfu_feature_index)
+        dfu_file_reports = cls._dfu_file_reports_cache.get(key)
+        if dfu_file_reports is None:
+            dfu_file_reports = cls._split_dfu_file(file_bytes, device_index, dfu_feature_index)
+            cls._dfu_file_reports_cache[key] = dfu_file_reports
+            while len(cls._dfu_file_reports_cache) > cls.DFU_FILE_REPORTS_CACHE_SIZE:
+                # Forget the least recently used DFU file
+                cls._dfu_file_reports_cache.popitem(last=False)
+            # end while
+        else:
+            cls._dfu_file_reports_cache.move_to_end(key)
+        # end if
+        return dfu_file_reports
+    # end def get_dfu_file_reports
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forget all the parsed DFU files.
+        """
+        cls._dfu_file_reports_cache.clear()
+    # end def clear_cache
+
     @staticmethod
-    def _get_block_bytes_from_file(dfu_file, function_index, header_bytes):
+    def get_dfu_start_command(dfu_start_report, dfu_feature_version):
         """
-        Get a data or command block of 16 bytes from a file.
+        Build the DfuStart command of a DFU file.
 
-        :param dfu_file: File to parse
-        :type dfu_file: ``BufferedReader or BinaryIO``
-        :param function_index: Function index to use in header
-        :type function_index: ``int``
+        :param dfu_start_report: DfuStart command report
+        :type dfu_start_report: ``bytes``
+        :param dfu_feature_version: DFU feature (0x00D0) version
+        :type dfu_feature_version: ``int``
 
-        :return: block of bytes
-        :rtype: ``bytes``
+        :return: The DfuStart command
+        :rtype: ``DfuStartV0|DfuStartV1|DfuStartV2``
         """
-        block_bytes = dfu_file.read(16)
-        if block_bytes is None:
-            return None
-        elif len(block_bytes) == 0:
-            return None
+        if dfu_feature_version == 0:
+            return DfuStartV0.fromHexList(HexList(dfu_start_report))
+        elif dfu_feature_version == 1:
+            return DfuStartV1.fromHexList(HexList(dfu_start_report))
+        elif dfu_feature_version == 2 or dfu_feature_version == 3:
+            return DfuStartV2.fromHexList(HexList(dfu_start_report))
+        else:
+            assert False, "dfu_feature_version parameter (%d) not in accepted version %s" % (dfu_feature_version,
+                                                                                             str(Dfu.VERSIONS_LIST))
         # end if
-        header_bytes[3] = (function_index << 4) | 0x0F
-        return bytes(header_bytes) + block_bytes
-    # end def _get_block_bytes_from_file
+    # end def get_dfu_start_command
+
+    @classmethod
+    def _split_dfu_file(cls, file_bytes, device_index, dfu_feature_index):
+        """
+        Split the content of a DFU file in reports.
+
+        :param file_bytes: Content of the DFU file
+        :type file_bytes: ``bytes``
+        :param device_index: Device Index
+        :type device_index: ``int``
+        :param dfu_feature_index: DFU feature (0x00D0) index
+        :type dfu_feature_index: ``int``
+
+        :return: The reports of the DFU file
+        :rtype: ``DfuFileReports``
+        """
+        # Headers of the reports, by function index
+        headers = [bytes([Dfu.DEFAULT.REPORT_ID_LONG, device_index, dfu_feature_index, (function_index << 4) | 0x0F])
+                   for function_index in range(DfuStatusResponse.FUNCTION_INDEX[4] + 1)]
+        header_size = len(headers[0])
+        file_size = len(file_bytes)
+
+        # Get StartDfu command. The encryption mode is at the same place in all the DfuStart versions
+        dfu_start = headers[DfuStatusResponse.FUNCTION_INDEX[4]] + file_bytes[:16]
+        dfu_start_command = DfuStartV0.fromHexList(HexList(dfu_start))
+
+        offset = 16
+        sequence_number = 1
+        command_1 = []
+        command_2 = []
+        command_3 = None
+        while offset < file_size:
+            # Get the next command
+            block_bytes = headers[sequence_number % 4] + file_bytes[offset:offset + 16]
+            offset += 16
+            command_id = block_bytes[header_size]
+
+            if command_id == Dfu.CommandId.SUPPLY_PROGRAM_DATA:
+                # Get Command 1 and its program data blocks
+                number_of_data_packets = cls.get_number_of_program_data_packets(
+                    dfu_start_command, DfuCmdDataXCmd1or2.fromHexList(HexList(block_bytes)))
+            elif command_id == Dfu.CommandId.SUPPLY_CHECK_DATA:
+                # Get Command 2 and its check data blocks
+                number_of_data_packets = ceil(DfuCmdDataXCmd1or2.fromHexList(HexList(block_bytes)).size.toLong() / 16)
+            else:
+                if command_id == Dfu.CommandId.CHECK_AND_VALIDATE_FIRMWARE:
+                    # Get Command 3
+                    command_3 = block_bytes
+                    sequence_number += 1
+                # end if
+                continue
+            # end if
+            sequence_number += 1
+
+            data_list = []
+            for _ in range(number_of_data_packets):
+                if offset >= file_size:
+                    break
+                # end if
+                data_list.append(headers[sequence_number % 4] + file_bytes[offset:offset + 16])
+                offset += 16
+                sequence_number += 1
+            # end for
+
+            if command_id == Dfu.CommandId.SUPPLY_PROGRAM_DATA:
+                command_1.append((block_bytes, data_list))
+            else:
+                command_2.append((block_bytes, data_list))
+            # end if
+        # end while
+
+        return DfuFileReports(dfu_start, command_1, command_2, command_3)
+    # end def _split_dfu_file
 
     @staticmethod
     def _get_block_bytes_from_hidpp_message(message):
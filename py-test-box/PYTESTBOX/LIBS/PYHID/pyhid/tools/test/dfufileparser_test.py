@@ -15,8 +15,13 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
+from os import remove
+from struct import pack
+from tempfile import mkstemp
+
 from pylibrary.tools.hexlist import HexList, RandHexList
 from pyhid.tools.dfufileparser import DfuFileParser
+from pyhid.tools.dfufileparser import DfuFileReports
 from Crypto.Cipher import AES
 from pylibrary.tools.aes import Aes
 from unittest import TestCase
@@ -30,6 +35,9 @@ AES_16_BYTES_LONG_KEY = 16
 AES_24_BYTES_LONG_KEY = 24
 AES_32_BYTES_LONG_KEY = 32
 
+DEVICE_INDEX = 0xFF
+DFU_FEATURE_INDEX = 0x03
+
 
 # ------------------------------------------------------------------------------
 # implementation
@@ -208,6 +216,100 @@ class DfuFileParserTestCase(TestCase):
 # end class DfuFileParserTestCase
 
 
+class DfuFileParserCacheTestCase(TestCase):
+    """
+    Tests of the DfuFileParser cache of the DFU file reports
+    """
+    def setUp(self):
+        """
+        Write a clear text DFU file: 3 program data packets and 2 check data packets
+        """
+        super().setUp()
+        DfuFileParser.clear_cache()
+        self.program_data = bytes(range(40))
+        self.check_data = bytes(range(0x80, 0xA0))
+        dfu_file_content = bytes([0, 0]) + b'RBM00_D0' + bytes(6)
+        dfu_file_content += pack('>BII7x', 1, 0x4000, len(self.program_data)) + self.program_data + bytes(8)
+        dfu_file_content += pack('>BII7x', 2, 0, len(self.check_data)) + self.check_data
+        dfu_file_content += pack('>B15x', 3)
+        file_descriptor, self.dfu_file_path = mkstemp(suffix='.dfu')
+        with open(file_descriptor, 'wb') as dfu_file:
+            dfu_file.write(dfu_file_content)
+        # end with
+    # end def setUp
+
+    def tearDown(self):
+        """
+        Remove the DFU file
+        """
+        remove(self.dfu_file_path)
+        DfuFileParser.clear_cache()
+        super().tearDown()
+    # end def tearDown
+
+    def test_reports(self):
+        """
+        Tests the reports of a DFU file and their function indexes
+        """
+        dfu_file_reports = DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX)
+
+        self.assertEqual(bytes([0x11, DEVICE_INDEX, DFU_FEATURE_INDEX, 0x4F]), dfu_file_reports.dfu_start[:4])
+        self.assertEqual(1, len(dfu_file_reports.command_1))
+        cmd_1, program_data_list = dfu_file_reports.command_1[0]
+        self.assertEqual(0x1F, cmd_1[3])
+        self.assertEqual([0x2F, 0x3F, 0x0F], [program_data[3] for program_data in program_data_list])
+        self.assertEqual(self.program_data, b''.join(program_data[4:] for program_data in program_data_list)[:40])
+        cmd_2, check_data_list = dfu_file_reports.command_2[0]
+        self.assertEqual(0x1F, cmd_2[3])
+        self.assertEqual(self.check_data, b''.join(check_data[4:] for check_data in check_data_list))
+        self.assertEqual(0x0F, dfu_file_reports.command_3[3])
+    # end def test_reports
+
+    def test_cache(self):
+        """
+        Tests the reports are cached by file content, and the parsed objects are not shared
+        """
+        dfu_file_reports = DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX)
+        self.assertIs(dfu_file_reports,
+                      DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX))
+        self.assertIsNot(dfu_file_reports, DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, 0x04))
+
+        first_parser = DfuFileParser.parse_dfu_file(self.dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX, 0)
+        second_parser = DfuFileParser.parse_dfu_file(self.dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX, 0)
+        first_parser.command_1[0][1][0].data = HexList('00' * 16)
+        self.assertEqual(HexList(self.program_data[:16]), HexList(second_parser.command_1[0][1][0].data))
+        self.assertEqual(dfu_file_reports.command_1,
+                         DfuFileReports.from_dfu_file_parser(second_parser).command_1)
+
+        with open(self.dfu_file_path, 'r+b') as dfu_file:
+            dfu_file.seek(32)
+            dfu_file.write(b'\xFF')
+        # end with
+        changed_dfu_file_reports = DfuFileParser.get_dfu_file_reports(
+            self.dfu_file_path, DEVICE_INDEX, DFU_FEATURE_INDEX)
+        self.assertIsNot(dfu_file_reports, changed_dfu_file_reports)
+        self.assertEqual(0xFF, changed_dfu_file_reports.command_1[0][1][0][4])
+    # end def test_cache
+
+    def test_cache_size(self):
+        """
+        Tests the cache keeps the most recently used DFU files
+        """
+        first_reports = DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, 0)
+        last_reports = DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, 1)
+        for dfu_feature_index in range(2, DfuFileParser.DFU_FILE_REPORTS_CACHE_SIZE + 1):
+            # The first DFU file is used again, the second one is the least recently used
+            self.assertIs(first_reports, DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, 0))
+            DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, dfu_feature_index)
+        # end for
+
+        self.assertEqual(DfuFileParser.DFU_FILE_REPORTS_CACHE_SIZE, len(DfuFileParser._dfu_file_reports_cache))
+        self.assertIs(first_reports, DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, 0))
+        self.assertIsNot(last_reports, DfuFileParser.get_dfu_file_reports(self.dfu_file_path, DEVICE_INDEX, 1))
+    # end def test_cache_size
+# end class DfuFileParserCacheTestCase
+
+
 if __name__ == '__main__':
     from unittest import main
     main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pylibrary.benchmark.crc_benchmark
+:brief: Benchmark of the CRC classes over application images
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+The CRC 16 CCITT and the STM32 CRC 32 of a random image are computed with the former byte by byte table lookups,
+reproduced here, then with the current classes: binascii for the default polynomials, and the slicing-by-8 tables for
+another polynomial.
+
+Usage: python -m pylibrary.benchmark.crc_benchmark [image size in KB]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from random import Random
+from time import perf_counter_ns
+
+from pylibrary.tools.crc import Crc16ccitt
+from pylibrary.tools.crc import Crc32Stm32
+from pylibrary.tools.hexlist import HexList
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_SIZE = 1024  # In KB
+OTHER_POLYNOMIAL_16 = 0x8005
+OTHER_POLYNOMIAL_32 = 0x1EDC6F41
+
+
+def legacy_crc16(data, table, preset):
+    """
+    Former ``Crc16ccitt._compute_crc``: byte by byte, with a type check per byte.
+
+    :param data: The data
+    :type data: ``list[int]``
+    :param table: The CRC table
+    :type table: ``list[int]``
+    :param preset: The preset value
+    :type preset: ``int``
+
+    :return: The CRC value
+    :rtype: ``int``
+    """
+    crc = preset
+    for c in data:
+        if isinstance(c, str):
+            c = ord(c)
+        # end if
+        cc = 0xff & c
+
+        tmp = (crc >> 8) ^ cc
+        crc = (crc << 8) ^ table[tmp & 0xff]
+        crc = crc & 0xffff
+    # end for
+    return crc
+# end def legacy_crc16
+
+
+def legacy_crc32_stm32(data, crc_stm32):
+    """
+    Former ``Crc32Stm32.calculate_crc``: a ``HexList`` per reversed word, then byte by byte.
+
+    :param data: The data
+    :type data: ``HexList``
+    :param crc_stm32: The CRC object, for its table
+    :type crc_stm32: ``Crc32Stm32``
+
+    :return: The CRC value
+    :rtype: ``int``
+    """
+    return crc_stm32.crc32(crc_stm32.sort_data(data))
+# end def legacy_crc32_stm32
+
+
+def measure(function, *args):
+    """
+    Measure the duration of a function call.
+
+    :param function: The function to call
+    :type function: ``callable``
+    :param args: The arguments of the function
+    :type args: ``tuple``
+
+    :return: The result of the function and the duration in ns
+    :rtype: ``tuple[object, int]``
+    """
+    start = perf_counter_ns()
+    result = function(*args)
+    return result, perf_counter_ns() - start
+# end def measure
+
+
+def compute_crc16(data, polynomial=Crc16ccitt.DEFAULT_POLYNOMIAL):
+    """
+    Compute a CRC 16 with the current class.
+
+    :param data: The data
+    :type data: ``bytes``
+    :param polynomial: The polynomial - OPTIONAL
+    :type polynomial: ``int``
+
+    :return: The CRC value
+    :rtype: ``int``
+    """
+    crc = Crc16ccitt(polynomial=polynomial)
+    crc.start_crc(data)
+    return crc.crc
+# end def compute_crc16
+
+
+def compute_crc32_stm32(data, polynomial=Crc32Stm32.DEFAULT_POLYNOMIAL):
+    """
+    Compute a STM32 CRC 32 with the current class.
+
+    :param data: The data
+    :type data: ``bytes``
+    :param polynomial: The polynomial - OPTIONAL
+    :type polynomial: ``int``
+
+    :return: The CRC value
+    :rtype: ``int``
+    """
+    crc = Crc32Stm32(polynomial=polynomial)
+    crc.start_crc(data)
+    return crc.crc
+# end def compute_crc32_stm32
+
+
+def main(size=DEFAULT_SIZE):
+    """
+    Run the benchmark and print the results.
+
+    :param size: The image size in KB
+    :type size: ``int``
+    """
+    random = Random(0)
+    data = bytes(random.getrandbits(8) for _ in range(size * 1024))
+    hex_list_data = HexList(data)
+
+    results = []
+    for name, polynomial in (('CRC 16 CCITT', Crc16ccitt.DEFAULT_POLYNOMIAL), ('CRC 16 other', OTHER_POLYNOMIAL_16)):
+        crc16 = Crc16ccitt(polynomial=polynomial)
+        legacy_crc, legacy_time = measure(legacy_crc16, list(data), crc16._tab, crc16.preset)
+        crc, duration = measure(compute_crc16, data, polynomial)
+        assert legacy_crc == crc, f"Wrong {name}"
+        results.append((name, legacy_time, duration))
+    # end for
+
+    for name, polynomial in (('CRC 32 STM32', Crc32Stm32.DEFAULT_POLYNOMIAL), ('CRC 32 other', OTHER_POLYNOMIAL_32)):
+        legacy_crc, legacy_time = measure(legacy_crc32_stm32, hex_list_data, Crc32Stm32(polynomial=polynomial))
+        crc, duration = measure(compute_crc32_stm32, data, polynomial)
+        assert legacy_crc == crc, f"Wrong {name}"
+        results.append((name, legacy_time, duration))
+    # end for
+
+    print(f'Image of {size} KB')
+    for name, legacy_time, duration in results:
+        print(f'{name}: legacy {legacy_time / 1e6:8.1f} ms, current {duration / 1e6:8.1f} ms, '
+              f'speedup x{legacy_time / duration:.1f}')
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pylibrary.benchmark.hexlist_benchmark
+:brief: Benchmark of the HexList operations on realistic payload sizes
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+The construction, slicing, ``toLong``, string formatting and @e xor of ``HexList`` are compared with the element by
+element implementations they replace and with the same operation on ``bytes``, from a HID++ long report to a flash
+dump. The slicing is not changed, it is compared with ``bytes`` only.
+
+Usage: python -m pylibrary.benchmark.hexlist_benchmark [iterations]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from array import array
+from binascii import a2b_hex
+from binascii import b2a_hex
+from functools import reduce
+from os import urandom
+from struct import pack
+from time import perf_counter_ns
+
+from pylibrary.tools.hexlist import HexList
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_ITERATIONS = 3
+# (name, size in bytes): HID++ long report, BLE packet, flash page, flash dump
+PAYLOAD_SIZES = (('HID++ report', 20), ('BLE packet', 244), ('flash page', 4096), ('flash dump', 1024 * 1024))
+# Number of operations timed at once, for a total of about 64 kB processed per measure
+MINIMUM_BYTES_PER_MEASURE = 64 * 1024
+# The legacy toLong is quadratic, it is not measured above this size
+LEGACY_TO_LONG_MAXIMUM_SIZE = 64 * 1024
+
+
+def legacy_from_string(value):
+    """
+    Construction from a string, as done by the parsers before the fast path.
+
+    :param value: The hexadecimal string
+    :type value: ``str``
+
+    :return: The HexList
+    :rtype: ``HexList``
+    """
+    parsed = array("B")
+    parsed.frombytes(a2b_hex(value.replace(' ', '')))
+    result = HexList()
+    for item in parsed:
+        result.append(item)
+    # end for
+    return result
+# end def legacy_from_string
+
+
+def legacy_from_iterable(value):
+    """
+    Construction from bytes or a list, as done by the iterable parser before the fast paths.
+
+    :param value: The bytes or list of integers
+    :type value: ``bytes`` or ``list``
+
+    :return: The HexList
+    :rtype: ``HexList``
+    """
+    result = HexList()
+    for item in value:
+        result.extendRaw(HexList(item))
+    # end for
+    return result
+# end def legacy_from_iterable
+
+
+def legacy_to_long(value):
+    """
+    Conversion to an integer, byte by byte.
+
+    :param value: The HexList
+    :type value: ``HexList``
+
+    :return: The integer
+    :rtype: ``int``
+    """
+    return reduce(lambda x=0, y=0: x * 256 + y, value, 0)
+# end def legacy_to_long
+
+
+def legacy_to_str(value):
+    """
+    String formatting through ``struct.pack``.
+
+    :param value: The HexList
+    :type value: ``HexList``
+
+    :return: The hexadecimal string
+    :rtype: ``str``
+    """
+    return b2a_hex(pack('%dB' % (len(value),), *value)).upper().decode('utf8')
+# end def legacy_to_str
+
+
+def legacy_xor(value, other):
+    """
+    @e xor byte by byte.
+
+    :param value: The first operand
+    :type value: ``HexList``
+    :param other: The second operand
+    :type other: ``HexList``
+
+    :return: The result
+    :rtype: ``HexList``
+    """
+    result = HexList(other)
+    for index in range(-len(value), 0):
+        list.__setitem__(result, index, result[index] ^ value[index])
+    # end for
+    return result
+# end def legacy_xor
+
+
+def measure(method, size, iterations):
+    """
+    Measure an operation.
+
+    :param method: The operation, without parameter
+    :type method: ``callable type``
+    :param size: The payload size in bytes
+    :type size: ``int``
+    :param iterations: Number of measures, the best one is kept
+    :type iterations: ``int``
+
+    :return: The time of one operation, in ns
+    :rtype: ``float``
+    """
+    count = max(MINIMUM_BYTES_PER_MEASURE // size, 1)
+    best = None
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        for _ in range(count):
+            method()
+        # end for
+        elapsed = (perf_counter_ns() - start) / count
+        best = elapsed if best is None else min(best, elapsed)
+    # end for
+    return best
+# end def measure
+
+
+def format_time(value):
+    """
+    Format a time with a suited unit.
+
+    :param value: The time in ns
+    :type value: ``float``
+
+    :return: The formatted time
+    :rtype: ``str``
+    """
+    if value >= 1e6:
+        return f'{value / 1e6:8.2f} ms'
+    elif value >= 1e3:
+        return f'{value / 1e3:8.2f} us'
+    # end if
+    return f'{value:8.0f} ns'
+# end def format_time
+
+
+def main(iterations=DEFAULT_ITERATIONS):
+    """
+    Run the benchmark and print the results.
+
+    :param iterations: Number of measures of each operation, the best one is kept
+    :type iterations: ``int``
+    """
+    print(f'{iterations} iterations, best time per operation: legacy / HexList (speedup) / bytes')
+    for name, size in PAYLOAD_SIZES:
+        raw = urandom(size)
+        other_raw = urandom(size)
+        string = raw.hex()
+        integers = list(raw)
+        value = HexList(raw)
+        other = HexList(other_raw)
+        half = size // 2
+
+        operations = (
+            ('from string', lambda: legacy_from_string(string), lambda: HexList(string),
+             lambda: bytes.fromhex(string)),
+            ('from bytes', lambda: legacy_from_iterable(raw), lambda: HexList(raw), lambda: bytearray(raw)),
+            ('from list', lambda: legacy_from_iterable(integers), lambda: HexList(integers), lambda: bytes(integers)),
+            ('slice', None, lambda: value[half:], lambda: memoryview(raw)[half:]),
+            ('toLong', (lambda: legacy_to_long(value)) if size <= LEGACY_TO_LONG_MAXIMUM_SIZE else None, value.toLong,
+             lambda: int.from_bytes(raw, 'big')),
+            ('str', lambda: legacy_to_str(value), value.__str__, lambda: raw.hex().upper()),
+            ('xor', lambda: legacy_xor(value, other), lambda: value ^ other,
+             lambda: (int.from_bytes(raw, 'big') ^ int.from_bytes(other_raw, 'big')).to_bytes(size, 'big')),
+        )
+
+        assert legacy_from_string(string) == HexList(string) == legacy_from_iterable(raw) == HexList(integers)
+        assert legacy_to_str(value) == str(value)
+        assert size > LEGACY_TO_LONG_MAXIMUM_SIZE or legacy_to_long(value) == value.toLong()
+        assert legacy_xor(value, other) == value ^ other
+
+        print(f'{name} ({size} bytes)')
+        for operation, legacy_method, method, bytes_method in operations:
+            hexlist_time = measure(method, size, iterations)
+            bytes_time = measure(bytes_method, size, iterations)
+            if legacy_method is not None:
+                legacy_time = measure(legacy_method, size, iterations)
+                print(f'  {operation:12s} {format_time(legacy_time)} / {format_time(hexlist_time)} '
+                      f'(x{legacy_time / hexlist_time:6.1f}) / {format_time(bytes_time)}')
+            else:
+                print(f'  {operation:12s} {"-":>11s} / {format_time(hexlist_time)} {"":9s} / '
+                      f'{format_time(bytes_time)}')
+            # end if
+        # end for
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
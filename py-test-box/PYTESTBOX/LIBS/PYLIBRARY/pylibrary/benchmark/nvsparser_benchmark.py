@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pylibrary.benchmark.nvsparser_benchmark
+:brief: Benchmark of the chunk ID based NVS parsing on multi-zone NVS images
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+An NVS image of several zones is built, each zone having an active bank filled with small chunks and an erased
+bank. The parsing of the memory read (per byte ``IntelHex`` and re-slicing of the rest of the bank after each chunk)
+is compared with the parsing by offset of the raw bytes, then the chunk history lookups by linear scan of the bank are
+compared with the chunk ID index of the bank.
+
+Usage: python -m pylibrary.benchmark.nvsparser_benchmark [zone count]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from random import Random
+from time import perf_counter_ns
+
+from intelhex import IntelHex
+
+from pylibrary.tools.chunkidmaps import CHUNK_ID_MAP_QUARK
+from pylibrary.tools.crc import Crc16ccitt
+from pylibrary.tools.nvsparser import IdBasedNvsParser
+from pylibrary.tools.nvsparser import NvsZone
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_ZONE_COUNT = 8
+BANK_LENGTH = 8 * 1024
+NVS_START_ADDRESS = 0x3E000
+# Chunk IDs written in the banks, the ID 1 is the active bank header
+CHUNK_IDS = range(0x10, 0x30)
+# Number of chunk history lookups per chunk ID
+LOOKUP_COUNT = 10
+
+
+def get_chunk(chunk_id, data, word_size):
+    """
+    Build a chunk with its header: ID, length and CRC.
+
+    :param chunk_id: The chunk ID
+    :type chunk_id: ``int``
+    :param data: The chunk data
+    :type data: ``bytes``
+    :param word_size: The NVS word size
+    :type word_size: ``int``
+
+    :return: The raw chunk
+    :rtype: ``bytes``
+    """
+    crc = Crc16ccitt()
+    crc.start_crc(list(data) + [chunk_id, len(data)])
+    header = bytes([chunk_id, len(data)]) + crc.crc.to_bytes(2, 'little')
+    return (header.ljust(word_size, b'\x00') + data).ljust(word_size + -(-len(data) // word_size) * word_size, b'\x00')
+# end def get_chunk
+
+
+def get_nvs_image(zone_count):
+    """
+    Build the NVS image: each zone has an active bank three quarters full and an erased bank.
+
+    :param zone_count: Number of zones
+    :type zone_count: ``int``
+
+    :return: The NVS image
+    :rtype: ``bytes``
+    """
+    random = Random(0)
+    word_size = CHUNK_ID_MAP_QUARK["NVS_WORD_SIZE"]
+    image = bytearray()
+    for _ in range(zone_count):
+        bank = bytearray(bytes(CHUNK_ID_MAP_QUARK["ACTIVE_BANK_HDR"][:2])
+                         + CHUNK_ID_MAP_QUARK["ACTIVE_BANK_HDR"][2].to_bytes(2, 'little'))
+        while len(bank) < BANK_LENGTH * 3 // 4:
+            data = bytes(random.randrange(256) for _ in range(random.choice((1, 4, 6, 16))))
+            bank += get_chunk(random.choice(CHUNK_IDS), data, word_size)
+        # end while
+        image += bank.ljust(BANK_LENGTH, b'\xFF') + b'\xFF' * BANK_LENGTH
+    # end for
+    return bytes(image)
+# end def get_nvs_image
+
+
+def legacy_from_memory_read(nvs_data):
+    """
+    Parse the NVS as done before the parsing by offset: per byte ``IntelHex`` then re-slicing of the rest of the bank.
+
+    :param nvs_data: The NVS image
+    :type nvs_data: ``bytes``
+
+    :return: The zone list
+    :rtype: ``list[NvsZone]``
+    """
+    hex_file = IntelHex(dict(zip(range(NVS_START_ADDRESS, NVS_START_ADDRESS + len(nvs_data)), nvs_data)))
+    zone_list = []
+    for (start, stop) in hex_file.segments():
+        array_to_parse = hex_file.gets(addr=start, length=stop - start)
+        while len(array_to_parse) > 0:
+            zone, array_to_parse = NvsZone.from_hex_array(
+                array_to_parse=array_to_parse,
+                chunk_from_hex_array_method=IdBasedNvsParser.chunk_from_hex_array,
+                bank_length=BANK_LENGTH,
+                zone_number=len(zone_list),
+                start_address=start,
+                chunk_id_map=CHUNK_ID_MAP_QUARK)
+            zone_list.append(zone)
+            start += BANK_LENGTH * 2
+        # end while
+    # end for
+    return zone_list
+# end def legacy_from_memory_read
+
+
+def legacy_get_chunk_history(bank, chunk_id):
+    """
+    Get the chunk history by a linear scan of the bank.
+
+    :param bank: The bank
+    :type bank: ``NvsBank``
+    :param chunk_id: The chunk ID
+    :type chunk_id: ``int``
+
+    :return: The chunk history
+    :rtype: ``list[NvsChunk]``
+    """
+    return [chunk for chunk in bank.chunks if chunk.chunk_id == chunk_id]
+# end def legacy_get_chunk_history
+
+
+def measure_lookups(zone_list, get_chunk_history):
+    """
+    Measure the chunk history lookups in the active banks.
+
+    :param zone_list: The zone list
+    :type zone_list: ``list[NvsZone]``
+    :param get_chunk_history: The function giving the chunk history of a bank
+    :type get_chunk_history: ``function``
+
+    :return: The total time in ns and the history lengths
+    :rtype: ``tuple[int, list[int]]``
+    """
+    lengths = []
+    start = perf_counter_ns()
+    for zone in zone_list:
+        bank = zone.get_active_bank()
+        for _ in range(LOOKUP_COUNT):
+            for chunk_id in CHUNK_IDS:
+                lengths.append(len(get_chunk_history(bank, chunk_id)))
+            # end for
+        # end for
+    # end for
+    return perf_counter_ns() - start, lengths
+# end def measure_lookups
+
+
+def main(count=DEFAULT_ZONE_COUNT):
+    """
+    Run the benchmark and print the results.
+
+    :param count: Number of zones
+    :type count: ``int``
+    """
+    nvs_data = get_nvs_image(count)
+
+    start = perf_counter_ns()
+    legacy_zone_list = legacy_from_memory_read(nvs_data)
+    legacy_parse_time = perf_counter_ns() - start
+
+    start = perf_counter_ns()
+    zone_list = IdBasedNvsParser.from_bytes(nvs_data, NVS_START_ADDRESS, BANK_LENGTH, CHUNK_ID_MAP_QUARK).zone_list
+    parse_time = perf_counter_ns() - start
+
+    assert [zone.to_hex_array() for zone in legacy_zone_list] == [zone.to_hex_array() for zone in zone_list], \
+        "The parsing by offset does not give the legacy chunks"
+
+    legacy_lookup_time, legacy_lengths = measure_lookups(legacy_zone_list, legacy_get_chunk_history)
+    lookup_time, lengths = measure_lookups(zone_list, lambda bank, chunk_id: bank.get_chunk_history(chunk_id))
+    assert legacy_lengths == lengths, "The chunk ID index does not give the legacy chunk history"
+
+    chunk_count = sum(len(zone.get_active_bank().chunks) for zone in zone_list)
+    print(f'{count} zones of 2 x {BANK_LENGTH} bytes, {chunk_count} chunks')
+    print(f'parsing        : legacy {legacy_parse_time / 1e6:9.1f} ms, by offset {parse_time / 1e6:9.1f} ms, '
+          f'speedup x{legacy_parse_time / parse_time:.1f}')
+    print(f'chunk history  : legacy {legacy_lookup_time / len(lengths) / 1000:9.2f} us, indexed '
+          f'{lookup_time / len(lengths) / 1000:9.2f} us, speedup x{legacy_lookup_time / lookup_time:.1f}')
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
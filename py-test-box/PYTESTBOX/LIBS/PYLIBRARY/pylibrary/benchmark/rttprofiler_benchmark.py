@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pylibrary.benchmark.rttprofiler_benchmark
+:brief: Benchmark of the RTT profiler parsing and statistics on multi-megabyte streams
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A captured RTT stream of profiler records, with some garbage and sequence gaps, is fed by chunks of 1024 bytes as
+read by the ``ProfilerExecutor``. The parsing of the legacy parser (list buffer scanned byte by byte) is compared with
+the ``bytearray`` parser, then the statistics of the legacy profiler (loops over the tag indexes) are compared with the
+vectorized profiler.
+
+Usage: python -m pylibrary.benchmark.rttprofiler_benchmark [stream size in MB]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import collections
+import sys
+import warnings
+from random import Random
+from time import perf_counter_ns
+
+from pylibrary.tools.rttprofiler import FOOTER
+from pylibrary.tools.rttprofiler import HEADER
+from pylibrary.tools.rttprofiler import MARKER_SIZE
+from pylibrary.tools.rttprofiler import PAYLOAD_SIZE
+from pylibrary.tools.rttprofiler import Parser
+from pylibrary.tools.rttprofiler import Profiler
+from pylibrary.tools.rttprofiler import RECORD_SIZE
+from pylibrary.tools.rttprofiler import RelativeMeasure
+from pylibrary.tools.rttprofiler import counts_to_msec
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_STREAM_SIZE = 4
+CHUNK_SIZE = 1024
+STARTUP_TAG = 0x0444
+LOOP_START_TAG = 0x0189
+LOOP_END_TAG = 0x0313
+RELATIVE_MEASUREMENTS = (RelativeMeasure(LOOP_START_TAG, LOOP_END_TAG), RelativeMeasure(LOOP_START_TAG, LOOP_START_TAG))
+
+
+def get_stream(size):
+    """
+    Build an RTT stream of profiler records: main loop start and end tags, with some garbage and sequence gaps.
+
+    :param size: The stream size in bytes
+    :type size: ``int``
+
+    :return: The stream
+    :rtype: ``bytes``
+    """
+    random = Random(0)
+    stream = bytearray()
+    seq_number = 0
+    cycles = 0
+    while len(stream) < size:
+        if random.random() < 0.001:
+            stream += bytes(random.randrange(256) for _ in range(random.randrange(1, 16)))
+            seq_number += random.randrange(1, 4)
+        # end if
+        for tag in (LOOP_START_TAG, LOOP_END_TAG):
+            cycles = (cycles + random.randrange(100, 2000)) & 0xFFFFFFFF
+            stream += (HEADER.to_bytes(MARKER_SIZE, 'little') + tag.to_bytes(2, 'little') + cycles.to_bytes(4, 'little')
+                       + (seq_number & 0xFFFF).to_bytes(2, 'little') + FOOTER.to_bytes(MARKER_SIZE, 'little'))
+            seq_number += 1
+        # end for
+    # end while
+    return bytes(stream)
+# end def get_stream
+
+
+def legacy_binary_stream_to_records(tmp_in_data, in_data):
+    """
+    Parse a chunk as done before the ``bytearray`` parser: list buffer scanned byte by byte and re-sliced after each
+    record.
+
+    :param tmp_in_data: The list buffer, updated
+    :type tmp_in_data: ``list[int]``
+    :param in_data: The chunk
+    :type in_data: ``bytes``
+
+    :return: The raw records
+    :rtype: ``list[tuple]``
+    """
+    tmp_in_data.extend(in_data)
+    out_data = []
+    while len(tmp_in_data) >= RECORD_SIZE:
+        i = 0
+        record_found = False
+        for i in range(len(tmp_in_data) - MARKER_SIZE + 1):
+            footer = int.from_bytes(tmp_in_data[i:i + MARKER_SIZE], byteorder='little', signed=False)
+            if footer == FOOTER:
+                rec_limit = i + MARKER_SIZE
+                if rec_limit >= RECORD_SIZE:
+                    header = int.from_bytes(tmp_in_data[rec_limit - RECORD_SIZE:rec_limit - (RECORD_SIZE - MARKER_SIZE)],
+                                            byteorder='little', signed=False)
+                    if header == HEADER:
+                        record_found = True
+                        payload_start = rec_limit - (RECORD_SIZE - MARKER_SIZE)
+                        out_data.append(tuple(tmp_in_data[payload_start:payload_start + PAYLOAD_SIZE]))
+                        tmp_in_data[:] = tmp_in_data[rec_limit:]
+                    # end if
+                    break
+                # end if
+            # end if
+        # end for
+        if not record_found:
+            tmp_in_data[:] = tmp_in_data[(i - (RECORD_SIZE - MARKER_SIZE - 1)):]
+        # end if
+    # end while
+    return out_data
+# end def legacy_binary_stream_to_records
+
+
+def legacy_get_statistics(records, relative_measurements):
+    """
+    Compute the statistics as done before the vectorized profiler: tag indexes per sequence section, then loops over
+    the end tags and backward searches of the start tags.
+
+    :param records: The profiler records
+    :type records: ``tuple[ProfilerRecord]``
+    :param relative_measurements: The tag pairs
+    :type relative_measurements: ``tuple[RelativeMeasure]``
+
+    :return: The minimum, maximum and average durations in ms per tag pair
+    :rtype: ``dict``
+    """
+    tags_index = collections.defaultdict(dict)
+    section = 0
+    seq_number = records[0].seq_number
+    tags_index[0] = collections.defaultdict(list)
+    for idx, record in enumerate(records):
+        if record.seq_number != seq_number:
+            section += 1
+            tags_index[section] = collections.defaultdict(list)
+        # end if
+        seq_number = (record.seq_number + 1) & 0xFFFF
+        tags_index[section][record.tag].append(idx)
+    # end for
+
+    statistics = {}
+    for rel in relative_measurements:
+        durations = []
+        for tags_dicts in tags_index.values():
+            for idx_end in tags_dicts[rel.end]:
+                for idx_start in reversed(tags_dicts[rel.start]):
+                    if idx_start < idx_end:
+                        durations.append((records[idx_end].cycles - records[idx_start].cycles) & 0xFFFFFFFF)
+                        break
+                    # end if
+                # end for
+            # end for
+        # end for
+        statistics[rel] = (counts_to_msec(min(durations)), counts_to_msec(max(durations)),
+                           counts_to_msec(sum(durations) / len(durations)))
+    # end for
+    return statistics
+# end def legacy_get_statistics
+
+
+def main(count=DEFAULT_STREAM_SIZE):
+    """
+    Run the benchmark and print the results.
+
+    :param count: The stream size in MB
+    :type count: ``int``
+    """
+    stream = get_stream(count * 1024 * 1024)
+    chunks = [stream[offset:offset + CHUNK_SIZE] for offset in range(0, len(stream), CHUNK_SIZE)]
+
+    start = perf_counter_ns()
+    tmp_in_data = []
+    legacy_records = []
+    for chunk in chunks:
+        legacy_records.extend(Parser.parse_records(legacy_binary_stream_to_records(tmp_in_data, chunk)))
+    # end for
+    legacy_parse_time = perf_counter_ns() - start
+
+    start = perf_counter_ns()
+    parser = Parser()
+    profiler = Profiler(startup_tag=STARTUP_TAG, startup_gap_idx=len(legacy_records))
+    for chunk in chunks:
+        profiler.add_data(parser.binary_stream_to_array(chunk))
+    # end for
+    parse_time = perf_counter_ns() - start
+
+    records = profiler._in_records
+    assert [(record.tag, record.cycles, record.seq_number) for record in legacy_records] == records.tolist(), \
+        "The bytearray parser does not give the legacy records"
+
+    start = perf_counter_ns()
+    legacy_statistics = legacy_get_statistics(legacy_records, RELATIVE_MEASUREMENTS)
+    legacy_statistics_time = perf_counter_ns() - start
+
+    start = perf_counter_ns()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        profiler.process_data()
+    # end with
+    statistics = profiler.get_statistics(RELATIVE_MEASUREMENTS)
+    statistics_time = perf_counter_ns() - start
+
+    for rel in RELATIVE_MEASUREMENTS:
+        assert legacy_statistics[rel] == (statistics[rel].min, statistics[rel].max, statistics[rel].average), \
+            "The vectorized profiler does not give the legacy statistics"
+    # end for
+
+    mb_size = len(stream) / (1024 * 1024)
+    print(f'{mb_size:.1f} MB stream in {len(chunks)} chunks, {len(records)} records')
+    print(f'parsing    : legacy {legacy_parse_time / 1e6:9.1f} ms ({mb_size / legacy_parse_time * 1e9:6.1f} MB/s), '
+          f'bytearray {parse_time / 1e6:9.1f} ms ({mb_size / parse_time * 1e9:6.1f} MB/s), '
+          f'speedup x{legacy_parse_time / parse_time:.1f}')
+    print(f'statistics : legacy {legacy_statistics_time / 1e6:9.1f} ms, vectorized {statistics_time / 1e6:9.1f} ms, '
+          f'speedup x{legacy_statistics_time / statistics_time:.1f}')
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
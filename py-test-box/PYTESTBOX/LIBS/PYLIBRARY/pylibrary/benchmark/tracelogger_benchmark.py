@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------
+"""
+:package: pylibrary.benchmark.tracelogger_benchmark
+:brief: Benchmark of the trace logger cost in the traced thread
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A packet trace, like the interrupt read ones, is logged many times. The time spent in the calling thread is measured
+for a disabled trace level and for an enabled one written in a file, with the legacy trace logger (lock, three owner
+lookups and a write per call), the unbuffered trace logger and the buffered trace logger.
+
+Usage: python -m pylibrary.benchmark.tracelogger_benchmark [trace count]
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+import sys
+from os import devnull
+from time import perf_counter_ns
+from weakref import ref
+
+from pylibrary.system.tracelogger import DummyOwner
+from pylibrary.system.tracelogger import TIMESTAMP_UNIT
+from pylibrary.system.tracelogger import TIMESTAMP_UNIT_DIVIDER_MAP
+from pylibrary.system.tracelogger import TraceLevel
+from pylibrary.system.tracelogger import TraceLogger
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEFAULT_TRACE_COUNT = 100000
+READER_NAME = 'Device 1-2.3'
+ENDPOINT = 0x83
+
+
+def legacy_log_trace(trace_logger, subscription_owner, message, trace_level=TraceLevel.NO_TRACE, end_line="\n"):
+    """
+    Trace as done before the buffered trace logger: under the lock, with three owner lookups and a write per call.
+
+    :param trace_logger: The trace logger
+    :type trace_logger: ``TraceLogger``
+    :param subscription_owner: Subscription owner to use
+    :type subscription_owner: ``object``
+    :param message: Message to trace
+    :type message: ``str``
+    :param trace_level: The trace level of this message - OPTIONAL
+    :type trace_level: ``TraceLevel`` or ``int``
+    :param end_line: End line string - OPTIONAL
+    :type end_line: ``str``
+    """
+    with trace_logger._lock:
+        timestamp = perf_counter_ns()
+        if subscription_owner is None or ref(subscription_owner) not in trace_logger._trace_table:
+            return
+        # end if
+        if trace_logger._trace_table[ref(subscription_owner)].level == TraceLevel.NO_TRACE or \
+                trace_level == TraceLevel.NO_TRACE or \
+                trace_level > trace_logger._trace_table[ref(subscription_owner)].level:
+            return
+        # end if
+        str_to_write = f"[{trace_logger._trace_table[ref(subscription_owner)].name}]" \
+                       f"[{trace_level.name}]" \
+                       f"[{timestamp / TIMESTAMP_UNIT_DIVIDER_MAP[TIMESTAMP_UNIT]:.2f}{TIMESTAMP_UNIT}]" \
+                       f" {message}{end_line}"
+        trace_logger._trace_table[ref(subscription_owner)].output.write(str_to_write)
+    # end with
+# end def legacy_log_trace
+
+
+def measure(trace_logger, count, trace_level, legacy):
+    """
+    Measure the time spent in the calling thread to log packet traces.
+
+    :param trace_logger: The trace logger
+    :type trace_logger: ``TraceLogger``
+    :param count: Number of traces
+    :type count: ``int``
+    :param trace_level: The trace level of the owner
+    :type trace_level: ``TraceLevel``
+    :param legacy: Flag indicating to trace as done before the buffered trace logger
+    :type legacy: ``bool``
+
+    :return: The time per trace in ns, in the calling thread then including the flush
+    :rtype: ``tuple[float, float]``
+    """
+    owner = DummyOwner()
+    trace_logger.subscribe(subscription_owner=owner, trace_level=trace_level, trace_name='InterruptPollingTask')
+    with open(devnull, 'w') as output:
+        trace_logger._trace_table[ref(owner)].output = output
+
+        start = perf_counter_ns()
+        if legacy:
+            for _ in range(count):
+                legacy_log_trace(trace_logger, owner,
+                                 f"{READER_NAME}, Interrupt read on endpoint 0x{ENDPOINT:02X} started",
+                                 trace_level=TraceLevel.EXTRA_DEBUG)
+            # end for
+        else:
+            for _ in range(count):
+                trace_logger.log_trace(owner, "{}, Interrupt read on endpoint 0x{:02X} started",
+                                       trace_level=TraceLevel.EXTRA_DEBUG, args=(READER_NAME, ENDPOINT))
+            # end for
+        # end if
+        caller_time = perf_counter_ns() - start
+        trace_logger.flush()
+        total_time = perf_counter_ns() - start
+
+        trace_logger._trace_table[ref(owner)].output = sys.stdout
+    # end with
+    trace_logger.unsubscribe(owner)
+    return caller_time / count, total_time / count
+# end def measure
+
+
+def main(count=DEFAULT_TRACE_COUNT):
+    """
+    Run the benchmark and print the results.
+
+    :param count: Number of traces
+    :type count: ``int``
+    """
+    print(f'{count} packet traces, time per trace in the traced thread (and including the flush)')
+    for trace_level in (TraceLevel.NO_TRACE, TraceLevel.EXTRA_DEBUG):
+        legacy_time, _ = measure(TraceLogger(buffered=False), count, trace_level, legacy=True)
+        unbuffered_time, _ = measure(TraceLogger(buffered=False), count, trace_level, legacy=False)
+        # The ring buffer keeps all the traces until the final flush
+        buffered_time, buffered_total_time = measure(
+            TraceLogger(buffered=True, ring_size=count, flush_period=3600), count, trace_level, legacy=False)
+        print(f'{trace_level.name:12}: legacy {legacy_time:8.0f} ns, unbuffered {unbuffered_time:8.0f} ns, '
+              f'buffered {buffered_time:8.0f} ns ({buffered_total_time:8.0f} ns), '
+              f'speedup x{legacy_time / buffered_time:.1f}')
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
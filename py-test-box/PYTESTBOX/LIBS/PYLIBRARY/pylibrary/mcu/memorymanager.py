@@ -14,6 +14,7 @@
 # ------------------------------------------------------------------------------
 from copy import deepcopy
 from enum import IntEnum
+from time import perf_counter
 
 from pylibrary.mcu.connectchunks import BootloaderConnectIdChunk
 from pylibrary.mcu.connectchunks import ConnectIdBlePro3HostsChunk
@@ -54,6 +55,10 @@ class MemoryManager(NvsManagerInterface):
         NVS_ENCRYPTION_KEY = 0
     # end class SIZE
 
+    # Write only the changed NVS flash pages when the debugger supports it, instead of reloading the whole firmware.
+    # Opt-in, the whole reload stays the reference
+    USE_NVS_PAGE_WRITE = False
+
     def __init__(self, debugger):
         """
         :param debugger: The debugger object to use to read memory
@@ -65,6 +70,9 @@ class MemoryManager(NvsManagerInterface):
         self.nvs_parser = None
         self.backup_nvs_parser = None
         self.chunk_id_map = None
+        # Duration of the last whole NVS reload in seconds, to report the time saved by the NVS flash page write
+        self.full_nvs_write_time = None
+        self.last_nvs_write_report = None
         self.nvs_encryption_key = None if self.ADDRESS.NVS_ENCRYPTION_KEY is None else self._set_nvs_encryption_key()
     # end def __init__
 
@@ -106,7 +114,10 @@ class MemoryManager(NvsManagerInterface):
 
     def load_nvs(self, backup=False, no_reset=False, **kwargs):
         """
-        Store the modified NVS content on the target using the debugger
+        Store the modified NVS content on the target using the debugger.
+
+        If the debugger can write the NVS flash pages (``NVS_PAGE_SIZE`` defined), only the pages which differ from
+        the device content are written, otherwise the NVS is reloaded with the whole firmware.
 
         :param backup: Flag enabling to reload the copy of the initial NVS - OPTIONAL
         :type backup: ``bool``
@@ -114,20 +125,33 @@ class MemoryManager(NvsManagerInterface):
         :type no_reset: ``bool``
         :param kwargs: Keyword arguments
         :type kwargs: ``dict``
+
+        :return: The write report if only the changed NVS flash pages are written, ``None`` otherwise
+        :rtype: ``NvsWriteReport`` or ``None``
         """
         if backup and self.backup_nvs_parser is not None:
-            if not no_reset:
-                self.debugger.reload_file(nvs_hex_file=self.backup_nvs_parser.to_hex_file())
-            else:
-                self.debugger.reload_nvs_no_device_reset(nvs_hex_file=self.backup_nvs_parser.to_hex_file())
-            # end if
+            nvs_parser = self.backup_nvs_parser
         elif self.nvs_parser is not None:
-            if not no_reset:
-                self.debugger.reload_file(nvs_hex_file=self.nvs_parser.to_hex_file())
-            else:
-                self.debugger.reload_nvs_no_device_reset(nvs_hex_file=self.nvs_parser.to_hex_file())
-            # end if
+            nvs_parser = self.nvs_parser
+        else:
+            return None
+        # end if
+
+        if self.USE_NVS_PAGE_WRITE and getattr(self.debugger, 'NVS_PAGE_SIZE', None) is not None:
+            self.last_nvs_write_report = self.debugger.reload_nvs_pages(nvs_hex_file=nvs_parser.to_hex_file(),
+                                                                        no_reset=no_reset,
+                                                                        full_write_time=self.full_nvs_write_time)
+            return self.last_nvs_write_report
         # end if
+
+        start = perf_counter()
+        if not no_reset:
+            self.debugger.reload_file(nvs_hex_file=nvs_parser.to_hex_file())
+        else:
+            self.debugger.reload_nvs_no_device_reset(nvs_hex_file=nvs_parser.to_hex_file())
+        # end if
+        self.full_nvs_write_time = perf_counter() - start
+        return None
     # end def load_nvs
 
     def reset(self, **kwargs):
@@ -188,9 +212,14 @@ class MemoryManager(NvsManagerInterface):
         :return: python chunk representation
         :rtype: ``NvsChunk`` or ``None``
         """
-        nvs_chunks = self.get_chunks_by_name(chunk_name=chunk_name, active_bank_only=active_bank_only)
+        if (self.nvs_parser is None or
+                chunk_name not in CHUNK_ID_TO_CLASS_MAP or
+                self.chunk_type not in CHUNK_ID_TO_CLASS_MAP[chunk_name]):
+            return None
+        # end if
 
-        return nvs_chunks[-1] if len(nvs_chunks) > 0 else None
+        # Only the last chunk of the history is converted
+        return self.nvs_parser.get_chunk(chunk_id=chunk_name, mode=self.chunk_type, active_bank_only=active_bank_only)
     # end def get_active_chunk_by_name
 
     def get_chunks_by_name(self, chunk_name, active_bank_only=False, **kwargs):
@@ -15,6 +15,7 @@
 # imports
 # ------------------------------------------------------------------------------
 from os.path                            import abspath
+from pylibrary.system.dwarf             import DwarfFile
 from pylibrary.tools.hexlist            import HexList
 from pylibrary.tools.numeral            import Numeral
 from os                                 import stat
@@ -333,7 +334,7 @@ class Debugger(object):
                                     ##< - setRegisters(), getRegisters()
                                     ##< - readVariables(), writeVariables()
     F_MAPPING        = 0x00000008   ##< Mapping file:
-                                    ##< - loadAdrFile()
+                                    ##< - loadAdrFile(), loadElfFile()
     F_BREAKPOINTS    = 0x00000010   ##< Breakpoints:
                                     ##< - addBreakpoint(), removeBreakpoint(), removeAllBreakpoints()
                                     ##< - getCurrentBreakpointId()
@@ -707,8 +708,16 @@ class Debugger(object):
         initialization needed to connect to a debugger, emulator, simulator, etc...
 
         @option kwargs [in] (dict) debugger specific parameters
+
+        @par Parameters
+             - @c elfFilePath : elf file whose DWARF labels are loaded (see loadElfFile), if not None
+             .
         '''
         self._loadConfig()
+
+        if (kwargs.get('elfFilePath') is not None):
+            self.loadElfFile(kwargs['elfFilePath'])
+        # end if
     # end def open
 
     def isOpen(self):
@@ -921,6 +930,35 @@ class Debugger(object):
         # end if
     # end def loadAdrFile
 
+    def loadElfFile(self, elfFilePath):
+        '''
+        Load the labels from the DWARF debug information of an elf file.
+
+        The debug information is decoded lazily, and the label index is shared between the loadings of the same elf
+        file through its index file (see DwarfFile).
+
+        @param  elfFilePath  [in] (str)     Path to the elf file to load.
+
+        Example:
+        @code
+        # Load Mask.elf
+        debugger.loadElfFile("Mask.elf")
+        @endcode
+        '''
+        filePath = join(self._inputDir, elfFilePath)
+
+        newTime  = stat(filePath)[ST_MTIME]
+        if (self._statCache.get(filePath) == newTime):
+            return
+        # end if
+        self._statCache[filePath] = newTime
+
+        if (isinstance(self._adrFile, DwarfFile)):
+            self._adrFile.close()
+        # end if
+        self._adrFile = DwarfFile(filePath)
+    # end def loadElfFile
+
     # --------------------------------------------------------------------------
     # F_RUNNING
     # --------------------------------------------------------------------------
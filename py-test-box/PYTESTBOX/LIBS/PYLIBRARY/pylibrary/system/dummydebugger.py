@@ -18,6 +18,7 @@
 # ------------------------------------------------------------------------------
 from pylibrary.system.debugger         import Component
 from pylibrary.system.debugger         import Debugger
+from pylibrary.system.nvspagewriter    import NvsPageWriter
 from pylibrary.tools.hexlist            import HexList
 import sys
 
@@ -60,6 +61,12 @@ class DummyDebugger(Debugger):
     MEMORY_START    = 0
     MEMORY_SIZE     = 1
 
+    ## Simulated NVS flash, erased at instantiation
+    NVS_START_ADDRESS = 0x3E000
+    NVS_SIZE          = 8 * 1024
+    NVS_BANK_SIZE     = 4 * 1024
+    NVS_PAGE_SIZE     = 4 * 1024
+
     class DummyComponent(Component):
         '''
         Definition of the Dummy component
@@ -88,6 +95,10 @@ class DummyDebugger(Debugger):
         self.connectionHost   = self._DEFAULT_HOST
         self.connectionPort   = self._DEFAULT_PORT
         self.__socket         = None
+
+        self.nvsFlash            = bytearray(b'\xFF' * self.NVS_SIZE)
+        self.erasedPageCount     = 0
+        self.writtenByteCount    = 0
     # end def __init__
 
     def setStdout(self, stdout):
@@ -249,12 +260,95 @@ class DummyDebugger(Debugger):
         '''
         assert isinstance(addressOrLabel, int), TypeError('Should be int instead')
 
+        if (self._isNvsRange(addressOrLabel, length)):
+            offset = addressOrLabel - self.NVS_START_ADDRESS
+            return HexList(self.nvsFlash[offset:offset + length])
+        # end if
+
         assert ((addressOrLabel + length) <= (self.MEMORY_START + self.MEMORY_SIZE)), IndexError('Out of range')
 
         return HexList(0x10)
 
     # end def readMemory
 
+    def writeMemory(self, addressOrLabel,
+                          data,
+                          memoryType = None):
+        '''
+        @copydoc pylibrary.system.debugger.Debugger.writeMemory
+
+        Only the simulated NVS flash can be written: as in flash, the written bits can only be cleared
+        '''
+        assert isinstance(addressOrLabel, int), TypeError('Should be int instead')
+        assert self._isNvsRange(addressOrLabel, len(data)), IndexError('Out of range')
+
+        offset = addressOrLabel - self.NVS_START_ADDRESS
+        for index, value in enumerate(data):
+            self.nvsFlash[offset + index] &= value
+        # end for
+        self.writtenByteCount += len(data)
+    # end def writeMemory
+
+    def _isNvsRange(self, address, length):
+        '''
+        Check whether a memory range is in the simulated NVS flash
+
+        @param  address [in] (int) The start address of the range
+        @param  length  [in] (int) The length of the range
+
+        @return (bool) True if the range is in the NVS flash
+        '''
+        return (self.NVS_START_ADDRESS <= address) and (address + length <= self.NVS_START_ADDRESS + self.NVS_SIZE)
+    # end def _isNvsRange
+
+    def erase_flash_page(self, address):
+        '''
+        Erase a page of the simulated NVS flash
+
+        @param  address [in] (int) The start address of the flash page
+        '''
+        assert ((address - self.NVS_START_ADDRESS) % self.NVS_PAGE_SIZE == 0), ValueError('Not a flash page')
+        assert self._isNvsRange(address, self.NVS_PAGE_SIZE), IndexError('Out of range')
+
+        offset = address - self.NVS_START_ADDRESS
+        self.nvsFlash[offset:offset + self.NVS_PAGE_SIZE] = b'\xFF' * self.NVS_PAGE_SIZE
+        self.erasedPageCount += 1
+    # end def erase_flash_page
+
+    def write_flash_page(self, address, data):
+        '''
+        Erase a page of the simulated NVS flash and write its content
+
+        @param  address [in] (int)     The start address of the flash page
+        @param  data    [in] (HexList) The content of the flash page
+        '''
+        self.erase_flash_page(address)
+        self.writeMemory(address, data)
+    # end def write_flash_page
+
+    def reload_nvs_pages(self, nvs_hex_file, no_reset = False, full_write_time = None):
+        '''
+        Write the simulated NVS flash, only the pages which differ are erased and written
+
+        @param  nvs_hex_file    [in] (str, IntelHex)  Hex file of the NVS to load
+        @option no_reset        [in] (bool)           If True, the simulator is only stopped and run
+        @option full_write_time [in] (float)          The duration of the last whole NVS reload, in seconds
+
+        @return (NvsWriteReport) The write report
+        '''
+        nvsPageWriter = NvsPageWriter(self, self.NVS_START_ADDRESS, self.NVS_SIZE, self.NVS_PAGE_SIZE)
+        self.stop()
+        try:
+            return nvsPageWriter.write(nvs_hex_file, full_write_time = full_write_time)
+        finally:
+            if no_reset:
+                self.run()
+            else:
+                self.reset()
+            # end if
+        # end try
+    # end def reload_nvs_pages
+
 # end class DummyDebugger
 
 def dummyPredicate(debugger):
@@ -16,18 +16,39 @@ This follows DWARF's standard V2.0.0, but only implements a limited subset of
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
-from pylibrary.tools.numeral            import Numeral
+from bisect                             import bisect_right
+from hashlib                            import sha1
+from json                               import dump
+from json                               import load
+from mmap                               import ACCESS_READ
+from mmap                               import mmap
+from os                                 import listdir
+from os                                 import makedirs
+from os                                 import remove
+from os                                 import replace
+from os                                 import utime
+from os.path                            import exists
+from os.path                            import getmtime
+from os.path                            import join
+from tempfile                           import gettempdir
+
+from elftools.elf.elffile               import ELFFile
+
 from pylibrary.tools.strutils          import StrAbleMixin
 
 # ------------------------------------------------------------------------------
 # implementation
 # ------------------------------------------------------------------------------
 
+# The buffers can be HexList instances, or any bytes-like object supporting find: bytes, bytearray or a mmap of
+# the elf file
+_BYTES_BUFFERS = (bytes, bytearray, mmap)
+
 def _read_block(buffer, offset, count):                                                                                 #@ReservedAssignment pylint:disable=W0622
     '''
     Reads a block of data
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
     @param  count  [in] (int) The number of bytes the value is encoded on
 
@@ -40,7 +61,7 @@ def _read_un(buffer, offset, count):
     '''
     Reads an unsigned integer encoded on a fixed number of bytes
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
     @param  count  [in] (int) The number of bytes the value is encoded on
 
@@ -50,14 +71,14 @@ def _read_un(buffer, offset, count):
         raise IndexError('Index out of bounds: %d' % (max(min(len(buffer), offset+count), offset)))
     # end if
 
-    return int(Numeral(buffer[offset:offset+count], littleEndian = True)), offset + count
+    return int.from_bytes(buffer[offset:offset+count], 'little'), offset + count
 # end def _read_un
 
 def _read_sn(buffer, offset, count):                                                                                    #@ReservedAssignment pylint:disable=W0622
     '''
-    Reads an unsigned integer encoded on a fixed number of bytes
+    Reads a signed integer encoded on a fixed number of bytes
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
     @param  count  [in] (int) The number of bytes the value is encoded on
 
@@ -67,15 +88,14 @@ def _read_sn(buffer, offset, count):
         raise IndexError('Index out of bounds: %d' % (max(min(len(buffer), offset+count), offset)))
     # end if
 
-    value, offset = _read_un(buffer, offset, count)
-    return (value if value < (1 << ((count * 8) - 1)) else value - (1 << (count * 8))), offset
+    return int.from_bytes(buffer[offset:offset+count], 'little', signed = True), offset + count
 # end def _read_sn
 
 def _read_uword(buffer, offset):                                                                                        #@ReservedAssignment pylint:disable=W0622
     '''
     Reads an unsigned integer encoded on 4 bytes
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
@@ -87,7 +107,7 @@ def _read_sword(buffer, offset):
     '''
     Reads a signed integer encoded on 4 bytes
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
@@ -99,7 +119,7 @@ def _read_uhalf(buffer, offset):
     '''
     Reads an unsigned integer encoded on 2 bytes
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
@@ -111,7 +131,7 @@ def _read_shalf(buffer, offset):
     '''
     Reads a signed integer encoded on 2 bytes
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
@@ -123,7 +143,7 @@ def _read_ubyte(buffer, offset):
     '''
     Reads an unsigned integer encoded on 1 byte
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
@@ -135,7 +155,7 @@ def _read_sbyte(buffer, offset):
     '''
     Reads a signed integer encoded on 1 byte
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
@@ -147,11 +167,20 @@ def _read_string(buffer, offset):
     '''
     Reads null-terminated string
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
     '''
+    if (isinstance(buffer, _BYTES_BUFFERS)):
+        end = buffer.find(b'\x00', offset)
+        if (end < 0):
+            raise IndexError('Index out of bounds: %d' % (len(buffer),))
+        # end if
+
+        return bytes(buffer[offset:end]).decode('latin-1'), end+1
+    # end if
+
     count = 0
     while (buffer[offset+count] != 0):
         count += 1
@@ -164,44 +193,45 @@ def _read_uleb128(buffer, offset):
     '''
     Reads a variable-length-encoded unsigned integer
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
     '''
-    result = 0
-    loop = True
-    shift = 0
-    while (loop):
-        value, offset = _read_ubyte(buffer, offset)
-        loop = (value & 0x80) != 0
-        value = value & 0x7F
+    value = buffer[offset]
+    if (value < 0x80):
+        # Single byte values are the most common ones
+        return value, offset+1
+    # end if
 
-        result = result | (value << shift)
+    result = value & 0x7F
+    shift = 7
+    while (value & 0x80):
+        offset += 1
+        value = buffer[offset]
+        result |= (value & 0x7F) << shift
         shift += 7
     # end while
 
-    return result, offset
+    return result, offset+1
 # end def _read_uleb128
 
 def _read_sleb128(buffer, offset):                                                                                      #@ReservedAssignment pylint:disable=W0622
     '''
     Reads a variable-length-encoded signed integer
 
-    @param  buffer [in] (HexList) The buffer to read from.
+    @param  buffer [in] (HexList, bytes, mmap) The buffer to read from.
     @param  offset [in] (int) The offset at which to start reading
 
     @return (value, newOffset)
     '''
     result = 0
-    loop = True
     shift = 0
-    while (loop):
-        value, offset = _read_ubyte(buffer, offset)
-        loop = (value & 0x80) != 0
-        value = value & 0x7F
-
-        result = result | (value << shift)
+    value = 0x80
+    while (value & 0x80):
+        value = buffer[offset]
+        offset += 1
+        result |= (value & 0x7F) << shift
         shift += 7
     # end while
 
@@ -339,7 +369,8 @@ class DebugLineSection(StrAbleMixin):
                                opcode_base,
                                standard_opcode_lengths,
                                include_directories,
-                               file_names):
+                               file_names,
+                               maximum_operations_per_instruction = 1):
                 '''
                 Constructor.
 
@@ -361,6 +392,8 @@ class DebugLineSection(StrAbleMixin):
                 @param  standard_opcode_lengths    [in] (list) Number of LEB128 opcodes for standard opcodes
                 @param  include_directories        [in] (list) list of path names
                 @param  file_names                 [in] (list) list of (name, drectory_index, time, size)
+                @option maximum_operations_per_instruction [in] (int) The maximum number of operations in an
+                                                              instruction, only encoded from version 4
                 '''
                 super(DebugLineSection.EntrySet.Prologue, self).__init__()
 
@@ -375,6 +408,8 @@ class DebugLineSection(StrAbleMixin):
                 self.standard_opcode_lengths    = standard_opcode_lengths
                 self.include_directories        = include_directories
                 self.file_names                 = file_names
+
+                self.maximum_operations_per_instruction = maximum_operations_per_instruction
             # end def __init__
 
             @classmethod
@@ -392,6 +427,10 @@ class DebugLineSection(StrAbleMixin):
                 version, offset                    = _read_uhalf(buffer, offset)
                 prologue_length, offset            = _read_uword(buffer, offset)
                 minimum_instruction_length, offset = _read_ubyte(buffer, offset)
+                maximum_operations_per_instruction = 1
+                if (version >= 4):
+                    maximum_operations_per_instruction, offset = _read_ubyte(buffer, offset)
+                # end if
                 default_is_stmt, offset            = _read_ubyte(buffer, offset)
                 line_base, offset                  = _read_sbyte(buffer, offset)
                 line_range, offset                 = _read_ubyte(buffer, offset)
@@ -439,7 +478,8 @@ class DebugLineSection(StrAbleMixin):
                            opcode_base,
                            standard_opcode_lengths,
                            include_directories,
-                           file_names)
+                           file_names,
+                           maximum_operations_per_instruction)
             # end def fromHexList
         # end class Prologue
 
@@ -499,13 +539,29 @@ class DebugLineSection(StrAbleMixin):
             # end def __str__
 
             @staticmethod
-            def _appendRow(registers, matrix):
+            def _appendRow(registers, matrix, end_sequence = False):
                 '''
                 Append a row to the matrix, using the current registers
 
-                @param  registers [in] (Registers) The current registers state.
-                @param  matrix    [in] (dict) The current matrix collector
-                '''
+                @param  registers    [in] (Registers) The current registers state.
+                @param  matrix       [in] (dict, list) The current matrix collector: the dict of the rows per address,
+                                                      or the list of the rows
+                @option end_sequence [in] (bool) Whether the row ends a sequence
+
+                A row list collects the rows as they are emitted, with their end_sequence flag, instead of mapping every
+                address between two rows.
+                '''
+                if (isinstance(matrix, list)):
+                    matrix.append((registers.address,
+                                   registers.file,
+                                   registers.line,
+                                   registers.column,
+                                   registers.is_stmt,
+                                   registers.basic_block,
+                                   end_sequence))
+                    return
+                # end if
+
                 last_entry = matrix.get(registers.last_address, None)
                 if (last_entry is not None):
                     for address in range(registers.last_address, registers.address):
@@ -536,7 +592,7 @@ class DebugLineSection(StrAbleMixin):
                 super(DebugLineSection.EntrySet.SpecialOpcode, self).__init__()
                 adjusted_opcode = buffer[offset] - prologue.opcode_base
 
-                self._add_address = adjusted_opcode / prologue.line_range
+                self._add_address = (adjusted_opcode // prologue.line_range) * prologue.minimum_instruction_length
                 self._add_line    = prologue.line_base + (adjusted_opcode % prologue.line_range)
             # end def __init__
 
@@ -687,7 +743,7 @@ class DebugLineSection(StrAbleMixin):
                 '''
                 super(DebugLineSection.EntrySet.AdvanceLineStandardOpcode, self).__init__()
 
-                self._leb128, finalOffset = _read_uleb128(buffer, offset+1)
+                self._leb128, finalOffset = _read_sleb128(buffer, offset+1)
                 self._length = finalOffset - offset
             # end def __init__
 
@@ -922,7 +978,7 @@ class DebugLineSection(StrAbleMixin):
                 super(DebugLineSection.EntrySet.ConstAddPcStandardOpcode, self).__init__()
 
                 adjusted_opcode = 255 - prologue.opcode_base
-                self._add_address = adjusted_opcode / prologue.line_range
+                self._add_address = (adjusted_opcode // prologue.line_range) * prologue.minimum_instruction_length
             # end def __init__
 
             def __str__(self):
@@ -968,7 +1024,7 @@ class DebugLineSection(StrAbleMixin):
                 @param  prologue [in] (Prologue) The prologue to initialize the registers with
                 '''
                 super(DebugLineSection.EntrySet.FixedAdvancePcStandardOpcode, self).__init__()
-                self._uhalf = _read_uhalf(buffer, offset+1)
+                self._uhalf, _ = _read_uhalf(buffer, offset+1)
             # end def __init__
 
             def __str__(self):
@@ -1050,7 +1106,7 @@ class DebugLineSection(StrAbleMixin):
                 '''
                 @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.__call__
                 '''
-                self._appendRow(registers, matrix)
+                self._appendRow(registers, matrix, end_sequence = True)
 
                 registers.reset(prologue)
                 registers.end_sequence = True
@@ -1129,12 +1185,12 @@ class DebugLineSection(StrAbleMixin):
 
                 _, finalOffset = _read_uleb128(buffer, offset+1)
 
-                self._source_file_name, finalOffset = _read_string(buffer, finalOffset)
+                self._source_file_name, finalOffset = _read_string(buffer, finalOffset+1)
                 self._directory_index, finalOffset  = _read_uleb128(buffer, finalOffset)
                 self._last_modification_time, finalOffset = _read_uleb128(buffer, finalOffset)
                 self._byte_length, finalOffset = _read_uleb128(buffer, finalOffset)
 
-                self._length = finalOffset + 1 - offset
+                self._length = finalOffset - offset
             # end def __init__
 
             def __str__(self):
@@ -1179,6 +1235,112 @@ class DebugLineSection(StrAbleMixin):
             # end def __call__
         # end class DefineFileExtendedOpcode
 
+        class OtherStandardOpcode(Opcode):
+            '''
+            Standard opcode without effect on the matrix (DW_LNS_set_prologue_end, DW_LNS_set_epilogue_begin,
+            DW_LNS_set_isa...)
+
+            Its operands are skipped, their count being given by the prologue.
+            '''
+
+            def __init__(self, buffer, offset, prologue):                                                               #@ReservedAssignment pylint:disable=W0622
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.__init__
+                @param  buffer   [in] (list) The buffer to read from
+                @param  offset   [in] (int) The offset at which to start reading
+                @param  prologue [in] (Prologue) The prologue to initialize the registers with
+                '''
+                super(DebugLineSection.EntrySet.OtherStandardOpcode, self).__init__()
+
+                self._opcode = buffer[offset]
+                finalOffset = offset + 1
+                for _ in range(prologue.standard_opcode_lengths[self._opcode]):
+                    _, finalOffset = _read_uleb128(buffer, finalOffset)
+                # end for
+                self._length = finalOffset - offset
+            # end def __init__
+
+            def __str__(self):
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.__str__
+                '''
+                return 'DW_LNS_0x%02x' % self._opcode
+            # end def __str__
+
+            def getLength(self):
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.getLength
+                '''
+                return self._length
+            # end def getLength
+
+            @classmethod
+            def accept(cls, prologue, buffer, offset):                                                                  #@ReservedAssignment pylint:disable=W0622
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.accept
+                '''
+                return (0 < buffer[offset] < prologue.opcode_base)
+            # end def accept
+
+            def __call__(self, prologue, registers, matrix):
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.__call__
+                '''
+                pass
+            # end def __call__
+        # end class OtherStandardOpcode
+
+        class OtherExtendedOpcode(Opcode):
+            '''
+            Extended opcode without effect on the matrix (DW_LNE_set_discriminator, vendor extensions...)
+
+            It is skipped, using its encoded length.
+            '''
+
+            def __init__(self, buffer, offset, prologue):                                                               #@ReservedAssignment pylint:disable=W0613,W0622
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.__init__
+                @param  buffer   [in] (list) The buffer to read from
+                @param  offset   [in] (int) The offset at which to start reading
+                @param  prologue [in] (Prologue) The prologue to initialize the registers with
+                '''
+                super(DebugLineSection.EntrySet.OtherExtendedOpcode, self).__init__()
+
+                length, finalOffset = _read_uleb128(buffer, offset+1)
+                self._opcode = buffer[finalOffset]
+                self._length = finalOffset + length - offset
+            # end def __init__
+
+            def __str__(self):
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.__str__
+                '''
+                return 'DW_LNE_0x%02x' % self._opcode
+            # end def __str__
+
+            def getLength(self):
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.getLength
+                '''
+                return self._length
+            # end def getLength
+
+            @classmethod
+            def accept(cls, prologue, buffer, offset):                                                                  #@ReservedAssignment pylint:disable=W0622
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.accept
+                '''
+                return (buffer[offset] == 0)
+            # end def accept
+
+            def __call__(self, prologue, registers, matrix):
+                '''
+                @copydoc pylibrary.system.dwarf.DebugLineSection.EntrySet.Opcode.__call__
+                '''
+                pass
+            # end def __call__
+        # end class OtherExtendedOpcode
+
         OPCODES = (CopyStandardOpcode,
                    AdvancePcStandardOpcode,
                    AdvanceLineStandardOpcode,
@@ -1192,6 +1354,8 @@ class DebugLineSection(StrAbleMixin):
                    EndSequenceExtendedOpcode,
                    SetAddressExtendedOpcode,
                    DefineFileExtendedOpcode,
+                   OtherStandardOpcode,
+                   OtherExtendedOpcode,
                    )
 
         def __init__(self, prologue, statements):
@@ -1270,6 +1434,25 @@ class DebugLineSection(StrAbleMixin):
 
             return matrix
         # end def getMatrix
+
+        def getRows(self):
+            '''
+            Builds the rows of the line number program, in emission order.
+
+            Unlike the matrix, the addresses between two rows are not expanded: the row of an address is the last
+            row at or before it, in the same sequence.
+
+            @return (list) The rows (address, file, line, column, is_stmt, basic_block, end_sequence)
+            '''
+            rows = []
+            prologue = self.prologue
+            registers = self.Registers(prologue = prologue)
+            for statement in self.statements:
+                statement(prologue, registers, rows)
+            # end for
+
+            return rows
+        # end def getRows
     # end class EntrySet
 
     def __init__(self, entry_sets):
@@ -1379,8 +1562,8 @@ class DebugArangesSection(StrAbleMixin):
 
             full_address_size = address_size + segment_size
 
-            # Adjust the offset to the padded value
-            while (((offset - startOffset) % full_address_size) != 0):
+            # Adjust the offset to the padded value: the tuples are aligned on their size
+            while (((offset - startOffset) % (2 * full_address_size)) != 0):
                 offset += 1
             # end while
 
@@ -1723,6 +1906,8 @@ class DebugInfoSection(StrAbleMixin):
             DW_AT_variable_parameter   = 0x4b # flag
             DW_AT_virtuality           = 0x4c # constant
             DW_AT_vtable_elem_location = 0x4d # block, reference
+            DW_AT_ranges               = 0x55 # rangelistptr (DWARF 3)
+            DW_AT_linkage_name         = 0x6e # string (DWARF 4)
             DW_AT_lo_user              = 0x2000
             DW_AT_hi_user              = 0x3fff
 
@@ -1785,6 +1970,8 @@ class DebugInfoSection(StrAbleMixin):
                                DW_AT_variable_parameter:   'variable_parameter',
                                DW_AT_virtuality:           'virtuality',
                                DW_AT_vtable_elem_location: 'vtable_elem_location',
+                               DW_AT_ranges:               'ranges',
+                               DW_AT_linkage_name:         'linkage_name',
                                DW_AT_lo_user:              'lo_user',
                                DW_AT_hi_user:              'hi_user',
                                }
@@ -1824,6 +2011,8 @@ class DebugInfoSection(StrAbleMixin):
             DW_TAG_constant               = 0x27
             DW_TAG_enumerator             = 0x28
             DW_TAG_file_type              = 0x29
+            DW_TAG_subprogram             = 0x2e
+            DW_TAG_variable               = 0x34
 
             TAG_NAMES = {DW_TAG_array_type:             'array_type',
                          DW_TAG_class_type:             'class_type',
@@ -1860,6 +2049,8 @@ class DebugInfoSection(StrAbleMixin):
                          DW_TAG_constant:               'constant',
                          DW_TAG_enumerator:             'enumerator',
                          DW_TAG_file_type:              'file_type',
+                         DW_TAG_subprogram:             'subprogram',
+                         DW_TAG_variable:               'variable',
                          }
 
             DW_FORM_addr      = 0x01 # address
@@ -1882,11 +2073,18 @@ class DebugInfoSection(StrAbleMixin):
             DW_FORM_ref4      = 0x13 # reference
             DW_FORM_ref8      = 0x14 # reference
             DW_FORM_ref_udata = 0x15 # reference
+            DW_FORM_indirect     = 0x16 # form given by the data (DWARF 3)
+            DW_FORM_sec_offset   = 0x17 # offset in another section (DWARF 4)
+            DW_FORM_exprloc      = 0x18 # block (DWARF 4)
+            DW_FORM_flag_present = 0x19 # flag, without data (DWARF 4)
+            DW_FORM_ref_sig8     = 0x20 # reference (DWARF 4)
 
             def __init__(self, abbreviation_code,
                                children,
                                attributes,
-                               length = None):
+                               length = None,
+                               tag    = None,
+                               offset = None):
                 '''
                 Constructor
 
@@ -1895,11 +2093,15 @@ class DebugInfoSection(StrAbleMixin):
                 @param  attributes        [in] (dict) Dictionary of attributes for this DIE
                 @option length            [in] (list) Length of the serialized DIE
                                                     Useful when reading from HexList
+                @option tag               [in] (int) The DW_TAG_xxx value of the DIE
+                @option offset            [in] (int) The offset of the DIE in the buffer it was read from
                 '''
                 super(DebugInfoSection.EntrySet.DebuggingInformationEntry, self).__init__()
 
                 self.abbreviation_code = abbreviation_code
                 self.children          = children
+                self.tag               = tag
+                self.offset            = offset
 
                 for key, value in attributes.items():
                     setattr(self, key, value)
@@ -1915,14 +2117,16 @@ class DebugInfoSection(StrAbleMixin):
             # end def __init__
 
             @classmethod
-            def fromHexList(cls, buffer, offset, abbrev_table, address_size):                                            #@ReservedAssignment pylint:disable=W0622,R0912
+            def fromHexList(cls, buffer, offset, abbrev_table, address_size, read_children = True):                     #@ReservedAssignment pylint:disable=W0622,R0912
                 '''
                 Read a DIE from a HexList
 
-                @param  buffer       [in] (HexList) The buffer to read from.
-                @param  offset       [in] (int)    The offset at which to read
-                @param  abbrev_table [in] (DebugAbbrevSection.AbbrevTable) The abbreviation table
-                @param  address_size [in] (int) Size of an address, in bytes
+                @param  buffer        [in] (HexList) The buffer to read from.
+                @param  offset        [in] (int)    The offset at which to read
+                @param  abbrev_table  [in] (DebugAbbrevSection.AbbrevTable) The abbreviation table
+                @param  address_size  [in] (int) Size of an address, in bytes
+                @option read_children [in] (bool) Whether to read the children. If not, the length only covers the
+                                                  DIE attributes
 
                 @return (DebuggingInformationEntry) New instance of a DebuggingInformationEntry
                 '''
@@ -1933,6 +2137,9 @@ class DebugInfoSection(StrAbleMixin):
 
                 attributes = {}
                 for attribute_name, attribute_form in abbrev_entry_set.attributes:
+                    if (attribute_form == cls.DW_FORM_indirect):
+                        attribute_form, offset = _read_uleb128(buffer, offset)
+                    # end if
 
                     if (attribute_form == cls.DW_FORM_addr):
                         value, offset = _read_un(buffer, offset, address_size)
@@ -1957,9 +2164,9 @@ class DebugInfoSection(StrAbleMixin):
                     elif (attribute_form == cls.DW_FORM_data8):
                         value, offset = _read_un(buffer, offset, 8)
                     elif (attribute_form == cls.DW_FORM_sdata):
-                        value, offset = _read_uleb128(buffer, offset)
-                    elif (attribute_form == cls.DW_FORM_udata):
                         value, offset = _read_sleb128(buffer, offset)
+                    elif (attribute_form == cls.DW_FORM_udata):
+                        value, offset = _read_uleb128(buffer, offset)
                     elif (attribute_form == cls.DW_FORM_flag):
                         value, offset = _read_ubyte(buffer, offset)
                     elif (attribute_form == cls.DW_FORM_ref1):
@@ -1970,23 +2177,36 @@ class DebugInfoSection(StrAbleMixin):
                         value, offset = _read_sn(buffer, offset, 4)
                     elif (attribute_form == cls.DW_FORM_ref8):
                         value, offset = _read_sn(buffer, offset, 8)
+                    elif (attribute_form == cls.DW_FORM_ref_addr):
+                        # The offset is encoded as an address in version 2 and on 4 bytes after, these are equal
+                        # for 32-bit targets
+                        value, offset = _read_un(buffer, offset, address_size)
                     elif (attribute_form == cls.DW_FORM_ref_udata):
                         value, offset = _read_uleb128(buffer, offset)
                     elif (attribute_form == cls.DW_FORM_string):
                         value, offset = _read_string(buffer, offset)
                     elif (attribute_form == cls.DW_FORM_strp):
                         value, offset = _read_uword(buffer, offset)
+                    elif (attribute_form == cls.DW_FORM_sec_offset):
+                        value, offset = _read_uword(buffer, offset)
+                    elif (attribute_form == cls.DW_FORM_exprloc):
+                        block_length, offset = _read_uleb128(buffer, offset)
+                        value, offset = _read_block(buffer, offset, block_length)
+                    elif (attribute_form == cls.DW_FORM_flag_present):
+                        value = 1
+                    elif (attribute_form == cls.DW_FORM_ref_sig8):
+                        value, offset = _read_un(buffer, offset, 8)
                     else:
                         raise ValueError('Unknown form: %d (0x%02x)'
                                          % (attribute_form, attribute_form))
                     # end if
 
-                    attributes[cls.ATTRIBUTE_NAMES[attribute_name]] = value
+                    attributes[cls.ATTRIBUTE_NAMES.get(attribute_name, 'attribute_0x%x' % (attribute_name,))] = value
                 # end for
 
                 children = []
                 # Read children
-                if (abbrev_entry_set.has_children):
+                if (abbrev_entry_set.has_children and read_children):
                     loop = True
                     while (loop):
                         child = cls.fromHexList(buffer, offset, abbrev_table, address_size)
@@ -2003,7 +2223,9 @@ class DebugInfoSection(StrAbleMixin):
                 return cls(abbreviation_code,
                            children,
                            attributes,
-                           length = length)
+                           length = length,
+                           tag    = abbrev_entry_set.entry_tag,
+                           offset = startOffset)
             # end def fromHexList
         # end class DebuggingInformationEntry
 
@@ -2085,6 +2307,745 @@ class DebugInfoSection(StrAbleMixin):
     # end def fromHexList
 # end class DebugInfoSection
 
+class UnsupportedDwarfVersionError(ValueError):
+    '''
+    Raised when a compilation unit uses a DWARF version the decoders of this module do not support.
+    '''
+# end class UnsupportedDwarfVersionError
+
+class DwarfFile(object):
+    '''
+    Lazy reader of the DWARF debug information of an elf file.
+
+    The elf file is memory mapped, and the sections are decoded from the mapping when first needed:
+    - The compilation unit of an address is found in the .debug_aranges section, and only its line number
+      program is decoded to resolve the line of an address.
+    - The labels (named functions and variables, with their address and DIE offset) are indexed on the
+      first label lookup, by decoding the compilation units one at a time.
+
+    The decoders of this module support the DWARF versions 2 to 4. The compilation units of another version (e.g.
+    DWARF 5) are read with pyelftools instead: their labels and line rows are indexed the same way, but their DIEs
+    cannot be decoded (see getDie).
+
+    The label index and the decoded line rows are saved in an index file, named after the hash of the elf file
+    contents, and reused by the next readers of the same elf file. The label index is saved when built, the line
+    rows when the file is closed. Only the INDEX_MAX_COUNT most recently used index files are kept in the index
+    directory, the older ones are removed when an index file is saved.
+
+    The label lookups follow the AdrFile interface, so that a DwarfFile can be used by the debuggers as their
+    address file.
+    '''
+    INDEX_VERSION   = 1
+    INDEX_EXTENSION = '.dwarfidx'
+    INDEX_DIR       = join(gettempdir(), 'dwarfindex')
+    INDEX_MAX_COUNT = 16
+
+    SUPPORTED_VERSIONS = (2, 3, 4)
+
+    DW_OP_addr = 0x03
+
+    _DIE = DebugInfoSection.EntrySet.DebuggingInformationEntry
+
+    # Size of the compilation unit header: length, version, debug_abbrev offset and address size
+    _CU_HEADER_SIZE = 11
+
+    class _AbbrevTables(dict):
+        '''
+        The abbreviation tables of the .debug_abbrev section, decoded on first access.
+        '''
+
+        def __init__(self, buffer, sectionOffset):
+            '''
+            Constructor
+
+            @param  buffer        [in] (mmap) The elf file mapping
+            @param  sectionOffset [in] (int)  The offset of the .debug_abbrev section in the elf file
+            '''
+            super(DwarfFile._AbbrevTables, self).__init__()
+
+            self._buffer        = buffer
+            self._sectionOffset = sectionOffset
+        # end def __init__
+
+        def __missing__(self, key):
+            '''
+            Decodes the table at the given offset of the section
+
+            @param  key [in] (int) The offset of the table in the .debug_abbrev section
+
+            @return (DebugAbbrevSection.AbbrevTable) The abbreviation table
+            '''
+            table = DebugAbbrevSection.AbbrevTable.fromHexList(self._buffer, self._sectionOffset + key)
+            self[key] = table
+            return table
+        # end def __missing__
+    # end class _AbbrevTables
+
+    def __init__(self, elfPath,
+                       indexDir = None):
+        '''
+        Constructor
+
+        @param  elfPath  [in] (str) The path to the elf file
+        @option indexDir [in] (str) The directory of the index files, INDEX_DIR if None
+        '''
+        self._elfPath  = elfPath
+        self._indexDir = self.INDEX_DIR if indexDir is None else indexDir
+
+        self._file   = open(elfPath, 'rb')
+        self._buffer = mmap(self._file.fileno(), 0, access = ACCESS_READ)
+
+        self._sections = {}
+        for section in ELFFile(self._file).iter_sections():
+            if (section.name.startswith('.debug_')):
+                self._sections[section.name] = (section['sh_offset'], section['sh_size'])
+            # end if
+        # end for
+
+        self._debugAbbrev = DebugAbbrevSection(self._AbbrevTables(self._buffer,
+                                                                  self._getSectionOffset('.debug_abbrev')))
+        self._dwarfInfo      = None
+        self._hash           = None
+        self._addressRanges  = None
+        self._lines          = {}
+        self._labels         = None
+        self._labelAddresses = None
+        self._indexChanged   = False
+
+        self._loadIndex()
+    # end def __init__
+
+    def __enter__(self):
+        '''
+        Context manager entry
+
+        @return (DwarfFile) The current instance
+        '''
+        return self
+    # end def __enter__
+
+    def __exit__(self, *excInfo):
+        '''
+        Context manager exit: closes the file
+
+        @param  excInfo [in] (tuple) The exception information
+        '''
+        self.close()
+    # end def __exit__
+
+    def close(self):
+        '''
+        Saves the index if it changed, and releases the elf file mapping.
+        '''
+        if (self._buffer is not None):
+            if (self._indexChanged):
+                self.saveIndex()
+            # end if
+
+            self._buffer.close()
+            self._file.close()
+            self._buffer    = None
+            self._dwarfInfo = None
+        # end if
+    # end def close
+
+    def getHash(self):
+        '''
+        Obtains the hash of the elf file contents
+
+        @return (str) The hexadecimal SHA-1 of the elf file
+        '''
+        if (self._hash is None):
+            self._hash = sha1(self._buffer).hexdigest()
+        # end if
+
+        return self._hash
+    # end def getHash
+
+    def getIndexPath(self):
+        '''
+        Obtains the path of the index file of the elf file
+
+        @return (str) The index file path
+        '''
+        return join(self._indexDir, self.getHash() + self.INDEX_EXTENSION)
+    # end def getIndexPath
+
+    def _loadIndex(self):
+        '''
+        Loads the index file of the elf file, if any.
+
+        An index file of another version is ignored, and will be replaced on the next save.
+        '''
+        indexPath = self.getIndexPath()
+        if (not exists(indexPath)):
+            return
+        # end if
+
+        try:
+            with open(indexPath, 'r') as indexFile:
+                index = load(indexFile)
+            # end with
+        except (OSError, ValueError):
+            return
+        # end try
+
+        if (index.get('version') != self.INDEX_VERSION):
+            return
+        # end if
+
+        # The modification time of the index files orders them for the eviction
+        try:
+            utime(indexPath)
+        except OSError:
+            pass
+        # end try
+
+        if (index.get('labels') is not None):
+            self._setLabels(dict((label, [tuple(entry) for entry in entries])
+                                 for label, entries in index['labels'].items()))
+        # end if
+
+        for stmtList, (fileNames, rows) in index.get('lines', {}).items():
+            self._setLines(int(stmtList), fileNames, [tuple(row) for row in rows])
+        # end for
+    # end def _loadIndex
+
+    def saveIndex(self):
+        '''
+        Saves the label index and the decoded line rows in the index file.
+        '''
+        index = {'version': self.INDEX_VERSION,
+                 'elf':     self._elfPath,
+                 'labels':  self._labels,
+                 'lines':   dict((str(stmtList), (fileNames, rows))
+                                 for stmtList, (fileNames, _, rows) in self._lines.items()),
+                 }
+
+        makedirs(self._indexDir, exist_ok = True)
+        indexPath = self.getIndexPath()
+        temporaryPath = '%s.%d.tmp' % (indexPath, id(self))
+        with open(temporaryPath, 'w') as indexFile:
+            dump(index, indexFile)
+        # end with
+        replace(temporaryPath, indexPath)
+
+        self._indexChanged = False
+        self._evictIndexFiles()
+    # end def saveIndex
+
+    def _evictIndexFiles(self):
+        '''
+        Removes the least recently used index files of the index directory, keeping INDEX_MAX_COUNT files.
+
+        An index file being removed by another reader at the same time is skipped.
+        '''
+        indexFiles = []
+        for name in listdir(self._indexDir):
+            if (name.endswith(self.INDEX_EXTENSION)):
+                path = join(self._indexDir, name)
+                try:
+                    indexFiles.append((getmtime(path), path))
+                except OSError:
+                    pass
+                # end try
+            # end if
+        # end for
+
+        indexFiles.sort(reverse = True)
+        for _, path in indexFiles[self.INDEX_MAX_COUNT:]:
+            try:
+                remove(path)
+            except OSError:
+                pass
+            # end try
+        # end for
+    # end def _evictIndexFiles
+
+    def _getSectionOffset(self, name):
+        '''
+        Obtains the offset of a section in the elf file
+
+        @param  name [in] (str) The section name
+
+        @return (int) The section offset, 0 if the section is missing
+        '''
+        return self._sections.get(name, (0, 0))[0]
+    # end def _getSectionOffset
+
+    def _readString(self, value):
+        '''
+        Obtains the value of a string attribute
+
+        @param  value [in] (str, int) The inline string, or its offset in the .debug_str section (DW_FORM_strp)
+
+        @return (str) The string
+        '''
+        if (isinstance(value, int)):
+            value, _ = _read_string(self._buffer, self._getSectionOffset('.debug_str') + value)
+        # end if
+
+        return value
+    # end def _readString
+
+    def _readCompilationUnitHeader(self, cuOffset):
+        '''
+        Reads the header of a compilation unit
+
+        @param  cuOffset [in] (int) The offset of the compilation unit in the .debug_info section
+
+        @return (tuple) The end offset of the unit in the .debug_info section, its abbreviation table and its address
+                        size
+
+        @exception UnsupportedDwarfVersionError The unit version is not in SUPPORTED_VERSIONS
+        '''
+        offset = self._getSectionOffset('.debug_info') + cuOffset
+        length, offset              = _read_uword(self._buffer, offset)
+        version, offset             = _read_uhalf(self._buffer, offset)
+        if (version not in self.SUPPORTED_VERSIONS):
+            raise UnsupportedDwarfVersionError('Unsupported DWARF version %d of the compilation unit at 0x%X in %s'
+                                               % (version, cuOffset, self._elfPath))
+        # end if
+        debug_abbrev_offset, offset = _read_uword(self._buffer, offset)
+        address_size, offset        = _read_ubyte(self._buffer, offset)
+
+        return (cuOffset + 4 + length,
+                self._debugAbbrev.tables[debug_abbrev_offset],
+                address_size)
+    # end def _readCompilationUnitHeader
+
+    def iterCompilationUnitOffsets(self):
+        '''
+        Iterates over the compilation units, only reading their lengths.
+
+        @return (generator) The offsets of the compilation units in the .debug_info section
+        '''
+        sectionOffset, sectionSize = self._sections.get('.debug_info', (0, 0))
+        cuOffset = 0
+        while (cuOffset < sectionSize):
+            yield cuOffset
+
+            length, _ = _read_uword(self._buffer, sectionOffset + cuOffset)
+            cuOffset += 4 + length
+        # end while
+    # end def iterCompilationUnitOffsets
+
+    def getCompilationUnit(self, cuOffset):
+        '''
+        Decodes a compilation unit, with all its DIEs.
+
+        @param  cuOffset [in] (int) The offset of the compilation unit in the .debug_info section
+
+        @return (DebugInfoSection.EntrySet) The compilation unit. The DIE offsets are offsets in the elf file.
+
+        @exception UnsupportedDwarfVersionError The unit version is not in SUPPORTED_VERSIONS
+        '''
+        self._readCompilationUnitHeader(cuOffset)
+        return DebugInfoSection.EntrySet.fromHexList(self._buffer,
+                                                     self._getSectionOffset('.debug_info') + cuOffset,
+                                                     self._debugAbbrev)
+    # end def getCompilationUnit
+
+    def getDie(self, dieOffset,
+                     cuOffset,
+                     readChildren = True):
+        '''
+        Decodes a single DIE
+
+        @param  dieOffset    [in] (int)  The offset of the DIE in the .debug_info section
+        @param  cuOffset     [in] (int)  The offset of its compilation unit in the .debug_info section
+        @option readChildren [in] (bool) Whether to decode the children of the DIE
+
+        @return (DebuggingInformationEntry) The DIE
+
+        @exception UnsupportedDwarfVersionError The unit version is not in SUPPORTED_VERSIONS
+        '''
+        _, abbrevTable, addressSize = self._readCompilationUnitHeader(cuOffset)
+        return self._DIE.fromHexList(self._buffer,
+                                     self._getSectionOffset('.debug_info') + dieOffset,
+                                     abbrevTable,
+                                     addressSize,
+                                     read_children = readChildren)
+    # end def getDie
+
+    def getCompilationUnitOffset(self, address):
+        '''
+        Obtains the compilation unit of an address, from the .debug_aranges section
+
+        @param  address [in] (int) The address
+
+        @return (int) The offset of the compilation unit in the .debug_info section, None if not found
+        '''
+        if (self._addressRanges is None):
+            ranges = []
+            if ('.debug_aranges' in self._sections):
+                aranges = DebugArangesSection.fromHexList(self._buffer, *self._sections['.debug_aranges'])
+                for entry_set in aranges.entry_sets.values():
+                    for start, length in entry_set.addresses_and_lengths:
+                        ranges.append((start, start + length, entry_set.debug_info_offset))
+                    # end for
+                # end for
+            # end if
+            ranges.sort()
+            self._addressRanges = ([start for start, _, _ in ranges], ranges)
+        # end if
+
+        starts, ranges = self._addressRanges
+        index = bisect_right(starts, address) - 1
+        if ((index >= 0) and (address < ranges[index][1])):
+            return ranges[index][2]
+        # end if
+
+        return None
+    # end def getCompilationUnitOffset
+
+    def _setLines(self, stmtList, fileNames, rows):
+        '''
+        Stores the line rows of a line number program
+
+        @param  stmtList  [in] (int)  The offset of the program in the .debug_line section
+        @param  fileNames [in] (list) The source file names, per file index
+        @param  rows      [in] (list) The rows (address, file, line, column, end_sequence), sorted by address, a
+                                      sequence end being sorted before a sequence start at the same address
+        '''
+        self._lines[stmtList] = (fileNames, [row[0] for row in rows], rows)
+    # end def _setLines
+
+    def _getDwarfInfo(self):
+        '''
+        Obtains the pyelftools reader of the debug information, used for the compilation units of an unsupported
+        DWARF version
+
+        @return (DWARFInfo) The pyelftools reader
+        '''
+        if (self._dwarfInfo is None):
+            self._dwarfInfo = ELFFile(self._file).get_dwarf_info()
+        # end if
+
+        return self._dwarfInfo
+    # end def _getDwarfInfo
+
+    def _decodeLines(self, stmtList):
+        '''
+        Decodes a line number program
+
+        @param  stmtList [in] (int) The offset of the program in the .debug_line section
+
+        @return (tuple) The source file names, per file index, and the rows (address, file, line, column,
+                        end_sequence)
+        '''
+        entrySet = DebugLineSection.EntrySet.fromHexList(self._buffer, self._getSectionOffset('.debug_line') + stmtList)
+
+        prologue = entrySet.prologue
+        fileNames = [None]
+        for name, directoryIndex, _, _ in prologue.file_names[1:]:
+            if (directoryIndex and not name.startswith('/')):
+                name = '%s/%s' % (prologue.include_directories[directoryIndex], name)
+            # end if
+            fileNames.append(name)
+        # end for
+
+        return fileNames, [(row[0], row[1], row[2], row[3], row[6]) for row in entrySet.getRows()]
+    # end def _decodeLines
+
+    def _readLines(self, cuOffset):
+        '''
+        Reads the line number program of a compilation unit with pyelftools
+
+        @param  cuOffset [in] (int) The offset of the compilation unit in the .debug_info section
+
+        @return (tuple) The source file names, per file index, and the rows (address, file, line, column,
+                        end_sequence)
+        '''
+        dwarfInfo   = self._getDwarfInfo()
+        lineProgram = dwarfInfo.line_program_for_CU(dwarfInfo.get_CU_at(cuOffset))
+        if (lineProgram is None):
+            return [], []
+        # end if
+
+        # From DWARF 5, the file and directory indexes start at 0, the directory 0 being the compilation directory.
+        # Before, they start at 1, and the compilation directory is not listed.
+        firstIndex  = 0 if (lineProgram['version'] >= 5) else 1
+        directories = [directory.decode('latin-1') for directory in lineProgram['include_directory']]
+        fileNames   = [None] * firstIndex
+        for fileEntry in lineProgram['file_entry']:
+            name = fileEntry.name.decode('latin-1')
+            if (fileEntry.dir_index and not name.startswith('/')):
+                name = '%s/%s' % (directories[fileEntry.dir_index - firstIndex], name)
+            # end if
+            fileNames.append(name)
+        # end for
+
+        rows = [(entry.state.address, entry.state.file, entry.state.line, entry.state.column,
+                 entry.state.end_sequence)
+                for entry in lineProgram.get_entries() if entry.state is not None]
+
+        return fileNames, rows
+    # end def _readLines
+
+    def _getLines(self, stmtList,
+                        cuOffset = None):
+        '''
+        Obtains the line rows of a line number program, decoding it if not done yet
+
+        @param  stmtList [in] (int) The offset of the program in the .debug_line section
+        @option cuOffset [in] (int) The offset of its compilation unit in the .debug_info section, if the unit is read
+                                    with pyelftools. The program is decoded by this module if None.
+
+        @return (tuple) The source file names, the row addresses and the rows
+        '''
+        if (stmtList not in self._lines):
+            if (cuOffset is None):
+                fileNames, rows = self._decodeLines(stmtList)
+            else:
+                fileNames, rows = self._readLines(cuOffset)
+            # end if
+
+            self._setLines(stmtList, fileNames, sorted(rows, key = lambda row: (row[0], not row[4])))
+            self._indexChanged = True
+        # end if
+
+        return self._lines[stmtList]
+    # end def _getLines
+
+    def getLineInfo(self, address):
+        '''
+        Resolves the source line of an address.
+
+        Only the line number program of the compilation unit containing the address is decoded.
+
+        @param  address [in] (int) The address
+
+        @return (tuple) The source file name, line and column, None if the address is not covered
+        '''
+        cuOffset = self.getCompilationUnitOffset(address)
+        if (cuOffset is None):
+            return None
+        # end if
+
+        try:
+            stmtList = getattr(self.getDie(cuOffset + self._CU_HEADER_SIZE, cuOffset, readChildren = False),
+                               'stmt_list', None)
+            lineCuOffset = None
+        except UnsupportedDwarfVersionError:
+            stmtList = self._getDwarfInfo().get_CU_at(cuOffset).get_top_DIE().attributes.get('DW_AT_stmt_list')
+            stmtList = None if (stmtList is None) else stmtList.value
+            lineCuOffset = cuOffset
+        # end try
+
+        if (stmtList is None):
+            return None
+        # end if
+
+        fileNames, addresses, rows = self._getLines(stmtList, lineCuOffset)
+        index = bisect_right(addresses, address) - 1
+        if ((index < 0) or rows[index][4]):
+            return None
+        # end if
+
+        row = rows[index]
+        fileName = fileNames[row[1]] if (row[1] < len(fileNames)) else None
+        return (fileName, row[2], row[3])
+    # end def getLineInfo
+
+    @classmethod
+    def _getLocationAddress(cls, location):
+        '''
+        Obtains the address of a variable location
+
+        @param  location [in] (bytes, list) The location expression
+
+        @return (int) The DW_OP_addr address, None for another location
+        '''
+        if (    isinstance(location, (bytes, list))
+            and (len(location) > 1)
+            and (location[0] == cls.DW_OP_addr)):
+            return int.from_bytes(bytes(location[1:]), 'little')
+        # end if
+
+        return None
+    # end def _getLocationAddress
+
+    def _getDieAddress(self, die):
+        '''
+        Obtains the address of a function or variable DIE
+
+        @param  die [in] (DebuggingInformationEntry) The DIE
+
+        @return (int) The address: low_pc of a function, DW_OP_addr location of a variable, None otherwise
+        '''
+        if (die.tag == self._DIE.DW_TAG_subprogram):
+            return getattr(die, 'low_pc', None)
+        # end if
+
+        if (die.tag == self._DIE.DW_TAG_variable):
+            return self._getLocationAddress(getattr(die, 'location', None))
+        # end if
+
+        return None
+    # end def _getDieAddress
+
+    def _decodeLabels(self, cuOffset):
+        '''
+        Decodes the labels of a compilation unit
+
+        @param  cuOffset [in] (int) The offset of the compilation unit in the .debug_info section
+
+        @return (list) The (label, address, DIE offset) of the named functions and variables of the unit
+
+        @exception UnsupportedDwarfVersionError The unit version is not in SUPPORTED_VERSIONS
+        '''
+        labels = []
+        sectionOffset = self._getSectionOffset('.debug_info')
+        compilationUnit = self.getCompilationUnit(cuOffset)
+        for die in compilationUnit.debugging_informations[0].children:
+            name = getattr(die, 'name', None)
+            if (name is None):
+                continue
+            # end if
+
+            address = self._getDieAddress(die)
+            if (address is not None):
+                labels.append((self._readString(name), address, die.offset - sectionOffset))
+            # end if
+        # end for
+
+        return labels
+    # end def _decodeLabels
+
+    def _readLabels(self, cuOffset):
+        '''
+        Reads the labels of a compilation unit with pyelftools
+
+        @param  cuOffset [in] (int) The offset of the compilation unit in the .debug_info section
+
+        @return (list) The (label, address, DIE offset) of the named functions and variables of the unit
+        '''
+        labels = []
+        for die in self._getDwarfInfo().get_CU_at(cuOffset).get_top_DIE().iter_children():
+            name = die.attributes.get('DW_AT_name')
+            if (name is None):
+                continue
+            # end if
+
+            address = None
+            if (die.tag == 'DW_TAG_subprogram'):
+                lowPc = die.attributes.get('DW_AT_low_pc')
+                address = None if (lowPc is None) else lowPc.value
+            elif (die.tag == 'DW_TAG_variable'):
+                location = die.attributes.get('DW_AT_location')
+                address = None if (location is None) else self._getLocationAddress(location.value)
+            # end if
+
+            if (address is not None):
+                labels.append((name.value.decode('latin-1'), address, die.offset))
+            # end if
+        # end for
+
+        return labels
+    # end def _readLabels
+
+    def _setLabels(self, labels):
+        '''
+        Stores the label index
+
+        @param  labels [in] (dict) The (address, DIE offset, compilation unit offset) list, per label
+        '''
+        self._labels = labels
+        self._labelAddresses = sorted((entry[0], label) for label, entries in labels.items() for entry in entries)
+    # end def _setLabels
+
+    def _getLabels(self):
+        '''
+        Obtains the label index, building it if not done yet
+
+        @return (dict) The (address, DIE offset, compilation unit offset) list, per label
+        '''
+        if (self._labels is None):
+            labels = {}
+            for cuOffset in self.iterCompilationUnitOffsets():
+                try:
+                    unitLabels = self._decodeLabels(cuOffset)
+                except UnsupportedDwarfVersionError:
+                    unitLabels = self._readLabels(cuOffset)
+                # end try
+
+                for label, address, dieOffset in unitLabels:
+                    labels.setdefault(label, []).append((address, dieOffset, cuOffset))
+                # end for
+            # end for
+
+            self._setLabels(labels)
+            self.saveIndex()
+        # end if
+
+        return self._labels
+    # end def _getLabels
+
+    def getLabelDie(self, label):
+        '''
+        Obtains the DIE of a label
+
+        @param  label [in] (str) The label
+
+        @return (DebuggingInformationEntry) The DIE of the label, None if not found
+
+        @exception UnsupportedDwarfVersionError The version of the compilation unit of the label is not in
+                                                SUPPORTED_VERSIONS
+        '''
+        entries = self._getLabels().get(label)
+        if (not entries):
+            return None
+        # end if
+
+        _, dieOffset, cuOffset = entries[0]
+        return self.getDie(dieOffset, cuOffset)
+    # end def getLabelDie
+
+    def getAddress(self, label):
+        '''
+        @copydoc pylibrary.system.debugger.AdrFile.getAddress
+        '''
+        entries = self._getLabels().get(label)
+        if (not entries):
+            raise AssertionError('Could not find address for label: %s'
+                                % (label,))
+        # end if
+
+        addresses = sorted(set(entry[0] for entry in entries))
+        if (len(addresses) > 1):
+            raise ValueError('label %s is multiply defined at addresses: %s'
+                             % (label, '(%s)' % ','.join(['0x%08.8X' % x for x in addresses])))
+        # end if
+
+        return addresses[0]
+    # end def getAddress
+
+    def getLabels(self, value = None):
+        '''
+        @copydoc pylibrary.system.debugger.AdrFile.getLabels
+        '''
+        labels = self._getLabels()
+        if (value is None):
+            # Return all labels
+            return tuple(labels.keys())
+        # end if
+
+        labelAddresses = self._labelAddresses
+        index = bisect_right(labelAddresses, (value, '\U0010FFFF'))
+        lowerIndex = index - 1
+        if ((lowerIndex >= 0) and (labelAddresses[lowerIndex][0] == value)):
+            label = labelAddresses[lowerIndex][1]
+            return (label, label,)
+        # end if
+
+        lowerBoundLabel  = labelAddresses[lowerIndex][1] if (lowerIndex >= 0) else 'Unknown'
+        higherBoundLabel = labelAddresses[index][1] if (index < len(labelAddresses)) else 'Unknown'
+
+        return (lowerBoundLabel, higherBoundLabel,)
+    # end def getLabels
+# end class DwarfFile
+
 # ------------------------------------------------------------------------------
 # END OF FILE
 # ------------------------------------------------------------------------------
@@ -248,8 +248,16 @@ class GdbMiDebugger(Debugger):
                          memoryType = None):                                                                            # pylint:disable=W0613
         '''
         @copydoc pylibrary.system.debugger.Debugger._toAddress
+
+        The label is resolved by gdb, else from the loaded elf file if any.
         '''
-        return self.addressCache[label]
+        address = self.addressCache[label]
+        if (address is None) and (self._adrFile is not None):
+            # Label unknown by gdb: it is read from the DWARF information of the elf file
+            address = super(GdbMiDebugger, self)._toAddress(label, memoryType)
+        # end if
+
+        return address
     # end def _toAddress
 
     def getAddress(self, addressOrLabel,
@@ -335,6 +343,8 @@ class GdbMiDebugger(Debugger):
              - @c filePath   : exec file
              - @c symbolPath : symbol file
              .
+
+        The DWARF labels of the elf file given by @c elfFilePath resolve the labels unknown by gdb (see loadElfFile).
         '''
         super(GdbMiDebugger, self).open(**kwargs)
 
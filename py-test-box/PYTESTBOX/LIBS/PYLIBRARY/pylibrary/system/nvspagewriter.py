@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pylibrary.system.nvspagewriter
+:brief: Write of the NVS image in flash, limited to the pages which differ from the device content
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from time import perf_counter
+
+from intelhex import IntelHex
+
+from pylibrary.tools.hexlist import HexList
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class NvsWriteReport(object):
+    """
+    Result of an NVS write.
+    """
+
+    def __init__(self, page_count, written_pages, elapsed_time, full_write_time=None):
+        """
+        :param page_count: The number of flash pages of the NVS
+        :type page_count: ``int``
+        :param written_pages: The start addresses of the erased and written pages
+        :type written_pages: ``list[int]``
+        :param elapsed_time: The duration of the write, in seconds
+        :type elapsed_time: ``float``
+        :param full_write_time: The duration of the last whole NVS reload, in seconds, ``None`` if unknown - OPTIONAL
+        :type full_write_time: ``float`` or ``None``
+        """
+        self.page_count = page_count
+        self.written_pages = written_pages
+        self.elapsed_time = elapsed_time
+        self.full_write_time = full_write_time
+        self.bytes_flashed = 0
+    # end def __init__
+
+    @property
+    def saved_time(self):
+        """
+        The duration saved compared to the last whole NVS reload.
+
+        :return: The saved duration in seconds, ``None`` if no whole NVS reload was measured
+        :rtype: ``float`` or ``None``
+        """
+        return None if self.full_write_time is None else self.full_write_time - self.elapsed_time
+    # end def saved_time
+
+    def __str__(self):
+        """
+        Convert the report to a string.
+
+        :return: The report
+        :rtype: ``str``
+        """
+        saved_time = 'unknown' if self.saved_time is None else f'{self.saved_time * 1000:.0f} ms'
+        return (f'NVS write: {len(self.written_pages)}/{self.page_count} pages, {self.bytes_flashed} bytes flashed '
+                f'in {self.elapsed_time * 1000:.0f} ms, saved {saved_time}')
+    # end def __str__
+# end class NvsWriteReport
+
+
+class NvsPageWriter(object):
+    """
+    Write an NVS image in flash page by page, only the pages which differ from the current device content are erased
+    and written. Every written page is read back and verified.
+
+    The debugger must provide ``readMemory`` and ``write_flash_page``, which erases a flash page and writes its
+    content. Its reads must get the flash content, not a probe cache updated by the write itself.
+    """
+
+    def __init__(self, debugger, start_address, size, page_size):
+        """
+        :param debugger: The debugger giving access to the flash
+        :type debugger: ``pylibrary.system.debugger.Debugger``
+        :param start_address: The start address of the NVS in flash, aligned on a page
+        :type start_address: ``int``
+        :param size: The size of the NVS, a multiple of the page size
+        :type size: ``int``
+        :param page_size: The size of a flash page
+        :type page_size: ``int``
+        """
+        assert start_address % page_size == 0 and size % page_size == 0, \
+            f"The NVS (0x{start_address:X}, {size} bytes) should be made of flash pages of {page_size} bytes"
+
+        self.debugger = debugger
+        self.start_address = start_address
+        self.size = size
+        self.page_size = page_size
+    # end def __init__
+
+    def get_nvs_data(self, nvs_hex_file):
+        """
+        Get the content of the whole NVS from an hex file, the missing addresses being erased.
+
+        :param nvs_hex_file: Hex file of the NVS
+        :type nvs_hex_file: ``str`` or ``IntelHex``
+
+        :return: The NVS content
+        :rtype: ``bytes``
+        """
+        return bytes(IntelHex(nvs_hex_file).tobinarray(start=self.start_address, size=self.size))
+    # end def get_nvs_data
+
+    def get_changed_pages(self, nvs_data, device_data):
+        """
+        Get the offsets of the pages which differ between the NVS to write and the device content.
+
+        :param nvs_data: The NVS content to write
+        :type nvs_data: ``bytes``
+        :param device_data: The device content
+        :type device_data: ``bytes``
+
+        :return: The offsets of the changed pages in the NVS
+        :rtype: ``list[int]``
+        """
+        nvs_view = memoryview(nvs_data)
+        device_view = memoryview(device_data)
+        return [offset for offset in range(0, self.size, self.page_size)
+                if nvs_view[offset:offset + self.page_size] != device_view[offset:offset + self.page_size]]
+    # end def get_changed_pages
+
+    def write(self, nvs_hex_file, device_data=None, full_write_time=None):
+        """
+        Write the changed pages of the NVS.
+
+        :param nvs_hex_file: Hex file of the NVS to write
+        :type nvs_hex_file: ``str`` or ``IntelHex``
+        :param device_data: The current content of the NVS on the device. It is read if ``None``. The NVS read before
+                            the test cannot be used: the firmware writes its chunks while running - OPTIONAL
+        :type device_data: ``bytes`` or ``HexList`` or ``None``
+        :param full_write_time: The duration of the last whole NVS reload, in seconds - OPTIONAL
+        :type full_write_time: ``float`` or ``None``
+
+        :return: The write report
+        :rtype: ``NvsWriteReport``
+
+        :raise ``AssertionError``: If a written page is not read back
+        """
+        start = perf_counter()
+        nvs_data = self.get_nvs_data(nvs_hex_file)
+        if device_data is None:
+            device_data = self.debugger.readMemory(self.start_address, self.size)
+        # end if
+        changed_pages = self.get_changed_pages(nvs_data, bytes(device_data))
+
+        written_pages = []
+        for offset in changed_pages:
+            address = self.start_address + offset
+            page_data = nvs_data[offset:offset + self.page_size]
+            self.debugger.write_flash_page(address, HexList(page_data))
+            read_back = bytes(self.debugger.readMemory(address, self.page_size))
+            assert read_back == page_data, f"The flash page at 0x{address:X} is not written correctly"
+            written_pages.append(address)
+        # end for
+
+        report = NvsWriteReport(page_count=self.size // self.page_size,
+                                written_pages=written_pages,
+                                elapsed_time=perf_counter() - start,
+                                full_write_time=full_write_time)
+        report.bytes_flashed = len(written_pages) * self.page_size
+        return report
+    # end def write
+# end class NvsPageWriter
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+''' @package pylibrary.system.test.dwarf_test
+
+@brief Tests of the lazy DWARF reader
+
+@author christophe.roquebert
+
+@date   2026/10/18
+'''
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from os                                 import listdir
+from os                                 import remove
+from os                                 import utime
+from os.path                            import join
+from shutil                             import rmtree
+from struct                             import pack
+from tempfile                           import mkdtemp
+from tempfile                           import mkstemp
+from unittest                           import TestCase
+from unittest.mock                      import patch
+
+from pylibrary.system.dwarf             import DebugLineSection
+from pylibrary.system.dwarf             import DwarfFile
+from pylibrary.system.dwarf             import UnsupportedDwarfVersionError
+from pylibrary.system.dwarf             import _read_sleb128
+from pylibrary.system.dwarf             import _read_string
+from pylibrary.system.dwarf             import _read_uleb128
+from pylibrary.system.dummydebugger     import DummyDebugger
+from pylibrary.tools.hexlist            import HexList
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+def buildLineProgram(version = 2):
+    '''
+    Builds a line number program for main.c: lines 10 and 11 at 0x1000 and 0x1004, up to 0x1010.
+
+    @option version [in] (int) The DWARF version: 2 or 5
+
+    @return (bytes) The line number program
+    '''
+    standardOpcodeLengths = bytes((0, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 1))
+    if (version == 5):
+        prologue  = pack('<BBBbBB', 1, 1, 1, -5, 14, 13) + standardOpcodeLengths
+        prologue += b'\x01\x01\x08' + b'\x01' + b'/src\x00'                      # Directories: path (string)
+        prologue += b'\x02\x01\x08\x02\x0b' + b'\x02' + b'main.c\x00\x00' * 2   # Files: path (string), directory (data1)
+        header    = pack('<HBBI', 5, 4, 0, len(prologue)) + prologue
+    else:
+        prologue  = pack('<BBbBB', 1, 1, -5, 14, 13) + standardOpcodeLengths
+        prologue += b'\x00' + b'main.c\x00\x00\x00\x00' + b'\x00'
+        header    = pack('<HI', 2, len(prologue)) + prologue
+    # end if
+    program   = b'\x00\x05\x02' + pack('<I', 0x1000)  # DW_LNE_set_address 0x1000
+    program  += b'\x03\x09\x01'                         # DW_LNS_advance_line 9, DW_LNS_copy
+    program  += bytes((75,))                            # Special opcode: address + 4, line + 1
+    program  += b'\x02\x0c'                             # DW_LNS_advance_pc 12
+    program  += b'\x00\x01\x01'                         # DW_LNE_end_sequence
+    return pack('<I', len(header) + len(program)) + header + program
+# end def buildLineProgram
+
+def buildElf(version = 2):
+    '''
+    Builds a 32-bit little endian elf file made of DWARF sections only.
+
+    The compilation unit main.c contains the function main at 0x1000 and the variable counter at 0x20000000.
+
+    @option version [in] (int) The DWARF version: 2 or 5
+
+    @return (bytes) The elf file content
+    '''
+    abbrev  = b'\x01\x11\x01\x03\x08\x10\x06\x00\x00'       # compile_unit: name (string), stmt_list (data4)
+    abbrev += b'\x02\x2e\x00\x03\x08\x11\x01\x12\x01\x00\x00' # subprogram: name (string), low_pc, high_pc (addr)
+    abbrev += b'\x03\x34\x00\x03\x0e\x02\x0a\x00\x00'       # variable: name (strp), location (block1)
+    abbrev += b'\x00'
+
+    dies  = b'\x01main.c\x00' + pack('<I', 0)
+    dies += b'\x02main\x00' + pack('<II', 0x1000, 0x1010)
+    dies += b'\x03' + pack('<I', 0) + b'\x05\x03' + pack('<I', 0x20000000)
+    dies += b'\x00'
+    if (version == 5):
+        info = pack('<IHBBI', 8 + len(dies), 5, 1, 4, 0) + dies                # DW_UT_compile
+    else:
+        info = pack('<IHIB', 7 + len(dies), 2, 0, 4) + dies
+    # end if
+
+    aranges  = pack('<HIBB', 2, 0, 4, 0) + b'\x00' * 4 + pack('<IIII', 0x1000, 0x10, 0, 0)
+    aranges  = pack('<I', len(aranges)) + aranges
+
+    sections = [('.debug_abbrev', abbrev), ('.debug_info', info), ('.debug_aranges', aranges),
+                ('.debug_line', buildLineProgram(version)), ('.debug_str', b'counter\x00')]
+
+    sectionNames = b'\x00'
+    contents     = b''
+    headers      = b'\x00' * 40
+    for name, content in sections + [('.shstrtab', None)]:
+        if (content is None):
+            content = sectionNames + name.encode() + b'\x00'
+        # end if
+        headers      += pack('<10I', len(sectionNames), 1 if name.startswith('.debug') else 3, 0, 0,
+                             52 + len(contents), len(content), 0, 0, 1, 0)
+        sectionNames += name.encode() + b'\x00'
+        contents     += content
+    # end for
+
+    elfHeader = pack('<16sHHIIIIIHHHHHH', b'\x7fELF\x01\x01\x01', 2, 40, 1, 0, 0, 52 + len(contents), 0,
+                     52, 0, 0, 40, len(sections) + 2, len(sections) + 1)
+    return elfHeader + contents + headers
+# end def buildElf
+
+class ReadersTestCase(TestCase):
+    '''
+    Tests of the buffer readers
+    '''
+
+    def testLeb128(self):
+        '''
+        Tests the LEB128 readers, on bytes and HexList buffers
+        '''
+        for buffer in (b'\x7f\xe5\x8e\x26\x7f', HexList('7FE58E267F')):
+            self.assertEqual((127, 1),     _read_uleb128(buffer, 0))
+            self.assertEqual((624485, 4),  _read_uleb128(buffer, 1))
+            self.assertEqual((-1, 5),      _read_sleb128(buffer, 4))
+        # end for
+    # end def testLeb128
+
+    def testString(self):
+        '''
+        Tests the null-terminated string reader
+        '''
+        self.assertEqual(('main', 5), _read_string(b'main\x00.c\x00', 0))
+        self.assertEqual(('', 5),     _read_string(b'main\x00.c\x00', 4))
+    # end def testString
+
+    def testLineRows(self):
+        '''
+        Tests the rows of a line number program
+        '''
+        entrySet = DebugLineSection.EntrySet.fromHexList(buildLineProgram(), 0)
+
+        self.assertEqual([(0x1000, 1, 10, 0), (0x1004, 1, 11, 0), (0x1010, 1, 11, 0)],
+                         [row[:4] for row in entrySet.getRows()])
+        self.assertEqual([False, False, True], [row[6] for row in entrySet.getRows()])
+    # end def testLineRows
+# end class ReadersTestCase
+
+class DwarfFileTestCase(TestCase):
+    '''
+    Tests of the DwarfFile lazy reader
+    '''
+    DWARF_VERSION = 2
+
+    def setUp(self):
+        '''
+        Writes the elf file
+        '''
+        TestCase.setUp(self)
+
+        fileDescriptor, self.elfPath = mkstemp(suffix = '.elf')
+        with open(fileDescriptor, 'wb') as elfFile:
+            elfFile.write(buildElf(self.DWARF_VERSION))
+        # end with
+        self.indexDir = mkdtemp()
+    # end def setUp
+
+    def tearDown(self):
+        '''
+        Removes the elf and index files
+        '''
+        rmtree(self.indexDir)
+        remove(self.elfPath)
+
+        TestCase.tearDown(self)
+    # end def tearDown
+
+    def testLabels(self):
+        '''
+        Tests the AdrFile interface
+        '''
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            self.assertEqual(0x1000,     dwarfFile.getAddress('main'))
+            self.assertEqual(0x20000000, dwarfFile.getAddress('counter'))
+            self.assertRaises(AssertionError, dwarfFile.getAddress, 'unknown')
+
+            self.assertEqual({'main', 'counter'},    set(dwarfFile.getLabels()))
+            self.assertEqual(('main', 'main'),       dwarfFile.getLabels(0x1000))
+            self.assertEqual(('main', 'counter'),    dwarfFile.getLabels(0x1008))
+            self.assertEqual(('Unknown', 'main'),    dwarfFile.getLabels(0x0FFF))
+        # end with
+    # end def testLabels
+
+    def testLabelDie(self):
+        '''
+        Tests the DIE of a label is decoded
+        '''
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            self.assertEqual(0x1010, dwarfFile.getLabelDie('main').high_pc)
+            self.assertIsNone(dwarfFile.getLabelDie('unknown'))
+        # end with
+    # end def testLabelDie
+
+    def testLineInfo(self):
+        '''
+        Tests the line lookups
+        '''
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            self.assertEqual(('main.c', 10, 0), dwarfFile.getLineInfo(0x1000))
+            self.assertEqual(('main.c', 11, 0), dwarfFile.getLineInfo(0x100F))
+            self.assertIsNone(dwarfFile.getLineInfo(0x1010))
+            self.assertIsNone(dwarfFile.getLineInfo(0x0FFF))
+        # end with
+    # end def testLineInfo
+
+    def testIndex(self):
+        '''
+        Tests the index file is reused by the next readers of the elf file
+        '''
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            dwarfFile.getLabels()
+            dwarfFile.getLineInfo(0x1000)
+            indexPath = dwarfFile.getIndexPath()
+        # end with
+        self.assertEqual([indexPath], [join(self.indexDir, name) for name in listdir(self.indexDir)])
+
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            self.assertIsNotNone(dwarfFile._labels)
+            self.assertEqual(0x1000, dwarfFile.getAddress('main'))
+            self.assertEqual(('main.c', 11, 0), dwarfFile.getLineInfo(0x1004))
+            self.assertFalse(dwarfFile._indexChanged)
+        # end with
+    # end def testIndex
+
+    def testIndexEviction(self):
+        '''
+        Tests only the most recently used index files are kept
+        '''
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            indexPath = dwarfFile.getIndexPath()
+        # end with
+
+        oldIndexPaths = []
+        for index in range(DwarfFile.INDEX_MAX_COUNT):
+            oldIndexPath = join(self.indexDir, '%040x%s' % (index, DwarfFile.INDEX_EXTENSION))
+            with open(oldIndexPath, 'w') as indexFile:
+                indexFile.write('{}')
+            # end with
+            utime(oldIndexPath, (index + 1, index + 1))
+            oldIndexPaths.append(oldIndexPath)
+        # end for
+
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            dwarfFile.getLabels()
+        # end with
+
+        self.assertEqual(sorted(oldIndexPaths[1:] + [indexPath]),
+                         sorted(join(self.indexDir, name) for name in listdir(self.indexDir)))
+    # end def testIndexEviction
+
+    def testDebuggerOpen(self):
+        '''
+        Tests the labels of the elf file given when opening a debugger are resolved by the debugger
+        '''
+        debugger = DummyDebugger()
+        with patch.object(DwarfFile, 'INDEX_DIR', self.indexDir):
+            debugger.open(elfFilePath = self.elfPath)
+        # end with
+        self.addCleanup(debugger._adrFile.close)
+
+        self.assertEqual(0x1000,             debugger.getAddress('main'))
+        self.assertEqual(('main', 'counter'), debugger.getLabels(0x1008))
+    # end def testDebuggerOpen
+# end class DwarfFileTestCase
+
+class Dwarf5FileTestCase(DwarfFileTestCase):
+    '''
+    Tests of the DwarfFile lazy reader, on a DWARF 5 compilation unit read with pyelftools
+    '''
+    DWARF_VERSION = 5
+
+    def testLabelDie(self):
+        '''
+        Tests the DIE of a label of an unsupported version is not decoded
+        '''
+        with DwarfFile(self.elfPath, indexDir = self.indexDir) as dwarfFile:
+            self.assertRaises(UnsupportedDwarfVersionError, dwarfFile.getLabelDie, 'main')
+        # end with
+    # end def testLabelDie
+# end class Dwarf5FileTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pylibrary.system.test.nvspagewriter_test
+:brief: Tests of the NVS flash page writer
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from io import StringIO
+from unittest import TestCase
+
+from intelhex import IntelHex
+
+from pylibrary.mcu.memorymanager import MemoryManager
+from pylibrary.system.dummydebugger import DummyDebugger
+from pylibrary.system.nvspagewriter import NvsPageWriter
+from pylibrary.tools.hexlist import HexList
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class FaultyDummyDebugger(DummyDebugger):
+    """
+    Dummy debugger whose flash page write loses the last byte of the page.
+    """
+
+    def write_flash_page(self, address, data):
+        # See ``DummyDebugger.write_flash_page``
+        super().write_flash_page(address, data[:-1])
+    # end def write_flash_page
+# end class FaultyDummyDebugger
+
+
+class NvsPageWriterTestCase(TestCase):
+    """
+    ``NvsPageWriter`` test implementation.
+    """
+    PAGE_SIZE = DummyDebugger.NVS_PAGE_SIZE
+
+    def setUp(self):
+        """
+        Create a dummy debugger with a simulated NVS flash.
+        """
+        super().setUp()
+        self.debugger = self._create_debugger(DummyDebugger)
+    # end def setUp
+
+    @staticmethod
+    def _create_debugger(debugger_class):
+        """
+        Create a dummy debugger writing in a string.
+
+        :param debugger_class: The dummy debugger class
+        :type debugger_class: ``type``
+
+        :return: The dummy debugger
+        :rtype: ``DummyDebugger``
+        """
+        debugger = debugger_class()
+        debugger.setStdout(StringIO())
+        return debugger
+    # end def _create_debugger
+
+    def _get_nvs_hex_file(self, nvs_data):
+        """
+        Get the hex file of an NVS content.
+
+        :param nvs_data: The NVS content
+        :type nvs_data: ``bytes``
+
+        :return: The NVS hex file
+        :rtype: ``IntelHex``
+        """
+        nvs_hex_file = IntelHex()
+        nvs_hex_file.frombytes(nvs_data, offset=self.debugger.NVS_START_ADDRESS)
+        return nvs_hex_file
+    # end def _get_nvs_hex_file
+
+    def _get_nvs_page_writer(self, debugger):
+        """
+        Get the page writer of the dummy debugger NVS.
+
+        :param debugger: The dummy debugger
+        :type debugger: ``DummyDebugger``
+
+        :return: The page writer
+        :rtype: ``NvsPageWriter``
+        """
+        return NvsPageWriter(debugger, debugger.NVS_START_ADDRESS, debugger.NVS_SIZE, debugger.NVS_PAGE_SIZE)
+    # end def _get_nvs_page_writer
+
+    def test_unchanged_nvs(self):
+        """
+        Test an NVS identical to the device content writes no page.
+        """
+        report = self._get_nvs_page_writer(self.debugger).write(
+            self._get_nvs_hex_file(b'\xFF' * self.debugger.NVS_SIZE))
+
+        self.assertEqual([], report.written_pages, "Unexpected written pages")
+        self.assertEqual(0, report.bytes_flashed, "Unexpected flashed bytes")
+        self.assertEqual(self.debugger.NVS_SIZE // self.PAGE_SIZE, report.page_count, "Wrong page count")
+        self.assertEqual(0, self.debugger.erasedPageCount, "Unexpected erased pages")
+    # end def test_unchanged_nvs
+
+    def test_changed_page(self):
+        """
+        Test only the changed page is erased, written and verified.
+        """
+        self.debugger.nvsFlash[:4] = b'\x01\x02\x03\x04'
+        nvs_data = bytearray(self.debugger.nvsFlash)
+        nvs_data[self.PAGE_SIZE + 10] = 0x5A
+
+        report = self._get_nvs_page_writer(self.debugger).write(self._get_nvs_hex_file(bytes(nvs_data)),
+                                                                full_write_time=10.0)
+
+        self.assertEqual([self.debugger.NVS_START_ADDRESS + self.PAGE_SIZE], report.written_pages,
+                         "Wrong written pages")
+        self.assertEqual(self.PAGE_SIZE, report.bytes_flashed, "Wrong flashed bytes")
+        self.assertEqual(1, self.debugger.erasedPageCount, "Wrong erased page count")
+        self.assertEqual(nvs_data, self.debugger.nvsFlash, "Wrong NVS content")
+        self.assertAlmostEqual(10.0 - report.elapsed_time, report.saved_time, msg="Wrong saved time")
+    # end def test_changed_page
+
+    def test_partial_hex_file(self):
+        """
+        Test the addresses missing in the hex file are erased.
+        """
+        self.debugger.nvsFlash[self.PAGE_SIZE:self.PAGE_SIZE + 4] = b'\x00' * 4
+        nvs_hex_file = IntelHex()
+        nvs_hex_file.frombytes(b'\x00' * 4, offset=self.debugger.NVS_START_ADDRESS)
+
+        report = self._get_nvs_page_writer(self.debugger).write(nvs_hex_file)
+
+        self.assertEqual(self.debugger.NVS_SIZE // self.PAGE_SIZE, len(report.written_pages), "Wrong written pages")
+        self.assertEqual(b'\x00' * 4 + b'\xFF' * (self.debugger.NVS_SIZE - 4), self.debugger.nvsFlash,
+                         "Wrong NVS content")
+    # end def test_partial_hex_file
+
+    def test_read_back_mismatch(self):
+        """
+        Test a page not written correctly is detected by the read back.
+        """
+        debugger = self._create_debugger(FaultyDummyDebugger)
+
+        with self.assertRaises(AssertionError):
+            self._get_nvs_page_writer(debugger).write(self._get_nvs_hex_file(b'\x00' * debugger.NVS_SIZE))
+        # end with
+    # end def test_read_back_mismatch
+
+    def test_load_nvs(self):
+        """
+        Test the memory manager writes only the changed NVS pages once enabled, and reports the time saved compared to
+        the last whole NVS reload.
+        """
+        self.debugger.reload_file = lambda nvs_hex_file: None
+        memory_manager = MemoryManager(self.debugger)
+        memory_manager.nvs_parser = FakeNvsParser(self._get_nvs_hex_file(HexList('00' * self.PAGE_SIZE)))
+
+        self.assertIsNone(memory_manager.load_nvs(), "The NVS flash page write should be opt-in")
+        self.assertIsNotNone(memory_manager.full_nvs_write_time, "The whole NVS reload is not measured")
+
+        memory_manager.USE_NVS_PAGE_WRITE = True
+        report = memory_manager.load_nvs()
+        self.assertEqual([self.debugger.NVS_START_ADDRESS], report.written_pages, "Wrong written pages")
+        self.assertIsNotNone(report.saved_time, "The saved time is not reported")
+        self.assertIs(report, memory_manager.last_nvs_write_report, "Wrong last report")
+
+        report = memory_manager.load_nvs()
+        self.assertEqual([], report.written_pages, "Unexpected written pages")
+    # end def test_load_nvs
+# end class NvsPageWriterTestCase
+
+
+class FakeNvsParser(object):
+    """
+    NVS parser giving a predefined hex file.
+    """
+
+    def __init__(self, hex_file):
+        """
+        :param hex_file: The NVS hex file
+        :type hex_file: ``IntelHex``
+        """
+        self.hex_file = hex_file
+    # end def __init__
+
+    def to_hex_file(self):
+        """
+        Get the NVS hex file.
+
+        :return: The NVS hex file
+        :rtype: ``IntelHex``
+        """
+        return self.hex_file
+    # end def to_hex_file
+# end class FakeNvsParser
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pylibrary.system.test.tracelogger_test
+:brief: Tests of the trace logger
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from io import StringIO
+from re import sub
+from threading import Thread
+from unittest import TestCase
+
+from pylibrary.system.tracelogger import DummyOwner
+from pylibrary.system.tracelogger import TraceLevel
+from pylibrary.system.tracelogger import TraceLogger
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class TraceLoggerTestCase(TestCase):
+    """
+    ``TraceLogger`` test implementation.
+    """
+    BUFFERED = False
+
+    def setUp(self):
+        """
+        Create a trace logger with an owner writing in a string.
+        """
+        super().setUp()
+        # The background flush is not expected to run during a test
+        self.trace_logger = TraceLogger(buffered=self.BUFFERED, flush_period=60)
+        self.owner = DummyOwner()
+        self.trace_logger.subscribe(subscription_owner=self.owner, trace_level=TraceLevel.DEBUG, trace_name="Owner")
+        self.output = StringIO()
+        self.trace_logger._trace_table[next(iter(self.trace_logger._trace_table))].output = self.output
+    # end def setUp
+
+    def tearDown(self):
+        """
+        Unsubscribe the owner.
+        """
+        self.trace_logger.unsubscribe_all()
+        super().tearDown()
+    # end def tearDown
+
+    def _get_lines(self):
+        """
+        Get the traced lines, without the timestamps.
+
+        :return: The traced lines
+        :rtype: ``list[str]``
+        """
+        self.trace_logger.flush()
+        return [sub(r'\[[0-9.]+ms\]', '', line) for line in self.output.getvalue().splitlines()]
+    # end def _get_lines
+
+    def test_trace_level(self):
+        """
+        Test only the messages of an enabled trace level are traced.
+        """
+        self.assertTrue(self.trace_logger.is_trace_enabled(self.owner, TraceLevel.DEBUG), "DEBUG should be enabled")
+        self.assertFalse(self.trace_logger.is_trace_enabled(self.owner, TraceLevel.EXTRA_DEBUG),
+                         "EXTRA_DEBUG should be disabled")
+        self.assertFalse(self.trace_logger.is_trace_enabled(self.owner, TraceLevel.NO_TRACE),
+                         "NO_TRACE should be disabled")
+        self.assertFalse(self.trace_logger.is_trace_enabled(DummyOwner(), TraceLevel.ERROR),
+                         "An unsubscribed owner should be disabled")
+
+        self.trace_logger.log_trace(self.owner, "error", trace_level=TraceLevel.ERROR)
+        self.trace_logger.log_trace(self.owner, "extra debug", trace_level=TraceLevel.EXTRA_DEBUG)
+        self.trace_logger.update_trace_level(self.owner, TraceLevel.NO_TRACE)
+        self.trace_logger.log_trace(self.owner, "warning", trace_level=TraceLevel.WARNING)
+
+        self.assertEqual(["[Owner][ERROR] error"], self._get_lines(), "Wrong traces")
+    # end def test_trace_level
+
+    def test_message_args(self):
+        """
+        Test the message template is formatted with its arguments.
+        """
+        self.trace_logger.log_trace(self.owner, "endpoint 0x{:02X}: {}", trace_level=TraceLevel.INFO,
+                                    args=(0x81, "data"))
+        self.trace_logger.log_trace(self.owner, "{not formatted}", trace_level=TraceLevel.INFO, end_line=None)
+
+        self.assertEqual(["[Owner][INFO] endpoint 0x81: data", "[Owner][INFO] {not formatted}"], self._get_lines(),
+                         "Wrong traces")
+    # end def test_message_args
+# end class TraceLoggerTestCase
+
+
+class BufferedTraceLoggerTestCase(TraceLoggerTestCase):
+    """
+    ``TraceLogger`` test implementation in buffered mode.
+    """
+    BUFFERED = True
+
+    def test_deferred_write(self):
+        """
+        Test the traces are written by the flush, in timestamp order across threads.
+        """
+        self.trace_logger.log_trace(self.owner, "main 1", trace_level=TraceLevel.INFO)
+        thread = Thread(target=self.trace_logger.log_trace, args=(self.owner, "thread", TraceLevel.INFO))
+        thread.start()
+        thread.join()
+        self.trace_logger.log_trace(self.owner, "main 2", trace_level=TraceLevel.INFO)
+
+        self.assertEqual("", self.output.getvalue(), "The traces should not be written before the flush")
+        self.assertEqual(["[Owner][INFO] main 1", "[Owner][INFO] thread", "[Owner][INFO] main 2"], self._get_lines(),
+                         "Wrong traces")
+        self.assertEqual(1, len(self.trace_logger._trace_rings), "The ring buffer of the ended thread is kept")
+    # end def test_deferred_write
+
+    def test_full_ring(self):
+        """
+        Test the oldest traces are dropped and counted when the ring buffer is full.
+        """
+        trace_logger = TraceLogger(buffered=True, ring_size=2, flush_period=60)
+        owner = DummyOwner()
+        trace_logger.subscribe(subscription_owner=owner, trace_level=TraceLevel.INFO, trace_name="Owner")
+        output = StringIO()
+        trace_logger._trace_table[next(iter(trace_logger._trace_table))].output = output
+
+        for index in range(5):
+            trace_logger.log_trace(owner, "{}", trace_level=TraceLevel.INFO, args=(index,))
+        # end for
+        trace_logger.flush()
+
+        self.assertEqual(3, trace_logger.dropped_trace_count, "Wrong dropped trace count")
+        self.assertEqual(["3", "4"], [line.split(' ')[-1] for line in output.getvalue().splitlines()],
+                         "Wrong kept traces")
+        trace_logger.unsubscribe(owner)
+    # end def test_full_ring
+
+    def test_closed_output(self):
+        """
+        Test the traces of an owner recorded after its unsubscription flush are dropped, without aborting the write
+        of the other traces.
+        """
+        owner = DummyOwner()
+        self.trace_logger.subscribe(subscription_owner=owner, trace_level=TraceLevel.INFO, trace_name="Closed")
+        owner_info = self.trace_logger._trace_table[next(reversed(self.trace_logger._trace_table))]
+        output = StringIO()
+        owner_info.output = output
+
+        self.trace_logger.log_trace(self.owner, "before", trace_level=TraceLevel.INFO)
+        # Record queued between the flush and the close of the unsubscription
+        self.trace_logger.log_trace(owner, "dropped", trace_level=TraceLevel.INFO)
+        output.close()
+        self.trace_logger.log_trace(self.owner, "after", trace_level=TraceLevel.INFO)
+
+        self.assertEqual(["[Owner][INFO] before", "[Owner][INFO] after"], self._get_lines(), "Wrong traces")
+        self.trace_logger.unsubscribe(owner)
+    # end def test_closed_output
+# end class BufferedTraceLoggerTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
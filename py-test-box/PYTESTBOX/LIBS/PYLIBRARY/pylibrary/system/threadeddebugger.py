@@ -461,6 +461,17 @@ class ThreadedDebugger(Debugger):
                                                **kwargs)
     # end def loadAdrFile
 
+    def loadElfFile(self, elfFilePath, *args, **kwargs):                                                                # pylint:disable=W0221,W0222
+        '''
+        @copydoc pylibrary.system.debugger.Debugger.loadElfFile
+        @option args   [in] (list) extraneous arguments
+        @option kwargs [in] (list) extraneous keyword arguments
+        '''
+        return self._getWrapper('loadElfFile')(elfFilePath,
+                                               *args,
+                                               **kwargs)
+    # end def loadElfFile
+
     def loadMemoryFile(self, memoryFilePath,
                              format     = Debugger.FORMAT_AUTO,                                                         # @ReservedAssignment pylint:disable=W0622
                              memoryType = None,
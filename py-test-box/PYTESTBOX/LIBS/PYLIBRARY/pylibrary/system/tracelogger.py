@@ -13,13 +13,21 @@
 # imports
 # ------------------------------------------------------------------------------
 from _io import TextIOWrapper
+from atexit import register
+from collections import deque
 from enum import IntEnum
 from enum import auto
+from operator import itemgetter
 from os import W_OK
 from os import access
 from os import path
+from sys import stderr
 from sys import stdout
+from threading import Event
 from threading import RLock
+from threading import Thread
+from threading import current_thread
+from threading import local
 from time import perf_counter_ns
 from weakref import ref
 
@@ -38,6 +46,14 @@ TIMESTAMP_UNIT_DIVIDER_MAP = {
 # This can the value 's', 'ms', 'us' or 'ns'
 TIMESTAMP_UNIT = 'ms'
 
+# If True, the traces of the trace logger instance are recorded in per thread ring buffers and written by a background
+# thread, so that tracing does not slow down the traced thread. If False, they are written by the caller
+BUFFERED_TRACE = False
+# Number of traces kept per thread before the flush, the oldest traces are dropped when a ring buffer is full
+TRACE_RING_SIZE = 16384
+# Period of the background flush of the ring buffers [seconds]
+TRACE_FLUSH_PERIOD = 0.1
+
 
 class TraceLevel(IntEnum):
     """
@@ -73,21 +89,51 @@ class TraceLogger:
         # end def __init__
     # end class _SubscribedOwnerInfo
 
+    class _TraceRing:
+        """
+        Ring buffer of the traces of a thread, waiting to be written. Only its thread appends to it and only the flush
+        removes from it, which ``deque`` supports without lock.
+        """
+        def __init__(self, thread, size):
+            self.thread = thread
+            self.records = deque(maxlen=size)
+            self.dropped_count = 0
+        # end def __init__
+    # end class _TraceRing
+
     _SINGLETON = None
 
     @staticmethod
     def get_instance():
         if TraceLogger._SINGLETON is None:
-            TraceLogger._SINGLETON = TraceLogger()
+            TraceLogger._SINGLETON = TraceLogger(buffered=BUFFERED_TRACE)
         # end if
 
         return TraceLogger._SINGLETON
     # end def get_instance
 
-    def __init__(self):
+    def __init__(self, buffered=False, ring_size=TRACE_RING_SIZE, flush_period=TRACE_FLUSH_PERIOD):
+        """
+        :param buffered: Flag indicating to record the traces in per thread ring buffers written by a background
+                         thread, instead of writing them in the caller thread - OPTIONAL
+        :type buffered: ``bool``
+        :param ring_size: Number of traces kept per thread before the flush - OPTIONAL
+        :type ring_size: ``int``
+        :param flush_period: Period of the background flush in seconds - OPTIONAL
+        :type flush_period: ``float``
+        """
         self._lock = RLock()
         self._trace_table = {}
         self._setting_linked_trace_level = []
+
+        self.buffered = buffered
+        self._ring_size = ring_size
+        self._flush_period = flush_period
+        self._thread_local = local()
+        self._trace_rings = []
+        self._dropped_count = 0
+        self._flush_thread = None
+        self._flush_event = Event()
     # end def __init__
 
     def __del__(self):
@@ -97,6 +143,17 @@ class TraceLogger:
         self.unsubscribe_all()
     # end def __del__
 
+    @property
+    def dropped_trace_count(self):
+        """
+        Number of traces dropped because a ring buffer was full.
+
+        :return: The dropped trace count
+        :rtype: ``int``
+        """
+        return self._dropped_count + sum(trace_ring.dropped_count for trace_ring in list(self._trace_rings))
+    # end def dropped_trace_count
+
     def _sanity_check(self, subscription_owner):
         """
         Perform a sanity check for a subscription owner.
@@ -248,9 +305,13 @@ class TraceLogger:
         :param subscription_owner: Subscription owner to unsubscribe
         :type subscription_owner: ``object``
         """
+        # The pending traces are written before the output is closed. The traces recorded after this flush are
+        # dropped, the output of their owner being removed
+        self.flush()
         owner_info = self._trace_table.pop(ref(subscription_owner), None)
         if owner_info is not None:
             out_file = owner_info.output
+            owner_info.output = None
             if out_file != stdout and hasattr(out_file, "close"):
                 out_file.close()
             # end if
@@ -289,8 +350,10 @@ class TraceLogger:
         """
         Unsubscribe all owners.
         """
+        self.flush()
         for owner_info in self._trace_table.values():
             out_file = owner_info.output
+            owner_info.output = None
             if out_file != stdout and hasattr(out_file, "close"):
                 out_file.close()
             # end if
@@ -414,8 +477,24 @@ class TraceLogger:
         return self._trace_table[ref(subscription_owner)].name
     # end def get_trace_name
 
-    @synchronize_with_object_inner_lock("_lock")
-    def log_trace(self, subscription_owner, message, trace_level=TraceLevel.NO_TRACE, end_line="\n"):
+    def is_trace_enabled(self, subscription_owner, trace_level):
+        """
+        Check if a message of a trace level would be traced for an owner. It enables to skip building a costly
+        message. This check does not take the lock.
+
+        :param subscription_owner: Subscription owner to use
+        :type subscription_owner: ``object``
+        :param trace_level: The trace level of the message
+        :type trace_level: ``TraceLevel`` or ``int``
+
+        :return: Flag indicating if the message would be traced
+        :rtype: ``bool``
+        """
+        owner_info = self._trace_table.get(ref(subscription_owner)) if subscription_owner is not None else None
+        return owner_info is not None and 0 < trace_level <= owner_info.level
+    # end def is_trace_enabled
+
+    def log_trace(self, subscription_owner, message, trace_level=TraceLevel.NO_TRACE, end_line="\n", args=None):
         """
         Write the wanted message on the owner output. The log format is:
 
@@ -424,52 +503,181 @@ class TraceLogger:
         If the trace level of the owner is ``TraceLevel.NO_TRACE``, the trace_level argument is NO_TRACE or
         ``trace_level`` is higher than the trace level of the owner, this message log is not done and ignored.
 
+        If the trace logger is buffered, the message is recorded in the ring buffer of the calling thread and written
+        later by the background flush, otherwise it is written immediately.
+
         :param subscription_owner: Subscription owner to use
         :type subscription_owner: ``object``
-        :param message: Message to trace in the log
+        :param message: Message to trace in the log. If ``args`` is given, it is a ``str.format`` template
         :type message: ``str``
         :param trace_level: The trace level of this message - OPTIONAL
         :type trace_level: ``TraceLevel`` or ``int``
         :param end_line: End line string, by default it is a new line character. If ``None``, no end line is
                          added - OPTIONAL
         :type end_line: ``str``
+        :param args: Arguments of the message template, formatted only when the message is written. They should not
+                     be modified after the call - OPTIONAL
+        :type args: ``tuple`` or ``None``
 
         :raise ``AssertionError``: If a sanity check fails or if writing all the message on the output failed
         """
         # The timestamp is computed before anything else to get the best value
         timestamp = perf_counter_ns()
 
-        if not self._sanity_check(subscription_owner=subscription_owner):
+        if subscription_owner is None:
             return
         # end if
 
-        if self._trace_table[ref(subscription_owner)].level == TraceLevel.NO_TRACE or \
-                trace_level == TraceLevel.NO_TRACE or \
-                trace_level > self._trace_table[ref(subscription_owner)].level:
+        # A single lookup without lock: the level check is all a disabled trace costs
+        owner_info = self._trace_table.get(ref(subscription_owner))
+        if owner_info is None or not 0 < trace_level <= owner_info.level:
             return
         # end if
 
-        if end_line is None:
-            end_line = ""
+        record = (timestamp, owner_info, trace_level, message, args, end_line)
+        if self.buffered:
+            try:
+                trace_ring = self._thread_local.trace_ring
+            except AttributeError:
+                trace_ring = self._add_trace_ring()
+            # end try
+            if len(trace_ring.records) == self._ring_size:
+                trace_ring.dropped_count += 1
+            # end if
+            trace_ring.records.append(record)
+        else:
+            with self._lock:
+                self._write_records([record])
+            # end with
         # end if
+    # end def log_trace
 
-        if isinstance(trace_level, TraceLevel):
-            trace_level_print = trace_level.name
-        elif 0 <= trace_level < TraceLevel.RFU:
-            trace_level_print = TraceLevel(trace_level).name
-        else:
-            trace_level_print = trace_level
+    def flush(self):
+        """
+        Write the traces recorded in the ring buffers, in timestamp order.
+
+        :raise ``AssertionError``: If writing all the messages on an output failed
+        """
+        with self._lock:
+            records = []
+            for trace_ring in self._trace_rings:
+                for _ in range(len(trace_ring.records)):
+                    records.append(trace_ring.records.popleft())
+                # end for
+            # end for
+
+            # The ring buffers of the ended threads are removed
+            ended_trace_rings = [trace_ring for trace_ring in self._trace_rings
+                                 if not trace_ring.thread.is_alive() and len(trace_ring.records) == 0]
+            for trace_ring in ended_trace_rings:
+                self._dropped_count += trace_ring.dropped_count
+                self._trace_rings.remove(trace_ring)
+            # end for
+
+            records.sort(key=itemgetter(0))
+            self._write_records(records)
+        # end with
+    # end def flush
+
+    def _add_trace_ring(self):
+        """
+        Create the ring buffer of the calling thread and start the background flush if needed.
+
+        :return: The ring buffer of the calling thread
+        :rtype: ``TraceLogger._TraceRing``
+        """
+        trace_ring = TraceLogger._TraceRing(thread=current_thread(), size=self._ring_size)
+        with self._lock:
+            self._trace_rings.append(trace_ring)
+            if self._flush_thread is None:
+                self._flush_thread = Thread(target=self._flush_loop, name="TraceLoggerFlush", daemon=True)
+                self._flush_thread.start()
+                register(self.flush)
+            # end if
+        # end with
+        self._thread_local.trace_ring = trace_ring
+        return trace_ring
+    # end def _add_trace_ring
+
+    def _flush_loop(self):
+        """
+        Run method of the background flush thread.
+        """
+        while not self._flush_event.wait(self._flush_period):
+            # noinspection PyBroadException
+            try:
+                self.flush()
+            except Exception as exception:
+                stderr.write(f"TraceLogger flush failed: {exception}\n")
+            # end try
+        # end while
+    # end def _flush_loop
+
+    @staticmethod
+    def _write_records(records):
+        """
+        Format the trace records and write them, with one write per consecutive records of an output.
+
+        :param records: The trace records ``(timestamp, owner info, trace level, message, args, end line)``
+        :type records: ``list[tuple]``
+
+        :raise ``AssertionError``: If writing all the messages on an output failed
+        """
+        output = None
+        strings_to_write = []
+        for timestamp, owner_info, trace_level, message, args, end_line in records:
+            if owner_info.output is not output:
+                TraceLogger._write_output(output, strings_to_write)
+                output = owner_info.output
+                strings_to_write = []
+            # end if
+
+            if args is not None:
+                message = message.format(*args)
+            # end if
+
+            if end_line is None:
+                end_line = ""
+            # end if
+
+            if isinstance(trace_level, TraceLevel):
+                trace_level_print = trace_level.name
+            elif 0 <= trace_level < TraceLevel.RFU:
+                trace_level_print = TraceLevel(trace_level).name
+            else:
+                trace_level_print = trace_level
+            # end if
+
+            strings_to_write.append(f"[{owner_info.name}]"
+                                    f"[{trace_level_print}]"
+                                    f"[{timestamp / TIMESTAMP_UNIT_DIVIDER_MAP[TIMESTAMP_UNIT]:.2f}{TIMESTAMP_UNIT}]"
+                                    f" {message}{end_line}")
+        # end for
+        TraceLogger._write_output(output, strings_to_write)
+    # end def _write_records
+
+    @staticmethod
+    def _write_output(output, strings_to_write):
+        """
+        Write strings on an output.
+
+        :param output: The output, ignored if ``None`` or closed
+        :type output: ``TextIOWrapper`` or ``None``
+        :param strings_to_write: The strings to write
+        :type strings_to_write: ``list[str]``
+
+        :raise ``AssertionError``: If writing all the strings on the output failed
+        """
+        if output is None or getattr(output, "closed", False) or len(strings_to_write) == 0:
+            return
         # end if
 
-        str_to_write = f"[{self._trace_table[ref(subscription_owner)].name}]" \
-                       f"[{trace_level_print}]" \
-                       f"[{timestamp / TIMESTAMP_UNIT_DIVIDER_MAP[TIMESTAMP_UNIT]:.2f}{TIMESTAMP_UNIT}]" \
-                       f" {message}{end_line}"
-        len_written = self._trace_table[ref(subscription_owner)].output.write(str_to_write)
+        str_to_write = "".join(strings_to_write)
+        len_written = output.write(str_to_write)
 
         assert len_written == len(str_to_write), f"Could not write the wanted number of character for the log. " \
                                                  f"Expected {len(str_to_write)}, obtained {len_written}"
-    # end def log_trace
+    # end def _write_output
 # end class TraceLogger
 
 
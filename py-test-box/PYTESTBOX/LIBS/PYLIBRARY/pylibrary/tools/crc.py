@@ -9,6 +9,11 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
+from array import array
+from binascii import crc32
+from binascii import crc_hqx
+from struct import Struct
+
 from pylibrary.tools.hexlist import HexList
 from pylibrary.tools.numeral import Numeral
 
@@ -16,7 +21,128 @@ from pylibrary.tools.numeral import Numeral
 # ------------------------------------------------------------------------------
 # implementation
 # ------------------------------------------------------------------------------
+# Slicing-by-8 tables by (polynomial, width), shared by all the CRC objects
+_SLICING_BY_8_TABLES = {}
+_QWORD = Struct('>Q')
+# Bit reversed value of each byte
+_REVERSED_BITS = bytes(int(f'{byte:08b}'[::-1], 2) for byte in range(256))
+
+
+def _to_bytes(data):
+    """
+    Get the bytes of the data given to a CRC: each element is a byte value, a character or a value truncated to its
+    low byte.
+
+    :param data: The data
+    :type data: ``bytes`` or ``bytearray`` or ``memoryview`` or ``HexList`` or ``list[int|str]`` or ``str``
+
+    :return: The bytes of the data
+    :rtype: ``bytes`` or ``bytearray`` or ``memoryview``
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    elif isinstance(data, memoryview):
+        return data.cast('B') if data.format != 'B' else data
+    # end if
+
+    try:
+        return bytes(data)
+    except (TypeError, ValueError):
+        return bytes((ord(element) if isinstance(element, str) else element) & 0xFF for element in data)
+    # end try
+# end def _to_bytes
+
+
+def _get_slicing_by_8_tables(polynomial, width):
+    """
+    Get the slicing-by-8 tables of a most significant bit first CRC: the table ``k`` gives the CRC of a byte followed
+    by ``k`` null bytes.
+
+    :param polynomial: The polynomial
+    :type polynomial: ``int``
+    :param width: The CRC width in bits, 16 or 32
+    :type width: ``int``
+
+    :return: The 8 tables of 256 values
+    :rtype: ``list[list[int]]``
+    """
+    tables = _SLICING_BY_8_TABLES.get((polynomial, width))
+    if tables is None:
+        top_bit = 1 << (width - 1)
+        mask = (1 << width) - 1
+        table = []
+        for byte in range(256):
+            crc = byte << (width - 8)
+            for _ in range(8):
+                crc = (crc << 1) ^ polynomial if crc & top_bit else crc << 1
+            # end for
+            table.append(crc & mask)
+        # end for
+
+        tables = [table]
+        for _ in range(7):
+            tables.append([((crc << 8) & mask) ^ table[crc >> (width - 8)] for crc in tables[-1]])
+        # end for
+        _SLICING_BY_8_TABLES[(polynomial, width)] = tables
+    # end if
+    return tables
+# end def _get_slicing_by_8_tables
+
+
+def _compute_slicing_by_8(crc, data, polynomial, width):
+    """
+    Update a most significant bit first CRC, 8 bytes at a time.
+
+    :param crc: The current CRC value
+    :type crc: ``int``
+    :param data: The data
+    :type data: ``bytes`` or ``bytearray`` or ``memoryview``
+    :param polynomial: The polynomial
+    :type polynomial: ``int``
+    :param width: The CRC width in bits, 16 or 32
+    :type width: ``int``
+
+    :return: The updated CRC value
+    :rtype: ``int``
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = _get_slicing_by_8_tables(polynomial, width)
+    mask = (1 << width) - 1
+    data = memoryview(data)
+    end = len(data) - len(data) % 8
+    crc_shift = 64 - width
+    for (value,) in _QWORD.iter_unpack(data[:end]):
+        value ^= crc << crc_shift
+        crc = (t7[value >> 56] ^ t6[(value >> 48) & 0xFF] ^ t5[(value >> 40) & 0xFF] ^ t4[(value >> 32) & 0xFF] ^
+               t3[(value >> 24) & 0xFF] ^ t2[(value >> 16) & 0xFF] ^ t1[(value >> 8) & 0xFF] ^ t0[value & 0xFF])
+    # end for
+
+    byte_shift = width - 8
+    for byte in data[end:]:
+        crc = ((crc << 8) & mask) ^ t0[(crc >> byte_shift) ^ byte]
+    # end for
+    return crc
+# end def _compute_slicing_by_8
+
+
+def _reverse_bits_32(value):
+    """
+    Reverse the bit order of a 32 bits value.
+
+    :param value: The value
+    :type value: ``int``
+
+    :return: The reversed value
+    :rtype: ``int``
+    """
+    return int.from_bytes(value.to_bytes(4, 'little').translate(_REVERSED_BITS), 'big')
+# end def _reverse_bits_32
+
+
 class Crc16ccitt:
+    """
+    Implement the CRC 16 CCITT, most significant bit first. The data can be given in several parts with
+    ``continue_crc``.
+    """
     DEFAULT_PRESET = 0xFFFF
     DEFAULT_POLYNOMIAL = 0x1021
 
@@ -35,34 +161,17 @@ class Crc16ccitt:
     @polynomial.setter
     def polynomial(self, value):
         self.__polynomial = value
-        self._tab = [self._initial(i) for i in range(256)]
+        self._tab = _get_slicing_by_8_tables(value, 16)[0]
     # end setter def polynomial
 
-    def _initial(self, c):
-        crc = 0
-        c = c << 8
-        for j in range(8):
-            if (crc ^ c) & 0x8000:
-                crc = (crc << 1) ^ self.polynomial
-            else:
-                crc = crc << 1
-            # end if
-            c = c << 1
-        # end for
-        return crc
-    # end setter def _initial
-
     def _compute_crc(self, array_to_parse):
-        for c in array_to_parse:
-            if isinstance(c, str):
-                c = ord(c)
-            # end if
-            cc = 0xff & c
-
-            tmp = (self.crc >> 8) ^ cc
-            self.crc = (self.crc << 8) ^ self._tab[tmp & 0xff]
-            self.crc = self.crc & 0xffff
-        # end for
+        data = _to_bytes(array_to_parse)
+        if self.polynomial == self.DEFAULT_POLYNOMIAL:
+            # binascii implements the CRC-CCITT of this polynomial
+            self.crc = crc_hqx(data, self.crc)
+        else:
+            self.crc = _compute_slicing_by_8(self.crc, data, self.polynomial, 16)
+        # end if
     # end def _compute_crc
 
     def start_crc(self, array_to_parse):
@@ -79,6 +188,10 @@ class Crc16ccitt:
 class Crc32Stm32:
     """
     Implement the CRC 32 algo integrated in the STM32 chipset
+
+    The data is entered by 32-bit words, in little endian: each word is reversed before being given to the CRC
+    calculator, an incomplete last word is ignored. The data can be given in several parts with ``continue_crc``, the
+    bytes of an incomplete word are kept for the next part.
     """
     DEFAULT_POLYNOMIAL = 0x04C11DB7
     DEFAULT_INIT_VALUE = 0xFFFFFFFF
@@ -95,6 +208,8 @@ class Crc32Stm32:
         self.init_value = init_value
         self.crc_table = {}
         self.generate_crc32_table()
+        self.crc = init_value
+        self._incomplete_word = b''
     # end def __init__
 
     @classmethod
@@ -112,17 +227,29 @@ class Crc32Stm32:
                 for i in range(len(data) // cls.INPUT_DATA_WORD_SIZE)]
     # end def sort_data
 
+    @classmethod
+    def reverse_words(cls, data):
+        """
+        Reverse the bytes of each word of the data, as ``sort_data`` but in a single buffer
+
+        :param data: Data to reverse
+        :type data: ``bytes`` or ``bytearray`` or ``memoryview`` or ``HexList``
+
+        :return: Reversed words, without the incomplete last word
+        :rtype: ``bytes``
+        """
+        data = _to_bytes(data)
+        words = array('I')
+        words.frombytes(data[:len(data) - len(data) % cls.INPUT_DATA_WORD_SIZE])
+        words.byteswap()
+        return words.tobytes()
+    # end def reverse_words
+
     def generate_crc32_table(self):
         """
         Generate CRC32 table
         """
-        for i in range(256):
-            c = i << 24
-            for _ in range(8):
-                c = (c << 1) ^ self.polynomial if (c & 0x80000000) else c << 1
-            # end for
-            self.crc_table[i] = c & 0xffffffff
-        # end for
+        self.crc_table = dict(enumerate(_get_slicing_by_8_tables(self.polynomial, 32)[0]))
     # end def generate_crc32_table
 
     def calculate_crc(self, data):
@@ -130,15 +257,62 @@ class Crc32Stm32:
         Calculate the CRC of data
 
         :param data: Input data
-        :type data: ``HexList``
+        :type data: ``HexList`` or ``bytes`` or ``bytearray`` or ``memoryview``
 
         :return: CRC value
         :rtype: ``HexList``
         """
-        data = self.sort_data(data)
-        return HexList(Numeral(self.crc32(data)))[::-1]
+        return HexList(Numeral(self._compute_crc(self.init_value, self.reverse_words(data))))[::-1]
     # end def calculate_crc
 
+    def start_crc(self, data):
+        """
+        Start a CRC computation with the first part of the data
+
+        :param data: Input data
+        :type data: ``HexList`` or ``bytes`` or ``bytearray`` or ``memoryview``
+        """
+        self.crc = self.init_value
+        self._incomplete_word = b''
+        self.continue_crc(data)
+    # end def start_crc
+
+    def continue_crc(self, data):
+        """
+        Continue a CRC computation with the next part of the data
+
+        :param data: Input data
+        :type data: ``HexList`` or ``bytes`` or ``bytearray`` or ``memoryview``
+        """
+        data = _to_bytes(data)
+        if len(self._incomplete_word) > 0:
+            data = self._incomplete_word + bytes(data)
+        # end if
+        self._incomplete_word = bytes(data[len(data) - len(data) % self.INPUT_DATA_WORD_SIZE:])
+        self.crc = self._compute_crc(self.crc, self.reverse_words(data))
+    # end def continue_crc
+
+    def _compute_crc(self, crc, data):
+        """
+        Update a CRC with the reversed words of the data
+
+        :param crc: Current CRC value
+        :type crc: ``int``
+        :param data: Reversed words
+        :type data: ``bytes``
+
+        :return: Updated CRC value
+        :rtype: ``int``
+        """
+        if self.polynomial == self.DEFAULT_POLYNOMIAL:
+            # binascii implements the bit reflected CRC of this polynomial, the bits of the data and of the CRC are
+            # reversed around it. Its CRC value is inverted in input and in output
+            return _reverse_bits_32(
+                crc32(data.translate(_REVERSED_BITS), _reverse_bits_32(crc) ^ 0xFFFFFFFF) ^ 0xFFFFFFFF)
+        # end if
+        return _compute_slicing_by_8(crc, data, self.polynomial, 32)
+    # end def _compute_crc
+
     def crc32(self, data):
         """
         Get CRC32, as computed in STM32
@@ -15,60 +15,368 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
+from bisect import bisect_right
+from dataclasses import dataclass
+from os import stat
+from os.path import abspath
+from threading import RLock
+
 from elftools.elf.elffile import ELFFile
 from elftools.elf.sections import SymbolTableSection
 
+
 # ------------------------------------------------------------------------------
 # implementation
 # ------------------------------------------------------------------------------
+@dataclass(frozen=True)
+class ElfSymbol:
+    """
+    Symbol of the ``.symtab`` section of an elf file.
+    """
+    name: str
+    address: int
+    size: int
 
+    @property
+    def end(self):
+        """
+        The address following the symbol.
+
+        :return: The end address, excluded
+        :rtype: ``int``
+        """
+        return self.address + self.size
+    # end def end
+# end class ElfSymbol
+
+
+class AddressIntervals:
+    """
+    Set of addresses stored as sorted, disjoint ``[start, end)`` intervals.
+
+    It replaces the sets of every byte address of the symbols: the membership is checked by bisection and the memory
+    only depends on the number of symbols.
+    """
+
+    def __init__(self, intervals=()):
+        """
+        :param intervals: The ``(start, end)`` intervals, the end being excluded. They can be unsorted and overlap
+                          - OPTIONAL
+        :type intervals: ``iterable[tuple[int, int]]``
+        """
+        merged = []
+        for start, end in sorted(interval for interval in intervals if interval[1] > interval[0]):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+                # end if
+            else:
+                merged.append([start, end])
+            # end if
+        # end for
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+    # end def __init__
+
+    @property
+    def intervals(self):
+        """
+        The sorted, disjoint intervals.
+
+        :return: The ``(start, end)`` intervals, the end being excluded
+        :rtype: ``list[tuple[int, int]]``
+        """
+        return list(zip(self._starts, self._ends))
+    # end def intervals
+
+    def __contains__(self, address):
+        """
+        Check if an address is in one of the intervals.
+
+        :param address: The address
+        :type address: ``int``
+
+        :return: Flag indicating if the address is in the set
+        :rtype: ``bool``
+        """
+        index = bisect_right(self._starts, address) - 1
+        return index >= 0 and address < self._ends[index]
+    # end def __contains__
+
+    def contains_all(self, addresses):
+        """
+        Check if all the addresses are in the intervals.
+
+        :param addresses: The addresses
+        :type addresses: ``iterable[int]``
+
+        :return: Flag indicating if all the addresses are in the set
+        :rtype: ``bool``
+        """
+        return all(address in self for address in addresses)
+    # end def contains_all
+
+    def __or__(self, other):
+        """
+        Get the union with other intervals.
+
+        :param other: The other intervals
+        :type other: ``AddressIntervals``
+
+        :return: The union
+        :rtype: ``AddressIntervals``
+        """
+        return AddressIntervals(self.intervals + other.intervals)
+    # end def __or__
+
+    def __iter__(self):
+        """
+        Iterate over all the addresses, in increasing order.
+
+        :return: The address iterator
+        :rtype: ``iterator[int]``
+        """
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end)
+        # end for
+    # end def __iter__
+
+    def __len__(self):
+        """
+        Get the number of addresses.
+
+        :return: The number of addresses
+        :rtype: ``int``
+        """
+        return sum(self._ends) - sum(self._starts)
+    # end def __len__
+
+    def __eq__(self, other):
+        # See ``object.__eq__``
+        return isinstance(other, AddressIntervals) and self.intervals == other.intervals
+    # end def __eq__
+
+    def __repr__(self):
+        # See ``object.__repr__``
+        return f"AddressIntervals({', '.join(f'[0x{start:X}, 0x{end:X})' for start, end in self.intervals)})"
+    # end def __repr__
+# end class AddressIntervals
+
+
+class ElfSymbolIndex:
+    """
+    Index of the symbols of an elf file, loaded once per file version.
+
+    The symbols are indexed by name, as returned by ``SymbolTableSection.get_symbol_by_name`` (the first symbol of a
+    name), and by address: the sized symbols are sorted by start address to find the symbol containing an address by
+    bisection.
+    """
+    # Cache of the indexes per absolute path, with the (modification time, size) of the loaded file
+    SYMBOL_INDEX_CACHE = {}
+    _CACHE_LOCK = RLock()
 
-class ElfHelper:
     def __init__(self, elf_file):
-        self.elf_file = elf_file
+        """
+        :param elf_file: Path of the elf file
+        :type elf_file: ``str``
 
-    # returns a set with all the addresses spanning across each symbol memory range,
-    # these addresses can be used as an input to the is_same_hex() method.
-    def get_symbols_address_range(self, symbols_names=None):
-        symbols_addresses = set()
-        if symbols_names is None:
-            return symbols_addresses
-
-        with open(self.elf_file, 'rb') as f:
-            elf_object = ELFFile(f)
-            symbol_table = elf_object.get_section_by_name('.symtab')
-            assert (isinstance(symbol_table, SymbolTableSection))
-            symbols_allowed_to_differ = []
-            for name in symbols_names:
-                if symbol_table.get_symbol_by_name(name) is not None:
-                    symbols_allowed_to_differ.append(symbol_table.get_symbol_by_name(name)[0])
+        :raise ``AssertionError``: If the elf file has no symbol table
+        """
+        self.elf_file = elf_file
+        self._symbols_by_name = {}
+        sized_symbols = []
+        with open(elf_file, 'rb') as f:
+            symbol_table = ELFFile(f).get_section_by_name('.symtab')
+            assert isinstance(symbol_table, SymbolTableSection), f"No symbol table in {elf_file}"
+            for elf_symbol in symbol_table.iter_symbols():
+                symbol = ElfSymbol(name=elf_symbol.name, address=elf_symbol['st_value'], size=elf_symbol['st_size'])
+                self._symbols_by_name.setdefault(symbol.name, symbol)
+                if symbol.size > 0:
+                    sized_symbols.append(symbol)
                 # end if
             # end for
+        # end with
 
-            for i in symbols_allowed_to_differ:
-                symbols_addresses |= set(x for x in range(i['st_value'], i['st_value'] + i['st_size']))
-            # end for
+        sized_symbols.sort(key=lambda sized_symbol: (sized_symbol.address, sized_symbol.size))
+        self._sorted_symbols = sized_symbols
+        self._starts = [symbol.address for symbol in sized_symbols]
+        # Highest end address of the symbols up to each index, to stop the backward search of overlapping symbols
+        self._max_ends = []
+        max_end = 0
+        for symbol in sized_symbols:
+            max_end = max(max_end, symbol.end)
+            self._max_ends.append(max_end)
+        # end for
+    # end def __init__
 
-            return symbols_addresses
-        # end with
+    @classmethod
+    def get(cls, elf_file):
+        """
+        Get the index of an elf file, loaded again only if the file changed since its last load.
 
-    # end get_symbols_address_range
+        :param elf_file: Path of the elf file
+        :type elf_file: ``str``
 
-    # this returns the start address of a symbol.
-    def get_symbol_address(self, name):
-        with open(self.elf_file, 'rb') as f:
-            elf_object = ELFFile(f)
-            symbol_table = elf_object.get_section_by_name('.symtab')
-            assert (isinstance(symbol_table, SymbolTableSection))
-            if symbol_table.get_symbol_by_name(name) is not None:
-                return symbol_table.get_symbol_by_name(name)[0]['st_value']
-            else:
-                return None
+        :return: The symbol index
+        :rtype: ``ElfSymbolIndex``
+        """
+        key = abspath(elf_file)
+        file_stat = stat(key)
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        with cls._CACHE_LOCK:
+            cached = cls.SYMBOL_INDEX_CACHE.get(key)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, cls(key))
+                cls.SYMBOL_INDEX_CACHE[key] = cached
             # end if
         # end with
-    # end get_symbol_address
-# end ElfHelper
+        return cached[1]
+    # end def get
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clear the cache of indexes.
+        """
+        with cls._CACHE_LOCK:
+            cls.SYMBOL_INDEX_CACHE.clear()
+        # end with
+    # end def clear_cache
+
+    def get_symbol(self, name):
+        """
+        Get a symbol by name.
+
+        :param name: The symbol name
+        :type name: ``str``
+
+        :return: The symbol, ``None`` if not found
+        :rtype: ``ElfSymbol`` or ``None``
+        """
+        return self._symbols_by_name.get(name)
+    # end def get_symbol
+
+    def get_symbol_at(self, address):
+        """
+        Get the symbol containing an address. If several symbols contain it, the one starting the closest to the
+        address is returned.
+
+        :param address: The address
+        :type address: ``int``
+
+        :return: The symbol, ``None`` if no sized symbol contains the address
+        :rtype: ``ElfSymbol`` or ``None``
+        """
+        index = bisect_right(self._starts, address) - 1
+        while index >= 0 and self._max_ends[index] > address:
+            symbol = self._sorted_symbols[index]
+            if address < symbol.end:
+                return symbol
+            # end if
+            index -= 1
+        # end while
+        return None
+    # end def get_symbol_at
+
+    def get_address_intervals(self, names):
+        """
+        Get the address intervals spanned by symbols. The unknown names are ignored.
+
+        :param names: The symbol names
+        :type names: ``iterable[str]``
+
+        :return: The address intervals
+        :rtype: ``AddressIntervals``
+        """
+        symbols = [self._symbols_by_name.get(name) for name in names]
+        return AddressIntervals((symbol.address, symbol.end) for symbol in symbols if symbol is not None)
+    # end def get_address_intervals
+# end class ElfSymbolIndex
+
+
+class ElfHelper:
+    """
+    Access to the symbols of an elf file, through its cached ``ElfSymbolIndex``.
+    """
+
+    def __init__(self, elf_file):
+        """
+        :param elf_file: Path of the elf file
+        :type elf_file: ``str``
+        """
+        self.elf_file = elf_file
+    # end def __init__
+
+    @property
+    def symbol_index(self):
+        """
+        The symbol index of the elf file, reloaded if the file changed.
+
+        :return: The symbol index
+        :rtype: ``ElfSymbolIndex``
+        """
+        return ElfSymbolIndex.get(self.elf_file)
+    # end def symbol_index
+
+    def get_symbols_address_intervals(self, symbols_names=None):
+        """
+        Get the address intervals spanned by symbols. The unknown names are ignored.
+
+        :param symbols_names: The symbol names - OPTIONAL
+        :type symbols_names: ``list[str]`` or ``None``
+
+        :return: The address intervals, empty if no name is given
+        :rtype: ``AddressIntervals``
+        """
+        if symbols_names is None:
+            return AddressIntervals()
+        # end if
+        return self.symbol_index.get_address_intervals(symbols_names)
+    # end def get_symbols_address_intervals
+
+    def get_symbols_address_range(self, symbols_names=None):
+        """
+        Get a set with all the addresses spanning across each symbol memory range, these addresses can be used as an
+        input to the ``is_same_hex()`` method. ``get_symbols_address_intervals`` gives the same addresses without
+        building the set.
+
+        :param symbols_names: The symbol names - OPTIONAL
+        :type symbols_names: ``list[str]`` or ``None``
+
+        :return: The addresses
+        :rtype: ``set[int]``
+        """
+        return set(self.get_symbols_address_intervals(symbols_names))
+    # end def get_symbols_address_range
+
+    def get_symbol_address(self, name):
+        """
+        Get the start address of a symbol.
+
+        :param name: The symbol name
+        :type name: ``str``
+
+        :return: The symbol address, ``None`` if not found
+        :rtype: ``int`` or ``None``
+        """
+        symbol = self.symbol_index.get_symbol(name)
+        return None if symbol is None else symbol.address
+    # end def get_symbol_address
+
+    def get_symbol_at(self, address):
+        """
+        Get the symbol containing an address.
+
+        :param address: The address
+        :type address: ``int``
+
+        :return: The symbol, ``None`` if no sized symbol contains the address
+        :rtype: ``ElfSymbol`` or ``None``
+        """
+        return self.symbol_index.get_symbol_at(address)
+    # end def get_symbol_at
+# end class ElfHelper
 
 # ------------------------------------------------------------------------------
 # END OF FILE
-# ------------------------------------------------------------------------------
\ No newline at end of file
+# ------------------------------------------------------------------------------
@@ -14,16 +14,12 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
-from array import array
 from binascii import a2b_hex
-from binascii import b2a_hex
-from struct import pack
 from traceback import extract_stack
 from types import MethodType
 import copy
 import random
 import warnings
-from functools import reduce
 
 
 # ------------------------------------------------------------------------------
@@ -241,9 +237,7 @@ class HexList(list, HexListable):
             value = value.replace(' ', '')
 
             try:
-                parseVal = array("B")
-                parseVal.frombytes(a2b_hex(value))
-                collector.extend(parseVal)
+                collector.extend(a2b_hex(value))
             except Exception as excp:
                 raise HexListError("%s (%s)" % (excp, value))
             # end try
@@ -255,7 +249,6 @@ class HexList(list, HexListable):
         """
         Parser dedicated to int and long processing
         """
-        __BYTE_RANGE = list(range(0, 256))
 
         @staticmethod
         def accept(value):
@@ -273,7 +266,7 @@ class HexList(list, HexListable):
             """
 
             # The element is an integer or long
-            if value not in cls.__BYTE_RANGE:
+            if not 0 <= value <= 0xFF:
                 raise HexListError("Element is not an unsigned byte (%s)!" % value)
             else:
                 collector.append(value)
@@ -306,6 +299,33 @@ class HexList(list, HexListable):
 
     # end class HexListParser
 
+    class BytesParser(Parser):
+        """
+        Parser dedicated to bytes, bytearray and memoryview processing
+        """
+
+        @staticmethod
+        def accept(value):
+            """
+            @copydoc pylibrary.tools.hexlist.HexList.Parser.accept
+            """
+            return isinstance(value, (bytes, bytearray, memoryview))
+
+        # end def accept
+
+        @staticmethod
+        def parse(value, collector):
+            """
+            @copydoc pylibrary.tools.hexlist.HexList.Parser.parse
+            """
+            if isinstance(value, memoryview) and value.format != 'B':
+                value = value.cast('B')
+            # end if
+            collector.extend(value)
+        # end def parse
+
+    # end class BytesParser
+
     class HexListableParser(Parser):
         """
         Parser dedicated to __hexlist__ processing
@@ -354,7 +374,11 @@ class HexList(list, HexListable):
             @copydoc pylibrary.tools.hexlist.HexList.Parser.parse
             """
             for subValue in value:
-                collector.extend(HexList(subValue))
+                if type(subValue) is int and 0 <= subValue <= 0xFF:
+                    collector.append(subValue)
+                else:
+                    collector.extend(HexList(subValue))
+                # end if
             # end for
         # end def parse
 
@@ -388,10 +412,22 @@ class HexList(list, HexListable):
     __PARSERS = (IntegerParser(),
                  StringParser(),
                  HexListParser(),
+                 BytesParser(),
                  HexListableParser(),
                  IterableParser(),
                  NoneParser())
 
+    # Parsers of the most frequent exact types, found without testing all the parsers
+    __TYPE_PARSERS = {int: __PARSERS[0],
+                      str: __PARSERS[1],
+                      bytes: __PARSERS[3],
+                      bytearray: __PARSERS[3],
+                      memoryview: __PARSERS[3],
+                      type(None): __PARSERS[-1]}
+
+    # Translation table of the @e not operator
+    __INVERT_TABLE = bytes(range(255, -1, -1))
+
     def _getParser(self, value):
         """
         Obtains a parser for given value
@@ -419,7 +455,14 @@ class HexList(list, HexListable):
         glistVal = []
 
         for itemValue in initValue:
-            parser = self._getParser(itemValue)
+            if type(itemValue) is HexList:
+                glistVal.extend(itemValue)
+                continue
+            # end if
+            parser = self.__TYPE_PARSERS.get(type(itemValue))
+            if parser is None:
+                parser = self._getParser(itemValue)
+            # end if
             parser.parse(itemValue, glistVal)
         # end for
 
@@ -448,7 +491,7 @@ class HexList(list, HexListable):
 
         @return (str) String representation of HexList
         """
-        return b2a_hex(pack('%dB' % (len(self),), *self)).upper().decode('utf8')
+        return bytes(self).hex().upper()
 
     # end def __str__
 
@@ -622,16 +665,9 @@ class HexList(list, HexListable):
                           stacklevel=2)
         # end if
 
-        minimum = min(len(self), len(hexBuf))
-        for ind in range(-minimum, 0):
-            list.__setitem__(hexBuf, ind, hexBuf[ind] ^ self[ind])
-        # end for
-
-        if len(self) > len(hexBuf):
-            hexBuf[:0] = self[:-minimum]
-        # end if
-
-        return hexBuf
+        # The operands are aligned on their right, as big endian integers
+        value = self.toLong() ^ hexBuf.toLong()
+        return HexList(value.to_bytes(max(len(self), len(hexBuf)), 'big'))
 
     # end def __xor__
 
@@ -650,15 +686,9 @@ class HexList(list, HexListable):
                           stacklevel=2)
         # end if
 
-        minimum = min(len(self), len(hexBuf))
-        for ind in range(-minimum, 0):
-            hexBuf[ind] |= self[ind]
-        # end for
-        if len(self) > len(hexBuf):
-            return HexList(self[0:-minimum], hexBuf)
-        else:
-            return hexBuf
-        # end if
+        # The operands are aligned on their right, as big endian integers
+        value = self.toLong() | hexBuf.toLong()
+        return HexList(value.to_bytes(max(len(self), len(hexBuf)), 'big'))
 
     # end def __or__
 
@@ -680,15 +710,9 @@ class HexList(list, HexListable):
                           stacklevel=2)
         # end if
 
-        minimum = min(len(self), len(hexBuf))
-        for ind in range(-minimum, 0):
-            hexBuf[ind] &= self[ind]
-        # end for
-        if len(self) > len(hexBuf):
-            return hexBuf
-        else:
-            return hexBuf[-minimum:]
-        # end if
+        # The operands are aligned on their right, as big endian integers
+        value = self.toLong() & hexBuf.toLong()
+        return HexList(value.to_bytes(min(len(self), len(hexBuf)), 'big'))
 
     # end def __and__
 
@@ -698,11 +722,7 @@ class HexList(list, HexListable):
 
         @return (HexList) Invert of HexList
         """
-        result = HexList(self)
-        for ind in range(len(self)):
-            list.__setitem__(result, ind, (~(self[ind])) & 0xFF)
-        # end for
-        return result
+        return HexList(bytes(self).translate(self.__INVERT_TABLE))
 
     # end def __invert__
 
@@ -726,6 +746,9 @@ class HexList(list, HexListable):
         """
         result = False
         if isinstance(item, HexList):
+            if len(item) > 0:
+                return bytes(item) in bytes(self)
+            # end if
             l2 = len(item)
             for i in kmp(self, item):
                 if self[i: i + l2] == item:
@@ -752,7 +775,14 @@ class HexList(list, HexListable):
         @return (bool) Presence flag of item in self
         """
         result = 0
-        if isinstance(x, HexList):
+        if isinstance(x, HexList) and len(x) > 0:
+            l1 = len(self) if j == -1 else j
+            result = bytes(self).find(bytes(x), i, l1)
+            if result == -1:
+                raise ValueError('Pattern %s not found in %s'
+                                 % (x, self[i: l1]))
+            # end if
+        elif isinstance(x, HexList):
             l1 = len(self) if j == -1 else j
             l2 = len(x)
             for ind in kmp(self[i: l1], x):
@@ -813,24 +843,14 @@ class HexList(list, HexListable):
                 raise ValueError("Count must be greater than zero")
             # end if
 
-            for _ in range(count):
-                result.insert(0, value & 0xFF)
-                value = value >> 8
-            # end for
-
-        elif value:
-            while value:
-                result.insert(0, value & 0xFF)
-                value = value >> 8
-            # end while
+            # The most significant bytes not fitting in count bytes are dropped
+            value &= (1 << (count * 8)) - 1
 
         else:
-            result.insert(0, 0x00)
+            count = max((value.bit_length() + 7) // 8, 1)
         # end if
 
-        if littleEndian:
-            result.reverse()
-        # end if
+        result.extendRaw(value.to_bytes(count, 'little' if littleEndian else 'big'))
 
         return cls(result) if cls is not HexList else result
 
@@ -1039,13 +1059,7 @@ class HexList(list, HexListable):
                                          Defaults to False
         @return (long) value of HexList
         """
-        if littleEndian:
-            value = reversed(self)
-        else:
-            value = self
-        # end if
-
-        return reduce(lambda x=0, y=0: x * 256 + y, value, 0)
+        return int.from_bytes(bytes(self), 'little' if littleEndian else 'big')
 
     # end def toLong
     hexToLong = toLong
@@ -1056,7 +1070,7 @@ class HexList(list, HexListable):
 
         @return (str) string
         """
-        return ''.join([chr(x) for x in self])
+        return bytes(self).decode('latin-1')
 
     # end def toString
 
@@ -1104,9 +1118,9 @@ class HexList(list, HexListable):
         # end if
 
         if fromLeft:
-            self.insert(0, pattern * paddingSize)
+            list.__setitem__(self, slice(0, 0), pattern * paddingSize)
         else:
-            self.extend(pattern * paddingSize)
+            list.extend(self, pattern * paddingSize)
         # end if
 
     # end def addPadding
@@ -1127,14 +1141,7 @@ class HexList(list, HexListable):
         :return: The ascii string representation of the input value
         :rtype: ``str``
         """
-        result = ''
-        data_length = len(self)
-        for i in range(data_length):
-            if self[i] != 0:
-                result += chr(self[i])
-            # end if
-        # end for
-        return result
+        return bytes(self).replace(b'\x00', b'').decode('latin-1')
     # end def ascii_converter
 # end class HexList
 
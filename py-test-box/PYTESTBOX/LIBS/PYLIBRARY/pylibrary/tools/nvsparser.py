@@ -16,6 +16,7 @@
 # ------------------------------------------------------------------------------
 import abc
 import copy
+import re
 import sys
 import warnings
 from enum import IntEnum
@@ -60,6 +61,9 @@ class MODE(IntEnum):
     RECEIVER = 1
 # end class MODE
 
+# Search of the end of a padding chunk in a memory area
+NON_ERASED_BYTE = re.compile(rb'[^\xFF]')
+
 # CHUNK_ID_TO_CLASS_MAP = {
 #     chunk_name: {
 #         chunk_type: (is_encrypted, python representation class),
@@ -198,6 +202,26 @@ class NvsParserInterface(object, metaclass=abc.ABCMeta):
         raise NotImplementedError('users must define chunk_from_hex_array to use this base class')
     # end def chunk_from_hex_array
 
+    @classmethod
+    @abc.abstractmethod
+    def chunk_from_memory(cls, memory, offset, chunk_id_map):
+        """
+        Parse the chunk starting at an offset of a memory area, without copying the rest of the area.
+
+        :param memory: The memory area to parse, the bank for instance. The chunk data taken from a ``memoryview`` are
+                       ``bytes``.
+        :type memory: ``memoryview`` or ``list`` or ``HexList`` or ``tuple`` or ``bytearray`` or ``bytes``
+        :param offset: The offset of the chunk in the memory area
+        :type offset: ``int``
+        :param chunk_id_map: Map of chunk ids which also defines the NVS_WORD_SIZE
+        :type chunk_id_map: ``dict``
+
+        :return: The chunk object (or the chunk list) and the offset following the chunk.
+        :rtype: ``tuple[NvsChunk|list[NvsChunk], int]``
+        """
+        raise NotImplementedError('users must define chunk_from_memory to use this base class')
+    # end def chunk_from_memory
+
     @staticmethod
     @abc.abstractmethod
     def chunk_to_hex_array(chunk):
@@ -215,7 +239,7 @@ class NvsParserInterface(object, metaclass=abc.ABCMeta):
     # end def chunk_to_hex_array
 
     @abc.abstractmethod
-    def get_chunk(self, chunk_id, mode=None):
+    def get_chunk(self, chunk_id, mode=None, active_bank_only=False):
         """
         Get a chunk.
 
@@ -224,6 +248,8 @@ class NvsParserInterface(object, metaclass=abc.ABCMeta):
         :param mode: Mode of the owner of the NVS. If None, it will oly get the raw chunks (no decryption or special
                      classes). - OPTIONAL
         :type mode: ``MODE``
+        :param active_bank_only: Flag indicating to get the chunk only from the active bank - OPTIONAL
+        :type active_bank_only: ``bool``
 
         :return: The wanted chunk.
         :rtype: ``NvsChunk`` or ``Chunk BitFieldContainerMixin object``
@@ -365,12 +391,39 @@ class IdBasedNvsParser(NvsParserInterface):
         :rtype: ``NvsParser``
         """
         nvs_data = debugger.readMemory(nvs_start_address, nvs_size)
-        nvs_addresses = range(nvs_start_address, nvs_start_address + nvs_size)
 
-        return cls.from_hex_file(IntelHex(dict(zip(nvs_addresses, nvs_data))), zone_bank_length, chunk_id_map,
-                                 aes_key)
+        return cls.from_bytes(nvs_data, nvs_start_address, zone_bank_length, chunk_id_map, aes_key)
     # end def from_memory_read
 
+    @classmethod
+    def from_bytes(cls, nvs_data, nvs_start_address, zone_bank_length, chunk_id_map, aes_key=None):
+        """
+        Construct object from the raw content of the NVS, without building an intermediate hex file.
+
+        :param nvs_data: The content of the NVS.
+        :type nvs_data: ``HexList`` or ``bytes`` or ``bytearray``
+        :param nvs_start_address: The start address of the NVS in memory.
+        :type nvs_start_address: ``int``
+        :param zone_bank_length: The length of each bank in a zone, can be just one number for all zones or a list to
+                                 give the length for each zone.
+        :type zone_bank_length: ``int`` or ``list of int``
+        :param chunk_id_map: The map to get the right chunk ID for the platform/project. The keys should be strings.
+                             You can find examples in pylibrary/tools/chunkidmaps.py.
+                             It must have at least the keys "ACTIVE_BANK_HDR", "TEMP_BANK_HDR", "INVALID_BANK_HDR"
+                             which point to the full header, not just the ID.
+        :type chunk_id_map: ``dict``
+        :param aes_key: NVS AES encryption key. - OPTIONAL
+        :type aes_key: ``IntelHex``
+
+        :return: The object created from the data.
+        :rtype: ``NvsParser``
+        """
+        zone_list = []
+        cls.zones_from_memory(memoryview(bytes(nvs_data)), nvs_start_address, zone_bank_length, chunk_id_map,
+                              zone_list)
+        return cls(chunk_id_map, zone_list, HexList(aes_key))
+    # end def from_bytes
+
     @classmethod
     def from_hex_file(cls, hex_file, zone_bank_length, chunk_id_map, aes_key=None):
         """
@@ -399,28 +452,50 @@ class IdBasedNvsParser(NvsParserInterface):
 
         # Every segment is parsed and then padded in NvsBank if needed
         for (start, stop) in addresses_to_parse:
-            array_to_parse = hex_file.gets(addr=start, length=stop - start)
-            index = 0
-            while len(array_to_parse) > 0:
-                bank_size = zone_bank_length
-                if isinstance(zone_bank_length, list):
-                    bank_size = zone_bank_length[index]
-                    index += 1
-                # end if
-                zone, array_to_parse = NvsZone.from_hex_array(
-                    array_to_parse=array_to_parse,
-                    chunk_from_hex_array_method=cls.chunk_from_hex_array,
-                    bank_length=bank_size,
-                    zone_number=len(zone_list),
-                    start_address=start,
-                    chunk_id_map=chunk_id_map)
-                zone_list.append(zone)
-                start += bank_size * 2
-            # end while
+            cls.zones_from_memory(memoryview(hex_file.gets(addr=start, length=stop - start)), start,
+                                  zone_bank_length, chunk_id_map, zone_list)
         # end for
         return cls(chunk_id_map, zone_list, HexList(aes_key))
     # end def from_hex_file
 
+    @classmethod
+    def zones_from_memory(cls, memory, start_address, zone_bank_length, chunk_id_map, zone_list):
+        """
+        Parse the zones of a contiguous memory area. The area is walked by offset, it is never copied.
+
+        :param memory: The memory area to parse
+        :type memory: ``memoryview``
+        :param start_address: The start address in memory of the area
+        :type start_address: ``int``
+        :param zone_bank_length: The length of each bank in a zone, can be just one number for all zones or a list to
+                                 give the length for each zone.
+        :type zone_bank_length: ``int`` or ``list of int``
+        :param chunk_id_map: The map to get the right chunk ID for the platform/project. The keys should be strings.
+        :type chunk_id_map: ``dict``
+        :param zone_list: The zone list to complete with the parsed zones
+        :type zone_list: ``list[NvsZone]``
+        """
+        offset = 0
+        index = 0
+        while offset < len(memory):
+            bank_size = zone_bank_length
+            if isinstance(zone_bank_length, list):
+                bank_size = zone_bank_length[index]
+                index += 1
+            # end if
+            zone, offset = NvsZone.from_memory(
+                memory=memory,
+                offset=offset,
+                chunk_from_memory_method=cls.chunk_from_memory,
+                bank_length=bank_size,
+                zone_number=len(zone_list),
+                start_address=start_address,
+                chunk_id_map=chunk_id_map)
+            zone_list.append(zone)
+            start_address += bank_size * 2
+        # end while
+    # end def zones_from_memory
+
     def to_hex_file(self):
         """
         Convert this to an IntelHex object.
@@ -449,43 +524,56 @@ class IdBasedNvsParser(NvsParserInterface):
         :return: The chunk object and the array_to_parse minus the chunk.
         :rtype: ``tuple``
         """
+        chunk, offset = cls.chunk_from_memory(array_to_parse, 0, chunk_id_map)
+        return chunk, array_to_parse[offset:]
+    # end def chunk_from_hex_array
+
+    @classmethod
+    def chunk_from_memory(cls, memory, offset, chunk_id_map):
+        # See ``NvsParserInterface.chunk_from_memory``
         word_size = chunk_id_map["NVS_WORD_SIZE"]
-        return_array = array_to_parse
 
-        chunk_id = return_array[0]
+        chunk_id = memory[offset]
 
         if (chunk_id & 0xFF) == 0xFF:
-            # This is considered a padding chunk
-            padding_length = 1
-            for i in range(len(return_array) - 1):
-                if return_array[i] != 0xFF:
-                    break
-                # end if
-                padding_length += 1
-            # end for
-            return_array = return_array[padding_length:]
-            return NvsChunk.create_a_padding_chunk(padding_length, word_size), return_array
+            # This is considered a padding chunk, it ends with the first byte which is not erased
+            if isinstance(memory, memoryview):
+                non_erased_byte = NON_ERASED_BYTE.search(memory, offset)
+                padding_end = len(memory) if non_erased_byte is None else non_erased_byte.start() + 1
+            else:
+                padding_end = offset + 1
+                while padding_end < len(memory) and memory[padding_end - 1] == 0xFF:
+                    padding_end += 1
+                # end while
+            # end if
+            return NvsChunk.create_a_padding_chunk(padding_end - offset, word_size), padding_end
         # end if
 
-        chunk_length = return_array[cls.LENGTH_INDEX]
-        chunk_crc = int.from_bytes(return_array[cls.CRC_INDEX:cls.CRC_INDEX + cls.CRC_SIZE],
+        chunk_length = memory[offset + cls.LENGTH_INDEX]
+        chunk_crc = int.from_bytes(memory[offset + cls.CRC_INDEX:offset + cls.CRC_INDEX + cls.CRC_SIZE],
                                    byteorder="little",
                                    signed=False)
-        chunk_data = return_array[word_size:word_size + word_size * ceil(chunk_length / word_size)]
-        return_array = return_array[word_size + word_size * ceil(chunk_length / word_size):]
+        data_offset = offset + word_size
+        chunk_end = data_offset + word_size * ceil(chunk_length / word_size)
+        chunk_data = memory[data_offset:chunk_end]
+        if isinstance(chunk_data, memoryview):
+            chunk_data = chunk_data.tobytes()
+        # end if
 
         # The CRC check (would only generate a warning if mismatch) is not done for disabled bank header chunk
         if chunk_id != 0:
             crc_check = Crc16ccitt()
-            crc_check.start_crc(list(chunk_data[:chunk_length]) + [chunk_id, chunk_length])
+            crc_check.start_crc(chunk_data[:chunk_length])
+            crc_check.continue_crc((chunk_id, chunk_length))
             if chunk_crc != crc_check.crc:
                 warnings.warn(f"Error CRC for chunk_id = {hex(chunk_id)}: received = {hex(chunk_crc)} and "
                               f"computed = {hex(crc_check.crc)}")
             # end if
         # end if
 
-        return NvsChunk(cls.chunk_to_hex_array, chunk_id, chunk_length, chunk_crc, chunk_data, word_size), return_array
-    # end def chunk_from_hex_array
+        return (NvsChunk(cls.chunk_to_hex_array, chunk_id, chunk_length, chunk_crc, chunk_data, word_size),
+                min(chunk_end, len(memory)))
+    # end def chunk_from_memory
 
     @classmethod
     def chunk_to_hex_array(cls, chunk):
@@ -511,22 +599,25 @@ class IdBasedNvsParser(NvsParserInterface):
         return return_array
     # end def chunk_to_hex_array
 
-    def get_chunk(self, chunk_id, mode=None):
+    def get_chunk(self, chunk_id, mode=None, active_bank_only=False):
         """
-        Get the last value of a chunk in its history.
+        Get the last value of a chunk in its history. Only this value is decrypted and converted.
 
         :param chunk_id: ID of the chunk to get. It can be the int value or the name.
         :type chunk_id: ``int`` or ``str``
         :param mode: Mode of the owner of the NVS. If None, it will oly get the raw chunks (no decryption or special
                      classes). - OPTIONAL
         :type mode: ``MODE``
+        :param active_bank_only: Flag indicating to get the chunk only from the active bank - OPTIONAL
+        :type active_bank_only: ``bool``
 
         :return: The wanted chunk.
         :rtype: ``NvsChunk``
         """
-        chunk_list = self.get_chunk_history(chunk_id, mode)
-        if len(chunk_list) > 0:
-            return chunk_list[-1]
+        chunk_history, is_encrypted, chunk_class = self._get_raw_chunk_history(
+            chunk_id, mode, active_bank_only=active_bank_only)
+        if len(chunk_history) > 0:
+            return self._get_chunk_bitfield_object_from_chunk(chunk_history[-1], is_encrypted, chunk_class)
         else:
             return None
         # end if
@@ -585,6 +676,28 @@ class IdBasedNvsParser(NvsParserInterface):
         :return: The wanted chunk history.
         :rtype: ``list[NvsChunk|BitFieldContainerMixin]``
         """
+        chunk_history, is_encrypted, chunk_class = self._get_raw_chunk_history(
+            chunk_id, mode, get_all=get_all, active_bank_only=active_bank_only)
+
+        return [self._get_chunk_bitfield_object_from_chunk(chunk, is_encrypted, chunk_class) for chunk in chunk_history]
+    # end def get_chunk_history
+
+    def _get_raw_chunk_history(self, chunk_id, mode=None, get_all=False, active_bank_only=False):
+        """
+        Retrieve all the values of a chunk from its history, without decrypting or converting them.
+
+        :param chunk_id: ID of the chunk to get. It can be the int value or the name.
+        :type chunk_id: ``int`` or ``str``
+        :param mode: Mode of the owner of the NVS. - OPTIONAL
+        :type mode: ``MODE``
+        :param get_all: Get all the chunks, even the chunk repeated from disabled bank to active bank - OPTIONAL
+        :type get_all: ``bool``
+        :param active_bank_only: Flag indicating to get the chunk history only from the active bank - OPTIONAL
+        :type active_bank_only: ``bool``
+
+        :return: The chunk history, the encryption flag and the class of the chunk in this mode
+        :rtype: ``tuple[list[NvsChunk], bool, type]``
+        """
         chunk_id = chunk_id if isinstance(chunk_id, int) else self.chunk_id_map[chunk_id]
         (is_encrypted, chunk_class) = self._get_encryption_and_class(chunk_id, mode)
 
@@ -604,8 +717,8 @@ class IdBasedNvsParser(NvsParserInterface):
             # end if
         # end if
 
-        return [self._get_chunk_bitfield_object_from_chunk(chunk, is_encrypted, chunk_class) for chunk in chunk_history]
-    # end def get_chunk_history
+        return chunk_history, is_encrypted, chunk_class
+    # end def _get_raw_chunk_history
 
     def get_chunk_name(self, chunk_id):
         """
@@ -658,7 +771,8 @@ class IdBasedNvsParser(NvsParserInterface):
 
         # Compute external crc
         new_chunk_crc = Crc16ccitt()
-        new_chunk_crc.start_crc(list(new_chunk.chunk_data) + [platform_chunk_id, len(new_chunk.chunk_data)])
+        new_chunk_crc.start_crc(new_chunk.chunk_data)
+        new_chunk_crc.continue_crc((platform_chunk_id, len(new_chunk.chunk_data)))
         new_chunk.chunk_crc = new_chunk_crc.crc
         if len(new_chunk.chunk_data) % self.nvs_word_size != 0:
             new_chunk.chunk_data = list(new_chunk.chunk_data) + (
@@ -1035,7 +1149,7 @@ class IdBasedNvsParser(NvsParserInterface):
         chunk.internal_crc = int.from_bytes(clear_buffer[clear_data_length:clear_data_length + cls.CRC_SIZE],
                                             byteorder="little", signed=False)
         crc_check = Crc16ccitt()
-        crc_check.start_crc(list(chunk.clear_data))
+        crc_check.start_crc(chunk.clear_data)
         if chunk.internal_crc != crc_check.crc:
             warnings.warn(f"Error internal CRC for chunk_id = {hex(chunk.chunk_id)}: received ="
                           f" {hex(chunk.internal_crc)} and computed = {hex(crc_check.crc)}")
@@ -1057,7 +1171,7 @@ class IdBasedNvsParser(NvsParserInterface):
         :rtype: ``HexList``
         """
         crc_check = Crc16ccitt()
-        crc_check.start_crc(list(chunk.clear_data))
+        crc_check.start_crc(chunk.clear_data)
         crc = crc_check.crc.to_bytes(cls.CRC_SIZE, byteorder="little", signed=False)
         clear_buffer = chunk.clear_data + crc
         chunk.chunk_data = Aes.aes_cipher(data=clear_buffer, key=aes_key, encrypt=True, iv=chunk.iv)
@@ -1232,25 +1346,52 @@ class AddressBasedNvsParser(IdBasedNvsParser):
 
         # Every segment is parsed and then padded in NvsBank if needed
         for (start, stop) in addresses_to_parse:
-            array_to_parse = hex_file.gets(addr=start, length=stop - start)
-            index = 0
-            bank_size = zone_bank_length
-            if isinstance(zone_bank_length, list):
-                bank_size = zone_bank_length[index]
-                index += 1
-            # end if
-            zone, array_to_parse = NvsZone.from_hex_array(
-                array_to_parse=array_to_parse,
-                chunk_from_hex_array_method=cls.chunk_from_hex_array,
-                bank_length=bank_size,
-                zone_number=len(zone_list),
-                start_address=start,
-                chunk_id_map=chunk_id_map)
-            zone_list.append(zone)
+            cls.zones_from_memory(memoryview(hex_file.gets(addr=start, length=stop - start)), start,
+                                  zone_bank_length, chunk_id_map, zone_list)
         # end for
         return cls(chunk_id_map, zone_list, HexList(aes_key))
     # end def from_hex_file
 
+    @classmethod
+    def zones_from_memory(cls, memory, start_address, zone_bank_length, chunk_id_map, zone_list):
+        """
+        Parse the zone of a contiguous memory area, a single zone is parsed per area.
+
+        :param memory: The memory area to parse
+        :type memory: ``memoryview``
+        :param start_address: The start address in memory of the area
+        :type start_address: ``int``
+        :param zone_bank_length: The length of each bank in a zone, can be just one number for all zones or a list to
+                                 give the length for each zone.
+        :type zone_bank_length: ``int`` or ``list of int``
+        :param chunk_id_map: The map to get the right chunk ID for the platform/project. The keys should be strings.
+        :type chunk_id_map: ``dict``
+        :param zone_list: The zone list to complete with the parsed zone
+        :type zone_list: ``list[NvsZone]``
+        """
+        bank_size = zone_bank_length[0] if isinstance(zone_bank_length, list) else zone_bank_length
+        zone, _ = NvsZone.from_memory(
+            memory=memory,
+            offset=0,
+            chunk_from_memory_method=cls.chunk_from_memory,
+            bank_length=bank_size,
+            zone_number=len(zone_list),
+            start_address=start_address,
+            chunk_id_map=chunk_id_map)
+        zone_list.append(zone)
+    # end def zones_from_memory
+
+    @classmethod
+    def chunk_from_memory(cls, memory, offset, chunk_id_map):
+        # See ``NvsParserInterface.chunk_from_memory``. The chunks are at fixed addresses, they are all parsed at once.
+        array_to_parse = memory[offset:]
+        if isinstance(array_to_parse, memoryview):
+            array_to_parse = array_to_parse.tobytes()
+        # end if
+        chunks, _ = cls.chunk_from_hex_array(array_to_parse, chunk_id_map)
+        return chunks, len(memory)
+    # end def chunk_from_memory
+
     def to_hex_file(self):
         """
         Convert this to an IntelHex object.
@@ -1331,23 +1472,8 @@ class AddressBasedNvsParser(IdBasedNvsParser):
         return return_array
     # end def chunk_to_hex_array
 
-    def get_chunk_history(self, chunk_id, mode=None, get_all=False, active_bank_only=False):
-        """
-        Retrieve all the values of a chunk from its history and decrypt the chunk data if it is encrypted
-
-        :param chunk_id: ID of the chunk to get. It can be the int value or the name.
-        :type chunk_id: ``int`` or ``str``
-        :param mode: Mode of the owner of the NVS. If None, it will oly get the raw chunks (no decryption or special
-                     classes). - OPTIONAL
-        :type mode: ``MODE``
-        :param get_all: Get all the chunks, even the chunk repeated from disabled bank to active bank - OPTIONAL
-        :type get_all: ``bool``
-        :param active_bank_only: Flag indicating to get the chunk history only from the active bank - OPTIONAL
-        :type active_bank_only: ``bool``
-
-        :return: The wanted chunk history.
-        :rtype: ``list[NvsChunk|BitFieldContainerMixin]``
-        """
+    def _get_raw_chunk_history(self, chunk_id, mode=None, get_all=False, active_bank_only=False):
+        # See ``IdBasedNvsParser._get_raw_chunk_history``
         chunk_id = chunk_id if isinstance(chunk_id, int) else self.chunk_id_map[chunk_id][0]
         (is_encrypted, chunk_class) = self._get_encryption_and_class(chunk_id, mode)
 
@@ -1367,8 +1493,8 @@ class AddressBasedNvsParser(IdBasedNvsParser):
             chunk_history = active_bank_chunks
         # end if
 
-        return [self._get_chunk_bitfield_object_from_chunk(chunk, is_encrypted, chunk_class) for chunk in chunk_history]
-    # end def get_chunk_history
+        return chunk_history, is_encrypted, chunk_class
+    # end def _get_raw_chunk_history
 
     def add_new_chunk(self, chunk_id, data, is_encrypted=False, iv=None):
         """
@@ -1406,7 +1532,8 @@ class AddressBasedNvsParser(IdBasedNvsParser):
 
         # Compute external crc
         new_chunk_crc = Crc16ccitt()
-        new_chunk_crc.start_crc(list(new_chunk.chunk_data) + [platform_chunk_address, len(new_chunk.chunk_data)])
+        new_chunk_crc.start_crc(new_chunk.chunk_data)
+        new_chunk_crc.continue_crc((platform_chunk_address, len(new_chunk.chunk_data)))
         new_chunk.chunk_crc = new_chunk_crc.crc
 
         if active_bank.get_current_length() + len(data) + self.nvs_word_size > active_bank.bank_length:
@@ -1541,13 +1668,49 @@ class NvsZone(object):
         :return: a tuple with the zone object and array_to_parse minus the zone taken
         :rtype: ``tuple``
         """
+        zone, offset = cls.from_memory(memory=array_to_parse,
+                                       offset=0,
+                                       chunk_from_memory_method=NvsBank.get_chunk_from_memory_method(
+                                           chunk_from_hex_array_method),
+                                       bank_length=bank_length,
+                                       zone_number=zone_number,
+                                       start_address=start_address,
+                                       chunk_id_map=chunk_id_map)
+        return zone, array_to_parse[offset:]
+    # end def from_hex_array
+
+    @classmethod
+    def from_memory(cls, memory, offset, chunk_from_memory_method, bank_length, zone_number, start_address,
+                    chunk_id_map):
+        """
+        Parse the zone starting at an offset of a memory area.
+
+        :param memory: The memory area to parse
+        :type memory: ``memoryview`` or ``list`` or ``HexList`` or ``tuple`` or ``bytearray`` or ``bytes``
+        :param offset: The offset of the zone in the memory area
+        :type offset: ``int``
+        :param chunk_from_memory_method: The method to use to parse a chunk at an offset of a bank
+        :type chunk_from_memory_method: ``function``
+        :param bank_length: The length of the bank
+        :type bank_length: ``int``
+        :param zone_number: The number of the zone
+        :type zone_number: ``int``
+        :param start_address: The start address in memory of the zone
+        :type start_address: ``int``
+        :param chunk_id_map: The map to get the right chunk ID for the platform/project. The keys should be strings.
+        :type chunk_id_map: ``dict``
+
+        :return: a tuple with the zone object and the offset following the zone
+        :rtype: ``tuple[NvsZone, int]``
+        """
         banks = [None, None]
         bank_start_address = start_address
 
         for i in range(2):
-            banks[i], array_to_parse = NvsBank.from_hex_array(
-                array_to_parse=array_to_parse,
-                chunk_from_hex_array_method=chunk_from_hex_array_method,
+            banks[i], offset = NvsBank.from_memory(
+                memory=memory,
+                offset=offset,
+                chunk_from_memory_method=chunk_from_memory_method,
                 start_address=bank_start_address,
                 bank_length=bank_length,
                 chunk_id_map=chunk_id_map)
@@ -1558,8 +1721,8 @@ class NvsZone(object):
             # end if
         # end for
 
-        return cls(zone_number, banks, start_address), array_to_parse
-    # end def from_hex_array
+        return cls(zone_number, banks, start_address), offset
+    # end def from_memory
 
     def to_hex_array(self):
         """
@@ -1774,6 +1937,9 @@ class NvsBank(object):
         self.bank_length = bank_length
         self.chunks = chunks
         self.nvs_word_size = nvs_word_size
+        # Chunk ID to chunk history index, see get_chunk_history
+        self._chunk_index = None
+        self._chunk_index_key = None
 
         assert self.bank_length >= self.get_current_length(), \
             f"The current length of the bank " \
@@ -1806,10 +1972,63 @@ class NvsBank(object):
         :return: a tuple with the bank object and array_to_parse minus the bank taken
         :rtype: ``tuple``
         """
-        bank_array_to_parse = array_to_parse[:bank_length]
+        bank, offset = cls.from_memory(memory=array_to_parse,
+                                       offset=0,
+                                       chunk_from_memory_method=cls.get_chunk_from_memory_method(
+                                           chunk_from_hex_array_method),
+                                       start_address=start_address,
+                                       bank_length=bank_length,
+                                       chunk_id_map=chunk_id_map)
+        return bank, array_to_parse[offset:]
+    # end def from_hex_array
+
+    @staticmethod
+    def get_chunk_from_memory_method(chunk_from_hex_array_method):
+        """
+        Get a method parsing a chunk at an offset of a bank, from a method parsing the first chunk of an hex array.
+
+        :param chunk_from_hex_array_method: The method to use to convert an hex array to a chunk
+        :type chunk_from_hex_array_method: ``function``
+
+        :return: The method to use to parse a chunk at an offset of a bank
+        :rtype: ``function``
+        """
+        def chunk_from_memory(memory, offset, chunk_id_map):
+            chunk, array_to_parse = chunk_from_hex_array_method(memory[offset:], chunk_id_map)
+            return chunk, len(memory) - len(array_to_parse)
+        # end def chunk_from_memory
+        return chunk_from_memory
+    # end def get_chunk_from_memory_method
+
+    @classmethod
+    def from_memory(cls, memory, offset, chunk_from_memory_method, start_address, bank_length, chunk_id_map):
+        """
+        Parse the bank starting at an offset of a memory area. The bank is walked chunk by chunk by offset.
+
+        :param memory: The memory area to parse
+        :type memory: ``memoryview`` or ``list`` or ``HexList`` or ``tuple`` or ``bytearray`` or ``bytes``
+        :param offset: The offset of the bank in the memory area
+        :type offset: ``int``
+        :param chunk_from_memory_method: The method to use to parse a chunk at an offset of the bank
+        :type chunk_from_memory_method: ``function``
+        :param start_address: The start address in memory of the bank
+        :type start_address: ``int``
+        :param bank_length: The length of the bank
+        :type bank_length: ``int``
+        :param chunk_id_map: The map to get the right chunk ID for the platform/project. The keys should be strings.
+                             It must have at least the keys "ACTIVE_BANK_HDR", "TEMP_BANK_HDR", "INVALID_BANK_HDR"
+                             which point to the full header, not just the ID.
+        :type chunk_id_map: ``dict``
+
+        :return: a tuple with the bank object and the offset following the bank
+        :rtype: ``tuple[NvsBank, int]``
+        """
+        # Slicing a memoryview does not copy the bank
+        bank_memory = memory[offset:offset + bank_length]
         chunks = []
-        while len(bank_array_to_parse) > 0:
-            chunk, bank_array_to_parse = chunk_from_hex_array_method(bank_array_to_parse, chunk_id_map)
+        chunk_offset = 0
+        while chunk_offset < len(bank_memory):
+            chunk, chunk_offset = chunk_from_memory_method(bank_memory, chunk_offset, chunk_id_map)
             if isinstance(chunk, list):
                 chunks = chunk
             else:
@@ -1842,8 +2061,8 @@ class NvsBank(object):
         # end if
 
         return (cls(active, start_address, bank_length, chunks, chunk_id_map["NVS_WORD_SIZE"]),
-                array_to_parse[bank_length:])
-    # end def from_hex_array
+                offset + len(bank_memory))
+    # end def from_memory
 
     def to_hex_array(self, no_padding=False):
         """
@@ -1894,6 +2113,7 @@ class NvsBank(object):
 
         if self.chunks[-1].chunk_length == -1 and self.chunks[-1].chunk_crc == -1:
             self.chunks[-1] = chunk_to_add
+            self._chunk_index = None
         else:
             self.chunks.append(chunk_to_add)
         # end if
@@ -2001,14 +2221,31 @@ class NvsBank(object):
         :return: The wanted chunk.
         :rtype: ``list of NvsChunk``
         """
-        chunk_history = []
-        for chunk in self.chunks:
-            if chunk.chunk_id == chunk_id:
-                chunk_history.append(chunk)
-            # end if
-        # end for
-        return chunk_history
+        return list(self._get_chunk_index().get(chunk_id, ()))
     # end def get_chunk_history
+
+    def _get_chunk_index(self):
+        """
+        Get the chunk history of every chunk ID of the bank.
+
+        The index is built again when the chunk list is replaced or resized, when a chunk is replaced by
+        ``add_chunk``, or when the ID of any chunk is changed.
+
+        :return: The chunks in the bank order, per chunk ID
+        :rtype: ``dict[int, list[NvsChunk]]``
+        """
+        chunk_index_key = (self.chunks, len(self.chunks), NvsChunk.chunk_id_revision)
+        if (self._chunk_index is None or self._chunk_index_key[0] is not self.chunks
+                or self._chunk_index_key[1:] != chunk_index_key[1:]):
+            chunk_index = {}
+            for chunk in self.chunks:
+                chunk_index.setdefault(chunk.chunk_id, []).append(chunk)
+            # end for
+            self._chunk_index = chunk_index
+            self._chunk_index_key = chunk_index_key
+        # end if
+        return self._chunk_index
+    # end def _get_chunk_index
 # end class NvsBank
 
 
@@ -2016,6 +2253,8 @@ class NvsChunk(object):
     """
     NvsChunk class supporting clear and encrypted payload
     """
+    # Incremented on every chunk ID change, to invalidate the chunk indexes of the banks
+    chunk_id_revision = 0
 
     def __init__(self, to_hex_array_method, chunk_id, chunk_length, chunk_crc, chunk_data,
                  nvs_word_size=4, default_parser=True):
@@ -2053,6 +2292,29 @@ class NvsChunk(object):
         self.padding_bytes = None
     # end def __init__
 
+    @property
+    def chunk_id(self):
+        """
+        The ID of the chunk.
+
+        :return: The chunk ID
+        :rtype: The type is dependent on the platform/project
+        """
+        return self._chunk_id
+    # end def chunk_id
+
+    @chunk_id.setter
+    def chunk_id(self, chunk_id):
+        """
+        Set the ID of the chunk.
+
+        :param chunk_id: The chunk ID
+        :type chunk_id: The type is dependent on the platform/project
+        """
+        self._chunk_id = chunk_id
+        NvsChunk.chunk_id_revision += 1
+    # end def chunk_id
+
     @classmethod
     def create_a_padding_chunk(cls, padding_length, nvs_word_size=4):
         """
@@ -15,16 +15,15 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
-import sys
 import time
 import threading
 import _thread
-import collections
+from struct import iter_unpack
 from typing import Tuple
 from typing import Optional
 from typing import Union
 from dataclasses import dataclass
-from statistics import mean
+import numpy as np
 from pylink.jlink import JLink
 import pylink.errors
 import warnings
@@ -44,6 +43,11 @@ PAYLOAD_SIZE = TAG_SIZE + SEQ_NUMBER_SIZE + CYCLES_SIZE
 HEADER = 0x1010
 FOOTER = 0x2020
 RECORD_SIZE = 2 * MARKER_SIZE + PAYLOAD_SIZE
+HEADER_BYTES = HEADER.to_bytes(MARKER_SIZE, byteorder='little')
+FOOTER_BYTES = FOOTER.to_bytes(MARKER_SIZE, byteorder='little')
+# Record payload: tag, cycles and sequence number, little endian
+PAYLOAD_FORMAT = '<HIH'
+RECORD_DTYPE = np.dtype([('tag', '<u2'), ('cycles', '<u4'), ('seq_number', '<u2')])
 
 Verbose = False
 # ------------------------------------------------------------------------------
@@ -85,131 +89,145 @@ class Profiler:
         :param startup_gap_idx: Maximum number of chunk in a RTT buffer
         :type startup_gap_idx: ``int``
         """
-        self._in_records = []  # type : List[ProfilerRecord]
+        self._records = np.empty(0, dtype=RECORD_DTYPE)  # type : np.ndarray
+        self._pending_records = []  # type : List[np.ndarray]
         self._startup_tag = startup_tag  # type : int
         self._startup_gap_idx = startup_gap_idx  # type : int
-        self._tags_index = collections.defaultdict(dict)  # type : Defaultdict[Dict]
+        # Index of the contiguous section of seq_numbers of each record, computed by process_data
+        self._sections = np.empty(0, dtype=np.int64)  # type : np.ndarray
         self.missing_records = 0
 
-    def add_data(self, profiler_records : Tuple[ProfilerRecord, ...]) -> None:
+    @property
+    def _in_records(self) -> np.ndarray:
+        """ Records added so far, as a structured array of ``RECORD_DTYPE``
+        """
+        if len(self._pending_records) > 0:
+            self._records = np.concatenate([self._records] + self._pending_records)
+            self._pending_records = []
+        # end if
+        return self._records
+    # end def _in_records
+
+    def add_data(self, profiler_records: Union[Tuple[ProfilerRecord, ...], np.ndarray]) -> None:
         """ Add a stream of data
 
         :param profiler_records: Parsed data retrieved by the ProfilerExecutor run function
-        :type profiler_records: ``Tuple[ProfilerRecord, ...]``
+        :type profiler_records: ``Tuple[ProfilerRecord, ...]`` or ``np.ndarray`` of ``RECORD_DTYPE``
         """
-        self._in_records.extend(profiler_records)
+        if not isinstance(profiler_records, np.ndarray):
+            profiler_records = np.array([(record.tag, record.cycles, record.seq_number) for record in profiler_records],
+                                        dtype=RECORD_DTYPE)
+        # end if
+        self._pending_records.append(profiler_records)
 
     def clear_data(self):
         """
         Clear the Profiler internal variables
         """
-        self._in_records = []
-        self._tags_index = collections.defaultdict(dict)
+        self._records = np.empty(0, dtype=RECORD_DTYPE)
+        self._pending_records = []
+        self._sections = np.empty(0, dtype=np.int64)
     # end def clear_data
 
     def _process_startup_sequence(self):
-        startup_tag_count = 0
-        startup_tag_idx = 0
+        records = self._in_records
         # finds if there is a startup tag in the captured stream
-        for idx, record in enumerate(self._in_records):
-            if record.tag == self._startup_tag:
-                startup_tag_idx = idx
-                startup_tag_count += 1
-            # end if
+        startup_tag_indexes = np.flatnonzero(records['tag'] == self._startup_tag)
+        startup_tag_count = len(startup_tag_indexes)
         assert startup_tag_count == 0 or startup_tag_count == 1, f'startup_tag_count={startup_tag_count}'
 
         # if there are missing sequence numbers after the first buffer capture, then
         # discard the data before the sequence gap, (but keep the startup sequence if present)
-        if (len(self._in_records) > self._startup_gap_idx and
-            self._in_records[self._startup_gap_idx - 1].seq_number + 1 != self._in_records[self._startup_gap_idx].seq_number):
+        if (len(records) > self._startup_gap_idx and
+                int(records['seq_number'][self._startup_gap_idx - 1]) + 1 !=
+                int(records['seq_number'][self._startup_gap_idx])):
             if startup_tag_count > 0:
-                del self._in_records[startup_tag_idx + 1:self._startup_gap_idx]
+                self._records = np.delete(records, np.s_[startup_tag_indexes[0] + 1:self._startup_gap_idx])
             else:
-                del self._in_records[:self._startup_gap_idx]
+                self._records = records[self._startup_gap_idx:]
             # end if
         # end if
     # end def _process_startup_sequence
 
     def process_data(self):
         self._process_startup_sequence()
-        # This builds a "list" of dictionaries where each dict's keys are
-        # the tags in the records and the value is a list of indexes of the
-        # records where the tag appears.
-        # There is one dict for each contiguous section of seq_numbers, so
-        # in the case that there are no missing seq_counters, the list of
-        # dicts only contains one dict. The "list" of dicts is actually
-        # implemented as a dict itself, so as to be able to use defaultdict()
-        tags_index_table_idx = 0
-        if len(self._in_records) > 0:
-            seq_number = self._in_records[0].seq_number
-            self._tags_index[0] = collections.defaultdict(list)
-            for idx, record in enumerate(self._in_records):
-                if record.seq_number != seq_number:
-                    # If the previous record matches the startup tag, do not raise the warning
-                    if self._in_records[idx-1].tag != self._startup_tag:
-                        self.missing_records += (record.seq_number - seq_number)
-                    # end if
-                    tags_index_table_idx += 1
-                    seq_number = (record.seq_number + 1) if record.seq_number < 0xFFFF else 0
-                    self._tags_index[tags_index_table_idx] = collections.defaultdict(list)
-                else:
-                    seq_number = (seq_number + 1) if seq_number < 0xFFFF else 0
-                # end if
-                self._tags_index[tags_index_table_idx][record.tag].append(idx)
-            # end for
+        # This splits the records in contiguous sections of seq_numbers: a new section starts at each record whose
+        # seq_number does not follow the one of the previous record. In the case that there are no missing
+        # seq_counters, all the records are in the section 0.
+        records = self._in_records
+        if len(records) > 0:
+            seq_numbers = records['seq_number'].astype(np.int64)
+            expected_seq_numbers = (seq_numbers[:-1] + 1) & 0xFFFF
+            gaps = np.flatnonzero(seq_numbers[1:] != expected_seq_numbers) + 1
+            # If the previous record matches the startup tag, do not raise the warning
+            counted_gaps = gaps[records['tag'][gaps - 1] != self._startup_tag]
+            self.missing_records += int((seq_numbers[counted_gaps] - expected_seq_numbers[counted_gaps - 1]).sum())
+            self._sections = np.zeros(len(records), dtype=np.int64)
+            self._sections[gaps] = 1
+            np.cumsum(self._sections, out=self._sections)
         # end if
         if self.missing_records > 0:
             warnings.warn(f'missing records = {self.missing_records}')
         # end if
     # end def process_data
 
-    def get_statistics(self, relative_measurements: Tuple[RelativeMeasure, ...], start=None, end=None) -> dict:
-        relative = {key: [] for key in relative_measurements}
-        mins = dict.fromkeys(relative_measurements, sys.maxsize)
-        maxs = dict.fromkeys(relative_measurements, 0)
-        average = dict.fromkeys(relative_measurements, 0)
-
-        for rel in relative.keys():
-            for tags_dicts in self._tags_index.values():
-                for idx_end in tags_dicts[rel.end]:
-                    for idx_start in reversed(tags_dicts[rel.start]):
-                        if idx_start < idx_end:
-                            relative[rel].append((idx_start, idx_end))
-                            break
-                        # end if
-                    # end for
-                # end for
-            # end for
-        # end for
+    def _get_relative_indexes(self, relative_measure: RelativeMeasure) -> Tuple[np.ndarray, np.ndarray]:
+        """ Pair each record of the end tag with the last previous record of the start tag in its section
+
+        :param relative_measure: The start and end tags
+        :type relative_measure: ``RelativeMeasure``
+
+        :return: The indexes of the start records and of the end records
+        :rtype: ``Tuple[np.ndarray, np.ndarray]``
+        """
+        records = self._in_records[:len(self._sections)]
+        start_indexes = np.flatnonzero(records['tag'] == relative_measure.start)
+        end_indexes = np.flatnonzero(records['tag'] == relative_measure.end)
+        positions = np.searchsorted(start_indexes, end_indexes) - 1
+        found = positions >= 0
+        start_indexes = start_indexes[positions[found]]
+        end_indexes = end_indexes[found]
+        same_section = self._sections[start_indexes] == self._sections[end_indexes]
+        return start_indexes[same_section], end_indexes[same_section]
+    # end def _get_relative_indexes
 
-        for rel in relative.keys():
-            if len(relative[rel]) == 0:
+    def get_statistics(self, relative_measurements: Tuple[RelativeMeasure, ...], start=None, end=None) -> dict:
+        mins = dict.fromkeys(relative_measurements, 0.0)
+        maxs = dict.fromkeys(relative_measurements, 0.0)
+        average = dict.fromkeys(relative_measurements, 0.0)
+
+        cycles = self._in_records['cycles'].astype(np.int64)
+        for rel in relative_measurements:
+            start_indexes, end_indexes = self._get_relative_indexes(rel)
+            if len(start_indexes) == 0:
                 break
             # end if
-            all_timestamps = [(self._in_records[start].cycles,
-                               self._in_records[end].cycles) for start, end in relative[rel]]
-            filtered_timestamps = []
+            start_ts = cycles[start_indexes]
+            end_ts = cycles[end_indexes]
             # Select timings between the given start time and end time
-            for start_ts, end_ts in all_timestamps:
-                if end is not None and counts_to_msec(start_ts) > end * 1000:
-                    break
-                elif start is not None and counts_to_msec(end_ts) < start * 1000:
-                    continue
+            if end is not None:
+                after_end = np.flatnonzero(counts_to_msec(start_ts) > end * 1000)
+                if len(after_end) > 0:
+                    start_ts = start_ts[:after_end[0]]
+                    end_ts = end_ts[:after_end[0]]
                 # end if
-                filtered_timestamps.append((start_ts, end_ts))
-            # end for
-            mins[rel] = min((end_ts - start_ts) & 0xFFFFFFFF for start_ts, end_ts in filtered_timestamps)
-            maxs[rel] = max((end_ts - start_ts) & 0xFFFFFFFF for start_ts, end_ts in filtered_timestamps)
-            average[rel] = mean((end_ts - start_ts) & 0xFFFFFFFF for start_ts, end_ts in filtered_timestamps)
+            # end if
+            if start is not None:
+                after_start = counts_to_msec(end_ts) >= start * 1000
+                start_ts = start_ts[after_start]
+                end_ts = end_ts[after_start]
+            # end if
+            durations = (end_ts - start_ts) & 0xFFFFFFFF
+            mins[rel] = counts_to_msec(int(durations.min()))
+            maxs[rel] = counts_to_msec(int(durations.max()))
+            average[rel] = counts_to_msec(int(durations.sum()) / len(durations))
         # end for
-        mins = {key: counts_to_msec(mins[key]) if mins[key] < sys.maxsize else 0.0 for key in mins}
-        maxs = {key: counts_to_msec(maxs[key]) for key in maxs}
-        average = {key: counts_to_msec(average[key]) for key in average}
 
-        statistics = {key : Statistics(min=mins[key], max=maxs[key], average=average[key]) for key in relative.keys()}
+        statistics = {key : Statistics(min=mins[key], max=maxs[key], average=average[key])
+                      for key in relative_measurements}
 
         if Verbose:
-            for rel in relative.keys():
+            for rel in relative_measurements:
                 print("tag pair:%s, min:%f, max:%f, ave:%f" % (rel,
                    mins[rel],
                    maxs[rel],
@@ -220,13 +238,15 @@ class Profiler:
     # end def get_min_max
 
     def get_startup_time_msec(self) -> Union[None, float]:
-        for tags_dicts in self._tags_index.values():
-            if self._startup_tag in tags_dicts:
-                assert len(tags_dicts[self._startup_tag]) == 1 # only appears once
-                startup_time = self._in_records[tags_dicts[self._startup_tag][0]].cycles
-                if Verbose:
-                    print("start-up time:%f" % (counts_to_msec(startup_time)))
-                return counts_to_msec(startup_time)
+        records = self._in_records[:len(self._sections)]
+        startup_tag_indexes = np.flatnonzero(records['tag'] == self._startup_tag)
+        if len(startup_tag_indexes) > 0:
+            section = self._sections[startup_tag_indexes[0]]
+            assert np.count_nonzero(self._sections[startup_tag_indexes] == section) == 1  # only appears once
+            startup_time = int(records['cycles'][startup_tag_indexes[0]])
+            if Verbose:
+                print("start-up time:%f" % (counts_to_msec(startup_time)))
+            return counts_to_msec(startup_time)
         return None
         # end if
     # end def get_starting_time
@@ -235,53 +255,70 @@ class Profiler:
 
 class Parser:
     def __init__(self):
-        self._tmp_in_data = []
+        self._tmp_in_data = bytearray()
         self._prev_timestamp = 0
 
-    def binary_stream_to_records(self, in_data) -> Tuple[tuple, ...]:
-        self._tmp_in_data.extend(in_data)
-        out_data = []
-        while len(self._tmp_in_data) >= RECORD_SIZE:
-            i = 0
-            record_found = False
-            for i in range(len(self._tmp_in_data) - MARKER_SIZE + 1):
-                footer = int.from_bytes(self._tmp_in_data[i:i + MARKER_SIZE], byteorder='little', signed=False)
-                if footer == FOOTER:
-                    rec_limit = i + MARKER_SIZE
-                    if rec_limit >= RECORD_SIZE:
-                        header = int.from_bytes(self._tmp_in_data[rec_limit - RECORD_SIZE:rec_limit -
-                                                    (RECORD_SIZE - MARKER_SIZE)], byteorder='little', signed=False)
-                        if header == HEADER:
-                            record_found = True
-                            payload_start = rec_limit - (RECORD_SIZE - MARKER_SIZE)
-                            record = tuple(self._tmp_in_data[payload_start:payload_start + PAYLOAD_SIZE])
-                            out_data.append(record)
-                            # remove from buffer all the data that has been parsed
-                            self._tmp_in_data = self._tmp_in_data[rec_limit:len(self._tmp_in_data)]
-                        break # get out of the loop that looks for a footer
-                    # end if
-                # end if
-            # end for
-            if not record_found:
+    def _extract_payloads(self, in_data) -> bytearray:
+        """ Append the data to the stream buffer and extract the payloads of the complete records
+
+        A record is recognized by its footer, then its header ``RECORD_SIZE - MARKER_SIZE`` bytes before. The bytes
+        that cannot be part of a record anymore are removed from the buffer, the others are kept for the next call.
+
+        :param in_data: Data read from the RTT buffer
+        :type in_data: ``bytes`` or ``list[int]``
+
+        :return: The concatenated payloads of the records found
+        :rtype: ``bytearray``
+        """
+        buffer = self._tmp_in_data
+        buffer.extend(in_data)
+        payloads = bytearray()
+        position = 0
+        while len(buffer) - position >= RECORD_SIZE:
+            # A footer is only taken into account if there is room for a full record before it
+            footer_index = buffer.find(FOOTER_BYTES, position + RECORD_SIZE - MARKER_SIZE)
+            if footer_index < 0:
                 # remove from buffer all bytes that are guaranteed no to form part of a partial record
                 # Worst case is that only one byte is missing to have a complete record, so we can
                 # safely remove data until we leave RECORD_SIZE - 1 bytes in the buffer.
-                # Note that 'i' iterates up to buffer_size - MARKER_SIZE
-                self._tmp_in_data = self._tmp_in_data[(i - (RECORD_SIZE - MARKER_SIZE - 1)):len(self._tmp_in_data)]
+                position = len(buffer) - (RECORD_SIZE - 1)
+                break
+            # end if
+            header_index = footer_index + MARKER_SIZE - RECORD_SIZE
+            if buffer[header_index:header_index + MARKER_SIZE] == HEADER_BYTES:
+                payloads += buffer[header_index + MARKER_SIZE:footer_index]
+                # remove from buffer all the data that has been parsed
+                position = footer_index + MARKER_SIZE
+            else:
+                # Only the bytes up to the wrong header can be removed: the footer may be part of the next record
+                position = header_index + 1
             # end if
         # end while
-        return tuple(out_data)
+        del buffer[:position]
+        return payloads
+    # end def _extract_payloads
+
+    def binary_stream_to_records(self, in_data) -> Tuple[bytes, ...]:
+        payloads = bytes(self._extract_payloads(in_data))
+        return tuple(payloads[offset:offset + PAYLOAD_SIZE] for offset in range(0, len(payloads), PAYLOAD_SIZE))
     # end def binary_stream_to_records
 
+    def binary_stream_to_array(self, in_data) -> np.ndarray:
+        """ Parse a stream of data into a structured array of records
+
+        :param in_data: Data read from the RTT buffer
+        :type in_data: ``bytes`` or ``list[int]``
+
+        :return: The records found, as a structured array of ``RECORD_DTYPE``
+        :rtype: ``np.ndarray``
+        """
+        return np.frombuffer(self._extract_payloads(in_data), dtype=RECORD_DTYPE)
+    # end def binary_stream_to_array
+
     @staticmethod
     def parse_records(raw_records) -> Tuple[ProfilerRecord, ...]:
-        out_data = []
-        for rec in raw_records:
-            tag = int.from_bytes(rec[TAG_OFFSET:TAG_OFFSET + TAG_SIZE], byteorder='little', signed=False)
-            cycles = int.from_bytes(rec[CYCLES_OFFSET:CYCLES_OFFSET + CYCLES_SIZE], byteorder='little', signed=False)
-            seq_number = int.from_bytes(rec[SEQ_NUMBER_OFFSET:SEQ_NUMBER_OFFSET + SEQ_NUMBER_SIZE], byteorder='little', signed=False)
-            out_data.append(ProfilerRecord(tag=tag, seq_number=seq_number, cycles=cycles))
-        return tuple(out_data)
+        return tuple(ProfilerRecord(tag=tag, seq_number=seq_number, cycles=cycles)
+                     for tag, cycles, seq_number in iter_unpack(PAYLOAD_FORMAT, b''.join(map(bytes, raw_records))))
     # end def parse_records
 # end class Parser
 
@@ -319,9 +356,9 @@ class ProfilerExecutor(threading.Thread):
         try:
             while self._jlink.connected() and not self.stop_requested():
                 in_data = self._jlink.rtt_read(1, 1024)
-                parsed_data = self._parser.parse_records(self._parser.binary_stream_to_records(in_data))
+                parsed_data = self._parser.binary_stream_to_array(in_data)
                 if Verbose:
-                    counters = tuple(record.seq_number for record in parsed_data)
+                    counters = tuple(parsed_data['seq_number'].tolist())
                     print(counters)
                 # end if
                 if len(parsed_data) > 0:
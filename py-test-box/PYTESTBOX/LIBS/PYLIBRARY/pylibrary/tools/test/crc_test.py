@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pylibrary.tools.test.crc_test
+:brief: Tests of the CRC classes
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from random import Random
+from unittest import TestCase
+
+from pylibrary.tools.crc import Crc16ccitt
+from pylibrary.tools.crc import Crc32Stm32
+from pylibrary.tools.hexlist import HexList
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+def bitwise_crc(data, polynomial, init_value, width):
+    """
+    Compute a most significant bit first CRC one bit at a time, as reference.
+
+    :param data: The data
+    :type data: ``bytes``
+    :param polynomial: The polynomial
+    :type polynomial: ``int``
+    :param init_value: The init value
+    :type init_value: ``int``
+    :param width: The CRC width in bits
+    :type width: ``int``
+
+    :return: The CRC value
+    :rtype: ``int``
+    """
+    crc = init_value
+    top_bit = 1 << (width - 1)
+    for byte in data:
+        crc ^= byte << (width - 8)
+        for _ in range(8):
+            crc = (crc << 1) ^ polynomial if crc & top_bit else crc << 1
+        # end for
+        crc &= (1 << width) - 1
+    # end for
+    return crc
+# end def bitwise_crc
+
+
+class Crc16ccittTestCase(TestCase):
+    """
+    Crc16ccitt test implementation.
+    """
+
+    def test_check_value(self):
+        """
+        Test the CRC-16/CCITT-FALSE check value, for all the input types
+        """
+        for data in (b'123456789', bytearray(b'123456789'), memoryview(b'123456789'), HexList(b'123456789'),
+                     list(b'123456789'), '123456789'):
+            crc = Crc16ccitt()
+            crc.start_crc(data)
+            self.assertEqual(0x29B1, crc.crc, f"Wrong CRC for {type(data)}")
+        # end for
+    # end def test_check_value
+
+    def test_other_polynomial(self):
+        """
+        Test a polynomial computed with the slicing-by-8 tables, on all the lengths around 8 bytes
+        """
+        data = bytes(Random(0).randrange(256) for _ in range(40))
+        for length in range(len(data)):
+            crc = Crc16ccitt(polynomial=0x8005, preset=0)
+            crc.start_crc(data[:length])
+            self.assertEqual(bitwise_crc(data[:length], 0x8005, 0, 16), crc.crc, f"Wrong CRC for {length} bytes")
+        # end for
+    # end def test_other_polynomial
+
+    def test_continue(self):
+        """
+        Test the CRC computed in several parts, with values truncated to their low byte
+        """
+        crc = Crc16ccitt()
+        crc.start_crc(b'12345')
+        crc.continue_crc([ord('6'), 0x100 + ord('7')])
+        crc.continue_crc('89')
+        self.assertEqual(0x29B1, crc.crc)
+    # end def test_continue
+# end class Crc16ccittTestCase
+
+
+class Crc32Stm32TestCase(TestCase):
+    """
+    Crc32Stm32 test implementation.
+    """
+
+    def setUp(self):
+        """
+        Initialize test
+        """
+        super().setUp()
+        self.data = bytes(Random(0).randrange(256) for _ in range(203))
+        self.words_data = b''.join(self.data[index:index + 4][::-1] for index in range(0, 200, 4))
+    # end def setUp
+
+    def test_calculate_crc(self):
+        """
+        Test the CRC of the reversed words, the incomplete last word being ignored
+        """
+        crc = bitwise_crc(self.words_data, Crc32Stm32.DEFAULT_POLYNOMIAL, Crc32Stm32.DEFAULT_INIT_VALUE, 32)
+
+        for data in (self.data, HexList(self.data), memoryview(self.data)):
+            self.assertEqual(HexList(crc.to_bytes(4, 'little')), Crc32Stm32().calculate_crc(data),
+                             f"Wrong CRC for {type(data)}")
+        # end for
+        self.assertEqual(crc, Crc32Stm32().crc32(Crc32Stm32.sort_data(HexList(self.data))))
+        self.assertEqual(self.words_data, Crc32Stm32.reverse_words(self.data))
+    # end def test_calculate_crc
+
+    def test_other_polynomial(self):
+        """
+        Test a polynomial computed with the slicing-by-8 tables
+        """
+        self.assertEqual(HexList(bitwise_crc(self.words_data, 0x1EDC6F41, 0, 32).to_bytes(4, 'little')),
+                         Crc32Stm32(init_value=0, polynomial=0x1EDC6F41).calculate_crc(self.data))
+    # end def test_other_polynomial
+
+    def test_continue(self):
+        """
+        Test the CRC computed in several parts, not aligned on words
+        """
+        crc = Crc32Stm32()
+        crc.start_crc(self.data[:5])
+        crc.continue_crc(self.data[5:6])
+        crc.continue_crc(self.data[6:150])
+        crc.continue_crc(self.data[150:])
+        self.assertEqual(bitwise_crc(self.words_data, Crc32Stm32.DEFAULT_POLYNOMIAL, Crc32Stm32.DEFAULT_INIT_VALUE, 32),
+                         crc.crc)
+    # end def test_continue
+# end class Crc32Stm32TestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
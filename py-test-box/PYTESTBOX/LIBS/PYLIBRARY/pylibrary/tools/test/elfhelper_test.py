@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pylibrary.tools.test.elfhelper_test
+:brief: Tests of the elf symbol index
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from os import remove
+from os import stat
+from os import utime
+from struct import pack
+from tempfile import mkstemp
+from unittest import TestCase
+
+from pylibrary.tools.elfhelper import AddressIntervals
+from pylibrary.tools.elfhelper import ElfHelper
+from pylibrary.tools.elfhelper import ElfSymbolIndex
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+def build_elf(symbols):
+    """
+    Build a 32-bit little endian elf file made of a symbol table only.
+
+    :param symbols: The ``(name, address, size)`` of the symbols
+    :type symbols: ``list[tuple[str, int, int]]``
+
+    :return: The elf file content
+    :rtype: ``bytes``
+    """
+    string_table = b'\x00'
+    symbol_table = b'\x00' * 16
+    for name, address, size in symbols:
+        symbol_table += pack('<IIIBBH', len(string_table), address, size, 0x11, 0, 1)
+        string_table += name.encode() + b'\x00'
+    # end for
+    section_names = b'\x00.symtab\x00.strtab\x00.shstrtab\x00'
+
+    header_size = 52
+    symbol_table_offset = header_size
+    string_table_offset = symbol_table_offset + len(symbol_table)
+    section_names_offset = string_table_offset + len(string_table)
+    section_headers_offset = section_names_offset + len(section_names)
+
+    elf_header = pack('<16sHHIIIIIHHHHHH', b'\x7fELF\x01\x01\x01', 2, 40, 1, 0, 0, section_headers_offset, 0,
+                      header_size, 0, 0, 40, 4, 3)
+    section_headers = b'\x00' * 40
+    section_headers += pack('<10I', 1, 2, 0, 0, symbol_table_offset, len(symbol_table), 2, 1, 4, 16)
+    section_headers += pack('<10I', 9, 3, 0, 0, string_table_offset, len(string_table), 0, 0, 1, 0)
+    section_headers += pack('<10I', 17, 3, 0, 0, section_names_offset, len(section_names), 0, 0, 1, 0)
+    return elf_header + symbol_table + string_table + section_names + section_headers
+# end def build_elf
+
+
+class ElfHelperTestCase(TestCase):
+    """
+    ``ElfHelper`` test implementation.
+    """
+    SYMBOLS = [('__etext', 0x8000, 0), ('rsa_keyMod', 0x1000, 0x100), ('uicr_approtectExpectedValue', 0x1100, 4),
+               ('fwd_currentFwData', 0x2000, 0x40), ('fwd_buildInfo', 0x2010, 8), ('rsa_keyMod', 0x3000, 0x10)]
+
+    def setUp(self):
+        """
+        Write the elf file.
+        """
+        super().setUp()
+        file_descriptor, self.elf_file = mkstemp(suffix='.elf')
+        with open(file_descriptor, 'wb') as f:
+            f.write(build_elf(self.SYMBOLS))
+        # end with
+        ElfSymbolIndex.clear_cache()
+    # end def setUp
+
+    def tearDown(self):
+        """
+        Remove the elf file.
+        """
+        ElfSymbolIndex.clear_cache()
+        remove(self.elf_file)
+        super().tearDown()
+    # end def tearDown
+
+    def test_symbol_address(self):
+        """
+        Test the address of a symbol is the one of the first symbol of this name.
+        """
+        elf_helper = ElfHelper(self.elf_file)
+
+        self.assertEqual(0x8000, elf_helper.get_symbol_address('__etext'), "Wrong unsized symbol address")
+        self.assertEqual(0x1000, elf_helper.get_symbol_address('rsa_keyMod'), "Wrong duplicated symbol address")
+        self.assertIsNone(elf_helper.get_symbol_address('unknown_symbol'), "Unexpected unknown symbol address")
+    # end def test_symbol_address
+
+    def test_symbol_at(self):
+        """
+        Test the symbol containing an address is the closest one, overlapping symbols included.
+        """
+        elf_helper = ElfHelper(self.elf_file)
+
+        self.assertEqual('rsa_keyMod', elf_helper.get_symbol_at(0x10FF).name, "Wrong symbol at the last address")
+        self.assertEqual('fwd_buildInfo', elf_helper.get_symbol_at(0x2010).name, "Wrong nested symbol")
+        self.assertEqual('fwd_currentFwData', elf_helper.get_symbol_at(0x2018).name, "Wrong enclosing symbol")
+        self.assertEqual('fwd_currentFwData', elf_helper.get_symbol_at(0x203F).name, "Wrong enclosing symbol")
+        self.assertIsNone(elf_helper.get_symbol_at(0x1104), "Unexpected symbol after the last address")
+        self.assertIsNone(elf_helper.get_symbol_at(0x0FFF), "Unexpected symbol before the first address")
+    # end def test_symbol_at
+
+    def test_address_range(self):
+        """
+        Test the symbols addresses as intervals and as the legacy set of addresses.
+        """
+        elf_helper = ElfHelper(self.elf_file)
+        names = ['rsa_keyMod', 'uicr_approtectExpectedValue', 'unknown_symbol']
+
+        intervals = elf_helper.get_symbols_address_intervals(names)
+
+        self.assertEqual([(0x1000, 0x1104)], intervals.intervals, "The contiguous symbols should be merged")
+        self.assertIn(0x1103, intervals, "Missing address")
+        self.assertNotIn(0x1104, intervals, "Unexpected address")
+        self.assertTrue(intervals.contains_all((0x1000, 0x1050, 0x1100)), "Missing addresses")
+        self.assertEqual(set(range(0x1000, 0x1104)), elf_helper.get_symbols_address_range(names),
+                         "Wrong address set")
+        self.assertEqual(set(), elf_helper.get_symbols_address_range(), "Unexpected addresses without symbol")
+        self.assertEqual(AddressIntervals([(0x1000, 0x1104), (0x2000, 0x2040)]),
+                         intervals | elf_helper.get_symbols_address_intervals(['fwd_buildInfo', 'fwd_currentFwData']),
+                         "Wrong union")
+    # end def test_address_range
+
+    def test_cache(self):
+        """
+        Test the index is loaded once per file version.
+        """
+        elf_helper = ElfHelper(self.elf_file)
+        symbol_index = elf_helper.symbol_index
+
+        self.assertIs(symbol_index, ElfHelper(self.elf_file).symbol_index, "The index should be cached")
+
+        with open(self.elf_file, 'wb') as f:
+            f.write(build_elf([('rsa_keyMod', 0x4000, 0x100)]))
+        # end with
+        mtime = stat(self.elf_file).st_mtime_ns + 10 ** 9
+        utime(self.elf_file, ns=(mtime, mtime))
+
+        self.assertIsNot(symbol_index, elf_helper.symbol_index, "The index of the modified file should be reloaded")
+        self.assertEqual(0x4000, elf_helper.get_symbol_address('rsa_keyMod'), "Wrong symbol address after reload")
+    # end def test_cache
+# end class ElfHelperTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
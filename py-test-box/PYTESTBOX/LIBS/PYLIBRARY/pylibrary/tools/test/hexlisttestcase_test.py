@@ -119,6 +119,21 @@ class HexListTestCase(TestCase):
 
     # end def test_Construction
 
+    def test_Construction_Bytes(self):
+        '''Test the construction from bytes-like objects'''
+        expected = HexList("0102FF04")
+        for value in (b'\x01\x02\xFF\x04',
+                      bytearray(b'\x01\x02\xFF\x04'),
+                      memoryview(b'\x00\x01\x02\xFF\x04')[1:],
+                      memoryview(bytearray(b'\x01\x02\xFF\x04')).cast('H')):
+            self.assertEqual(expected, HexList(value), "Invalid construction from %r" % (value,))
+        # end for
+
+        self.assertEqual(HexList("01020304FF"),
+                         HexList(b'\x01', "02", bytearray(b'\x03\x04'), 0xFF),
+                         "Invalid mixed construction")
+    # end def test_Construction_Bytes
+
     def test_Contains(self):
         '''
         Tests __contains__ method
@@ -725,6 +740,13 @@ class HexListTestCase(TestCase):
                              HexList.fromLong(longValue, count),
                              "Invalid conversion from Long")
         # end for
+
+        self.assertEqual(HexList("6745"),
+                         HexList.fromLong(0x1234567, 2, littleEndian=True),
+                         "Invalid little endian conversion from Long")
+        self.assertEqual(0x1234567,
+                         HexList.fromLong(0x1234567, None, littleEndian=True).toLong(littleEndian=True),
+                         "Invalid little endian round trip")
     # end def test_FromLong
 
 
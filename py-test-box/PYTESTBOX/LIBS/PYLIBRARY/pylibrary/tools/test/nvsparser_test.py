@@ -26,6 +26,7 @@ from intelhex import IntelHex
 from pylibrary.tools.chunkidmaps import CHUNK_ID_MAP_NRF52
 from pylibrary.tools.chunkidmaps import CHUNK_ID_MAP_QUARK
 from pylibrary.tools.chunkidmaps import CHUNK_ID_MAP_STM32L052
+from pylibrary.tools.hexlist import HexList
 from pylibrary.tools.nvsparser import NvsBank
 from pylibrary.tools.nvsparser import NvsChunk
 from pylibrary.tools.nvsparser import NvsParserInterface
@@ -99,6 +100,46 @@ class IdBasedNvsParserTestCase(TestCase):
         self.assertEqual(result_diff.tell(), 1, "Error parsing from IntelHex object")
     # end def test_parsing_consistency
 
+    def test_from_bytes(self):
+        """
+        Test instantiating the NvsParser class by parsing the raw content of the NVS, as read from the memory.
+        """
+        test_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nvs_herzog_test.hex")
+        tes_file_object = IntelHex(test_file_path)
+        (start, stop), = tes_file_object.segments()
+
+        test_with_bytes = IdBasedNvsParser.from_bytes(HexList(tes_file_object.gets(start, stop - start)), start,
+                                                      1024 * 4, CHUNK_ID_MAP_QUARK)
+        test_with_hex_file_object = IdBasedNvsParser.from_hex_file(tes_file_object, 1024 * 4, CHUNK_ID_MAP_QUARK)
+
+        result_diff = StringIO()
+        diff_dumps(tes_file_object, test_with_bytes.to_hex_file(), result_diff)
+        self.assertEqual(result_diff.tell(), 1, "Error parsing from bytes")
+        self.assertEqual(test_with_bytes.diff(test_with_hex_file_object, active_banks=False), {},
+                         "Parsing from bytes and from IntelHex object should give the same chunks")
+    # end def test_from_bytes
+
+    def test_get_chunk_after_update(self):
+        """
+        Test the chunk history follows the added and deleted chunks.
+        """
+        test_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nvs_herzog_test.hex")
+
+        test_parser = IdBasedNvsParser.from_hex_file(test_file_path, 1024 * 4, CHUNK_ID_MAP_QUARK)
+        history_length = len(test_parser.get_chunk_history("NVS_SERIAL_NB_ID", get_all=True))
+
+        test_parser.add_new_chunk(chunk_id="NVS_SERIAL_NB_ID", data=[1, 2, 3, 4])
+        self.assertEqual(len(test_parser.get_chunk_history("NVS_SERIAL_NB_ID", get_all=True)), history_length + 1,
+                         "The added chunk should be in the history")
+        self.assertEqual(list(test_parser.get_chunk(chunk_id="NVS_SERIAL_NB_ID", active_bank_only=True).chunk_data),
+                         [1, 2, 3, 4],
+                         "Wrong data")
+
+        test_parser.delete_chunk("NVS_SERIAL_NB_ID")
+        self.assertEqual(len(test_parser.get_chunk_history("NVS_SERIAL_NB_ID", get_all=True)), history_length,
+                         "The deleted chunk should not be in the history")
+    # end def test_get_chunk_after_update
+
     def test_add_get_chunk_no_padding_needed(self):
         """
         Test adding and getting a chunk that does not need padding: the length is dividable by 4 (word size in
@@ -991,6 +1032,42 @@ class NvsBankTestCase(TestCase):
         expected_diff = {}
         self.assertEqual(diff, expected_diff, "No difference between banks should be found")
     # end def test_bank_no_diff
+
+    def test_bank_get_chunk_history(self):
+        """
+        Test NvsBank.get_chunk_history(chunk_id) after changes of the chunks.
+        """
+        array_to_test = TEST_CHUNK_ID_MAP["ACTIVE_BANK_HDR"] + [2, 1, 3, 4] + [3, 1, 3, 5] + [2, 1, 3, 6]
+        test_bank, _ = NvsBank.from_hex_array(array_to_parse=array_to_test,
+                                              chunk_from_hex_array_method=chunk_from_hex_array,
+                                              start_address=0,
+                                              bank_length=20,
+                                              chunk_id_map=TEST_CHUNK_ID_MAP)
+
+        self.assertEqual([chunk.chunk_data for chunk in test_bank.get_chunk_history(2)], [[4], [6]],
+                         "Wrong chunk history")
+        self.assertEqual(test_bank.get_chunk_history(4), [], "Wrong chunk history of a missing chunk")
+
+        # Change of a chunk ID
+        test_bank.chunks[1].chunk_id = 4
+        self.assertEqual([chunk.chunk_data for chunk in test_bank.get_chunk_history(2)], [[6]],
+                         "Wrong chunk history after a chunk ID change")
+        self.assertEqual([chunk.chunk_data for chunk in test_bank.get_chunk_history(4)], [[4]],
+                         "Wrong chunk history after a chunk ID change")
+
+        # Chunk replacing the padding
+        test_bank.add_chunk(NvsChunk(to_hex_array_method=chunk_to_hex_array,
+                                     chunk_id=2,
+                                     chunk_length=1,
+                                     chunk_crc=3,
+                                     chunk_data=[7]))
+        self.assertEqual([chunk.chunk_data for chunk in test_bank.get_chunk_history(2)], [[6], [7]],
+                         "Wrong chunk history after adding a chunk")
+
+        # New chunk list
+        test_bank.chunks = test_bank.chunks[:2]
+        self.assertEqual(test_bank.get_chunk_history(2), [], "Wrong chunk history after changing the chunk list")
+    # end def test_bank_get_chunk_history
 # end class NvsBankTestCase
 
 
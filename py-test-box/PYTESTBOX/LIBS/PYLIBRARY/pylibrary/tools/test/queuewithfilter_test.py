@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pylibrary.tools.test.queuewithfilter_test
+:brief: QueueWithFilter testing module
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from threading import Thread
+from time import sleep
+from time import time
+from unittest import TestCase
+
+from pylibrary.tools.threadutils import QueueEmpty
+from pylibrary.tools.threadutils import QueueWithFilter
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class PoppingQueueWithFilter(QueueWithFilter):
+    """
+    Queue redefining its storage, it cannot be searched in place
+    """
+
+    def _get(self):
+        # See ``QueueWithFilter._get``
+        return super()._get()
+    # end def _get
+# end class PoppingQueueWithFilter
+
+
+class QueueWithFilterTestCase(TestCase):
+    """
+    QueueWithFilter testing class
+    """
+    QUEUE_CLASS = QueueWithFilter
+
+    def _create_queue(self, items=()):
+        """
+        Create a queue with an index on the parity of the items.
+
+        :param items: The items to put in the queue - OPTIONAL
+        :type items: ``iterable``
+
+        :return: The queue
+        :rtype: ``QueueWithFilter``
+        """
+        queue = self.QUEUE_CLASS()
+        queue.add_index(index_name='parity', key_method=lambda item: item % 2 if isinstance(item, int) else None)
+        for item in items:
+            queue.put(item)
+        # end for
+        return queue
+    # end def _create_queue
+
+    def _get_all(self, queue):
+        """
+        Get all the items of a queue.
+
+        :param queue: The queue
+        :type queue: ``QueueWithFilter``
+
+        :return: The items
+        :rtype: ``list``
+        """
+        items = []
+        while not queue.event_empty.is_set():
+            items.append(queue.get_nowait())
+        # end while
+        return items
+    # end def _get_all
+
+    def test_filter_keeps_order(self):
+        """
+        Check only the matching item is removed and the other ones stay in order
+        """
+        queue = self._create_queue(range(10))
+        self.assertEqual(5, queue.get_first_message_filter(filter_method=lambda item: item > 4))
+        self.assertEqual(6, queue.get_no_wait_first_message_filter(filter_method=lambda item: item > 4))
+        self.assertEqual(0, queue.get_no_wait_first_message_filter())
+        self.assertListEqual([1, 2, 3, 4, 7, 8, 9], self._get_all(queue))
+        self.assertTrue(queue.event_empty.is_set())
+        self.assertFalse(queue.event_not_empty.is_set())
+    # end def test_filter_keeps_order
+
+    def test_not_found(self):
+        """
+        Check the errors when no item matches the filter
+        """
+        queue = self._create_queue(range(4))
+        with self.assertRaises(QueueEmpty):
+            queue.get_no_wait_first_message_filter(filter_method=lambda item: item > 4)
+        # end with
+        self.assertIsNone(queue.get_first_message_filter(
+            timeout=0.05, filter_method=lambda item: item > 4, skip_error=True))
+        self.assertIsNone(queue.get_first_message_filter(
+            timeout=None, filter_method=lambda item: item > 4, skip_error=True))
+        with self.assertRaises(QueueEmpty):
+            queue.get_first_message_index(index_name='parity', key_filter_method=lambda key: key == 2, timeout=0.05)
+        # end with
+        self.assertListEqual([0, 1, 2, 3], self._get_all(queue))
+    # end def test_not_found
+
+    def test_index(self):
+        """
+        Check the items are found by key, in the queue order
+        """
+        queue = self._create_queue([0, 'a', 1, 2, 3, 4])
+        self.assertEqual(1, queue.get_no_wait_first_message_index(
+            index_name='parity', key_filter_method=lambda key: key == 1))
+        self.assertEqual(3, queue.get_first_message_index(
+            index_name='parity', key_filter_method=lambda key: key == 1))
+        self.assertEqual(2, queue.get_first_message_index(
+            index_name='parity', key_filter_method=lambda key: key == 0, filter_method=lambda item: item > 0))
+        self.assertEqual(0, queue.get_first_message_index(index_name='parity', key_filter_method=lambda key: True))
+        self.assertListEqual(['a', 4], self._get_all(queue))
+        with self.assertRaises(KeyError):
+            queue.get_no_wait_first_message_index(index_name='unknown', key_filter_method=lambda key: True)
+        # end with
+    # end def test_index
+
+    def test_filter_uses_queue(self):
+        """
+        Check the filter methods can use the queue
+        """
+        queue = self._create_queue(range(5))
+        results = []
+
+        def consumer():
+            """
+            Get items with filters using the queue
+            """
+            results.append(queue.get_first_message_filter(
+                timeout=1, filter_method=lambda item: queue.qsize() > 0 and item == 3))
+            results.append(queue.get_first_message_index(
+                index_name='parity', key_filter_method=lambda key: queue.qsize() > 0 and key == 0,
+                filter_method=lambda item: queue.qsize() > 0 and item > 0))
+        # end def consumer
+
+        thread = Thread(target=consumer, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive(), "The filter methods deadlocked")
+        self.assertListEqual([3, 2], results)
+        self.assertListEqual([0, 1, 4], self._get_all(queue))
+    # end def test_filter_uses_queue
+
+    def test_index_on_existing_items(self):
+        """
+        Check the items already in the queue are indexed and the storage modified directly is detected
+        """
+        queue = self.QUEUE_CLASS()
+        for item in range(4):
+            queue.put(item)
+        # end for
+        queue.add_index(index_name='parity', key_method=lambda item: item % 2)
+        self.assertEqual(1, queue.get_no_wait_first_message_index(
+            index_name='parity', key_filter_method=lambda key: key == 1))
+
+        with queue.mutex:
+            queue.queue.clear()
+            queue.queue.append(5)
+        # end with
+        self.assertEqual(5, queue.get_no_wait_first_message_index(
+            index_name='parity', key_filter_method=lambda key: key == 1))
+    # end def test_index_on_existing_items
+
+    def test_wait(self):
+        """
+        Check a waiting get is woken up by the put of the expected item, the other items staying in the queue
+        """
+        queue = self._create_queue()
+
+        def producer():
+            """
+            Put items in the queue
+            """
+            for item in range(1, 40):
+                queue.put(item)
+                sleep(0.001)
+            # end for
+        # end def producer
+
+        thread = Thread(target=producer)
+        thread.start()
+        start = time()
+        try:
+            self.assertEqual(30, queue.get_first_message_filter(timeout=5, filter_method=lambda item: item >= 30))
+            self.assertEqual(32, queue.get_first_message_index(
+                index_name='parity', key_filter_method=lambda key: key == 0, timeout=5,
+                filter_method=lambda item: item >= 31))
+        finally:
+            thread.join()
+        # end try
+        self.assertLess(time() - start, 5)
+        self.assertListEqual([item for item in range(1, 40) if item not in (30, 32)], self._get_all(queue))
+    # end def test_wait
+
+    def test_concurrent_waiters(self):
+        """
+        Check several waiting gets with different filters are all woken up
+        """
+        queue = self._create_queue()
+        results = {}
+
+        def consumer(expected):
+            """
+            Wait for an item
+
+            :param expected: The expected item
+            :type expected: ``int``
+            """
+            results[expected] = queue.get_first_message_filter(
+                timeout=5, filter_method=lambda item: item == expected, skip_error=True)
+        # end def consumer
+
+        threads = [Thread(target=consumer, args=(expected,)) for expected in range(5)]
+        for thread in threads:
+            thread.start()
+        # end for
+        sleep(0.05)
+        for item in reversed(range(5)):
+            queue.put(item)
+        # end for
+        for thread in threads:
+            thread.join()
+        # end for
+        self.assertDictEqual({expected: expected for expected in range(5)}, results)
+        self.assertTrue(queue.event_empty.is_set())
+    # end def test_concurrent_waiters
+# end class QueueWithFilterTestCase
+
+
+class PoppingQueueWithFilterTestCase(QueueWithFilterTestCase):
+    """
+    QueueWithFilter testing class, for a queue popping and putting back the unwanted items
+    """
+    QUEUE_CLASS = PoppingQueueWithFilter
+
+    def test_index_on_existing_items(self):
+        # See ``QueueWithFilterTestCase.test_index_on_existing_items``
+        queue = self.QUEUE_CLASS()
+        self.assertFalse(queue._is_searchable_in_place())
+        super().test_index_on_existing_items()
+    # end def test_index_on_existing_items
+
+    def test_concurrent_waiters(self):
+        # See ``QueueWithFilterTestCase.test_concurrent_waiters``
+        # The waiting gets pop the items of each other, they are not supported by this queue
+        pass
+    # end def test_concurrent_waiters
+# end class PoppingQueueWithFilterTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -19,6 +19,7 @@ from pylibrary.tools.rttprofiler import Parser
 from pylibrary.tools.rttprofiler import Profiler
 from pylibrary.tools.rttprofiler import RelativeMeasure
 from pylibrary.tools.rttprofiler import ProfilerRecord
+from pylibrary.tools.rttprofiler import counts_to_msec
 from unittest import TestCase
 from typing import Tuple
 import random
@@ -152,6 +153,28 @@ class ParserTestCase(TestCase):
             assert parsed_data == expected_parsed_data
         # end for
     # end def test_garbage_between_records
+
+    def test_array_parsing_and_statistics(self):
+        in_data = [16, 16, 137, 1, 36, 104, 12, 0, 0, 0, 32, 32, 16, 16, 19, 3, 22, 141, 14, 0, 1, 0, 32, 32, 18, 54,
+                   16, 16, 137, 1, 59, 172, 14, 0, 2, 0, 32, 32, 16, 16, 19, 3, 200, 174, 14, 0, 3, 0, 32, 32, 16, 16,
+                   137, 1, 1, 186, 14, 0, 5, 0, 32, 32, 16, 16, 19, 3, 64, 190, 14, 0, 6, 0, 32, 32]
+        pre_parsed_data = ((393, 0, 813092), (787, 1, 953622), (393, 2, 961595), (787, 3, 962248), (393, 5, 965121),
+                           (787, 6, 966208))
+
+        profiler = Profiler(startup_tag=444, startup_gap_idx=len(pre_parsed_data))
+        for i in range(0, len(in_data), 7):
+            profiler.add_data(self.parser_under_test.binary_stream_to_array(bytes(in_data[i:i + 7])))
+        # end for
+        assert tuple(map(tuple_to_profiler_record, pre_parsed_data)) == \
+               tuple(ProfilerRecord(tag=tag, seq_number=seq_number, cycles=cycles)
+                     for tag, cycles, seq_number in profiler._in_records.tolist())
+
+        profiler.process_data()
+        assert profiler.missing_records == 1
+        # The gap in the sequence numbers splits the records in two sections: the pairs are not measured across it
+        statistics = profiler.get_statistics((RelativeMeasure(393, 787),))[RelativeMeasure(393, 787)]
+        assert (statistics.min, statistics.max) == (counts_to_msec(653), counts_to_msec(140530))
+    # end def test_array_parsing_and_statistics
 # end class ParserTestCase
 # ------------------------------------------------------------------------------
 # END OF FILE
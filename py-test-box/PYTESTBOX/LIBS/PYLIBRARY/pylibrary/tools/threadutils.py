@@ -14,13 +14,16 @@
 # ------------------------------------------------------------------------------
 import threading
 from atexit import register
+from bisect import bisect_left
 from collections import deque
 from contextlib import contextmanager
 from ctypes import c_long
 from ctypes import py_object
 from ctypes import pythonapi
 from functools import wraps
+from heapq import merge
 from inspect import signature
+from itertools import islice
 from queue import Empty
 from queue import Full
 from queue import Queue
@@ -774,8 +777,66 @@ class QueueWithEvents(Queue):
 
 class QueueWithFilter(QueueWithEvents):
     """
-    QueueWithEvents object, adding a method to get with filter.
+    QueueWithEvents object, adding methods to get with filter.
+
+    The objects are searched in place: the objects not tested yet are copied under the queue mutex, then tested
+    without it, so that the filter methods can use the queue. Only the object returned is removed from the queue and
+    a waiting search is woken up by ``put``. Each object is tagged with a sequence number, so that a search woken up
+    only tests the objects it has not tested yet.
+
+    Secondary indexes can be added with ``add_index``. An index gives a key for each object (its class, its feature
+    index...) and the objects are then found by key with ``get_first_message_index``, without testing the objects
+    having another key.
+
+    Subclasses redefining the storage (``_get``) cannot be searched in place, the objects are then popped and put back
+    as before.
     """
+
+    def __init__(self, maxsize=0):
+        # See ``QueueWithEvents.__init__``
+        # Index name -> (key method, key -> deque of (sequence, object))
+        self._indexes = {}
+        # (sequence, keys) of each object of the queue, in the queue order
+        self._entries = deque()
+        self._next_sequence = 0
+
+        super().__init__(maxsize=maxsize)
+    # end def __init__
+
+    def add_index(self, index_name, key_method):
+        """
+        Add a secondary index on the objects of the queue. The objects already in the queue are indexed.
+
+        :param index_name: The name of the index
+        :type index_name: ``str``
+        :param key_method: The method giving the key of an object. It should return a hashable object or ``None`` if
+                           the object is not indexed
+        :type key_method: ``callable type``
+
+        :raise ``ValueError``: If the index already exists
+        """
+        with self.mutex:
+            if index_name in self._indexes:
+                raise ValueError(f"Index {index_name} already exists")
+            # end if
+            self._indexes[index_name] = (key_method, {})
+            self._rebuild_entries()
+        # end with
+    # end def add_index
+
+    def has_index(self, index_name):
+        """
+        Check if a secondary index exists.
+
+        :param index_name: The name of the index
+        :type index_name: ``str``
+
+        :return: Flag indicating if the index exists
+        :rtype: ``bool``
+        """
+        return index_name in self._indexes
+    # end def has_index
+
     def get_first_message_filter(self, timeout=2, filter_method=None, skip_error=False):
         """
         Get the first object from the queue that matches the given filter method. If no filter method is given, the
@@ -785,6 +846,54 @@ class QueueWithFilter(QueueWithEvents):
         :param timeout: The timeout of this action in seconds (``None`` disables it) - OPTIONAL
         :type timeout: ``float`` or ``None``
         :param filter_method: The method used to test an object to know if it is the expected one. It should return
+                              a ``bool``. It is called without the queue mutex - OPTIONAL
+        :type filter_method: ``callable type`` or ``None``
+        :param skip_error: Flag to enable (default) / disable exception when the requested object is not
+                           found - OPTIONAL
+        :type skip_error: ``bool``
+
+        :return: Expected object or ``None`` if not found and ``skip_error`` is ``True``
+        :rtype: ``object`` or ``None``
+
+        :raise ``QueueEmpty``: If no expected message is found and ``skip_error`` is ``False``
+        """
+        return self._get_first_message(
+            block=timeout is not None, timeout=timeout, filter_method=filter_method, skip_error=skip_error)
+    # end def get_first_message_filter
+
+    def get_no_wait_first_message_filter(self, filter_method=None, skip_error=False):
+        """
+        Get the first object from the queue that matches the given filter method with no wait period. If no filter
+        method is given, the first object in the queue is returned (if any). If no parameter is given this method acts
+        like the method ``get_nowait``.
+
+        :param filter_method: The method used to test an object to know if it is the expected one. It should return
+                              a ``bool`` - OPTIONAL
+        :type filter_method: ``callable type`` or ``None``
+        :param skip_error: Flag to enable (default) / disable exception when the requested object in not
+                           found - OPTIONAL
+        :type skip_error: ``bool``
+
+        :return: Expected object or ``None`` if not found and ``skip_error`` is ``True``
+        :rtype: ``object`` or ``None``
+
+        :raise ``QueueEmpty``: If no expected message is found and ``skip_error`` is ``False``
+        """
+        return self._get_first_message(block=False, timeout=None, filter_method=filter_method, skip_error=skip_error)
+    # end def get_no_wait_first_message_filter
+
+    def get_first_message_index(self, index_name, key_filter_method, timeout=2, filter_method=None, skip_error=False):
+        """
+        Get the first object from the queue whose key in a secondary index matches the given key filter method and
+        that matches the given filter method (if any).
+
+        :param index_name: The name of the index
+        :type index_name: ``str``
+        :param key_filter_method: The method used to test a key of the index. It should return a ``bool``
+        :type key_filter_method: ``callable type``
+        :param timeout: The timeout of this action in seconds (``None`` disables it) - OPTIONAL
+        :type timeout: ``float`` or ``None``
+        :param filter_method: The method used to test an object having an expected key. It should return
                               a ``bool`` - OPTIONAL
         :type filter_method: ``callable type`` or ``None``
         :param skip_error: Flag to enable (default) / disable exception when the requested object is not
@@ -795,54 +904,331 @@ class QueueWithFilter(QueueWithEvents):
         :rtype: ``object`` or ``None``
 
         :raise ``QueueEmpty``: If no expected message is found and ``skip_error`` is ``False``
+        :raise ``KeyError``: If the index does not exist
         """
-        unwanted_objects = []
-        returned_message = None
+        return self._get_first_message(
+            block=timeout is not None, timeout=timeout, filter_method=filter_method, skip_error=skip_error,
+            index=self._indexes[index_name], key_filter_method=key_filter_method)
+    # end def get_first_message_index
 
-        if timeout is None:
-            end_time = None
-        else:
-            end_time = time() + timeout
+    def get_no_wait_first_message_index(self, index_name, key_filter_method, filter_method=None, skip_error=False):
+        """
+        Get the first object from the queue whose key in a secondary index matches the given key filter method and
+        that matches the given filter method (if any), with no wait period.
+
+        :param index_name: The name of the index
+        :type index_name: ``str``
+        :param key_filter_method: The method used to test a key of the index. It should return a ``bool``
+        :type key_filter_method: ``callable type``
+        :param filter_method: The method used to test an object having an expected key. It should return
+                              a ``bool`` - OPTIONAL
+        :type filter_method: ``callable type`` or ``None``
+        :param skip_error: Flag to enable (default) / disable exception when the requested object is not
+                           found - OPTIONAL
+        :type skip_error: ``bool``
+
+        :return: Expected object or ``None`` if not found and ``skip_error`` is ``True``
+        :rtype: ``object`` or ``None``
+
+        :raise ``QueueEmpty``: If no expected message is found and ``skip_error`` is ``False``
+        :raise ``KeyError``: If the index does not exist
+        """
+        return self._get_first_message(
+            block=False, timeout=None, filter_method=filter_method, skip_error=skip_error,
+            index=self._indexes[index_name], key_filter_method=key_filter_method)
+    # end def get_no_wait_first_message_index
+
+    def _put(self, item):
+        # See ``Queue._put``
+        self._check_entries()
+        super()._put(item)
+        self._add_entry(item)
+        # All the waiters are woken up, the object may not be the one expected by the first one
+        self.not_empty.notify_all()
+    # end def _put
+
+    def _get(self):
+        # See ``Queue._get``
+        self._check_entries()
+        item = super()._get()
+        self._remove_entry(*self._entries.popleft())
+        return item
+    # end def _get
+
+    def _get_first_message(self, block, timeout, filter_method, skip_error, index=None, key_filter_method=None):
+        """
+        Get the first object from the queue that matches the filters.
+
+        :param block: Flag indicating to wait for the expected object
+        :type block: ``bool``
+        :param timeout: The timeout of this action in seconds, only used if ``block`` is ``True``
+        :type timeout: ``float`` or ``None``
+        :param filter_method: The method used to test an object to know if it is the expected one
+        :type filter_method: ``callable type`` or ``None``
+        :param skip_error: Flag to enable / disable exception when the requested object is not found
+        :type skip_error: ``bool``
+        :param index: The secondary index to use - OPTIONAL
+        :type index: ``tuple[callable type, dict]`` or ``None``
+        :param key_filter_method: The method used to test a key of the index - OPTIONAL
+        :type key_filter_method: ``callable type`` or ``None``
+
+        :return: Expected object or ``None`` if not found and ``skip_error`` is ``True``
+        :rtype: ``object`` or ``None``
+
+        :raise ``QueueEmpty``: If no expected message is found and ``skip_error`` is ``False``
+        """
+        if not self._is_searchable_in_place():
+            if index is not None:
+                filter_method = self._get_index_filter_method(
+                    key_method=index[0], key_filter_method=key_filter_method, filter_method=filter_method)
+            # end if
+            return self._get_first_message_popping(
+                block=block, timeout=timeout, filter_method=filter_method, skip_error=skip_error)
         # end if
-        remaining_time = timeout
 
-        try:
-            while returned_message is None:
-                returned_message = self.get(block=timeout is not None, timeout=remaining_time)
-                if filter_method is not None and not filter_method(returned_message):
-                    unwanted_objects.append(returned_message)
-                    returned_message = None
+        end_time = time() + timeout if block and timeout is not None else None
+        # Sequence of the last object tested
+        last_sequence = -1
+
+        while True:
+            with self.mutex:
+                self._check_entries()
+                candidates = self._get_candidates(last_sequence=last_sequence, index=index)
+                # All the objects put until now are tested below
+                tested_sequence = self._next_sequence - 1
+            # end with
+
+            # The filter methods are called without the queue mutex, they can use the queue
+            for sequence, item in self._filter_candidates(
+                    candidates=candidates, filter_method=filter_method, key_filter_method=key_filter_method):
+                with self.mutex:
+                    # The object may have been removed by another consumer in the meantime
+                    position = bisect_left(self._entries, (sequence,))
+                    if position < len(self._entries) and self._entries[position][0] == sequence:
+                        return self._remove_item(sequence=sequence)
+                    # end if
+                # end with
+            # end for
+            last_sequence = tested_sequence
+
+            with self.not_empty:
+                if self._next_sequence - 1 > last_sequence:
+                    # Objects were put while testing
+                    continue
                 # end if
 
-                if remaining_time is not None:
-                    remaining_time = end_time - time()
-                    if remaining_time <= 0 and returned_message is None:
-                        raise QueueEmpty(f"Message filtered still not in queue after {timeout} seconds")
+                if block and end_time is None:
+                    self.not_empty.wait()
+                    continue
+                # end if
+
+                remaining_time = end_time - time() if block else 0
+                if remaining_time <= 0:
+                    if skip_error:
+                        return None
                     # end if
+                    raise QueueEmpty(f"Message filtered still not in queue after {timeout} seconds")
                 # end if
-            # end while
-        except QueueEmpty:
-            if not skip_error:
-                raise
+                self.not_empty.wait(remaining_time)
+            # end with
+        # end while
+    # end def _get_first_message
+
+    def _get_candidates(self, last_sequence, index=None):
+        """
+        Copy the objects of the queue put after an already tested object. The queue mutex should be acquired.
+
+        :param last_sequence: The sequence of the last object tested
+        :type last_sequence: ``int``
+        :param index: The secondary index to use - OPTIONAL
+        :type index: ``tuple[callable type, dict]`` or ``None``
+
+        :return: The list of (sequence, object) in the queue order, or the list of (key, list of (sequence, object)) of
+                 the index
+        :rtype: ``list[tuple[int, object]]`` or ``list[tuple[object, list[tuple[int, object]]]]``
+        """
+        if index is None:
+            position = bisect_left(self._entries, (last_sequence + 1,))
+            return [(sequence, item) for (sequence, _), item in zip(islice(self._entries, position, None),
+                                                                    islice(self.queue, position, None))]
+        # end if
+
+        return [(key, list(islice(bucket, bisect_left(bucket, (last_sequence + 1,)), None)))
+                for key, bucket in index[1].items()]
+    # end def _get_candidates
+
+    @staticmethod
+    def _filter_candidates(candidates, filter_method, key_filter_method=None):
+        """
+        Get the candidate objects matching the filters, in the queue order.
+
+        :param candidates: The candidates given by ``_get_candidates``
+        :type candidates: ``list[tuple[int, object]]`` or ``list[tuple[object, list[tuple[int, object]]]]``
+        :param filter_method: The method used to test an object to know if it is the expected one
+        :type filter_method: ``callable type`` or ``None``
+        :param key_filter_method: The method used to test a key of the index, ``None`` if the candidates are not
+                                  given by an index - OPTIONAL
+        :type key_filter_method: ``callable type`` or ``None``
+
+        :return: The (sequence, object) matching the filters
+        :rtype: ``generator[tuple[int, object]]``
+        """
+        if key_filter_method is not None:
+            candidates = merge(*[bucket for key, bucket in candidates if key_filter_method(key)])
+        # end if
+        for sequence, item in candidates:
+            if filter_method is None or filter_method(item):
+                yield sequence, item
             # end if
-        finally:
-            self._post_processing_unwanted_objects(unwanted_objects=unwanted_objects)
-        # end try
+        # end for
+    # end def _filter_candidates
 
-        return returned_message
-    # end def get_first_message_filter
+    def _remove_item(self, sequence):
+        """
+        Remove an object from the queue. The queue mutex should be acquired.
 
-    def get_no_wait_first_message_filter(self, filter_method=None, skip_error=False):
+        :param sequence: The sequence of the object
+        :type sequence: ``int``
+
+        :return: The object removed
+        :rtype: ``object``
         """
-        Get the first object from the queue that matches the given filter method with no wait period. If no filter
-        method is given, the first object in the queue is returned (if any). If no parameter is given this method acts
-        like the method ``get_nowait``.
+        position = bisect_left(self._entries, (sequence,))
+        item = self.queue[position]
+        keys = self._entries[position][1]
+        del self.queue[position]
+        del self._entries[position]
+        self._remove_entry(sequence, keys)
+        self.not_full.notify()
+        self._update_event_not_empty()
+        return item
+    # end def _remove_item
+
+    def _add_entry(self, item):
+        """
+        Tag a new object with a sequence number and add it to the indexes.
+
+        :param item: The object put in the queue
+        :type item: ``object``
+        """
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        keys = []
+        for key_method, buckets in self._indexes.values():
+            key = key_method(item)
+            keys.append(key)
+            if key is not None:
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = deque()
+                # end if
+                bucket.append((sequence, item))
+            # end if
+        # end for
+        self._entries.append((sequence, tuple(keys)))
+    # end def _add_entry
 
-        :param filter_method: The method used to test an object to know if it is the expected one. It should return
-                              a ``bool`` - OPTIONAL
+    def _remove_entry(self, sequence, keys):
+        """
+        Remove an object from the indexes.
+
+        :param sequence: The sequence of the object
+        :type sequence: ``int``
+        :param keys: The keys of the object in the indexes
+        :type keys: ``tuple``
+        """
+        for (_, buckets), key in zip(self._indexes.values(), keys):
+            if key is None:
+                continue
+            # end if
+            bucket = buckets[key]
+            if bucket[0][0] == sequence:
+                bucket.popleft()
+            else:
+                del bucket[bisect_left(bucket, (sequence,))]
+            # end if
+            if len(bucket) == 0:
+                del buckets[key]
+            # end if
+        # end for
+    # end def _remove_entry
+
+    def _check_entries(self):
+        """
+        Rebuild the entries if the queue storage was modified directly (``queue.queue.clear()`` for instance).
+        """
+        if len(self._entries) != self._qsize():
+            self._rebuild_entries()
+        # end if
+    # end def _check_entries
+
+    def _rebuild_entries(self):
+        """
+        Tag again all the objects of the queue and rebuild the indexes.
+        """
+        self._entries.clear()
+        for _, buckets in self._indexes.values():
+            buckets.clear()
+        # end for
+        # The queues redefining the storage may not have the deque of ``Queue``
+        for item in getattr(self, 'queue', ()):
+            self._add_entry(item)
+        # end for
+    # end def _rebuild_entries
+
+    def _is_searchable_in_place(self):
+        """
+        Check the storage of the queue is the deque of ``Queue``, with its objects tagged by this class.
+
+        :return: Flag indicating if the queue can be searched in place
+        :rtype: ``bool``
+        """
+        return type(self)._get is QueueWithFilter._get and '_get' not in self.__dict__
+    # end def _is_searchable_in_place
+
+    @staticmethod
+    def _get_index_filter_method(key_method, key_filter_method, filter_method):
+        """
+        Get a filter method testing the key of an object, for the queues that cannot be searched in place.
+
+        :param key_method: The method giving the key of an object
+        :type key_method: ``callable type``
+        :param key_filter_method: The method used to test a key of the index
+        :type key_filter_method: ``callable type``
+        :param filter_method: The method used to test an object having an expected key
         :type filter_method: ``callable type`` or ``None``
-        :param skip_error: Flag to enable (default) / disable exception when the requested object in not
-                           found - OPTIONAL
+
+        :return: The filter method
+        :rtype: ``callable type``
+        """
+        def index_filter_method(item):
+            """
+            Filter method testing the key and the object.
+
+            :param item: The object to test
+            :type item: ``object``
+
+            :return: Flag indicating if this is the expected object
+            :rtype: ``bool``
+            """
+            key = key_method(item)
+            return key is not None and key_filter_method(key) and (filter_method is None or filter_method(item))
+        # end def index_filter_method
+        return index_filter_method
+    # end def _get_index_filter_method
+
+    def _get_first_message_popping(self, block, timeout, filter_method, skip_error):
+        """
+        Get the first object from the queue that matches the given filter method, popping the objects and putting
+        back the unwanted ones. It is used for the queues that cannot be searched in place.
+
+        :param block: Flag indicating to wait for the expected object
+        :type block: ``bool``
+        :param timeout: The timeout of this action in seconds, only used if ``block`` is ``True``
+        :type timeout: ``float`` or ``None``
+        :param filter_method: The method used to test an object to know if it is the expected one
+        :type filter_method: ``callable type`` or ``None``
+        :param skip_error: Flag to enable / disable exception when the requested object is not found
         :type skip_error: ``bool``
 
         :return: Expected object or ``None`` if not found and ``skip_error`` is ``True``
@@ -853,14 +1239,27 @@ class QueueWithFilter(QueueWithEvents):
         unwanted_objects = []
         returned_message = None
 
+        if not block or timeout is None:
+            end_time = None
+        else:
+            end_time = time() + timeout
+        # end if
+        remaining_time = timeout if block else None
+
         try:
             while returned_message is None:
-                # get an item from the queue without blocking
-                returned_message = self.get_nowait()
+                returned_message = self.get(block=block, timeout=remaining_time)
                 if filter_method is not None and not filter_method(returned_message):
                     unwanted_objects.append(returned_message)
                     returned_message = None
                 # end if
+
+                if end_time is not None:
+                    remaining_time = end_time - time()
+                    if remaining_time <= 0 and returned_message is None:
+                        raise QueueEmpty(f"Message filtered still not in queue after {timeout} seconds")
+                    # end if
+                # end if
             # end while
         except QueueEmpty:
             if not skip_error:
@@ -871,7 +1270,7 @@ class QueueWithFilter(QueueWithEvents):
         # end try
 
         return returned_message
-    # end def get_no_wait_first_message_filter
+    # end def _get_first_message_popping
 
     def _post_processing_unwanted_objects(self, unwanted_objects):
         """
@@ -892,9 +1291,9 @@ class QueueWithFilter(QueueWithEvents):
         # end while
 
         # Put back the unused messages into the initial queue
-        while len(unwanted_objects) > 0:
-            self.put(unwanted_objects.pop(0))
-        # end while
+        for unwanted_object in unwanted_objects:
+            self.put(unwanted_object)
+        # end for
     # end def _post_processing_unwanted_objects
 # end class QueueWithFilter
 
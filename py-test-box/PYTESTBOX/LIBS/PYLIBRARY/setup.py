@@ -98,7 +98,8 @@ if (__name__ == '__main__'):
       test_suite = 'pylibrary.testrunner.PyLibraryTestRunner', install_requires=['pywin32', 'libusb1', 'bitstring',
                                                                                  'pylink-square', 'hidapi', 'intelhex',
                                                                                  'pyelftools', 'pysetup',
-                                                                                 'pycryptodome', 'pyserial']
+                                                                                 'pycryptodome', 'pyserial',
+                                                                                 'numpy']
     )
 # end if
 
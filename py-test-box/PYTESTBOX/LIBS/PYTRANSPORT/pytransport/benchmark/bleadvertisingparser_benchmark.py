@@ -0,0 +1,442 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pytransport.benchmark.bleadvertisingparser_benchmark
+:brief: Benchmark of the BLE advertising batch splitting on long synthetic captures
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A device advertising the series E and F (same packet, 30 ms then 100 ms interval) interlaced with the high duty cycle
+series D is simulated, with the advertising delay of the Bluetooth specification and packet drops, up to a given
+number of reports. The capture is split in batches with the legacy implementation and with the columnar one, the
+results are checked to be the same.
+
+Usage: python -m pytransport.benchmark.bleadvertisingparser_benchmark [report count]
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+import sys
+from time import perf_counter_ns
+
+import math
+import numpy as np
+
+from pychannel.logiconstants import BleAdvertisingInterval
+from pychannel.logiconstants import BleAdvertisingSeries
+from pylibrary.system.tracelogger import TIMESTAMP_UNIT_DIVIDER_MAP
+from pytransport.ble.bleadvertisingparser import BleAdvertisingParser
+from pytransport.ble.bleadvertisingparser import CROSSING_STABILITY_LENGTH
+from pytransport.ble.bleadvertisingparser import HIGH_DUTY_CYCLE_VALUE_FOR_PARSING
+from pytransport.ble.bleadvertisingparser import N
+from pytransport.ble.bleadvertisingparser import SIZE_ZONE_OF_INTEREST_LEFT
+from pytransport.ble.bleadvertisingparser import SIZE_ZONE_OF_INTEREST_RIGHT
+from pytransport.ble.bleadvertisingparser import STABILITY_MAX_THRESHOLD
+from pytransport.ble.bleadvertisingparser import THRESHOLD_LEVEL
+from pytransport.ble.bleadvertisingparser import TIME_ASSUMED_ONE_WINDOW
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+DEFAULT_COUNT = 1000000
+SEED = 42
+EXPECTED_SERIES = [BleAdvertisingSeries.E, BleAdvertisingSeries.F, BleAdvertisingSeries.D]
+# (data index, interval in ms, window duration in s) of the advertising windows, repeated up to the report count
+SCHEDULE = ((0, BleAdvertisingInterval.SHORT, 30), (0, BleAdvertisingInterval.LONG, 30),
+            (1, HIGH_DUTY_CYCLE_VALUE_FOR_PARSING, 0.5))
+ADVERTISING_DELAY_MAX = 10  # In ms
+DROP_PROBABILITY = 0.1
+
+
+def build_capture(count, seed=SEED):
+    """
+    Build a synthetic advertising capture.
+
+    :param count: The number of reports
+    :type count: ``int``
+    :param seed: The seed of the random generator - OPTIONAL
+    :type seed: ``int``
+
+    :return: The timestamps in ns of each advertising data
+    :rtype: ``list[list[int]]``
+    """
+    generator = np.random.default_rng(seed)
+    ms = TIMESTAMP_UNIT_DIVIDER_MAP['ms']
+    data_timestamps = [[] for _ in range(max(data_id for data_id, _, _ in SCHEDULE) + 1)]
+    current_time = 0
+    report_count = 0
+    while report_count < count:
+        for data_id, interval, duration in SCHEDULE:
+            window_count = int(duration * 1000 / interval)
+            delays = generator.uniform(0, ADVERTISING_DELAY_MAX if interval > HIGH_DUTY_CYCLE_VALUE_FOR_PARSING else 0,
+                                       window_count)
+            timestamps = current_time + np.cumsum((interval + delays) * ms).astype(np.int64)
+            current_time = int(timestamps[-1])
+            received = timestamps[generator.uniform(0, 1, window_count) >= DROP_PROBABILITY]
+            data_timestamps[data_id].extend(received.tolist())
+            report_count += len(received)
+        # end for
+    # end while
+    return data_timestamps
+# end def build_capture
+
+
+def legacy_split_advertisement_data_in_batches(data, expected_series=None):
+    """
+    ``BleAdvertisingParser.split_advertisement_data_in_batches`` as implemented before the columnar timestamps, without
+    the debug plots
+
+    :param data: Advertising data to split
+    :type data: ``list``
+    :param expected_series: expected
+    :type expected_series: ``list[BleAdvertisingSeries]``
+
+    :return: tuple of four list that correspond the following data related to each batch:
+        timestamps
+        intervals
+        data indexes
+        list of discarded timestamps at the end of the batch
+    :rtype: ``tuple``
+    """
+    indexes = np.zeros(len(data), dtype=int)
+    indexes_limit = np.array([len(x) for x in data])
+    batches_timestamps = []
+    batches_intervals = []
+    batches_data_id = []
+    batches_discarded = []
+    if expected_series is None:
+        expected_series = [series for series in BleAdvertisingSeries]
+    # end if
+    possible_transition = BleAdvertisingParser.get_possible_transition_in_series_set(expected_series)
+    last_timestamp_appended = None
+
+    def append_batch(_start, _stop, _current_data_id, _last_timestamp_appended):
+        """
+        Add a batch separated by data to the list. If the batch is sufficiently long it will be checked for
+         interval time transition
+        Internal helper function
+
+        :param _start: start index of the slice
+        :type _start: ``int``
+        :param _stop: stop index of the slice
+        :type _stop: ``int``
+        :param _last_timestamp_appended: timestamp of the last value added to the lists, used to calculate first
+            interval of a new batch - Optional
+        :type _last_timestamp_appended: ``int`` or ``None``
+        :param _current_data_id: current index of the data considered - Optional
+        :type _current_data_id: ``int`` or None
+
+        :return: last timestamp appended to the lists
+        :rtype: ``int``
+        """
+        data_slice = np.array(data[_current_data_id][_start:_stop])
+
+        last_timestamp = data_slice[-1]
+        while len(data_slice) > 0:
+            intervals_of_slice = np.ediff1d(data_slice)
+
+            if _last_timestamp_appended is not None:
+                intervals = np.append([data_slice[0] - _last_timestamp_appended], intervals_of_slice)
+            else:
+                intervals = intervals_of_slice
+            # end if
+
+            if last_timestamp - data_slice[0] < TIME_ASSUMED_ONE_WINDOW:
+                batches_timestamps.append(data_slice)
+                batches_intervals.append(intervals)
+                batches_data_id.append(_current_data_id)
+                batches_discarded.append([])
+                return last_timestamp
+            # end if
+            data_slice = split_batch(intervals, data_slice, _current_data_id)
+
+        # end while
+        return last_timestamp
+    # end def append_batch
+
+    def split_batch(intervals, timestamps, _current_data_id):
+        """
+        split a single batch in two based on the most likely initial transition happening in the interval times
+        Internal helper function
+
+        :param timestamps: list of timestamps to consider
+        :type timestamps: ``list[int]``
+        :param intervals: intervals to consider
+        :type intervals: ``np.ndarray``
+        :param _current_data_id: current index of the data considered
+        :type _current_data_id: ``int``
+
+        :return: data after the split
+        :rtype: ``list``
+        """
+        moving_averaged = BleAdvertisingParser.moving_average(intervals, N)
+        splits = []
+        splits_crossing = []
+
+        for i_transition, transition in enumerate(possible_transition):
+            decoded = [t if t != BleAdvertisingInterval.HIGH_DUTY_CYCLE else HIGH_DUTY_CYCLE_VALUE_FOR_PARSING
+                       for t in transition]
+
+            initial = decoded[0] * TIMESTAMP_UNIT_DIVIDER_MAP['ms']
+            final = decoded[1] * TIMESTAMP_UNIT_DIVIDER_MAP['ms']
+            order_of_transition = initial < final
+            threshold_level = THRESHOLD_LEVEL if order_of_transition else 1 - THRESHOLD_LEVEL
+
+            # for some cases the threshold level need to be changed
+            if transition[0] == BleAdvertisingInterval.HIGH_DUTY_CYCLE:
+                threshold_level = 0.50
+            elif transition[1] == BleAdvertisingInterval.HIGH_DUTY_CYCLE:
+                threshold_level = 0.75
+            # end if
+
+            threshold = (abs(final-initial) * threshold_level) + min(initial, final)
+
+            averaged_threshold = np.array(moving_averaged > threshold)
+            threshold_crossings = np.diff(averaged_threshold)
+            threshold_crossing_indexes = np.argwhere(threshold_crossings)[:, 0]
+
+            while len(threshold_crossing_indexes) > 0:
+                analyzed_crossing = threshold_crossing_indexes[0]
+                # is crossing in the right direction
+                if averaged_threshold[analyzed_crossing] == order_of_transition:
+                    # wrong direction, discard crossing
+                    threshold_crossing_indexes = np.delete(threshold_crossing_indexes, 0)
+                    continue
+                # end if
+                # Test whether crossing is long enough
+                stability_zone = averaged_threshold[analyzed_crossing+1:
+                                                    analyzed_crossing+1+CROSSING_STABILITY_LENGTH]
+                stability_count = np.count_nonzero(stability_zone == order_of_transition)
+                number_after_crossing = len(moving_averaged) - 1 - analyzed_crossing
+                if stability_count >= min(STABILITY_MAX_THRESHOLD, float(number_after_crossing)):
+                    break
+                # end if
+                threshold_crossing_indexes = np.delete(threshold_crossing_indexes, 0)
+            # end while
+
+            threshold_crossing_indexes_back_to_initial = threshold_crossing_indexes + N - 1
+
+
+            if len(threshold_crossing_indexes) == 0:
+                # no crossing for this value
+                continue
+            # end if
+            crossing_index = int(threshold_crossing_indexes_back_to_initial[0])
+
+
+            start_interest = max(crossing_index - SIZE_ZONE_OF_INTEREST_LEFT, 0)
+            zone_of_interest = intervals[start_interest:crossing_index+SIZE_ZONE_OF_INTEREST_RIGHT]
+
+            divided_initial = zone_of_interest / initial
+            divided_final = zone_of_interest / final
+            round_initial = np.round(divided_initial)
+            round_final = np.round(divided_final)
+            closeness_initial = np.abs(divided_initial - round_initial)
+            closeness_final = np.abs(divided_final - round_final)
+
+            closer_initial = closeness_initial < closeness_final
+            delta_closeness = np.abs(closeness_initial-closeness_final)
+            too_close_closeness = delta_closeness < 0.2
+
+            too_far = np.logical_and(closer_initial > 0.5, closeness_final > 0.5)
+            # a value much bellow both expected at transition is an outlier generated
+            # by the firmware that we can't deal with
+            too_low = np.logical_and(round_initial == 0, round_final == 0)
+            # if above the value of both at transition can lead to wrong classification
+            too_big = np.logical_and(round_initial >= 2, round_final >= 2)
+            ambiguous = np.logical_or(too_close_closeness,
+                                      np.logical_or(too_far, np.logical_or(too_low, too_big)))
+
+            # for each value that are continuously in the rough size of the biggest value at the start
+            continuous_sure_end = 0
+            continuous_sure_start = 0
+            if order_of_transition:
+                threshold = round(final/initial)
+                override_thresholded = np.array(divided_initial < threshold)
+                for val in override_thresholded:
+                    if not val:
+                        continuous_sure_start += 1
+                    else:
+                        break
+                    # end if
+                # end for
+
+                for val in reversed(override_thresholded):
+                    if val:
+                        continuous_sure_end += 1
+                    else:
+                        break
+                    # end if
+                # end for
+            else:
+                threshold = round(initial/final)
+                override_thesholded = np.array(divided_final > threshold)
+                for val in override_thesholded:
+                    if val:
+                        continuous_sure_start += 1
+                    else:
+                        break
+                    # end if
+                # end for
+                for val in reversed(override_thesholded):
+                    if not val:
+                        continuous_sure_end += 1
+                    else:
+                        break
+                    # end if
+                # end for
+            # end if
+            mask_override = np.pad(np.repeat(True, len(zone_of_interest) - continuous_sure_end),
+                                   (0, continuous_sure_end), constant_values=False)
+            closer_initial_override_masked_end = np.logical_and(closer_initial, mask_override)
+
+            mask_override = np.pad(np.repeat(True, continuous_sure_start),
+                                   (0, len(zone_of_interest) - continuous_sure_start), constant_values=False)
+
+            closer_initial_override_masked = np.logical_or(closer_initial_override_masked_end, mask_override)
+
+            closer_initial_masked = np.logical_xor(closer_initial_override_masked, ambiguous)
+
+            index_crossing = np.argwhere(np.diff(closer_initial_masked))[:, 0]
+            index_where_closer = index_crossing[np.where(closer_initial_masked[index_crossing])]
+            index_where_further = index_crossing[
+                np.where(np.logical_not(closer_initial_masked[index_crossing]))]
+            index_where_ambiguous = np.argwhere(np.diff(ambiguous))[:, 0]
+
+            # protect index errors when never ambiguous
+            if len(index_where_ambiguous) > 0:
+                last_before_ambiguous = index_where_ambiguous[0] - 1
+                last_ambiguous = index_where_ambiguous[-1] + 1
+            else:
+                last_before_ambiguous = math.inf
+                last_ambiguous = -math.inf
+            # end if
+            # if it is true closer at start of the window
+            if len(index_where_closer) == 0 or len(index_crossing) == 0:
+                low = 0
+            elif index_crossing[0] == index_where_closer[0]:
+                low = min(int(index_where_closer[0]), last_before_ambiguous)
+            else:
+                low = 0
+            # end if
+            if len(index_where_closer) > 0:
+                last_closer_plus_1 = index_where_closer[-1] + 1
+            else:
+                last_closer_plus_1 = -math.inf
+            # end if
+            if len(index_where_further) == 0 or len(index_crossing) == 0:
+                high = max(low + 1, last_closer_plus_1, last_ambiguous)
+            elif index_crossing[-1] == index_where_further[-1]:
+                high = SIZE_ZONE_OF_INTEREST_LEFT+SIZE_ZONE_OF_INTEREST_RIGHT
+            else:
+                high = max(low + 1, last_closer_plus_1, last_ambiguous)
+            # end if
+
+            if round_initial[low] > 3:
+                low -= 1
+            # end if
+
+            split_at_low = start_interest + low
+            split_at_high = start_interest + high
+
+            splits.append((split_at_low, split_at_high))
+            splits_crossing.append(crossing_index)
+            # end if
+        # end for
+
+        if len(splits) == 0:
+            batches_timestamps.append(timestamps)
+            batches_intervals.append(intervals)
+            batches_data_id.append(_current_data_id)
+            batches_discarded.append(np.array([]))
+            return []
+        else:
+
+            index_best_guess_split = np.argmin(splits_crossing)
+
+            (low, high) = splits[index_best_guess_split]
+            batches_timestamps.append(timestamps[0:low + 2])
+            batches_intervals.append(intervals[0:low + 1])
+            batches_data_id.append(_current_data_id)
+            batches_discarded.append(timestamps[low+2:high+1])
+            start_next_slice = high + 1
+            # return the rest of the segment
+            return timestamps[start_next_slice:]
+        # end if
+    # end def split_batch
+
+    if len(data) > 1:
+        while np.any(indexes < indexes_limit):
+            current_timestamp_of_each_data = np.array([data[i][index] if index < indexes_limit[i] else math.inf
+                                                       for i, index in enumerate(indexes)])
+            current_data_id = np.argmin(current_timestamp_of_each_data)
+            next_timestamp = np.min(np.delete(current_timestamp_of_each_data, current_data_id))
+
+            first_id_after_switch = np.searchsorted(data[current_data_id], next_timestamp)
+            current_index = indexes[current_data_id]
+            last_timestamp_appended = append_batch(current_index, first_id_after_switch, current_data_id,
+                                                   last_timestamp_appended)
+
+            indexes[current_data_id] = first_id_after_switch
+        # end while
+    else:
+        # append whole as a batch, surely to split
+        append_batch(0, len(data[0]), 0, last_timestamp_appended)
+    # end if
+    return batches_timestamps, batches_intervals, batches_data_id, batches_discarded
+# end def legacy_split_advertisement_data_in_batches
+
+
+def check_same_batches(legacy_batches, batches):
+    """
+    Check the batches are the same.
+
+    :param legacy_batches: The batches of the legacy implementation
+    :type legacy_batches: ``tuple``
+    :param batches: The batches of the columnar implementation
+    :type batches: ``tuple``
+    """
+    for legacy_values, values in zip(legacy_batches, batches):
+        assert len(legacy_values) == len(values), "Different batch count"
+        for legacy_value, value in zip(legacy_values, values):
+            assert np.array_equal(legacy_value, value), "Different batches"
+        # end for
+    # end for
+# end def check_same_batches
+
+
+def main(count=DEFAULT_COUNT):
+    """
+    Run the benchmark and print the results.
+
+    :param count: The number of reports
+    :type count: ``int``
+    """
+    data = build_capture(count)
+    print(f'{sum(len(timestamps) for timestamps in data)} reports in {len(data)} advertising data')
+
+    start = perf_counter_ns()
+    legacy_batches = legacy_split_advertisement_data_in_batches(data, EXPECTED_SERIES)
+    legacy_duration = perf_counter_ns() - start
+    start = perf_counter_ns()
+    batches = BleAdvertisingParser.split_advertisement_data_in_batches(data, EXPECTED_SERIES)
+    duration = perf_counter_ns() - start
+
+    check_same_batches(legacy_batches, batches)
+    print(f'{len(batches[0])} batches, {sum(len(discarded) > 0 for discarded in batches[3])} split on a transition')
+    print(f'legacy  : {legacy_duration / 1e6:9.1f} ms')
+    print(f'columnar: {duration / 1e6:9.1f} ms ({legacy_duration / duration:.1f}x)')
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -0,0 +1,565 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pytransport.benchmark.interrupttransfer_benchmark
+:brief: Stress benchmark of the LibusbUsbContext interrupt endpoint reading, with a fake libusb backend
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A fake device sends bursts of reports on an interrupt endpoint, as a gaming mouse at 1 kHz or 8 kHz. Like a real
+device, it keeps only the last report when no transfer is pending: the previous one is dropped. The endpoint is read
+with one ``InterruptPollingTask`` (blocking reads) and then with an ``InterruptTransferRing`` (asynchronous transfers
+completed by ``ContextEventHandleTask``). The dropped reports and the CPU time per received report are compared.
+
+Usage: python -m pytransport.benchmark.interrupttransfer_benchmark [duration in seconds]
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+import sys
+from collections import deque
+from queue import Queue
+from threading import Condition
+from threading import Event
+from threading import Thread
+from time import perf_counter
+from time import process_time
+from time import sleep
+from time import thread_time
+
+import usb1
+
+from pytransport.usb.libusbcontext.libusbdriverusbcontext import LibusbUsbContext
+from pytransport.usb.libusbcontext.libusbdriverusbcontext import LibusbUsbContextDevice
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+DEFAULT_DURATION = 2
+READER_NAME = 'Bus 1 Device 1'
+ENDPOINT = 0x81
+REPORT_SIZE = 8
+# (report rate in Hz, reports per burst)
+REPORT_RATES = ((1000, 1), (8000, 8), (8000, 32))
+
+
+class FakeTransfer:
+    """
+    Asynchronous transfer of the fake backend, with the ``usb1.USBTransfer`` interface used by the context
+    """
+
+    def __init__(self, endpoint):
+        """
+        :param endpoint: The interrupt endpoint of the device
+        :type endpoint: ``FakeInterruptEndpoint``
+        """
+        self._endpoint = endpoint
+        self._buffer = None
+        self._callback = None
+        self._user_data = None
+        self._status = None
+        self._actual_length = 0
+        self.submitted = False
+    # end def __init__
+
+    def setInterrupt(self, endpoint, buffer_or_len, callback=None, user_data=None, timeout=0):
+        # See ``usb1.USBTransfer.setInterrupt``
+        self._buffer = bytearray(buffer_or_len)
+        self._callback = callback
+        self._user_data = user_data
+    # end def setInterrupt
+
+    def submit(self):
+        # See ``usb1.USBTransfer.submit``
+        self.submitted = True
+        self._endpoint.submit(self)
+    # end def submit
+
+    def cancel(self):
+        # See ``usb1.USBTransfer.cancel``
+        self._endpoint.cancel(self)
+    # end def cancel
+
+    def isSubmitted(self):
+        # See ``usb1.USBTransfer.isSubmitted``
+        return self.submitted
+    # end def isSubmitted
+
+    def getStatus(self):
+        # See ``usb1.USBTransfer.getStatus``
+        return self._status
+    # end def getStatus
+
+    def getActualLength(self):
+        # See ``usb1.USBTransfer.getActualLength``
+        return self._actual_length
+    # end def getActualLength
+
+    def getBuffer(self):
+        # See ``usb1.USBTransfer.getBuffer``
+        return self._buffer
+    # end def getBuffer
+
+    def getUserData(self):
+        # See ``usb1.USBTransfer.getUserData``
+        return self._user_data
+    # end def getUserData
+
+    def complete(self, status, report=b''):
+        """
+        Complete the transfer, its callback is called by the event handling of the fake context.
+
+        :param status: The transfer status
+        :type status: ``int``
+        :param report: The report received - OPTIONAL
+        :type report: ``bytes``
+        """
+        self._status = status
+        self._actual_length = len(report)
+        self._buffer[:len(report)] = report
+    # end def complete
+
+    def call_callback(self):
+        """
+        Call the completion callback, as done by ``usb1.USBContext.handleEventsTimeout``.
+        """
+        self.submitted = False
+        self._callback(self)
+    # end def call_callback
+# end class FakeTransfer
+
+
+class FakeInterruptEndpoint:
+    """
+    Interrupt IN endpoint of the fake device. A report sent while no transfer or read is pending is kept until the next
+    one, a report sent while a report is kept replaces it and is counted as dropped.
+    """
+
+    def __init__(self, context):
+        """
+        :param context: The fake libusb context handling the events
+        :type context: ``FakeUsbContext``
+        """
+        self._context = context
+        self._condition = Condition()
+        self._pending_transfers = deque()
+        self._kept_report = None
+        self._reading = False
+        self.sent_count = 0
+        self.dropped_count = 0
+    # end def __init__
+
+    def send(self, report):
+        """
+        Send a report from the device.
+
+        :param report: The report
+        :type report: ``bytes``
+        """
+        with self._condition:
+            self.sent_count += 1
+            if len(self._pending_transfers) > 0:
+                self._context.complete(self._pending_transfers.popleft(), usb1.TRANSFER_COMPLETED, report)
+            else:
+                if self._kept_report is not None:
+                    self.dropped_count += 1
+                # end if
+                self._kept_report = report
+                if self._reading:
+                    self._condition.notify()
+                # end if
+            # end if
+        # end with
+    # end def send
+
+    def read(self, timeout):
+        """
+        Blocking read of a report.
+
+        :param timeout: The timeout in seconds
+        :type timeout: ``float``
+
+        :return: The report
+        :rtype: ``bytes``
+
+        :raise ``usb1.USBErrorTimeout``: If no report is received
+        """
+        with self._condition:
+            self._reading = True
+            try:
+                if not self._condition.wait_for(lambda: self._kept_report is not None, timeout):
+                    raise usb1.USBErrorTimeout()
+                # end if
+                report, self._kept_report = self._kept_report, None
+                return report
+            finally:
+                self._reading = False
+            # end try
+        # end with
+    # end def read
+
+    def submit(self, transfer):
+        """
+        Submit an asynchronous transfer.
+
+        :param transfer: The transfer
+        :type transfer: ``FakeTransfer``
+        """
+        with self._condition:
+            if self._kept_report is not None:
+                self._context.complete(transfer, usb1.TRANSFER_COMPLETED, self._kept_report)
+                self._kept_report = None
+            else:
+                self._pending_transfers.append(transfer)
+            # end if
+        # end with
+    # end def submit
+
+    def cancel(self, transfer):
+        """
+        Cancel an asynchronous transfer.
+
+        :param transfer: The transfer
+        :type transfer: ``FakeTransfer``
+        """
+        with self._condition:
+            if transfer in self._pending_transfers:
+                self._pending_transfers.remove(transfer)
+                self._context.complete(transfer, usb1.TRANSFER_CANCELLED)
+            # end if
+        # end with
+    # end def cancel
+# end class FakeInterruptEndpoint
+
+
+class FakeDescriptor:
+    """
+    Configuration, interface, interface setting or endpoint descriptor of the fake device
+    """
+
+    def __init__(self, children=(), number=0, address=0, max_packet_size=0):
+        """
+        :param children: The descriptors it contains - OPTIONAL
+        :type children: ``tuple``
+        :param number: The configuration or interface number - OPTIONAL
+        :type number: ``int``
+        :param address: The endpoint address - OPTIONAL
+        :type address: ``int``
+        :param max_packet_size: The endpoint max packet size - OPTIONAL
+        :type max_packet_size: ``int``
+        """
+        self._children = children
+        self._number = number
+        self._address = address
+        self._max_packet_size = max_packet_size
+    # end def __init__
+
+    def __iter__(self):
+        return iter(self._children)
+    # end def __iter__
+
+    def getConfigurationValue(self):
+        # See ``usb1.USBConfiguration.getConfigurationValue``
+        return self._number
+    # end def getConfigurationValue
+
+    def getNumSettings(self):
+        # See ``usb1.USBInterface.getNumSettings``
+        return len(self._children)
+    # end def getNumSettings
+
+    def getNumber(self):
+        # See ``usb1.USBInterfaceSetting.getNumber``
+        return self._number
+    # end def getNumber
+
+    def getProtocol(self):
+        # See ``usb1.USBInterfaceSetting.getProtocol``
+        return 2
+    # end def getProtocol
+
+    def getAddress(self):
+        # See ``usb1.USBEndpoint.getAddress``
+        return self._address
+    # end def getAddress
+
+    def getMaxPacketSize(self):
+        # See ``usb1.USBEndpoint.getMaxPacketSize``
+        return self._max_packet_size
+    # end def getMaxPacketSize
+# end class FakeDescriptor
+
+
+class FakeUsbDeviceHandle:
+    """
+    Device handle of the fake backend
+    """
+
+    def __init__(self, endpoint):
+        """
+        :param endpoint: The interrupt endpoint of the device
+        :type endpoint: ``FakeInterruptEndpoint``
+        """
+        self._endpoint = endpoint
+    # end def __init__
+
+    def kernelDriverActive(self, interface):
+        # See ``usb1.USBDeviceHandle.kernelDriverActive``
+        return False
+    # end def kernelDriverActive
+
+    def claimInterface(self, interface):
+        # See ``usb1.USBDeviceHandle.claimInterface``
+        pass
+    # end def claimInterface
+
+    def releaseInterface(self, interface):
+        # See ``usb1.USBDeviceHandle.releaseInterface``
+        pass
+    # end def releaseInterface
+
+    def interruptRead(self, endpoint, length, timeout=0):
+        # See ``usb1.USBDeviceHandle.interruptRead``
+        return self._endpoint.read(timeout=timeout / 1000)
+    # end def interruptRead
+
+    def getTransfer(self, iso_packets=0):
+        # See ``usb1.USBDeviceHandle.getTransfer``
+        return FakeTransfer(endpoint=self._endpoint)
+    # end def getTransfer
+
+    def close(self):
+        # See ``usb1.USBDeviceHandle.close``
+        pass
+    # end def close
+# end class FakeUsbDeviceHandle
+
+
+class FakeUsbDevice(FakeDescriptor):
+    """
+    Device of the fake backend, with one interface and one interrupt IN endpoint
+    """
+
+    def __init__(self, endpoint):
+        """
+        :param endpoint: The interrupt endpoint of the device
+        :type endpoint: ``FakeInterruptEndpoint``
+        """
+        endpoint_descriptor = FakeDescriptor(address=ENDPOINT, max_packet_size=REPORT_SIZE)
+        super().__init__(children=(FakeDescriptor(children=(FakeDescriptor(children=(
+            FakeDescriptor(children=(endpoint_descriptor,)),)),), number=1),))
+        self._endpoint = endpoint
+    # end def __init__
+
+    def getBusNumber(self):
+        # See ``usb1.USBDevice.getBusNumber``
+        return 1
+    # end def getBusNumber
+
+    def getPortNumberList(self):
+        # See ``usb1.USBDevice.getPortNumberList``
+        return [1]
+    # end def getPortNumberList
+
+    def getVendorID(self):
+        # See ``usb1.USBDevice.getVendorID``
+        return 0x046D
+    # end def getVendorID
+
+    def getProductID(self):
+        # See ``usb1.USBDevice.getProductID``
+        return 0xC000
+    # end def getProductID
+
+    def open(self):
+        # See ``usb1.USBDevice.open``
+        return FakeUsbDeviceHandle(endpoint=self._endpoint)
+    # end def open
+
+    def close(self):
+        # See ``usb1.USBDevice.close``
+        pass
+    # end def close
+# end class FakeUsbDevice
+
+
+class FakeUsbContext:
+    """
+    libusb context of the fake backend, the completed transfers are given back by ``handleEventsTimeout``
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._completed_transfers = deque()
+        self.endpoint = FakeInterruptEndpoint(context=self)
+        self.device = FakeUsbDevice(endpoint=self.endpoint)
+    # end def __init__
+
+    def complete(self, transfer, status, report=b''):
+        """
+        Complete a transfer.
+
+        :param transfer: The transfer
+        :type transfer: ``FakeTransfer``
+        :param status: The transfer status
+        :type status: ``int``
+        :param report: The report received - OPTIONAL
+        :type report: ``bytes``
+        """
+        transfer.complete(status=status, report=report)
+        with self._condition:
+            self._completed_transfers.append(transfer)
+            self._condition.notify()
+        # end with
+    # end def complete
+
+    def handleEventsTimeout(self, tv=0):
+        # See ``usb1.USBContext.handleEventsTimeout``
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._completed_transfers) > 0, tv)
+            completed_transfers, self._completed_transfers = self._completed_transfers, deque()
+        # end with
+        for transfer in completed_transfers:
+            transfer.call_callback()
+        # end for
+    # end def handleEventsTimeout
+
+    def getDeviceList(self):
+        # See ``usb1.USBContext.getDeviceList``
+        return [self.device]
+    # end def getDeviceList
+
+    def close(self):
+        # See ``usb1.USBContext.close``
+        pass
+    # end def close
+# end class FakeUsbContext
+
+
+class PollingFakeBackendUsbContext(LibusbUsbContext):
+    """
+    Context using the fake backend, reading the endpoint with a polling task
+    """
+    _DEVICE_CACHE = [LibusbUsbContextDevice(reader_name=READER_NAME, vid=0x046D, pid=0xC000)]
+
+    def __init__(self, backend):
+        """
+        :param backend: The fake libusb context
+        :type backend: ``FakeUsbContext``
+        """
+        super().__init__()
+        self._backend = backend
+    # end def __init__
+
+    def _create_libusb_context(self):
+        # See ``LibusbUsbContext._create_libusb_context``
+        return self._backend
+    # end def _create_libusb_context
+# end class PollingFakeBackendUsbContext
+
+
+class AsynchronousFakeBackendUsbContext(PollingFakeBackendUsbContext):
+    """
+    Context using the fake backend, reading the endpoint with a ring of asynchronous transfers
+    """
+    ASYNCHRONOUS_INTERRUPT_READ = True
+# end class AsynchronousFakeBackendUsbContext
+
+
+def run(context_class, rate, burst, duration):
+    """
+    Send reports to a context for a given duration.
+
+    :param context_class: The context class
+    :type context_class: ``type``
+    :param rate: The report rate, in Hz
+    :type rate: ``int``
+    :param burst: The number of reports sent at once
+    :type burst: ``int``
+    :param duration: The duration, in seconds
+    :type duration: ``float``
+
+    :return: The number of reports sent, dropped, received and the CPU time of the context per received report in us
+    :rtype: ``tuple[int, int, int, float]``
+    """
+    backend = FakeUsbContext()
+    context = context_class(backend=backend)
+    context.open()
+    device = context._usb_context_devices[0]
+    context.open_device(usb_context_device=device)
+    queue = Queue()
+    context.start_interrupt_read_polling(
+        usb_context_device=device, endpoint=ENDPOINT, w_length=REPORT_SIZE, time_stamped_msg_queue=queue)
+
+    done = Event()
+    device_cpu_time = []
+
+    def device_thread():
+        """
+        Send the bursts of reports at the report rate.
+        """
+        start_cpu = thread_time()
+        period = burst / rate
+        next_time = perf_counter()
+        index = 0
+        while not done.is_set():
+            for _ in range(burst):
+                backend.endpoint.send(index.to_bytes(REPORT_SIZE, 'little'))
+                index += 1
+            # end for
+            next_time += period
+            delay = next_time - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            # end if
+        # end while
+        device_cpu_time.append(thread_time() - start_cpu)
+    # end def device_thread
+
+    start_cpu = process_time()
+    thread = Thread(target=device_thread)
+    thread.start()
+    sleep(duration)
+    done.set()
+    thread.join()
+    # Let the last reports be received
+    sleep(0.05)
+    cpu_time = process_time() - start_cpu - device_cpu_time[0]
+
+    context.close()
+    received = queue.qsize()
+    return (backend.endpoint.sent_count, backend.endpoint.dropped_count, received,
+            cpu_time / max(received, 1) * 1e6)
+# end def run
+
+
+def main(duration=DEFAULT_DURATION):
+    """
+    Run the benchmark and print the results.
+
+    :param duration: The duration of each run, in seconds
+    :type duration: ``float``
+    """
+    print(f'{duration}s per run, ring of {AsynchronousFakeBackendUsbContext.INTERRUPT_TRANSFER_RING_SIZE} transfers')
+    for rate, burst in REPORT_RATES:
+        for name, context_class in (('polling', PollingFakeBackendUsbContext),
+                                    ('ring', AsynchronousFakeBackendUsbContext)):
+            sent, dropped, received, cpu_per_report = run(context_class, rate, burst, duration)
+            print(f'{rate:5d} Hz, bursts of {burst:2d}, {name:7s}: {sent:6d} sent, {dropped:6d} dropped '
+                  f'({dropped / sent * 100:5.1f}%), {received:6d} received, {cpu_per_report:6.1f} us CPU/report')
+        # end for
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[float(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
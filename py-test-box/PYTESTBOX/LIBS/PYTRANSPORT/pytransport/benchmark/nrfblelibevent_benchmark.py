@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pytransport.benchmark.nrfblelibevent_benchmark
+:brief: Benchmark of the nrf-ble-lib process transport, with a fake driver process
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+
+A fake driver process sends a stream of notifications to the main process, first as pickled tuples through the event
+queue as done before, then as records in a ``NrfBleLibEventRing`` with a doorbell message in the event queue. Then a
+fake driver process echoes requests: they are sent one at a time waiting for each response, then all at once and
+matched with their response by correlation ID.
+
+Usage: python -m pytransport.benchmark.nrfblelibevent_benchmark [notification count]
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+import sys
+from time import perf_counter_ns
+
+from aioprocessing import AioProcess
+from aioprocessing import AioQueue
+
+from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibEventRecordType
+from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibProcessMessageType
+from pytransport.ble.nrfblelibblecontext.nrfblelibeventring import NrfBleLibEventRing
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+DEFAULT_COUNT = 100000
+REQUEST_COUNT = 2000
+CONNECTION_HANDLE = 0
+VALUE_HANDLE = 0x0010
+# HID++ long report notification
+PAYLOAD = bytes(range(20))
+DOORBELL = (NrfBleLibProcessMessageType.EVENT_RING_EVENT, tuple())
+
+
+def send_notifications_in_queue(event_queue, count):
+    """
+    Fake driver process sending the notifications through the event queue.
+
+    :param event_queue: The event queue
+    :type event_queue: ``AioQueue``
+    :param count: The number of notifications
+    :type count: ``int``
+    """
+    for index in range(count):
+        event_queue.put((NrfBleLibProcessMessageType.NOTIFICATION_EVENT,
+                         (CONNECTION_HANDLE, VALUE_HANDLE, list(PAYLOAD), index)))
+    # end for
+    event_queue.put(None)
+# end def send_notifications_in_queue
+
+
+def send_notifications_in_ring(event_queue, event_ring, count):
+    """
+    Fake driver process sending the notifications through the event ring.
+
+    :param event_queue: The event queue, for the doorbell
+    :type event_queue: ``AioQueue``
+    :param event_ring: The event ring
+    :type event_ring: ``NrfBleLibEventRing``
+    :param count: The number of notifications
+    :type count: ``int``
+    """
+    for index in range(count):
+        while not event_ring.write(NrfBleLibEventRecordType.NOTIFICATION, CONNECTION_HANDLE, VALUE_HANDLE, PAYLOAD,
+                                   index):
+            pass
+        # end while
+        if event_ring.take_doorbell():
+            event_queue.put(DOORBELL)
+        # end if
+    # end for
+    event_queue.put(None)
+    event_ring.close()
+# end def send_notifications_in_ring
+
+
+def echo_requests(request_queue, response_queue):
+    """
+    Fake driver process answering the requests until ``None`` is received.
+
+    :param request_queue: The request queue
+    :type request_queue: ``AioQueue``
+    :param response_queue: The response queue
+    :type response_queue: ``AioQueue``
+    """
+    request = request_queue.get()
+    while request is not None:
+        request_type, arguments, correlation_id = request
+        response_queue.put((NrfBleLibProcessMessageType.CHARACTERISTIC_READ_RESPONSE, arguments, correlation_id))
+        request = request_queue.get()
+    # end while
+# end def echo_requests
+
+
+def receive_from_queue(count):
+    """
+    Receive the notifications sent through the event queue.
+
+    :param count: The number of notifications
+    :type count: ``int``
+
+    :return: The number of notifications received and the duration in ns
+    :rtype: ``tuple[int, int]``
+    """
+    event_queue = AioQueue()
+    process = AioProcess(target=send_notifications_in_queue, args=(event_queue, count))
+    start = perf_counter_ns()
+    process.start()
+    received = 0
+    event = event_queue.get()
+    while event is not None:
+        # As done by the event thread for a notification
+        bytes(event[1][2])
+        received += 1
+        event = event_queue.get()
+    # end while
+    duration = perf_counter_ns() - start
+    process.join()
+    return received, duration
+# end def receive_from_queue
+
+
+def receive_from_ring(count):
+    """
+    Receive the notifications sent through the event ring.
+
+    :param count: The number of notifications
+    :type count: ``int``
+
+    :return: The number of notifications received, the number of doorbells and the duration in ns
+    :rtype: ``tuple[int, int, int]``
+    """
+    event_queue = AioQueue()
+    event_ring = NrfBleLibEventRing()
+    process = AioProcess(target=send_notifications_in_ring, args=(event_queue, event_ring, count))
+    start = perf_counter_ns()
+    process.start()
+    received = 0
+    doorbells = 0
+    event = event_queue.get()
+    while event is not None:
+        doorbells += 1
+        received += len(event_ring.read())
+        event = event_queue.get()
+    # end while
+    received += len(event_ring.read())
+    duration = perf_counter_ns() - start
+    process.join()
+    event_ring.close()
+    return received, doorbells, duration
+# end def receive_from_ring
+
+
+def exchange_requests(count, pipelined):
+    """
+    Send requests to an echo process and get their responses.
+
+    :param count: The number of requests
+    :type count: ``int``
+    :param pipelined: Flag indicating to send all the requests before getting the responses
+    :type pipelined: ``bool``
+
+    :return: The duration in ns
+    :rtype: ``int``
+    """
+    request_queue = AioQueue()
+    response_queue = AioQueue()
+    process = AioProcess(target=echo_requests, args=(request_queue, response_queue))
+    process.start()
+    # Warm up the process
+    request_queue.put((NrfBleLibProcessMessageType.CHARACTERISTIC_READ_REQUEST, (0,), 0))
+    response_queue.get()
+
+    start = perf_counter_ns()
+    if pipelined:
+        for correlation_id in range(1, count + 1):
+            request_queue.put((NrfBleLibProcessMessageType.CHARACTERISTIC_READ_REQUEST, (correlation_id,),
+                               correlation_id))
+        # end for
+        responses = {}
+        for _ in range(count):
+            response = response_queue.get()
+            responses[response[2]] = response
+        # end for
+        assert sorted(responses) == list(range(1, count + 1)), "Missing responses"
+    else:
+        for correlation_id in range(1, count + 1):
+            request_queue.put((NrfBleLibProcessMessageType.CHARACTERISTIC_READ_REQUEST, (correlation_id,),
+                               correlation_id))
+            assert response_queue.get()[2] == correlation_id, "Wrong response"
+        # end for
+    # end if
+    duration = perf_counter_ns() - start
+
+    request_queue.put(None)
+    process.join()
+    return duration
+# end def exchange_requests
+
+
+def main(count=DEFAULT_COUNT):
+    """
+    Run the benchmark and print the results.
+
+    :param count: The number of notifications
+    :type count: ``int``
+    """
+    print(f'{count} notifications of {len(PAYLOAD)} bytes')
+    received, duration = receive_from_queue(count)
+    print(f'event queue: {received:7d} received in {duration / 1e6:8.1f} ms, {duration / received:7.0f} ns/event')
+    received, doorbells, duration = receive_from_ring(count)
+    print(f'event ring : {received:7d} received in {duration / 1e6:8.1f} ms, {duration / received:7.0f} ns/event, '
+          f'{doorbells} doorbells')
+
+    print(f'{REQUEST_COUNT} requests')
+    for name, pipelined in (('sequential', False), ('pipelined', True)):
+        duration = exchange_requests(REQUEST_COUNT, pipelined)
+        print(f'{name:10s} : {duration / 1e6:8.1f} ms, {duration / REQUEST_COUNT / 1e3:7.1f} us/request')
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
+# end if
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
@@ -78,12 +78,39 @@ class BleAdvertisingParser:
         return ret[n - 1:] / n
     # end def moving_average
 
+    @staticmethod
+    def get_columnar_timestamps(data):
+        """
+        Merge the timestamps of the advertising data in a single array in time order, with the index of the data of
+        each timestamp. The timestamps of each data are expected to be sorted.
+
+        :param data: Advertising data timestamps
+        :type data: ``list``
+
+        :return: The merged timestamps (``int64`` for timestamps in nanoseconds) and their data indexes
+        :rtype: ``tuple[np.ndarray, np.ndarray]``
+        """
+        columns = [np.asarray(timestamps) for timestamps in data if len(timestamps) > 0]
+        if len(columns) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=int)
+        # end if
+        timestamps = np.concatenate(columns)
+        data_ids = np.repeat(np.arange(len(data)), [len(timestamps_of_data) for timestamps_of_data in data])
+        # The stable sort keeps the data order for equal timestamps
+        order = np.argsort(timestamps, kind='stable')
+        return timestamps[order], data_ids[order]
+    # end def get_columnar_timestamps
+
     @staticmethod
     def split_advertisement_data_in_batches(data, expected_series=None):
         """
         Split advertising data in batches representing received windows. the split is based on their data
         type and advertising interval. Expected series can be set to hint the parser on how to deal with the data
 
+        The timestamps are merged in a columnar array (see ``get_columnar_timestamps``): the runs of consecutive
+        timestamps of the same data and their intervals are found on the whole array, only the runs longer than a
+        window are split on their interval transitions.
+
         :param data: Advertising data to split
         :type data: ``list``
         :param expected_series: expected
@@ -96,8 +123,6 @@ class BleAdvertisingParser:
             list of discarded timestamps at the end of the batch
         :rtype: ``tuple``
         """
-        indexes = np.zeros(len(data), dtype=int)
-        indexes_limit = np.array([len(x) for x in data])
         batches_timestamps = []
         batches_intervals = []
         batches_data_id = []
@@ -106,325 +131,296 @@ class BleAdvertisingParser:
             expected_series = [series for series in BleAdvertisingSeries]
         # end if
         possible_transition = BleAdvertisingParser.get_possible_transition_in_series_set(expected_series)
-        last_timestamp_appended = None
-
-        def append_batch(_start, _stop, _current_data_id, _last_timestamp_appended):
-            """
-            Add a batch separated by data to the list. If the batch is sufficiently long it will be checked for
-             interval time transition
-            Internal helper function
-
-            :param _start: start index of the slice
-            :type _start: ``int``
-            :param _stop: stop index of the slice
-            :type _stop: ``int``
-            :param _last_timestamp_appended: timestamp of the last value added to the lists, used to calculate first
-                interval of a new batch - Optional
-            :type _last_timestamp_appended: ``int`` or ``None``
-            :param _current_data_id: current index of the data considered - Optional
-            :type _current_data_id: ``int`` or None
-
-            :return: last timestamp appended to the lists
-            :rtype: ``int``
-            """
-            data_slice = np.array(data[_current_data_id][_start:_stop])
-
-            last_timestamp = data_slice[-1]
-            while len(data_slice) > 0:
-                intervals_of_slice = np.ediff1d(data_slice)
-
-                if _last_timestamp_appended is not None:
-                    intervals = np.append([data_slice[0] - _last_timestamp_appended], intervals_of_slice)
-                else:
-                    intervals = intervals_of_slice
-                # end if
 
-                if last_timestamp - data_slice[0] < TIME_ASSUMED_ONE_WINDOW:
-                    batches_timestamps.append(data_slice)
+        timestamps, data_ids = BleAdvertisingParser.get_columnar_timestamps(data)
+        if len(timestamps) == 0:
+            return batches_timestamps, batches_intervals, batches_data_id, batches_discarded
+        # end if
+        all_intervals = np.diff(timestamps)
+        run_starts = np.concatenate(([0], np.flatnonzero(np.diff(data_ids)) + 1))
+        run_stops = np.append(run_starts[1:], len(timestamps))
+        is_one_window = timestamps[run_stops - 1] - timestamps[run_starts] < TIME_ASSUMED_ONE_WINDOW
+
+        for start, stop, one_window in zip(run_starts.tolist(), run_stops.tolist(), is_one_window.tolist()):
+            current_data_id = int(data_ids[start])
+            # The first interval of a run is from the last timestamp of the previous run
+            intervals = all_intervals[start - 1:stop - 1] if start > 0 else all_intervals[:stop - 1]
+            run_timestamps = timestamps[start:stop]
+            if one_window:
+                batches_timestamps.append(run_timestamps)
+                batches_intervals.append(intervals)
+                batches_data_id.append(current_data_id)
+                batches_discarded.append([])
+                continue
+            # end if
+
+            last_timestamp = run_timestamps[-1]
+            while len(run_timestamps) > 0:
+                if last_timestamp - run_timestamps[0] < TIME_ASSUMED_ONE_WINDOW:
+                    batches_timestamps.append(run_timestamps)
                     batches_intervals.append(intervals)
-                    batches_data_id.append(_current_data_id)
+                    batches_data_id.append(current_data_id)
                     batches_discarded.append([])
-                    return last_timestamp
+                    break
                 # end if
-                data_slice = split_batch(intervals, data_slice, _current_data_id)
 
-            # end while
-            return last_timestamp
-        # end def append_batch
-
-        def split_batch(intervals, timestamps, _current_data_id):
-            """
-            split a single batch in two based on the most likely initial transition happening in the interval times
-            Internal helper function
-
-            :param timestamps: list of timestamps to consider
-            :type timestamps: ``list[int]``
-            :param intervals: intervals to consider
-            :type intervals: ``np.ndarray``
-            :param _current_data_id: current index of the data considered
-            :type _current_data_id: ``int``
-
-            :return: data after the split
-            :rtype: ``list``
-            """
-            moving_averaged = BleAdvertisingParser.moving_average(intervals, N)
-            ax = None
-            splits = []
-            splits_crossing = []
-
-            if DEBUG_PLOTS:
-                fig, ax = BleAdvertisingPlotter.make_figure("split_batch Debug plot",
-                                                            shape=(len(possible_transition), 1))
-                moving_averaged_ms = moving_averaged / TIMESTAMP_UNIT_DIVIDER_MAP["ms"]
-                for i, transition in enumerate(possible_transition):
-                    intervals_number = BleAdvertisingPlotter.plot_advertising_intervals(
-                        intervals, axis=ax[i], title=f"possible transition {transition}")
-                    ax[i].step(intervals_number[N-1:], moving_averaged_ms)
-                # end for
-            # end if
-            for i_transition, transition in enumerate(possible_transition):
-                decoded = [t if t != BleAdvertisingInterval.HIGH_DUTY_CYCLE else HIGH_DUTY_CYCLE_VALUE_FOR_PARSING
-                           for t in transition]
-
-                initial = decoded[0] * TIMESTAMP_UNIT_DIVIDER_MAP['ms']
-                final = decoded[1] * TIMESTAMP_UNIT_DIVIDER_MAP['ms']
-                order_of_transition = initial < final
-                threshold_level = THRESHOLD_LEVEL if order_of_transition else 1 - THRESHOLD_LEVEL
-
-                # for some cases the threshold level need to be changed
-                if transition[0] == BleAdvertisingInterval.HIGH_DUTY_CYCLE:
-                    threshold_level = 0.50
-                elif transition[1] == BleAdvertisingInterval.HIGH_DUTY_CYCLE:
-                    threshold_level = 0.75
+                split = BleAdvertisingParser._get_batch_split(intervals, possible_transition)
+                if split is None:
+                    batches_timestamps.append(run_timestamps)
+                    batches_intervals.append(intervals)
+                    batches_data_id.append(current_data_id)
+                    batches_discarded.append(np.array([]))
+                    break
                 # end if
 
-                threshold = (abs(final-initial) * threshold_level) + min(initial, final)
-
-                averaged_threshold = np.array(moving_averaged > threshold)
-                threshold_crossings = np.diff(averaged_threshold)
-                threshold_crossing_indexes = np.argwhere(threshold_crossings)[:, 0]
-
-                while len(threshold_crossing_indexes) > 0:
-                    analyzed_crossing = threshold_crossing_indexes[0]
-                    # is crossing in the right direction
-                    if averaged_threshold[analyzed_crossing] == order_of_transition:
-                        # wrong direction, discard crossing
-                        threshold_crossing_indexes = np.delete(threshold_crossing_indexes, 0)
-                        continue
-                    # end if
-                    # Test whether crossing is long enough
-                    stability_zone = averaged_threshold[analyzed_crossing+1:
-                                                        analyzed_crossing+1+CROSSING_STABILITY_LENGTH]
-                    stability_count = np.count_nonzero(stability_zone == order_of_transition)
-                    number_after_crossing = len(moving_averaged) - 1 - analyzed_crossing
-                    if stability_count >= min(STABILITY_MAX_THRESHOLD, float(number_after_crossing)):
-                        break
-                    # end if
-                    threshold_crossing_indexes = np.delete(threshold_crossing_indexes, 0)
-                # end while
-
-                threshold_crossing_indexes_back_to_initial = threshold_crossing_indexes + N - 1
-
-                if DEBUG_PLOTS:
-                    ax[i_transition].axhline(threshold / TIMESTAMP_UNIT_DIVIDER_MAP["ms"], c='r')
+                low, high = split
+                batches_timestamps.append(run_timestamps[0:low + 2])
+                batches_intervals.append(intervals[0:low + 1])
+                batches_data_id.append(current_data_id)
+                batches_discarded.append(run_timestamps[low + 2:high + 1])
+                run_timestamps = run_timestamps[high + 1:]
+                # The first interval of the rest is still from the last timestamp of the previous run
+                if start > 0:
+                    intervals = np.diff(run_timestamps, prepend=timestamps[start - 1])
+                else:
+                    intervals = np.diff(run_timestamps)
                 # end if
+            # end while
+        # end for
+        return batches_timestamps, batches_intervals, batches_data_id, batches_discarded
+    # end def split_advertisement_data_in_batches
 
-                if len(threshold_crossing_indexes) == 0:
-                    # no crossing for this value
-                    continue
-                # end if
-                crossing_index = int(threshold_crossing_indexes_back_to_initial[0])
+    @staticmethod
+    def _get_threshold_crossing(moving_averaged, threshold, order_of_transition):
+        """
+        Get the first crossing of a threshold in the direction of a transition, followed by enough values on the
+        other side of the threshold
+
+        :param moving_averaged: The moving average of the intervals
+        :type moving_averaged: ``np.ndarray``
+        :param threshold: The threshold
+        :type threshold: ``float``
+        :param order_of_transition: Flag indicating the intervals increase with the transition
+        :type order_of_transition: ``bool``
+
+        :return: The index of the crossing in the moving average, ``None`` if not found
+        :rtype: ``int`` or ``None``
+        """
+        averaged_threshold = moving_averaged > threshold
+        crossing_indexes = np.flatnonzero(averaged_threshold[1:] != averaged_threshold[:-1])
+        # is crossing in the right direction
+        crossing_indexes = crossing_indexes[averaged_threshold[crossing_indexes] != order_of_transition]
+
+        # Test whether crossing is long enough: count the values on the expected side after each crossing
+        expected_side_count = np.concatenate(([0], np.cumsum(averaged_threshold == order_of_transition)))
+        stability_count = expected_side_count[np.minimum(crossing_indexes + 1 + CROSSING_STABILITY_LENGTH,
+                                                         len(averaged_threshold))] - \
+            expected_side_count[crossing_indexes + 1]
+        number_after_crossing = len(moving_averaged) - 1 - crossing_indexes
+        stable_crossing_indexes = crossing_indexes[
+            stability_count >= np.minimum(STABILITY_MAX_THRESHOLD, number_after_crossing)]
+        return int(stable_crossing_indexes[0]) if len(stable_crossing_indexes) > 0 else None
+    # end def _get_threshold_crossing
 
-                if DEBUG_PLOTS:
-                    ax[i_transition].axvline(crossing_index, c='r')
-                # end if
+    @staticmethod
+    def _count_leading(values, value):
+        """
+        Count the values equal to a value at the start of an array
 
-                start_interest = max(crossing_index - SIZE_ZONE_OF_INTEREST_LEFT, 0)
-                zone_of_interest = intervals[start_interest:crossing_index+SIZE_ZONE_OF_INTEREST_RIGHT]
-
-                divided_initial = zone_of_interest / initial
-                divided_final = zone_of_interest / final
-                round_initial = np.round(divided_initial)
-                round_final = np.round(divided_final)
-                closeness_initial = np.abs(divided_initial - round_initial)
-                closeness_final = np.abs(divided_final - round_final)
-
-                closer_initial = closeness_initial < closeness_final
-                delta_closeness = np.abs(closeness_initial-closeness_final)
-                too_close_closeness = delta_closeness < 0.2
-
-                too_far = np.logical_and(closer_initial > 0.5, closeness_final > 0.5)
-                # a value much bellow both expected at transition is an outlier generated
-                # by the firmware that we can't deal with
-                too_low = np.logical_and(round_initial == 0, round_final == 0)
-                # if above the value of both at transition can lead to wrong classification
-                too_big = np.logical_and(round_initial >= 2, round_final >= 2)
-                ambiguous = np.logical_or(too_close_closeness,
-                                          np.logical_or(too_far, np.logical_or(too_low, too_big)))
-
-                # for each value that are continuously in the rough size of the biggest value at the start
-                continuous_sure_end = 0
-                continuous_sure_start = 0
-                if order_of_transition:
-                    threshold = round(final/initial)
-                    override_thresholded = np.array(divided_initial < threshold)
-                    for val in override_thresholded:
-                        if not val:
-                            continuous_sure_start += 1
-                        else:
-                            break
-                        # end if
-                    # end for
-
-                    for val in reversed(override_thresholded):
-                        if val:
-                            continuous_sure_end += 1
-                        else:
-                            break
-                        # end if
-                    # end for
-                else:
-                    threshold = round(initial/final)
-                    override_thesholded = np.array(divided_final > threshold)
-                    for val in override_thesholded:
-                        if val:
-                            continuous_sure_start += 1
-                        else:
-                            break
-                        # end if
-                    # end for
-                    for val in reversed(override_thesholded):
-                        if not val:
-                            continuous_sure_end += 1
-                        else:
-                            break
-                        # end if
-                    # end for
-                # end if
-                mask_override = np.pad(np.repeat(True, len(zone_of_interest) - continuous_sure_end),
-                                       (0, continuous_sure_end), constant_values=False)
-                closer_initial_override_masked_end = np.logical_and(closer_initial, mask_override)
+        :param values: The array
+        :type values: ``np.ndarray``
+        :param value: The value
+        :type value: ``bool``
 
-                mask_override = np.pad(np.repeat(True, continuous_sure_start),
-                                       (0, len(zone_of_interest) - continuous_sure_start), constant_values=False)
+        :return: The number of leading values
+        :rtype: ``int``
+        """
+        different = values != value
+        return int(np.argmax(different)) if different.any() else len(values)
+    # end def _count_leading
 
-                closer_initial_override_masked = np.logical_or(closer_initial_override_masked_end, mask_override)
+    @staticmethod
+    def _get_batch_split(intervals, possible_transition):
+        """
+        Find where to split a batch in two based on the most likely initial transition happening in the interval times
 
-                closer_initial_masked = np.logical_xor(closer_initial_override_masked, ambiguous)
+        :param intervals: intervals to consider
+        :type intervals: ``np.ndarray``
+        :param possible_transition: The possible interval transitions
+        :type possible_transition: ``set[tuple[BleAdvertisingInterval, BleAdvertisingInterval]]``
+
+        :return: The index of the last interval of the first batch minus one, and the index of the last discarded
+                 timestamp, ``None`` if no transition is found
+        :rtype: ``tuple[int, int]`` or ``None``
+        """
+        moving_averaged = BleAdvertisingParser.moving_average(intervals, N)
+        ax = None
+        splits = []
+        splits_crossing = []
+
+        if DEBUG_PLOTS:
+            fig, ax = BleAdvertisingPlotter.make_figure("split_batch Debug plot",
+                                                        shape=(len(possible_transition), 1))
+            moving_averaged_ms = moving_averaged / TIMESTAMP_UNIT_DIVIDER_MAP["ms"]
+            for i, transition in enumerate(possible_transition):
+                intervals_number = BleAdvertisingPlotter.plot_advertising_intervals(
+                    intervals, axis=ax[i], title=f"possible transition {transition}")
+                ax[i].step(intervals_number[N-1:], moving_averaged_ms)
+            # end for
+        # end if
+        for i_transition, transition in enumerate(possible_transition):
+            decoded = [t if t != BleAdvertisingInterval.HIGH_DUTY_CYCLE else HIGH_DUTY_CYCLE_VALUE_FOR_PARSING
+                       for t in transition]
+
+            initial = decoded[0] * TIMESTAMP_UNIT_DIVIDER_MAP['ms']
+            final = decoded[1] * TIMESTAMP_UNIT_DIVIDER_MAP['ms']
+            order_of_transition = initial < final
+            threshold_level = THRESHOLD_LEVEL if order_of_transition else 1 - THRESHOLD_LEVEL
+
+            # for some cases the threshold level need to be changed
+            if transition[0] == BleAdvertisingInterval.HIGH_DUTY_CYCLE:
+                threshold_level = 0.50
+            elif transition[1] == BleAdvertisingInterval.HIGH_DUTY_CYCLE:
+                threshold_level = 0.75
+            # end if
 
-                index_crossing = np.argwhere(np.diff(closer_initial_masked))[:, 0]
-                index_where_closer = index_crossing[np.where(closer_initial_masked[index_crossing])]
-                index_where_further = index_crossing[
-                    np.where(np.logical_not(closer_initial_masked[index_crossing]))]
-                index_where_ambiguous = np.argwhere(np.diff(ambiguous))[:, 0]
+            threshold = (abs(final-initial) * threshold_level) + min(initial, final)
 
-                # protect index errors when never ambiguous
-                if len(index_where_ambiguous) > 0:
-                    last_before_ambiguous = index_where_ambiguous[0] - 1
-                    last_ambiguous = index_where_ambiguous[-1] + 1
-                else:
-                    last_before_ambiguous = math.inf
-                    last_ambiguous = -math.inf
-                # end if
-                # if it is true closer at start of the window
-                if len(index_where_closer) == 0 or len(index_crossing) == 0:
-                    low = 0
-                elif index_crossing[0] == index_where_closer[0]:
-                    low = min(int(index_where_closer[0]), last_before_ambiguous)
-                else:
-                    low = 0
-                # end if
-                if len(index_where_closer) > 0:
-                    last_closer_plus_1 = index_where_closer[-1] + 1
-                else:
-                    last_closer_plus_1 = -math.inf
-                # end if
-                if len(index_where_further) == 0 or len(index_crossing) == 0:
-                    high = max(low + 1, last_closer_plus_1, last_ambiguous)
-                elif index_crossing[-1] == index_where_further[-1]:
-                    high = SIZE_ZONE_OF_INTEREST_LEFT+SIZE_ZONE_OF_INTEREST_RIGHT
-                else:
-                    high = max(low + 1, last_closer_plus_1, last_ambiguous)
-                # end if
+            threshold_crossing_index = BleAdvertisingParser._get_threshold_crossing(
+                moving_averaged, threshold, order_of_transition)
 
-                if round_initial[low] > 3:
-                    low -= 1
-                # end if
+            if DEBUG_PLOTS:
+                ax[i_transition].axhline(threshold / TIMESTAMP_UNIT_DIVIDER_MAP["ms"], c='r')
+            # end if
 
-                split_at_low = start_interest + low
-                split_at_high = start_interest + high
-
-                if DEBUG_PLOTS:
-                    fig_zone, ax_zone = BleAdvertisingPlotter.make_figure(
-                        f"Zoom Zone of interest Debug Plot {transition} {crossing_index}", (6, 1), sharey="none")
-                    zone_numbers = BleAdvertisingPlotter.plot_advertising_intervals(zone_of_interest, ax_zone[0],
-                                                                                    "interest")
-                    ax_zone[1].set_title("closeness values")
-                    ax_zone[1].step(zone_numbers, closeness_initial, label="closeness_initial", where='mid')
-                    ax_zone[1].step(zone_numbers, closeness_final, label="closeness_final", where='mid')
-
-                    ax_zone[2].step(zone_numbers, closer_initial, where='mid', label="closer_initial")
-                    ax_zone[3].step(zone_numbers, too_close_closeness, where='mid', label="too_close_closeness")
-                    ax_zone[3].step(zone_numbers, too_far, where='mid', label="too_far")
-                    ax_zone[3].step(zone_numbers, too_low, where='mid', label="too_low")
-                    ax_zone[3].step(zone_numbers, too_big, where='mid', label="too_big")
-                    ax_zone[3].legend()
-                    ax_zone[4].step(zone_numbers, mask_override, where='mid', label="mask_override")
-                    ax_zone[5].step(zone_numbers, closer_initial_masked, where='mid', label="closer_initial_masked")
-
-                    ax_zone[0].axvline(low, c='g')
-                    ax_zone[0].axvline(high, c='r', linestyle="dotted")
-
-                    for a in ax_zone:
-                        a.legend()
-                    # end for
-                # end if
-                splits.append((split_at_low, split_at_high))
-                splits_crossing.append(crossing_index)
-                # end if
-            # end for
+            if threshold_crossing_index is None:
+                # no crossing for this value
+                continue
+            # end if
+            crossing_index = threshold_crossing_index + N - 1
 
-            if len(splits) == 0:
-                batches_timestamps.append(timestamps)
-                batches_intervals.append(intervals)
-                batches_data_id.append(_current_data_id)
-                batches_discarded.append(np.array([]))
-                return []
+            if DEBUG_PLOTS:
+                ax[i_transition].axvline(crossing_index, c='r')
+            # end if
+
+            start_interest = max(crossing_index - SIZE_ZONE_OF_INTEREST_LEFT, 0)
+            zone_of_interest = intervals[start_interest:crossing_index+SIZE_ZONE_OF_INTEREST_RIGHT]
+
+            divided_initial = zone_of_interest / initial
+            divided_final = zone_of_interest / final
+            round_initial = np.round(divided_initial)
+            round_final = np.round(divided_final)
+            closeness_initial = np.abs(divided_initial - round_initial)
+            closeness_final = np.abs(divided_final - round_final)
+
+            closer_initial = closeness_initial < closeness_final
+            delta_closeness = np.abs(closeness_initial-closeness_final)
+            too_close_closeness = delta_closeness < 0.2
+
+            too_far = np.logical_and(closer_initial > 0.5, closeness_final > 0.5)
+            # a value much bellow both expected at transition is an outlier generated
+            # by the firmware that we can't deal with
+            too_low = np.logical_and(round_initial == 0, round_final == 0)
+            # if above the value of both at transition can lead to wrong classification
+            too_big = np.logical_and(round_initial >= 2, round_final >= 2)
+            ambiguous = np.logical_or(too_close_closeness,
+                                      np.logical_or(too_far, np.logical_or(too_low, too_big)))
+
+            # for each value that are continuously in the rough size of the biggest value at the start (the mask is
+            # inverted for a decreasing transition, so that the sure values are the leading False and trailing True)
+            if order_of_transition:
+                override_thresholded = divided_initial < round(final/initial)
             else:
+                override_thresholded = divided_final <= round(initial/final)
+            # end if
+            continuous_sure_start = BleAdvertisingParser._count_leading(override_thresholded, False)
+            continuous_sure_end = BleAdvertisingParser._count_leading(override_thresholded[::-1], True)
+            zone_numbers = np.arange(len(zone_of_interest))
+            mask_override = zone_numbers < len(zone_of_interest) - continuous_sure_end
+            closer_initial_override_masked_end = np.logical_and(closer_initial, mask_override)
 
-                index_best_guess_split = np.argmin(splits_crossing)
+            mask_override = zone_numbers < continuous_sure_start
 
-                (low, high) = splits[index_best_guess_split]
-                batches_timestamps.append(timestamps[0:low + 2])
-                batches_intervals.append(intervals[0:low + 1])
-                batches_data_id.append(_current_data_id)
-                batches_discarded.append(timestamps[low+2:high+1])
-                start_next_slice = high + 1
-                # return the rest of the segment
-                return timestamps[start_next_slice:]
+            closer_initial_override_masked = np.logical_or(closer_initial_override_masked_end, mask_override)
+
+            closer_initial_masked = np.logical_xor(closer_initial_override_masked, ambiguous)
+
+            index_crossing = np.argwhere(np.diff(closer_initial_masked))[:, 0]
+            index_where_closer = index_crossing[np.where(closer_initial_masked[index_crossing])]
+            index_where_further = index_crossing[
+                np.where(np.logical_not(closer_initial_masked[index_crossing]))]
+            index_where_ambiguous = np.argwhere(np.diff(ambiguous))[:, 0]
+
+            # protect index errors when never ambiguous
+            if len(index_where_ambiguous) > 0:
+                last_before_ambiguous = index_where_ambiguous[0] - 1
+                last_ambiguous = index_where_ambiguous[-1] + 1
+            else:
+                last_before_ambiguous = math.inf
+                last_ambiguous = -math.inf
+            # end if
+            # if it is true closer at start of the window
+            if len(index_where_closer) == 0 or len(index_crossing) == 0:
+                low = 0
+            elif index_crossing[0] == index_where_closer[0]:
+                low = min(int(index_where_closer[0]), last_before_ambiguous)
+            else:
+                low = 0
+            # end if
+            if len(index_where_closer) > 0:
+                last_closer_plus_1 = index_where_closer[-1] + 1
+            else:
+                last_closer_plus_1 = -math.inf
+            # end if
+            if len(index_where_further) == 0 or len(index_crossing) == 0:
+                high = max(low + 1, last_closer_plus_1, last_ambiguous)
+            elif index_crossing[-1] == index_where_further[-1]:
+                high = SIZE_ZONE_OF_INTEREST_LEFT+SIZE_ZONE_OF_INTEREST_RIGHT
+            else:
+                high = max(low + 1, last_closer_plus_1, last_ambiguous)
             # end if
-        # end def split_batch
 
-        if len(data) > 1:
-            while np.any(indexes < indexes_limit):
-                current_timestamp_of_each_data = np.array([data[i][index] if index < indexes_limit[i] else math.inf
-                                                           for i, index in enumerate(indexes)])
-                current_data_id = np.argmin(current_timestamp_of_each_data)
-                next_timestamp = np.min(np.delete(current_timestamp_of_each_data, current_data_id))
+            if round_initial[low] > 3:
+                low -= 1
+            # end if
 
-                first_id_after_switch = np.searchsorted(data[current_data_id], next_timestamp)
-                current_index = indexes[current_data_id]
-                last_timestamp_appended = append_batch(current_index, first_id_after_switch, current_data_id,
-                                                       last_timestamp_appended)
+            split_at_low = start_interest + low
+            split_at_high = start_interest + high
 
-                indexes[current_data_id] = first_id_after_switch
-            # end while
-        else:
-            # append whole as a batch, surely to split
-            append_batch(0, len(data[0]), 0, last_timestamp_appended)
+            if DEBUG_PLOTS:
+                fig_zone, ax_zone = BleAdvertisingPlotter.make_figure(
+                    f"Zoom Zone of interest Debug Plot {transition} {crossing_index}", (6, 1), sharey="none")
+                zone_numbers = BleAdvertisingPlotter.plot_advertising_intervals(zone_of_interest, ax_zone[0],
+                                                                                "interest")
+                ax_zone[1].set_title("closeness values")
+                ax_zone[1].step(zone_numbers, closeness_initial, label="closeness_initial", where='mid')
+                ax_zone[1].step(zone_numbers, closeness_final, label="closeness_final", where='mid')
+
+                ax_zone[2].step(zone_numbers, closer_initial, where='mid', label="closer_initial")
+                ax_zone[3].step(zone_numbers, too_close_closeness, where='mid', label="too_close_closeness")
+                ax_zone[3].step(zone_numbers, too_far, where='mid', label="too_far")
+                ax_zone[3].step(zone_numbers, too_low, where='mid', label="too_low")
+                ax_zone[3].step(zone_numbers, too_big, where='mid', label="too_big")
+                ax_zone[3].legend()
+                ax_zone[4].step(zone_numbers, mask_override, where='mid', label="mask_override")
+                ax_zone[5].step(zone_numbers, closer_initial_masked, where='mid', label="closer_initial_masked")
+
+                ax_zone[0].axvline(low, c='g')
+                ax_zone[0].axvline(high, c='r', linestyle="dotted")
+
+                for a in ax_zone:
+                    a.legend()
+                # end for
+            # end if
+            splits.append((split_at_low, split_at_high))
+            splits_crossing.append(crossing_index)
+        # end for
+
+        if len(splits) == 0:
+            return None
         # end if
-        return batches_timestamps, batches_intervals, batches_data_id, batches_discarded
-    # end def split_advertisement_data_in_batches
+        return splits[int(np.argmin(splits_crossing))]
+    # end def _get_batch_split
 
     @staticmethod
     def get_possible_transition_in_series_set(series):
@@ -614,10 +610,8 @@ class BleAdvertisingParser:
         :return:  the concatenated list
         :rtype: ``list``
         """
-        timestamps = np.array([])
-        for i, adv_data in enumerate(advertising_data_timestamps):
-            timestamps = np.append(timestamps, np.array([adv_data]))
-        # end for
+        timestamps = np.concatenate([np.array([])] + [np.asarray(adv_data, dtype=float).ravel()
+                                                      for adv_data in advertising_data_timestamps])
         timestamps.sort()
         return timestamps
     # end def concatenate_timestamps
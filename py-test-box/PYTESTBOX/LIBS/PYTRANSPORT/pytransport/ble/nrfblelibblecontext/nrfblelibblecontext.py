@@ -14,6 +14,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 import queue
 from _weakref import ref
+from collections import deque
 from copy import copy
 from ctypes import c_long
 from ctypes import py_object
@@ -285,6 +286,8 @@ class NrfBleLibBleContext(BleContext):
         self._nrf_ble_lib_process = NrfBleLibAsyncioProcess(com_port=self._serial_port, event_queue=self._event_queue)
         self._event_thread = None
         self._central_gatt_table = []
+        # Correlation ID of the last scan request, to get its response
+        self._scan_correlation_id = None
 
         self._pairing_event_queues = RLockedDict()
     # end def __init__
@@ -944,8 +947,14 @@ class NrfBleLibBleContext(BleContext):
             """
             running = True
             consecutive_exception_count = 0
+            # Events read from the event ring of the process, treated before the next event of the queue
+            ring_events = deque()
             while running:
-                event = event_queue.get()
+                event = ring_events.popleft() if ring_events else event_queue.get()
+                if event == (NrfBleLibProcessMessageType.EVENT_RING_EVENT, tuple()):
+                    ring_events.extend(nrf_ble_lib_process.get_event_ring_messages())
+                    continue
+                # end if
                 try:
                     # check callbacks and logging
                     match event:
@@ -1521,7 +1530,7 @@ class NrfBleLibBleContext(BleContext):
             message=f"Asynchronous scanning for devices...",
             trace_level=TraceLevel.DEBUG)
 
-        self._nrf_ble_lib_process.send_request(
+        self._scan_correlation_id = self._nrf_ble_lib_process.send_request(
             request_type=NrfBleLibProcessMessageType.SCAN_REQUEST,
             request_arguments=(scan_parameters, copy(self._scan_filters), scan_time))
         # explicit copy of scan filters to ensure the current state is sent to the process
@@ -1721,7 +1730,8 @@ class NrfBleLibBleContext(BleContext):
         try:
             response = self._nrf_ble_lib_process.get_response(
                 original_request_type=NrfBleLibProcessMessageType.SCAN_REQUEST,
-                timeout=timeout + SCAN_FINISH_EXTRA_TIME
+                timeout=timeout + SCAN_FINISH_EXTRA_TIME,
+                correlation_id=self._scan_correlation_id
             )
         except queue.Empty:
             raise TransportContextException(TransportContextException.Cause.DEVICE_NOT_FOUND)
@@ -58,7 +58,9 @@ class ReadOperation(Enum, metaclass=ContainsEnumMeta):
 class NrfBleLibProcessMessageType(IntEnum):
     """
     Requests, responses, and events types for and from the nrf-ble-lib process.
-    Format of a message: ``tuple[NrfBleLibProcessMessageType, tuple[arguments]]``.
+    Format of a message: ``tuple[NrfBleLibProcessMessageType, tuple[arguments]]``. The requests and responses also
+    carry the correlation ID of the request, to match a response with its request when several requests are pipelined:
+    ``tuple[NrfBleLibProcessMessageType, tuple[arguments], int]``.
 
     |
 
@@ -152,6 +154,9 @@ class NrfBleLibProcessMessageType(IntEnum):
       optionally a string
     * CRITICAL_ERROR_EVENT arguments are the same as ERROR_EVENT, this event just mean that the process is stopped by it
     * LOG_EVENT arguments: log level (see pylibrary.system.tracelogger.TraceLevel) and log message
+    * EVENT_RING_EVENT has no arguments: it signals that records are available in the event ring (see
+      ``NrfBleLibEventRing``), the notifications, indications and log events being written there instead of being put
+      in the event queue
     """
     # Requests
     STOP_REQUEST = 0
@@ -206,9 +211,24 @@ class NrfBleLibProcessMessageType(IntEnum):
     ERROR_EVENT = auto()
     CRITICAL_ERROR_EVENT = auto()
     LOG_EVENT = auto()
+    EVENT_RING_EVENT = auto()
 # end class NrfBleLibProcessMessageType
 
 
+class NrfBleLibEventRecordType(IntEnum, metaclass=ContainsEnumMeta):
+    """
+    Record types of the event ring (see ``NrfBleLibEventRing``).
+
+    A record is made of its type, a connection handle, a characteristic handle, a timestamp and a payload. For a log
+    record, the characteristic handle is the log level and the payload is the UTF-8 log message.
+    """
+    WRAP = 0
+    NOTIFICATION = auto()
+    INDICATION = auto()
+    LOG = auto()
+# end class NrfBleLibEventRecordType
+
+
 class ScanStartRequestArgsInd(IntEnum, metaclass=ContainsEnumMeta):
     """
     Argument indexes for ``NrfBleLibProcessMessageType.SCAN_REQUEST``.
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Python Test Harness
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+:package: pytransport.ble.nrfblelibblecontext.nrfblelibeventring
+:brief: Define the shared memory ring buffer carrying the high rate events of the nrf-ble-lib process.
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------------------------------------------------
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+from os import getpid
+from struct import Struct
+
+from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibEventRecordType
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Implementation
+# ----------------------------------------------------------------------------------------------------------------------
+class NrfBleLibEventRing:
+    """
+    Single producer, single consumer ring buffer in shared memory, written by the nrf-ble-lib process and read by the
+    event thread of the main process.
+
+    The notifications, indications and logs are written as compact binary records instead of being pickled through
+    the event queue. A record is a 16 bytes header (type, connection handle, characteristic handle, payload length and
+    timestamp) followed by its payload, aligned on 8 bytes. A record never wraps around the end of the buffer: the end
+    is skipped, with a ``NrfBleLibEventRecordType.WRAP`` record if there is room for its header.
+
+    The consumer is woken up by a doorbell: the producer asks for one only when the consumer has read all the previous
+    records (see ``take_doorbell``), so a burst of records costs a single message in the event queue. The head, tail
+    and doorbell flag are only accessed with the lock held, which orders the payload copies with their publication.
+    """
+    DEFAULT_CAPACITY = 1024 * 1024  # In bytes
+    # Head and tail as free running byte counters, then the doorbell flag
+    CONTROL = Struct('<QQB')
+    INDEXES = Struct('<QQ')
+    INDEX = Struct('<Q')
+    HEAD_OFFSET = 0
+    TAIL_OFFSET = INDEX.size
+    DOORBELL_OFFSET = INDEXES.size
+    CONTROL_SIZE = 64
+    # Type, connection handle, characteristic handle, payload length and timestamp
+    RECORD_HEADER = Struct('<BxHHHQ')
+    RECORD_ALIGNMENT = 8
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        :param capacity: The size of the record buffer in bytes, multiple of ``RECORD_ALIGNMENT`` - OPTIONAL
+        :type capacity: ``int``
+        """
+        assert capacity % self.RECORD_ALIGNMENT == 0, \
+            f"The capacity should be a multiple of {self.RECORD_ALIGNMENT}, {capacity} is not"
+        self.capacity = capacity
+        # A record cannot take more than a quarter of the buffer, nor have a length over 16 bits
+        self.max_payload_size = min(0xFFFF, capacity // 4 - self.RECORD_HEADER.size)
+        self._lock = Lock()
+        self._shared_memory = SharedMemory(create=True, size=self.CONTROL_SIZE + capacity)
+        # A forked process gets the ring as is, it must not destroy it
+        self._owner_pid = getpid()
+        self._buffer = self._shared_memory.buf
+        self.reset()
+    # end def __init__
+
+    def __getstate__(self):
+        """
+        Get the state to give to a spawned process: the shared memory is attached by name.
+
+        :return: The state
+        :rtype: ``dict``
+        """
+        return {'capacity': self.capacity, 'max_payload_size': self.max_payload_size, 'lock': self._lock,
+                'name': self._shared_memory.name}
+    # end def __getstate__
+
+    def __setstate__(self, state):
+        """
+        Attach to the shared memory of the ring.
+
+        :param state: The state given by ``__getstate__``
+        :type state: ``dict``
+        """
+        self.capacity = state['capacity']
+        self.max_payload_size = state['max_payload_size']
+        self._lock = state['lock']
+        self._shared_memory = SharedMemory(name=state['name'])
+        self._owner_pid = None
+        self._buffer = self._shared_memory.buf
+    # end def __setstate__
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory block.
+
+        :return: The name
+        :rtype: ``str``
+        """
+        return self._shared_memory.name
+    # end def name
+
+    def reset(self):
+        """
+        Empty the ring. It should only be called when the producer is not running.
+        """
+        with self._lock:
+            self.CONTROL.pack_into(self._buffer, 0, 0, 0, 0)
+        # end with
+    # end def reset
+
+    def close(self):
+        """
+        Release the shared memory. The process that created the ring also destroys it.
+        """
+        if self._buffer is None:
+            return
+        # end if
+        self._buffer.release()
+        self._buffer = None
+        self._shared_memory.close()
+        if self._owner_pid == getpid():
+            self._shared_memory.unlink()
+        # end if
+    # end def close
+
+    def write(self, record_type, connection_handle, characteristic_handle, payload, timestamp):
+        """
+        Write a record, producer side.
+
+        :param record_type: The record type
+        :type record_type: ``NrfBleLibEventRecordType`` or ``int``
+        :param connection_handle: The connection handle
+        :type connection_handle: ``int``
+        :param characteristic_handle: The characteristic handle, or the log level of a log record
+        :type characteristic_handle: ``int``
+        :param payload: The payload, at most ``max_payload_size`` bytes
+        :type payload: ``bytes`` or ``bytearray``
+        :param timestamp: The timestamp in nanoseconds
+        :type timestamp: ``int``
+
+        :return: Flag indicating if the record was written, ``False`` if the ring is full
+        :rtype: ``bool``
+
+        :raise ``ValueError``: If the payload is too long
+        """
+        payload_size = len(payload)
+        if payload_size > self.max_payload_size:
+            raise ValueError(f"Record payload of {payload_size} bytes, the maximum is {self.max_payload_size}")
+        # end if
+        record_size = -(-(self.RECORD_HEADER.size + payload_size) // self.RECORD_ALIGNMENT) * self.RECORD_ALIGNMENT
+
+        buffer = self._buffer
+        with self._lock:
+            head, tail = self.INDEXES.unpack_from(buffer, 0)
+        # end with
+
+        position = head % self.capacity
+        padding = self.capacity - position if self.capacity - position < record_size else 0
+        if head + padding + record_size - tail > self.capacity:
+            return False
+        # end if
+
+        if padding > 0:
+            if padding >= self.RECORD_HEADER.size:
+                self.RECORD_HEADER.pack_into(
+                    buffer, self.CONTROL_SIZE + position, NrfBleLibEventRecordType.WRAP, 0, 0, 0, 0)
+            # end if
+            position = 0
+        # end if
+
+        offset = self.CONTROL_SIZE + position
+        self.RECORD_HEADER.pack_into(
+            buffer, offset, record_type, connection_handle, characteristic_handle, payload_size, timestamp)
+        offset += self.RECORD_HEADER.size
+        buffer[offset:offset + payload_size] = payload
+
+        with self._lock:
+            self.INDEX.pack_into(buffer, self.HEAD_OFFSET, head + padding + record_size)
+        # end with
+        return True
+    # end def write
+
+    def take_doorbell(self):
+        """
+        Check if the consumer has to be woken up after a write, producer side. Only the first write after a read of
+        the consumer needs it, the next ones are read with it.
+
+        :return: Flag indicating if the consumer has to be woken up
+        :rtype: ``bool``
+        """
+        with self._lock:
+            if self._buffer[self.DOORBELL_OFFSET]:
+                return False
+            # end if
+            self._buffer[self.DOORBELL_OFFSET] = 1
+        # end with
+        return True
+    # end def take_doorbell
+
+    def read(self):
+        """
+        Read all the available records, consumer side.
+
+        :return: The records as ``(record_type, connection_handle, characteristic_handle, payload, timestamp)`` tuples
+        :rtype: ``list[tuple[int, int, int, bytes, int]]``
+        """
+        buffer = self._buffer
+        with self._lock:
+            # Records written from now on need a new doorbell, even if they are read by this call
+            buffer[self.DOORBELL_OFFSET] = 0
+            head, tail = self.INDEXES.unpack_from(buffer, 0)
+        # end with
+
+        records = []
+        header_size = self.RECORD_HEADER.size
+        unpack_header = self.RECORD_HEADER.unpack_from
+        while tail < head:
+            position = tail % self.capacity
+            end_size = self.capacity - position
+            if end_size < header_size:
+                tail += end_size
+                continue
+            # end if
+
+            offset = self.CONTROL_SIZE + position
+            record_type, connection_handle, characteristic_handle, payload_size, timestamp = unpack_header(
+                buffer, offset)
+            if record_type == NrfBleLibEventRecordType.WRAP:
+                tail += end_size
+                continue
+            # end if
+
+            offset += header_size
+            records.append((record_type, connection_handle, characteristic_handle,
+                            bytes(buffer[offset:offset + payload_size]), timestamp))
+            tail += -(-(header_size + payload_size) // self.RECORD_ALIGNMENT) * self.RECORD_ALIGNMENT
+        # end while
+
+        with self._lock:
+            self.INDEX.pack_into(buffer, self.TAIL_OFFSET, tail)
+        # end with
+        return records
+    # end def read
+# end class NrfBleLibEventRing
+
+# ----------------------------------------------------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------------------------------------------------
@@ -18,10 +18,12 @@ from asyncio import Lock
 from asyncio import TimeoutError as asyncio_TimeoutError
 from asyncio import get_event_loop
 from asyncio import new_event_loop
+from asyncio import sleep as asyncio_sleep
 from asyncio import set_event_loop
 from asyncio import wait
 from asyncio import wait_for
 from contextlib import suppress
+from itertools import count
 from os import SCHED_RR
 from os import getpid
 from os import sched_get_priority_max
@@ -29,6 +31,7 @@ from os import sched_param
 from os import sched_setscheduler
 from queue import Empty
 from sys import stdout
+from threading import Condition
 from time import time
 
 from aioprocessing import AioProcess
@@ -82,6 +85,7 @@ from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import ErrorId
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import GetConnectionSecurityParametersRequestArgsInd
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import IoCapability
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibConnectionCacheTupleIndex
+from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibEventRecordType
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibHciOpcode
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibProcessMessageType
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibProcessUtil
@@ -94,6 +98,7 @@ from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import SetIndication
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import SetNotificationStatusRequestArgsInd
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import UpdateConnectionParametersRequestArgsInd
 from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import WriteOperation
+from pytransport.ble.nrfblelibblecontext.nrfblelibeventring import NrfBleLibEventRing
 from pytransport.transportcontext import TransportContextException
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -736,6 +741,7 @@ class NrfBleLibAsyncioProcess:
     """
     BLOCKING_DEFAULT_TIMEOUT = 15  # In seconds
     PROCESS_CONSECUTIVE_ERROR_MAX_COUNT = 50  # TODO Find a better value or even remove the concept all together
+    EVENT_RING_FULL_POLL_INTERVAL = 0.001  # In seconds
 
     def __init__(self, com_port, request_queue=None, response_queue=None, event_queue=None):
         """
@@ -757,6 +763,17 @@ class NrfBleLibAsyncioProcess:
         self._request_queue = request_queue if request_queue is not None else AioQueue()
         self._response_queue = response_queue if response_queue is not None else AioQueue()
         self._event_queue = event_queue if event_queue is not None else AioQueue()
+        # Notifications, indications and logs are written in the ring, the event queue only carries a doorbell
+        # message when the event thread has to read it
+        self._event_ring = NrfBleLibEventRing()
+
+        # The requests are tagged with a correlation ID, that the process copies in their response. The responses
+        # received while waiting for another one are kept until their requester gets them.
+        self._correlation_ids = count(start=1)
+        self._pending_correlation_ids = set()
+        self._pending_responses = []
+        self._response_condition = Condition()
+        self._response_reader_active = False
 
         # TODO: why use spawn (see "Contexts and start methods" in
         #  https://docs.python.org/3.7/library/multiprocessing.html#multiprocessing.Process)
@@ -764,8 +781,18 @@ class NrfBleLibAsyncioProcess:
         self._nrf_ble_lib_process = None
     # end def __init__
 
+    def __del__(self):
+        """
+        Release the event ring.
+        """
+        event_ring = getattr(self, '_event_ring', None)
+        if event_ring is not None:
+            event_ring.close()
+        # end if
+    # end def __del__
+
     @classmethod
-    def _run_nrf_ble_lib_process(cls, com_port, request_queue, response_queue, event_queue):
+    def _run_nrf_ble_lib_process(cls, com_port, request_queue, response_queue, event_queue, event_ring):
         """
         Main method for the nrf-ble-lib process.
 
@@ -777,6 +804,8 @@ class NrfBleLibAsyncioProcess:
         :type response_queue: ``AioQueue``
         :param event_queue: The event queue to be able to receive the nrf-ble-lib event in the main process
         :type event_queue: ``AioQueue``
+        :param event_ring: The ring buffer for the notifications, indications and logs
+        :type event_ring: ``NrfBleLibEventRing``
         """
         if VERBOSE:
             stdout.write(f"Start nrf-ble-lib process, process PID = {getpid()}\n")
@@ -835,21 +864,78 @@ class NrfBleLibAsyncioProcess:
             # end try
         # end def _stop_scan
 
+        def write_event_record(record_type, connection_handle, characteristic_handle, payload, timestamp):
+            """
+            Write a record in the event ring, and ring the doorbell of the event thread if it is waiting for one
+
+            :param record_type: The record type
+            :type record_type: ``NrfBleLibEventRecordType``
+            :param connection_handle: The connection handle
+            :type connection_handle: ``int``
+            :param characteristic_handle: The characteristic handle, or the log level of a log record
+            :type characteristic_handle: ``int``
+            :param payload: The payload
+            :type payload: ``bytes``
+            :param timestamp: The timestamp in nanoseconds
+            :type timestamp: ``int``
+
+            :return: Flag indicating if the record was written, ``False`` if the ring is full or the payload too long
+            :rtype: ``bool``
+            """
+            if len(payload) > event_ring.max_payload_size or not event_ring.write(
+                    record_type, connection_handle, characteristic_handle, payload, timestamp):
+                return False
+            # end if
+            if event_ring.take_doorbell():
+                event_queue.put((NrfBleLibProcessMessageType.EVENT_RING_EVENT, tuple()))
+            # end if
+            return True
+        # end def write_event_record
+
         def log_trace(message, trace_level):
             """
-            Put a log message on the queue to be logged by the main process
+            Put a log message in the event ring (or on the queue if the ring is full) to be logged by the main process
             
             :param message: message of the log
             :type message: ``str``
             :param trace_level: level of logging
             :type trace_level: ``TraceLevel``
             """
-            event_arguments = (trace_level, message)
+            if not write_event_record(NrfBleLibEventRecordType.LOG, 0, trace_level, message.encode(), 0):
+                event_arguments = (trace_level, message)
 
-            event_queue.put(
-                (NrfBleLibProcessMessageType.LOG_EVENT, event_arguments))
+                event_queue.put(
+                    (NrfBleLibProcessMessageType.LOG_EVENT, event_arguments))
+            # end if
         # end def log_trace
 
+        async def _put_notification_indication_event(message_type, record_type, event):
+            """
+            Write a notification or indication in the event ring, waiting for the event thread if the ring is full.
+            A payload too long for the ring is put on the event queue.
+
+            :param message_type: The message type, to use on the event queue
+            :type message_type: ``NrfBleLibProcessMessageType``
+            :param record_type: The record type, to use in the event ring
+            :type record_type: ``NrfBleLibEventRecordType``
+            :param event: The dictionary representing the event
+            :type event: ``dict``
+            """
+            event_data = event["event_data"]
+            value = bytes(event_data["value"])
+            if len(value) > event_ring.max_payload_size:
+                await event_queue.coro_put(
+                    (message_type,
+                     (event_data["connection_handle"], event_data["value_handle"], event_data["value"],
+                      event["timestamp"])))
+                return
+            # end if
+            while not write_event_record(record_type, event_data["connection_handle"], event_data["value_handle"],
+                                         value, event["timestamp"]):
+                await asyncio_sleep(cls.EVENT_RING_FULL_POLL_INTERVAL)
+            # end while
+        # end def _put_notification_indication_event
+
         def _get_connection_in_cache_from_args(args_tuple, connection_handle_index):
             """
             Get the (connection_handle, address, connection) tuple in cache
@@ -1005,12 +1091,14 @@ class NrfBleLibAsyncioProcess:
             # end if
         # end def _treat_advertising_event
 
-        async def _async_scan_timout_task(scan_timeout):
+        async def _async_scan_timout_task(scan_timeout, correlation_id):
             """
             Asyncio method for the scan timeout, it can also be stopped using the event ``scanning``.
 
             :param scan_timeout: The scan timeout in seconds
             :type scan_timeout: ``int`` or ``float``
+            :param correlation_id: The correlation ID of the scan request
+            :type correlation_id: ``int``
             """
             # noinspection PyBroadException
             try:
@@ -1025,7 +1113,8 @@ class NrfBleLibAsyncioProcess:
                 if VERBOSE:
                     stdout.write(f"Scan timeout Task finished after {time() - start_time}s\n")
                 # end if
-                await response_queue.coro_put((NrfBleLibProcessMessageType.SCAN_RESPONSE, (devices_scanned,)))
+                await response_queue.coro_put(
+                    (NrfBleLibProcessMessageType.SCAN_RESPONSE, (devices_scanned,), correlation_id))
             except CancelledError:
                 if VERBOSE:
                     stdout.write("Scan timeout Task canceled\n")
@@ -1042,7 +1131,7 @@ class NrfBleLibAsyncioProcess:
                     error_event_arguments += (error_message,)
                 # end if
                 await response_queue.coro_put(
-                    (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments))
+                    (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments, correlation_id))
             except Exception as other_exception:
                 if VERBOSE_ERROR:
                     stdout.write("Scan timeout Task raised an exception: "
@@ -1054,7 +1143,7 @@ class NrfBleLibAsyncioProcess:
                     error_event_arguments += (error_message,)
                 # end if
                 await response_queue.coro_put(
-                    (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments))
+                    (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments, correlation_id))
             # end try
         # end def _async_scan_timout_task
 
@@ -1083,18 +1172,16 @@ class NrfBleLibAsyncioProcess:
                             if VERBOSE:
                                 stdout.write(f"gatt_notification received {event}\n")
                             # end if
-                            await event_queue.coro_put(
-                                (NrfBleLibProcessMessageType.NOTIFICATION_EVENT,
-                                 (event["event_data"]["connection_handle"], event["event_data"]["value_handle"],
-                                  event["event_data"]["value"], event["timestamp"])))
+                            await _put_notification_indication_event(
+                                message_type=NrfBleLibProcessMessageType.NOTIFICATION_EVENT,
+                                record_type=NrfBleLibEventRecordType.NOTIFICATION, event=event)
                         elif event["type"] == "gatt_indication":
                             if VERBOSE:
                                 stdout.write(f"gatt_indication received {event}\n")
                             # end if
-                            await event_queue.coro_put(
-                                (NrfBleLibProcessMessageType.INDICATION_EVENT,
-                                 (event["event_data"]["connection_handle"], event["event_data"]["value_handle"],
-                                  event["event_data"]["value"], event["timestamp"])))
+                            await _put_notification_indication_event(
+                                message_type=NrfBleLibProcessMessageType.INDICATION_EVENT,
+                                record_type=NrfBleLibEventRecordType.INDICATION, event=event)
                         elif event["type"] == "hci_disconnection_complete":
                             if VERBOSE:
                                 stdout.write(f"hci_disconnection_complete received {event}, remove from connection "
@@ -1186,7 +1273,7 @@ class NrfBleLibAsyncioProcess:
                             # end if
                             await event_queue.coro_put(
                                 (NrfBleLibProcessMessageType.CRITICAL_ERROR_EVENT, error_event_arguments))
-                            await request_queue.coro_put((NrfBleLibProcessMessageType.STOP_REQUEST, tuple()))
+                            await request_queue.coro_put((NrfBleLibProcessMessageType.STOP_REQUEST, tuple(), None))
                             return
                         else:
                             if VERBOSE_ERROR:
@@ -1270,7 +1357,7 @@ class NrfBleLibAsyncioProcess:
                 scanning_timeout_task = None
                 run = True
                 while run:
-                    request, args = await request_queue.coro_get()
+                    request, args, correlation_id = await request_queue.coro_get()
                     try:
                         if request == NrfBleLibProcessMessageType.STOP_REQUEST:
                             if VERBOSE:
@@ -1278,7 +1365,7 @@ class NrfBleLibAsyncioProcess:
                             # end if
                             run = False
                             await _clean_stop()
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple()))
+                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple(), correlation_id))
                             continue
                         elif request == NrfBleLibProcessMessageType.SCAN_REQUEST:
                             scan_parameters = args[ScanStartRequestArgsInd.SCAN_PARAMETERS]
@@ -1294,7 +1381,7 @@ class NrfBleLibAsyncioProcess:
                                     TransportContextException.Cause.CONTEXT_INTERNAL_ERROR, "Advertising did not start")
                             # end if
                             scanning_timeout_task = asyncio_loop.create_task(_async_scan_timout_task(
-                                scan_timeout=scan_timeout))
+                                scan_timeout=scan_timeout, correlation_id=correlation_id))
                             # Response is sent in the timeout task, this permit to unlock the request task and
                             # stop scanning by request if wanted
                         elif request == NrfBleLibProcessMessageType.SCAN_STOP_REQUEST:
@@ -1310,7 +1397,7 @@ class NrfBleLibAsyncioProcess:
                                 # end if
                                 scanning_timeout_task = None
                             # end if
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple()))
+                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple(), correlation_id))
                         elif request == NrfBleLibProcessMessageType.CONNECT_REQUEST:
                             address = args[ConnectRequestArgsInd.DEVICE_ADDRESS]
                             if len(args) > ConnectRequestArgsInd.CONNECTION_PARAMETERS:
@@ -1322,7 +1409,8 @@ class NrfBleLibAsyncioProcess:
                             # end if
                             connection_handle = await connection.handle()
                             connection_cache[connection_handle] = (address, connection)
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (address, connection_handle)))
+                            await response_queue.coro_put(
+                                (REQUEST_TO_RESPONSE[request], (address, connection_handle), correlation_id))
                         elif request == NrfBleLibProcessMessageType.DISCONNECT_REQUEST:
                             try:
                                 _, address, connection = \
@@ -1331,7 +1419,8 @@ class NrfBleLibAsyncioProcess:
                                         connection_handle_index=DisconnectRequestArgsInd.CONNECTION_HANDLE)
                             except TransportContextException as exp:
                                 if exp.get_cause() == TransportContextException.Cause.DEVICE_NOT_CONNECTED:
-                                    await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (None,)))
+                                    await response_queue.coro_put(
+                                        (REQUEST_TO_RESPONSE[request], (None,), correlation_id))
                                 else:
                                     raise
                                 # end if
@@ -1345,7 +1434,8 @@ class NrfBleLibAsyncioProcess:
                                         # end if
                                     # end try
                                 # end if
-                                await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (address,)))
+                                await response_queue.coro_put(
+                                    (REQUEST_TO_RESPONSE[request], (address,), correlation_id))
                             # end try
                         elif request == NrfBleLibProcessMessageType.PERFORM_SERVICE_DISCOVERY_REQUEST:
                             _, _, connection = _get_connection_in_cache_from_args(
@@ -1376,7 +1466,7 @@ class NrfBleLibAsyncioProcess:
                                 # end for
                             # end for
 
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (gatt_table,)))
+                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (gatt_table,), correlation_id))
                         elif request == NrfBleLibProcessMessageType.PAIR_REQUEST:
                             _, _, connection = _get_connection_in_cache_from_args(
                                 args_tuple=args, connection_handle_index=PairRequestArgsInd.CONNECTION_HANDLE)
@@ -1391,12 +1481,12 @@ class NrfBleLibAsyncioProcess:
                                 args[PairRequestArgsInd.AUTHENTICATION_REQUIREMENTS])
 
                             if args[PairRequestArgsInd.ASYNC]:
-                                await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple()))
+                                await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple(), correlation_id))
                                 await connection.pair()
                                 await event_queue.coro_put((NrfBleLibProcessMessageType.PAIRED_EVENT, tuple()))
                             else:
                                 await connection.pair()
-                                await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple()))
+                                await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple(), correlation_id))
                             # end if
                         elif request == NrfBleLibProcessMessageType.DELETE_BOND_REQUEST:
                             address = args[DeleteBondRequestArgsInd.DEVICE_ADDRESS]
@@ -1405,7 +1495,7 @@ class NrfBleLibAsyncioProcess:
                             # TODO add error management if device bonding already deleted
                             device_db.remove_entry_for_address(address["address"], address["address_type"])
 
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple()))
+                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple(), correlation_id))
                         elif request == NrfBleLibProcessMessageType.UPDATE_CONNECTION_PARAMETERS_REQUEST:
                             _, _, connection = _get_connection_in_cache_from_args(
                                 args_tuple=args,
@@ -1413,7 +1503,7 @@ class NrfBleLibAsyncioProcess:
 
                             await connection.update_connection_parameters(
                                 args[UpdateConnectionParametersRequestArgsInd.CONNECTION_PARAMETERS])
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple()))
+                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple(), correlation_id))
                         elif request == NrfBleLibProcessMessageType.GET_CONNECTION_SECURITY_PARAMETERS_REQUEST:
                             connection_handle, _, connection = _get_connection_in_cache_from_args(
                                 args_tuple=args,
@@ -1421,7 +1511,8 @@ class NrfBleLibAsyncioProcess:
 
                             security_parameters = connection.security_parameters()
                             await response_queue.coro_put(
-                                (REQUEST_TO_RESPONSE[request], (connection_handle, security_parameters)))
+                                (REQUEST_TO_RESPONSE[request], (connection_handle, security_parameters),
+                                 correlation_id))
                         elif request == NrfBleLibProcessMessageType.CHARACTERISTIC_WRITE_REQUEST:
                             connection_handle, _, connection = _get_connection_in_cache_from_args(
                                 args_tuple=args,
@@ -1440,7 +1531,8 @@ class NrfBleLibAsyncioProcess:
                             await response_queue.coro_put(
                                 (REQUEST_TO_RESPONSE[request],
                                  (connection_handle, characteristic, args[
-                                     CharacteristicWriteRequestArgsInd.CHARACTERISTIC_WRITE_OPERATION], data_to_write)))
+                                     CharacteristicWriteRequestArgsInd.CHARACTERISTIC_WRITE_OPERATION], data_to_write),
+                                 correlation_id))
                         elif request == NrfBleLibProcessMessageType.UPDATE_GATT_TABLE_REQUEST:
                             gatt_db_setup = NrfBleLibStructureTranslator.get_driver_gatt_db_setup(
                                 interface_gatt_table=args[
@@ -1449,7 +1541,7 @@ class NrfBleLibAsyncioProcess:
                             gatt_db = ble_adapter.gatt_db()
                             gatt_db.apply_db_setup(gatt_db_setup)
 
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple()))
+                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], tuple(), correlation_id))
                         elif request == NrfBleLibProcessMessageType.CHARACTERISTIC_READ_REQUEST:
                             connection_handle, _, connection = _get_connection_in_cache_from_args(
                                 args_tuple=args,
@@ -1467,7 +1559,8 @@ class NrfBleLibAsyncioProcess:
 
                             await response_queue.coro_put(
                                 (REQUEST_TO_RESPONSE[request], (connection_handle, characteristic, args[
-                                     CharacteristicWriteRequestArgsInd.CHARACTERISTIC_WRITE_OPERATION], value)))
+                                     CharacteristicWriteRequestArgsInd.CHARACTERISTIC_WRITE_OPERATION], value),
+                                 correlation_id))
                         elif request == NrfBleLibProcessMessageType.DESCRIPTOR_READ_REQUEST:
                             connection_handle, _, connection = _get_connection_in_cache_from_args(
                                 args_tuple=args,
@@ -1485,7 +1578,8 @@ class NrfBleLibAsyncioProcess:
 
                             await response_queue.coro_put(
                                 (REQUEST_TO_RESPONSE[request], (connection_handle, descriptor, args[
-                                     CharacteristicWriteRequestArgsInd.CHARACTERISTIC_WRITE_OPERATION], value)))
+                                     CharacteristicWriteRequestArgsInd.CHARACTERISTIC_WRITE_OPERATION], value),
+                                 correlation_id))
                         elif request == NrfBleLibProcessMessageType.SET_NOTIFICATION_STATUS_REQUEST:
                             connection_handle, address, connection = _get_connection_in_cache_from_args(
                                     args_tuple=args,
@@ -1502,7 +1596,8 @@ class NrfBleLibAsyncioProcess:
                             # end if
 
                             await response_queue.coro_put(
-                                (REQUEST_TO_RESPONSE[request], (connection_handle, characteristic, status)))
+                                (REQUEST_TO_RESPONSE[request], (connection_handle, characteristic, status),
+                                 correlation_id))
                         elif request == NrfBleLibProcessMessageType.SET_INDICATION_STATUS_REQUEST:
                             connection_handle, address, connection = _get_connection_in_cache_from_args(
                                     args_tuple=args,
@@ -1518,10 +1613,11 @@ class NrfBleLibAsyncioProcess:
                             # end if
 
                             await response_queue.coro_put(
-                                (REQUEST_TO_RESPONSE[request], (connection_handle, characteristic, status)))
+                                (REQUEST_TO_RESPONSE[request], (connection_handle, characteristic, status),
+                                 correlation_id))
                         elif request == NrfBleLibProcessMessageType.GET_CENTRAL_ADDRESS_REQUEST:
                             address = ble_adapter.address()
-                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (address,)))
+                            await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (address,), correlation_id))
                         elif request == NrfBleLibProcessMessageType.SET_CONNECTION_PARAMETERS_RANGE_REQUEST:
                             connection_parameter_range = \
                                 NrfBleLibStructureTranslator.get_driver_connection_parameters_range(
@@ -1530,7 +1626,7 @@ class NrfBleLibAsyncioProcess:
                             await ble_adapter.set_accepted_connection_parameter_range_for_update_requests(
                                 connection_parameter_range)
                             await response_queue.coro_put((REQUEST_TO_RESPONSE[request], (
-                                args[SetConnectionParametersRangeRequestArgsInd.RANGE],)))
+                                args[SetConnectionParametersRangeRequestArgsInd.RANGE],), correlation_id))
                         # end if
 
                         # Reset the consecutive exception count because no exceptions arise for this request
@@ -1548,14 +1644,15 @@ class NrfBleLibAsyncioProcess:
                                              f"{TracebackLogWrapper.get_exception_stack()}\n")
                             # end if
                             await response_queue.coro_put(
-                                (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments))
+                                (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments, correlation_id))
                         else:
                             if VERBOSE_ERROR:
                                 stdout.write("Request Task Finished in a raise condition inside the run loop: "
                                              f"{TracebackLogWrapper.get_exception_stack()}\n")
                             # end if
                             await response_queue.coro_put(
-                                (NrfBleLibProcessMessageType.CRITICAL_ERROR_RESPONSE, error_event_arguments))
+                                (NrfBleLibProcessMessageType.CRITICAL_ERROR_RESPONSE, error_event_arguments,
+                                 correlation_id))
                             raise
                         # end if
                     except NrfblError as nrf_ble_lib_error:
@@ -1587,14 +1684,15 @@ class NrfBleLibAsyncioProcess:
                                              f"{TracebackLogWrapper.get_exception_stack()}\n")
                             # end if
                             await response_queue.coro_put(
-                                (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments))
+                                (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments, correlation_id))
                         else:
                             if VERBOSE_ERROR:
                                 stdout.write("Request Task Finished in a raise condition inside the run loop: "
                                              f"{TracebackLogWrapper.get_exception_stack()}\n")
                             # end if
                             await response_queue.coro_put(
-                                (NrfBleLibProcessMessageType.CRITICAL_ERROR_RESPONSE, error_event_arguments))
+                                (NrfBleLibProcessMessageType.CRITICAL_ERROR_RESPONSE, error_event_arguments,
+                                 correlation_id))
                             raise
                         # end if
                     except CancelledError:
@@ -1612,14 +1710,15 @@ class NrfBleLibAsyncioProcess:
                                              f"{TracebackLogWrapper.get_exception_stack()}\n")
                             # end if
                             await response_queue.coro_put(
-                                (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments))
+                                (NrfBleLibProcessMessageType.ERROR_RESPONSE, error_event_arguments, correlation_id))
                         else:
                             if VERBOSE_ERROR:
                                 stdout.write("Request Task Finished in a raise condition inside the run loop: "
                                              f"{TracebackLogWrapper.get_exception_stack()}\n")
                             # end if
                             await response_queue.coro_put(
-                                (NrfBleLibProcessMessageType.CRITICAL_ERROR_RESPONSE, error_event_arguments))
+                                (NrfBleLibProcessMessageType.CRITICAL_ERROR_RESPONSE, error_event_arguments,
+                                 correlation_id))
                             raise
                         # end if
                     # end try
@@ -1664,6 +1763,11 @@ class NrfBleLibAsyncioProcess:
                 # end try
             # end while
         # end for
+        self._event_ring.reset()
+        with self._response_condition:
+            self._pending_correlation_ids.clear()
+            self._pending_responses.clear()
+        # end with
     # end def _clear_process_queues
 
     def start_process(self):
@@ -1685,7 +1789,7 @@ class NrfBleLibAsyncioProcess:
 
         self._nrf_ble_lib_process = AioProcess(
             target=type(self)._run_nrf_ble_lib_process,
-            args=(self._com_port, self._request_queue, self._response_queue, self._event_queue))
+            args=(self._com_port, self._request_queue, self._response_queue, self._event_queue, self._event_ring))
         self._nrf_ble_lib_process.start()
         sched_setscheduler(self._nrf_ble_lib_process.pid, SCHED_RR, sched_param(sched_get_priority_max(SCHED_RR) - 1))
     # end def start_process
@@ -1730,6 +1834,66 @@ class NrfBleLibAsyncioProcess:
         # end if
     # end def is_process_alive
 
+    def _wait_for_response(self, is_expected, timeout):
+        """
+        Wait for a response. A single thread reads the response queue at a time: the responses it gets for the other
+        requesters are kept in the pending responses, and the other threads are notified.
+
+        :param is_expected: Function called on a response to check if it is the one waited for
+        :type is_expected: ``callable``
+        :param timeout: Timeout in seconds, starting on this method call
+        :type timeout: ``float``
+
+        :return: The response
+        :rtype: ``tuple``
+
+        :raise ``Empty``: If no response is found during the allowed time
+        """
+        end_time = time() + timeout
+        with self._response_condition:
+            while True:
+                for index, response in enumerate(self._pending_responses):
+                    if is_expected(response):
+                        del self._pending_responses[index]
+                        self._pending_correlation_ids.discard(self.get_message_correlation_id(message=response))
+                        return response
+                    # end if
+                # end for
+
+                remaining_time = end_time - time()
+                if remaining_time <= 0:
+                    raise Empty
+                # end if
+
+                if self._response_reader_active:
+                    self._response_condition.wait(timeout=remaining_time)
+                    continue
+                # end if
+
+                self._response_reader_active = True
+                self._response_condition.release()
+                try:
+                    response = self._response_queue.get(timeout=remaining_time)
+                except Empty:
+                    response = None
+                finally:
+                    self._response_condition.acquire()
+                    self._response_reader_active = False
+                # end try
+
+                if response is not None:
+                    if self.get_message_correlation_id(message=response) in self._pending_correlation_ids or \
+                            is_expected(response):
+                        self._pending_responses.append(response)
+                    elif VERBOSE:
+                        stdout.write(f"Unknown response received: {response}\n")
+                    # end if
+                # end if
+                self._response_condition.notify_all()
+            # end while
+        # end with
+    # end def _wait_for_response
+
     def send_request_wait_for_response(self, request_type, request_arguments=tuple(), timeout=BLOCKING_DEFAULT_TIMEOUT):
         """
         send a request to the process then wait for the response
@@ -1744,27 +1908,32 @@ class NrfBleLibAsyncioProcess:
         :return: the response
         :rtype: ``tuple``
         """
-        self._request_queue.put((request_type, request_arguments))
+        correlation_id = self.send_request(request_type=request_type, request_arguments=request_arguments)
+        return self.get_response(original_request_type=request_type, timeout=timeout, correlation_id=correlation_id)
+    # end def send_request_wait_for_response
 
-        response_type = REQUEST_TO_RESPONSE[request_type]
+    def send_requests_wait_for_responses(self, requests, timeout=BLOCKING_DEFAULT_TIMEOUT):
+        """
+        Send several requests to the process at once then wait for their responses. The process treats them in
+        order, without waiting for the main process between them.
 
-        star_time = time()
-        response = self._response_queue.get(timeout=timeout)
-        while self.get_message_type(message=response) != response_type and \
-                (self.get_message_type(message=response) not in ERROR_TYPES or
-                 self.get_message_type_associated_with_error(error=response) != request_type):
-            if VERBOSE:
-                stdout.write(f"Unknown response received while waiting for {response_type.name}: {response}\n")
-            # end if
-            new_timeout = timeout - (time() - star_time)
-            if new_timeout <= 0:
-                raise Empty
-            # end if
-            response = self._response_queue.get(timeout=new_timeout)
-        # end while
+        :param requests: The ``(request_type, request_arguments)`` of the requests
+        :type requests: ``list[tuple[NrfBleLibProcessMessageType, tuple]]``
+        :param timeout: timeout of all the requests in second, starting on this method call - Optional
+        :type timeout: ``float``
 
-        return response
-    # end def send_request_wait_for_response
+        :return: the responses, in the order of the requests
+        :rtype: ``list[tuple]``
+
+        :raise: ``Empty`` if the responses are not all found during allowed time
+        """
+        end_time = time() + timeout
+        correlation_ids = [self.send_request(request_type=request_type, request_arguments=request_arguments)
+                           for request_type, request_arguments in requests]
+        return [self.get_response(original_request_type=request_type, timeout=max(0, end_time - time()),
+                                  correlation_id=correlation_id)
+                for (request_type, _), correlation_id in zip(requests, correlation_ids)]
+    # end def send_requests_wait_for_responses
 
     def send_request(self, request_type, request_arguments=tuple()):
         """
@@ -1775,13 +1944,18 @@ class NrfBleLibAsyncioProcess:
         :param request_arguments: the arguments of the response - Optional
         :type request_arguments: ``tuple``
 
-        :return: The expected Response type
-        :rtype: ``NrfBleLibProcessMessageType``
+        :return: The correlation ID of the request, to give to ``get_response``
+        :rtype: ``int``
         """
-        self._request_queue.put((request_type, request_arguments))
+        correlation_id = next(self._correlation_ids)
+        with self._response_condition:
+            self._pending_correlation_ids.add(correlation_id)
+        # end with
+        self._request_queue.put((request_type, request_arguments, correlation_id))
+        return correlation_id
     # end def send_request
 
-    def get_response(self, original_request_type, timeout=BLOCKING_DEFAULT_TIMEOUT):
+    def get_response(self, original_request_type, timeout=BLOCKING_DEFAULT_TIMEOUT, correlation_id=None):
         """
         Return the corresponding response for a request previously sent
 
@@ -1789,30 +1963,39 @@ class NrfBleLibAsyncioProcess:
         :type original_request_type: ``NrfBleLibProcessMessageType``
         :param timeout: timeout to wait, starting on this method call
         :type timeout: ``float``
+        :param correlation_id: The correlation ID returned by ``send_request``, if ``None`` the first response to a
+                               request of this type is returned - OPTIONAL
+        :type correlation_id: ``int`` or ``None``
 
         :return: response obtained
         :rtype: ``tuple``
 
         :raise: ``Empty`` if no response found during allowed time
         """
+        if correlation_id is not None:
+            try:
+                return self._wait_for_response(
+                    is_expected=lambda response: self.get_message_correlation_id(message=response) == correlation_id,
+                    timeout=timeout)
+            except Empty:
+                # A late response is dropped instead of being kept for nobody
+                with self._response_condition:
+                    self._pending_correlation_ids.discard(correlation_id)
+                # end with
+                raise
+            # end try
+        # end if
 
         response_type = REQUEST_TO_RESPONSE[original_request_type]
-        response = self._response_queue.get(timeout=timeout)
-        star_time = time()
-        while self.get_message_type(message=response) != response_type and \
-                (self.get_message_type(message=response) not in ERROR_TYPES or
-                 self.get_message_type_associated_with_error(error=response) != original_request_type):
-            if VERBOSE:
-                stdout.write(f"Unknown response received while waiting for {response_type}: {response}\n")
-            # end if
-            new_timeout = timeout - (time() - star_time)
-            if new_timeout <= 0:
-                raise Empty
-            # end if
-            response = self._response_queue.get(timeout=new_timeout)
-        # end while
 
-        return response
+        def is_expected(response):
+            message_type = self.get_message_type(message=response)
+            return message_type == response_type or (
+                message_type in ERROR_TYPES and
+                self.get_message_type_associated_with_error(error=response) == original_request_type)
+        # end def is_expected
+
+        return self._wait_for_response(is_expected=is_expected, timeout=timeout)
     # end def get_response
 
     def wait_for_event(self, timeout):
@@ -1828,6 +2011,30 @@ class NrfBleLibAsyncioProcess:
         return self._event_queue.get(timeout=timeout)
     # end def wait_for_event
 
+    def get_event_ring_messages(self):
+        """
+        Read the events written in the event ring since the last read, to call when a
+        ``NrfBleLibProcessMessageType.EVENT_RING_EVENT`` is received.
+
+        :return: The events, as the message tuples of the event queue
+        :rtype: ``list[tuple]``
+        """
+        messages = []
+        for record_type, connection_handle, characteristic_handle, payload, timestamp in self._event_ring.read():
+            if record_type == NrfBleLibEventRecordType.NOTIFICATION:
+                messages.append((NrfBleLibProcessMessageType.NOTIFICATION_EVENT,
+                                 (connection_handle, characteristic_handle, payload, timestamp)))
+            elif record_type == NrfBleLibEventRecordType.INDICATION:
+                messages.append((NrfBleLibProcessMessageType.INDICATION_EVENT,
+                                 (connection_handle, characteristic_handle, payload, timestamp)))
+            elif record_type == NrfBleLibEventRecordType.LOG:
+                messages.append((NrfBleLibProcessMessageType.LOG_EVENT,
+                                 (TraceLevel(characteristic_handle), payload.decode(errors='replace'))))
+            # end if
+        # end for
+        return messages
+    # end def get_event_ring_messages
+
     @staticmethod
     def get_message_type(message):
         """
@@ -1858,6 +2065,20 @@ class NrfBleLibAsyncioProcess:
         return message[1]
     # end def get_message_arguments
 
+    @staticmethod
+    def get_message_correlation_id(message):
+        """
+        Get the correlation ID inside a response tuple
+
+        :param message: Response tuple
+        :type message: ``tuple``
+
+        :return: The correlation ID of the request, ``None`` if the request was not sent by ``send_request``
+        :rtype: ``int`` or ``None``
+        """
+        return message[2] if len(message) > 2 else None
+    # end def get_message_correlation_id
+
     @staticmethod
     def get_message_type_associated_with_error(error):
         """
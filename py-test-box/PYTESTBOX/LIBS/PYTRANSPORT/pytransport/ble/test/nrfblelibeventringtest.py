@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+:package: pytransport.ble.test.nrfblelibeventringtest
+:brief: Validates the shared memory ring buffer of the nrf-ble-lib process events
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------------------------------------------------
+from multiprocessing import Process
+from multiprocessing import Queue
+from unittest import TestCase
+
+from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibEventRecordType
+from pytransport.ble.nrfblelibblecontext.nrfblelibeventring import NrfBleLibEventRing
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------------------------------------------------
+def write_notifications(event_ring, doorbell_queue, count):
+    """
+    Write notifications in the ring from another process, ringing the doorbell as the nrf-ble-lib process does.
+
+    :param event_ring: The event ring
+    :type event_ring: ``NrfBleLibEventRing``
+    :param doorbell_queue: The queue receiving the doorbells, then ``None`` at the end
+    :type doorbell_queue: ``Queue``
+    :param count: The number of notifications
+    :type count: ``int``
+    """
+    for index in range(count):
+        while not event_ring.write(NrfBleLibEventRecordType.NOTIFICATION, 1, 0x10, index.to_bytes(4, 'little') * 3,
+                                   index):
+            pass
+        # end while
+        if event_ring.take_doorbell():
+            doorbell_queue.put(True)
+        # end if
+    # end for
+    doorbell_queue.put(None)
+    event_ring.close()
+# end def write_notifications
+
+
+class NrfBleLibEventRingTestCase(TestCase):
+    """
+    ``NrfBleLibEventRing`` test implementation.
+    """
+
+    def setUp(self):
+        """
+        Create a small ring.
+        """
+        super().setUp()
+        self.event_ring = NrfBleLibEventRing(capacity=256)
+    # end def setUp
+
+    def tearDown(self):
+        """
+        Destroy the ring.
+        """
+        self.event_ring.close()
+        super().tearDown()
+    # end def tearDown
+
+    def test_write_read(self):
+        """
+        Test the records are read in order, with their fields.
+        """
+        self.assertTrue(self.event_ring.write(NrfBleLibEventRecordType.NOTIFICATION, 1, 0x10, b'\x01\x02\x03', 42))
+        self.assertTrue(self.event_ring.write(NrfBleLibEventRecordType.LOG, 0, 4, b'message', 0))
+
+        self.assertEqual([(NrfBleLibEventRecordType.NOTIFICATION, 1, 0x10, b'\x01\x02\x03', 42),
+                          (NrfBleLibEventRecordType.LOG, 0, 4, b'message', 0)], self.event_ring.read(),
+                         "Wrong records")
+        self.assertEqual([], self.event_ring.read(), "The records should be read once")
+    # end def test_write_read
+
+    def test_wrap_around(self):
+        """
+        Test the records written across the end of the buffer many times are not corrupted.
+        """
+        for index in range(100):
+            payload = bytes([index]) * (index % 40)
+            self.assertTrue(self.event_ring.write(NrfBleLibEventRecordType.INDICATION, index, index, payload, index),
+                            "The ring should not be full")
+            self.assertEqual([(NrfBleLibEventRecordType.INDICATION, index, index, payload, index)],
+                             self.event_ring.read(), "Wrong record after wrap around")
+        # end for
+    # end def test_wrap_around
+
+    def test_full(self):
+        """
+        Test a full ring refuses the records until the consumer reads it, and a too long payload is rejected.
+        """
+        written = 0
+        while self.event_ring.write(NrfBleLibEventRecordType.NOTIFICATION, 1, 0x10, b'\x00' * 16, written):
+            written += 1
+        # end while
+
+        self.assertEqual(256 // 32, written, "Wrong number of records in a full ring")
+        self.assertEqual(list(range(written)), [record[-1] for record in self.event_ring.read()], "Wrong records")
+        self.assertTrue(self.event_ring.write(NrfBleLibEventRecordType.NOTIFICATION, 1, 0x10, b'', 0),
+                        "The ring should accept records once read")
+        with self.assertRaises(ValueError):
+            self.event_ring.write(NrfBleLibEventRecordType.NOTIFICATION, 1, 0x10,
+                                  b'\x00' * (self.event_ring.max_payload_size + 1), 0)
+        # end with
+    # end def test_full
+
+    def test_doorbell(self):
+        """
+        Test the doorbell is taken once per read of the consumer.
+        """
+        self.assertTrue(self.event_ring.take_doorbell(), "The first write should ring the doorbell")
+        self.assertFalse(self.event_ring.take_doorbell(), "The doorbell is already rung")
+        self.event_ring.read()
+        self.assertTrue(self.event_ring.take_doorbell(), "A write after a read should ring the doorbell")
+    # end def test_doorbell
+
+    def test_other_process(self):
+        """
+        Test the records written by another process, through a ring smaller than the records written.
+        """
+        count = 1000
+        doorbell_queue = Queue()
+        process = Process(target=write_notifications, args=(self.event_ring, doorbell_queue, count))
+        process.start()
+        records = []
+        doorbell = doorbell_queue.get(timeout=10)
+        while doorbell is not None:
+            records.extend(self.event_ring.read())
+            doorbell = doorbell_queue.get(timeout=10)
+        # end while
+        records.extend(self.event_ring.read())
+        process.join(timeout=10)
+
+        self.assertEqual([(NrfBleLibEventRecordType.NOTIFICATION, 1, 0x10, index.to_bytes(4, 'little') * 3, index)
+                          for index in range(count)], records, "Wrong records from the other process")
+    # end def test_other_process
+# end class NrfBleLibEventRingTestCase
+
+# ----------------------------------------------------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+:package: pytransport.ble.test.nrfblelibprocesstest
+:brief: Validates the matching of the nrf-ble-lib process responses with their requests, with a fake process
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------------------------------------------------
+from queue import Empty
+from queue import Queue
+from threading import Thread
+from unittest import TestCase
+
+from pytransport.ble.nrfblelibblecontext.nrfblelibconstants import NrfBleLibProcessMessageType
+from pytransport.ble.nrfblelibblecontext.nrfblelibprocess import NrfBleLibAsyncioProcess
+from pytransport.ble.nrfblelibblecontext.nrfblelibprocess import REQUEST_TO_RESPONSE
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------------------------------------------------
+# Timeout of the waits for the fake process [seconds]
+WAIT_TIMEOUT = 5
+# Timeout of the requests left without response [seconds]
+MISSING_RESPONSE_TIMEOUT = 0.2
+
+REQUESTS = [(NrfBleLibProcessMessageType.SCAN_REQUEST, (1,)),
+            (NrfBleLibProcessMessageType.SCAN_STOP_REQUEST, ()),
+            (NrfBleLibProcessMessageType.SCAN_REQUEST, (2,))]
+
+
+class NrfBleLibProcessResponseTestCase(TestCase):
+    """
+    ``NrfBleLibAsyncioProcess`` request and response matching test implementation. The nrf-ble-lib process is
+    replaced by a thread answering the requests of the request queue.
+    """
+
+    def setUp(self):
+        """
+        Create the process object on local queues, without starting the process.
+        """
+        super().setUp()
+        self.request_queue = Queue()
+        self.response_queue = Queue()
+        self.process = NrfBleLibAsyncioProcess(com_port=None, request_queue=self.request_queue,
+                                               response_queue=self.response_queue, event_queue=Queue())
+        self.addCleanup(self.process._event_ring.close)
+    # end def setUp
+
+    def answer(self, request_count, order=None, missing=()):
+        """
+        Start a thread answering requests as the process does, the response echoing the arguments of its request.
+
+        :param request_count: The number of requests to read before answering
+        :type request_count: ``int``
+        :param order: The order of the answers, by request index, ``None`` for the request order - OPTIONAL
+        :type order: ``list[int]`` or ``None``
+        :param missing: The indexes of the requests left without response - OPTIONAL
+        :type missing: ``tuple[int]``
+
+        :return: The thread, and the requests read by it
+        :rtype: ``tuple[Thread, list[tuple]]``
+        """
+        requests = []
+
+        def run():
+            """
+            Read the requests then answer them.
+            """
+            for _ in range(request_count):
+                requests.append(self.request_queue.get(timeout=WAIT_TIMEOUT))
+            # end for
+            for index in (order if order is not None else range(request_count)):
+                if index not in missing:
+                    request_type, request_arguments, correlation_id = requests[index]
+                    self.response_queue.put((REQUEST_TO_RESPONSE[request_type], request_arguments, correlation_id))
+                # end if
+            # end for
+        # end def run
+
+        thread = Thread(target=run, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, WAIT_TIMEOUT)
+        return thread, requests
+    # end def answer
+
+    def assert_no_pending_response(self):
+        """
+        Check no response nor correlation ID is kept by the process object.
+        """
+        self.assertEqual([], self.process._pending_responses, "Responses kept for nobody")
+        self.assertEqual(set(), self.process._pending_correlation_ids, "Correlation IDs kept for nobody")
+    # end def assert_no_pending_response
+
+    def test_pipelined_requests(self):
+        """
+        Test the responses of pipelined requests are returned in the request order.
+        """
+        thread, requests = self.answer(request_count=len(REQUESTS))
+
+        responses = self.process.send_requests_wait_for_responses(requests=REQUESTS, timeout=WAIT_TIMEOUT)
+
+        self.assertEqual([REQUEST_TO_RESPONSE[request_type] for request_type, _ in REQUESTS],
+                         [self.process.get_message_type(message=response) for response in responses])
+        self.assertEqual([(1,), (), (2,)], [self.process.get_message_arguments(message=response)
+                                            for response in responses])
+        self.assertEqual(3, len({self.process.get_message_correlation_id(message=request) for request in requests}),
+                         "The correlation IDs should be unique")
+        self.assert_no_pending_response()
+    # end def test_pipelined_requests
+
+    def test_out_of_order_responses(self):
+        """
+        Test the responses received out of order are matched with their requests by correlation ID, including the
+        responses of the same type.
+        """
+        self.answer(request_count=len(REQUESTS), order=[2, 1, 0])
+
+        responses = self.process.send_requests_wait_for_responses(requests=REQUESTS, timeout=WAIT_TIMEOUT)
+
+        self.assertEqual([(1,), (), (2,)], [self.process.get_message_arguments(message=response)
+                                            for response in responses])
+        self.assert_no_pending_response()
+    # end def test_out_of_order_responses
+
+    def test_concurrent_requesters(self):
+        """
+        Test two threads waiting for their responses each get their own one, the responses being received in the
+        reverse order.
+        """
+        self.answer(request_count=2, order=[1, 0])
+        responses = {}
+
+        def requester(request_argument):
+            """
+            Send a request and wait for its response.
+
+            :param request_argument: The argument of the request
+            :type request_argument: ``int``
+            """
+            responses[request_argument] = self.process.send_request_wait_for_response(
+                request_type=NrfBleLibProcessMessageType.SCAN_REQUEST, request_arguments=(request_argument,),
+                timeout=WAIT_TIMEOUT)
+        # end def requester
+
+        threads = [Thread(target=requester, args=(request_argument,)) for request_argument in (1, 2)]
+        for thread in threads:
+            thread.start()
+        # end for
+        for thread in threads:
+            thread.join(timeout=WAIT_TIMEOUT)
+        # end for
+
+        self.assertEqual({1: (1,), 2: (2,)}, {request_argument: self.process.get_message_arguments(message=response)
+                                              for request_argument, response in responses.items()})
+        self.assert_no_pending_response()
+    # end def test_concurrent_requesters
+
+    def test_missing_response(self):
+        """
+        Test a missing response raises ``Empty`` once the responses received are kept, and its late response is
+        dropped.
+        """
+        thread, requests = self.answer(request_count=len(REQUESTS), order=[2, 0], missing=(1,))
+
+        with self.assertRaises(Empty):
+            self.process.send_requests_wait_for_responses(requests=REQUESTS, timeout=MISSING_RESPONSE_TIMEOUT)
+        # end with
+        thread.join(timeout=WAIT_TIMEOUT)
+
+        # The response received after the missing one is still kept for its requester
+        correlation_id = self.process.get_message_correlation_id(message=requests[2])
+        self.assertEqual((2,), self.process.get_message_arguments(message=self.process.get_response(
+            original_request_type=NrfBleLibProcessMessageType.SCAN_REQUEST, timeout=0,
+            correlation_id=correlation_id)))
+
+        request_type, request_arguments, correlation_id = requests[1]
+        self.response_queue.put((REQUEST_TO_RESPONSE[request_type], request_arguments, correlation_id))
+        self.answer(request_count=1)
+        response = self.process.send_request_wait_for_response(
+            request_type=NrfBleLibProcessMessageType.SCAN_STOP_REQUEST, timeout=WAIT_TIMEOUT)
+
+        self.assertNotEqual(correlation_id, self.process.get_message_correlation_id(message=response),
+                            "The late response should be dropped")
+        self.assert_no_pending_response()
+    # end def test_missing_response
+
+    def test_response_without_correlation_id(self):
+        """
+        Test a response is matched by request type when no correlation ID is given, an error response included, the
+        other responses without correlation ID being dropped as before.
+        """
+        self.response_queue.put((NrfBleLibProcessMessageType.SCAN_STOP_RESPONSE, ()))
+        self.response_queue.put((NrfBleLibProcessMessageType.ERROR_RESPONSE,
+                                 (NrfBleLibProcessMessageType.SCAN_REQUEST, 'error')))
+
+        response = self.process.get_response(original_request_type=NrfBleLibProcessMessageType.SCAN_REQUEST,
+                                             timeout=WAIT_TIMEOUT)
+
+        self.assertEqual(NrfBleLibProcessMessageType.ERROR_RESPONSE, self.process.get_message_type(message=response))
+        with self.assertRaises(Empty):
+            self.process.get_response(original_request_type=NrfBleLibProcessMessageType.SCAN_STOP_REQUEST,
+                                      timeout=MISSING_RESPONSE_TIMEOUT)
+        # end with
+        self.assert_no_pending_response()
+    # end def test_response_without_correlation_id
+# end class NrfBleLibProcessResponseTestCase
+
+# ----------------------------------------------------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------------------------------------------------
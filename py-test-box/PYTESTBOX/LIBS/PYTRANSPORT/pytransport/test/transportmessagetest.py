@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Python Test Harness
+# ------------------------------------------------------------------------------
+"""
+:package: pytransport.test.transportmessagetest
+:brief: TransportMessage testing module
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ------------------------------------------------------------------------------
+# imports
+# ------------------------------------------------------------------------------
+from sys import getswitchinterval
+from sys import setswitchinterval
+from threading import Barrier
+from threading import Thread
+from unittest import TestCase
+
+from pylibrary.tools.hexlist import HexList
+from pytransport.transportmessage import TransportMessage
+from pytransport.usb.usbmessage import UsbMessage
+
+
+# ------------------------------------------------------------------------------
+# implementation
+# ------------------------------------------------------------------------------
+class TransportMessageTestCase(TestCase):
+    """
+    TransportMessage testing class
+    """
+    DATA = '11FF050100'
+
+    def test_raw_data(self):
+        """
+        Check a message created from raw data builds its HexList only when ``data`` is read
+        """
+        for raw_data in (bytes.fromhex(self.DATA), bytearray.fromhex(self.DATA),
+                         memoryview(bytearray.fromhex(self.DATA))):
+            transport_message = TransportMessage(raw_data=raw_data, timestamp=12)
+            self.assertEqual(5, len(transport_message))
+            self.assertEqual(0x11, transport_message.raw_data[0])
+            self.assertEqual(f'{self.DATA} at 12ns', str(transport_message))
+            self.assertIsNone(transport_message._data)
+
+            self.assertEqual(HexList(self.DATA), transport_message.data)
+            self.assertIsInstance(transport_message.data, HexList)
+            self.assertEqual(f'{self.DATA} at 12ns', str(transport_message))
+        # end for
+    # end def test_raw_data
+
+    def test_data(self):
+        """
+        Check ``raw_data`` follows the HexList data and its modifications
+        """
+        transport_message = TransportMessage(raw_data=bytes.fromhex(self.DATA))
+        transport_message.data[4] = 0xAA
+        self.assertEqual(bytes.fromhex('11FF0501AA'), transport_message.raw_data)
+
+        transport_message.data = HexList('1234')
+        self.assertEqual(b'\x12\x34', transport_message.raw_data)
+        self.assertEqual(2, len(transport_message))
+
+        self.assertIsNone(TransportMessage().raw_data)
+        with self.assertRaises(AssertionError):
+            TransportMessage(data=HexList(self.DATA), raw_data=bytes.fromhex(self.DATA))
+        # end with
+    # end def test_data
+
+    def test_equality(self):
+        """
+        Check the equality of messages created from raw data and from HexList
+        """
+        raw_message = UsbMessage(raw_data=bytes.fromhex(self.DATA), timestamp=1)
+        self.assertEqual(UsbMessage(data=HexList(self.DATA), timestamp=2), raw_message)
+        self.assertEqual(UsbMessage(raw_data=bytearray.fromhex(self.DATA)), raw_message)
+        self.assertNotEqual(TransportMessage(raw_data=bytes.fromhex(self.DATA)), raw_message)
+        self.assertNotEqual(UsbMessage(raw_data=bytes.fromhex('11FF0501')), raw_message)
+        self.assertIsNone(raw_message._data)
+    # end def test_equality
+
+    def test_concurrent_data(self):
+        """
+        Check the HexList is built once when several threads read ``data`` at the same time
+        """
+        thread_count = 8
+        switch_interval = getswitchinterval()
+        # The threads are switched as often as possible to interleave the reads
+        setswitchinterval(1e-6)
+        self.addCleanup(setswitchinterval, switch_interval)
+
+        for _ in range(100):
+            transport_message = TransportMessage(raw_data=bytes.fromhex(self.DATA))
+            barrier = Barrier(thread_count)
+            results = []
+
+            def reader():
+                """
+                Read the data once all the readers are started
+                """
+                barrier.wait()
+                results.append(transport_message.data)
+            # end def reader
+
+            threads = [Thread(target=reader) for _ in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            # end for
+            for thread in threads:
+                thread.join()
+            # end for
+            self.assertEqual(thread_count, len(results))
+            self.assertTrue(all(data is results[0] for data in results), "The HexList is built several times")
+            self.assertEqual(HexList(self.DATA), results[0])
+        # end for
+    # end def test_concurrent_data
+# end class TransportMessageTestCase
+
+# ------------------------------------------------------------------------------
+# END OF FILE
+# ------------------------------------------------------------------------------
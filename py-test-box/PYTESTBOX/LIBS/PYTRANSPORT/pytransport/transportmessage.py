@@ -12,6 +12,8 @@
 # ------------------------------------------------------------------------------
 # imports
 # ------------------------------------------------------------------------------
+from threading import Lock
+
 from pylibrary.tools.hexlist import HexList
 
 
@@ -21,9 +23,15 @@ from pylibrary.tools.hexlist import HexList
 class TransportMessage:
     """
     Transport message base class
+
+    The data can be given as a ``HexList`` or as the raw buffer received (``raw_data``). In the latter case, the
+    ``HexList`` is only built when ``data`` is read, the dispatching reads the header directly in ``raw_data``. The
+    ``HexList`` is built once, under a lock, even if several threads read ``data`` at the same time.
     """
+    # Lock of the ``HexList`` build, shared by all the messages: it is only taken once per message read as ``HexList``
+    _DATA_LOCK = Lock()
 
-    def __init__(self, message_class=None, data=None, timestamp=None):
+    def __init__(self, message_class=None, data=None, timestamp=None, raw_data=None):
         """
         Constructor
 
@@ -33,10 +41,19 @@ class TransportMessage:
         :type data: ``HexList`` or ``None``
         :param timestamp: Time stamp counter in us - OPTIONAL
         :type timestamp: ``int`` or ``None``
+        :param raw_data: Binary data as received, exclusive with ``data``. A ``memoryview`` must not be modified
+                         while the message is used - OPTIONAL
+        :type raw_data: ``bytes`` or ``bytearray`` or ``memoryview`` or ``None``
         """
+        assert data is None or raw_data is None, "data and raw_data cannot be both given"
         self.message_class = message_class
         self.data = data
         self.timestamp = timestamp
+        if raw_data is not None:
+            assert isinstance(raw_data, (bytes, bytearray, memoryview)), \
+                "raw_data should be either None, bytes, bytearray or memoryview"
+            self._raw_data = raw_data
+        # end if
     # end def __init__
 
     @property
@@ -70,6 +87,19 @@ class TransportMessage:
         :return: data value
         :rtype: ``HexList`` or ``None``
         """
+        if self._raw_data is not None:
+            with TransportMessage._DATA_LOCK:
+                raw_data = self._raw_data
+                if raw_data is not None:
+                    # The HexList replaces the raw data, the modifications done on it are then seen by ``raw_data``.
+                    # It is set before the raw data is cleared, a reader without the lock always sees one of them
+                    data = HexList()
+                    data.extendRaw(raw_data)
+                    self._data = data
+                    self._raw_data = None
+                # end if
+            # end with
+        # end if
         return self._data
     # end def property getter data
 
@@ -83,8 +113,29 @@ class TransportMessage:
         """
         assert value is None or isinstance(value, HexList), "data should be either None or HexList"
         self._data = value
+        self._raw_data = None
     # end def property setter data
 
+    @property
+    def raw_data(self):
+        """
+        Property getter of raw_data, the data as a bytes-like object. The ``HexList`` is not built if the message was
+        created from raw data.
+
+        :return: raw_data value
+        :rtype: ``bytes`` or ``bytearray`` or ``memoryview`` or ``None``
+        """
+        raw_data = self._raw_data
+        if raw_data is not None:
+            return raw_data
+        # end if
+        data = self._data
+        if data is not None:
+            return bytes(data)
+        # end if
+        return None
+    # end def property getter raw_data
+
     @property
     def timestamp(self):
         """
@@ -115,8 +166,11 @@ class TransportMessage:
             to_str += f"{self.message_class.__name__} "
         # end if
 
-        if self.data is not None:
-            to_str += f"{self.data} "
+        raw_data = self._raw_data
+        if raw_data is not None:
+            to_str += f"{raw_data.hex().upper()} "
+        elif self._data is not None:
+            to_str += f"{self._data} "
         # end if
 
         if self.timestamp is not None:
@@ -140,12 +194,19 @@ class TransportMessage:
     def __eq__(self, other):
         # The equality is not done over the timestamp because we can have two identical transport messages
         # at different times
-        return type(self) == type(other) and \
-               self.message_class == other.message_class and \
-               self.data == other.data
+        if type(self) != type(other) or self.message_class != other.message_class:
+            return False
+        elif self._data is not None and other._data is not None:
+            return self._data == other._data
+        # end if
+        return self.raw_data == other.raw_data
     # end def __eq__
 
     def __len__(self):
+        raw_data = self._raw_data
+        if raw_data is not None:
+            return len(raw_data)
+        # end if
         return len(self.data)
     # end def __len__
 # end class TransportMessage
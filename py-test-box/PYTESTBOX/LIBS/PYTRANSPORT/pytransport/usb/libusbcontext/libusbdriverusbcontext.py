@@ -13,7 +13,6 @@
 # Imports
 # ------------------------------------------------------------------------------
 from atexit import register
-from binascii import hexlify
 from ctypes import c_long
 from ctypes import py_object
 from ctypes import pythonapi
@@ -40,7 +39,9 @@ from pylibrary.tools.tracebacklog import TracebackLogWrapper
 from pytransport.transportcontext import TransportContextException
 from pytransport.usb.libusbcontext.usbtasks import ContextEventHandleTask
 from pytransport.usb.libusbcontext.usbtasks import InterruptPollingTask
+from pytransport.usb.libusbcontext.usbtasks import InterruptTransferRing
 from pytransport.usb.libusbcontext.usbtasks import MAX_THREADS
+from pytransport.usb.libusbcontext.usbtasks import TRANSFER_RING_SIZE
 from pytransport.usb.libusbcontext.usbtasks import USB_TIMEOUT
 from pytransport.usb.usbcontext import StringDescriptor
 from pytransport.usb.usbcontext import UsbContext
@@ -196,6 +197,10 @@ class LibusbUsbContext(UsbContext):
     USB_CONTEXT_DEVICE_CLASS = LibusbUsbContextDevice
     # Hotplug capability is not supported by Libusb Driver
     ASYNCHRONOUS_CONNECTION_DISCONNECTION_CAPABILITY = False
+    # Read the interrupt endpoints with rings of asynchronous transfers (see ``InterruptTransferRing``) completed by
+    # the libusb event handling task, instead of one polling task per endpoint (see ``InterruptPollingTask``)
+    ASYNCHRONOUS_INTERRUPT_READ = False
+    INTERRUPT_TRANSFER_RING_SIZE = TRANSFER_RING_SIZE
 
     def __init__(self, trace_level=TraceLevel.NO_TRACE, trace_file_name=None):
         # See ``UsbContext.__init__``
@@ -205,7 +210,7 @@ class LibusbUsbContext(UsbContext):
         self._libusb_context = None
         self._hotplug_opaque_handle = None  # This handle is only to be used to unregister the hotplug callback
         self._hotplug_callback = WeakMethod(self._hotplug_callback)
-        self._hotplug_task = None
+        self._event_handle_task = None
         self._threaded_executor = None
         self._executor_thread = None
         self._device_endpoint_task_dict = RLockedDict()
@@ -315,19 +320,23 @@ class LibusbUsbContext(UsbContext):
             subscription_owner=self, message=f"Opening {self.__class__.__name__}...", trace_level=TraceLevel.DEBUG)
 
         try:
-            self._libusb_context = usb1.USBContext()
+            self._libusb_context = self._create_libusb_context()
             # Get a deep copy of the device cache using device_cache read only property
             self._usb_context_devices = self.__class__.device_cache
 
             tasks = []
-            if self.__class__.ASYNCHRONOUS_CONNECTION_DISCONNECTION_CAPABILITY:
-                self._hotplug_task = ContextEventHandleTask(
+            if self.__class__.ASYNCHRONOUS_CONNECTION_DISCONNECTION_CAPABILITY or \
+                    self.__class__.ASYNCHRONOUS_INTERRUPT_READ:
+                self._event_handle_task = ContextEventHandleTask(
                     libusb_context=self._libusb_context,
                     trace_level=TRACE_LOGGER.get_trace_level(subscription_owner=self),
-                    trace_file_name=self.trace_file_name, trace_name="LibusbUsbContext Hotplug")
+                    trace_file_name=self.trace_file_name, trace_name="LibusbUsbContext Event Handle")
+                tasks.append(self._event_handle_task)
+            # end if
+
+            if self.__class__.ASYNCHRONOUS_CONNECTION_DISCONNECTION_CAPABILITY:
                 self._hotplug_opaque_handle = self._libusb_context.hotplugRegisterCallback(
                     callback=self._hotplug_callback)
-                tasks.append(self._hotplug_task)
             # end if
 
             self._threaded_executor = ThreadedExecutor(
@@ -343,9 +352,9 @@ class LibusbUsbContext(UsbContext):
                 message=f"Exception while opening. Clean attributes. Exception:\n"
                         f"{TracebackLogWrapper.get_exception_stack()}",
                 trace_level=TraceLevel.ERROR)
-            if self._hotplug_task is not None:
-                self._hotplug_task.stop_event.set()
-                self._hotplug_task = None
+            if self._event_handle_task is not None:
+                self._event_handle_task.stop_event.set()
+                self._event_handle_task = None
             # end if
             if self._hotplug_opaque_handle is not None:
                 # noinspection PyBroadException
@@ -380,10 +389,6 @@ class LibusbUsbContext(UsbContext):
             subscription_owner=self, message=f"Closing {self.__class__.__name__}...", trace_level=TraceLevel.DEBUG)
 
         try:
-            if self._hotplug_task is not None:
-                self._hotplug_task.stop_event.set()
-            # end if
-
             for device in self._usb_context_devices:
                 self.close_device(usb_context_device=device)
                 if device.libusb_device is not None:
@@ -391,6 +396,11 @@ class LibusbUsbContext(UsbContext):
                 # end if
             # end for
 
+            # The event handling is stopped after the devices, it completes the cancelled transfers
+            if self._event_handle_task is not None:
+                self._event_handle_task.stop_event.set()
+            # end if
+
             if self._executor_thread is not None and self._executor_thread.is_alive():
                 self._threaded_executor.stop()
                 self._executor_thread.join(USB_TIMEOUT + 1)
@@ -436,7 +446,7 @@ class LibusbUsbContext(UsbContext):
         finally:
             self._threaded_executor = None
             self._executor_thread = None
-            self._hotplug_task = None
+            self._event_handle_task = None
             self._hotplug_opaque_handle = None
             self._libusb_context = None
             self._usb_context_devices = None
@@ -444,6 +454,16 @@ class LibusbUsbContext(UsbContext):
         # end try
     # end def close
 
+    def _create_libusb_context(self):
+        """
+        Create the libusb context used by this context. It can be redefined to use another libusb backend.
+
+        :return: The libusb context
+        :rtype: ``usb1.USBContext``
+        """
+        return usb1.USBContext()
+    # end def _create_libusb_context
+
     def reset(self):
         # See TransportContext.reset
         self.close()
@@ -895,7 +915,7 @@ class LibusbUsbContext(UsbContext):
             trace_level=TraceLevel.EXTRA_DEBUG)
 
         data_length = usb_context_device.libusb_device_handle.interruptWrite(
-            endpoint=endpoint, data=bytes(list(data.data)), timeout=int(timeout*1000))
+            endpoint=endpoint, data=bytes(data.raw_data), timeout=int(timeout*1000))
 
         # Update the timestamp of the message sent
         data.timestamp = perf_counter_ns()
@@ -943,28 +963,32 @@ class LibusbUsbContext(UsbContext):
 
         TRACE_LOGGER.log_trace(
             subscription_owner=trace_owner,
-            message=f"{usb_context_device.reader_name}, Interrupt read on endpoint 0x{endpoint:02X} started",
-            trace_level=TraceLevel.EXTRA_DEBUG)
+            message="{}, Interrupt read on endpoint 0x{:02X} started",
+            trace_level=TraceLevel.EXTRA_DEBUG,
+            args=(usb_context_device.reader_name, endpoint))
 
         interrupt_data = device_handle.interruptRead(
             endpoint=endpoint, length=w_length, timeout=int(timeout*1000))
         # Perform the time
         timestamp = perf_counter_ns()
 
-        interrupt_data = UsbMessage(
-            data=HexList(hexlify(interrupt_data).decode('utf8')), timestamp=timestamp)
-        TRACE_LOGGER.log_trace(
-            subscription_owner=trace_owner,
-            message=f"{usb_context_device.reader_name}, Interrupt read on endpoint 0x{endpoint:02X}: "
-                    f"{interrupt_data.data} at {interrupt_data.timestamp}ns",
-            trace_level=TraceLevel.INFO)
+        interrupt_data = UsbMessage(raw_data=interrupt_data, timestamp=timestamp)
+        # The message is formatted now: it is modified by the upper layers
+        if TRACE_LOGGER.is_trace_enabled(subscription_owner=trace_owner, trace_level=TraceLevel.INFO):
+            TRACE_LOGGER.log_trace(
+                subscription_owner=trace_owner,
+                message=f"{usb_context_device.reader_name}, Interrupt read on endpoint 0x{endpoint:02X}: "
+                        f"{interrupt_data}",
+                trace_level=TraceLevel.INFO)
+        # end if
         return interrupt_data
     # end def interrupt_read
 
     def start_interrupt_read_polling(self, usb_context_device, endpoint, w_length, time_stamped_msg_queue=None,
                                      trace_name=None, callback=None, discard_report=False):
         """
-        Start a task that performs interrupt read continuous polling on a USB device.
+        Start a task that performs interrupt read continuous polling on a USB device. If
+        ``ASYNCHRONOUS_INTERRUPT_READ`` is set, a ring of asynchronous transfers is submitted instead.
 
         :param usb_context_device: The USB device to use
         :type usb_context_device: ``LibusbUsbContextDevice``
@@ -992,12 +1016,20 @@ class LibusbUsbContext(UsbContext):
             usb_context_device.set_transfer_callback(transfer_type_key=endpoint, callback=callback)
         # end if
 
-        task = InterruptPollingTask(libusb_usb_context=self, usb_context_device=usb_context_device,
-                                    endpoint_number=endpoint, data_size=w_length,
-                                    time_stamped_msg_queue=time_stamped_msg_queue, trace_name=trace_name)
+        if self.__class__.ASYNCHRONOUS_INTERRUPT_READ:
+            task = InterruptTransferRing(libusb_usb_context=self, usb_context_device=usb_context_device,
+                                         endpoint_number=endpoint, data_size=w_length,
+                                         time_stamped_msg_queue=time_stamped_msg_queue, trace_name=trace_name,
+                                         ring_size=self.__class__.INTERRUPT_TRANSFER_RING_SIZE)
+            task.start()
+        else:
+            task = InterruptPollingTask(libusb_usb_context=self, usb_context_device=usb_context_device,
+                                        endpoint_number=endpoint, data_size=w_length,
+                                        time_stamped_msg_queue=time_stamped_msg_queue, trace_name=trace_name)
 
-        self._threaded_executor.add_task(task)
-        task.polling_started_event.wait()
+            self._threaded_executor.add_task(task)
+            task.polling_started_event.wait()
+        # end if
 
         with self._device_endpoint_task_dict:
             self._device_endpoint_task_dict[usb_context_device.reader_name][endpoint] = task
@@ -1031,7 +1063,7 @@ class LibusbUsbContext(UsbContext):
                     return
                 # end if
 
-                task.stop_event.set()
+                task.stop()
 
                 task.end_event.wait(USB_TIMEOUT * 1.01)
             # end with
@@ -1219,7 +1251,7 @@ class LibusbUsbContext(UsbContext):
                     # All stop event are set to avoid having to wait for all timeout sequentially. This way, all
                     # timeout done by the libusb methods in the threads will be awaited parallely
                     for interface_task in interface_tasks.values():
-                        interface_task.stop_event.set()
+                        interface_task.stop()
                     # end for
 
                     # All the wait should then be done here but because their stops are done in parallel just the
@@ -1270,13 +1302,13 @@ class LibusbUsbContext(UsbContext):
             # end if
         except (AssertionError, TransportContextException):
             TRACE_LOGGER.log_trace(
-                subscription_owner=self._hotplug_task, message=f"Exception while getting device in callback ",
+                subscription_owner=self._event_handle_task, message=f"Exception while getting device in callback ",
                 trace_level=TraceLevel.WARNING)
         # end try
 
         if usb_context_device is None:
             TRACE_LOGGER.log_trace(
-                subscription_owner=self._hotplug_task,
+                subscription_owner=self._event_handle_task,
                 message=f"Event on unknown device [Bus {bus_id} Device {port_list}]: {event_str}",
                 trace_level=TraceLevel.DEBUG)
             return
@@ -1307,7 +1339,7 @@ class LibusbUsbContext(UsbContext):
         # end with
 
         TRACE_LOGGER.log_trace(
-            subscription_owner=self._hotplug_task,
+            subscription_owner=self._event_handle_task,
             message=f"Event on device [{usb_context_device.reader_name}]: {event_str}",
             trace_level=TraceLevel.INFO)
     # end def _hotplug_callback
@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+:package: pytransport.usb.libusbcontext.test
+:brief: Package containing all tests related to the libusb USB context
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ----------------------------------------------------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------------------------------------------------
+
+# ----------------------------------------------------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+:package: pytransport.usb.libusbcontext.test.interrupttransferringtest
+:brief: Validates the ring of asynchronous interrupt transfers, with fake libusb transfers
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------------------------------------------------
+from queue import Queue
+from threading import Event
+from unittest import TestCase
+from unittest.mock import patch
+
+import usb1
+
+from pytransport.usb.libusbcontext import usbtasks
+from pytransport.usb.libusbcontext.usbtasks import TRACE_LOGGER
+from pytransport.usb.libusbcontext.usbtasks import InterruptTransferRing
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------------------------------------------------
+ENDPOINT = 0x81
+DATA_SIZE = 8
+# Timeout of the waits for the backoff timers [seconds]
+WAIT_TIMEOUT = 2
+
+
+class FakeTransfer:
+    """
+    Fake libusb transfer, completed by the test
+    """
+
+    def __init__(self):
+        self.callback = None
+        self.status = None
+        self.buffer = bytearray()
+        self.actual_length = 0
+        self.submitted = False
+        self.submit_count = 0
+        self.cancel_requested = False
+        self.submitted_event = Event()
+    # end def __init__
+
+    def setInterrupt(self, endpoint, buffer_or_len, callback=None, user_data=None, timeout=0):
+        """
+        See ``usb1.USBTransfer.setInterrupt``
+        """
+        self.buffer = bytearray(buffer_or_len)
+        self.callback = callback
+    # end def setInterrupt
+
+    def submit(self):
+        """
+        See ``usb1.USBTransfer.submit``
+        """
+        assert not self.submitted, "Transfer already submitted"
+        self.submitted = True
+        self.cancel_requested = False
+        self.submit_count += 1
+        self.submitted_event.set()
+    # end def submit
+
+    def cancel(self):
+        """
+        See ``usb1.USBTransfer.cancel``, the cancelled status is given by ``complete_cancelled``
+        """
+        self.cancel_requested = True
+    # end def cancel
+
+    def isSubmitted(self):
+        """
+        See ``usb1.USBTransfer.isSubmitted``
+        """
+        return self.submitted
+    # end def isSubmitted
+
+    def getStatus(self):
+        """
+        See ``usb1.USBTransfer.getStatus``
+        """
+        return self.status
+    # end def getStatus
+
+    def getBuffer(self):
+        """
+        See ``usb1.USBTransfer.getBuffer``
+        """
+        return self.buffer
+    # end def getBuffer
+
+    def getActualLength(self):
+        """
+        See ``usb1.USBTransfer.getActualLength``
+        """
+        return self.actual_length
+    # end def getActualLength
+
+    def complete(self, status, data=b''):
+        """
+        Complete the transfer, as the libusb event handling does
+
+        :param status: The transfer status
+        :type status: ``int``
+        :param data: The received data - OPTIONAL
+        :type data: ``bytes``
+        """
+        assert self.submitted, "Transfer not submitted"
+        self.submitted = False
+        self.submitted_event.clear()
+        self.status = status
+        self.buffer[:len(data)] = data
+        self.actual_length = len(data)
+        self.callback(self)
+    # end def complete
+
+    def complete_cancelled(self):
+        """
+        Complete the transfer if its cancellation was requested
+        """
+        if self.submitted and self.cancel_requested:
+            self.complete(status=usb1.TRANSFER_CANCELLED)
+        # end if
+    # end def complete_cancelled
+# end class FakeTransfer
+
+
+class FakeDeviceHandle:
+    """
+    Fake libusb device handle, keeping the allocated transfers
+    """
+
+    def __init__(self):
+        self.transfers = []
+    # end def __init__
+
+    def getTransfer(self, iso_packets=0):
+        """
+        See ``usb1.USBDeviceHandle.getTransfer``
+        """
+        transfer = FakeTransfer()
+        self.transfers.append(transfer)
+        return transfer
+    # end def getTransfer
+# end class FakeDeviceHandle
+
+
+class FakeUsbContext:
+    """
+    Fake USB context, owner of the traces of the ring
+    """
+    trace_file_name = None
+# end class FakeUsbContext
+
+
+class FakeUsbContextDevice:
+    """
+    Fake USB context device, keeping the messages given to its interrupt callback
+    """
+
+    def __init__(self):
+        self.libusb_device_handle = FakeDeviceHandle()
+        self.reader_name = 'Fake device'
+        self.received = []
+    # end def __init__
+
+    def get_transfer_callback(self, transfer_type_key):
+        """
+        See ``UsbContextDevice.get_transfer_callback``
+        """
+        return self.interrupt_callback
+    # end def get_transfer_callback
+
+    def interrupt_callback(self, transport_message):
+        """
+        Keep a received message
+
+        :param transport_message: The message
+        :type transport_message: ``UsbMessage``
+        """
+        self.received.append(transport_message)
+    # end def interrupt_callback
+# end class FakeUsbContextDevice
+
+
+class InterruptTransferRingTestCase(TestCase):
+    """
+    ``InterruptTransferRing`` test implementation.
+    """
+
+    def setUp(self):
+        """
+        Create a ring of 2 transfers on a fake device.
+        """
+        super().setUp()
+        self.create_ring(ring_size=2)
+        self.addCleanup(self.stop_ring)
+    # end def setUp
+
+    def create_ring(self, ring_size):
+        """
+        Create and start a ring on a new fake device.
+
+        :param ring_size: Number of transfers of the ring
+        :type ring_size: ``int``
+        """
+        self.usb_context = FakeUsbContext()
+        TRACE_LOGGER.subscribe(subscription_owner=self.usb_context)
+        self.addCleanup(TRACE_LOGGER.unsubscribe, self.usb_context)
+        usb_context_device = FakeUsbContextDevice()
+        self.received = usb_context_device.received
+        self.queue = Queue()
+        self.ring = InterruptTransferRing(
+            libusb_usb_context=self.usb_context, usb_context_device=usb_context_device,
+            endpoint_number=ENDPOINT, data_size=DATA_SIZE, time_stamped_msg_queue=self.queue, ring_size=ring_size)
+        self.ring.start()
+        self.transfers = usb_context_device.libusb_device_handle.transfers
+    # end def create_ring
+
+    def stop_ring(self):
+        """
+        Stop the ring and complete the cancelled transfers.
+        """
+        self.ring.stop()
+        for transfer in self.transfers:
+            transfer.complete_cancelled()
+        # end for
+    # end def stop_ring
+
+    def assert_stopped(self):
+        """
+        Check the pending transfers are cancelled, and the ring ends when their cancellation is completed.
+        """
+        self.assertTrue(self.ring.stop_event.is_set())
+        self.assertTrue(all(transfer.cancel_requested for transfer in self.transfers if transfer.submitted))
+        for transfer in self.transfers:
+            transfer.complete_cancelled()
+        # end for
+        self.assertTrue(self.ring.end_event.is_set())
+        self.assertFalse(any(transfer.submitted for transfer in self.transfers))
+    # end def assert_stopped
+
+    def test_completion(self):
+        """
+        Test a completed transfer is submitted again, and its report is given to the queue and to the callback.
+        """
+        self.assertEqual([1, 1], [transfer.submit_count for transfer in self.transfers])
+        self.assertTrue(self.ring.polling_started_event.is_set())
+
+        self.transfers[0].complete(status=usb1.TRANSFER_COMPLETED, data=b'\x01\x02\x03')
+
+        self.assertEqual([2, 1], [transfer.submit_count for transfer in self.transfers])
+        self.assertEqual(b'\x01\x02\x03', bytes(self.queue.get_nowait().raw_data))
+        self.assertEqual([b'\x01\x02\x03'], [bytes(message.raw_data) for message in self.received])
+        self.assertEqual((1, 0, 0), (self.ring.report_count, self.ring.error_count, self.ring.starvation_count))
+    # end def test_completion
+
+    def test_stop(self):
+        """
+        Test the stop cancels the transfers, the end being signaled when all of them are completed.
+        """
+        self.ring.stop()
+
+        self.assertTrue(all(transfer.cancel_requested for transfer in self.transfers))
+        self.transfers[0].complete_cancelled()
+        self.assertFalse(self.ring.end_event.is_set())
+        self.transfers[1].complete_cancelled()
+        self.assertTrue(self.ring.end_event.is_set())
+        self.assertEqual([1, 1], [transfer.submit_count for transfer in self.transfers])
+        self.assertEqual(0, self.ring.error_count)
+    # end def test_stop
+
+    def test_no_device(self):
+        """
+        Test the ring is stopped when the device is gone.
+        """
+        self.transfers[0].complete(status=usb1.TRANSFER_NO_DEVICE)
+
+        self.assert_stopped()
+        self.assertEqual([1, 1], [transfer.submit_count for transfer in self.transfers])
+        self.assertEqual(0, self.ring.error_count)
+    # end def test_no_device
+
+    def test_stall(self):
+        """
+        Test the ring is stopped when the endpoint is halted.
+        """
+        self.transfers[1].complete(status=usb1.TRANSFER_STALL)
+
+        self.assert_stopped()
+        self.assertEqual([1, 1], [transfer.submit_count for transfer in self.transfers])
+        self.assertEqual(1, self.ring.error_count)
+    # end def test_stall
+
+    def test_error_backoff(self):
+        """
+        Test a transfer completed with an error is submitted again after its backoff delay.
+        """
+        with patch.object(usbtasks, 'TRANSFER_ERROR_BACKOFF_MIN', 0.05):
+            self.transfers[0].complete(status=usb1.TRANSFER_ERROR)
+            self.assertFalse(self.transfers[0].submitted, "Submitted again without delay")
+            self.assertTrue(self.transfers[0].submitted_event.wait(WAIT_TIMEOUT))
+        # end with
+
+        self.assertEqual([2, 1], [transfer.submit_count for transfer in self.transfers])
+        self.assertEqual((0, 1), (self.ring.report_count, self.ring.error_count))
+        self.assertFalse(self.ring.stop_event.is_set())
+    # end def test_error_backoff
+
+    def test_consecutive_errors(self):
+        """
+        Test the ring is stopped after too many consecutive errors, a report resetting the count.
+        """
+        with patch.object(usbtasks, 'TRANSFER_MAX_CONSECUTIVE_ERRORS', 3), \
+                patch.object(usbtasks, 'TRANSFER_ERROR_BACKOFF_MIN', 0):
+            for status in (usb1.TRANSFER_ERROR, usb1.TRANSFER_TIMED_OUT, usb1.TRANSFER_COMPLETED,
+                           usb1.TRANSFER_OVERFLOW, usb1.TRANSFER_ERROR):
+                self.transfers[0].complete(status=status)
+                self.assertTrue(self.transfers[0].submitted_event.wait(WAIT_TIMEOUT))
+            # end for
+            self.assertFalse(self.ring.stop_event.is_set())
+
+            self.transfers[0].complete(status=usb1.TRANSFER_ERROR)
+        # end with
+
+        self.assert_stopped()
+        self.assertEqual((1, 5), (self.ring.report_count, self.ring.error_count))
+    # end def test_consecutive_errors
+
+    def test_stop_during_backoff(self):
+        """
+        Test a transfer waiting for its backoff delay is not submitted again after a stop.
+        """
+        with patch.object(usbtasks, 'TRANSFER_ERROR_BACKOFF_MIN', 0.05):
+            self.transfers[0].complete(status=usb1.TRANSFER_ERROR)
+            self.ring.stop()
+        # end with
+
+        self.transfers[1].complete_cancelled()
+        self.assertTrue(self.ring.end_event.is_set())
+        self.assertFalse(self.transfers[0].submitted_event.wait(0.2))
+        self.assertEqual([1, 1], [transfer.submit_count for transfer in self.transfers])
+    # end def test_stop_during_backoff
+
+    def test_starvation(self):
+        """
+        Test a report completed while no other transfer was pending is counted as a starvation.
+        """
+        self.stop_ring()
+        self.create_ring(ring_size=1)
+
+        self.transfers[0].complete(status=usb1.TRANSFER_COMPLETED, data=b'\x01')
+        self.transfers[0].complete(status=usb1.TRANSFER_COMPLETED, data=b'\x02')
+
+        self.assertEqual((2, 2), (self.ring.report_count, self.ring.starvation_count))
+        self.assertEqual(3, self.transfers[0].submit_count)
+    # end def test_starvation
+# end class InterruptTransferRingTestCase
+
+# ----------------------------------------------------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------------------------------------------------
@@ -15,6 +15,8 @@
 import os
 import sys
 from threading import Event
+from threading import RLock
+from threading import Timer
 import time
 
 from pylibrary.system.tracelogger import TraceLevel
@@ -23,6 +25,7 @@ from pylibrary.tools.threadutils import Task
 from pylibrary.tools.tracebacklog import TracebackLogWrapper
 from pytransport.usb.usbcontext import UsbContext
 from pytransport.usb.usbcontext import UsbContextDevice
+from pytransport.usb.usbmessage import UsbMessage
 
 # Import libusb python wrapper through pysetup
 try:
@@ -57,13 +60,24 @@ else:
     USB_TIMEOUT = 0.1
 # end if
 
+# Number of transfers submitted at the same time on an interrupt endpoint, when the asynchronous transfers are used
+TRANSFER_RING_SIZE = 8
+
+# A transfer completed with an error is submitted again after a delay, doubled at each consecutive error from
+# TRANSFER_ERROR_BACKOFF_MIN up to TRANSFER_ERROR_BACKOFF_MAX [seconds]. The ring is stopped after
+# TRANSFER_MAX_CONSECUTIVE_ERRORS consecutive errors.
+TRANSFER_ERROR_BACKOFF_MIN = 0.001
+TRANSFER_ERROR_BACKOFF_MAX = 0.1
+TRANSFER_MAX_CONSECUTIVE_ERRORS = 10
+
 
 # ------------------------------------------------------------------------------
 # Implementation
 # ------------------------------------------------------------------------------
 class ContextEventHandleTask(Task):
     """
-    Task that call the method ``usb1.USBContext.handleEventsTimeout``. This is used for example for hotplug purposes.
+    Task that call the method ``usb1.USBContext.handleEventsTimeout``. This is used for hotplug purposes and to
+    complete the asynchronous transfers (see ``InterruptTransferRing``).
     """
 
     def __init__(self, libusb_context, trace_level=None, trace_file_name=None, trace_name=None):
@@ -175,6 +189,13 @@ class InterruptPollingTask(Task):
         # end if
     # end def __del__
 
+    def stop(self):
+        """
+        Request the end of the polling, ``end_event`` is set when it is done.
+        """
+        self.stop_event.set()
+    # end def stop
+
     def _run(self):
         """
         Run method for the interrupt polling.
@@ -254,6 +275,322 @@ class InterruptPollingTask(Task):
     # end def _run
 # end class InterruptPollingTask
 
+
+class InterruptTransferRing:
+    """
+    Ring of asynchronous transfers reading an interrupt endpoint.
+
+    ``ring_size`` transfers are submitted at the same time, so that a transfer is always pending when the device sends
+    a report, and each transfer is submitted again in its completion callback. The callbacks are called by the thread
+    handling the libusb events (``ContextEventHandleTask``), no thread is used per endpoint.
+
+    A transfer completed with an error is submitted again after a backoff delay, and the ring is stopped after
+    ``TRANSFER_MAX_CONSECUTIVE_ERRORS`` consecutive errors. The ring is stopped at once when the device is gone
+    (``TRANSFER_NO_DEVICE``) or the endpoint is halted (``TRANSFER_STALL``).
+
+    It has the events of ``InterruptPollingTask`` and is stopped the same way.
+    """
+
+    def __init__(self, libusb_usb_context, usb_context_device, endpoint_number, data_size, time_stamped_msg_queue=None,
+                 trace_name=None, ring_size=TRANSFER_RING_SIZE):
+        """
+        :param libusb_usb_context: Context that create that ring
+        :type libusb_usb_context: ``UsbContext``
+        :param usb_context_device: Context device associated with the ring
+        :type usb_context_device: ``UsbContextDevice``
+        :param endpoint_number: Endpoint to get the data from
+        :type endpoint_number: ``int``
+        :param data_size: Length of the buffer to receive data
+        :type data_size: ``int``
+        :param time_stamped_msg_queue: Queue to get all USB message received - OPTIONAL
+        :type time_stamped_msg_queue: ``Queue`` or ``None``
+        :param trace_name: Trace name of the ring - OPTIONAL
+        :type trace_name: ``str`` or ``None``
+        :param ring_size: Number of transfers submitted at the same time - OPTIONAL
+        :type ring_size: ``int``
+        """
+        self._libusb_usb_context = libusb_usb_context
+        self._usb_context_device = usb_context_device
+        self._interrupt_ep_in = endpoint_number
+        self._data_size = data_size
+        self._time_stamped_msg_queue = time_stamped_msg_queue
+        self._ring_size = ring_size
+        self._transfers = []
+        # Number of transfers submitted or waiting for their backoff delay
+        self._submitted_count = 0
+        # Backoff timers of the transfers completed with an error, by transfer
+        self._backoff_timers = {}
+        self._consecutive_error_count = 0
+        self._lock = RLock()
+
+        self.stop_event = Event()
+        self.end_event = Event()
+        self.polling_started_event = Event()
+
+        # Statistics
+        self.report_count = 0
+        self.error_count = 0
+        # Number of completions while no other transfer was pending, a report sent at that time may be lost
+        self.starvation_count = 0
+
+        TRACE_LOGGER.subscribe(
+            subscription_owner=self,
+            trace_file_name=self._libusb_usb_context.trace_file_name,
+            trace_name=trace_name,
+            linked_owner=self._libusb_usb_context)
+    # end def __init__
+
+    def __del__(self):
+        if TRACE_LOGGER.is_subscribe(subscription_owner=self):
+            TRACE_LOGGER.unsubscribe(subscription_owner=self)
+        # end if
+    # end def __del__
+
+    def start(self):
+        """
+        Allocate and submit the transfers.
+
+        :raise ``usb1.USBError``: If a transfer cannot be submitted, the transfers already submitted are cancelled
+        """
+        with self._lock:
+            device_handle = self._usb_context_device.libusb_device_handle
+            try:
+                for _ in range(self._ring_size):
+                    transfer = device_handle.getTransfer()
+                    transfer.setInterrupt(endpoint=self._interrupt_ep_in, buffer_or_len=self._data_size,
+                                          callback=self._transfer_callback, timeout=0)
+                    self._transfers.append(transfer)
+                # end for
+
+                for transfer in self._transfers:
+                    transfer.submit()
+                    self._submitted_count += 1
+                # end for
+            except Exception:
+                self.stop()
+                raise
+            # end try
+        # end with
+
+        TRACE_LOGGER.log_trace(subscription_owner=self,
+                               message=f"{self._usb_context_device.reader_name}, {self._ring_size} transfers "
+                                       f"submitted on endpoint 0x{self._interrupt_ep_in:02X}",
+                               trace_level=TraceLevel.DEBUG)
+        self.polling_started_event.set()
+    # end def start
+
+    def stop(self):
+        """
+        Cancel the pending transfers, ``end_event`` is set when all of them are completed.
+        """
+        with self._lock:
+            self.stop_event.set()
+            for transfer in self._transfers:
+                if transfer.isSubmitted():
+                    # noinspection PyBroadException
+                    try:
+                        transfer.cancel()
+                    except Exception:
+                        # The transfer is already completing
+                        pass
+                    # end try
+                # end if
+            # end for
+
+            for timer in self._backoff_timers.values():
+                timer.cancel()
+                self._submitted_count -= 1
+            # end for
+            self._backoff_timers.clear()
+
+            if self._submitted_count == 0 and not self.end_event.is_set():
+                self._end()
+            # end if
+        # end with
+    # end def stop
+
+    def _transfer_callback(self, transfer):
+        """
+        Completion callback of the transfers, called by the libusb event handling. The report is copied, the transfer
+        is submitted again and the report is given to the queue and to the transfer callback of the device.
+
+        :param transfer: The completed transfer
+        :type transfer: ``usb1.USBTransfer``
+        """
+        timestamp = time.perf_counter_ns()
+        status = transfer.getStatus()
+        data = None
+        if status == usb1.TRANSFER_COMPLETED:
+            data = bytes(transfer.getBuffer()[:transfer.getActualLength()])
+            self.report_count += 1
+        elif status not in (usb1.TRANSFER_CANCELLED, usb1.TRANSFER_NO_DEVICE):
+            self.error_count += 1
+            TRACE_LOGGER.log_trace(subscription_owner=self,
+                                   message="{}, Transfer on endpoint 0x{:02X} completed with status {}",
+                                   trace_level=TraceLevel.EXTRA_DEBUG,
+                                   args=(self._usb_context_device.reader_name, self._interrupt_ep_in, status))
+        # end if
+
+        with self._lock:
+            resubmitted = False
+            if status == usb1.TRANSFER_COMPLETED:
+                self._consecutive_error_count = 0
+                if self._submitted_count == 1:
+                    self.starvation_count += 1
+                # end if
+                if not self.stop_event.is_set():
+                    resubmitted = self._submit(transfer)
+                # end if
+            elif status in (usb1.TRANSFER_NO_DEVICE, usb1.TRANSFER_STALL):
+                # Device Reset sent, or endpoint halted: the other transfers would fail the same way
+                if not self.stop_event.is_set():
+                    TRACE_LOGGER.log_trace(subscription_owner=self,
+                                           message="{}, Transfers on endpoint 0x{:02X} stopped by status {}",
+                                           trace_level=TraceLevel.DEBUG,
+                                           args=(self._usb_context_device.reader_name, self._interrupt_ep_in, status))
+                    self.stop()
+                # end if
+            elif status != usb1.TRANSFER_CANCELLED and not self.stop_event.is_set():
+                self._consecutive_error_count += 1
+                if self._consecutive_error_count >= TRANSFER_MAX_CONSECUTIVE_ERRORS:
+                    TRACE_LOGGER.log_trace(subscription_owner=self,
+                                           message="{}, Transfers on endpoint 0x{:02X} stopped after {} consecutive "
+                                                   "errors",
+                                           trace_level=TraceLevel.ERROR,
+                                           args=(self._usb_context_device.reader_name, self._interrupt_ep_in,
+                                                 self._consecutive_error_count))
+                    self.stop()
+                else:
+                    delay = min(TRANSFER_ERROR_BACKOFF_MIN * 2 ** (self._consecutive_error_count - 1),
+                                TRANSFER_ERROR_BACKOFF_MAX)
+                    timer = Timer(delay, self._backoff_callback, args=(transfer,))
+                    timer.daemon = True
+                    self._backoff_timers[transfer] = timer
+                    timer.start()
+                    resubmitted = True
+                # end if
+            # end if
+
+            if not resubmitted:
+                self._release()
+            # end if
+        # end with
+
+        if data is not None:
+            self._dispatch(data=data, timestamp=timestamp)
+        # end if
+    # end def _transfer_callback
+
+    def _backoff_callback(self, transfer):
+        """
+        Submit again a transfer completed with an error, at the end of its backoff delay.
+
+        :param transfer: The transfer
+        :type transfer: ``usb1.USBTransfer``
+        """
+        with self._lock:
+            if self._backoff_timers.pop(transfer, None) is None:
+                # Cancelled by ``stop``
+                return
+            # end if
+
+            if not self._submit(transfer):
+                self._release()
+            # end if
+        # end with
+    # end def _backoff_callback
+
+    def _submit(self, transfer):
+        """
+        Submit again a completed transfer. The lock is expected to be held.
+
+        :param transfer: The transfer
+        :type transfer: ``usb1.USBTransfer``
+
+        :return: Flag indicating if the transfer is submitted
+        :rtype: ``bool``
+        """
+        # noinspection PyBroadException
+        try:
+            transfer.submit()
+            return True
+        except Exception:
+            exception_stack = TracebackLogWrapper.get_exception_stack()
+            TRACE_LOGGER.log_trace(subscription_owner=self,
+                                   message=f"{self._usb_context_device.reader_name}, Cannot submit the "
+                                           f"transfer again:\n{exception_stack}",
+                                   trace_level=TraceLevel.ERROR)
+            return False
+        # end try
+    # end def _submit
+
+    def _release(self):
+        """
+        Count a transfer no longer submitted, the end is signaled with the last one. The lock is expected to be held.
+        """
+        self._submitted_count -= 1
+        if self._submitted_count == 0:
+            self.stop_event.set()
+            self._end()
+        # end if
+    # end def _release
+
+    def _dispatch(self, data, timestamp):
+        """
+        Give a report to the queue and to the transfer callback of the device.
+
+        :param data: The report
+        :type data: ``bytes``
+        :param timestamp: The completion time of the transfer in nanoseconds
+        :type timestamp: ``int``
+        """
+        # noinspection PyBroadException
+        try:
+            usb_message = UsbMessage(raw_data=data, timestamp=timestamp)
+            # The message is formatted now: it is modified by the upper layers
+            if TRACE_LOGGER.is_trace_enabled(subscription_owner=self, trace_level=TraceLevel.INFO):
+                TRACE_LOGGER.log_trace(subscription_owner=self,
+                                       message=f"{self._usb_context_device.reader_name}, Interrupt read on endpoint "
+                                               f"0x{self._interrupt_ep_in:02X}: {usb_message}",
+                                       trace_level=TraceLevel.INFO)
+            # end if
+
+            if self._time_stamped_msg_queue is not None:
+                self._time_stamped_msg_queue.put_nowait(usb_message)
+            # end if
+
+            interrupt_callback = self._usb_context_device.get_transfer_callback(
+                transfer_type_key=self._interrupt_ep_in)
+
+            if interrupt_callback is not None:
+                # Give the interrupt buffer to the callback method
+                interrupt_callback(transport_message=usb_message)
+            # end if
+        except Exception:
+            exception_stack = TracebackLogWrapper.get_exception_stack()
+            TRACE_LOGGER.log_trace(subscription_owner=self,
+                                   message=f"{self._usb_context_device.reader_name}, Exception in transfer "
+                                           f"callback:\n{exception_stack}",
+                                   trace_level=TraceLevel.ERROR)
+        # end try
+    # end def _dispatch
+
+    def _end(self):
+        """
+        Signal all the transfers are completed.
+        """
+        TRACE_LOGGER.log_trace(subscription_owner=self,
+                               message=f"{self._usb_context_device.reader_name}, End of the transfers on endpoint "
+                                       f"0x{self._interrupt_ep_in:02X}: {self.report_count} reports, "
+                                       f"{self.error_count} errors, {self.starvation_count} starvations",
+                               trace_level=TraceLevel.DEBUG)
+        if TRACE_LOGGER.is_subscribe(subscription_owner=self):
+            TRACE_LOGGER.unsubscribe(subscription_owner=self)
+        # end if
+        self.end_event.set()
+    # end def _end
+# end class InterruptTransferRing
+
 # ------------------------------------------------------------------------------
 # END OF FILE
 # ------------------------------------------------------------------------------
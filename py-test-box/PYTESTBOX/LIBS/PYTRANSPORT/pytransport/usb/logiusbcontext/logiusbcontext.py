@@ -1411,8 +1411,9 @@ class LogiusbUsbContext(UsbContext):
 
         TRACE_LOGGER.log_trace(
             subscription_owner=trace_owner,
-            message=f"{usb_context_device.reader_name}, Interrupt read on endpoint 0x{endpoint:02X} started",
-            trace_level=TraceLevel.EXTRA_DEBUG)
+            message="{}, Interrupt read on endpoint 0x{:02X} started",
+            trace_level=TraceLevel.EXTRA_DEBUG,
+            args=(usb_context_device.reader_name, endpoint))
 
         receiving_queue = Queue()
         try:
@@ -1429,11 +1430,14 @@ class LogiusbUsbContext(UsbContext):
             data=HexList(interrupt_data[LogiusbPacketIndex.MESSAGE_INDEX]),
             timestamp=int(interrupt_data[LogiusbPacketIndex.TIMESTAMP_INDEX]))
 
-        TRACE_LOGGER.log_trace(
-            subscription_owner=trace_owner,
-            message=f"{usb_context_device.reader_name}, Interrupt read on endpoint 0x{endpoint:02X}: "
-                    f"{interrupt_data.data} at {interrupt_data.timestamp}ns",
-            trace_level=TraceLevel.INFO)
+        # The message is formatted now: it is modified by the upper layers
+        if TRACE_LOGGER.is_trace_enabled(subscription_owner=trace_owner, trace_level=TraceLevel.INFO):
+            TRACE_LOGGER.log_trace(
+                subscription_owner=trace_owner,
+                message=f"{usb_context_device.reader_name}, Interrupt read on endpoint 0x{endpoint:02X}: "
+                        f"{interrupt_data.data} at {interrupt_data.timestamp}ns",
+                trace_level=TraceLevel.INFO)
+        # end if
         return interrupt_data
     # end def interrupt_read
 
@@ -88,8 +88,11 @@ from pytestbox.base.channelutils import ChannelUtils
 from pytestbox.base.configurationmanager import ConfigurationManager
 from pytestbox.base.devicemanagerutils import DeviceManagerUtils
 from pytestbox.base.emulatorsmanager import EmulatorsManager
+from pytestbox.base.featuremappingcache import FeatureMappingCache
 from pytestbox.base.loghelper import LogHelper
 from pytestbox.base.protocolmanagerutils import ProtocolManagerUtils
+from pytestbox.base.readinessprobe import ReadinessProbe
+from pytestbox.base.readinessprobe import SetupTimings
 # Next line force the initialization of the global device features & services decorator
 # noinspection PyUnresolvedReferences
 from pytestbox.base.registration import features
@@ -130,6 +133,12 @@ class CommonBaseTestCase(DebuggerTestCase, DeviceTestCase):
     """
     _PREDICATE_CACHE = dict()
     MAX_RESET_TRY = 4
+    # Wait for the DUT with readiness probes (USB enumeration, connection, 0x1D4B event, Root ping, Kosmos
+    # acknowledgement) bounded by ``READINESS_TIMEOUT`` instead of the fixed delays of the setup, the device recovery
+    # and the base utils (DFU restart, recovery actions). The base utils still apply their fixed delay when a probe is
+    # not ready in time. It shall be enabled only once validated on the hardware setup
+    USE_READINESS_PROBES = False
+    READINESS_TIMEOUT = 5  # in seconds
 
     # The naming of methodName is inherited from PyHarnessCase
     # noinspection PyPep8Naming
@@ -314,6 +323,18 @@ class CommonBaseTestCase(DebuggerTestCase, DeviceTestCase):
         # end with
 
         with self.manage_post_requisite():
+            config_manager = getattr(self, 'config_manager', None)
+            if config_manager is not None:
+                LogHelper.log_trace(
+                    self, f"Configuration manager memo: get_feature {config_manager.feature_hit_count} hits / "
+                          f"{config_manager.feature_miss_count} misses, get_feature_version "
+                          f"{config_manager.feature_version_hit_count} hits / "
+                          f"{config_manager.feature_version_miss_count} misses")
+            # end if
+        # end with
+
+        with self.manage_post_requisite():
+            FeatureMappingCache.invalidate()
             if self.current_channel is not None:
                 self.current_channel.hid_dispatcher.clear_feature_entries()
                 ChannelUtils.close_channel(test_case=self)
@@ -1633,6 +1654,12 @@ class DeviceBaseTestCase(CommonBaseTestCase):
     # Protocol to change to in setUp method after finding the current channel. This permit to create specific test
     # cases for specific protocol. If not None, it should be a LogitechProtocol
     PROTOCOL_TO_CHANGE_TO = None
+    # Load the whole feature table of the DUT at setup from the persistent feature mapping cache, instead of getting
+    # each feature index when it is first used. Opt-in: it adds 0x0001 and 0x0003 requests to each setup and it loads
+    # all the feature models. It shall stay disabled by the tests changing the DUT feature table without a firmware
+    # change (bootloader, deactivatable features)
+    USE_FEATURE_MAPPING_CACHE = False
+    RECOVER_TIME = .5  # in seconds
 
     # The naming of methodName is inherited from PyHarnessCase
     # noinspection PyPep8Naming
@@ -1645,6 +1672,7 @@ class DeviceBaseTestCase(CommonBaseTestCase):
         self.ble_context_device_used = None
 
         self._setup_hardware_reset_done = False
+        self.setup_timings = None
 
         super().__init__(methodName=methodName)
     # end def __init__
@@ -1667,12 +1695,12 @@ class DeviceBaseTestCase(CommonBaseTestCase):
 
         :raise ``ValueError``: If the Root feature was not found
         """
-        if PRINT_TEST_TIMINGS:
-            start_time = time()
-        # end if
+        self.setup_timings = SetupTimings()
 
         # Call inherited setup
-        super().setUp()
+        with self.setup_timings.phase('Common setup'):
+            super().setUp()
+        # end with
         self.config_manager.current_target = ConfigurationManager.TARGET.DEVICE
         self._setup_hardware_reset_done = False
 
@@ -1680,24 +1708,36 @@ class DeviceBaseTestCase(CommonBaseTestCase):
             self.button_stimuli_emulator.setup_connected_key_ids()
         # end if
 
-        # Debugger connection setup
-        self.debuggers_setup()
+        # USB devices to find again after the debugger reset
+        plugged_usb_devices = ReadinessProbe.get_plugged_usb_devices() if self.USE_READINESS_PROBES else None
 
-        if (self.device_debugger is not None) or (self.receiver_debugger is not None):
-            if self.id().split('.')[2] == 'connectionscheme':
-                # Cleanup all pairing slots except the first one
-                CommonBaseTestUtils.NvsHelper.clean_pairing_data(self)
-                self.last_ble_address = DeviceBaseTestUtils.NvsHelper.get_last_gap_address(
-                    test_case=self, memory_manager=self.device_memory_manager)
-                sleep(.1)
+        # Debugger connection setup
+        with self.setup_timings.phase('Debuggers'):
+            self.debuggers_setup()
+
+            if (self.device_debugger is not None) or (self.receiver_debugger is not None):
+                if self.id().split('.')[2] == 'connectionscheme':
+                    # Cleanup all pairing slots except the first one
+                    CommonBaseTestUtils.NvsHelper.clean_pairing_data(self)
+                    self.last_ble_address = DeviceBaseTestUtils.NvsHelper.get_last_gap_address(
+                        test_case=self, memory_manager=self.device_memory_manager)
+                    enumeration_delay = .1
+                else:
+                    # Let some time for the receivers to be ready after the debugger reset
+                    enumeration_delay = 1.2
+                # end if
             else:
-                # Let some time for the receivers to be ready after the debugger reset
-                sleep(1.2)
+                # Useful for test setups lacking a debugger.
+                enumeration_delay = 1
             # end if
-        else:
-            # Useful for test setups lacking a debugger.
-            sleep(1)
-        # end if
+        # end with
+
+        with self.setup_timings.phase('USB enumeration'):
+            if not self.USE_READINESS_PROBES or not self._wait_readiness(
+                    probes=[ReadinessProbe.usb_enumeration(expected_devices=plugged_usb_devices)]):
+                sleep(enumeration_delay)
+            # end if
+        # end with
 
         root_version = self.config_manager.get_feature_version(self.f.PRODUCT.FEATURES.IMPORTANT.ROOT)
         vlp_root_version = self.config_manager.get_feature_version(self.f.PRODUCT.FEATURES.VLP.IMPORTANT.ROOT)
@@ -1712,13 +1752,20 @@ class DeviceBaseTestCase(CommonBaseTestCase):
 
         # wake up the device
         if self.button_stimuli_emulator is not None and not ProtocolManagerUtils.is_corded_device_only(test_case=self):
-            self.button_stimuli_emulator.user_action()
+            with self.setup_timings.phase('Wake up'):
+                self.button_stimuli_emulator.user_action()
+                if self.USE_READINESS_PROBES and self.kosmos is not None:
+                    self._wait_readiness(probes=[ReadinessProbe.kosmos_stimulus_acknowledgement(test_case=self)])
+                # end if
+            # end with
         # end if
 
         if self.f.PRODUCT.F_Enabled:
-            self.create_device_handle()
+            with self.setup_timings.phase('Device handle'):
+                self.create_device_handle()
 
-            self._change_protocol_setup()
+                self._change_protocol_setup()
+            # end with
         # end if
 
         # TODO unplugging any charging mechanism
@@ -1743,58 +1790,95 @@ class DeviceBaseTestCase(CommonBaseTestCase):
                     VLPRoot.FEATURE_INDEX, VLPRoot.FEATURE_ID, vlp_root_version)
             # end if
 
-            ChannelUtils.open_channel(test_case=self)
-            # Prevent the DUT to send empty HID reports which could make the ChannelUtils.empty_queues call an
-            # infinite loop
-            if self.f.PRODUCT.USB_COMMUNICATION.F_SetIdleSupported and \
-                    isinstance(self.current_channel, (UsbChannel, ThroughReceiverChannel)):
-                ChannelUtils.set_idle(test_case=self)
-            # end if
+            with self.setup_timings.phase('Channel'):
+                ChannelUtils.open_channel(test_case=self)
+                if self.USE_READINESS_PROBES:
+                    self._wait_readiness(probes=[ReadinessProbe.device_connection(test_case=self),
+                                                 ReadinessProbe.root_ping(test_case=self)])
+                # end if
 
-            # Descriptor
-            ChannelUtils.get_descriptors(test_case=self)
+                # Prevent the DUT to send empty HID reports which could make the ChannelUtils.empty_queues call an
+                # infinite loop
+                if self.f.PRODUCT.USB_COMMUNICATION.F_SetIdleSupported and \
+                        isinstance(self.current_channel, (UsbChannel, ThroughReceiverChannel)):
+                    ChannelUtils.set_idle(test_case=self)
+                # end if
+
+                # Descriptor
+                ChannelUtils.get_descriptors(test_case=self)
+            # end with
 
             if not self._setup_hardware_reset_done:
-                self.reset(hardware_reset=True,
-                           verify_wireless_device_status_broadcast_event=(
-                                   self.current_channel.protocol > LogitechProtocol.UNKNOWN and
-                                   WirelessDeviceStatus.FEATURE_ID in LibusbDriver.FEATURE_CACHE),
-                           cleanup_battery_event=False)
+                with self.setup_timings.phase('Reset'):
+                    self.reset(hardware_reset=True,
+                               verify_wireless_device_status_broadcast_event=(
+                                       self.current_channel.protocol > LogitechProtocol.UNKNOWN and
+                                       WirelessDeviceStatus.FEATURE_ID in LibusbDriver.FEATURE_CACHE),
+                               cleanup_battery_event=False)
+                # end with
             # end if
 
-            # Empty message queues
-            ChannelUtils.empty_queues(test_case=self)
+            with self.setup_timings.phase('Feature mapping'):
+                # Empty message queues
+                ChannelUtils.empty_queues(test_case=self)
 
-            if isinstance(self.current_channel, ThroughReceiverChannel):
-                ChannelUtils.set_hidpp_reporting(test_case=self)
-            # end if
+                if isinstance(self.current_channel, ThroughReceiverChannel):
+                    ChannelUtils.set_hidpp_reporting(test_case=self)
+                # end if
 
-            if self.current_channel.protocol > LogitechProtocol.UNKNOWN and \
-                    WirelessDeviceStatus.FEATURE_ID not in LibusbDriver.FEATURE_CACHE:
-                self._build_feature_cache()
+                if self.USE_FEATURE_MAPPING_CACHE:
+                    ChannelUtils.load_feature_mapping(test_case=self)
+                # end if
 
-                self._print_receiver_info()
-            # end if
+                if self.current_channel.protocol > LogitechProtocol.UNKNOWN and \
+                        WirelessDeviceStatus.FEATURE_ID not in LibusbDriver.FEATURE_CACHE:
+                    self._build_feature_cache()
+
+                    self._print_receiver_info()
+                # end if
+            # end with
 
             self.original_device_index = ChannelUtils.get_device_index(test_case=self)
 
             if self.f.PRODUCT.FEATURES.KEYBOARD.FN_INVERSION_FOR_MULTI_HOST_DEVICES.F_Enabled:
                 # Because the fn inversion state be stored in NVS by 0x40A3. Shall confirm the fn inversion state is
                 # in default setting before executing test script.
-                FnInversionForMultiHostDevicesTestUtils.restore_fn_inversion_to_default_for_all_hosts(self)
+                with self.setup_timings.phase('Fn inversion'):
+                    FnInversionForMultiHostDevicesTestUtils.restore_fn_inversion_to_default_for_all_hosts(self)
+                # end with
             # end if
         else:
             self.original_device_index = None
         # end if
 
         if PRINT_TEST_TIMINGS:
-            # Noqa is used to avoid the error marking due to start_time being set in an if
-            sys.stdout.write(f"Basetest setup took {time() - start_time}s\n")  # noqa
+            sys.stdout.write(f"Basetest {self.setup_timings}\n")
 
             self._start_time = time()
         # end if
     # end def setUp
 
+    def _wait_readiness(self, probes):
+        """
+        Wait for readiness probes during the setup, with the common deadline ``READINESS_TIMEOUT``. A probe not ready
+        in time is only logged as a warning, the next setup steps have their own error handling.
+
+        :param probes: The probes to wait for, in order
+        :type probes: ``list[ReadinessProbe]``
+
+        :return: Flag indicating if all the probes are ready before the deadline
+        :rtype: ``bool``
+        """
+        is_ready = ReadinessProbe.wait_all(probes=probes, timeout=self.READINESS_TIMEOUT)
+        if not is_ready:
+            self.log_warning(
+                message=f"DUT not ready after {self.READINESS_TIMEOUT}s: {', '.join(str(probe) for probe in probes)}",
+                warning_level=WarningLevel.ROBUSTNESS)
+        # end if
+        self.setup_timings.add_probes(probes=probes)
+        return is_ready
+    # end def _wait_readiness
+
     def _build_feature_cache(self):
         """
         Create a cache with the feature index, id and version for the 0x1D4B Wireless device status
@@ -1886,6 +1970,12 @@ class DeviceBaseTestCase(CommonBaseTestCase):
 
         super().tearDown()
 
+        if self.setup_timings is not None:
+            LogHelper.log_trace(test_case=self, msg=f"Basetest {self.setup_timings}")
+            LogHelper.log_trace(test_case=self, msg=f"Setup phases over the session:\n"
+                                                    f"{SetupTimings.get_totals_report()}")
+        # end if
+
         if PRINT_TEST_TIMINGS:
             # Noqa is used to avoid the error marking due to start_time being set in an if
             sys.stdout.write(f"Basetest teardown took {time() - start_time}s\n")  # noqa
@@ -2277,8 +2367,16 @@ class DeviceBaseTestCase(CommonBaseTestCase):
                             queue_name=HIDDispatcher.QueueName.HID,
                             class_type=(HidMouse, HidKeyboard))
                     elif recover_time_needed:
-                        # Let some time for the device to recover after its internal reset
-                        sleep(.5)
+                        if self.USE_READINESS_PROBES:
+                            # The device has recovered after its internal reset when it answers. The probe empties
+                            # the important and error queues from its responses
+                            probe = ReadinessProbe.root_ping(test_case=self)
+                            self.assertTrue(expr=probe.wait(timeout=self.READINESS_TIMEOUT),
+                                            msg=f"The device did not recover after its reset: {probe}")
+                        else:
+                            # Let some time for the device to recover after its internal reset
+                            sleep(self.RECOVER_TIME)
+                        # end if
                     # end if
                 # end if
 
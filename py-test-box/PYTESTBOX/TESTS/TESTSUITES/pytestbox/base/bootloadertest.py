@@ -389,6 +389,8 @@ class DeviceBootloaderTestCase(CommonBootloaderTestCase, DeviceBaseTestCase):
     - bootloader supporting HID++ 2.0 protocol
     - application supporting HID++ 1.0 protocol
     """
+    # The DUT jumps between its bootloader and its application, their feature tables differ
+    USE_FEATURE_MAPPING_CACHE = False
 
     def dut_jump_on_bootloader(self, action_type=None):
         """
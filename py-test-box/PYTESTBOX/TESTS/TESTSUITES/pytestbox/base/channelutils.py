@@ -29,7 +29,11 @@ from pyharness.extensions import WarningLevel
 from pyhid.bitfieldcontainermixin import TimestampedBitFieldContainerMixin
 from pyhid.hid.interfacedescriptors import ReportDescriptor
 from pyhid.hiddispatcher import HIDDispatcher
+from pyhid.hidpp.features.common.deviceinformation import DeviceInformation
+from pyhid.hidpp.features.common.deviceinformation import DeviceInformationFactory
 from pyhid.hidpp.features.error import Hidpp1ErrorCodes
+from pyhid.hidpp.features.featureset import FeatureSet
+from pyhid.hidpp.features.featureset import FeatureSetFactory
 from pyhid.hidpp.features.root import Root
 from pyhid.hidpp.features.root import RootModel
 from pyhid.hidpp.features.root import RootFactory
@@ -46,6 +50,7 @@ from pylibrary.tools.hexlist import HexList
 from pylibrary.tools.numeral import Numeral
 from pylibrary.tools.numeral import to_int
 from pylibrary.tools.threadutils import QueueEmpty
+from pytestbox.base.featuremappingcache import FeatureMappingCache
 from pytestbox.base.loghelper import LogHelper
 from pyusb.libusbdriver import ChannelIdentifier
 from pyusb.libusbdriver import LibusbDriver
@@ -68,6 +73,8 @@ class ChannelUtils:
     GENERIC_RESET_TIMEOUT = 15  # in seconds
     WAIT_CONNECTION_STATE_PERIOD = 0.1  # in seconds
     UPDATE_FEATURE_MAPPING_RETRY_COUNTER = 3
+    # 0x0001 FeatureSet flags of the features which can be deactivated, their index is always asked to the device
+    DEACTIVATABLE_FEATURE_FLAGS = ('engineering_hidden', 'engineering', 'manuf_deact', 'compl_deact')
 
     @staticmethod
     @contextmanager
@@ -480,6 +487,15 @@ class ChannelUtils:
         channel = channel if channel is not None else test_case.current_channel
         assert channel is not None, "No channel was given and current channel is not initialized"
 
+        # The feature table validated in the test setup spares the Root request
+        feature_entry = FeatureMappingCache.get_feature_entry(channel=channel, feature_id=feature_id)
+        if feature_entry is not None:
+            feature_index, feature_version = feature_entry
+            channel.hid_dispatcher.add_feature_entry(
+                feature_index=feature_index, feature_id=feature_id, feature_version=feature_version)
+            return feature_index
+        # end if
+
         # Get the 0x0000 root feature object
         root_feature = RootFactory.create(
             test_case.config_manager.get_feature_version(test_case.f.PRODUCT.FEATURES.IMPORTANT.ROOT))
@@ -562,6 +578,295 @@ class ChannelUtils:
         return Root.FEATURE_NOT_FOUND
     # end def update_feature_mapping
 
+    @classmethod
+    def load_feature_mapping(cls, test_case, channel=None):
+        """
+        Load the whole feature table of the DUT in the internal ``HidDispatcher``, from the persistent
+        ``FeatureMappingCache`` when possible. Until the end of the test, ``update_feature_mapping`` then gets the
+        feature indexes from this table without any request.
+
+        The device identity (0x0003 unit ID and active firmware, transport) is read once per transport in the process.
+        A cached table is checked with a 0x0001 FeatureSet count request and a 0x0003 DeviceInformation active firmware
+        request: the device identity, then the feature table, are read again only if this check fails.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use. If ``None``, ``test_case.current_channel`` is used - OPTIONAL
+        :type channel: ``BaseCommunicationChannel`` or ``None``
+
+        :return: Flag indicating if the feature table is loaded, ``False`` if the device does not support 0x0003 or
+                 0x0001 version 1 or above
+        :rtype: ``bool``
+
+        :raise ``AssertionError``: If no channel was given and current channel is not initialized
+        """
+        channel = channel if channel is not None else test_case.current_channel
+        assert channel is not None, "No channel was given and current channel is not initialized"
+
+        FeatureMappingCache.invalidate(channel=channel)
+        path = FeatureMappingCache.get_path(test_case=test_case)
+        transport = FeatureMappingCache.get_transport(channel=channel)
+
+        identity_entry = FeatureMappingCache.get_identity(transport=transport)
+        if identity_entry is not None:
+            identity, entity_index, firmware = identity_entry
+            if cls._load_cached_feature_table(test_case=test_case, channel=channel, path=path, identity=identity,
+                                              entity_index=entity_index, firmware=firmware):
+                return True
+            # end if
+        # end if
+
+        # Unknown device, firmware or feature table changed, read the device identity again
+        identity_entry = cls._get_device_identity(test_case=test_case, channel=channel, transport=transport)
+        if identity_entry is None:
+            FeatureMappingCache.set_identity(transport=transport, identity=None)
+            return False
+        # end if
+        identity, entity_index, firmware = identity_entry
+        FeatureMappingCache.set_identity(
+            transport=transport, identity=identity, entity_index=entity_index, firmware=firmware)
+
+        if cls._load_cached_feature_table(test_case=test_case, channel=channel, path=path, identity=identity):
+            return True
+        # end if
+
+        feature_table = cls._get_feature_table(test_case=test_case, channel=channel)
+        if feature_table is None:
+            return False
+        # end if
+
+        feature_count, features = feature_table
+        FeatureMappingCache.set_table(path=path, identity=identity, feature_count=feature_count, features=features)
+        for feature_index, feature_id, feature_version in features:
+            channel.hid_dispatcher.add_feature_entry(
+                feature_index=feature_index, feature_id=feature_id, feature_version=feature_version)
+        # end for
+        FeatureMappingCache.validate(channel=channel, features=features)
+        return True
+    # end def load_feature_mapping
+
+    @classmethod
+    def _load_cached_feature_table(cls, test_case, channel, path, identity, entity_index=None, firmware=None):
+        """
+        Load the cached feature table of a device in the internal ``HidDispatcher`` if the 0x0001 FeatureSet count of
+        the DUT matches it, and if its active firmware is still the one of the identity.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use
+        :type channel: ``BaseCommunicationChannel``
+        :param path: The path of the cache file
+        :type path: ``str``
+        :param identity: The device identity
+        :type identity: ``str``
+        :param entity_index: The 0x0003 index of the active entity, if ``None`` the firmware is not checked, the
+                             identity being just read - OPTIONAL
+        :type entity_index: ``int`` or ``None``
+        :param firmware: The active firmware of the identity - OPTIONAL
+        :type firmware: ``str`` or ``None``
+
+        :return: Flag indicating if the feature table is loaded
+        :rtype: ``bool``
+        """
+        feature_table = FeatureMappingCache.get_table(path=path, identity=identity)
+        if feature_table is None:
+            return False
+        # end if
+
+        feature_count, features = feature_table
+        feature_set_entries = [(feature_index, feature_version) for feature_index, feature_id, feature_version
+                               in features if feature_id == FeatureSet.FEATURE_ID]
+        if len(feature_set_entries) == 0:
+            return False
+        # end if
+
+        feature_set_index, feature_set_version = feature_set_entries[0]
+        channel.hid_dispatcher.add_feature_entry(
+            feature_index=feature_set_index, feature_id=FeatureSet.FEATURE_ID, feature_version=feature_set_version)
+        if cls._get_feature_count(test_case=test_case, channel=channel, feature_set_index=feature_set_index,
+                                  feature_set_version=feature_set_version) != feature_count:
+            return False
+        # end if
+
+        if entity_index is not None:
+            # The firmware can be changed without changing the feature count (DFU, debugger flash in another process)
+            device_information_entries = [
+                (feature_index, feature_version) for feature_index, feature_id, feature_version in features
+                if feature_id == DeviceInformation.FEATURE_ID]
+            if len(device_information_entries) == 0:
+                return False
+            # end if
+
+            feature_index, feature_version = device_information_entries[0]
+            channel.hid_dispatcher.add_feature_entry(
+                feature_index=feature_index, feature_id=DeviceInformation.FEATURE_ID, feature_version=feature_version)
+            if cls._get_active_firmware(test_case=test_case, channel=channel, feature_index=feature_index,
+                                        feature_version=feature_version, entity_index=entity_index) != firmware:
+                return False
+            # end if
+        # end if
+
+        for feature_index, feature_id, feature_version in features:
+            channel.hid_dispatcher.add_feature_entry(
+                feature_index=feature_index, feature_id=feature_id, feature_version=feature_version)
+        # end for
+        FeatureMappingCache.validate(channel=channel, features=features)
+        return True
+    # end def _load_cached_feature_table
+
+    @classmethod
+    def _get_device_identity(cls, test_case, channel, transport):
+        """
+        Get the identity of the DUT: 0x0003 DeviceInformation unit ID and active firmware, and transport.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use
+        :type channel: ``BaseCommunicationChannel``
+        :param transport: The transport identifier
+        :type transport: ``str``
+
+        :return: The device identity, the index of the active entity and its firmware, ``None`` if 0x0003 is not
+                 supported or no entity is active
+        :rtype: ``tuple[str, int, str]`` or ``None``
+        """
+        feature_index = cls.update_feature_mapping(
+            test_case=test_case, feature_id=DeviceInformation.FEATURE_ID, channel=channel, skip_not_found=True)
+        if feature_index == Root.FEATURE_NOT_FOUND:
+            return None
+        # end if
+
+        _, feature_version = channel.hid_dispatcher.get_feature_entry_by_index(feature_index=feature_index)
+        device_information = DeviceInformationFactory.create(feature_version)
+
+        device_info = cls.send(
+            test_case=test_case,
+            channel=channel,
+            report=device_information.get_device_info_cls(
+                cls.get_device_index(test_case=test_case, channel=channel), feature_index),
+            response_queue_name=HIDDispatcher.QueueName.COMMON,
+            response_class_type=device_information.get_device_info_response_cls)
+
+        for entity_index in range(to_int(device_info.entity_count)):
+            firmware = cls._get_active_firmware(test_case=test_case, channel=channel, feature_index=feature_index,
+                                                feature_version=feature_version, entity_index=entity_index)
+            if firmware is not None:
+                return f"{HexList(device_info.unit_id)}_{firmware}_{transport}", entity_index, firmware
+            # end if
+        # end for
+        return None
+    # end def _get_device_identity
+
+    @classmethod
+    def _get_active_firmware(cls, test_case, channel, feature_index, feature_version, entity_index):
+        """
+        Get the firmware of an entity of the DUT with 0x0003 DeviceInformation, if it is the active one.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use
+        :type channel: ``BaseCommunicationChannel``
+        :param feature_index: The 0x0003 feature index
+        :type feature_index: ``int``
+        :param feature_version: The 0x0003 feature version
+        :type feature_version: ``int``
+        :param entity_index: The entity index
+        :type entity_index: ``int``
+
+        :return: The firmware prefix, number, revision and build, ``None`` if the entity is not active
+        :rtype: ``str`` or ``None``
+        """
+        device_information = DeviceInformationFactory.create(feature_version)
+        fw_info = cls.send(
+            test_case=test_case,
+            channel=channel,
+            report=device_information.get_fw_info_cls(
+                cls.get_device_index(test_case=test_case, channel=channel), feature_index, entity_index=entity_index),
+            response_queue_name=HIDDispatcher.QueueName.COMMON,
+            response_class_type=device_information.get_fw_info_response_cls)
+        if not to_int(fw_info.active):
+            return None
+        # end if
+        return f"{HexList(fw_info.fw_prefix)}{HexList(fw_info.fw_number)}_{HexList(fw_info.fw_revision)}_" \
+               f"{HexList(fw_info.fw_build)}"
+    # end def _get_active_firmware
+
+    @classmethod
+    def _get_feature_count(cls, test_case, channel, feature_set_index, feature_set_version):
+        """
+        Get the 0x0001 FeatureSet feature count of the DUT.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use
+        :type channel: ``BaseCommunicationChannel``
+        :param feature_set_index: The 0x0001 feature index
+        :type feature_set_index: ``int``
+        :param feature_set_version: The 0x0001 feature version
+        :type feature_set_version: ``int``
+
+        :return: The feature count, the Root feature excluded
+        :rtype: ``int``
+        """
+        feature_set = FeatureSetFactory.create(feature_set_version)
+        response = cls.send(
+            test_case=test_case,
+            channel=channel,
+            report=feature_set.get_count_cls(deviceIndex=cls.get_device_index(test_case=test_case, channel=channel),
+                                             featureId=feature_set_index),
+            response_queue_name=HIDDispatcher.QueueName.IMPORTANT,
+            response_class_type=feature_set.get_count_response_cls)
+        return to_int(response.count)
+    # end def _get_feature_count
+
+    @classmethod
+    def _get_feature_table(cls, test_case, channel):
+        """
+        Read the feature table of the DUT with 0x0001 FeatureSet. The features which can be deactivated are not part of
+        the table.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use
+        :type channel: ``BaseCommunicationChannel``
+
+        :return: The feature count and the list of (feature index, feature ID, feature version), ``None`` if 0x0001 is
+                 not supported or does not give the feature versions (version 0)
+        :rtype: ``tuple[int, list[tuple[int, int, int]]]`` or ``None``
+        """
+        feature_set_index = cls.update_feature_mapping(
+            test_case=test_case, feature_id=FeatureSet.FEATURE_ID, channel=channel, skip_not_found=True)
+        if feature_set_index == Root.FEATURE_NOT_FOUND:
+            return None
+        # end if
+
+        _, feature_set_version = channel.hid_dispatcher.get_feature_entry_by_index(feature_index=feature_set_index)
+        if feature_set_version == 0:
+            return None
+        # end if
+
+        feature_set = FeatureSetFactory.create(feature_set_version)
+        device_index = cls.get_device_index(test_case=test_case, channel=channel)
+        feature_count = cls._get_feature_count(test_case=test_case, channel=channel,
+                                               feature_set_index=feature_set_index,
+                                               feature_set_version=feature_set_version)
+        features = []
+        for feature_index in range(1, feature_count + 1):
+            response = cls.send(
+                test_case=test_case,
+                channel=channel,
+                report=feature_set.get_feature_id_cls(
+                    deviceIndex=device_index, featureId=feature_set_index, feature_index_to_get=feature_index),
+                response_queue_name=HIDDispatcher.QueueName.IMPORTANT,
+                response_class_type=feature_set.get_feature_id_response_cls)
+            if any(to_int(getattr(response, flag, 0)) for flag in cls.DEACTIVATABLE_FEATURE_FLAGS):
+                continue
+            # end if
+            features.append((feature_index, to_int(response.feature_id), to_int(response.feature_version)))
+        # end for
+        return feature_count, features
+    # end def _get_feature_table
+
     @classmethod
     def update_vlp_feature_mapping(cls, test_case, feature_id, channel=None, skip_not_found=False):
         """
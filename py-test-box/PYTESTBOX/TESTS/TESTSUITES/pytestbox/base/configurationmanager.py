@@ -94,6 +94,22 @@ class ConfigurationManager(ConfigurationManagerInterface):
         self._current_target = None
         self._cache = self.Cache(features)
         self._gaming_cache = self.GamingCache(features)
+        # Feature value map built once for the features given by ``_feature_value_map_features``
+        self._feature_value_map = None
+        self._feature_value_map_features = None
+        # Feature values resolved when first requested, by (mode, protocol, target), the current one being invalidated
+        # by the setters
+        self._compiled_views = {}
+        self._current_view = None
+        self.feature_hit_count = 0
+        self.feature_miss_count = 0
+        # Feature versions by feature configuration id, the configuration being kept in the value so that its id is
+        # not reused while this configuration manager exists
+        self._feature_versions = {}
+        self.feature_version_hit_count = 0
+        self.feature_version_miss_count = 0
+        # The static get_feature_version stays available on the class, the instance calls use the memoized versions
+        self.get_feature_version = self._get_memoized_feature_version
     # end class features
 
     @property
@@ -111,6 +127,7 @@ class ConfigurationManager(ConfigurationManagerInterface):
         """
         if mode in self.MODE:
             self._current_mode = mode
+            self._current_view = None
         else:
             raise ValueError("Unknown mode")
         # end if
@@ -131,6 +148,7 @@ class ConfigurationManager(ConfigurationManagerInterface):
         """
         if isinstance(protocol, LogitechProtocol):
             self._current_protocol = protocol
+            self._current_view = None
         else:
             raise ValueError("Unknown communication protocol")
     # end def _current_protocol$
@@ -169,6 +187,7 @@ class ConfigurationManager(ConfigurationManagerInterface):
         """
         if target in self.TARGET:
             self._current_target = target
+            self._current_view = None
         else:
             raise ValueError("Unknown target")
         # end if
@@ -178,7 +197,47 @@ class ConfigurationManager(ConfigurationManagerInterface):
     def feature_value_map(self):
         """
         Get the mapping of expected feature value
-        This map is readonly
+        This map is readonly, it is built once for the context features
+        """
+        if self._feature_value_map_features is not self.features:
+            self._feature_value_map = self._build_feature_value_map()
+            self._feature_value_map_features = self.features
+            self._compiled_views = {}
+            self._current_view = None
+        # end if
+        return self._feature_value_map
+    # end def feature_value_map
+
+    @property
+    def feature_hit_rate(self):
+        """
+        Rate of the ``get_feature`` calls answered from the values already resolved in the current context
+
+        :return: The hit rate between 0 and 1, ``None`` if ``get_feature`` was not called
+        :rtype: ``float`` or ``None``
+        """
+        count = self.feature_hit_count + self.feature_miss_count
+        return self.feature_hit_count / count if count > 0 else None
+    # end def feature_hit_rate
+
+    @property
+    def feature_version_hit_rate(self):
+        """
+        Rate of the ``get_feature_version`` calls answered from the memoized versions
+
+        :return: The hit rate between 0 and 1, ``None`` if ``get_feature_version`` was not called
+        :rtype: ``float`` or ``None``
+        """
+        count = self.feature_version_hit_count + self.feature_version_miss_count
+        return self.feature_version_hit_count / count if count > 0 else None
+    # end def feature_version_hit_rate
+
+    def _build_feature_value_map(self):
+        """
+        Build the mapping of expected feature value from the context features
+
+        :return: The mapping of expected feature value
+        :rtype: ``dict``
         """
         root_features = self.features.PRODUCT.FEATURES.IMPORTANT.ROOT
         feature_set_features = self.features.PRODUCT.FEATURES.IMPORTANT.FEATURE_SET
@@ -460,24 +519,62 @@ class ConfigurationManager(ConfigurationManagerInterface):
             self.ID.DUAL_BANK_IMAGE_HEADERS: self._cache.dual_bank_image_headers,
             self.ID.LOGI_MCU_BOOT_GIT_HASH: self._cache.logi_mcu_boot_git_hash,
         }
-    # end def feature_value_map
+    # end def _build_feature_value_map
 
     def get_feature(self, feature_id):
         # See ``ConfigurationManagerInterface.get_feature``
-        return self._resolve_dependency(feature_id, self.feature_value_map)
+        feature_value_map = self.feature_value_map
+        if self._current_view is None:
+            context = (self.current_mode, self.current_protocol, self.current_target)
+            self._current_view = self._compiled_views.setdefault(context, {})
+        # end if
+
+        if feature_id in self._current_view:
+            self.feature_hit_count += 1
+            return self._current_view[feature_id]
+        # end if
+
+        # Only the requested feature is resolved, then kept for the current context
+        self.feature_miss_count += 1
+        value = self._resolve_dependency(feature_id, feature_value_map)
+        self._current_view[feature_id] = value
+        return value
     # end def get_feature
 
     @staticmethod
     def get_feature_version(feature_config):
         # See ``ConfigurationManagerInterface.get_feature_version``
-        try:
-            return int(match(r"F_Version_(.*)", [version for version in dir(feature_config) if match(
-                r"F_Version_.*", version) and getattr(feature_config, version)][0]).group(1))
-        except IndexError:
-            return None
-        # end try
+        for name in dir(feature_config):
+            if name.startswith("F_Version_") and getattr(feature_config, name):
+                return int(name[len("F_Version_"):])
+            # end if
+        # end for
+        return None
     # end get_feature_version
 
+    def _get_memoized_feature_version(self, feature_config):
+        """
+        Get the version of a feature from the versions already found by this configuration manager. It replaces
+        ``get_feature_version`` on the instances.
+
+        :param feature_config: Feature SubSystem
+        :type feature_config: ``AbstractSubSystem``
+
+        :return: feature version enabled in SubSystem
+        :rtype: ``int``
+        """
+        cached = self._feature_versions.get(id(feature_config))
+        if cached is not None and cached[0] is feature_config:
+            self.feature_version_hit_count += 1
+            return cached[1]
+        # end if
+
+        self.feature_version_miss_count += 1
+        version = ConfigurationManager.get_feature_version(feature_config)
+        self._feature_versions[id(feature_config)] = (feature_config, version)
+        return version
+    # end def _get_memoized_feature_version
+
     @staticmethod
     def str_to_bool(keyword):
         """
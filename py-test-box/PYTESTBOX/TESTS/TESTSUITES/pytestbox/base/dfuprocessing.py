@@ -14,16 +14,21 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # imports
 # ----------------------------------------------------------------------------------------------------------------------
+from collections import deque
 from os.path import join
+from time import perf_counter
 
 import pysetup
+from pychannel.channelinterfaceclasses import BaseCommunicationChannel
 from pyhid.hidpp.features.common.dfu import Dfu
 from pyhid.hidpp.features.common.dfu import DfuCmdDataXCmd1or2
 from pyhid.hidpp.features.common.dfu import DfuFactory
 from pyhid.hidpp.features.common.dfu import DfuStartV0
 from pyhid.hidpp.features.common.dfu import DfuStatusEvent
 from pyhid.hidpp.features.common.dfu import DfuStatusResponse
+from pyhid.hiddispatcher import HIDDispatcher
 from pyhid.tools.dfufileparser import DfuFileParser
+from pyhid.tools.dfufileparser import DfuFileReports
 from pylibrary.tools.hexlist import HexList
 from pylibrary.tools.numeral import Numeral
 from pytestbox.base.bootloadertest import CommonBootloaderTestCase
@@ -43,6 +48,12 @@ class CommonDfuTestCase(CommonBootloaderTestCase):
     """
     DFU_APP = 'application'
     DFU_IMAGE = 'images'
+    # Number of program data packets sent before getting their dfuStatus responses. The responses are matched by
+    # their packet number, and the function index of the packets cycles on 4 values: it should not be over 4.
+    # 1 is the stop-and-wait flow control, a larger window shall be validated on the hardware setup first
+    DFU_PROGRAM_DATA_WINDOW = 1
+    # Time between two checks of the error queue while waiting for a dfuStatus response, in seconds
+    DFU_RESPONSE_POLLING_PERIOD = 0.05
 
     # WARNING: This class is reserved for the use of the python API.
     # It is NOT related to any specifications (feature 0x0003 for example)
@@ -901,6 +912,7 @@ class CommonDfuTestCase(CommonBootloaderTestCase):
         self.post_requisite_program_mcu_initial_state = True
         self.post_requisite_restart_in_main_application = False
         sequence_number = 0
+        window = self.DFU_PROGRAM_DATA_WINDOW
 
         if encrypt_algorithm is not None:
             if log_step > 0:
@@ -921,6 +933,19 @@ class CommonDfuTestCase(CommonBootloaderTestCase):
             # end if
         # end if
 
+        # Without a log per packet, the program data packets are streamed from their reports
+        stream_program_data = log_step <= 0 and log_check <= 0
+        if not stream_program_data:
+            dfu_file_reports = None
+        elif encrypt_algorithm is not None:
+            dfu_file_reports = DfuFileReports.from_dfu_file_parser(dfu_file_parser)
+        else:
+            dfu_file_reports = DfuFileParser.get_dfu_file_reports(
+                dfu_file_path=dfu_file_path,
+                device_index=int(Numeral(self.deviceIndex)),
+                dfu_feature_index=int(Numeral(bootloader_dfu_feature_id)))
+        # end if
+
         if log_step > 0:
             # ----------------------------------------------------------------------------------------------------------
             self.logTitle2(f'Test Step {log_step}: Send dfuStart : 16 first bytes of Regular_application.dfu file')
@@ -948,7 +973,7 @@ class CommonDfuTestCase(CommonBootloaderTestCase):
 
         sequence_number += 1
 
-        for (cmd_1, program_data_list) in dfu_file_parser.command_1:
+        for command_1_index, (cmd_1, program_data_list) in enumerate(dfu_file_parser.command_1):
             if log_step > 0:
                 # ------------------------------------------------------------------------------------------------------
                 self.logTitle2(f'Test Step {log_step}: Send dfuCmdData1 : next 16 bytes of Regular_application.dfu '
@@ -979,6 +1004,13 @@ class CommonDfuTestCase(CommonBootloaderTestCase):
                                f'{len(program_data_list)}, packet number should start at 1')
                 # ------------------------------------------------------------------------------------------------------
             # end if
+            if stream_program_data:
+                program_data_reports = dfu_file_reports.command_1[command_1_index][1]
+                window = self.send_dfu_data_packets(
+                    reports=program_data_reports, first_packet_number=sequence_number, window=window)
+                sequence_number += len(program_data_reports)
+                program_data_list = []
+            # end if
             for i in range(len(program_data_list)):
                 if log_step > 0:
                     # --------------------------------------------------------------------------------------------------
@@ -1173,6 +1205,147 @@ class CommonDfuTestCase(CommonBootloaderTestCase):
         # end if
     # end def wait_for_dfu_status
 
+    def send_dfu_data_packets(self, reports, first_packet_number, window=None, timeout=30):
+        """
+        Send DFU data packets with up to ``window`` packets waiting for their dfuStatus response, and check that each
+        packet gets a packet success status. The responses are matched with the packets by their packet number, in
+        any order.
+
+        The window is stopped on a wait for event response: the responses of the packets already sent are received,
+        then the dfuStatus events are matched with the packets answered wait for event, in their order. The packets
+        answered command in progress while the bootloader was busy are sent again after the events, and the next
+        packets are sent one at a time. An error response stops the window and fails the test.
+
+        :param reports: The reports of the data packets
+        :type reports: ``list[bytes]``
+        :param first_packet_number: The packet number of the first data packet
+        :type first_packet_number: ``int``
+        :param window: The maximum number of packets waiting for their response, 1 to wait for each response before
+                       sending the next packet. If ``None``, ``DFU_PROGRAM_DATA_WINDOW`` is used - OPTIONAL
+        :type window: ``int`` or ``None``
+        :param timeout: The timeout to wait for a dfuStatus event - OPTIONAL
+        :type timeout: ``int``
+
+        :return: The window to use for the next data packets of the DFU
+        :rtype: ``int``
+        """
+        window = window if window is not None else self.DFU_PROGRAM_DATA_WINDOW
+        assert 0 < window <= 4, f"The DFU window should be from 1 to 4 packets, {window} is not"
+
+        next_index = 0
+        # Packets sent and waiting for their dfuStatus response
+        pending_packet_numbers = deque()
+        # Packets answered wait for event, waiting for their dfuStatus event in this order
+        wait_for_event_packet_numbers = deque()
+        # Packets answered command in progress, to send again after the events
+        retransmit_packet_numbers = []
+        while next_index < len(reports) or len(pending_packet_numbers) > 0 or len(retransmit_packet_numbers) > 0:
+            while len(wait_for_event_packet_numbers) == 0 and len(pending_packet_numbers) < window and \
+                    (len(retransmit_packet_numbers) > 0 or next_index < len(reports)):
+                if len(retransmit_packet_numbers) > 0:
+                    packet_number = retransmit_packet_numbers.pop(0)
+                else:
+                    packet_number = first_packet_number + next_index
+                    next_index += 1
+                # end if
+                ChannelUtils.send_only(test_case=self, report=HexList(reports[packet_number - first_packet_number]))
+                pending_packet_numbers.append(packet_number)
+            # end while
+
+            dfu_status_response = self._get_dfu_data_packet_response(pending_packet_numbers=pending_packet_numbers)
+            packet_number = int(Numeral(dfu_status_response.pkt_nb))
+            self.assertIn(member=packet_number, container=pending_packet_numbers,
+                          msg=f"Unexpected Dfu packet number, waiting for {list(pending_packet_numbers)}")
+            pending_packet_numbers.remove(packet_number)
+
+            status = int(Numeral(dfu_status_response.status))
+            if status in DfuStatusResponse.StatusValue.WAIT_FOR_EVENT:
+                # The bootloader needs the stop-and-wait flow control
+                self.logTrace(msg=f"Wait for event on packet {packet_number}, continue with a window of 1 packet")
+                window = 1
+                wait_for_event_packet_numbers.append(packet_number)
+            elif status in DfuStatusResponse.StatusValue.COMMAND_IN_PROGRESS and \
+                    len(wait_for_event_packet_numbers) > 0:
+                # Packet sent while the bootloader was busy with a packet answered wait for event
+                retransmit_packet_numbers.append(packet_number)
+            else:
+                self.wait_for_dfu_status(dfu_status_response=dfu_status_response,
+                                         status=DfuStatusResponse.StatusValue.PACKET_SUCCESS,
+                                         packet_number=packet_number)
+            # end if
+
+            if len(pending_packet_numbers) == 0:
+                self._wait_for_dfu_status_events(packet_numbers=wait_for_event_packet_numbers, timeout=timeout)
+                retransmit_packet_numbers.sort()
+            # end if
+        # end while
+
+        return window
+    # end def send_dfu_data_packets
+
+    def _get_dfu_data_packet_response(self, pending_packet_numbers):
+        """
+        Get the dfuStatus response of a DFU data packet, the error queue being checked while waiting for it.
+
+        :param pending_packet_numbers: The packets waiting for their response
+        :type pending_packet_numbers: ``deque[int]``
+
+        :return: The dfuStatus response
+        :rtype: ``DfuStatusResponse``
+
+        :raise ``AssertionError``: If an error response is received, or if no response is received in time
+        """
+        deadline = perf_counter() + BaseCommunicationChannel.GENERIC_GET_TIMEOUT
+        while True:
+            error_response = ChannelUtils.get_only(
+                test_case=self, queue_name=HIDDispatcher.QueueName.ERROR, timeout=0, allow_no_message=True)
+            self.assertNone(obtained=error_response,
+                            msg=f"Error response to the Dfu packets {list(pending_packet_numbers)}")
+
+            remaining_time = deadline - perf_counter()
+            dfu_status_response = ChannelUtils.get_only(
+                test_case=self, queue_name=HIDDispatcher.QueueName.COMMON, class_type=DfuStatusResponse,
+                timeout=max(min(self.DFU_RESPONSE_POLLING_PERIOD, remaining_time), 0), allow_no_message=True)
+            if dfu_status_response is not None:
+                return dfu_status_response
+            # end if
+
+            self.assertTrue(expr=remaining_time > 0,
+                            msg=f"No dfuStatus response to the Dfu packets {list(pending_packet_numbers)}")
+        # end while
+    # end def _get_dfu_data_packet_response
+
+    def _wait_for_dfu_status_events(self, packet_numbers, timeout):
+        """
+        Wait for the dfuStatus events of the packets answered wait for event. Each event is matched with its packet
+        by its packet number, and shall have a packet success status.
+
+        :param packet_numbers: The packets answered wait for event, in the order of their responses. They are
+                               removed when their event is received
+        :type packet_numbers: ``deque[int]``
+        :param timeout: The timeout to wait for a dfuStatus event
+        :type timeout: ``int``
+        """
+        while len(packet_numbers) > 0:
+            message = self.getMessage(queue=self.hidDispatcher.event_message_queue, timeout=timeout)
+            if not isinstance(message, DfuStatusEvent):
+                continue
+            # end if
+
+            packet_number = int(Numeral(message.pkt_nb))
+            self.assertIn(member=packet_number, container=packet_numbers,
+                          msg=f"Unexpected Dfu event packet number, waiting for {list(packet_numbers)}")
+            if int(Numeral(message.status)) in DfuStatusResponse.StatusValue.WAIT_FOR_EVENT:
+                continue
+            # end if
+
+            self.wait_for_dfu_status(dfu_status_response=message,
+                                     status=DfuStatusResponse.StatusValue.PACKET_SUCCESS,
+                                     packet_number=packet_number)
+            packet_numbers.remove(packet_number)
+        # end while
+    # end def _wait_for_dfu_status_events
+
     def get_dfu_version(self):
         """
         Get the Dfu supported version.
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------
+"""
+:package: pytestbox.base.featuremappingcache
+:brief: Persistent cache of the device feature tables, keyed by device identity
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from json import JSONDecodeError
+from json import dump
+from json import load
+from os import makedirs
+from os import replace
+from os.path import dirname
+from os.path import exists
+from os.path import join
+from threading import RLock
+from weakref import WeakKeyDictionary
+
+from pyharness.debuggers.nvsdebugger import NvsDebugger
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+class FeatureMappingCache:
+    """
+    Cache of the feature tables (feature index, feature ID and feature version) read from the devices.
+
+    The tables are saved in a JSON file of the output directory, keyed by the device identity: unit ID, active firmware
+    and transport. The identity of the device on each transport is kept for the whole process, so that a table can be
+    reused by the next tests after a 0x0001 FeatureSet count check and a 0x0003 DeviceInformation active firmware
+    check. It is forgotten when the firmware of a device is changed in the process: at the DFU restart, and at the
+    first use of the cache after a debugger flash write (counted by ``NvsDebugger.flash_write_count``).
+
+    Only the channels whose table was validated in the current test are served by ``get_feature_entry``.
+    """
+    FILE_NAME = 'feature_mapping_cache.json'
+
+    _lock = RLock()
+    # Content of the cache files, per file path: {identity: {'feature_count': int, 'features': [[index, id, version]]}}
+    _files = {}
+    # Device identity, active entity index and active firmware per transport, read once in the process
+    _identities = {}
+    # Feature ID to (feature index, feature version) of the channels validated in the current test
+    _validated_channels = WeakKeyDictionary()
+    # Debugger flash write count when the identities and the validated channels were last checked
+    _flash_write_count = 0
+
+    hit_count = 0
+    miss_count = 0
+
+    @classmethod
+    def get_path(cls, test_case):
+        """
+        Get the path of the cache file.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+
+        :return: The path of the cache file
+        :rtype: ``str``
+        """
+        return join(test_case.getContext().getOutputDir(), cls.FILE_NAME)
+    # end def get_path
+
+    @staticmethod
+    def get_transport(channel):
+        """
+        Get the transport part of the device identity.
+
+        :param channel: The channel
+        :type channel: ``BaseCommunicationChannel``
+
+        :return: The transport identifier
+        :rtype: ``str``
+        """
+        return f"{type(channel).__name__}:{int(channel.protocol)}"
+    # end def get_transport
+
+    @classmethod
+    def get_identity(cls, transport):
+        """
+        Get the device identity last read on a transport.
+
+        :param transport: The transport identifier
+        :type transport: ``str``
+
+        :return: The device identity, its active entity index and its active firmware, ``None`` if it was not read in
+                 the process
+        :rtype: ``tuple[str, int, str]`` or ``None``
+        """
+        cls._check_flash_writes()
+        return cls._identities.get(transport)
+    # end def get_identity
+
+    @classmethod
+    def set_identity(cls, transport, identity, entity_index=None, firmware=None):
+        """
+        Set the device identity read on a transport.
+
+        :param transport: The transport identifier
+        :type transport: ``str``
+        :param identity: The device identity, ``None`` to forget it
+        :type identity: ``str`` or ``None``
+        :param entity_index: The 0x0003 index of the active entity - OPTIONAL
+        :type entity_index: ``int`` or ``None``
+        :param firmware: The active firmware (prefix, number, revision and build) - OPTIONAL
+        :type firmware: ``str`` or ``None``
+        """
+        if identity is None:
+            cls._identities.pop(transport, None)
+        else:
+            cls._identities[transport] = (identity, entity_index, firmware)
+        # end if
+    # end def set_identity
+
+    @classmethod
+    def get_table(cls, path, identity):
+        """
+        Get the feature table of a device.
+
+        :param path: The path of the cache file
+        :type path: ``str``
+        :param identity: The device identity
+        :type identity: ``str``
+
+        :return: The feature count given by 0x0001 FeatureSet and the list of (feature index, feature ID, feature
+                 version), ``None`` if the device is not in the cache
+        :rtype: ``tuple[int, list[tuple[int, int, int]]]`` or ``None``
+        """
+        with cls._lock:
+            entry = cls._load_file(path).get(identity)
+        # end with
+        if entry is None:
+            return None
+        # end if
+        return entry['feature_count'], [tuple(feature) for feature in entry['features']]
+    # end def get_table
+
+    @classmethod
+    def set_table(cls, path, identity, feature_count, features):
+        """
+        Save the feature table of a device.
+
+        :param path: The path of the cache file
+        :type path: ``str``
+        :param identity: The device identity
+        :type identity: ``str``
+        :param feature_count: The feature count given by 0x0001 FeatureSet
+        :type feature_count: ``int``
+        :param features: The list of (feature index, feature ID, feature version)
+        :type features: ``list[tuple[int, int, int]]``
+        """
+        with cls._lock:
+            content = cls._load_file(path)
+            content[identity] = {'feature_count': feature_count,
+                                 'features': [list(feature) for feature in features]}
+            makedirs(dirname(path), exist_ok=True)
+            # The file is replaced at once, another process never reads a partial file
+            temporary_path = f'{path}.tmp'
+            with open(temporary_path, 'w') as temporary_file:
+                dump(content, temporary_file, indent=1, sort_keys=True)
+            # end with
+            replace(temporary_path, path)
+        # end with
+    # end def set_table
+
+    @classmethod
+    def validate(cls, channel, features):
+        """
+        Mark the feature table of a channel as valid until the end of the test.
+
+        :param channel: The channel
+        :type channel: ``BaseCommunicationChannel``
+        :param features: The list of (feature index, feature ID, feature version)
+        :type features: ``list[tuple[int, int, int]]``
+        """
+        cls._check_flash_writes()
+        cls._validated_channels[channel] = {
+            feature_id: (feature_index, feature_version) for feature_index, feature_id, feature_version in features}
+    # end def validate
+
+    @classmethod
+    def invalidate(cls, channel=None, firmware_changed=False):
+        """
+        Stop serving the feature table of a channel, at the end of a test or when its firmware changes.
+
+        :param channel: The channel, if ``None`` all the channels are invalidated - OPTIONAL
+        :type channel: ``BaseCommunicationChannel`` or ``None``
+        :param firmware_changed: Flag indicating the firmware was changed (DFU, debugger flash): the device identity
+                                 on the transport of the channel, or on all the transports if ``channel`` is ``None``,
+                                 is forgotten and read again by the next setup - OPTIONAL
+        :type firmware_changed: ``bool``
+        """
+        if channel is None:
+            cls._validated_channels.clear()
+            if firmware_changed:
+                for transport in list(cls._identities):
+                    cls.set_identity(transport=transport, identity=None)
+                # end for
+            # end if
+        else:
+            cls._validated_channels.pop(channel, None)
+            if firmware_changed:
+                cls.set_identity(transport=cls.get_transport(channel=channel), identity=None)
+            # end if
+        # end if
+    # end def invalidate
+
+    @classmethod
+    def get_feature_entry(cls, channel, feature_id):
+        """
+        Get the feature index and version of a feature from the validated table of a channel.
+
+        :param channel: The channel
+        :type channel: ``BaseCommunicationChannel``
+        :param feature_id: The feature ID
+        :type feature_id: ``int``
+
+        :return: The feature index and version, ``None`` if the table of the channel is not validated or if it does
+                 not contain the feature
+        :rtype: ``tuple[int, int]`` or ``None``
+        """
+        cls._check_flash_writes()
+        features = cls._validated_channels.get(channel)
+        if features is None:
+            return None
+        # end if
+        feature_entry = features.get(feature_id)
+        if feature_entry is None:
+            cls.miss_count += 1
+        else:
+            cls.hit_count += 1
+        # end if
+        return feature_entry
+    # end def get_feature_entry
+
+    @classmethod
+    def _check_flash_writes(cls):
+        """
+        Invalidate all the channels and forget all the device identities if a debugger wrote a device flash since the
+        last check.
+        """
+        if cls._flash_write_count != NvsDebugger.flash_write_count:
+            cls._flash_write_count = NvsDebugger.flash_write_count
+            cls.invalidate(firmware_changed=True)
+        # end if
+    # end def _check_flash_writes
+
+    @classmethod
+    def _load_file(cls, path):
+        """
+        Get the content of a cache file, read only once in the process. A missing or corrupted file is an empty cache.
+
+        :param path: The path of the cache file
+        :type path: ``str``
+
+        :return: The content of the file
+        :rtype: ``dict``
+        """
+        content = cls._files.get(path)
+        if content is None:
+            content = {}
+            if exists(path):
+                try:
+                    with open(path) as cache_file:
+                        content = load(cache_file)
+                    # end with
+                except (OSError, JSONDecodeError):
+                    content = {}
+                # end try
+            # end if
+            cls._files[path] = content
+        # end if
+        return content
+    # end def _load_file
+# end class FeatureMappingCache
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
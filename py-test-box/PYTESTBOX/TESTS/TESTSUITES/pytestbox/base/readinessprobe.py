@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------
+"""
+:package: pytestbox.base.readinessprobe
+:brief: Readiness probes waiting for concrete DUT conditions, and setup phase timings
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from contextlib import contextmanager
+from time import perf_counter
+from time import sleep
+
+from pychannel.blechannel import BleChannel
+from pychannel.throughreceiverchannel import ThroughReceiverChannel
+from pychannel.usbchannel import UsbChannel
+from pyhid.hiddispatcher import HIDDispatcher
+from pyhid.hidpp.features.common.wirelessdevicestatus import WirelessDeviceStatusBroadcastEvent
+from pyhid.hidpp.features.root import RootFactory
+from pyhid.hidpp.hidpp1.notifications.deviceconnection import DeviceConnection
+from pylibrary.tools.numeral import to_int
+from pyraspi.services.kosmos.protocol.generated.messages import SEQUENCER_STATE_RUNNING
+from pyusb.libusbdriver import LibusbDriver
+from pytestbox.base.channelutils import ChannelUtils
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+class ReadinessProbe:
+    """
+    Wait for a concrete condition of the DUT, with a deadline, instead of sleeping a fixed time.
+
+    A probe is built from a wait method, ``wait_method(timeout) -> bool``, returning as soon as the condition is met.
+    Event driven conditions (connection notification, 0x1D4B event) block on their queue, the others are polled.
+    """
+    # Time between two checks of a polled condition, in seconds
+    DEFAULT_POLLING_PERIOD = 0.02
+    # Time the plugged USB devices shall stay unchanged to be considered as enumerated, in seconds
+    USB_ENUMERATION_STABLE_TIME = 0.3
+    # Time to wait for the response to a single Root ping, in seconds
+    PING_RESPONSE_TIMEOUT = 0.2
+
+    def __init__(self, name, wait_method):
+        """
+        :param name: The probe name, used in the timing reports
+        :type name: ``str``
+        :param wait_method: The method waiting for the condition, it takes the timeout in seconds and returns a flag
+                            indicating if the condition is met
+        :type wait_method: ``callable type``
+        """
+        self.name = name
+        self._wait_method = wait_method
+        self.is_ready = None
+        # Time spent in the last wait, in seconds
+        self.elapsed = None
+    # end def __init__
+
+    def __str__(self):
+        state = 'not waited' if self.is_ready is None else 'ready' if self.is_ready else 'timeout'
+        elapsed = '' if self.elapsed is None else f' after {self.elapsed:.3f}s'
+        return f'{self.name}: {state}{elapsed}'
+    # end def __str__
+
+    def wait(self, timeout):
+        """
+        Wait for the condition.
+
+        :param timeout: The maximum time to wait, in seconds
+        :type timeout: ``float``
+
+        :return: Flag indicating if the condition is met before the deadline
+        :rtype: ``bool``
+        """
+        start = perf_counter()
+        self.is_ready = bool(self._wait_method(max(timeout, 0)))
+        self.elapsed = perf_counter() - start
+        return self.is_ready
+    # end def wait
+
+    @staticmethod
+    def wait_all(probes, timeout):
+        """
+        Wait for the conditions of several probes, one after the other, with a common deadline.
+
+        :param probes: The probes
+        :type probes: ``list[ReadinessProbe]``
+        :param timeout: The maximum time to wait for all the probes, in seconds
+        :type timeout: ``float``
+
+        :return: Flag indicating if all the conditions are met before the deadline
+        :rtype: ``bool``
+        """
+        deadline = perf_counter() + timeout
+        for probe in probes:
+            if not probe.wait(timeout=deadline - perf_counter()):
+                return False
+            # end if
+        # end for
+        return True
+    # end def wait_all
+
+    @classmethod
+    def from_condition(cls, name, condition, period=DEFAULT_POLLING_PERIOD):
+        """
+        Build a probe polling a condition.
+
+        :param name: The probe name
+        :type name: ``str``
+        :param condition: The condition, without parameter, returning a flag indicating if it is met
+        :type condition: ``callable type``
+        :param period: The time between two checks of the condition, in seconds - OPTIONAL
+        :type period: ``float``
+
+        :return: The probe
+        :rtype: ``ReadinessProbe``
+        """
+        def wait_method(timeout):
+            deadline = perf_counter() + timeout
+            while not condition():
+                remaining_time = deadline - perf_counter()
+                if remaining_time <= 0:
+                    return False
+                # end if
+                sleep(min(period, remaining_time))
+            # end while
+            return True
+        # end def wait_method
+
+        return cls(name=name, wait_method=wait_method)
+    # end def from_condition
+
+    @staticmethod
+    def get_plugged_usb_devices():
+        """
+        Get the USB devices currently plugged in.
+
+        :return: The plugged devices, as (VID, PID, reader name)
+        :rtype: ``set[tuple[int, int, str]]``
+        """
+        if LibusbDriver.USB_CONTEXT_CLASS is None:
+            return set()
+        # end if
+        return {(device.vid, device.pid, device.get_basic_reader_name())
+                for device in LibusbDriver.USB_CONTEXT_CLASS.get_plugged_devices()}
+    # end def get_plugged_usb_devices
+
+    @classmethod
+    def usb_enumeration(cls, expected_devices, stable_time=USB_ENUMERATION_STABLE_TIME, period=DEFAULT_POLLING_PERIOD):
+        """
+        Build a probe waiting for the USB devices to be enumerated: all the expected devices are plugged in and the
+        plugged devices are unchanged during ``stable_time``. The stable time covers a device reset by the debugger
+        and still listed before its disconnection is detected.
+
+        :param expected_devices: The devices which shall be plugged in, as returned by ``get_plugged_usb_devices``
+        :type expected_devices: ``set[tuple[int, int, str]]``
+        :param stable_time: The time the plugged devices shall stay unchanged, in seconds - OPTIONAL
+        :type stable_time: ``float``
+        :param period: The time between two listings of the plugged devices, in seconds - OPTIONAL
+        :type period: ``float``
+
+        :return: The probe
+        :rtype: ``ReadinessProbe``
+        """
+        def wait_method(timeout):
+            deadline = perf_counter() + timeout
+            last_devices = None
+            stable_since = None
+            while True:
+                plugged_devices = cls.get_plugged_usb_devices()
+                now = perf_counter()
+                if plugged_devices != last_devices:
+                    last_devices = plugged_devices
+                    stable_since = now
+                elif expected_devices <= plugged_devices and now - stable_since >= stable_time:
+                    return True
+                # end if
+
+                if now >= deadline:
+                    return False
+                # end if
+                sleep(min(period, deadline - now))
+            # end while
+        # end def wait_method
+
+        return cls(name='USB enumeration', wait_method=wait_method)
+    # end def usb_enumeration
+
+    @classmethod
+    def device_connection(cls, test_case, channel=None):
+        """
+        Build a probe waiting for the DUT to be connected: the device connection notification of the receiver for a
+        channel through a receiver, the connection state of the channel otherwise.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use. If ``None``, ``test_case.current_channel`` is used - OPTIONAL
+        :type channel: ``BaseCommunicationChannel`` or ``None``
+
+        :return: The probe
+        :rtype: ``ReadinessProbe``
+
+        :raise ``AssertionError``: If no channel was given and current channel is not initialized
+        """
+        channel = channel if channel is not None else test_case.current_channel
+        assert channel is not None, "No channel was given and current channel is not initialized"
+
+        def wait_method(timeout):
+            if isinstance(channel, ThroughReceiverChannel):
+                if channel.connected:
+                    return True
+                # end if
+                with ChannelUtils.channel_open_state(test_case=test_case, channel=channel.receiver_channel):
+                    try:
+                        return ChannelUtils.wait_through_receiver_channel_link_status(
+                            test_case=test_case,
+                            channel=channel,
+                            link_status=DeviceConnection.LinkStatus.LINK_ESTABLISHED,
+                            timeout=timeout,
+                            allow_no_message=True)
+                    except AssertionError:
+                        # Only other connection notifications were received before the deadline
+                        return False
+                    # end try
+                # end with
+            elif isinstance(channel, (UsbChannel, BleChannel)):
+                return channel.wait_device_connection_state(connected=True, timeout=timeout)
+            # end if
+            raise RuntimeError(f"Unknown channel type: {channel}")
+        # end def wait_method
+
+        return cls(name='Device connection', wait_method=wait_method)
+    # end def device_connection
+
+    @classmethod
+    def wireless_device_status(cls, test_case, channel=None):
+        """
+        Build a probe waiting for a 0x1D4B ``WirelessDeviceStatusBroadcastEvent``, sent by the DUT when it reconnects.
+        The event is consumed.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use. If ``None``, ``test_case.current_channel`` is used - OPTIONAL
+        :type channel: ``BaseCommunicationChannel`` or ``None``
+
+        :return: The probe
+        :rtype: ``ReadinessProbe``
+        """
+        def wait_method(timeout):
+            return ChannelUtils.get_only(
+                test_case=test_case,
+                channel=channel,
+                queue_name=HIDDispatcher.QueueName.EVENT,
+                class_type=WirelessDeviceStatusBroadcastEvent,
+                timeout=timeout,
+                check_first_message=False,
+                allow_no_message=True) is not None
+        # end def wait_method
+
+        return cls(name='0x1D4B wireless device status', wait_method=wait_method)
+    # end def wireless_device_status
+
+    @classmethod
+    def root_ping(cls, test_case, channel=None, period=DEFAULT_POLLING_PERIOD):
+        """
+        Build a probe sending Root ``GetProtocolVersion`` requests until the DUT echoes the ping data.
+
+        A ping without response before ``PING_RESPONSE_TIMEOUT`` is sent again, the late responses to the previous
+        pings are skipped. Any other failure is raised. When the probe finishes, the important and error queues are
+        emptied from the late responses and from the error responses skipped while waiting.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param channel: The channel to use. If ``None``, ``test_case.current_channel`` is used - OPTIONAL
+        :type channel: ``BaseCommunicationChannel`` or ``None``
+        :param period: The time between a ping without response and the next one, in seconds - OPTIONAL
+        :type period: ``float``
+
+        :return: The probe
+        :rtype: ``ReadinessProbe``
+
+        :raise ``AssertionError``: If no channel was given and current channel is not initialized
+        """
+        channel = channel if channel is not None else test_case.current_channel
+        assert channel is not None, "No channel was given and current channel is not initialized"
+        root_feature = RootFactory.create(
+            test_case.config_manager.get_feature_version(test_case.f.PRODUCT.FEATURES.IMPORTANT.ROOT))
+
+        def get_response(timeout):
+            # The queue timeout is the only failure expected from a DUT not ready yet, ``get_only`` returns ``None``
+            return ChannelUtils.get_only(
+                test_case=test_case,
+                channel=channel,
+                queue_name=HIDDispatcher.QueueName.IMPORTANT,
+                class_type=root_feature.get_protocol_version_response_cls,
+                timeout=max(timeout, 0),
+                check_first_message=False,
+                allow_no_message=True,
+                skip_error_message=True)
+        # end def get_response
+
+        def wait_method(timeout):
+            deadline = perf_counter() + timeout
+            ping_data = 0
+            try:
+                while True:
+                    ping_data = (ping_data + 1) & 0xFF
+                    ChannelUtils.send_only(
+                        test_case=test_case,
+                        channel=channel,
+                        report=root_feature.get_protocol_version_cls(
+                            deviceIndex=ChannelUtils.get_device_index(test_case=test_case, channel=channel),
+                            pingData=ping_data))
+
+                    response_deadline = perf_counter() + max(min(cls.PING_RESPONSE_TIMEOUT, deadline - perf_counter()),
+                                                             period)
+                    response = get_response(timeout=response_deadline - perf_counter())
+                    while response is not None:
+                        if to_int(response.pingData) == ping_data:
+                            return True
+                        # end if
+                        # Late response to a previous ping
+                        response = get_response(timeout=response_deadline - perf_counter())
+                    # end while
+
+                    remaining_time = deadline - perf_counter()
+                    if remaining_time <= 0:
+                        return False
+                    # end if
+                    sleep(min(period, remaining_time))
+                # end while
+            finally:
+                ChannelUtils.empty_queue(
+                    test_case=test_case, channel=channel, queue_name=HIDDispatcher.QueueName.IMPORTANT)
+                ChannelUtils.empty_queue(test_case=test_case, channel=channel, queue_name=HIDDispatcher.QueueName.ERROR)
+            # end try
+        # end def wait_method
+
+        return cls(name='Root ping', wait_method=wait_method)
+    # end def root_ping
+
+    @classmethod
+    def kosmos_stimulus_acknowledgement(cls, test_case, period=DEFAULT_POLLING_PERIOD):
+        """
+        Build a probe waiting for the Kosmos sequencer to have played all the stimuli it was given. The sequencer
+        errors are not checked, they are reported by the Kosmos post requisites.
+
+        :param test_case: The current test case
+        :type test_case: ``pytestbox.base.basetest.CommonBaseTestCase``
+        :param period: The time between two sequencer status requests, in seconds - OPTIONAL
+        :type period: ``float``
+
+        :return: The probe
+        :rtype: ``ReadinessProbe``
+
+        :raise ``AssertionError``: If Kosmos is not available
+        """
+        assert test_case.kosmos is not None, "Kosmos is not available"
+
+        sequencer = test_case.kosmos.sequencer
+        return cls.from_condition(name='Kosmos stimulus acknowledgement',
+                                  condition=lambda: sequencer.status().state != SEQUENCER_STATE_RUNNING,
+                                  period=period)
+    # end def kosmos_stimulus_acknowledgement
+# end class ReadinessProbe
+
+
+class SetupTimings:
+    """
+    Durations of the setup phases of a test and results of its readiness probes. The durations are also summed per
+    phase over the whole process.
+    """
+    # Phase name to [count, total duration in seconds]
+    _totals = {}
+
+    def __init__(self):
+        # List of (phase name, duration in seconds), in execution order
+        self.phases = []
+        self.probes = []
+    # end def __init__
+
+    def __str__(self):
+        lines = [f"Setup took {self.total:.3f}s"]
+        lines.extend(f"\t{name}: {duration:.3f}s" for name, duration in self.phases)
+        lines.extend(f"\t{probe}" for probe in self.probes)
+        return '\n'.join(lines)
+    # end def __str__
+
+    @property
+    def total(self):
+        """
+        Property getter of ``total``, the sum of the phase durations.
+
+        :return: ``total`` value in seconds
+        :rtype: ``float``
+        """
+        return sum(duration for _, duration in self.phases)
+    # end def property getter total
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Measure the duration of a setup phase.
+
+        :param name: The phase name
+        :type name: ``str``
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name=name, duration=perf_counter() - start)
+        # end try
+    # end def phase
+
+    def add_phase(self, name, duration):
+        """
+        Add the duration of a setup phase.
+
+        :param name: The phase name
+        :type name: ``str``
+        :param duration: The duration in seconds
+        :type duration: ``float``
+        """
+        self.phases.append((name, duration))
+        totals = self._totals.setdefault(name, [0, 0.0])
+        totals[0] += 1
+        totals[1] += duration
+    # end def add_phase
+
+    def add_probes(self, probes):
+        """
+        Add the readiness probes waited during the setup.
+
+        :param probes: The probes
+        :type probes: ``list[ReadinessProbe]``
+        """
+        self.probes.extend(probe for probe in probes if probe.is_ready is not None)
+    # end def add_probes
+
+    @classmethod
+    def get_totals_report(cls):
+        """
+        Get the report of the phase durations summed over the process.
+
+        :return: The report, one line per phase with its count, total and mean durations
+        :rtype: ``str``
+        """
+        return '\n'.join(f"{name}: {count} times, total {total:.3f}s, mean {total / count:.3f}s"
+                         for name, (count, total) in cls._totals.items())
+    # end def get_totals_report
+# end class SetupTimings
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
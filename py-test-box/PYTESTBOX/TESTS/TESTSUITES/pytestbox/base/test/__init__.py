@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------
+"""
+:package: pytestbox.base.test
+:brief: Unit tests of the pytestbox base package
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
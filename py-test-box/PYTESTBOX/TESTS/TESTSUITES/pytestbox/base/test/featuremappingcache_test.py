@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------
+"""
+:package: pytestbox.base.test.featuremappingcache_test
+:brief: ``FeatureMappingCache`` and ``ChannelUtils.load_feature_mapping`` unit tests
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from os.path import join
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyharness.debuggers.nvsdebugger import NvsDebugger
+from pyhid.hidpp.features.common.deviceinformation import DeviceInformation
+from pyhid.hidpp.features.featureset import FeatureSet
+from pytestbox.base.channelutils import ChannelUtils
+from pytestbox.base.featuremappingcache import FeatureMappingCache
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+FEATURE_COUNT = 3
+FEATURES = [(1, FeatureSet.FEATURE_ID, 1), (2, DeviceInformation.FEATURE_ID, 4), (3, 0x1004, 2)]
+FIRMWARE = 'RBM12_00_A0B1'
+NEW_FIRMWARE = 'RBM12_00_A0B2'
+
+
+class FakeDispatcher:
+    """
+    Fake HID dispatcher keeping the added feature entries
+    """
+
+    def __init__(self):
+        self.feature_entries = {}
+    # end def __init__
+
+    def add_feature_entry(self, feature_index, feature_id, feature_version):
+        """
+        Add a feature entry
+
+        :param feature_index: The feature index
+        :type feature_index: ``int``
+        :param feature_id: The feature ID
+        :type feature_id: ``int``
+        :param feature_version: The feature version
+        :type feature_version: ``int``
+        """
+        self.feature_entries[feature_id] = (feature_index, feature_version)
+    # end def add_feature_entry
+# end class FakeDispatcher
+
+
+class FakeChannel:
+    """
+    Fake channel with a fake HID dispatcher
+    """
+
+    def __init__(self, protocol=1):
+        """
+        :param protocol: The channel protocol - OPTIONAL
+        :type protocol: ``int``
+        """
+        self.protocol = protocol
+        self.hid_dispatcher = FakeDispatcher()
+    # end def __init__
+# end class FakeChannel
+
+
+class FeatureMappingCacheTestCase(TestCase):
+    """
+    ``FeatureMappingCache`` test implementation
+    """
+
+    def setUp(self):
+        """
+        Initialize test with an empty cache in a temporary output directory
+        """
+        super().setUp()
+        output_dir = TemporaryDirectory()
+        self.addCleanup(output_dir.cleanup)
+        self.path = join(output_dir.name, FeatureMappingCache.FILE_NAME)
+        self.addCleanup(FeatureMappingCache._files.clear)
+        self.addCleanup(FeatureMappingCache._identities.clear)
+        self.addCleanup(FeatureMappingCache.invalidate)
+    # end def setUp
+
+    def test_table(self):
+        """
+        Check a saved table is read back from the file in another process
+        """
+        self.assertIsNone(FeatureMappingCache.get_table(path=self.path, identity='device'))
+
+        FeatureMappingCache.set_table(path=self.path, identity='device', feature_count=FEATURE_COUNT,
+                                      features=FEATURES)
+        FeatureMappingCache._files.clear()
+
+        self.assertEqual((FEATURE_COUNT, FEATURES), FeatureMappingCache.get_table(path=self.path, identity='device'))
+        self.assertIsNone(FeatureMappingCache.get_table(path=self.path, identity='other device'))
+    # end def test_table
+
+    def test_corrupted_file(self):
+        """
+        Check a corrupted file is an empty cache
+        """
+        with open(self.path, 'w') as cache_file:
+            cache_file.write('{"device": ')
+        # end with
+
+        self.assertIsNone(FeatureMappingCache.get_table(path=self.path, identity='device'))
+    # end def test_corrupted_file
+
+    def test_validated_channel(self):
+        """
+        Check only the table of a validated channel is served, until it is invalidated
+        """
+        channel = FakeChannel()
+        other_channel = FakeChannel()
+        FeatureMappingCache.validate(channel=channel, features=FEATURES)
+
+        self.assertEqual((3, 2), FeatureMappingCache.get_feature_entry(channel=channel, feature_id=0x1004))
+        self.assertIsNone(FeatureMappingCache.get_feature_entry(channel=channel, feature_id=0x1B04))
+        self.assertIsNone(FeatureMappingCache.get_feature_entry(channel=other_channel, feature_id=0x1004))
+
+        FeatureMappingCache.invalidate(channel=channel)
+
+        self.assertIsNone(FeatureMappingCache.get_feature_entry(channel=channel, feature_id=0x1004))
+    # end def test_validated_channel
+
+    def test_firmware_changed(self):
+        """
+        Check the identities are kept at the end of a test, and forgotten when a firmware changes
+        """
+        channel = FakeChannel(protocol=1)
+        transport = FeatureMappingCache.get_transport(channel=channel)
+        other_transport = FeatureMappingCache.get_transport(channel=FakeChannel(protocol=2))
+        FeatureMappingCache.set_identity(transport=transport, identity='device', entity_index=0, firmware=FIRMWARE)
+        FeatureMappingCache.set_identity(transport=other_transport, identity='receiver')
+
+        FeatureMappingCache.invalidate()
+        self.assertEqual(('device', 0, FIRMWARE), FeatureMappingCache.get_identity(transport=transport))
+
+        FeatureMappingCache.invalidate(channel=channel, firmware_changed=True)
+        self.assertIsNone(FeatureMappingCache.get_identity(transport=transport))
+        self.assertEqual(('receiver', None, None), FeatureMappingCache.get_identity(transport=other_transport))
+
+        FeatureMappingCache.invalidate(firmware_changed=True)
+        self.assertIsNone(FeatureMappingCache.get_identity(transport=other_transport))
+    # end def test_firmware_changed
+
+    def test_flash_write(self):
+        """
+        Check the validated channels and the identities are forgotten after a debugger flash write
+        """
+        channel = FakeChannel()
+        transport = FeatureMappingCache.get_transport(channel=channel)
+        FeatureMappingCache.set_identity(transport=transport, identity='device', entity_index=0, firmware=FIRMWARE)
+        FeatureMappingCache.validate(channel=channel, features=FEATURES)
+
+        NvsDebugger.count_flash_write()
+
+        self.assertIsNone(FeatureMappingCache.get_feature_entry(channel=channel, feature_id=0x1004))
+        self.assertIsNone(FeatureMappingCache.get_identity(transport=transport))
+
+        FeatureMappingCache.validate(channel=channel, features=FEATURES)
+        self.assertEqual((3, 2), FeatureMappingCache.get_feature_entry(channel=channel, feature_id=0x1004))
+    # end def test_flash_write
+# end class FeatureMappingCacheTestCase
+
+
+class LoadFeatureMappingTestCase(TestCase):
+    """
+    ``ChannelUtils.load_feature_mapping`` test implementation, the DUT requests being replaced by a fake DUT state
+    """
+
+    def setUp(self):
+        """
+        Initialize test with an empty cache in a temporary output directory and a fake DUT
+        """
+        super().setUp()
+        output_dir = TemporaryDirectory()
+        self.addCleanup(output_dir.cleanup)
+        self.test_case = SimpleNamespace(getContext=lambda: SimpleNamespace(getOutputDir=lambda: output_dir.name))
+        self.addCleanup(FeatureMappingCache._files.clear)
+        self.addCleanup(FeatureMappingCache._identities.clear)
+        self.addCleanup(FeatureMappingCache.invalidate)
+
+        self.firmware = FIRMWARE
+        self.requests = []
+        for name, side_effect in (
+                ('_get_device_identity', self._get_device_identity),
+                ('_get_feature_table', self._get_feature_table),
+                ('_get_feature_count', self._get_feature_count),
+                ('_get_active_firmware', self._get_active_firmware)):
+            patcher = patch.object(ChannelUtils, name, side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # end for
+    # end def setUp
+
+    def _get_device_identity(self, test_case, channel, transport):
+        self.requests.append('identity')
+        return f'unit_{self.firmware}_{transport}', 0, self.firmware
+    # end def _get_device_identity
+
+    def _get_feature_table(self, test_case, channel):
+        self.requests.append('table')
+        return FEATURE_COUNT, FEATURES
+    # end def _get_feature_table
+
+    def _get_feature_count(self, test_case, channel, feature_set_index, feature_set_version):
+        self.requests.append('count')
+        return FEATURE_COUNT
+    # end def _get_feature_count
+
+    def _get_active_firmware(self, test_case, channel, feature_index, feature_version, entity_index):
+        self.requests.append('firmware')
+        return self.firmware
+    # end def _get_active_firmware
+
+    def load_feature_mapping(self):
+        """
+        Load the feature mapping of the fake DUT in a new channel, as a test setup
+
+        :return: The channel
+        :rtype: ``FakeChannel``
+        """
+        channel = FakeChannel()
+        self.requests.clear()
+        self.assertTrue(ChannelUtils.load_feature_mapping(test_case=self.test_case, channel=channel))
+        self.assertEqual((3, 2), FeatureMappingCache.get_feature_entry(channel=channel, feature_id=0x1004))
+        self.assertEqual((3, 2), channel.hid_dispatcher.feature_entries[0x1004])
+        FeatureMappingCache.invalidate()
+        return channel
+    # end def load_feature_mapping
+
+    def test_cached_table(self):
+        """
+        Check the table is read once, then checked with the feature count and the active firmware
+        """
+        self.load_feature_mapping()
+        self.assertEqual(['identity', 'table'], self.requests)
+
+        self.load_feature_mapping()
+        self.assertEqual(['count', 'firmware'], self.requests)
+    # end def test_cached_table
+
+    def test_firmware_changed_in_another_process(self):
+        """
+        Check a firmware change keeping the feature count is detected by the active firmware check
+        """
+        self.load_feature_mapping()
+        self.firmware = NEW_FIRMWARE
+
+        self.load_feature_mapping()
+        self.assertEqual(['count', 'firmware', 'identity', 'table'], self.requests)
+        self.assertEqual(NEW_FIRMWARE, FeatureMappingCache.get_identity(
+            transport=FeatureMappingCache.get_transport(channel=FakeChannel()))[2])
+    # end def test_firmware_changed_in_another_process
+
+    def test_firmware_changed(self):
+        """
+        Check the identity is read again after a firmware change in the process
+        """
+        self.load_feature_mapping()
+        FeatureMappingCache.invalidate(firmware_changed=True)
+
+        self.load_feature_mapping()
+        self.assertEqual(['identity', 'count'], self.requests)
+    # end def test_firmware_changed
+# end class LoadFeatureMappingTestCase
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
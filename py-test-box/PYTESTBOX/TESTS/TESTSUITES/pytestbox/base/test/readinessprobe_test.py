@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Python Test Box
+# ----------------------------------------------------------------------------
+"""
+:package: pytestbox.base.test.readinessprobe_test
+:brief: ``ReadinessProbe`` unit tests, with a fake dispatcher
+:author: Christophe Roquebert <croquebert@logitech.com>
+:date: 2026/10/18
+"""
+# ----------------------------------------------------------------------------
+# imports
+# ----------------------------------------------------------------------------
+from queue import Empty
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from pychannel.channelinterfaceclasses import ChannelException
+from pyhid.hiddispatcher import HIDDispatcher
+from pyhid.hidpp.features.common.wirelessdevicestatus import WirelessDeviceStatus
+from pyhid.hidpp.features.common.wirelessdevicestatus import WirelessDeviceStatusBroadcastEvent
+from pyhid.hidpp.features.error import ErrorCodes
+from pyhid.hidpp.features.root import RootGetProtocolVersionResponse
+from pylibrary.tools.numeral import to_int
+from pytestbox.base.channelutils import ChannelUtils
+from pytestbox.base.readinessprobe import ReadinessProbe
+from pytestbox.base.readinessprobe import SetupTimings
+
+
+# ----------------------------------------------------------------------------
+# implementation
+# ----------------------------------------------------------------------------
+DEVICE_INDEX = 0xFF
+ROOT_VERSION = 2
+PROBE_TIMEOUT = 0.3
+
+
+class FakeDispatcher:
+    """
+    Fake HID dispatcher: a list of messages per queue name
+    """
+
+    def __init__(self):
+        self.queues = {HIDDispatcher.QueueName.IMPORTANT: [], HIDDispatcher.QueueName.ERROR: [],
+                       HIDDispatcher.QueueName.EVENT: []}
+        self.hid_message_queue = None
+    # end def __init__
+
+    def get_queue_by_name(self, name):
+        """
+        Get a queue, its name being used as queue object
+
+        :param name: The queue name
+        :type name: ``str``
+
+        :return: The queue
+        :rtype: ``str`` or ``None``
+        """
+        return name if name in self.queues else None
+    # end def get_queue_by_name
+# end class FakeDispatcher
+
+
+class FakeChannel:
+    """
+    Fake channel: the sent reports are given to a device method returning the messages to put in the dispatcher
+    queues
+    """
+
+    def __init__(self, device):
+        """
+        :param device: The device method, it takes the sent report and returns a list of (queue name, message)
+        :type device: ``callable type``
+        """
+        self.hid_dispatcher = FakeDispatcher()
+        self.device = device
+        self.sent_reports = []
+    # end def __init__
+
+    def __str__(self):
+        return 'FakeChannel'
+    # end def __str__
+
+    def send_data(self, data, timeout=0):
+        """
+        Send a report to the fake device
+
+        :param data: The report
+        :type data: ``TimestampedBitFieldContainerMixin``
+        :param timeout: Unused - OPTIONAL
+        :type timeout: ``float``
+        """
+        self.sent_reports.append(data)
+        for queue_name, message in self.device(data):
+            self.hid_dispatcher.queues[queue_name].append(message)
+        # end for
+    # end def send_data
+
+    def get_message(self, dispatcher_queue, message_class=None, timeout=0, skip_error=False):
+        """
+        Get the first message of a class from a queue, without waiting
+
+        :param dispatcher_queue: The queue
+        :type dispatcher_queue: ``str``
+        :param message_class: The message class, ``None`` for any class - OPTIONAL
+        :type message_class: ``type`` or ``None``
+        :param timeout: Unused - OPTIONAL
+        :type timeout: ``float``
+        :param skip_error: Unused, the error responses are already in the error queue - OPTIONAL
+        :type skip_error: ``bool``
+
+        :return: The message
+        :rtype: ``object``
+
+        :raise ``Empty``: If no message of the class is in the queue
+        """
+        messages = self.hid_dispatcher.queues[dispatcher_queue]
+        for index, message in enumerate(messages):
+            if message_class is None or isinstance(message, message_class):
+                return messages.pop(index)
+            # end if
+        # end for
+        raise Empty()
+    # end def get_message
+# end class FakeChannel
+
+
+def get_response(ping_data):
+    """
+    Get the response to a Root ping
+
+    :param ping_data: The ping data
+    :type ping_data: ``int``
+
+    :return: The response
+    :rtype: ``RootGetProtocolVersionResponse``
+    """
+    return RootGetProtocolVersionResponse(
+        device_index=DEVICE_INDEX, protocol_number=4, target_software=0, ping_data=ping_data)
+# end def get_response
+
+
+class RootPingTestCase(TestCase):
+    """
+    ``ReadinessProbe.root_ping`` test implementation
+    """
+
+    def setUp(self):
+        """
+        Initialize test
+        """
+        super().setUp()
+        self.test_case = SimpleNamespace(
+            f=SimpleNamespace(LOGGING=SimpleNamespace(F_LogHelperVerbose=False),
+                              PRODUCT=SimpleNamespace(FEATURES=SimpleNamespace(IMPORTANT=SimpleNamespace(ROOT=None)))),
+            config_manager=SimpleNamespace(get_feature_version=lambda feature_config: ROOT_VERSION),
+            logTrace=lambda msg: None,
+            log_warning=lambda *args, **kwargs: None)
+        patcher = patch.object(ChannelUtils, 'get_device_index', return_value=DEVICE_INDEX)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    # end def setUp
+
+    def wait_root_ping(self, device, timeout=PROBE_TIMEOUT):
+        """
+        Wait for a Root ping probe on a fake channel
+
+        :param device: The fake device method
+        :type device: ``callable type``
+        :param timeout: The probe timeout in seconds - OPTIONAL
+        :type timeout: ``float``
+
+        :return: The fake channel and the probe result
+        :rtype: ``tuple[FakeChannel, bool]``
+        """
+        channel = FakeChannel(device=device)
+        probe = ReadinessProbe.root_ping(test_case=self.test_case, channel=channel, period=0.01)
+        return channel, probe.wait(timeout=timeout)
+    # end def wait_root_ping
+
+    def assert_queues_empty(self, channel):
+        """
+        Check the important and error queues are empty
+
+        :param channel: The fake channel
+        :type channel: ``FakeChannel``
+        """
+        for queue_name, messages in channel.hid_dispatcher.queues.items():
+            self.assertEqual([], messages, f"{queue_name} not empty")
+        # end for
+    # end def assert_queues_empty
+
+    def test_ready(self):
+        """
+        Check a DUT echoing the first ping is ready
+        """
+        channel, is_ready = self.wait_root_ping(
+            device=lambda report: [(HIDDispatcher.QueueName.IMPORTANT, get_response(to_int(report.pingData)))])
+
+        self.assertTrue(is_ready)
+        self.assertEqual(1, len(channel.sent_reports))
+        self.assert_queues_empty(channel)
+    # end def test_ready
+
+    def test_late_responses(self):
+        """
+        Check the late responses to the previous pings and the error responses are skipped, then emptied
+        """
+        def device(report):
+            ping_data = to_int(report.pingData)
+            if ping_data < 3:
+                # Not ready yet
+                return [(HIDDispatcher.QueueName.ERROR, ErrorCodes(device_index=DEVICE_INDEX, feature_index=0))]
+            # end if
+            # The responses to the previous pings come first
+            return [(HIDDispatcher.QueueName.IMPORTANT, get_response(data)) for data in range(1, ping_data + 1)] + [
+                (HIDDispatcher.QueueName.IMPORTANT, get_response(1))]
+        # end def device
+
+        channel, is_ready = self.wait_root_ping(device=device)
+
+        self.assertTrue(is_ready)
+        self.assertEqual(3, len(channel.sent_reports))
+        self.assert_queues_empty(channel)
+    # end def test_late_responses
+
+    def test_timeout(self):
+        """
+        Check a DUT never echoing the ping is not ready, and the error responses are emptied
+        """
+        channel, is_ready = self.wait_root_ping(
+            device=lambda report: [(HIDDispatcher.QueueName.ERROR, ErrorCodes(device_index=DEVICE_INDEX,
+                                                                              feature_index=0))])
+
+        self.assertFalse(is_ready)
+        self.assertGreater(len(channel.sent_reports), 1)
+        self.assert_queues_empty(channel)
+    # end def test_timeout
+
+    def test_transport_error(self):
+        """
+        Check a transport error is raised, and not taken as a DUT not ready yet
+        """
+        def device(report):
+            raise ChannelException(ChannelException.Cause.DEVICE_NOT_CONNECTED)
+        # end def device
+
+        with self.assertRaises(ChannelException):
+            self.wait_root_ping(device=device)
+        # end with
+    # end def test_transport_error
+# end class RootPingTestCase
+
+
+class UsbEnumerationTestCase(TestCase):
+    """
+    ``ReadinessProbe.usb_enumeration`` test implementation
+    """
+    RECEIVER = (0x046D, 0xC548, 'Bus 3 Device 1->1')
+    DEBUGGER = (0x1366, 0x0105, 'Bus 3 Device 1->2')
+
+    def wait_usb_enumeration(self, plugged_devices, timeout=PROBE_TIMEOUT):
+        """
+        Wait for a USB enumeration probe, the receiver being expected
+
+        :param plugged_devices: The successive lists of plugged devices, the last one being kept
+        :type plugged_devices: ``list[set[tuple[int, int, str]]]``
+        :param timeout: The probe timeout in seconds - OPTIONAL
+        :type timeout: ``float``
+
+        :return: The probe result
+        :rtype: ``bool``
+        """
+        def get_plugged_usb_devices():
+            return plugged_devices.pop(0) if len(plugged_devices) > 1 else plugged_devices[0]
+        # end def get_plugged_usb_devices
+
+        with patch.object(ReadinessProbe, 'get_plugged_usb_devices', side_effect=get_plugged_usb_devices):
+            probe = ReadinessProbe.usb_enumeration(
+                expected_devices={self.RECEIVER, self.DEBUGGER}, stable_time=0.05, period=0.01)
+            return probe.wait(timeout=timeout)
+        # end with
+    # end def wait_usb_enumeration
+
+    def test_enumerated_again(self):
+        """
+        Check the probe waits for the receiver reset by the debugger to be enumerated again
+        """
+        self.assertTrue(self.wait_usb_enumeration(
+            plugged_devices=[{self.RECEIVER, self.DEBUGGER}, {self.DEBUGGER}, {self.DEBUGGER},
+                             {self.RECEIVER, self.DEBUGGER}]))
+    # end def test_enumerated_again
+
+    def test_not_enumerated(self):
+        """
+        Check the probe is not ready while the receiver is missing
+        """
+        self.assertFalse(self.wait_usb_enumeration(plugged_devices=[{self.DEBUGGER}]))
+    # end def test_not_enumerated
+
+    def test_not_stable(self):
+        """
+        Check the probe is not ready while the plugged devices change
+        """
+        devices = [{self.RECEIVER, self.DEBUGGER}, {self.DEBUGGER}] * 100
+        self.assertFalse(self.wait_usb_enumeration(plugged_devices=devices, timeout=0.1))
+    # end def test_not_stable
+# end class UsbEnumerationTestCase
+
+
+class WirelessDeviceStatusTestCase(TestCase):
+    """
+    ``ReadinessProbe.wireless_device_status`` test implementation
+    """
+
+    def setUp(self):
+        """
+        Initialize test
+        """
+        super().setUp()
+        self.test_case = SimpleNamespace(f=SimpleNamespace(LOGGING=SimpleNamespace(F_LogHelperVerbose=False)),
+                                         logTrace=lambda msg: None)
+        self.channel = FakeChannel(device=lambda report: [])
+    # end def setUp
+
+    def test_ready(self):
+        """
+        Check the probe is ready on a 0x1D4B event, received after another event, and consumes it
+        """
+        event_queue = self.channel.hid_dispatcher.queues[HIDDispatcher.QueueName.EVENT]
+        other_event = object()
+        event_queue.extend([other_event, WirelessDeviceStatusBroadcastEvent(
+            device_index=DEVICE_INDEX, feature_id=4, status=WirelessDeviceStatus.Status.RECONNECTION,
+            request=WirelessDeviceStatus.Request.NO_REQUEST, reason=WirelessDeviceStatus.Reason.UNKNOWN)])
+
+        probe = ReadinessProbe.wireless_device_status(test_case=self.test_case, channel=self.channel)
+
+        self.assertTrue(probe.wait(timeout=PROBE_TIMEOUT))
+        self.assertEqual([other_event], event_queue)
+    # end def test_ready
+
+    def test_timeout(self):
+        """
+        Check the probe is not ready without 0x1D4B event
+        """
+        probe = ReadinessProbe.wireless_device_status(test_case=self.test_case, channel=self.channel)
+
+        self.assertFalse(probe.wait(timeout=PROBE_TIMEOUT))
+        self.assertIn('timeout', str(probe))
+    # end def test_timeout
+# end class WirelessDeviceStatusTestCase
+
+
+class SetupTimingsTestCase(TestCase):
+    """
+    ``SetupTimings`` test implementation
+    """
+
+    def setUp(self):
+        """
+        Initialize test
+        """
+        super().setUp()
+        patcher = patch.object(SetupTimings, '_totals', {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    # end def setUp
+
+    def test_totals_report(self):
+        """
+        Check the phase durations are summed over the setups in the totals report
+        """
+        for duration in (0.5, 1.5):
+            setup_timings = SetupTimings()
+            setup_timings.add_phase(name='Debuggers', duration=duration)
+            setup_timings.add_phase(name='Channel', duration=0.25)
+        # end for
+
+        self.assertEqual(1.75, setup_timings.total)
+        self.assertEqual("Debuggers: 2 times, total 2.000s, mean 1.000s\n"
+                         "Channel: 2 times, total 0.500s, mean 0.250s", SetupTimings.get_totals_report())
+    # end def test_totals_report
+# end class SetupTimingsTestCase
+
+# ----------------------------------------------------------------------------
+# END OF FILE
+# ----------------------------------------------------------------------------
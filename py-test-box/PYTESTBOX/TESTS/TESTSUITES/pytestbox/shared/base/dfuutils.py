@@ -29,7 +29,9 @@ from pylibrary.tools.threadutils import QueueEmpty
 from pytestbox.base.basetestutils import CommonBaseTestUtils
 from pytestbox.base.channelutils import ChannelUtils
 from pytestbox.base.configurationmanager import ConfigurationManager
+from pytestbox.base.featuremappingcache import FeatureMappingCache
 from pytestbox.base.loghelper import LogHelper
+from pytestbox.base.readinessprobe import ReadinessProbe
 from pytestbox.shared.base.deviceinformationutils import DeviceInformationTestUtils
 from pytransport.transportcontext import TransportContextException
 
@@ -104,6 +106,8 @@ class DfuTestUtils(CommonBaseTestUtils):
                 raise
             # end if
         # end try
+        # The restarted firmware may differ: its identity and its feature table are read again by the next setup
+        FeatureMappingCache.invalidate(channel=test_case.current_channel, firmware_changed=True)
 
         if log_check > 0:
             # ---------------------------------------------------------------------------
@@ -132,7 +136,9 @@ class DfuTestUtils(CommonBaseTestUtils):
             DfuTestUtils.verify_communication_disconnection_then_reconnection(
                 test_case=test_case,
                 ble_service_changed_required=ble_service_changed_required)
-        else:
+        elif not test_case.USE_READINESS_PROBES or not ReadinessProbe.wait_all(
+                probes=[ReadinessProbe.wireless_device_status(test_case=test_case)],
+                timeout=test_case.READINESS_TIMEOUT):
             sleep(2)
         # end if
 
@@ -381,6 +381,37 @@ class SharedMemoryTestUtils(CommonBaseTestUtils):
             bss_size = app_elf_helper.get_symbol_address('__bss_length__')
             return bss_start_address, bss_size
         # end def get_bss_address_size
+
+        @classmethod
+        def get_different_symbol_names(cls, elf_file_path, start_address, expected, obtained):
+            """
+            Get the symbols containing the bytes that differ between two dumps of the same area.
+
+            :param elf_file_path: The path to the targeted .elf file
+            :type elf_file_path: ``str``
+            :param start_address: The start address of the dumped area
+            :type start_address: ``int``
+            :param expected: The expected content
+            :type expected: ``HexList``
+            :param obtained: The obtained content
+            :type obtained: ``HexList``
+
+            :return: The symbol names, or the address of the bytes not in a symbol, in address order
+            :rtype: ``list[str]``
+            """
+            app_elf_helper = ElfHelper(join(TESTS_PATH, "DFU_FILES", elf_file_path))
+            names = []
+            for offset, (expected_byte, obtained_byte) in enumerate(zip(expected, obtained)):
+                if expected_byte != obtained_byte:
+                    symbol = app_elf_helper.get_symbol_at(start_address + offset)
+                    name = f"0x{start_address + offset:08X}" if symbol is None else symbol.name
+                    if name not in names:
+                        names.append(name)
+                    # end if
+                # end if
+            # end for
+            return names
+        # end def get_different_symbol_names
 # end class SharedMemoryTestUtils
 
 # ----------------------------------------------------------------------------
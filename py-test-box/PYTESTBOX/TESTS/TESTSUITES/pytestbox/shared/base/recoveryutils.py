@@ -40,6 +40,7 @@ from pytestbox.base.configurationmanager import ConfigurationManager
 from pytestbox.base.productdata import POST_RESET_ACTIONS
 from pytestbox.base.productdata import PRE_RESET_ACTIONS
 from pytestbox.base.productdata import RECOVERY_KEYS_LIST_MAP
+from pytestbox.base.readinessprobe import ReadinessProbe
 from pytestbox.shared.base.devicediscoveryutils import DiscoveryTestUtils
 from pytestbox.shared.base.devicepairingutils import DevicePairingTestUtils
 from pyusb.libusbdriver import LibusbDriver
@@ -189,7 +190,11 @@ class RecoveryTestUtils(CommonBaseTestUtils):
 
         test_case.button_stimuli_emulator.perform_action_list(action_list)
 
-        time.sleep(.5)
+        if not test_case.USE_READINESS_PROBES or test_case.kosmos is None or not ReadinessProbe.wait_all(
+                probes=[ReadinessProbe.kosmos_stimulus_acknowledgement(test_case=test_case)],
+                timeout=test_case.READINESS_TIMEOUT):
+            time.sleep(.5)
+        # end if
     # end def filter_and_perform_actions
 
     @staticmethod
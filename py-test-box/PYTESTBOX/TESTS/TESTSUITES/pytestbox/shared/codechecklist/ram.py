@@ -149,9 +149,14 @@ class SharedRamTestCase(CommonBaseTestCase, ABC):
         # ---------------------------------------------------------------------------
         LogHelper.log_check(self, 'Check RAM content after initialization matches its copy in Flash')
         # ---------------------------------------------------------------------------
+        ram_start_address, _ = SharedMemoryTestUtils.RamHelper.get_ram_address_size(elf_file_path)
+        different_symbols = SharedMemoryTestUtils.RamHelper.get_different_symbol_names(
+            elf_file_path=elf_file_path, start_address=ram_start_address, expected=copy_flash,
+            obtained=ram_after_main_crt_startup)
         self.assertEqual(copy_flash,
                          ram_after_main_crt_startup,
-                         "After initialization, RAM shall matche its copy in Flash")
+                         f"After initialization, RAM shall matche its copy in Flash (different symbols: "
+                         f"{different_symbols})")
 
         # --------------------------------------------------------------------------------------------------------------
         LogHelper.log_step(self, 'Dump the bss content when firmware is halted at the start of the main routine')
@@ -162,9 +167,15 @@ class SharedRamTestCase(CommonBaseTestCase, ABC):
         # ---------------------------------------------------------------------------
         LogHelper.log_check(self, 'Check RAM content after initialization matches its copy in Flash')
         # ---------------------------------------------------------------------------
-        self.assertEqual(HexList("00" * len(bss_after_main_crt_startup)),
+        bss_start_address, _ = SharedMemoryTestUtils.RamHelper.get_bss_address_size(elf_file_path)
+        expected_bss = HexList("00" * len(bss_after_main_crt_startup))
+        different_symbols = SharedMemoryTestUtils.RamHelper.get_different_symbol_names(
+            elf_file_path=elf_file_path, start_address=bss_start_address, expected=expected_bss,
+            obtained=bss_after_main_crt_startup)
+        self.assertEqual(expected_bss,
                          bss_after_main_crt_startup,
-                         "After initialization, RAM shall matche its copy in Flash")
+                         f"After initialization, RAM shall matche its copy in Flash (different symbols: "
+                         f"{different_symbols})")
     # end def _verify_ram_bss_initialization
 
     @features('RamInit')
@@ -55,7 +55,7 @@ class PyHidGenerator(CommonPackageGenerator):
     """
     def generate_hid_dispatcher_file(self):
         """
-        Generate the hiddispatcher.py file
+        Generate the hiddispatchermanifest.py file
         """
         self.reset()
 
@@ -64,7 +64,7 @@ class PyHidGenerator(CommonPackageGenerator):
         obj.process()
         self.update_values(obj.get_implementation_section())
 
-        self.write_to_file(f"output/LIBS/PYHID/pyhid/hiddispatcher.py")
+        self.write_to_file(f"output/LIBS/PYHID/pyhid/hiddispatchermanifest.py")
     # end def generate_hid_dispatcher_file
 
     def generate_feature_file(self):
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 :package: codegenerator.generator.hiddispatcher
-:brief: Generator for hid dispatcher values
+:brief: Generator for hid dispatcher manifest entry
 :author: Suresh Thiyagarajan <sthiyagarajan@logitech.com>
 :date: 2021/05/24
 """
@@ -31,21 +31,12 @@ class HidDispatcherGenerator(CommonFileGenerator):
         # get common dictionary first
         dictionary = AutoInput.get_common_dictionary()
 
-        feature_table = Template(HidDispatcherTemplate.GET_FEATURE_TABLE).substitute(dictionary)
-        event_table = ""
-        if len(AutoInput.EVENT_LIST) > 0:
-            event_table = Template(HidDispatcherTemplate.GET_EVENT_TABLE).substitute(dictionary)
-        # end if
-        dictionary["InitFunction"] = Template(HidDispatcherTemplate.GET_INIT_FUNCTION).substitute(
-            dict(FeatureTable=feature_table, EventTable=event_table)
-        )
-        response_queue = Template(HidDispatcherTemplate.GET_RESPONSE_QUEUE).substitute(dictionary)
         event_queue = ""
         if len(AutoInput.EVENT_LIST) > 0:
-            event_queue = Template(HidDispatcherTemplate.GET_EVENT_QUEUE).substitute(dictionary)
+            event_queue = HidDispatcherTemplate.GET_EVENT_QUEUE
         # end if
-        dictionary["InitFeatureMessageQueues"] = Template(HidDispatcherTemplate.GET_INIT_FEATURE_MESSAGE_QUEUES) \
-            .substitute(dict(ResponseQueue=response_queue, EventQueue=event_queue))
+        dictionary["ManifestEntry"] = Template(HidDispatcherTemplate.GET_MANIFEST_ENTRY).substitute(
+            dict(dictionary, HidppCategoryLower=AutoInput.HIDPP_CATEGORY.lower(), EventQueue=event_queue))
 
         self.update_implementation_section(
             [Template(HidDispatcherTemplate.GET_HID_DISPATCHER).substitute(dictionary)])
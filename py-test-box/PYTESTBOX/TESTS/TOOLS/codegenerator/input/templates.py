@@ -534,48 +534,20 @@ class HidDispatcherTemplate(CommonTemplate):
     Define text for all the templates for HidDispatcher registration
     """
 
-    GET_EVENT_QUEUE = """
-        # HID++ Event messages
-        accepted_messages = (
-            # 0x$HidppFIDUpper $FeatureNameTitleCaseWithSpace
-            $FeatureNameTitleCaseWithoutSpace$Model.get_available_events_classes() +
-        )"""
-
-    GET_RESPONSE_QUEUE = """
-        # TODO: Please copy the below code & paste between the right numbers (ascending order)
-        # HID++ $HidppCategoryCapitalized messages
-        accepted_messages = (
-            # 0x$HidppFIDUpper $FeatureNameTitleCaseWithSpace
-            $FeatureNameTitleCaseWithoutSpace$Model.get_available_responses_classes() +
-        )"""
-
-    GET_FEATURE_TABLE = """
-        # TODO: Please copy the below code & paste between the right numbers (ascending order)
-        self._feature_table = {
-            # 0x$HidppFIDUpper $FeatureNameTitleCaseWithSpace
-            **$FeatureNameTitleCaseWithoutSpace$Model.get_available_responses_map(),
-        }"""
-
-    GET_EVENT_TABLE = """
-        self._event_table = {
-            # 0x$HidppFIDUpper $FeatureNameTitleCaseWithSpace
-            **$FeatureNameTitleCaseWithoutSpace$Model.get_available_events_map(),
-        }"""
-
-    GET_INIT_FUNCTION = """
-    def __init__(self):$FeatureTable$EventTable
-    # end def __init__"""
+    GET_EVENT_QUEUE = """, event_queue=DispatcherQueue.EVENT"""
 
-    GET_INIT_FEATURE_MESSAGE_QUEUES = """
-    def init_feature_message_queues(self):$ResponseQueue$EventQueue
-    # end def init_feature_message_queues"""
+    GET_MANIFEST_ENTRY = """
+    # 0x$HidppFIDUpper $FeatureNameTitleCaseWithSpace
+    FeatureManifestEntry(0x$HidppFIDUpper, 'pyhid.hidpp.features.$HidppCategoryLower.$FeatureNameLowerCaseWithoutSpace',
+                         model='$FeatureNameTitleCaseWithoutSpace$Model',
+                         response_queue=DispatcherQueue.$HidppCategoryUpper$EventQueue),"""
 
     GET_HID_DISPATCHER = """# This file already exist in the system with all the features.
+# The features are registered in the dispatcher through their manifest entry.
 
-class HIDDispatcher(object):
-$InitFunction
-$InitFeatureMessageQueues
-# end class HIDDispatcher
+HIDPP_FEATURE_MANIFEST = to_manifest(
+    # TODO: Please copy the below code & paste between the right numbers (ascending order)$ManifestEntry
+)
 """
 # end class HidDispatcherTemplate
 
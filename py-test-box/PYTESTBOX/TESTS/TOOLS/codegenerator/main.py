@@ -69,7 +69,7 @@ class CodeGenerator(object):
         # Ex: Generate PYTESTBOX/LIBS/PYHID/pyhid/hidpp/features/common/devicefriendlyname_test.py
         py_hid.generate_feature_test_file()
 
-        # Ex: Generate PYTESTBOX/LIBS/PYHID/pyhid/hiddispatcher.py
+        # Ex: Generate PYTESTBOX/LIBS/PYHID/pyhid/hiddispatchermanifest.py
         py_hid.generate_hid_dispatcher_file()
 
         test_suite = TestSuiteGenerator()
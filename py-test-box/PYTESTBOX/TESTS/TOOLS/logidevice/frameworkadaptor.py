@@ -601,6 +601,8 @@ class FrameworkAdapter:
         """
         if hasattr(self.framework.current_channel, 'hid_dispatcher') and\
                 self.framework.current_channel.hid_dispatcher is not None:
+            # The queues only accept the messages of the features loaded by the dispatcher
+            self.framework.current_channel.hid_dispatcher.load_feature(response_class_type.FEATURE_ID)
             for queue in self.framework.current_channel.hid_dispatcher.queue_list:
                 if response_class_type in queue._accepted_messages:
                     return queue